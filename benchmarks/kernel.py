@@ -0,0 +1,440 @@
+"""
+Measures the performance of the kernel code paths that are exercised the
+most while projects run and are displayed, and compares the results with
+a stored baseline so that performance regressions can be caught before a
+release. Each benchmark is timed several times and the fastest time is
+used for the comparison, which is the least affected by other activity on
+the machine. Baselines are only comparable to results measured on the
+same machine, so the stored baseline should be updated with the
+`--save-baseline` flag on the machine used to check releases.
+
+Usage:
+    python benchmarks/kernel.py [--steps 100] [--repeat 5] [--filter name]
+        [--output results.json] [--baseline benchmarks/baseline.json]
+        [--threshold 0.25] [--save-baseline]
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import textwrap
+import timeit
+import typing
+from collections import namedtuple
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from matplotlib import pyplot as plt  # noqa: E402
+
+import cauldron  # noqa: E402
+from cauldron import cli  # noqa: E402
+from cauldron import environ  # noqa: E402
+from cauldron import render  # noqa: E402
+from cauldron import runner  # noqa: E402
+from cauldron.cli.commands import close as close_command  # noqa: E402
+from cauldron.cli.commands import open as open_command  # noqa: E402
+from cauldron.cli.sync import sync_io  # noqa: E402
+from cauldron.render import plots  # noqa: E402
+from cauldron.session import writing  # noqa: E402
+from cauldron.session.buffering import RedirectBuffer  # noqa: E402
+from cauldron.session.caching import SharedCache  # noqa: E402
+from cauldron.session.writing import step as step_writer  # noqa: E402
+from cauldron.ui import statuses  # noqa: E402
+
+#: Version of the format of the results files, which must match for results
+#: to be compared with a baseline.
+RESULTS_VERSION = 1
+
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'baseline.json'
+)
+
+BENCHMARK = namedtuple('BENCHMARK', ['name', 'setup', 'number'])
+
+#: Context shared by the benchmarks, which contains the directory in which
+#: benchmark files are written and the project opened for the benchmarks.
+CONTEXT = namedtuple('CONTEXT', ['directory', 'project'])
+
+STEP_SOURCE = textwrap.dedent(
+    """
+    import cauldron as cd
+
+    previous = cd.shared.fetch('value_{previous}', 0)
+    cd.shared.value_{index} = previous + 1
+    cd.display.markdown('**Step {index}** follows {{{{ previous }}}}',
+                        previous=previous)
+    cd.display.text('Value is {{}}'.format(cd.shared.value_{index}))
+    """
+)
+
+TABLE_STEP_SOURCE = STEP_SOURCE + textwrap.dedent(
+    """
+    import pandas as pd
+
+    cd.display.table(pd.DataFrame({{
+        'a': range(100),
+        'b': [1.5 * i for i in range(100)],
+        'c': ['x{{}}'.format(i) for i in range(100)],
+    }}))
+    """
+)
+
+_benchmarks = []  # type: typing.List[BENCHMARK]
+
+
+def benchmark(name: str, number: int = 1):
+    """
+    Registers the decorated function as the setup of a benchmark. The setup
+    function is called with the benchmark context and returns the operation
+    that is timed, which is called the specified number of times for each
+    timing so that fast operations can be measured accurately.
+    """
+    def decorator(setup):
+        _benchmarks.append(BENCHMARK(name, setup, number))
+        return setup
+    return decorator
+
+
+def create_project(directory: str, step_count: int) -> str:
+    """
+    Creates a project with the specified number of steps in the directory,
+    where each step builds on the shared value of the step before it and
+    every tenth step also displays a table.
+    """
+    project_directory = os.path.join(directory, 'kernel_benchmark')
+    os.makedirs(project_directory)
+
+    step_names = []
+    for index in range(step_count):
+        name = 'S{:03d}.py'.format(index + 1)
+        source = TABLE_STEP_SOURCE if index % 10 == 9 else STEP_SOURCE
+        with open(os.path.join(project_directory, name), 'w') as f:
+            f.write(source.format(index=index, previous=index - 1))
+        step_names.append(name)
+
+    with open(os.path.join(project_directory, 'cauldron.json'), 'w') as f:
+        json.dump({'name': 'kernel_benchmark', 'steps': step_names}, f)
+
+    return project_directory
+
+
+@contextlib.contextmanager
+def discard_output():
+    """
+    Discards everything written to the standard output while running the
+    benchmarks at the file descriptor level so that the throughput of the
+    terminal does not affect the results.
+    """
+    sys.stdout.flush()
+    stdout_descriptor = os.dup(1)
+    devnull_descriptor = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull_descriptor, 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(stdout_descriptor, 1)
+        os.close(stdout_descriptor)
+        os.close(devnull_descriptor)
+
+
+@benchmark('shared_cache.put', number=1000)
+def shared_cache_put(context: CONTEXT):
+    cache = SharedCache()
+    values = {'value_{}'.format(i): i for i in range(100)}
+    return lambda: cache.put(**values)
+
+
+@benchmark('shared_cache.fetch', number=1000)
+def shared_cache_fetch(context: CONTEXT):
+    cache = SharedCache().put(**{'value_{}'.format(i): i for i in range(100)})
+    keys = ['value_{}'.format(i) for i in range(100)]
+
+    def operation():
+        for key in keys:
+            cache.fetch(key)
+    return operation
+
+
+@benchmark('redirect_buffer.write', number=10)
+def redirect_buffer_write(context: CONTEXT):
+    source = open(os.devnull, 'w')
+    buffer = RedirectBuffer(source)
+    buffer.active = True
+
+    def operation():
+        write = buffer.write
+        for index in range(10000):
+            write('.')
+        buffer.flush_all()
+    return operation
+
+
+@benchmark('render.table', number=10)
+def render_table(context: CONTEXT):
+    df = pd.DataFrame(
+        np.random.RandomState(0).rand(500, 10),
+        columns=['column_{}'.format(i) for i in range(10)]
+    )
+    return lambda: render.table(df)
+
+
+@benchmark('render.plotly', number=10)
+def render_plotly(context: CONTEXT):
+    x = list(range(1000))
+    data = [
+        {'x': x, 'y': [i * trace for i in x], 'type': 'scatter'}
+        for trace in range(10)
+    ]
+    layout = {'title': 'Benchmark'}
+    return lambda: render.plotly(data=data, layout=layout)
+
+
+@benchmark('render.pyplot', number=3)
+def render_pyplot(context: CONTEXT):
+    figure = plt.figure()
+    plt.plot(np.arange(1000), np.sin(np.arange(1000) / 50))
+    return lambda: plots.pyplot(figure, clear=False)
+
+
+@benchmark('step_writer.serialize', number=10)
+def step_writer_serialize(context: CONTEXT):
+    step = context.project.steps[9]
+    return lambda: step_writer.serialize(step)
+
+
+@benchmark('writing.save', number=1)
+def writing_save(context: CONTEXT):
+    return lambda: writing.save(context.project)
+
+
+@benchmark('statuses.get_status', number=1)
+def statuses_get_status(context: CONTEXT):
+    return lambda: statuses.get_status(last_timestamp=0)
+
+
+def _create_sync_file(context: CONTEXT) -> str:
+    """Creates a file of partially compressible data to synchronize."""
+    path = os.path.join(context.directory, 'sync_source.bin')
+    if not os.path.exists(path):
+        data = np.random.RandomState(0).randint(0, 16, 4 * 1024 * 1024)
+        with open(path, 'wb') as f:
+            f.write(data.astype(np.uint8).tobytes())
+    return path
+
+
+@benchmark('sync_io.read_file_chunks', number=1)
+def sync_io_read_file_chunks(context: CONTEXT):
+    path = _create_sync_file(context)
+    return lambda: list(sync_io.read_file_chunks(path))
+
+
+@benchmark('sync_io.write_file_chunk', number=1)
+def sync_io_write_file_chunk(context: CONTEXT):
+    chunks = [
+        chunk for chunk, size
+        in sync_io.read_file_chunks(_create_sync_file(context))
+    ]
+    path = os.path.join(context.directory, 'sync_destination.bin')
+
+    def operation():
+        for index, chunk in enumerate(chunks):
+            sync_io.write_file_chunk(path, chunk, append=index > 0)
+    return operation
+
+
+@benchmark('runner.complete', number=1)
+def runner_complete(context: CONTEXT):
+    def operation():
+        response = environ.Response()
+        runner.complete(response, context.project, force=True)
+        if response.failed:
+            raise RuntimeError('Benchmark project failed to run')
+    return operation
+
+
+def measure(context: CONTEXT, item: BENCHMARK, repeat: int) -> dict:
+    """
+    Times the benchmark and returns the fastest, median and mean time in
+    seconds taken by a single call of its operation.
+    """
+    operation = item.setup(context)
+    operation()
+
+    timings = [
+        elapsed / item.number
+        for elapsed in timeit.repeat(
+            operation,
+            repeat=repeat,
+            number=item.number
+        )
+    ]
+    return dict(
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.mean(timings),
+        number=item.number,
+        repeat=repeat
+    )
+
+
+def run(step_count: int, repeat: int, name_filter: str = None) -> dict:
+    """
+    Runs the benchmarks whose names contain the filter, or all of them if
+    no filter is specified, and returns the results.
+    """
+    directory = tempfile.mkdtemp(prefix='cd-benchmark-')
+    measurements = {}
+
+    try:
+        with discard_output():
+            environ.modes.add(environ.modes.SINGLE_RUN)
+            open_response = open_command.execute(
+                context=cli.make_command_context(open_command.NAME),
+                path=create_project(directory, step_count),
+                results_path=os.path.join(directory, 'results'),
+                forget=True
+            )
+            if open_response.failed:
+                raise RuntimeError('Unable to open benchmark project')
+
+            project = cauldron.project.get_internal_project()
+            runner.complete(environ.Response(), project)
+            writing.save(project)
+            context = CONTEXT(directory, project)
+
+            for item in _benchmarks:
+                if name_filter and name_filter not in item.name:
+                    continue
+                measurements[item.name] = measure(context, item, repeat)
+
+            close_command.execute(
+                context=cli.make_command_context(close_command.NAME)
+            )
+    finally:
+        environ.modes.remove(environ.modes.SINGLE_RUN)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return dict(
+        version=RESULTS_VERSION,
+        environment=dict(
+            cauldron_version=environ.version,
+            python_version=platform.python_version(),
+            platform=platform.platform(),
+            machine=platform.machine(),
+            step_count=step_count
+        ),
+        benchmarks=measurements
+    )
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> dict:
+    """
+    Compares the fastest times of the results with those of the baseline
+    and returns the ratio of each benchmark's time to its baseline time,
+    along with whether or not that ratio exceeds the regression threshold.
+    """
+    if baseline.get('version') != RESULTS_VERSION:
+        raise ValueError('The baseline results format is not supported')
+
+    out = {}
+    for name, measurement in results['benchmarks'].items():
+        expected = baseline['benchmarks'].get(name)
+        if not expected:
+            continue
+        ratio = measurement['min'] / expected['min']
+        out[name] = dict(
+            baseline=expected['min'],
+            ratio=ratio,
+            regressed=ratio > 1 + threshold
+        )
+    return out
+
+
+def _format_duration(seconds: float) -> str:
+    """Formats the duration in the most readable unit."""
+    if seconds >= 1:
+        return '{:.2f} s'.format(seconds)
+    if seconds >= 1e-3:
+        return '{:.2f} ms'.format(seconds * 1e3)
+    return '{:.2f} us'.format(seconds * 1e6)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--filter', dest='name_filter')
+    parser.add_argument(
+        '--output',
+        help='Path where the results are written as JSON'
+    )
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.25,
+        help='Fractional slowdown beyond which a benchmark has regressed'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Replace the baseline with the results instead of comparing'
+    )
+    args = parser.parse_args()
+
+    results = run(args.steps, args.repeat, args.name_filter)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        comparison = {}
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('environment') != results['environment']:
+            print(
+                'Warning: the baseline was measured in a different '
+                'environment and may not be comparable',
+                file=sys.stderr
+            )
+        comparison = compare(results, baseline, args.threshold)
+    else:
+        comparison = {}
+
+    results['comparison'] = comparison
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    for name, measurement in results['benchmarks'].items():
+        change = comparison.get(name)
+        print('{:<28} {:>12} {}'.format(
+            name,
+            _format_duration(measurement['min']),
+            (
+                '{:+.0%}{}'.format(
+                    change['ratio'] - 1,
+                    ' REGRESSION' if change['regressed'] else ''
+                )
+                if change else
+                ''
+            )
+        ))
+
+    regressions = [n for n, c in comparison.items() if c['regressed']]
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
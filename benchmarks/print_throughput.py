@@ -0,0 +1,126 @@
+"""
+Measures the throughput of printing to the intercepted standard output
+streams from within a running step of a Cauldron project. The step is run
+by the same batch runner that is used by the `cauldron shell --project`
+command and times each kind of output operation itself, which means that
+the results only include the overhead of output interception.
+
+Usage:
+    python benchmarks/print_throughput.py [--count 200000]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+
+import cauldron
+
+STEP_SOURCE = textwrap.dedent(
+    """
+    import sys
+    import time
+
+    import cauldron as cd
+
+    count = cd.shared.count
+    results = {}
+
+    def measure(name, operation):
+        start = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - start
+        results[name] = count / elapsed
+
+    def print_lines():
+        for index in range(count):
+            print('Line', index)
+
+    def write_fragments():
+        write = sys.stdout.write
+        for index in range(count):
+            write('.')
+
+    def write_fragments_lookup():
+        for index in range(count):
+            sys.stdout.write('.')
+            sys.stdout.flush()
+
+    def read_attributes():
+        for index in range(count):
+            sys.stdout.encoding
+            sys.stdout.isatty
+
+    measure('print_lines', print_lines)
+    cd.display.text('Printed lines')
+    measure('write_fragments', write_fragments)
+    cd.display.text('Wrote fragments')
+    measure('write_fragments_lookup', write_fragments_lookup)
+    cd.display.text('Wrote fragments with lookups')
+    measure('read_attributes', read_attributes)
+
+    cd.shared.results = results
+    """
+)
+
+
+def create_project(directory: str) -> str:
+    """Creates a project with a single benchmark step in the directory."""
+    project_directory = os.path.join(directory, 'print_throughput')
+    os.makedirs(project_directory)
+
+    with open(os.path.join(project_directory, 'cauldron.json'), 'w') as f:
+        json.dump({'name': 'print_throughput', 'steps': ['S01.py']}, f)
+
+    with open(os.path.join(project_directory, 'S01.py'), 'w') as f:
+        f.write(STEP_SOURCE)
+
+    return project_directory
+
+
+def run(count: int) -> dict:
+    """
+    Runs the benchmark project and returns the number of operations per
+    second for each kind of output operation.
+    """
+    directory = tempfile.mkdtemp(prefix='cd-benchmark-')
+
+    # The printed output is discarded at the file descriptor level so that
+    # the throughput of the terminal does not affect the results.
+    sys.stdout.flush()
+    stdout_descriptor = os.dup(1)
+    devnull_descriptor = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull_descriptor, 1)
+    try:
+        result = cauldron.run_project(
+            project_directory=create_project(directory),
+            output_directory=os.path.join(directory, 'results'),
+            logging_path=directory,
+            forget_project=True,
+            count=count
+        )
+    finally:
+        sys.stdout.flush()
+        os.dup2(stdout_descriptor, 1)
+        os.close(stdout_descriptor)
+        os.close(devnull_descriptor)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if result.failed:
+        raise RuntimeError('Benchmark project failed to run')
+    return result.shared.results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--count', type=int, default=200000)
+    args = parser.parse_args()
+
+    for name, rate in run(args.count).items():
+        print('{:<24} {:>12,.0f} operations/second'.format(name, rate))
+
+
+if __name__ == '__main__':
+    main()
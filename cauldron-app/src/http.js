@@ -153,7 +153,11 @@ function updateStatus(debounce = 0, force = false) {
 
   const forceArg = force ? 'yes' : null;
   const lastTimestamp = (store.getters.status || {}).timestamp || 0;
-  const data = { last_timestamp: lastTimestamp, force: forceArg };
+  const data = {
+    last_timestamp: lastTimestamp,
+    force: forceArg,
+    body_sequences: notebook.getBodySequences(),
+  };
   statusCache.lastInvocationTimestamp = (new Date()).getTime();
 
   return post('/status', data)
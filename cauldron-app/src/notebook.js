@@ -77,6 +77,46 @@ function scrollToStep(stepName, position) {
   cauldron.scrollToAnchor(targets[0].name, position || defaultPosition);
 }
 
+/**
+ * Returns the body displayed by a step change. Changes that append to the
+ * body of a running step only contain the newly appended chunks, which
+ * together with their sequence and pending output identify the displayed
+ * body.
+ *
+ * @param change
+ *    The step change from which to get the body.
+ * @returns {string}
+ */
+function getChangeBody(change) {
+  const step = (change || {}).step || {};
+  if (change.action !== 'appended') {
+    return step.body || '';
+  }
+
+  return [
+    step.body_id,
+    step.sequence,
+    (step.chunks || []).join(''),
+    step.pending,
+    step.progress,
+  ].join(':');
+}
+
+/**
+ * Returns the report body state of each step displayed in the notebook, or
+ * undefined if the notebook cannot append to running step bodies.
+ *
+ * @returns {Object|undefined}
+ */
+function getBodySequences() {
+  const cauldron = getCauldronObject();
+  if (!cauldron || !cauldron.getBodySequences) {
+    return undefined;
+  }
+
+  return cauldron.getBodySequences();
+}
+
 /**
  * We're only interested in step changes that are actually changes and that
  * occur more recently than the previous one. This filters down the source
@@ -93,8 +133,8 @@ function filterStepChanges(changes) {
   return changes.filter((c) => {
     const previous = previousStepChanges[c.name] || {};
 
-    const newBody = (c.step || {}).body || '';
-    const oldBody = (previous.step || {}).body || '';
+    const newBody = getChangeBody(c);
+    const oldBody = getChangeBody(previous);
 
     // Older Cauldron versions did not all have timestamps in changes, so we
     // use defaults here just in case.
@@ -224,6 +264,7 @@ function onLoaded() {
 
 export default {
   applyStepModifications,
+  getBodySequences,
   getUrl,
   getViewUrl,
   getCauldronObject,
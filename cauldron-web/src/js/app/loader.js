@@ -24,12 +24,19 @@ function loadSourceFile(include) {
     setTimeout(() => resolve(element), 250);
   }
 
+  function onFailed(reject, element) {
+    // Removing the element allows the file to be requested again later.
+    element.remove();
+    reject(new Error(`Unable to load "${filename}"`));
+  }
+
   if (/.*\.css$/.test(filename)) {
     // Load Style sheet files
-    return new Promise((resolve) => {
+    return new Promise((resolve, reject) => {
       const link = document.createElement('link');
       link.rel = 'stylesheet';
       link.onload = onLoaded.bind(null, resolve, link);
+      link.onerror = onFailed.bind(null, reject, link);
       link.href = filename + noCache;
       link.id = include.name;
       document.head.appendChild(link);
@@ -38,9 +45,10 @@ function loadSourceFile(include) {
 
   if (/.*\.js$/.test(filename)) {
     // Load Javascript files
-    return new Promise((resolve) => {
+    return new Promise((resolve, reject) => {
       const script = document.createElement('script');
       script.onload = onLoaded.bind(null, resolve, script);
+      script.onerror = onFailed.bind(null, reject, script);
       script.src = filename + noCache;
       script.id = include.name;
       document.head.appendChild(script);
@@ -80,4 +88,36 @@ function loadStepIncludes(steps) {
   return Promise.all(proms);
 }
 
-export default { loadSourceFile, loadSourceFiles, loadStepIncludes };
+/**
+ * Loads the body of a step that is stored in a separate file instead of
+ * within the results file. The body file is only requested if the body of
+ * the step has not already been loaded. A step whose body file cannot be
+ * loaded is given an empty body.
+ *
+ * @param step
+ *    The step for which to load the body.
+ * @returns {Promise}
+ *    Resolves to the step once its body has been loaded.
+ */
+function loadStepBody(step) {
+  if (!step || !step.body_file || step.body) {
+    return Promise.resolve(step);
+  }
+
+  return loadSourceFile({
+    name: `cauldron-step-body:${step.body_file}`,
+    src: `/${step.body_file}`,
+  }).catch(() => null).then(() => {
+    const bodies = window.STEP_BODIES || {};
+    // eslint-disable-next-line no-param-reassign
+    step.body = bodies[step.body_file] || '';
+    return step;
+  });
+}
+
+export default {
+  loadSourceFile,
+  loadSourceFiles,
+  loadStepBody,
+  loadStepIncludes,
+};
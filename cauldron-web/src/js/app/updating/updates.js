@@ -123,6 +123,88 @@ function prepareStepBody(step) {
 }
 
 
+/**
+ * Returns the report body state of each step displayed in the notebook,
+ * which is the body_id and sequence of the body chunks it currently shows.
+ * Status requests send these states so that the kernel only returns the
+ * body chunks that running steps have appended since then.
+ *
+ * @returns {Object}
+ *    Body states keyed by step name.
+ */
+function getBodySequences() {
+  const sequences = {};
+
+  $('.body-wrapper')
+    .find('.cd-ProjectStep__bodyInner[data-body-id]')
+    .each((index, e) => {
+      const inner = $(e);
+      const name = inner.closest('.cd-project-step').attr('data-step-name');
+      const sequence = parseInt(inner.attr('data-body-sequence'), 10);
+
+      if (name && !Number.isNaN(sequence)) {
+        sequences[name] = {
+          body_id: inner.attr('data-body-id'),
+          sequence,
+        };
+      }
+    });
+
+  return sequences;
+}
+
+
+/**
+ * Appends the body chunks of an 'appended' step update to the body of the
+ * displayed step and replaces its pending output and run status.
+ *
+ * @param existing
+ *    The displayed step dom element.
+ * @param step
+ *    The serialized step chunks.
+ */
+function appendStepBody(existing, step) {
+  const inner = existing.find('.cd-ProjectStep__bodyInner');
+  const isReplaced = step.start === 0;
+  const isCurrent = (
+    inner.attr('data-body-id') === step.body_id
+    && parseInt(inner.attr('data-body-sequence'), 10) === step.start
+  );
+
+  if (inner.length === 0 || (!isReplaced && !isCurrent)) {
+    // Without a matching body to append to, the body state is dropped so
+    // that the next status request returns the step in full.
+    inner.removeAttr('data-body-id');
+    return;
+  }
+
+  inner.find('.cd-ProjectStep__pending').remove();
+  if (isReplaced) {
+    inner.empty();
+  }
+
+  const chunks = prepareStepBody({
+    body: `<div>${step.chunks.join('')}</div>`,
+  });
+  inner.append(chunks.contents());
+
+  if (step.pending) {
+    inner.append(`<div class="cd-ProjectStep__pending">${step.pending}</div>`);
+  }
+
+  inner
+    .attr('data-body-id', step.body_id)
+    .attr('data-body-sequence', step.sequence);
+
+  if (step.chunks.length > 0 || step.pending) {
+    inner.parent().show();
+  }
+
+  existing.find('.cd-step-status').remove();
+  existing.find('.step-anchor[data-type="--end"]').before(step.progress || '');
+}
+
+
 function onReadyToProcess(updates) {
   // Add the body for each step to the page body
   const body = $('.body-wrapper');
@@ -136,6 +218,11 @@ function onReadyToProcess(updates) {
       return;
     }
 
+    if (update.action === 'appended') {
+      appendStepBody(existing, update.step);
+      return;
+    }
+
     let stepDom = prepareStepBody(update.step);
     if (selectedStep && update.name === selectedStep.name) {
       setSelected(stepDom);
@@ -199,6 +286,7 @@ function processStepUpdates(updates, stepToSelect) {
 }
 
 export default {
+  getBodySequences,
   prepareStepBody,
   processStepUpdates,
   updateSelectedStep
@@ -127,6 +127,75 @@ function populateDom() {
     .text(cauldron.TITLE);
 }
 
+/**
+ * Adds the steps to the page body. Steps whose bodies are stored in separate
+ * files are added as placeholders, and the body file of each one is only
+ * loaded when the placeholder is scrolled near the visible part of the page.
+ *
+ * @param steps
+ *    The serialized steps of the project results.
+ */
+function displaySteps(steps) {
+  const body = $('.body-wrapper');
+  const placeholders = new Map();
+
+  function loadPlaceholder(element) {
+    const step = placeholders.get(element);
+    placeholders.delete(element);
+
+    return loader.loadStepBody(step).then(() => {
+      const placeholder = $(element);
+      if (placeholder.closest('body').length === 0) {
+        // The placeholder was already replaced by a step update.
+        return;
+      }
+
+      const stepBody = updates.prepareStepBody(step);
+      if (stepBody) {
+        placeholder.replaceWith(stepBody);
+      } else {
+        placeholder.remove();
+      }
+      $(window).trigger('resize');
+    });
+  }
+
+  const observer = window.IntersectionObserver
+    ? new window.IntersectionObserver((entries) => {
+      entries
+        .filter((entry) => entry.isIntersecting)
+        .forEach((entry) => {
+          observer.unobserve(entry.target);
+          loadPlaceholder(entry.target);
+        });
+    }, { rootMargin: '100% 0px' })
+    : null;
+
+  steps.forEach((step) => {
+    if (!step.body_file || step.body) {
+      const stepBody = updates.prepareStepBody(step);
+      if (stepBody) {
+        body.append(stepBody);
+      }
+      return;
+    }
+
+    const placeholder = $('<div class="cd-project-step"></div>')
+      .attr('data-step-name', step.name)
+      .css('min-height', '200px')
+      .append($('<a class="step-anchor" data-type=""></a>').attr('name', step.name));
+
+    body.append(placeholder);
+    placeholders.set(placeholder[0], step);
+
+    if (observer) {
+      observer.observe(placeholder[0]);
+    } else {
+      loadPlaceholder(placeholder[0]);
+    }
+  });
+}
+
 /**
  *
  */
@@ -146,16 +215,7 @@ function initialize() {
       return loadIncludes();
     })
     .then(() => {
-      // Add the body for each step to the page body
-      const body = $('.body-wrapper');
-
-      window.RESULTS.steps.forEach((step) => {
-        const stepBody = updates.prepareStepBody(step);
-        if (stepBody) {
-          body.append(stepBody);
-        }
-      });
-
+      displaySteps(window.RESULTS.steps);
       $(window).trigger('resize');
       return cauldron.DATA;
     })
@@ -74,6 +74,7 @@ function main() {
   cauldron.collapse = interaction.collapse;
   cauldron.toggleVisible = interaction.toggleVisible;
   cauldron.processStepRenames = renaming.processStepRenames;
+  cauldron.getBodySequences = updates.getBodySequences;
   cauldron.prepareStepBody = updates.prepareStepBody;
   cauldron.processStepUpdates = updates.processStepUpdates;
   cauldron.updateSelectedStep = updates.updateSelectedStep;
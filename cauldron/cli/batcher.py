@@ -47,7 +47,9 @@ def run_project(
         shared_data: dict = None,
         reader_path: str = None,
         reload_project_libraries: bool = False,
-        forget_project: bool = False
+        forget_project: bool = False,
+        checkpoint: bool = False,
+        resume_from: str = None
 ) -> ExecutionResult:
     """
     Opens, executes and closes a Cauldron project in a single command in
@@ -84,6 +86,13 @@ def run_project(
         running lots of projects in batch mode it can be undesirable to
         clutter the recently opened project list with those projects in which
         case setting this to True will prevent that from happening.
+    :param checkpoint:
+        Whether or not to save a checkpoint of the shared values after each
+        step that runs successfully.
+    :param resume_from:
+        The name of a step from which to resume the project. The shared
+        values are restored from the checkpoint saved after the preceding
+        step in an earlier run, in which case the shared data is ignored.
     :return:
         The response result from the project execution.
     """
@@ -124,11 +133,13 @@ def run_project(
     commander.preload()
     run_response = run_command.execute(
         context=cli.make_command_context(run_command.NAME),
-        skip_library_reload=not reload_project_libraries
+        skip_library_reload=not reload_project_libraries,
+        checkpoint=checkpoint,
+        resume_from=resume_from
     )
 
     project_cache = SharedCache().put(
-        **project.shared._shared_cache_data
+        **project.shared.fetch(None)
     )
 
     if run_response.failed:
@@ -13,6 +13,7 @@ from cauldron.cli.commands import sync as sync_command
 from cauldron.cli.commands.run import actions as run_actions
 from cauldron.cli.interaction import autocompletion
 from cauldron.environ import Response
+from cauldron.runner import checkpoints
 from cauldron.session import projects
 from cauldron.session import writing
 
@@ -93,6 +94,47 @@ def populate(
             """)
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        dest='jobs',
+        default=1,
+        type=int,
+        help=cli.reformat("""
+            The maximum number of steps to run simultaneously when running
+            the project. When greater than 1, steps that do not depend on
+            each other through shared variables are run concurrently in
+            separate processes. This only applies when running the entire
+            project or continuing after a specified step.
+            """)
+    )
+
+    parser.add_argument(
+        '--checkpoint',
+        dest='checkpoint',
+        default=False,
+        action='store_true',
+        help=cli.reformat("""
+            Whether or not to save a checkpoint of the shared values after
+            each step that runs successfully, which allows the project to be
+            resumed later from the step after it with the --resume-from
+            option. Checkpoints can also be enabled for every run by setting
+            "checkpoints" to true in the project's cauldron.json file.
+            """)
+    )
+
+    parser.add_argument(
+        '--resume-from',
+        dest='resume_from',
+        default=None,
+        type=str,
+        help=cli.reformat("""
+            The name of a step from which to resume the project. The shared
+            values are restored from the checkpoint saved after the step
+            preceding it, instead of running all of the preceding steps, and
+            then the specified step and all steps after it are run.
+            """)
+    )
+
     parser.add_argument(
         '-ps', '--print-status',
         dest='print_status',
@@ -145,7 +187,10 @@ def execute(
         single_step: bool = False,
         limit: int = -1,
         print_status: bool = False,
-        skip_library_reload: bool = False
+        skip_library_reload: bool = False,
+        jobs: int = 1,
+        checkpoint: bool = False,
+        resume_from: str = None
 ) -> Response:
     """
 
@@ -160,6 +205,14 @@ def execute(
         Whether or not to skip reloading all project libraries prior to
         execution of the project. By default this is False in which case
         the project libraries are reloaded prior to execution.
+    :param jobs:
+        The maximum number of steps to run simultaneously.
+    :param checkpoint:
+        Whether or not to save a checkpoint of the shared values after each
+        step that runs successfully.
+    :param resume_from:
+        The name of a step from which to resume the project using the
+        checkpoint saved after the step preceding it.
     :return:
     """
     project = run_actions.get_project(context.response)
@@ -185,6 +238,11 @@ def execute(
     except Exception:
         pass
 
+    if resume_from:
+        steps = [resume_from.strip('"')]
+        continue_after = True
+        single_step = False
+
     project_steps = [project.get_step(name) for name in steps]
 
     if None in project_steps:
@@ -213,7 +271,10 @@ def execute(
         single_step=single_step,
         limit=limit,
         print_status=print_status,
-        skip_library_reload=skip_library_reload
+        skip_library_reload=skip_library_reload,
+        jobs=jobs,
+        checkpoint=checkpoint,
+        resume=bool(resume_from)
     )
 
 
@@ -226,7 +287,10 @@ def run_local(
         single_step: bool,
         limit: int,
         print_status: bool,
-        skip_library_reload: bool = False
+        skip_library_reload: bool = False,
+        jobs: int = 1,
+        checkpoint: bool = False,
+        resume: bool = False
 ) -> environ.Response:
     """
     Execute the run command locally within this cauldron environment
@@ -243,6 +307,16 @@ def run_local(
         Whether or not to skip reloading all project libraries prior to
         execution of the project. By default this is False in which case
         the project libraries are reloaded prior to execution.
+    :param jobs:
+        The maximum number of steps to run simultaneously.
+    :param checkpoint:
+        Whether or not to save a checkpoint of the shared values after each
+        step that runs successfully, which is also the case when checkpoints
+        are enabled in the project settings.
+    :param resume:
+        Whether or not to restore the checkpoint saved after the step that
+        precedes the first of the project steps and run the project from
+        that step onward instead of running the preceding steps.
     :return:
     """
     skip_reload = (
@@ -254,6 +328,18 @@ def run_local(
 
     environ.log_header('RUNNING', 5)
 
+    checkpoint = checkpoint or checkpoints.is_enabled(project)
+    if resume:
+        restored = checkpoints.restore(
+            context.response,
+            project,
+            project_steps[0],
+            force=force
+        )
+        if not restored:
+            return context.response
+        force = True
+
     steps_run = []
 
     if single_step:
@@ -267,7 +353,8 @@ def run_local(
             project=project,
             starting=ps,
             limit=1,
-            force=force
+            force=force,
+            checkpoint=checkpoint
         )
 
     elif continue_after or len(project_steps) == 0:
@@ -281,7 +368,9 @@ def run_local(
             project,
             ps,
             force=force,
-            limit=limit
+            limit=limit,
+            max_workers=jobs,
+            checkpoint=checkpoint
         )
     else:
         for ps in project_steps:
@@ -291,7 +380,8 @@ def run_local(
                 starting=ps,
                 limit=max(1, limit),
                 force=force or (limit < 1 and len(project_steps) < 2),
-                skips=steps_run + []
+                skips=steps_run + [],
+                checkpoint=checkpoint
             )
 
     project.write()
@@ -329,8 +419,11 @@ def autocomplete(segment: str, line: str, parts: typing.List[str]):
         return autocompletion.match_flags(
             segment=segment,
             value=parts[-1],
-            shorts=['f', 'c', 's', 'l'],
-            longs=['force', 'continue', 'step', 'limit', 'skip-reload']
+            shorts=['f', 'c', 's', 'l', 'j'],
+            longs=[
+                'force', 'continue', 'step', 'limit', 'skip-reload', 'jobs',
+                'checkpoint', 'resume-from'
+            ]
         )
 
     value = parts[-1]
@@ -122,7 +122,7 @@ def execute(
     settings = environ.package_settings
 
     if verbose:
-        data = environ.systems.get_system_data()
+        data = environ.systems.get_system_data(refresh=True)
         data['cauldron'] = settings
     else:
         data = settings
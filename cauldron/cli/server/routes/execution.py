@@ -143,7 +143,9 @@ def execute(asynchronous: bool = False):
                     run_status='running',
                     run_uid=r.thread.uid,
                     step_changes=server_runner.get_running_step_changes(True),
-                    server=server_runner.get_server_data()
+                    server=server_runner.get_server_data(
+                        include_packages=False
+                    )
                 )
                 .serialize()
             )
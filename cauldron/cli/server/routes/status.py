@@ -1,6 +1,7 @@
 import flask
 
 import cauldron
+from cauldron.cli.server import arguments
 from cauldron.cli.server import authorization
 from cauldron.cli.server import run as server_runner
 from cauldron.environ.response import Response
@@ -115,12 +116,28 @@ def project_data():
 @authorization.gatekeeper
 def run_status(uid: str):
     """
+    Returns the status of the command execution with the specified uid.
+    While running, the changes for the running steps are included. If the
+    request specifies `body_sequences`, a dictionary of step names mapped to
+    the `body_id` and `sequence` last received for each step, the running
+    step changes will only contain the report body chunks appended since.
+
+    Requests that specify a `wait` number of seconds are long-polled, such
+    that the response is not returned until the execution finishes, logs
+    messages beyond the specified `log_index` or updates the display of a
+    running step, or until the wait time elapses. Each waiting request
+    occupies one of the server's request threads for its duration.
 
     :param uid:
     :return:
     """
 
     try:
+        args = arguments.from_request()
+        body_sequences = args.get('body_sequences')
+        if not isinstance(body_sequences, dict):
+            body_sequences = None
+
         r = server_runner.active_execution_responses.get(uid)
 
         if not r:
@@ -137,9 +154,20 @@ def run_status(uid: str):
                 ).serialize()
             )
 
+        wait = float(args.get('wait') or 0)
+        if wait > 0 and r.thread.is_running:
+            server_runner.wait_for_run_changes(
+                response=r,
+                wait=wait,
+                log_index=int(args.get('log_index') or 0)
+            )
+
         if r.thread.is_running:
             try:
-                step_changes = server_runner.get_running_step_changes(True)
+                step_changes = server_runner.get_running_step_changes(
+                    write=True,
+                    body_sequences=body_sequences
+                )
             except Exception:
                 step_changes = None
 
@@ -150,8 +178,11 @@ def run_status(uid: str):
                     run_status='running',
                     run_multiple_updates=True,
                     run_uid=uid,
+                    run_wait=wait,
                     step_changes=step_changes,
-                    server=server_runner.get_server_data()
+                    server=server_runner.get_server_data(
+                        include_packages=False
+                    )
                 ).serialize()
             )
 
@@ -162,7 +193,8 @@ def run_status(uid: str):
                 run_log=r.get_thread_log(),
                 run_status='complete',
                 run_multiple_updates=True,
-                run_uid=r.thread.uid
+                run_uid=r.thread.uid,
+                run_wait=wait
             ).serialize()
         )
 
@@ -2,6 +2,7 @@ import json
 import mimetypes
 import os
 import tempfile
+import zlib
 
 import flask
 
@@ -15,7 +16,9 @@ from cauldron.cli.server import arguments
 from cauldron.cli.server import authorization
 from cauldron.cli.server import run as server_runner
 from cauldron.cli.server.routes.synchronize import status
+from cauldron.cli.server.routes.synchronize import uploads
 from cauldron.environ.response import Response
+from cauldron.session import projects
 
 sync_status = dict(
     time=-1,
@@ -129,6 +132,37 @@ def sync_open_project():
     ).response.flask_serialize()
 
 
+def get_sync_path(
+        project: 'projects.Project',
+        relative_path: str,
+        location: str = 'project'
+) -> str:
+    """
+    Returns the absolute path within the remote project where the file
+    synchronized from the given relative path will be written.
+
+    :param project:
+        The open project to which the file is being synchronized.
+    :param relative_path:
+        The path of the synchronized file relative to the root directory of
+        its location.
+    :param location:
+        Either "project" if the file resides within the project source
+        directory or "shared" if it resides within a shared library folder.
+    """
+    parts = relative_path.replace('\\', '/').strip('/').split('/')
+
+    root_directory = project.source_directory
+    if location == 'shared':
+        root_directory = os.path.realpath(os.path.join(
+            root_directory,
+            '..',
+            '__cauldron_shared_libs'
+        ))
+
+    return os.path.join(root_directory, *parts)
+
+
 @server_runner.APPLICATION.route('/sync-file', methods=['POST'])
 @authorization.gatekeeper
 def sync_source_file():
@@ -157,17 +191,7 @@ def sync_source_file():
             message='No project is open. Unable to sync'
         ).response.flask_serialize()
 
-    parts = relative_path.replace('\\', '/').strip('/').split('/')
-
-    root_directory = project.source_directory
-    if location == 'shared':
-        root_directory = os.path.realpath(os.path.join(
-            root_directory,
-            '..',
-            '__cauldron_shared_libs'
-        ))
-
-    file_path = os.path.join(root_directory, *parts)
+    file_path = get_sync_path(project, relative_path, location)
     parent_directory = os.path.dirname(file_path)
 
     if not os.path.exists(parent_directory):
@@ -189,6 +213,134 @@ def sync_source_file():
     ).console().response.flask_serialize()
 
 
+@server_runner.APPLICATION.route('/sync-manifest', methods=['POST'])
+@authorization.gatekeeper
+def sync_manifest():
+    """
+    Compares the content hashes of the client files to those of the files
+    within the remote project and returns the relative paths of the files
+    that are missing or have different contents, which are the only files
+    the client needs to synchronize.
+    """
+    r = Response()
+    args = arguments.from_request()
+    file_hashes = args.get('files')
+    location = args.get('location', 'project')
+
+    if not isinstance(file_hashes, dict):
+        return r.fail(
+            code='INVALID_ARGS',
+            message='Missing or invalid arguments'
+        ).response.flask_serialize()
+
+    project = cd.project.get_internal_project()
+
+    if not project:
+        return r.fail(
+            code='NO_OPEN_PROJECT',
+            message='No project is open. Unable to sync'
+        ).response.flask_serialize()
+
+    changed = [
+        relative_path
+        for relative_path, file_hash in file_hashes.items()
+        if file_hash != sync.manifest.get_file_hash(
+            get_sync_path(project, relative_path, location)
+        )
+    ]
+
+    return r.update(changed=changed).response.flask_serialize()
+
+
+@server_runner.APPLICATION.route('/sync-file-v2', methods=['GET', 'POST'])
+@authorization.gatekeeper
+def sync_source_file_chunk():
+    """
+    Synchronizes a chunk of a file sent as the raw binary request body with
+    the chunk information specified as query arguments. Chunks are written
+    directly at their offset within the file, which allows them to be sent
+    in any order and simultaneously. GET requests return the indexes of the
+    chunks already received for the file so that an interrupted upload can
+    be resumed without resending those chunks.
+    """
+    r = Response()
+    args = arguments.from_request()
+    relative_path = args.get('relative_path')
+    location = args.get('location', 'project')
+
+    try:
+        sync_time = float(args.get('sync_time', -1))
+        size = int(args['size'])
+        chunk_size = int(args['chunk_size'])
+        modified = float(args.get('modified', 0))
+        index = int(args.get('index', 0))
+        checksum = int(args.get('checksum', -1))
+    except (KeyError, TypeError, ValueError):
+        size = chunk_size = None
+
+    if None in [relative_path, size, chunk_size] or chunk_size < 1:
+        return r.fail(
+            code='INVALID_ARGS',
+            message='Missing or invalid arguments'
+        ).response.flask_serialize()
+
+    project = cd.project.get_internal_project()
+
+    if not project:
+        return r.fail(
+            code='NO_OPEN_PROJECT',
+            message='No project is open. Unable to sync'
+        ).response.flask_serialize()
+
+    file_path = get_sync_path(project, relative_path, location)
+
+    if flask.request.method == 'GET':
+        return r.update(
+            received=uploads.get_received(
+                file_path,
+                size,
+                chunk_size,
+                modified
+            )
+        ).response.flask_serialize()
+
+    chunk_count = uploads.get_chunk_count(size, chunk_size)
+    contents = sync.io.unpack_binary_chunk(
+        flask.request.get_data(),
+        args.get('encoding', '')
+    )
+    expected_size = min(chunk_size, size - index * chunk_size)
+    is_valid = (
+        0 <= index < chunk_count
+        and len(contents) == max(0, expected_size)
+        and checksum in (-1, zlib.crc32(contents))
+    )
+
+    if not is_valid:
+        return r.fail(
+            code='INVALID_CHUNK',
+            message='Invalid chunk {} for "{}"'.format(index, relative_path)
+        ).response.flask_serialize()
+
+    upload = uploads.get_upload(file_path, size, chunk_size, modified)
+    is_complete = uploads.write_chunk(upload, index, contents)
+
+    sync_status.update({}, time=sync_time)
+
+    if not is_complete:
+        return r.update(index=index, complete=False).notify(
+            kind='SYNCED',
+            code='SAVED_CHUNK',
+            message='File chunk {} {}'.format(index, file_path)
+        ).response.flask_serialize()
+
+    return r.update(index=index, complete=True).notify(
+        kind='SYNCED',
+        code='SAVED_FILE',
+        message='File {}'.format(file_path)
+    ).console().response.flask_serialize()
+
+
 @server_runner.APPLICATION.route(
     '/download/<filename>',
     methods=['GET', 'POST']
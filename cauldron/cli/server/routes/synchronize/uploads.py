@@ -0,0 +1,156 @@
+import os
+import threading
+import typing
+from collections import namedtuple
+
+from cauldron.cli.sync import sync_io
+
+UPLOAD = namedtuple('UPLOAD', [
+    'file_path',
+    'partial_path',
+    'size',
+    'chunk_size',
+    'modified',
+    'received'
+])
+
+#: Uploads in progress keyed by the path of the file being uploaded. These
+#: persist across client connections so that an interrupted upload can be
+#: resumed with only the chunks that have not yet been received.
+_uploads = dict()  # type: typing.Dict[str, UPLOAD]
+_lock = threading.Lock()
+
+
+def get_chunk_count(size: int, chunk_size: int) -> int:
+    """
+    Returns the number of chunks needed to upload a file of the given size
+    in chunks of the given chunk size.
+    """
+    return max(1, -(-size // max(1, chunk_size)))
+
+
+def _is_same_source(
+        upload: typing.Optional[UPLOAD],
+        size: int,
+        chunk_size: int,
+        modified: float
+) -> bool:
+    """
+    Whether or not the upload is for the same version of the source file
+    and uses the same chunk size.
+    """
+    return (
+        upload is not None
+        and (upload.size, upload.chunk_size, upload.modified)
+        == (size, chunk_size, modified)
+    )
+
+
+def get_received(
+        file_path: str,
+        size: int,
+        chunk_size: int,
+        modified: float
+) -> typing.List[int]:
+    """
+    Returns the indexes of the chunks already received for an upload of the
+    specified file, which will be empty unless there is an upload in progress
+    for the same version of the source file.
+
+    :param file_path:
+        The path where the uploaded file will be written
+    :param size:
+        The size, in bytes, of the source file being uploaded
+    :param chunk_size:
+        The size, in bytes, of each uploaded chunk
+    :param modified:
+        The modified time of the source file being uploaded
+    """
+    with _lock:
+        upload = _uploads.get(file_path)
+        if not _is_same_source(upload, size, chunk_size, modified):
+            return []
+        return sorted(upload.received)
+
+
+def get_upload(
+        file_path: str,
+        size: int,
+        chunk_size: int,
+        modified: float
+) -> UPLOAD:
+    """
+    Returns the in-progress upload for the specified version of the source
+    file, or starts a new one if no such upload exists. New uploads are
+    written into a partial file alongside the file path that is moved into
+    place once every chunk has been received.
+
+    :param file_path:
+        The path where the uploaded file will be written
+    :param size:
+        The size, in bytes, of the source file being uploaded
+    :param chunk_size:
+        The size, in bytes, of each uploaded chunk
+    :param modified:
+        The modified time of the source file being uploaded
+    """
+    with _lock:
+        upload = _uploads.get(file_path)
+        if _is_same_source(upload, size, chunk_size, modified):
+            return upload
+
+        directory = os.path.dirname(file_path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        upload = UPLOAD(
+            file_path=file_path,
+            partial_path='{}.cauldron-partial'.format(file_path),
+            size=size,
+            chunk_size=chunk_size,
+            modified=modified,
+            received=set()
+        )
+        with open(upload.partial_path, 'wb') as f:
+            f.truncate(size)
+
+        _uploads[file_path] = upload
+        return upload
+
+
+def write_chunk(upload: UPLOAD, index: int, contents: bytes) -> bool:
+    """
+    Writes the chunk contents into the partial file of the upload at the
+    offset of the chunk index. Chunks can be written in any order and from
+    multiple threads simultaneously.
+
+    :param upload:
+        The upload to which the chunk belongs
+    :param index:
+        The index of the chunk within the uploaded file
+    :param contents:
+        The bytes of the chunk
+    :return:
+        Whether or not the upload is complete, in which case the partial
+        file has been moved into place at the upload file path.
+    """
+    sync_io.write_file_chunk_at(
+        upload.partial_path,
+        contents,
+        index * upload.chunk_size
+    )
+
+    chunk_count = get_chunk_count(upload.size, upload.chunk_size)
+    with _lock:
+        upload.received.add(index)
+        is_complete = (
+            len(upload.received) >= chunk_count
+            and _uploads.get(upload.file_path) is upload
+        )
+        if is_complete:
+            del _uploads[upload.file_path]
+
+    if is_complete:
+        os.replace(upload.partial_path, upload.file_path)
+
+    return is_complete
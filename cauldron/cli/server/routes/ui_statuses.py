@@ -10,5 +10,6 @@ def ui_status():
     args = arguments.from_request()
     last_timestamp = args.get('last_timestamp', 0)
     force = args.get('force', False)
-    results = statuses.get_status(last_timestamp, force)
+    body_sequences = args.get('body_sequences')
+    results = statuses.get_status(last_timestamp, force, body_sequences)
     return flask.jsonify(results)
@@ -25,6 +25,17 @@ except Exception:  # pragma: no cover
 
 active_execution_responses = dict()  # type: typing.Dict[str, environ.Response]
 
+#: Maximum number of seconds that a run status request will wait for changes
+#: in the command execution before responding, which must remain less than
+#: the request timeout used by the remote clients.
+MAX_RUN_STATUS_WAIT = 5
+
+#: Number of request handling threads of the waitress server. Long-polled run
+#: status requests each hold a thread for up to MAX_RUN_STATUS_WAIT seconds,
+#: which would leave too few threads for other requests with the default of
+#: four threads when more than one client is polling.
+SERVER_THREADS = 16
+
 
 server_data = dict(
     version=SERVER_VERSION,
@@ -36,19 +47,46 @@ server_data = dict(
 authorization = {'code': ''}
 
 
-def get_server_data() -> dict:
-    """..."""
+def get_server_data(include_packages: bool = True) -> dict:
+    """
+    Returns information about the kernel server and the system in which it
+    is running.
+
+    :param include_packages:
+        Whether or not to include the list of imported packages, which can
+        be omitted for lightweight payloads like those returned repeatedly
+        while polling the status of a running command.
+    """
     out = dict(
         uptime=environ.run_time().total_seconds(),
         cauldron_settings=environ.package_settings
     )
     out.update(server_data)
     out.update(environ.systems.get_system_data())
+
+    if not include_packages:
+        del out['packages']
+
     return out
 
 
-def get_running_step_changes(write: bool = False) -> list:
-    """..."""
+def get_running_step_changes(
+        write: bool = False,
+        body_sequences: typing.Dict[str, dict] = None
+) -> list:
+    """
+    Returns the step changes for each of the currently running steps.
+
+    :param write:
+        Whether or not to write the running step changes to disk.
+    :param body_sequences:
+        If specified, the running step changes will only include the report
+        body chunks appended since the client-side state of each step, which
+        is a dictionary of step names mapped to dictionaries with the
+        `body_id` and `sequence` last received for that step. Steps missing
+        from the dictionary are serialized in full so that the client can
+        display them before appending to them.
+    """
     project = cd.project.get_internal_project()
 
     running_steps = list(filter(
@@ -70,7 +108,88 @@ def get_running_step_changes(write: bool = False) -> list:
             written=write
         )
 
-    return [get_changes(step) for step in running_steps]
+    def get_appended(step):
+        state = body_sequences.get(step.definition.name) or {}
+        step_data = writing.step_writer.serialize_chunks(
+            step,
+            body_id=state.get('body_id'),
+            sequence=state.get('sequence', 0)
+        )
+
+        if write:
+            writing.save(project, step_data.file_writes)
+
+        return dict(
+            name=step.definition.name,
+            action='appended',
+            step=step_data._asdict(),
+            timestamp=time.time(),
+            written=write
+        )
+
+    return [
+        get_appended(step)
+        if step.definition.name in (body_sequences or {}) else
+        get_changes(step)
+        for step in running_steps
+    ]
+
+
+def get_running_step_update_time() -> float:
+    """
+    Returns the most recent time at which the display of any of the running
+    steps was updated, or zero if no steps are running.
+    """
+    project = cd.project.get_internal_project(timeout=0)
+    steps = project.steps if project else []
+    return max(
+        [s.report.last_update_time for s in steps if s.is_running] + [0]
+    )
+
+
+def wait_for_run_changes(
+        response: environ.Response,
+        wait: float,
+        log_index: int = 0
+) -> bool:
+    """
+    Waits for the command execution associated with the response to change
+    before returning, which allows run status requests to be long-polled
+    instead of repeated at a fixed interval. A change occurs when the command
+    execution finishes, logs messages beyond the given log index, or updates
+    the display of a running step.
+
+    :param response:
+        Response of the command execution to wait on.
+    :param wait:
+        Maximum number of seconds to wait for a change, which is limited to
+        the MAX_RUN_STATUS_WAIT value.
+    :param log_index:
+        The number of run log messages that the client has already received.
+    :return:
+        Whether or not a change occurred before the wait time elapsed.
+    """
+    thread = response.thread
+    end_time = time.time() + min(max(wait, 0), MAX_RUN_STATUS_WAIT)
+    update_time = get_running_step_update_time()
+
+    while time.time() < end_time:
+        has_changed = (
+            not thread.is_running
+            or len(response.get_thread_log()) > log_index
+            or get_running_step_update_time() > update_time
+        )
+        if has_changed:
+            return True
+
+        # Joining returns immediately once the thread has stopped, which
+        # happens shortly before it stops being considered as running.
+        if thread.is_alive():
+            thread.join(0.05)
+        else:
+            time.sleep(0.05)
+
+    return False
 
 
 def parse(
@@ -198,6 +317,11 @@ def execute(
     if kwargs.get('basic'):
         app.run(port=port, debug=debug, host=host)
     else:
-        waitress.serve(app, port=port, host=host or 'localhost')
+        waitress.serve(
+            app,
+            port=port,
+            host=host or 'localhost',
+            threads=SERVER_THREADS
+        )
 
     environ.modes.remove(environ.modes.INTERACTIVE)
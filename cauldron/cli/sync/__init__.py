@@ -1,4 +1,5 @@
 from cauldron.cli.sync import sync_io as io  # noqa
+from cauldron.cli.sync import manifest  # noqa
 from cauldron.cli.sync import files  # noqa
 from cauldron.cli.sync import comm  # noqa
 from cauldron.cli.sync.threads import send_remote_command  # noqa
@@ -70,6 +70,7 @@ def send_request(
         method: str = None,
         timeout: int = 10,
         max_retries: int = 10,
+        body: bytes = None,
         **kwargs
 ) -> 'environ.Response':
     """
@@ -94,6 +95,8 @@ def send_request(
     :param max_retries:
         Number of retry attempts to make before giving up if a non-HTTP
         error is encountered during communication.
+    :param body:
+        Optional raw binary request body to send instead of JSON data.
     """
     if max_retries < 0:
         return environ.Response().fail(
@@ -109,13 +112,15 @@ def send_request(
         requests.HTTPError,
         requests.Timeout
     )
-    default_method = 'POST' if data is not None else 'GET'
+    has_body = data is not None or body is not None
+    default_method = 'POST' if has_body else 'GET'
     try:
         http_response = requests.request(
             method=method or default_method,
             url=url,
             json=data,
-            timeout=10,
+            data=body,
+            timeout=timeout,
             **kwargs
         )
     except retriable_errors:
@@ -126,6 +131,7 @@ def send_request(
             method=method,
             timeout=timeout,
             max_retries=max_retries - 1,
+            body=body,
             **kwargs
         )
 
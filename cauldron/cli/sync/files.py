@@ -1,13 +1,21 @@
-import glob
+import functools
 import os
 import time
 import typing
-import pathlib
+import zlib
+from concurrent import futures
 
 from cauldron import environ
 from cauldron.cli import sync
 from cauldron.environ.response import Response
 
+#: Number of seconds before a request sending a single binary file chunk
+#: times out, which needs to allow for larger chunks on slower connections.
+CHUNK_TIMEOUT = 30
+
+#: Default maximum number of chunks of a file sent simultaneously.
+DEFAULT_WORKERS = 4
+
 
 def send_chunk(
         chunk: str,
@@ -44,6 +52,122 @@ def send_chunk(
     )
 
 
+def send_binary_chunk(
+        file_path: str,
+        index: int,
+        size: int,
+        modified: float,
+        relative_path: str,
+        chunk_size: int = sync.io.DEFAULT_CHUNK_SIZE,
+        remote_connection: 'environ.RemoteConnection' = None,
+        sync_time: float = -1,
+        location: str = 'project'
+) -> Response:
+    """
+    Reads the chunk at the given index of the specified file and sends it
+    to the remote kernel as a raw binary request body. The remote kernel
+    writes each chunk directly at its offset within the file, which means
+    that chunks can be sent in any order, simultaneously and retried
+    without corrupting the remote file.
+    """
+    source = sync.io.read_file_chunk(file_path, index, chunk_size)
+    body, encoding = sync.io.pack_binary_chunk(source)
+    return sync.comm.send_request(
+        endpoint='/sync-file-v2',
+        method='POST',
+        remote_connection=remote_connection,
+        timeout=CHUNK_TIMEOUT,
+        body=body,
+        headers={'Content-Type': 'application/octet-stream'},
+        params=dict(
+            relative_path=relative_path,
+            index=index,
+            size=size,
+            chunk_size=chunk_size,
+            modified=modified,
+            checksum=zlib.crc32(source),
+            encoding=encoding,
+            sync_time=time.time() if sync_time < 0 else sync_time,
+            location=location
+        )
+    )
+
+
+def get_received_chunks(
+        relative_path: str,
+        size: int,
+        modified: float,
+        chunk_size: int = sync.io.DEFAULT_CHUNK_SIZE,
+        remote_connection: 'environ.RemoteConnection' = None,
+        location: str = 'project'
+) -> Response:
+    """
+    Requests the indexes of the chunks of the specified file that the remote
+    kernel has already received from a previous, interrupted attempt to send
+    the same version of the file, which are returned as the "received" data
+    value of the response.
+    """
+    return sync.comm.send_request(
+        endpoint='/sync-file-v2',
+        method='GET',
+        remote_connection=remote_connection,
+        params=dict(
+            relative_path=relative_path,
+            size=size,
+            chunk_size=chunk_size,
+            modified=modified,
+            location=location
+        )
+    )
+
+
+def _is_unsupported(response: Response) -> bool:
+    """
+    Whether or not the response indicates that the remote kernel is an older
+    version that does not support sending files as binary chunks.
+    """
+    http_response = getattr(response, 'http_response', None)
+    return http_response is not None and http_response.status_code == 404
+
+
+def _send_legacy(
+        file_path: str,
+        relative_path: str,
+        file_kind: str,
+        chunk_size: int,
+        remote_connection: 'environ.RemoteConnection',
+        sync_time: float,
+        location: str,
+        on_progress: typing.Callable
+) -> Response:
+    """
+    Sends the local file contents to a remote kernel that does not support
+    sending files as binary chunks one encoded chunk at a time.
+    """
+    response = Response()
+    offset = 0
+    chunks = sync.io.read_file_chunks(file_path, chunk_size)
+    for index, (chunk, length) in enumerate(chunks):
+        response = send_chunk(
+            chunk=chunk,
+            index=index,
+            offset=offset,
+            relative_path=relative_path,
+            file_kind=file_kind,
+            remote_connection=remote_connection,
+            sync_time=sync_time,
+            location=location,
+        )
+        offset += length
+
+        if response.failed:
+            return response
+
+        on_progress(response, index + 1, length, offset)
+
+    return response
+
+
 def send(
         file_path: str,
         relative_path: str,
@@ -53,9 +177,15 @@ def send(
         newer_than: float = 0,
         progress_callback=None,
         sync_time: float = -1,
-        location: str = 'project'
+        location: str = 'project',
+        max_workers: int = DEFAULT_WORKERS
 ) -> Response:
-    """Sends the local file contents to the remote kernel."""
+    """
+    Sends the local file contents to the remote kernel. Files are sent in
+    binary chunks, up to max_workers of them simultaneously, and chunks
+    that the remote kernel already received during a previous, interrupted
+    attempt to send the same version of the file are not sent again.
+    """
     response = Response()
     sync_time = time.time() if sync_time < 0 else sync_time
     callback = progress_callback or (lambda x: x)
@@ -73,8 +203,8 @@ def send(
         ))
         return response
 
+    size = os.path.getsize(file_path)
     chunk_count = sync.io.get_file_chunk_count(file_path, chunk_size)
-    chunks = sync.io.read_file_chunks(file_path, chunk_size)
 
     def get_progress(complete_count: int = 0) -> typing.Tuple[int, str]:
         """..."""
@@ -85,6 +215,30 @@ def send(
         display = '({}%)'.format('{}'.format(progress_value).ljust(3))
         return progress_value, display
 
+    def on_progress(
+            chunk_response: Response,
+            complete_count: int,
+            length: int,
+            offset: int
+    ):
+        """..."""
+        progress, progress_display = get_progress(complete_count)
+        if chunk_count > 1:
+            callback(chunk_response.notify(
+                kind='SYNC',
+                code='PROGRESS' if complete_count < chunk_count else 'DONE',
+                message='{} -> {} {} "{}"'.format(
+                    '+{:,.0f}B'.format(length),
+                    '{:,.0f}B'.format(offset),
+                    progress_display,
+                    relative_path
+                ),
+                progress=0.01 * progress,
+                chunk_count=chunk_count,
+                file_path=file_path,
+                relative_path=relative_path
+            ))
+
     progress_display = get_progress(0)[-1]
     callback(response.notify(
         kind='SYNC',
@@ -95,43 +249,104 @@ def send(
         relative_path=relative_path,
     ))
 
-    offset = 0
-    for index, (chunk, length) in enumerate(chunks):
-        response = send_chunk(
-            chunk=chunk,
-            index=index,
-            offset=offset,
+    send_legacy = functools.partial(
+        _send_legacy,
+        file_path=file_path,
+        relative_path=relative_path,
+        file_kind=file_kind,
+        chunk_size=chunk_size,
+        remote_connection=remote_connection,
+        sync_time=sync_time,
+        location=location,
+        on_progress=on_progress
+    )
+
+    received = set()
+    if chunk_count > 1:
+        response = get_received_chunks(
             relative_path=relative_path,
-            file_kind=file_kind,
+            size=size,
+            modified=modified_time,
+            chunk_size=chunk_size,
             remote_connection=remote_connection,
-            sync_time=sync_time,
-            location=location,
+            location=location
         )
-        offset += length
-
+        if _is_unsupported(response):
+            return send_legacy()
         if response.failed:
             return response
+        received = set(response.data.get('received') or [])
 
-        progress, progress_display = get_progress(index + 1)
-        if chunk_count > 1:
-            callback(response.notify(
-                kind='SYNC',
-                code='PROGRESS' if (index + 1) < chunk_count else 'DONE',
-                message='{} -> {} {} "{}"'.format(
-                    '+{:,.0f}B'.format(length),
-                    '{:,.0f}B'.format(offset),
-                    progress_display,
-                    relative_path
-                ),
-                progress=0.01 * progress,
-                chunk_count=chunk_count,
+    pending = [i for i in range(chunk_count) if i not in received]
+    complete_count = chunk_count - len(pending)
+    offset = sum([min(chunk_size, size - i * chunk_size) for i in received])
+
+    executor = futures.ThreadPoolExecutor(max(1, min(
+        max_workers,
+        len(pending)
+    )))
+    with executor:
+        sending = {
+            executor.submit(
+                send_binary_chunk,
                 file_path=file_path,
-                relative_path=relative_path
-            ))
+                index=index,
+                size=size,
+                modified=modified_time,
+                relative_path=relative_path,
+                chunk_size=chunk_size,
+                remote_connection=remote_connection,
+                sync_time=sync_time,
+                location=location
+            ): index
+            for index in pending
+        }
+
+        for future in futures.as_completed(sending):
+            response = future.result()
+
+            if response.failed:
+                for f in sending:
+                    f.cancel()
+                if chunk_count < 2 and _is_unsupported(response):
+                    return send_legacy()
+                return response
+
+            length = min(chunk_size, size - sending[future] * chunk_size)
+            complete_count += 1
+            offset += length
+            on_progress(response, complete_count, length, offset)
 
     return response
 
 
+def get_changed_files(
+        file_hashes: typing.Dict[str, str],
+        remote_connection: 'environ.RemoteConnection' = None,
+        location: str = 'project'
+) -> Response:
+    """
+    Sends the content hashes of the local files to the remote kernel, which
+    responds with the relative paths of the files that it is missing or that
+    have different contents as the "changed" data value of the response.
+
+    :param file_hashes:
+        Content hashes of the local files keyed by relative path, using
+        forward slashes as separators.
+    :param remote_connection:
+        The connection to the remote kernel.
+    :param location:
+        Either "project" if the files reside within the project source
+        directory or "shared" if they reside within a shared library folder.
+    """
+    return sync.comm.send_request(
+        endpoint='/sync-manifest',
+        method='POST',
+        remote_connection=remote_connection,
+        data=dict(files=file_hashes, location=location)
+    )
+
+
 def send_all_in(
         project_directory: str,
         relative_directory: str = '.',
@@ -143,7 +358,15 @@ def send_all_in(
         progress_callback=None,
         sync_time: float = -1
 ) -> Response:
-    """..."""
+    """
+    Sends the files within the directory that differ from those in the
+    remote kernel. The content hashes of the local files are exchanged with
+    the remote kernel in a single request to determine which files differ.
+    These hashes are cached in a persistent sync manifest so that only files
+    with a changed size or modified time are hashed again. Remote kernels
+    that do not support exchanging hashes are instead sent the files that
+    were modified after the newer_than timestamp.
+    """
     sync_time = time.time() if sync_time < 0 else sync_time
 
     project_directory = environ.paths.clean(project_directory)
@@ -151,36 +374,55 @@ def send_all_in(
         project_directory,
         relative_directory
     )).rstrip(os.path.sep)
+    within_project = root_directory.startswith(project_directory)
+    location = 'project' if within_project else 'shared'
 
-    glob_end = ('**', '*') if recursive else ('*',)
-    glob_path = os.path.join(root_directory, *glob_end)
-
-    # Only send files that have non-zero size that are not cauldron
-    # reader files and wheels and ignore hidden files that start with a
-    # dot. Also, ignore __pycache__ folders.
-    file_paths = (
-        p
-        for p in glob.iglob(glob_path, recursive=True)
-        if os.path.isfile(p)
-        and os.path.getsize(p) > 0
-        and not p.endswith(('.cauldron', '.whl'))
-        and not p.startswith('.')
-        and '__pycache__' not in p
-    )
+    manifest_path = sync.manifest.get_manifest_path(root_directory)
+    previous_entries = sync.manifest.load(manifest_path)
+    entries = dict()
 
-    for file_path in file_paths:
+    file_hashes = dict()
+    file_paths = dict()
+    listed_files = sync.manifest.list_files(root_directory, recursive)
+    for file_path, stats in listed_files:
         relative_path = file_path[len(root_directory):].strip(os.path.sep)
-        within_project = root_directory.startswith(project_directory)
+        key = relative_path.replace(os.path.sep, '/')
+        file_paths[key] = file_path
+
+        if key in previous_entries:
+            entries[key] = previous_entries[key]
+        file_hashes[key] = sync.manifest.get_file_hash(
+            file_path,
+            stats=stats,
+            entries=entries,
+            key=key
+        )
+
+    if entries != previous_entries:
+        sync.manifest.save(manifest_path, entries)
+
+    response = get_changed_files(file_hashes, remote_connection, location)
+    if _is_unsupported(response):
+        changed = None
+    elif response.failed:
+        return response
+    else:
+        changed = set(response.data.get('changed') or [])
+
+    for key, file_path in file_paths.items():
+        if changed is not None and key not in changed:
+            continue
+
         response = send(
             file_path=file_path,
-            relative_path=relative_path,
+            relative_path=key.replace('/', os.path.sep),
             file_kind=files_kind,
             chunk_size=chunk_size,
             remote_connection=remote_connection,
-            newer_than=newer_than,
+            newer_than=newer_than if changed is None else 0,
             progress_callback=progress_callback,
             sync_time=sync_time,
-            location='project' if within_project else 'shared'
+            location=location
         )
 
         if response.failed:
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import typing
+
+from cauldron import environ
+from cauldron import writer
+
+#: Hash cache entries of previously hashed files keyed by absolute file path
+#: for files that are hashed without a persistent manifest, e.g. by the kernel
+#: when comparing its files to a sync manifest sent by the client.
+_file_hashes = dict()  # type: typing.Dict[str, list]
+
+
+def get_manifest_path(directory: str) -> str:
+    """
+    Returns the path where the persistent sync manifest for the specified
+    local directory is stored within the user's Cauldron app data folder.
+
+    :param directory:
+        The absolute path of the directory being synchronized
+    """
+    key = hashlib.sha1(directory.encode('utf-8')).hexdigest()
+    return environ.paths.user('sync', '{}.json'.format(key))
+
+
+def load(manifest_path: str) -> typing.Dict[str, list]:
+    """
+    Loads the sync manifest stored at the specified path, which maps file
+    paths to lists containing the size, modified time in nanoseconds and
+    content hash of each file when it was last hashed. An empty manifest is
+    returned if the manifest does not exist or cannot be read.
+
+    :param manifest_path:
+        The path where the manifest is stored
+    """
+    try:
+        with open(manifest_path, 'r') as f:
+            entries = json.load(f)
+    except Exception:
+        return {}
+
+    return entries if isinstance(entries, dict) else {}
+
+
+def save(manifest_path: str, entries: typing.Dict[str, list]):
+    """
+    Saves the sync manifest entries to the specified path.
+
+    :param manifest_path:
+        The path where the manifest will be stored
+    :param entries:
+        The manifest entries to save
+    """
+    directory = os.path.dirname(manifest_path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    writer.write_file_atomically(manifest_path, json.dumps(entries))
+
+
+def hash_file(path: str) -> str:
+    """Returns a hex digest of the contents of the specified file."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1048576), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_file_hash(
+        path: str,
+        stats: os.stat_result = None,
+        entries: typing.Dict[str, list] = None,
+        key: str = None
+) -> typing.Optional[str]:
+    """
+    Returns the content hash of the specified file, which is only computed
+    if the size or modified time of the file differs from the manifest entry
+    for the file. Otherwise the hash stored in the entry is returned.
+
+    :param path:
+        The absolute path of the file to hash
+    :param stats:
+        The stat result for the file if already available, which saves
+        having to stat the file again.
+    :param entries:
+        The manifest entries in which to look up and store the hash of the
+        file. If omitted, an in-memory cache of hashes is used instead.
+    :param key:
+        The key of the file within the manifest entries, which defaults to
+        the file path.
+    :return:
+        The content hash of the file or None if the file does not exist.
+    """
+    entries = _file_hashes if entries is None else entries
+    key = path if key is None else key
+
+    try:
+        stats = stats or os.stat(path)
+    except OSError:
+        return None
+
+    entry = entries.get(key)
+    if entry and entry[:2] == [stats.st_size, stats.st_mtime_ns]:
+        return entry[2]
+
+    try:
+        file_hash = hash_file(path)
+    except OSError:
+        return None
+
+    entries[key] = [stats.st_size, stats.st_mtime_ns, file_hash]
+    return file_hash
+
+
+def list_files(
+        directory: str,
+        recursive: bool = True
+) -> typing.Iterator[typing.Tuple[str, os.stat_result]]:
+    """
+    Lists the files within the specified directory that should be
+    synchronized along with their stat results. Empty files, hidden files
+    and directories, __pycache__ directories, cauldron reader files and
+    wheels are skipped. Directories are scanned without additional calls to
+    determine the type of each entry and each file is only stat-ed once.
+
+    :param directory:
+        The directory in which to list files
+    :param recursive:
+        Whether or not to include the files in all descendant directories
+    """
+    try:
+        dir_entries = list(os.scandir(directory))
+    except OSError:
+        return
+
+    for entry in dir_entries:
+        if entry.name.startswith('.') or entry.name == '__pycache__':
+            continue
+
+        try:
+            if entry.is_dir():
+                if recursive:
+                    yield from list_files(entry.path, recursive)
+                continue
+
+            if entry.name.endswith(('.cauldron', '.whl')):
+                continue
+
+            stats = entry.stat() if entry.is_file() else None
+        except OSError:
+            continue
+
+        if stats and stats.st_size > 0:
+            yield entry.path, stats
+
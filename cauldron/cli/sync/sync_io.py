@@ -123,3 +123,80 @@ def write_file_chunk(
     mode = 'ab' if append else 'wb'
     contents = unpack_chunk(packed_chunk)
     writer.write_file(file_path, contents, mode=mode, offset=offset)
+
+
+def pack_binary_chunk(source_data: bytes) -> typing.Tuple[bytes, str]:
+    """
+    Packs the specified binary source data for transmission as a raw binary
+    request body. The data is compressed with the Zlib library only when
+    doing so makes it meaningfully smaller, which is not the case for data
+    that is already compressed like images or parquet files.
+
+    :param source_data:
+        The data to be packed for transmission
+    :return:
+        A tuple containing the packed bytes and the encoding that was applied
+        to them, which is an empty string if the data was not compressed.
+    """
+    if not source_data:
+        return b'', ''
+
+    compressed = zlib.compress(source_data, 1)
+    if len(compressed) < 0.9 * len(source_data):
+        return compressed, 'zlib'
+
+    return source_data, ''
+
+
+def unpack_binary_chunk(chunk_data: bytes, encoding: str = '') -> bytes:
+    """
+    Unpacks binary chunk data previously packed with the pack_binary_chunk
+    function back into the original bytes representation
+
+    :param chunk_data:
+        The packed bytes to convert back to the source bytes object.
+    :param encoding:
+        The encoding that was applied to the chunk data when it was packed.
+    """
+    if encoding == 'zlib':
+        return zlib.decompress(chunk_data)
+    return chunk_data or b''
+
+
+def read_file_chunk(
+        file_path: str,
+        index: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> bytes:
+    """
+    Reads the chunk of the specified file at the given chunk index, which
+    allows chunks to be read independently of one another.
+
+    :param file_path:
+        The path to the file to read the chunk from
+    :param index:
+        The index of the chunk within the file
+    :param chunk_size:
+        The size, in bytes, of each chunk in the file.
+    """
+    with open(file_path, mode='rb') as fp:
+        fp.seek(index * chunk_size)
+        return fp.read(chunk_size)
+
+
+def write_file_chunk_at(file_path: str, contents: bytes, offset: int):
+    """
+    Writes the contents into the existing file at the given byte offset
+    without modifying any other part of the file, which allows chunks of a
+    file to be written in any order and even simultaneously.
+
+    :param file_path:
+        The path to the existing file where the contents will be written.
+    :param contents:
+        The bytes to write into the file.
+    :param offset:
+        The byte offset in the file where the contents will be written.
+    """
+    with open(file_path, mode='r+b') as fp:
+        fp.seek(offset)
+        fp.write(contents)
@@ -7,6 +7,10 @@ from cauldron import environ
 from cauldron.environ.response import Response
 from cauldron.cli.sync import comm
 
+#: Number of seconds that the remote kernel is asked to wait for changes in
+#: a running command before responding to each run status request.
+RUN_STATUS_WAIT = 4
+
 
 def send_remote_command(
         command: str,
@@ -72,15 +76,36 @@ class AsyncCommandThread(threading.Thread):
         )
         return has_finished_response
 
+    @property
+    def log_index(self) -> int:
+        """Number of run log messages received from the remote kernel."""
+        return max([
+            len(r.data.get('run_log', []))
+            for r in self.responses
+        ] + [0])
+
     def check_status(self) -> Response:
-        """..."""
+        """
+        Requests the status of the remote command execution. The remote
+        kernel holds the request open until the execution changes or the
+        RUN_STATUS_WAIT time elapses, which returns changes as soon as they
+        happen without repeatedly polling the remote kernel.
+        """
         run_uid = self.responses[-1].data.get('run_uid', '')
-        endpoint = '/abort' if self.abort else '/run-status/{}'.format(run_uid)
+
+        if self.abort:
+            return comm.send_request(
+                endpoint='/abort',
+                remote_connection=self.remote_connection,
+                method='GET'
+            )
 
         return comm.send_request(
-            endpoint=endpoint,
+            endpoint='/run-status/{}'.format(run_uid),
             remote_connection=self.remote_connection,
-            method='GET'
+            method='POST',
+            data=dict(wait=RUN_STATUS_WAIT, log_index=self.log_index),
+            timeout=RUN_STATUS_WAIT + 10
         )
 
     def add_response(self, response: Response) -> Response:
@@ -127,7 +152,15 @@ class AsyncCommandThread(threading.Thread):
             ).response)
 
         while not self.is_finished:
-            time.sleep(1)
+            # Kernels that do not support waiting for changes respond to
+            # run status requests immediately and must be polled at a fixed
+            # interval instead.
+            is_polling = (
+                len(self.responses) > 1
+                and 'run_wait' not in self.responses[-1].data
+            )
+            if is_polling:
+                time.sleep(1)
             self.add_response(self.check_status())
 
         self.is_executing = False
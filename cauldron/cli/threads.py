@@ -4,6 +4,12 @@ import threading
 import uuid
 from datetime import datetime
 
+#: The CauldronThreads that have been marked as aborted and have not yet
+#: finished running. Abort checks return immediately without inspecting
+#: the current thread whenever this is empty, which is almost always the
+#: case, making them cheap enough to call on every shared value access.
+_aborted_threads = set()
+
 
 class ThreadAbortError(Exception):
     """
@@ -23,7 +29,7 @@ class CauldronThread(threading.Thread):
         """Create a new Cauldron Thread"""
         super(CauldronThread, self).__init__(*args, **kwargs)
 
-        self.abort = False
+        self._abort = False
         self.context = None
         self.daemon = True
         self.uid = str(uuid.uuid4())
@@ -38,6 +44,23 @@ class CauldronThread(threading.Thread):
         self._loop = None
         self.completed_at = None  # type: typing.Optional[datetime]
         self._has_started = False
+        self._has_finished = False
+
+    @property
+    def abort(self) -> bool:
+        """
+        Whether or not the user has requested that the command running in
+        this thread stop prematurely.
+        """
+        return self._abort
+
+    @abort.setter
+    def abort(self, value: bool):
+        self._abort = bool(value)
+        if self._abort and not self._has_finished:
+            _aborted_threads.add(self)
+        else:
+            _aborted_threads.discard(self)
 
     @property
     def is_running(self) -> bool:
@@ -77,10 +100,14 @@ class CauldronThread(threading.Thread):
 
         self._has_started = True
         self._loop = asyncio.new_event_loop()
-        self._loop.run_until_complete(run_command())
-        self._loop.close()
-        self._loop = None
-        self.completed_at = datetime.utcnow()
+        try:
+            self._loop.run_until_complete(run_command())
+        finally:
+            self._loop.close()
+            self._loop = None
+            self.completed_at = datetime.utcnow()
+            self._has_finished = True
+            _aborted_threads.discard(self)
 
     def abort_running(self) -> bool:
         """
@@ -108,10 +135,9 @@ def abort_thread():
     thread as aborted. It only applies to operations that are run within
     CauldronThreads and not the main thread.
     """
-    thread = threading.current_thread()
-
-    if not isinstance(thread, CauldronThread):
+    if not _aborted_threads:
         return
 
-    if thread.is_executing and thread.abort:
+    thread = threading.current_thread()
+    if thread in _aborted_threads and thread.is_executing:
         raise ThreadAbortError('User Aborted Execution')
@@ -73,11 +73,22 @@ def module_to_package_data(
     )
 
 
-def get_system_data() -> typing.Union[None, dict]:
+#: The most recently computed system data along with the number of modules
+#: that were loaded when it was computed.
+_system_data_snapshot = dict(module_count=None, data=None)
+
+
+def get_system_data(refresh: bool = False) -> typing.Union[None, dict]:
     """
     Returns information about the system in which Cauldron is running.
-    If the information cannot be found, None is returned instead.
-
+    If the information cannot be found, None is returned instead. Finding
+    the package information requires inspecting every loaded module, so the
+    result is cached and only recomputed when the number of loaded modules
+    has changed since it was last computed.
+
+    :param refresh:
+        Whether or not to recompute the system data even if the number of
+        loaded modules has not changed.
     :return:
         Dictionary containing information about the Cauldron system, whic
         includes:
@@ -86,6 +97,27 @@ def get_system_data() -> typing.Union[None, dict]:
          * version
     """
 
+    module_count = len(sys.modules)
+    snapshot = _system_data_snapshot
+    is_current = (
+        not refresh
+        and snapshot['data'] is not None
+        and snapshot['module_count'] == module_count
+    )
+    if not is_current:
+        snapshot.update(data=_create_system_data(), module_count=module_count)
+
+    # Callers are free to modify the returned data, so the cached data
+    # is copied instead of being shared.
+    data = snapshot['data']
+    return dict(
+        python=data['python'].copy(),
+        packages=[p.copy() for p in data['packages']]
+    )
+
+
+def _create_system_data() -> dict:
+    """Inspects the loaded modules to create the system data."""
     site_packages = get_site_packages()
     path_prefixes = [('[SP]', p) for p in site_packages]
     path_prefixes.append(('[CORE]', sys.exec_prefix))
@@ -70,7 +70,9 @@ def run_batch(args: dict) -> int:
         project_directory=args.get('project_directory'),
         log_path=args.get('logging_path'),
         output_directory=args.get('output_directory'),
-        shared_data=load_shared_data(args.get('shared_data_path'))
+        shared_data=load_shared_data(args.get('shared_data_path')),
+        checkpoint=args.get('checkpoint', False),
+        resume_from=args.get('resume_from')
     )
     return 0
 
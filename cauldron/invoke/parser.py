@@ -139,6 +139,20 @@ def add_shell_action(sub_parser: ArgumentParser) -> ArgumentParser:
         default=None
     )
 
+    sub_parser.add_argument(
+        '--checkpoint',
+        dest='checkpoint',
+        default=False,
+        action='store_true'
+    )
+
+    sub_parser.add_argument(
+        '--resume-from',
+        dest='resume_from',
+        type=str,
+        default=None
+    )
+
     return sub_parser
 
 
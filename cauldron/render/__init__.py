@@ -1,3 +1,4 @@
+import hashlib
 import json as json_internal
 import math
 import os
@@ -13,6 +14,7 @@ from cauldron import templating
 from cauldron.render import encoding
 from cauldron.render import inspection
 from cauldron.render import syntax_highlighting
+from cauldron.render import tables
 from cauldron.render import utils as render_utils
 
 
@@ -96,6 +98,12 @@ def inspect(source: dict) -> str:
     return inspection.render_tree(out)
 
 
+#: Highlighted code file doms keyed by the path and render arguments, which
+#: hold the size and modified time of the file when it was rendered.
+_CODE_FILE_CACHE = dict()  # type: typing.Dict[tuple, tuple]
+_CODE_FILE_CACHE_SIZE = 256
+
+
 def code_file(
         path: str,
         language: str = None,
@@ -103,6 +111,9 @@ def code_file(
         is_code_block: bool = False
 ) -> str:
     """
+    Renders the syntax highlighted contents of the code file at the given
+    path. The rendered result is cached and reused until the size or
+    modified time of the file changes.
 
     :param path:
     :param language:
@@ -114,9 +125,17 @@ def code_file(
 
     path = environ.paths.clean(path)
 
-    if not os.path.exists(path):
+    try:
+        stats = os.stat(path)
+    except OSError:
         return 'File does not exist: {}'.format(path)
 
+    key = (path, language, mime_type, is_code_block)
+    signature = (stats.st_mtime_ns, stats.st_size)
+    cached = _CODE_FILE_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
     source = None
     for encoding in ['utf-8', 'mac_roman', 'cp1250']:
         try:
@@ -129,7 +148,7 @@ def code_file(
     if source is None:
         return ''
 
-    return code(
+    dom = code(
         source=source,
         language=language,
         filename=path,
@@ -137,6 +156,15 @@ def code_file(
         is_code_block=is_code_block
     )
 
+    if key not in _CODE_FILE_CACHE:
+        while len(_CODE_FILE_CACHE) >= _CODE_FILE_CACHE_SIZE:
+            # Dictionaries preserve insertion order, which makes the first
+            # key the oldest entry in the cache.
+            _CODE_FILE_CACHE.pop(next(iter(_CODE_FILE_CACHE)), None)
+
+    _CODE_FILE_CACHE[key] = (signature, dom)
+    return dom
+
 
 def code(
         source: str,
@@ -347,37 +375,146 @@ def plotly(
     )
 
 
-def table(
-        data_frame,
-        scale: float = 0.7,
-        include_index: bool = False,
-        max_rows: int = 500,
-        sample_rows: typing.Optional[int] = None,
-        formats: typing.Union[
-            str,
-            typing.Callable[[typing.Any], str],
-            typing.Dict[
-                str,
-                typing.Union[str, typing.Callable[[typing.Any], str]]
-            ]
-        ] = None
+def _create_plotly_blob(
+        value,
+        encoder: typing.Type[json_internal.JSONEncoder],
+        directory: str,
+        files: dict
 ) -> str:
     """
+    Serializes the Plotly value into a content-addressed data file within
+    the directory, which is added to the files dictionary, and returns the
+    key of the file. Identical values share the same key and file.
+    """
+    serialized = json_internal.dumps(value, cls=encoder)
+    key = hashlib.sha1(serialized.encode()).hexdigest()[:20]
+    files['{}/{}.js'.format(directory, key)] = (
+        'window.CAULDRON_PLOTLY_DATA["{}"].resolve({});'.format(
+            key,
+            serialized
+        )
+    )
+    return key
 
-    :param data_frame:
+
+def shared_data_plotly(
+        data: list = None,
+        layout: dict = None,
+        scale: float = 0.5,
+        figure: dict = None,
+        static: bool = False,
+        directory: str = 'plotly'
+) -> dict:
+    """
+    Creates a Plotly plot in the display where the trace data and layout
+    template are stored in content-addressed data files instead of being
+    embedded within the display. Traces that are identical to those of
+    other plots are therefore only written and loaded once. The data files
+    are loaded when the plot first scrolls into view.
+
+    :param data:
+        The Plotly trace data to be plotted.
+    :param layout:
+        The layout data used for the plot.
     :param scale:
-    :param include_index:
-    :param max_rows:
-    :param sample_rows:
-    :param formats:
+        The display scale with units of fractional screen height.
+    :param figure:
+        In cases where you need to create a figure instead of separate data
+        and layout information, you can pass the figure here and leave the
+        data and layout values as None.
+    :param static:
+        If true, the plot will be created without interactivity.
+    :param directory:
+        The directory relative to the project results folder in which the
+        data files will be written, which should be shared by all steps so
+        that identical data is written only once.
+    :return:
+        A dictionary containing the rendered "body" and the "files" to
+        write, keyed by their paths relative to the results directory.
     """
     environ.abort_thread()
 
-    table_id = 'table-{}-{}'.format(
+    try:
+        import plotly as plotly_lib
+    except ImportError:
+        plotly_lib = None
+
+    if plotly_lib is None:
+        return dict(
+            body=templating.render_template(
+                template_name='import-error.html',
+                library_name='Plotly'
+            ),
+            files={}
+        )
+
+    source = figure if figure else {'data': data, 'layout': layout}
+    fig = plotly_lib.tools.return_figure_from_figure_or_data(source, True)
+
+    encoder = plotly_lib.utils.PlotlyJSONEncoder
+    files = dict()
+    directory = directory.strip('/')
+    traces = []
+    for trace in fig.get('data') or []:
+        environ.abort_thread()
+        traces.append(_create_plotly_blob(trace, encoder, directory, files))
+
+    layout = dict(fig.get('layout') or {})
+    template = layout.pop('template', None)
+
+    plot_id = 'plotly-{}'.format(templating.make_template_uid())
+    settings = dict(
+        id=plot_id,
+        src=directory,
+        traces=traces,
+        template=(
+            _create_plotly_blob(template, encoder, directory, files)
+            if template else
+            None
+        ),
+        layout=layout,
+        config={'staticPlot': static, 'showLink': False, 'responsive': True}
+    )
+
+    dom = templating.render_template(
+        'plotly-shared-data.html',
+        id=plot_id,
+        settings=(
+            json_internal.dumps(settings, cls=encoder)
+            .replace('</', '<\\/')
+        )
+    )
+
+    body = templating.render_template(
+        'plotly-component.html',
+        dom=dom,
+        scale=scale,
+        min_height=round(100.0 * scale),
+        id=plot_id
+    )
+    return dict(body=body, files=files)
+
+
+def _create_table_id() -> str:
+    """Creates a unique identifier for a rendered table."""
+    return 'table-{}-{}'.format(
         datetime.utcnow().strftime('%H-%M-%S-%f'),
         random.randint(0, 1e8)
     )
 
+
+def _get_table_frame(
+        data_frame,
+        include_index: bool = False,
+        max_rows: typing.Optional[int] = None,
+        sample_rows: typing.Optional[int] = None,
+        formats=None
+):
+    """
+    Returns the data frame containing the values to be displayed in a table
+    for the specified data frame or series, which has been sampled, limited
+    and formatted according to the arguments.
+    """
     df_source = (
         data_frame.to_frame()
         if hasattr(data_frame, 'to_frame') else
@@ -392,7 +529,7 @@ def table(
 
     df_source = (
         df_source.head(max_rows)
-        if len(df_source) > max_rows else
+        if max_rows is not None and len(df_source) > max_rows else
         df_source
     )
 
@@ -402,28 +539,147 @@ def table(
     if include_index:
         df_source = df_source.reset_index()
 
-    df_source = df_source.assign(**{
-        name: df_source[name].map(
+    return df_source.assign(**{
+        name: tables.format_column(
+            df_source[name],
             getattr(format_definition, 'format', format_definition)
         )
         for name, format_definition in (formats or {}).items()
         if name in df_source
     })
 
-    column_headers = ['"{}"'.format(x) for x in df_source.columns.tolist()]
-    data = df_source.values.tolist()
 
-    json_data = json_internal.dumps(data, cls=encoding.ComplexJsonEncoder)
+def table(
+        data_frame,
+        scale: float = 0.7,
+        include_index: bool = False,
+        max_rows: int = 500,
+        sample_rows: typing.Optional[int] = None,
+        formats: typing.Union[
+            str,
+            typing.Callable[[typing.Any], str],
+            typing.Dict[
+                str,
+                typing.Union[str, typing.Callable[[typing.Any], str]]
+            ]
+        ] = None
+) -> str:
+    """
+
+    :param data_frame:
+    :param scale:
+    :param include_index:
+    :param max_rows:
+    :param sample_rows:
+    :param formats:
+    """
+    environ.abort_thread()
+
+    table_id = _create_table_id()
+    df_source = _get_table_frame(
+        data_frame,
+        include_index=include_index,
+        max_rows=max_rows,
+        sample_rows=sample_rows,
+        formats=formats
+    )
+
+    column_headers = ['"{}"'.format(x) for x in df_source.columns.tolist()]
 
     return templating.render_template(
         'table.html',
         id=table_id,
         scale=min(0.95, max(0.05, scale)),
-        data=json_data,
+        columns=tables.dumps_columns(df_source),
         column_headers=', '.join(column_headers)
     )
 
 
+def streaming_table(
+        data_frame,
+        directory: str = 'tables',
+        scale: float = 0.7,
+        include_index: bool = False,
+        sample_rows: typing.Optional[int] = None,
+        formats: typing.Union[
+            str,
+            typing.Callable[[typing.Any], str],
+            typing.Dict[
+                str,
+                typing.Union[str, typing.Callable[[typing.Any], str]]
+            ]
+        ] = None,
+        page_size: int = 1000
+) -> dict:
+    """
+    Renders a table that loads its rows from separate page files only as
+    they are scrolled into view, which allows very large data frames to be
+    displayed without including their values in the rendered body. Each
+    page file is a script that stores the values of its rows column by
+    column, which can be loaded from the results directory whether it is
+    viewed through a server or directly from the file system.
+
+    :param data_frame:
+        The data frame or series to render as a table.
+    :param directory:
+        The directory, relative to the project results directory, in which
+        the page files of the table will be written.
+    :param scale:
+        The maximum display height as a fraction of the window height.
+    :param include_index:
+        Whether or not to include the index as columns in the table.
+    :param sample_rows:
+        If a positive integer, the number of rows to randomly sample from
+        the data frame for display.
+    :param formats:
+        Formats for the column values as used by the table function.
+    :param page_size:
+        The number of rows stored within each page file.
+    :return:
+        A dictionary containing the rendered "body" and the "files" to
+        write, keyed by their paths relative to the results directory.
+    """
+    environ.abort_thread()
+
+    table_id = _create_table_id()
+    source = '{}/{}'.format(directory.strip('/'), table_id)
+    df_source = _get_table_frame(
+        data_frame,
+        include_index=include_index,
+        sample_rows=sample_rows,
+        formats=formats
+    )
+
+    files = dict()
+    row_count = len(df_source)
+    for index, start in enumerate(range(0, max(1, row_count), page_size)):
+        environ.abort_thread()
+        page = df_source.iloc[start:start + page_size]
+        files['{}/{}.js'.format(source, index)] = (
+            'window.CAULDRON_TABLE_PAGES["{}"]({}, {});'.format(
+                table_id,
+                index,
+                tables.dumps_columns(page)
+            )
+        )
+
+    settings = dict(
+        id=table_id,
+        columns=[str(c) for c in df_source.columns],
+        row_count=row_count,
+        page_size=page_size,
+        src=source
+    )
+
+    body = templating.render_template(
+        'streaming-table.html',
+        id=table_id,
+        scale=min(0.95, max(0.05, scale)),
+        settings=json_internal.dumps(settings).replace('</', '<\\/')
+    )
+    return dict(body=body, files=files)
+
+
 def whitespace(lines: float = 1.0) -> str:
     """
 
@@ -1,48 +1,250 @@
 import datetime
-import json
-import numpy as np
-import pandas as pd
 import decimal
+import functools
+import json
 import typing
 from collections import namedtuple
 
+import numpy as np
+import pandas as pd
 from flask.json import JSONEncoder as FlaskJsonEncoder
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 NOT_OVERRIDEN = namedtuple('NOT_OVERRIDEN', [])
 
+#: Name of the JSON library used to serialize values by the fast encoding
+#: paths, which is orjson when it is installed and the standard library
+#: json module otherwise.
+_backend = {'name': 'orjson' if orjson is not None else 'json'}
+
+
+def to_datetime_strings(values: np.ndarray) -> list:
+    """
+    Converts the naive datetime64 values into ISO formatted strings that
+    include fractional seconds only when they are non-zero, which matches
+    the isoformat of the individual timestamps.
+    """
+    nanoseconds = values.astype('datetime64[ns]').view('int64')
+    remainder = np.where(np.isnat(values), 0, nanoseconds % 1000000000)
+    if not remainder.any():
+        return np.datetime_as_string(values, unit='s').tolist()
+
+    strings = np.where(
+        remainder == 0,
+        np.datetime_as_string(values, unit='s'),
+        np.where(
+            remainder % 1000 == 0,
+            np.datetime_as_string(values, unit='us'),
+            np.datetime_as_string(values, unit='ns')
+        )
+    )
+    return strings.tolist()
+
+
+def array_to_list(values: np.ndarray) -> list:
+    """
+    Converts the NumPy array into a (nested) list of JSON serializable
+    values as a whole instead of element by element. Datetime arrays are
+    converted into ISO formatted strings and timedelta arrays into seconds.
+    Object arrays are converted into lists of their Python values, which
+    may still need to be encoded individually.
+
+    :param values:
+        The array to convert.
+    """
+    kind = values.dtype.kind
+
+    if kind == 'M':
+        flat = to_datetime_strings(values.ravel())
+        return np.array(flat, dtype=object).reshape(values.shape).tolist()
+
+    if kind == 'm':
+        return (values / np.timedelta64(1, 's')).tolist()
 
+    return values.tolist()
+
+
+def series_to_list(series: pd.Series) -> list:
+    """
+    Converts the values of the series into a list of JSON serializable
+    values. Numeric, boolean, datetime, timedelta and categorical series
+    are converted as a whole instead of value by value. Other series are
+    converted into lists of their Python values, which may still include
+    values that must be encoded individually.
+
+    :param series:
+        The series to convert.
+    """
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = series_to_list(pd.Series(series.cat.categories))
+        values = np.array(categories + [float('nan')], dtype=object)
+        return values[series.cat.codes.to_numpy()].tolist()
+
+    if dtype.kind == 'M' and getattr(dtype, 'tz', None) is None:
+        return to_datetime_strings(series.to_numpy())
+
+    if dtype.kind == 'm':
+        return series.dt.total_seconds().tolist()
+
+    return series.tolist()
+
+
+@functools.singledispatch
 def default_override(value: typing.Any):
-    """..."""
-
-    if isinstance(value, decimal.Decimal):
-        return float(value)
-    if isinstance(value, datetime.date):
-        return value.isoformat()
-    elif isinstance(value, datetime.datetime):
-        return value.isoformat()
-    elif isinstance(value, datetime.time):
-        return value.isoformat()
-    elif isinstance(value, pd.Timestamp):
-        return value.to_pydatetime().isoformat()
-    elif isinstance(value, np.datetime64):
-        return pd.Timestamp(value).to_pydatetime().isoformat()
-    elif isinstance(value, datetime.timedelta):
-        return value.total_seconds()
-    elif isinstance(value, np.ndarray):
-        return value.tolist()
-    elif isinstance(value, (np.int8, np.int16, np.int32, np.int64)):
-        return int(value)
-    elif isinstance(value, (np.float16, np.float32, np.float64)):
-        return float(value)
-    elif isinstance(value, pd.Series):
-        return value.tolist()
-    elif isinstance(value, bytes):
-        return value.decode()
+    """
+    Converts values that are not natively JSON serializable into values
+    that are. The conversion is dispatched on the type of the value, which
+    means additional types can be supported by registering a conversion
+    function for them with ``default_override.register``. A NOT_OVERRIDEN
+    instance is returned for values of unsupported types.
 
+    :param value:
+        The value to convert into a JSON serializable value.
+    """
     return NOT_OVERRIDEN()
 
 
+def _to_isoformat(value) -> str:
+    return value.isoformat()
+
+
+def _to_float(value) -> float:
+    return float(value)
+
+
+default_override.register(decimal.Decimal, _to_float)
+default_override.register(np.floating, _to_float)
+default_override.register(datetime.date, _to_isoformat)
+default_override.register(datetime.time, _to_isoformat)
+default_override.register(np.ndarray, array_to_list)
+default_override.register(pd.Series, series_to_list)
+
+
+@default_override.register(pd.Timestamp)
+def _from_timestamp(value: pd.Timestamp) -> str:
+    return value.to_pydatetime().isoformat()
+
+
+@default_override.register(np.datetime64)
+def _from_datetime64(value: np.datetime64) -> str:
+    return pd.Timestamp(value).to_pydatetime().isoformat()
+
+
+@default_override.register(datetime.timedelta)
+def _from_timedelta(value: datetime.timedelta) -> float:
+    return value.total_seconds()
+
+
+@default_override.register(np.integer)
+def _from_integer(value: np.integer) -> int:
+    return int(value)
+
+
+@default_override.register(np.bool_)
+def _from_bool(value: np.bool_) -> bool:
+    return bool(value)
+
+
+@default_override.register(bytes)
+def _from_bytes(value: bytes) -> str:
+    return value.decode()
+
+
+@default_override.register(tuple)
+def _from_tuple(value: tuple) -> list:
+    # Only called by encoders that do not natively support tuple subclasses
+    # like named tuples, which the standard library serializes as lists.
+    return list(value)
+
+
+def _default(value):
+    """
+    Default function for the fast JSON library that raises a TypeError
+    for values that cannot be converted.
+    """
+    result = default_override(value)
+    if isinstance(result, NOT_OVERRIDEN):
+        raise TypeError(
+            'Object of type {} is not JSON serializable'
+            .format(type(value).__name__)
+        )
+    return result
+
+
+def get_backend() -> str:
+    """Returns the name of the JSON library used by the fast encoding paths."""
+    return _backend['name']
+
+
+def set_backend(name: str):
+    """
+    Sets the JSON library used by the fast encoding paths, which must be
+    either "json" or "orjson" if it is installed.
+
+    :param name:
+        The name of the JSON library to use.
+    """
+    if name not in ('json', 'orjson'):
+        raise ValueError('Unknown JSON backend "{}"'.format(name))
+
+    if name == 'orjson' and orjson is None:
+        raise ImportError('The orjson library is not installed')
+
+    _backend['name'] = name
+
+
+def _fast_dumps(
+        value: typing.Any,
+        sort_keys: bool = False,
+        indent: int = None
+) -> typing.Optional[str]:
+    """
+    Serializes the value with the fast JSON library when it is the active
+    backend and supports the specified settings. None is returned when the
+    value must be serialized by the standard library instead. Note that
+    NaN and infinite float values are serialized as null by the fast
+    library.
+    """
+    if _backend['name'] != 'orjson' or indent not in (None, 2):
+        return None
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    option |= orjson.OPT_SORT_KEYS if sort_keys else 0
+    option |= orjson.OPT_INDENT_2 if indent else 0
+
+    try:
+        return orjson.dumps(value, default=_default, option=option).decode()
+    except TypeError:
+        return None
+
+
+def dumps(value: typing.Any, sort_keys: bool = False) -> str:
+    """
+    Serializes the value into a JSON string using the fast JSON library
+    if it is available and falling back to the standard library with the
+    ComplexJsonEncoder otherwise. This should be used where only a valid
+    JSON representation of the value is needed and not the exact output
+    of the standard library, which differs in whitespace and non-finite
+    float values.
+
+    :param value:
+        The value to serialize.
+    :param sort_keys:
+        Whether or not to sort the keys of dictionaries in the output.
+    """
+    result = _fast_dumps(value, sort_keys=sort_keys)
+    if result is not None:
+        return result
+    return json.dumps(value, cls=ComplexJsonEncoder, sort_keys=sort_keys)
+
+
 class ComplexJsonEncoder(json.JSONEncoder):
     """
     Expands JSON encoding to include commonly observed types in scientific
@@ -61,7 +263,9 @@ class ComplexJsonEncoder(json.JSONEncoder):
 
 class ComplexFlaskJsonEncoder(FlaskJsonEncoder):
     """
-    Expands JSON encoding
+    Expands JSON encoding of Flask responses to include commonly observed
+    types in scientific data and serializes responses with the fast JSON
+    library when it is available.
     """
 
     def default(self, value):
@@ -72,3 +276,11 @@ class ComplexFlaskJsonEncoder(FlaskJsonEncoder):
             if isinstance(result, NOT_OVERRIDEN) else
             result
         )
+
+    def encode(self, value) -> str:
+        result = (
+            _fast_dumps(value, sort_keys=self.sort_keys, indent=self.indent)
+            if not self.skipkeys else
+            None
+        )
+        return super().encode(value) if result is None else result
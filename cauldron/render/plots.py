@@ -1,10 +1,120 @@
+import hashlib
 import io
+import re
 import typing
 
 from cauldron import environ
 from cauldron import templating
 
 
+#: Supported formats in which pyplot figures can be rendered into images.
+PYPLOT_FORMATS = ('svg', 'png', 'webp')
+
+#: Resolution in dots per inch of pyplot figures rendered as raster images.
+RASTER_DPI = 150
+
+SVG_TAG_PATTERN = re.compile(r'<svg\b[^>]*>')
+SVG_ATTRIBUTE_PATTERN = re.compile(r'([\w:.-]+)\s*=\s*"([^"]*)"')
+STYLE_TAG_PATTERN = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.DOTALL)
+
+
+def _prepare_figure(figure, aspect_ratio: typing.Union[list, tuple] = None):
+    """
+    Returns the figure to render, which is the currently active figure if
+    no figure is specified, sized to the specified aspect ratio.
+    """
+    from matplotlib import pyplot as mpl_pyplot
+
+    if not figure:
+        figure = mpl_pyplot.gcf()
+
+    if aspect_ratio:
+        figure.set_size_inches(
+            aspect_ratio[0],
+            aspect_ratio[1]
+        )
+    else:
+        figure.set_size_inches(12, 8)
+
+    return figure
+
+
+def _render_figure(figure, image_format: str, clear: bool) -> bytes:
+    """
+    Renders the figure into image data of the specified format. SVG data is
+    rendered with a fixed hash salt for element ids and without a creation
+    date so that identical figures produce identical data.
+    """
+    import matplotlib
+
+    buffer = io.BytesIO()
+    if image_format == 'svg':
+        with matplotlib.rc_context({'svg.hashsalt': 'cauldron'}):
+            figure.savefig(
+                buffer,
+                format='svg',
+                dpi=300,
+                metadata={'Date': None}
+            )
+    else:
+        figure.savefig(buffer, format=image_format, dpi=RASTER_DPI)
+
+    if clear:
+        figure.clear()
+
+    return buffer.getvalue()
+
+
+def _process_svg(svg_data: str, uid: str, scale: float) -> str:
+    """
+    Scopes the styles of the SVG data rendered by matplotlib to the plot
+    and updates the root svg tag to fill the display within the maximum
+    height of the display scale. The data is processed with regular
+    expressions that only touch the style and root svg tags instead of
+    parsing and re-serializing the entire document, which can be many
+    megabytes in size for plots with many points.
+    """
+    scope_class = 'cd-pylab-svg-{}'.format(uid)
+
+    svg_match = SVG_TAG_PATTERN.search(svg_data)
+    if not svg_match:
+        return svg_data
+
+    attributes = dict(SVG_ATTRIBUTE_PATTERN.findall(svg_match.group(0)))
+    attributes['width'] = '100%'
+    attributes['height'] = '100%'
+
+    classes = attributes.get('class', '').strip().split(' ')
+    classes.append(scope_class)
+    attributes['class'] = ' '.join(classes).strip()
+
+    styles = [
+        s for s in attributes.get('style', '').split(';')
+        if len(s.strip()) > 1
+    ]
+    styles.append('max-height:{}vh;'.format(int(100.0 * scale)))
+    attributes['style'] = ';'.join(styles).strip()
+
+    svg_tag = '<svg {}>'.format(' '.join(
+        '{}="{}"'.format(key, value)
+        for key, value in attributes.items()
+    ))
+
+    # Pyplot uses a * style tag, which is completely inappropriate
+    # and needs to be refined to prevent styles spilling out into
+    # other areas of the notebook.
+    body = STYLE_TAG_PATTERN.sub(
+        lambda match: '{}{}{}'.format(
+            match.group(1),
+            match.group(2).replace('*{', '.{} *{{'.format(scope_class)),
+            match.group(3)
+        ),
+        svg_data[svg_match.end():]
+    )
+
+    return '{}{}'.format(svg_tag, body)
+
+
 def pyplot(
         figure=None,
         scale: float = 0.8,
@@ -39,74 +149,88 @@ def pyplot(
     environ.abort_thread()
 
     try:
-        import bs4
-    except ImportError:
-        return templating.render_template(
-            template_name='import-error.html',
-            library_name='beautifulsoup4',
-            additional_info="""
-                The beatifulsoup4 library is needed to manage the
-                display of matplotlib graphics within the notebook
-                display.
-                """
-        )
-
-    try:
-        from matplotlib import pyplot as mpl_pyplot
+        figure = _prepare_figure(figure, aspect_ratio)
     except ImportError:
         return templating.render_template(
             template_name='import-error.html',
             library_name='matplotlib'
         )
 
-    if not figure:
-        figure = mpl_pyplot.gcf()
-
-    if aspect_ratio:
-        figure.set_size_inches(
-            aspect_ratio[0],
-            aspect_ratio[1]
-        )
-    else:
-        figure.set_size_inches(12, 8)
+    svg_data = _render_figure(figure, 'svg', clear)
+    uid = hashlib.sha1(svg_data).hexdigest()[:16]
 
-    buffer = io.StringIO()
-    figure.savefig(buffer, format='svg', dpi=300)
-    buffer.seek(0)
-    svg_data = buffer.read()
+    return '<div class="cd-pylab-plot">{}</div>'.format(
+        _process_svg(svg_data.decode(), uid, scale)
+    )
 
-    if clear:
-        figure.clear()
 
-    soup = bs4.BeautifulSoup(svg_data, 'html.parser')
-    uid = templating.make_template_uid()
+def pyplot_image(
+        figure=None,
+        directory: str = 'plots',
+        image_format: str = 'png',
+        scale: float = 0.8,
+        clear: bool = True,
+        aspect_ratio: typing.Union[list, tuple] = None
+) -> dict:
+    """
+    Renders a matplotlib figure into an image file that is referenced by
+    the display instead of being embedded within it, which keeps the
+    display small for figures with many elements. The image file is named
+    by the content hash of the image so that unchanged figures are not
+    rewritten or reloaded when steps are re-run.
 
-    # Pyplot uses a * style tag, which is completely inappropriate
-    # and needs to be refined to prevent styles spilling out into
-    # other areas of the notebook.
-    for style_tag in soup.find_all('style'):
-        style_tag.string = style_tag.string.replace(
-            '*{',
-            '.cd-pylab-svg-{} *{{'.format(uid)
-        )
+    :param figure:
+        The matplotlib figure to plot. If omitted, the currently active
+        figure will be used.
+    :param directory:
+        The directory relative to the project results folder in which the
+        image file will be written.
+    :param image_format:
+        The format of the image file, which is one of "png", "webp" or
+        "svg".
+    :param scale:
+        The display scale with units of fractional screen height.
+    :param clear:
+        Clears the figure after it has been rendered.
+    :param aspect_ratio:
+        The aspect ratio for the displayed plot as a two-element list or
+        tuple in units of inches.
+    :return:
+        A dictionary containing the "body" of the display and the image
+        "files" to write keyed by their paths relative to the project
+        results folder.
+    """
+    environ.abort_thread()
 
-    svg_tag = soup.find_all('svg')[0]
-    svg_tag['width'] = '100%'
-    svg_tag['height'] = '100%'
+    if image_format not in PYPLOT_FORMATS:
+        raise ValueError('Unsupported pyplot image format "{}"'.format(
+            image_format
+        ))
 
-    classes = svg_tag.get('class', '').strip().split(' ')
-    classes.append('cd-pylab-svg-{}'.format(uid))
-    svg_tag['class'] = ' '.join(classes).strip()
+    try:
+        figure = _prepare_figure(figure, aspect_ratio)
+    except ImportError:
+        return dict(
+            body=templating.render_template(
+                template_name='import-error.html',
+                library_name='matplotlib'
+            ),
+            files={}
+        )
 
-    styles = [
-        s for s in svg_tag.get('style', '').split(';')
-        if len(s.strip()) > 1
-    ]
-    styles.append('max-height:{}vh;'.format(int(100.0 * scale)))
-    svg_tag['style'] = ';'.join(styles).strip()
+    data = _render_figure(figure, image_format, clear)
+    path = '{}/{}.{}'.format(
+        directory,
+        hashlib.sha1(data).hexdigest()[:16],
+        image_format
+    )
 
-    result = '<div class="cd-pylab-plot">{}</div>'.format(soup.prettify())
-    return result
+    body = templating.render_template(
+        'pyplot-image.html',
+        path=path,
+        max_height=int(100.0 * scale)
+    )
+    return dict(body=body, files={path: data})
 
 
 def bokeh_plot(
@@ -1,3 +1,5 @@
+import functools
+
 from pygments import highlight
 from pygments.lexer import Lexer
 from pygments.formatters import HtmlFormatter
@@ -38,12 +40,11 @@ def as_html(
     environ.abort_thread()
 
     lexer = fetch_lexer(source, language, filename, mime_type)
-    Formatter = CodeBlockHtmlFormatter if is_code_block else HtmlFormatter
 
     dom = highlight(
         code=source,
         lexer=lexer if lexer else DjangoLexer(),
-        formatter=Formatter(linenos=True)
+        formatter=_get_formatter(is_code_block)
     )
 
     if not is_code_block:
@@ -62,6 +63,35 @@ def as_html(
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_formatter(is_code_block: bool) -> HtmlFormatter:
+    """
+    Returns a shared formatter instance for the given kind of output.
+    Formatters hold no state between highlighting calls, so they are
+    reused to avoid recomputing their style information for every call.
+    """
+    Formatter = CodeBlockHtmlFormatter if is_code_block else HtmlFormatter
+    return Formatter(linenos=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_lexer_by_name(language: str) -> Lexer:
+    """Returns a shared lexer instance for the given language name."""
+    return get_lexer_by_name(language, stripall=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_lexer_for_filename(filename: str) -> Lexer:
+    """Returns a shared lexer instance for the given file name."""
+    return get_lexer_for_filename(filename, stripall=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_lexer_for_mimetype(mime_type: str) -> Lexer:
+    """Returns a shared lexer instance for the given mime type."""
+    return get_lexer_for_mimetype(mime_type, stripall=True)
+
+
 def fetch_lexer(
         source: str,
         language: str = None,
@@ -81,13 +111,13 @@ def fetch_lexer(
 
     try:
         if language:
-            return get_lexer_by_name(language, stripall=True)
+            return _get_lexer_by_name(language)
     except ClassNotFound:
         pass
 
     if filename:
         try:
-            return get_lexer_for_filename(filename, stripall=True)
+            return _get_lexer_for_filename(filename)
         except ClassNotFound:
             pass
 
@@ -98,7 +128,7 @@ def fetch_lexer(
 
     try:
         if mime_type:
-            return get_lexer_for_mimetype(mime_type, stripall=True)
+            return _get_lexer_for_mimetype(mime_type)
     except ClassNotFound:
         pass
 
@@ -0,0 +1,63 @@
+import json
+import typing
+
+import numpy as np
+import pandas as pd
+
+from cauldron.render import encoding
+
+
+def format_column(
+        series: pd.Series,
+        format_function: typing.Callable[[typing.Any], str]
+) -> pd.Series:
+    """
+    Formats the values of the series with the format function, which is
+    only called once for each unique value in the series instead of once for
+    every value. Series with unhashable values are formatted value by value.
+
+    :param series:
+        The series containing the values to format.
+    :param format_function:
+        Function that converts a single value into its formatted string.
+    :return:
+        A series of the formatted values with the same index as the source.
+    """
+    try:
+        codes, uniques = pd.factorize(series)
+    except TypeError:
+        return series.map(format_function)
+
+    # Native Python values are much faster to format than NumPy scalars.
+    formatted = np.array(
+        list(map(format_function, uniques.tolist())) + [None],
+        dtype=object
+    )
+    values = formatted[codes]
+
+    # Missing values are not included in the uniques, but are formatted
+    # individually so that they display as they would have otherwise.
+    for index in np.flatnonzero(codes < 0):
+        values[index] = format_function(series.iat[index])
+
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def dumps_columns(data_frame: pd.DataFrame) -> str:
+    """
+    Serializes the data frame into a JSON string containing a list of the
+    values in each column. Each column is converted into JSON serializable
+    values as a whole so that the JSON encoder only needs to fall back to
+    encoding individual values for columns of mixed Python objects.
+
+    :param data_frame:
+        The data frame to serialize.
+    """
+    columns = [
+        json.dumps(
+            encoding.series_to_list(data_frame.iloc[:, index]),
+            cls=encoding.ComplexJsonEncoder
+        )
+        for index in range(len(data_frame.columns))
+    ]
+    return '[{}]'.format(', '.join(columns))
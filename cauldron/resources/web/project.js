@@ -129,4 +129,4 @@ e(l).on("context_hide.vakata.jstree",e.proxy((function(t,n){this._data.contextme
  *
  * Copyright © 2014 David Bushell | BSD & MIT license | https://github.com/dbushell/Pikaday
  */
-!function(t,r){"use strict";var i;try{i=n(0)}catch(e){}e.exports=function(e){var t="function"==typeof e,n=!!window.addEventListener,r=window.document,i=window.setTimeout,o=function(e,t,r,i){n?e.addEventListener(t,r,!!i):e.attachEvent("on"+t,r)},a=function(e,t,r,i){n?e.removeEventListener(t,r,!!i):e.detachEvent("on"+t,r)},s=function(e,t,n){var i;r.createEvent?((i=r.createEvent("HTMLEvents")).initEvent(t,!0,!1),i=g(i,n),e.dispatchEvent(i)):r.createEventObject&&(i=r.createEventObject(),i=g(i,n),e.fireEvent("on"+t,i))},l=function(e,t){return-1!==(" "+e.className+" ").indexOf(" "+t+" ")},u=function(e){return/Array/.test(Object.prototype.toString.call(e))},c=function(e){return/Date/.test(Object.prototype.toString.call(e))&&!isNaN(e.getTime())},d=function(e){var t=e.getDay();return 0===t||6===t},h=function(e){return e%4==0&&e%100!=0||e%400==0},f=function(e,t){return[31,h(e)?29:28,31,30,31,30,31,31,30,31,30,31][t]},p=function(e){c(e)&&e.setHours(0,0,0,0)},m=function(e,t){return e.getTime()===t.getTime()},g=function(e,t,n){var r,i;for(r in t)(i=void 0!==e[r])&&"object"==typeof t[r]&&null!==t[r]&&void 0===t[r].nodeName?c(t[r])?n&&(e[r]=new Date(t[r].getTime())):u(t[r])?n&&(e[r]=t[r].slice(0)):e[r]=g({},t[r],n):!n&&i||(e[r]=t[r]);return e},y=function(e){return e.month<0&&(e.year-=Math.ceil(Math.abs(e.month)/12),e.month+=12),e.month>11&&(e.year+=Math.floor(Math.abs(e.month)/12),e.month-=12),e},v={field:null,bound:void 0,position:"bottom left",reposition:!0,format:"YYYY-MM-DD",defaultDate:null,setDefaultDate:!1,firstDay:0,formatStrict:!1,minDate:null,maxDate:null,yearRange:10,showWeekNumber:!1,minYear:0,maxYear:9999,minMonth:void 0,maxMonth:void 0,startRange:null,endRange:null,isRTL:!1,yearSuffix:"",showMonthAfterYear:!1,showDaysInNextAndPreviousMonths:!1,numberOfMonths:1,mainCalendar:"left",container:void 0,i18n:{previousMonth:"Previous Month",nextMonth:"Next Month",months:["January","February","March","April","May","June","July","August","September","October","November","December"],weekdays:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],weekdaysShort:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"]},theme:null,onSelect:null,onOpen:null,onClose:null,onDraw:null},_=function(e,t,n){for(t+=e.firstDay;t>=7;)t-=7;return n?e.i18n.weekdaysShort[t]:e.i18n.weekdays[t]},w=function(e){var t=[],n="false";if(e.isEmpty){if(!e.showDaysInNextAndPreviousMonths)return'<td class="is-empty"></td>';t.push("is-outside-current-month")}return e.isDisabled&&t.push("is-disabled"),e.isToday&&t.push("is-today"),e.isSelected&&(t.push("is-selected"),n="true"),e.isInRange&&t.push("is-inrange"),e.isStartRange&&t.push("is-startrange"),e.isEndRange&&t.push("is-endrange"),'<td data-day="'+e.day+'" class="'+t.join(" ")+'" aria-selected="'+n+'"><button class="pika-button pika-day" type="button" data-pika-year="'+e.year+'" data-pika-month="'+e.month+'" data-pika-day="'+e.day+'">'+e.day+"</button></td>"},b=function(e,t){return"<tr>"+(t?e.reverse():e).join("")+"</tr>"},M=function(e,t,n,r,i,o){var a,s,l,c,d,h=e._o,f=n===h.minYear,p=n===h.maxYear,m='<div id="'+o+'" class="pika-title" role="heading" aria-live="assertive">',g=!0,y=!0;for(l=[],a=0;a<12;a++)l.push('<option value="'+(n===i?a-t:12+a-t)+'"'+(a===r?' selected="selected"':"")+(f&&a<h.minMonth||p&&a>h.maxMonth?'disabled="disabled"':"")+">"+h.i18n.months[a]+"</option>");for(c='<div class="pika-label">'+h.i18n.months[r]+'<select class="pika-select pika-select-month" tabindex="-1">'+l.join("")+"</select></div>",u(h.yearRange)?(a=h.yearRange[0],s=h.yearRange[1]+1):(a=n-h.yearRange,s=1+n+h.yearRange),l=[];a<s&&a<=h.maxYear;a++)a>=h.minYear&&l.push('<option value="'+a+'"'+(a===n?' selected="selected"':"")+">"+a+"</option>");return d='<div class="pika-label">'+n+h.yearSuffix+'<select class="pika-select pika-select-year" tabindex="-1">'+l.join("")+"</select></div>",h.showMonthAfterYear?m+=d+c:m+=c+d,f&&(0===r||h.minMonth>=r)&&(g=!1),p&&(11===r||h.maxMonth<=r)&&(y=!1),0===t&&(m+='<button class="pika-prev'+(g?"":" is-disabled")+'" type="button">'+h.i18n.previousMonth+"</button>"),t===e._o.numberOfMonths-1&&(m+='<button class="pika-next'+(y?"":" is-disabled")+'" type="button">'+h.i18n.nextMonth+"</button>"),m+"</div>"},k=function(a){var s=this,u=s.config(a);s._onMouseDown=function(e){if(s._v){var t=(e=e||window.event).target||e.srcElement;if(t)if(l(t,"is-disabled")||(!l(t,"pika-button")||l(t,"is-empty")||l(t.parentNode,"is-disabled")?l(t,"pika-prev")?s.prevMonth():l(t,"pika-next")&&s.nextMonth():(s.setDate(new Date(t.getAttribute("data-pika-year"),t.getAttribute("data-pika-month"),t.getAttribute("data-pika-day"))),u.bound&&i((function(){s.hide(),u.field&&u.field.blur()}),100))),l(t,"pika-select"))s._c=!0;else{if(!e.preventDefault)return e.returnValue=!1,!1;e.preventDefault()}}},s._onChange=function(e){var t=(e=e||window.event).target||e.srcElement;t&&(l(t,"pika-select-month")?s.gotoMonth(t.value):l(t,"pika-select-year")&&s.gotoYear(t.value))},s._onKeyChange=function(e){if(e=e||window.event,s.isVisible())switch(e.keyCode){case 13:case 27:u.field.blur();break;case 37:e.preventDefault(),s.adjustDate("subtract",1);break;case 38:s.adjustDate("subtract",7);break;case 39:s.adjustDate("add",1);break;case 40:s.adjustDate("add",7)}},s._onInputChange=function(n){var r;n.firedBy!==s&&(r=t?(r=e(u.field.value,u.format,u.formatStrict))&&r.isValid()?r.toDate():null:new Date(Date.parse(u.field.value)),c(r)&&s.setDate(r),s._v||s.show())},s._onInputFocus=function(){s.show()},s._onInputClick=function(){s.show()},s._onInputBlur=function(){var e=r.activeElement;do{if(l(e,"pika-single"))return}while(e=e.parentNode);s._c||(s._b=i((function(){s.hide()}),50)),s._c=!1},s._onClick=function(e){var t=(e=e||window.event).target||e.srcElement,r=t;if(t){!n&&l(t,"pika-select")&&(t.onchange||(t.setAttribute("onchange","return;"),o(t,"change",s._onChange)));do{if(l(r,"pika-single")||r===u.trigger)return}while(r=r.parentNode);s._v&&t!==u.trigger&&r!==u.trigger&&s.hide()}},s.el=r.createElement("div"),s.el.className="pika-single"+(u.isRTL?" is-rtl":"")+(u.theme?" "+u.theme:""),o(s.el,"mousedown",s._onMouseDown,!0),o(s.el,"touchend",s._onMouseDown,!0),o(s.el,"change",s._onChange),o(r,"keydown",s._onKeyChange),u.field&&(u.container?u.container.appendChild(s.el):u.bound?r.body.appendChild(s.el):u.field.parentNode.insertBefore(s.el,u.field.nextSibling),o(u.field,"change",s._onInputChange),u.defaultDate||(t&&u.field.value?u.defaultDate=e(u.field.value,u.format).toDate():u.defaultDate=new Date(Date.parse(u.field.value)),u.setDefaultDate=!0));var d=u.defaultDate;c(d)?u.setDefaultDate?s.setDate(d,!0):s.gotoDate(d):s.gotoDate(new Date),u.bound?(this.hide(),s.el.className+=" is-bound",o(u.trigger,"click",s._onInputClick),o(u.trigger,"focus",s._onInputFocus),o(u.trigger,"blur",s._onInputBlur)):this.show()};return k.prototype={config:function(e){this._o||(this._o=g({},v,!0));var t=g(this._o,e,!0);t.isRTL=!!t.isRTL,t.field=t.field&&t.field.nodeName?t.field:null,t.theme="string"==typeof t.theme&&t.theme?t.theme:null,t.bound=!!(void 0!==t.bound?t.field&&t.bound:t.field),t.trigger=t.trigger&&t.trigger.nodeName?t.trigger:t.field,t.disableWeekends=!!t.disableWeekends,t.disableDayFn="function"==typeof t.disableDayFn?t.disableDayFn:null;var n=parseInt(t.numberOfMonths,10)||1;if(t.numberOfMonths=n>4?4:n,c(t.minDate)||(t.minDate=!1),c(t.maxDate)||(t.maxDate=!1),t.minDate&&t.maxDate&&t.maxDate<t.minDate&&(t.maxDate=t.minDate=!1),t.minDate&&this.setMinDate(t.minDate),t.maxDate&&this.setMaxDate(t.maxDate),u(t.yearRange)){var r=(new Date).getFullYear()-10;t.yearRange[0]=parseInt(t.yearRange[0],10)||r,t.yearRange[1]=parseInt(t.yearRange[1],10)||r}else t.yearRange=Math.abs(parseInt(t.yearRange,10))||v.yearRange,t.yearRange>100&&(t.yearRange=100);return t},toString:function(n){return c(this._d)?t?e(this._d).format(n||this._o.format):this._d.toDateString():""},getMoment:function(){return t?e(this._d):null},setMoment:function(n,r){t&&e.isMoment(n)&&this.setDate(n.toDate(),r)},getDate:function(){return c(this._d)?new Date(this._d.getTime()):new Date},setDate:function(e,t){if(!e)return this._d=null,this._o.field&&(this._o.field.value="",s(this._o.field,"change",{firedBy:this})),this.draw();if("string"==typeof e&&(e=new Date(Date.parse(e))),c(e)){var n=this._o.minDate,r=this._o.maxDate;c(n)&&e<n?e=n:c(r)&&e>r&&(e=r),this._d=new Date(e.getTime()),p(this._d),this.gotoDate(this._d),this._o.field&&(this._o.field.value=this.toString(),s(this._o.field,"change",{firedBy:this})),t||"function"!=typeof this._o.onSelect||this._o.onSelect.call(this,this.getDate())}},gotoDate:function(e){var t=!0;if(c(e)){if(this.calendars){var n=new Date(this.calendars[0].year,this.calendars[0].month,1),r=new Date(this.calendars[this.calendars.length-1].year,this.calendars[this.calendars.length-1].month,1),i=e.getTime();r.setMonth(r.getMonth()+1),r.setDate(r.getDate()-1),t=i<n.getTime()||r.getTime()<i}t&&(this.calendars=[{month:e.getMonth(),year:e.getFullYear()}],"right"===this._o.mainCalendar&&(this.calendars[0].month+=1-this._o.numberOfMonths)),this.adjustCalendars()}},adjustDate:function(n,r){var i,o=this.getDate(),a=24*parseInt(r)*60*60*1e3;"add"===n?i=new Date(o.valueOf()+a):"subtract"===n&&(i=new Date(o.valueOf()-a)),t&&("add"===n?i=e(o).add(r,"days").toDate():"subtract"===n&&(i=e(o).subtract(r,"days").toDate())),this.setDate(i)},adjustCalendars:function(){this.calendars[0]=y(this.calendars[0]);for(var e=1;e<this._o.numberOfMonths;e++)this.calendars[e]=y({month:this.calendars[0].month+e,year:this.calendars[0].year});this.draw()},gotoToday:function(){this.gotoDate(new Date)},gotoMonth:function(e){isNaN(e)||(this.calendars[0].month=parseInt(e,10),this.adjustCalendars())},nextMonth:function(){this.calendars[0].month++,this.adjustCalendars()},prevMonth:function(){this.calendars[0].month--,this.adjustCalendars()},gotoYear:function(e){isNaN(e)||(this.calendars[0].year=parseInt(e,10),this.adjustCalendars())},setMinDate:function(e){e instanceof Date?(p(e),this._o.minDate=e,this._o.minYear=e.getFullYear(),this._o.minMonth=e.getMonth()):(this._o.minDate=v.minDate,this._o.minYear=v.minYear,this._o.minMonth=v.minMonth,this._o.startRange=v.startRange),this.draw()},setMaxDate:function(e){e instanceof Date?(p(e),this._o.maxDate=e,this._o.maxYear=e.getFullYear(),this._o.maxMonth=e.getMonth()):(this._o.maxDate=v.maxDate,this._o.maxYear=v.maxYear,this._o.maxMonth=v.maxMonth,this._o.endRange=v.endRange),this.draw()},setStartRange:function(e){this._o.startRange=e},setEndRange:function(e){this._o.endRange=e},draw:function(e){if(this._v||e){var t,n=this._o,r=n.minYear,o=n.maxYear,a=n.minMonth,s=n.maxMonth,l="";this._y<=r&&(this._y=r,!isNaN(a)&&this._m<a&&(this._m=a)),this._y>=o&&(this._y=o,!isNaN(s)&&this._m>s&&(this._m=s)),t="pika-title-"+Math.random().toString(36).replace(/[^a-z]+/g,"").substr(0,2);for(var u=0;u<n.numberOfMonths;u++)l+='<div class="pika-lendar">'+M(this,u,this.calendars[u].year,this.calendars[u].month,this.calendars[0].year,t)+this.render(this.calendars[u].year,this.calendars[u].month,t)+"</div>";this.el.innerHTML=l,n.bound&&"hidden"!==n.field.type&&i((function(){n.trigger.focus()}),1),"function"==typeof this._o.onDraw&&this._o.onDraw(this),n.bound&&n.field.setAttribute("aria-label","Use the arrow keys to pick a date")}},adjustPosition:function(){var e,t,n,i,o,a,s,l,u,c;if(!this._o.container){if(this.el.style.position="absolute",t=e=this._o.trigger,n=this.el.offsetWidth,i=this.el.offsetHeight,o=window.innerWidth||r.documentElement.clientWidth,a=window.innerHeight||r.documentElement.clientHeight,s=window.pageYOffset||r.body.scrollTop||r.documentElement.scrollTop,"function"==typeof e.getBoundingClientRect)l=(c=e.getBoundingClientRect()).left+window.pageXOffset,u=c.bottom+window.pageYOffset;else for(l=t.offsetLeft,u=t.offsetTop+t.offsetHeight;t=t.offsetParent;)l+=t.offsetLeft,u+=t.offsetTop;(this._o.reposition&&l+n>o||this._o.position.indexOf("right")>-1&&l-n+e.offsetWidth>0)&&(l=l-n+e.offsetWidth),(this._o.reposition&&u+i>a+s||this._o.position.indexOf("top")>-1&&u-i-e.offsetHeight>0)&&(u=u-i-e.offsetHeight),this.el.style.left=l+"px",this.el.style.top=u+"px"}},render:function(e,t,n){var r=this._o,i=new Date,o=f(e,t),a=new Date(e,t,1).getDay(),s=[],l=[];p(i),r.firstDay>0&&(a-=r.firstDay)<0&&(a+=7);for(var u,h,g,y,v=0===t?11:t-1,M=11===t?0:t+1,k=0===t?e-1:e,S=11===t?e+1:e,T=f(k,v),C=o+a,x=C;x>7;)x-=7;C+=7-x;for(var E=0,L=0;E<C;E++){var O=new Date(e,t,E-a+1),D=!!c(this._d)&&m(O,this._d),R=m(O,i),A=E<a||E>=o+a,N=E-a+1,Y=t,j=e,H=r.startRange&&m(r.startRange,O),P=r.endRange&&m(r.endRange,O),I=r.startRange&&r.endRange&&r.startRange<O&&O<r.endRange;A&&(E<a?(N=T+N,Y=v,j=k):(N-=o,Y=M,j=S));var F={day:N,month:Y,year:j,isSelected:D,isToday:R,isDisabled:r.minDate&&O<r.minDate||r.maxDate&&O>r.maxDate||r.disableWeekends&&d(O)||r.disableDayFn&&r.disableDayFn(O),isEmpty:A,isStartRange:H,isEndRange:P,isInRange:I,showDaysInNextAndPreviousMonths:r.showDaysInNextAndPreviousMonths};l.push(w(F)),7==++L&&(r.showWeekNumber&&l.unshift((u=E-a,h=t,g=e,y=void 0,void 0,y=new Date(g,0,1),'<td class="pika-week">'+Math.ceil(((new Date(g,h,u)-y)/864e5+y.getDay()+1)/7)+"</td>")),s.push(b(l,r.isRTL)),l=[],L=0)}return function(e,t,n){return'<table cellpadding="0" cellspacing="0" class="pika-table" role="grid" aria-labelledby="'+n+'">'+function(e){var t,n=[];e.showWeekNumber&&n.push("<th></th>");for(t=0;t<7;t++)n.push('<th scope="col"><abbr title="'+_(e,t)+'">'+_(e,t,!0)+"</abbr></th>");return"<thead><tr>"+(e.isRTL?n.reverse():n).join("")+"</tr></thead>"}(e)+(r=t,"<tbody>"+r.join("")+"</tbody>")+"</table>";var r}(r,s,n)},isVisible:function(){return this._v},show:function(){var e,t,n;this.isVisible()||(e=this.el,t="is-hidden",e.className=(n=(" "+e.className+" ").replace(" "+t+" "," ")).trim?n.trim():n.replace(/^\s+|\s+$/g,""),this._v=!0,this.draw(),this._o.bound&&(o(r,"click",this._onClick),this.adjustPosition()),"function"==typeof this._o.onOpen&&this._o.onOpen.call(this))},hide:function(){var e,t,n=this._v;!1!==n&&(this._o.bound&&a(r,"click",this._onClick),this.el.style.position="static",this.el.style.left="auto",this.el.style.top="auto",e=this.el,l(e,t="is-hidden")||(e.className=""===e.className?t:e.className+" "+t),this._v=!1,void 0!==n&&"function"==typeof this._o.onClose&&this._o.onClose.call(this))},destroy:function(){this.hide(),a(this.el,"mousedown",this._onMouseDown,!0),a(this.el,"touchend",this._onMouseDown,!0),a(this.el,"change",this._onChange),this._o.field&&(a(this._o.field,"change",this._onInputChange),this._o.bound&&(a(this._o.trigger,"click",this._onInputClick),a(this._o.trigger,"focus",this._onInputFocus),a(this._o.trigger,"blur",this._onInputBlur))),this.el.parentNode&&this.el.parentNode.removeChild(this.el)}},k}(i)}()},function(e,t,n){},function(e,t,n){"use strict";n.r(t);var r={};n.r(r),n.d(r,"version",(function(){return a})),n.d(r,"bisect",(function(){return h})),n.d(r,"bisectRight",(function(){return c})),n.d(r,"bisectLeft",(function(){return d})),n.d(r,"ascending",(function(){return s})),n.d(r,"bisector",(function(){return l})),n.d(r,"cross",(function(){return m})),n.d(r,"descending",(function(){return g})),n.d(r,"deviation",(function(){return _})),n.d(r,"extent",(function(){return w})),n.d(r,"histogram",(function(){return N})),n.d(r,"thresholdFreedmanDiaconis",(function(){return j})),n.d(r,"thresholdScott",(function(){return H})),n.d(r,"thresholdSturges",(function(){return A})),n.d(r,"max",(function(){return P})),n.d(r,"mean",(function(){return I})),n.d(r,"median",(function(){return F})),n.d(r,"merge",(function(){return B})),n.d(r,"min",(function(){return z})),n.d(r,"pairs",(function(){return f})),n.d(r,"permute",(function(){return W})),n.d(r,"quantile",(function(){return Y})),n.d(r,"range",(function(){return C})),n.d(r,"scan",(function(){return U})),n.d(r,"shuffle",(function(){return V})),n.d(r,"sum",(function(){return q})),n.d(r,"ticks",(function(){return O})),n.d(r,"tickIncrement",(function(){return D})),n.d(r,"tickStep",(function(){return R})),n.d(r,"transpose",(function(){return G})),n.d(r,"variance",(function(){return v})),n.d(r,"zip",(function(){return K})),n.d(r,"axisTop",(function(){return ue})),n.d(r,"axisRight",(function(){return ce})),n.d(r,"axisBottom",(function(){return de})),n.d(r,"axisLeft",(function(){return he})),n.d(r,"brush",(function(){return Ca})),n.d(r,"brushX",(function(){return Sa})),n.d(r,"brushY",(function(){return Ta})),n.d(r,"brushSelection",(function(){return ka})),n.d(r,"chord",(function(){return Ya})),n.d(r,"ribbon",(function(){return Ka})),n.d(r,"nest",(function(){return Qa})),n.d(r,"set",(function(){return ss})),n.d(r,"map",(function(){return Za})),n.d(r,"keys",(function(){return ls})),n.d(r,"values",(function(){return us})),n.d(r,"entries",(function(){return cs})),n.d(r,"color",(function(){return yn})),n.d(r,"rgb",(function(){return bn})),n.d(r,"hsl",(function(){return En})),n.d(r,"lab",(function(){return xr})),n.d(r,"hcl",(function(){return Yr})),n.d(r,"lch",(function(){return Nr})),n.d(r,"gray",(function(){return Cr})),n.d(r,"cubehelix",(function(){return Xr})),n.d(r,"contours",(function(){return ws})),n.d(r,"contourDensity",(function(){return Cs})),n.d(r,"dispatch",(function(){return _e})),n.d(r,"drag",(function(){return Qt})),n.d(r,"dragDisable",(function(){return Vt})),n.d(r,"dragEnable",(function(){return qt})),n.d(r,"dsvFormat",(function(){return js})),n.d(r,"csvParse",(function(){return Ps})),n.d(r,"csvParseRows",(function(){return Is})),n.d(r,"csvFormat",(function(){return Fs})),n.d(r,"csvFormatBody",(function(){return Bs})),n.d(r,"csvFormatRows",(function(){return zs})),n.d(r,"tsvParse",(function(){return Us})),n.d(r,"tsvParseRows",(function(){return Vs})),n.d(r,"tsvFormat",(function(){return qs})),n.d(r,"tsvFormatBody",(function(){return Gs})),n.d(r,"tsvFormatRows",(function(){return Xs})),n.d(r,"autoType",(function(){return Ks})),n.d(r,"easeLinear",(function(){return lo})),n.d(r,"easeQuad",(function(){return ho})),n.d(r,"easeQuadIn",(function(){return uo})),n.d(r,"easeQuadOut",(function(){return co})),n.d(r,"easeQuadInOut",(function(){return ho})),n.d(r,"easeCubic",(function(){return mo})),n.d(r,"easeCubicIn",(function(){return fo})),n.d(r,"easeCubicOut",(function(){return po})),n.d(r,"easeCubicInOut",(function(){return mo})),n.d(r,"easePoly",(function(){return vo})),n.d(r,"easePolyIn",(function(){return go})),n.d(r,"easePolyOut",(function(){return yo})),n.d(r,"easePolyInOut",(function(){return vo})),n.d(r,"easeSin",(function(){return ko})),n.d(r,"easeSinIn",(function(){return bo})),n.d(r,"easeSinOut",(function(){return Mo})),n.d(r,"easeSinInOut",(function(){return ko})),n.d(r,"easeExp",(function(){return Co})),n.d(r,"easeExpIn",(function(){return So})),n.d(r,"easeExpOut",(function(){return To})),n.d(r,"easeExpInOut",(function(){return Co})),n.d(r,"easeCircle",(function(){return Lo})),n.d(r,"easeCircleIn",(function(){return xo})),n.d(r,"easeCircleOut",(function(){return Eo})),n.d(r,"easeCircleInOut",(function(){return Lo})),n.d(r,"easeBounce",(function(){return Bo})),n.d(r,"easeBounceIn",(function(){return Fo})),n.d(r,"easeBounceOut",(function(){return Bo})),n.d(r,"easeBounceInOut",(function(){return zo})),n.d(r,"easeBack",(function(){return Vo})),n.d(r,"easeBackIn",(function(){return Wo})),n.d(r,"easeBackOut",(function(){return Uo})),n.d(r,"easeBackInOut",(function(){return Vo})),n.d(r,"easeElastic",(function(){return Xo})),n.d(r,"easeElasticIn",(function(){return Go})),n.d(r,"easeElasticOut",(function(){return Xo})),n.d(r,"easeElasticInOut",(function(){return Ko})),n.d(r,"blob",(function(){return $s})),n.d(r,"buffer",(function(){return Qs})),n.d(r,"dsv",(function(){return rl})),n.d(r,"csv",(function(){return il})),n.d(r,"tsv",(function(){return ol})),n.d(r,"image",(function(){return al})),n.d(r,"json",(function(){return ll})),n.d(r,"text",(function(){return tl})),n.d(r,"xml",(function(){return cl})),n.d(r,"html",(function(){return dl})),n.d(r,"svg",(function(){return hl})),n.d(r,"forceCenter",(function(){return fl})),n.d(r,"forceCollide",(function(){return Cl})),n.d(r,"forceLink",(function(){return Ll})),n.d(r,"forceManyBody",(function(){return Yl})),n.d(r,"forceRadial",(function(){return jl})),n.d(r,"forceSimulation",(function(){return Nl})),n.d(r,"forceX",(function(){return Hl})),n.d(r,"forceY",(function(){return Pl})),n.d(r,"formatDefaultLocale",(function(){return tu})),n.d(r,"format",(function(){return ql})),n.d(r,"formatPrefix",(function(){return Gl})),n.d(r,"formatLocale",(function(){return eu})),n.d(r,"formatSpecifier",(function(){return zl})),n.d(r,"FormatSpecifier",(function(){return Wl})),n.d(r,"precisionFixed",(function(){return nu})),n.d(r,"precisionPrefix",(function(){return ru})),n.d(r,"precisionRound",(function(){return iu})),n.d(r,"geoArea",(function(){return $u})),n.d(r,"geoBounds",(function(){return Wc})),n.d(r,"geoCentroid",(function(){return td})),n.d(r,"geoCircle",(function(){return hd})),n.d(r,"geoClipAntimeridian",(function(){return Sd})),n.d(r,"geoClipCircle",(function(){return Td})),n.d(r,"geoClipExtent",(function(){return Ad})),n.d(r,"geoClipRectangle",(function(){return Ld})),n.d(r,"geoContains",(function(){return $d})),n.d(r,"geoDistance",(function(){return zd})),n.d(r,"geoGraticule",(function(){return eh})),n.d(r,"geoGraticule10",(function(){return th})),n.d(r,"geoInterpolate",(function(){return ah})),n.d(r,"geoLength",(function(){return Id})),n.d(r,"geoPath",(function(){return of})),n.d(r,"geoAlbers",(function(){return Tf})),n.d(r,"geoAlbersUsa",(function(){return Cf})),n.d(r,"geoAzimuthalEqualArea",(function(){return Of})),n.d(r,"geoAzimuthalEqualAreaRaw",(function(){return Lf})),n.d(r,"geoAzimuthalEquidistant",(function(){return Rf})),n.d(r,"geoAzimuthalEquidistantRaw",(function(){return Df})),n.d(r,"geoConicConformal",(function(){return Pf})),n.d(r,"geoConicConformalRaw",(function(){return Hf})),n.d(r,"geoConicEqualArea",(function(){return Sf})),n.d(r,"geoConicEqualAreaRaw",(function(){return kf})),n.d(r,"geoConicEquidistant",(function(){return zf})),n.d(r,"geoConicEquidistantRaw",(function(){return Bf})),n.d(r,"geoEqualEarth",(function(){return Kf})),n.d(r,"geoEqualEarthRaw",(function(){return Xf})),n.d(r,"geoEquirectangular",(function(){return Ff})),n.d(r,"geoEquirectangularRaw",(function(){return If})),n.d(r,"geoGnomonic",(function(){return $f})),n.d(r,"geoGnomonicRaw",(function(){return Jf})),n.d(r,"geoIdentity",(function(){return Qf})),n.d(r,"geoProjection",(function(){return wf})),n.d(r,"geoProjectionMutator",(function(){return bf})),n.d(r,"geoMercator",(function(){return Nf})),n.d(r,"geoMercatorRaw",(function(){return Af})),n.d(r,"geoNaturalEarth1",(function(){return tp})),n.d(r,"geoNaturalEarth1Raw",(function(){return ep})),n.d(r,"geoOrthographic",(function(){return rp})),n.d(r,"geoOrthographicRaw",(function(){return np})),n.d(r,"geoStereographic",(function(){return op})),n.d(r,"geoStereographicRaw",(function(){return ip})),n.d(r,"geoTransverseMercator",(function(){return sp})),n.d(r,"geoTransverseMercatorRaw",(function(){return ap})),n.d(r,"geoRotation",(function(){return ud})),n.d(r,"geoStream",(function(){return Wu})),n.d(r,"geoTransform",(function(){return af})),n.d(r,"cluster",(function(){return dp})),n.d(r,"hierarchy",(function(){return fp})),n.d(r,"pack",(function(){return Pp})),n.d(r,"packSiblings",(function(){return Rp})),n.d(r,"packEnclose",(function(){return _p})),n.d(r,"partition",(function(){return Up})),n.d(r,"stratify",(function(){return Jp})),n.d(r,"tree",(function(){return rm})),n.d(r,"treemap",(function(){return lm})),n.d(r,"treemapBinary",(function(){return um})),n.d(r,"treemapDice",(function(){return Wp})),n.d(r,"treemapSlice",(function(){return im})),n.d(r,"treemapSliceDice",(function(){return cm})),n.d(r,"treemapSquarify",(function(){return sm})),n.d(r,"treemapResquarify",(function(){return dm})),n.d(r,"interpolate",(function(){return er})),n.d(r,"interpolateArray",(function(){return Wn})),n.d(r,"interpolateBasis",(function(){return Rn})),n.d(r,"interpolateBasisClosed",(function(){return An})),n.d(r,"interpolateDate",(function(){return Un})),n.d(r,"interpolateDiscrete",(function(){return tr})),n.d(r,"interpolateHue",(function(){return nr})),n.d(r,"interpolateNumber",(function(){return Vn})),n.d(r,"interpolateObject",(function(){return qn})),n.d(r,"interpolateRound",(function(){return rr})),n.d(r,"interpolateString",(function(){return Qn})),n.d(r,"interpolateTransformCss",(function(){return lr})),n.d(r,"interpolateTransformSvg",(function(){return ur})),n.d(r,"interpolateZoom",(function(){return hr})),n.d(r,"interpolateRgb",(function(){return In})),n.d(r,"interpolateRgbBasis",(function(){return Bn})),n.d(r,"interpolateRgbBasisClosed",(function(){return zn})),n.d(r,"interpolateHsl",(function(){return pr})),n.d(r,"interpolateHslLong",(function(){return mr})),n.d(r,"interpolateLab",(function(){return Pr})),n.d(r,"interpolateHcl",(function(){return Fr})),n.d(r,"interpolateHclLong",(function(){return Br})),n.d(r,"interpolateCubehelix",(function(){return $r})),n.d(r,"interpolateCubehelixLong",(function(){return Zr})),n.d(r,"piecewise",(function(){return Qr})),n.d(r,"quantize",(function(){return ni})),n.d(r,"path",(function(){return Wa})),n.d(r,"polygonArea",(function(){return hm})),n.d(r,"polygonCentroid",(function(){return fm})),n.d(r,"polygonHull",(function(){return ym})),n.d(r,"polygonContains",(function(){return vm})),n.d(r,"polygonLength",(function(){return _m})),n.d(r,"quadtree",(function(){return wl})),n.d(r,"randomUniform",(function(){return bm})),n.d(r,"randomNormal",(function(){return Mm})),n.d(r,"randomLogNormal",(function(){return km})),n.d(r,"randomBates",(function(){return Tm})),n.d(r,"randomIrwinHall",(function(){return Sm})),n.d(r,"randomExponential",(function(){return Cm})),n.d(r,"scaleBand",(function(){return Nm})),n.d(r,"scalePoint",(function(){return Ym})),n.d(r,"scaleIdentity",(function(){return Jm})),n.d(r,"scaleLinear",(function(){return Km})),n.d(r,"scaleLog",(function(){return og})),n.d(r,"scaleSymlog",(function(){return ug})),n.d(r,"scaleOrdinal",(function(){return Am})),n.d(r,"scaleImplicit",(function(){return Rm})),n.d(r,"scalePow",(function(){return pg})),n.d(r,"scaleSqrt",(function(){return mg})),n.d(r,"scaleQuantile",(function(){return gg})),n.d(r,"scaleQuantize",(function(){return yg})),n.d(r,"scaleThreshold",(function(){return vg})),n.d(r,"scaleTime",(function(){return o_})),n.d(r,"scaleUtc",(function(){return m_})),n.d(r,"scaleSequential",(function(){return v_})),n.d(r,"scaleSequentialLog",(function(){return __})),n.d(r,"scaleSequentialPow",(function(){return b_})),n.d(r,"scaleSequentialSqrt",(function(){return M_})),n.d(r,"scaleSequentialSymlog",(function(){return w_})),n.d(r,"scaleSequentialQuantile",(function(){return k_})),n.d(r,"scaleDiverging",(function(){return T_})),n.d(r,"scaleDivergingLog",(function(){return C_})),n.d(r,"scaleDivergingPow",(function(){return E_})),n.d(r,"scaleDivergingSqrt",(function(){return L_})),n.d(r,"scaleDivergingSymlog",(function(){return x_})),n.d(r,"tickFormat",(function(){return Gm})),n.d(r,"schemeCategory10",(function(){return D_})),n.d(r,"schemeAccent",(function(){return R_})),n.d(r,"schemeDark2",(function(){return A_})),n.d(r,"schemePaired",(function(){return N_})),n.d(r,"schemePastel1",(function(){return Y_})),n.d(r,"schemePastel2",(function(){return j_})),n.d(r,"schemeSet1",(function(){return H_})),n.d(r,"schemeSet2",(function(){return P_})),n.d(r,"schemeSet3",(function(){return I_})),n.d(r,"schemeTableau10",(function(){return F_})),n.d(r,"interpolateBrBG",(function(){return W_})),n.d(r,"schemeBrBG",(function(){return z_})),n.d(r,"interpolatePRGn",(function(){return V_})),n.d(r,"schemePRGn",(function(){return U_})),n.d(r,"interpolatePiYG",(function(){return G_})),n.d(r,"schemePiYG",(function(){return q_})),n.d(r,"interpolatePuOr",(function(){return K_})),n.d(r,"schemePuOr",(function(){return X_})),n.d(r,"interpolateRdBu",(function(){return $_})),n.d(r,"schemeRdBu",(function(){return J_})),n.d(r,"interpolateRdGy",(function(){return Q_})),n.d(r,"schemeRdGy",(function(){return Z_})),n.d(r,"interpolateRdYlBu",(function(){return tw})),n.d(r,"schemeRdYlBu",(function(){return ew})),n.d(r,"interpolateRdYlGn",(function(){return rw})),n.d(r,"schemeRdYlGn",(function(){return nw})),n.d(r,"interpolateSpectral",(function(){return ow})),n.d(r,"schemeSpectral",(function(){return iw})),n.d(r,"interpolateBuGn",(function(){return sw})),n.d(r,"schemeBuGn",(function(){return aw})),n.d(r,"interpolateBuPu",(function(){return uw})),n.d(r,"schemeBuPu",(function(){return lw})),n.d(r,"interpolateGnBu",(function(){return dw})),n.d(r,"schemeGnBu",(function(){return cw})),n.d(r,"interpolateOrRd",(function(){return fw})),n.d(r,"schemeOrRd",(function(){return hw})),n.d(r,"interpolatePuBuGn",(function(){return mw})),n.d(r,"schemePuBuGn",(function(){return pw})),n.d(r,"interpolatePuBu",(function(){return yw})),n.d(r,"schemePuBu",(function(){return gw})),n.d(r,"interpolatePuRd",(function(){return _w})),n.d(r,"schemePuRd",(function(){return vw})),n.d(r,"interpolateRdPu",(function(){return bw})),n.d(r,"schemeRdPu",(function(){return ww})),n.d(r,"interpolateYlGnBu",(function(){return kw})),n.d(r,"schemeYlGnBu",(function(){return Mw})),n.d(r,"interpolateYlGn",(function(){return Tw})),n.d(r,"schemeYlGn",(function(){return Sw})),n.d(r,"interpolateYlOrBr",(function(){return xw})),n.d(r,"schemeYlOrBr",(function(){return Cw})),n.d(r,"interpolateYlOrRd",(function(){return Lw})),n.d(r,"schemeYlOrRd",(function(){return Ew})),n.d(r,"interpolateBlues",(function(){return Dw})),n.d(r,"schemeBlues",(function(){return Ow})),n.d(r,"interpolateGreens",(function(){return Aw})),n.d(r,"schemeGreens",(function(){return Rw})),n.d(r,"interpolateGreys",(function(){return Yw})),n.d(r,"schemeGreys",(function(){return Nw})),n.d(r,"interpolatePurples",(function(){return Hw})),n.d(r,"schemePurples",(function(){return jw})),n.d(r,"interpolateReds",(function(){return Iw})),n.d(r,"schemeReds",(function(){return Pw})),n.d(r,"interpolateOranges",(function(){return Bw})),n.d(r,"schemeOranges",(function(){return Fw})),n.d(r,"interpolateCividis",(function(){return zw})),n.d(r,"interpolateCubehelixDefault",(function(){return Ww})),n.d(r,"interpolateRainbow",(function(){return Gw})),n.d(r,"interpolateWarm",(function(){return Uw})),n.d(r,"interpolateCool",(function(){return Vw})),n.d(r,"interpolateSinebow",(function(){return $w})),n.d(r,"interpolateTurbo",(function(){return Zw})),n.d(r,"interpolateViridis",(function(){return eb})),n.d(r,"interpolateMagma",(function(){return tb})),n.d(r,"interpolateInferno",(function(){return nb})),n.d(r,"interpolatePlasma",(function(){return rb})),n.d(r,"create",(function(){return At})),n.d(r,"creator",(function(){return Te})),n.d(r,"local",(function(){return Yt})),n.d(r,"matcher",(function(){return Oe})),n.d(r,"mouse",(function(){return It})),n.d(r,"namespace",(function(){return Me})),n.d(r,"namespaces",(function(){return be})),n.d(r,"clientPoint",(function(){return Pt})),n.d(r,"select",(function(){return Rt})),n.d(r,"selectAll",(function(){return Ft})),n.d(r,"selection",(function(){return Dt})),n.d(r,"selector",(function(){return xe})),n.d(r,"selectorAll",(function(){return Le})),n.d(r,"style",(function(){return Ge})),n.d(r,"touch",(function(){return Bt})),n.d(r,"touches",(function(){return zt})),n.d(r,"window",(function(){return We})),n.d(r,"event",(function(){return vt})),n.d(r,"customEvent",(function(){return St})),n.d(r,"arc",(function(){return kb})),n.d(r,"area",(function(){return Lb})),n.d(r,"line",(function(){return Eb})),n.d(r,"pie",(function(){return Rb})),n.d(r,"areaRadial",(function(){return Pb})),n.d(r,"radialArea",(function(){return Pb})),n.d(r,"lineRadial",(function(){return Hb})),n.d(r,"radialLine",(function(){return Hb})),n.d(r,"pointRadial",(function(){return Ib})),n.d(r,"linkHorizontal",(function(){return Gb})),n.d(r,"linkVertical",(function(){return Xb})),n.d(r,"linkRadial",(function(){return Kb})),n.d(r,"symbol",(function(){return fM})),n.d(r,"symbols",(function(){return hM})),n.d(r,"symbolCircle",(function(){return Jb})),n.d(r,"symbolCross",(function(){return $b})),n.d(r,"symbolDiamond",(function(){return eM})),n.d(r,"symbolSquare",(function(){return oM})),n.d(r,"symbolStar",(function(){return iM})),n.d(r,"symbolTriangle",(function(){return sM})),n.d(r,"symbolWye",(function(){return dM})),n.d(r,"curveBasisClosed",(function(){return _M})),n.d(r,"curveBasisOpen",(function(){return bM})),n.d(r,"curveBasis",(function(){return yM})),n.d(r,"curveBundle",(function(){return kM})),n.d(r,"curveCardinalClosed",(function(){return EM})),n.d(r,"curveCardinalOpen",(function(){return OM})),n.d(r,"curveCardinal",(function(){return CM})),n.d(r,"curveCatmullRomClosed",(function(){return YM})),n.d(r,"curveCatmullRomOpen",(function(){return HM})),n.d(r,"curveCatmullRom",(function(){return AM})),n.d(r,"curveLinearClosed",(function(){return IM})),n.d(r,"curveLinear",(function(){return Tb})),n.d(r,"curveMonotoneX",(function(){return GM})),n.d(r,"curveMonotoneY",(function(){return XM})),n.d(r,"curveNatural",(function(){return $M})),n.d(r,"curveStep",(function(){return QM})),n.d(r,"curveStepAfter",(function(){return tk})),n.d(r,"curveStepBefore",(function(){return ek})),n.d(r,"stack",(function(){return ok})),n.d(r,"stackOffsetExpand",(function(){return ak})),n.d(r,"stackOffsetDiverging",(function(){return sk})),n.d(r,"stackOffsetNone",(function(){return nk})),n.d(r,"stackOffsetSilhouette",(function(){return lk})),n.d(r,"stackOffsetWiggle",(function(){return uk})),n.d(r,"stackOrderAppearance",(function(){return ck})),n.d(r,"stackOrderAscending",(function(){return hk})),n.d(r,"stackOrderDescending",(function(){return pk})),n.d(r,"stackOrderInsideOut",(function(){return mk})),n.d(r,"stackOrderNone",(function(){return rk})),n.d(r,"stackOrderReverse",(function(){return gk})),n.d(r,"timeInterval",(function(){return bg})),n.d(r,"timeMillisecond",(function(){return iy})),n.d(r,"timeMilliseconds",(function(){return oy})),n.d(r,"utcMillisecond",(function(){return iy})),n.d(r,"utcMilliseconds",(function(){return oy})),n.d(r,"timeSecond",(function(){return ty})),n.d(r,"timeSeconds",(function(){return ny})),n.d(r,"utcSecond",(function(){return ty})),n.d(r,"utcSeconds",(function(){return ny})),n.d(r,"timeMinute",(function(){return Zg})),n.d(r,"timeMinutes",(function(){return Qg})),n.d(r,"timeHour",(function(){return Kg})),n.d(r,"timeHours",(function(){return Jg})),n.d(r,"timeDay",(function(){return qg})),n.d(r,"timeDays",(function(){return Gg})),n.d(r,"timeWeek",(function(){return Dg})),n.d(r,"timeWeeks",(function(){return Pg})),n.d(r,"timeSunday",(function(){return Dg})),n.d(r,"timeSundays",(function(){return Pg})),n.d(r,"timeMonday",(function(){return Rg})),n.d(r,"timeMondays",(function(){return Ig})),n.d(r,"timeTuesday",(function(){return Ag})),n.d(r,"timeTuesdays",(function(){return Fg})),n.d(r,"timeWednesday",(function(){return Ng})),n.d(r,"timeWednesdays",(function(){return Bg})),n.d(r,"timeThursday",(function(){return Yg})),n.d(r,"timeThursdays",(function(){return zg})),n.d(r,"timeFriday",(function(){return jg})),n.d(r,"timeFridays",(function(){return Wg})),n.d(r,"timeSaturday",(function(){return Hg})),n.d(r,"timeSaturdays",(function(){return Ug})),n.d(r,"timeMonth",(function(){return Cg})),n.d(r,"timeMonths",(function(){return xg})),n.d(r,"timeYear",(function(){return kg})),n.d(r,"timeYears",(function(){return Sg})),n.d(r,"utcMinute",(function(){return f_})),n.d(r,"utcMinutes",(function(){return p_})),n.d(r,"utcHour",(function(){return c_})),n.d(r,"utcHours",(function(){return d_})),n.d(r,"utcDay",(function(){return My})),n.d(r,"utcDays",(function(){return ky})),n.d(r,"utcWeek",(function(){return sy})),n.d(r,"utcWeeks",(function(){return py})),n.d(r,"utcSunday",(function(){return sy})),n.d(r,"utcSundays",(function(){return py})),n.d(r,"utcMonday",(function(){return ly})),n.d(r,"utcMondays",(function(){return my})),n.d(r,"utcTuesday",(function(){return uy})),n.d(r,"utcTuesdays",(function(){return gy})),n.d(r,"utcWednesday",(function(){return cy})),n.d(r,"utcWednesdays",(function(){return yy})),n.d(r,"utcThursday",(function(){return dy})),n.d(r,"utcThursdays",(function(){return vy})),n.d(r,"utcFriday",(function(){return hy})),n.d(r,"utcFridays",(function(){return _y})),n.d(r,"utcSaturday",(function(){return fy})),n.d(r,"utcSaturdays",(function(){return wy})),n.d(r,"utcMonth",(function(){return s_})),n.d(r,"utcMonths",(function(){return l_})),n.d(r,"utcYear",(function(){return Ty})),n.d(r,"utcYears",(function(){return Cy})),n.d(r,"timeFormatDefaultLocale",(function(){return qv})),n.d(r,"timeFormat",(function(){return Ry})),n.d(r,"timeParse",(function(){return Ay})),n.d(r,"utcFormat",(function(){return Ny})),n.d(r,"utcParse",(function(){return Yy})),n.d(r,"timeFormatLocale",(function(){return Oy})),n.d(r,"isoFormat",(function(){return Gv})),n.d(r,"isoParse",(function(){return Xv})),n.d(r,"now",(function(){return hi})),n.d(r,"timer",(function(){return mi})),n.d(r,"timerFlush",(function(){return gi})),n.d(r,"timeout",(function(){return wi})),n.d(r,"interval",(function(){return bi})),n.d(r,"transition",(function(){return oo})),n.d(r,"active",(function(){return Qo})),n.d(r,"interrupt",(function(){return Yi})),n.d(r,"voronoi",(function(){return tS})),n.d(r,"zoom",(function(){return mS})),n.d(r,"zoomTransform",(function(){return aS})),n.d(r,"zoomIdentity",(function(){return oS}));var i=n(1),o=n.n(i),a="5.12.0",s=function(e,t){return e<t?-1:e>t?1:e>=t?0:NaN},l=function(e){var t;return 1===e.length&&(t=e,e=function(e,n){return s(t(e),n)}),{left:function(t,n,r,i){for(null==r&&(r=0),null==i&&(i=t.length);r<i;){var o=r+i>>>1;e(t[o],n)<0?r=o+1:i=o}return r},right:function(t,n,r,i){for(null==r&&(r=0),null==i&&(i=t.length);r<i;){var o=r+i>>>1;e(t[o],n)>0?i=o:r=o+1}return r}}};var u=l(s),c=u.right,d=u.left,h=c,f=function(e,t){null==t&&(t=p);for(var n=0,r=e.length-1,i=e[0],o=new Array(r<0?0:r);n<r;)o[n]=t(i,i=e[++n]);return o};function p(e,t){return[e,t]}var m=function(e,t,n){var r,i,o,a,s=e.length,l=t.length,u=new Array(s*l);for(null==n&&(n=p),r=o=0;r<s;++r)for(a=e[r],i=0;i<l;++i,++o)u[o]=n(a,t[i]);return u},g=function(e,t){return t<e?-1:t>e?1:t>=e?0:NaN},y=function(e){return null===e?NaN:+e},v=function(e,t){var n,r,i=e.length,o=0,a=-1,s=0,l=0;if(null==t)for(;++a<i;)isNaN(n=y(e[a]))||(l+=(r=n-s)*(n-(s+=r/++o)));else for(;++a<i;)isNaN(n=y(t(e[a],a,e)))||(l+=(r=n-s)*(n-(s+=r/++o)));if(o>1)return l/(o-1)},_=function(e,t){var n=v(e,t);return n?Math.sqrt(n):n},w=function(e,t){var n,r,i,o=e.length,a=-1;if(null==t){for(;++a<o;)if(null!=(n=e[a])&&n>=n)for(r=i=n;++a<o;)null!=(n=e[a])&&(r>n&&(r=n),i<n&&(i=n))}else for(;++a<o;)if(null!=(n=t(e[a],a,e))&&n>=n)for(r=i=n;++a<o;)null!=(n=t(e[a],a,e))&&(r>n&&(r=n),i<n&&(i=n));return[r,i]},b=Array.prototype,M=b.slice,k=b.map,S=function(e){return function(){return e}},T=function(e){return e},C=function(e,t,n){e=+e,t=+t,n=(i=arguments.length)<2?(t=e,e=0,1):i<3?1:+n;for(var r=-1,i=0|Math.max(0,Math.ceil((t-e)/n)),o=new Array(i);++r<i;)o[r]=e+r*n;return o},x=Math.sqrt(50),E=Math.sqrt(10),L=Math.sqrt(2),O=function(e,t,n){var r,i,o,a,s=-1;if(n=+n,(e=+e)===(t=+t)&&n>0)return[e];if((r=t<e)&&(i=e,e=t,t=i),0===(a=D(e,t,n))||!isFinite(a))return[];if(a>0)for(e=Math.ceil(e/a),t=Math.floor(t/a),o=new Array(i=Math.ceil(t-e+1));++s<i;)o[s]=(e+s)*a;else for(e=Math.floor(e*a),t=Math.ceil(t*a),o=new Array(i=Math.ceil(e-t+1));++s<i;)o[s]=(e-s)/a;return r&&o.reverse(),o};function D(e,t,n){var r=(t-e)/Math.max(0,n),i=Math.floor(Math.log(r)/Math.LN10),o=r/Math.pow(10,i);return i>=0?(o>=x?10:o>=E?5:o>=L?2:1)*Math.pow(10,i):-Math.pow(10,-i)/(o>=x?10:o>=E?5:o>=L?2:1)}function R(e,t,n){var r=Math.abs(t-e)/Math.max(0,n),i=Math.pow(10,Math.floor(Math.log(r)/Math.LN10)),o=r/i;return o>=x?i*=10:o>=E?i*=5:o>=L&&(i*=2),t<e?-i:i}var A=function(e){return Math.ceil(Math.log(e.length)/Math.LN2)+1},N=function(){var e=T,t=w,n=A;function r(r){var i,o,a=r.length,s=new Array(a);for(i=0;i<a;++i)s[i]=e(r[i],i,r);var l=t(s),u=l[0],c=l[1],d=n(s,u,c);Array.isArray(d)||(d=R(u,c,d),d=C(Math.ceil(u/d)*d,c,d));for(var f=d.length;d[0]<=u;)d.shift(),--f;for(;d[f-1]>c;)d.pop(),--f;var p,m=new Array(f+1);for(i=0;i<=f;++i)(p=m[i]=[]).x0=i>0?d[i-1]:u,p.x1=i<f?d[i]:c;for(i=0;i<a;++i)u<=(o=s[i])&&o<=c&&m[h(d,o,0,f)].push(r[i]);return m}return r.value=function(t){return arguments.length?(e="function"==typeof t?t:S(t),r):e},r.domain=function(e){return arguments.length?(t="function"==typeof e?e:S([e[0],e[1]]),r):t},r.thresholds=function(e){return arguments.length?(n="function"==typeof e?e:Array.isArray(e)?S(M.call(e)):S(e),r):n},r},Y=function(e,t,n){if(null==n&&(n=y),r=e.length){if((t=+t)<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,i=(r-1)*t,o=Math.floor(i),a=+n(e[o],o,e);return a+(+n(e[o+1],o+1,e)-a)*(i-o)}},j=function(e,t,n){return e=k.call(e,y).sort(s),Math.ceil((n-t)/(2*(Y(e,.75)-Y(e,.25))*Math.pow(e.length,-1/3)))},H=function(e,t,n){return Math.ceil((n-t)/(3.5*_(e)*Math.pow(e.length,-1/3)))},P=function(e,t){var n,r,i=e.length,o=-1;if(null==t){for(;++o<i;)if(null!=(n=e[o])&&n>=n)for(r=n;++o<i;)null!=(n=e[o])&&n>r&&(r=n)}else for(;++o<i;)if(null!=(n=t(e[o],o,e))&&n>=n)for(r=n;++o<i;)null!=(n=t(e[o],o,e))&&n>r&&(r=n);return r},I=function(e,t){var n,r=e.length,i=r,o=-1,a=0;if(null==t)for(;++o<r;)isNaN(n=y(e[o]))?--i:a+=n;else for(;++o<r;)isNaN(n=y(t(e[o],o,e)))?--i:a+=n;if(i)return a/i},F=function(e,t){var n,r=e.length,i=-1,o=[];if(null==t)for(;++i<r;)isNaN(n=y(e[i]))||o.push(n);else for(;++i<r;)isNaN(n=y(t(e[i],i,e)))||o.push(n);return Y(o.sort(s),.5)},B=function(e){for(var t,n,r,i=e.length,o=-1,a=0;++o<i;)a+=e[o].length;for(n=new Array(a);--i>=0;)for(t=(r=e[i]).length;--t>=0;)n[--a]=r[t];return n},z=function(e,t){var n,r,i=e.length,o=-1;if(null==t){for(;++o<i;)if(null!=(n=e[o])&&n>=n)for(r=n;++o<i;)null!=(n=e[o])&&r>n&&(r=n)}else for(;++o<i;)if(null!=(n=t(e[o],o,e))&&n>=n)for(r=n;++o<i;)null!=(n=t(e[o],o,e))&&r>n&&(r=n);return r},W=function(e,t){for(var n=t.length,r=new Array(n);n--;)r[n]=e[t[n]];return r},U=function(e,t){if(n=e.length){var n,r,i=0,o=0,a=e[o];for(null==t&&(t=s);++i<n;)(t(r=e[i],a)<0||0!==t(a,a))&&(a=r,o=i);return 0===t(a,a)?o:void 0}},V=function(e,t,n){for(var r,i,o=(null==n?e.length:n)-(t=null==t?0:+t);o;)i=Math.random()*o--|0,r=e[o+t],e[o+t]=e[i+t],e[i+t]=r;return e},q=function(e,t){var n,r=e.length,i=-1,o=0;if(null==t)for(;++i<r;)(n=+e[i])&&(o+=n);else for(;++i<r;)(n=+t(e[i],i,e))&&(o+=n);return o},G=function(e){if(!(i=e.length))return[];for(var t=-1,n=z(e,X),r=new Array(n);++t<n;)for(var i,o=-1,a=r[t]=new Array(i);++o<i;)a[o]=e[o][t];return r};function X(e){return e.length}var K=function(){return G(arguments)},J=Array.prototype.slice,$=function(e){return e},Z=1,Q=2,ee=3,te=4,ne=1e-6;function re(e){return"translate("+(e+.5)+",0)"}function ie(e){return"translate(0,"+(e+.5)+")"}function oe(e){return function(t){return+e(t)}}function ae(e){var t=Math.max(0,e.bandwidth()-1)/2;return e.round()&&(t=Math.round(t)),function(n){return+e(n)+t}}function se(){return!this.__axis}function le(e,t){var n=[],r=null,i=null,o=6,a=6,s=3,l=e===Z||e===te?-1:1,u=e===te||e===Q?"x":"y",c=e===Z||e===ee?re:ie;function d(d){var h=null==r?t.ticks?t.ticks.apply(t,n):t.domain():r,f=null==i?t.tickFormat?t.tickFormat.apply(t,n):$:i,p=Math.max(o,0)+s,m=t.range(),g=+m[0]+.5,y=+m[m.length-1]+.5,v=(t.bandwidth?ae:oe)(t.copy()),_=d.selection?d.selection():d,w=_.selectAll(".domain").data([null]),b=_.selectAll(".tick").data(h,t).order(),M=b.exit(),k=b.enter().append("g").attr("class","tick"),S=b.select("line"),T=b.select("text");w=w.merge(w.enter().insert("path",".tick").attr("class","domain").attr("stroke","currentColor")),b=b.merge(k),S=S.merge(k.append("line").attr("stroke","currentColor").attr(u+"2",l*o)),T=T.merge(k.append("text").attr("fill","currentColor").attr(u,l*p).attr("dy",e===Z?"0em":e===ee?"0.71em":"0.32em")),d!==_&&(w=w.transition(d),b=b.transition(d),S=S.transition(d),T=T.transition(d),M=M.transition(d).attr("opacity",ne).attr("transform",(function(e){return isFinite(e=v(e))?c(e):this.getAttribute("transform")})),k.attr("opacity",ne).attr("transform",(function(e){var t=this.parentNode.__axis;return c(t&&isFinite(t=t(e))?t:v(e))}))),M.remove(),w.attr("d",e===te||e==Q?a?"M"+l*a+","+g+"H0.5V"+y+"H"+l*a:"M0.5,"+g+"V"+y:a?"M"+g+","+l*a+"V0.5H"+y+"V"+l*a:"M"+g+",0.5H"+y),b.attr("opacity",1).attr("transform",(function(e){return c(v(e))})),S.attr(u+"2",l*o),T.attr(u,l*p).text(f),_.filter(se).attr("fill","none").attr("font-size",10).attr("font-family","sans-serif").attr("text-anchor",e===Q?"start":e===te?"end":"middle"),_.each((function(){this.__axis=v}))}return d.scale=function(e){return arguments.length?(t=e,d):t},d.ticks=function(){return n=J.call(arguments),d},d.tickArguments=function(e){return arguments.length?(n=null==e?[]:J.call(e),d):n.slice()},d.tickValues=function(e){return arguments.length?(r=null==e?null:J.call(e),d):r&&r.slice()},d.tickFormat=function(e){return arguments.length?(i=e,d):i},d.tickSize=function(e){return arguments.length?(o=a=+e,d):o},d.tickSizeInner=function(e){return arguments.length?(o=+e,d):o},d.tickSizeOuter=function(e){return arguments.length?(a=+e,d):a},d.tickPadding=function(e){return arguments.length?(s=+e,d):s},d}function ue(e){return le(Z,e)}function ce(e){return le(Q,e)}function de(e){return le(ee,e)}function he(e){return le(te,e)}var fe={value:function(){}};function pe(){for(var e,t=0,n=arguments.length,r={};t<n;++t){if(!(e=arguments[t]+"")||e in r)throw new Error("illegal type: "+e);r[e]=[]}return new me(r)}function me(e){this._=e}function ge(e,t){return e.trim().split(/^|\s+/).map((function(e){var n="",r=e.indexOf(".");if(r>=0&&(n=e.slice(r+1),e=e.slice(0,r)),e&&!t.hasOwnProperty(e))throw new Error("unknown type: "+e);return{type:e,name:n}}))}function ye(e,t){for(var n,r=0,i=e.length;r<i;++r)if((n=e[r]).name===t)return n.value}function ve(e,t,n){for(var r=0,i=e.length;r<i;++r)if(e[r].name===t){e[r]=fe,e=e.slice(0,r).concat(e.slice(r+1));break}return null!=n&&e.push({name:t,value:n}),e}me.prototype=pe.prototype={constructor:me,on:function(e,t){var n,r=this._,i=ge(e+"",r),o=-1,a=i.length;if(!(arguments.length<2)){if(null!=t&&"function"!=typeof t)throw new Error("invalid callback: "+t);for(;++o<a;)if(n=(e=i[o]).type)r[n]=ve(r[n],e.name,t);else if(null==t)for(n in r)r[n]=ve(r[n],e.name,null);return this}for(;++o<a;)if((n=(e=i[o]).type)&&(n=ye(r[n],e.name)))return n},copy:function(){var e={},t=this._;for(var n in t)e[n]=t[n].slice();return new me(e)},call:function(e,t){if((n=arguments.length-2)>0)for(var n,r,i=new Array(n),o=0;o<n;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(o=0,n=(r=this._[e]).length;o<n;++o)r[o].value.apply(t,i)},apply:function(e,t,n){if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(var r=this._[e],i=0,o=r.length;i<o;++i)r[i].value.apply(t,n)}};var _e=pe,we="http://www.w3.org/1999/xhtml",be={svg:"http://www.w3.org/2000/svg",xhtml:we,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"},Me=function(e){var t=e+="",n=t.indexOf(":");return n>=0&&"xmlns"!==(t=e.slice(0,n))&&(e=e.slice(n+1)),be.hasOwnProperty(t)?{space:be[t],local:e}:e};function ke(e){return function(){var t=this.ownerDocument,n=this.namespaceURI;return n===we&&t.documentElement.namespaceURI===we?t.createElement(e):t.createElementNS(n,e)}}function Se(e){return function(){return this.ownerDocument.createElementNS(e.space,e.local)}}var Te=function(e){var t=Me(e);return(t.local?Se:ke)(t)};function Ce(){}var xe=function(e){return null==e?Ce:function(){return this.querySelector(e)}};function Ee(){return[]}var Le=function(e){return null==e?Ee:function(){return this.querySelectorAll(e)}},Oe=function(e){return function(){return this.matches(e)}},De=function(e){return new Array(e.length)};function Re(e,t){this.ownerDocument=e.ownerDocument,this.namespaceURI=e.namespaceURI,this._next=null,this._parent=e,this.__data__=t}Re.prototype={constructor:Re,appendChild:function(e){return this._parent.insertBefore(e,this._next)},insertBefore:function(e,t){return this._parent.insertBefore(e,t)},querySelector:function(e){return this._parent.querySelector(e)},querySelectorAll:function(e){return this._parent.querySelectorAll(e)}};var Ae="$";function Ne(e,t,n,r,i,o){for(var a,s=0,l=t.length,u=o.length;s<u;++s)(a=t[s])?(a.__data__=o[s],r[s]=a):n[s]=new Re(e,o[s]);for(;s<l;++s)(a=t[s])&&(i[s]=a)}function Ye(e,t,n,r,i,o,a){var s,l,u,c={},d=t.length,h=o.length,f=new Array(d);for(s=0;s<d;++s)(l=t[s])&&(f[s]=u=Ae+a.call(l,l.__data__,s,t),u in c?i[s]=l:c[u]=l);for(s=0;s<h;++s)(l=c[u=Ae+a.call(e,o[s],s,o)])?(r[s]=l,l.__data__=o[s],c[u]=null):n[s]=new Re(e,o[s]);for(s=0;s<d;++s)(l=t[s])&&c[f[s]]===l&&(i[s]=l)}function je(e,t){return e<t?-1:e>t?1:e>=t?0:NaN}function He(e){return function(){this.removeAttribute(e)}}function Pe(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Ie(e,t){return function(){this.setAttribute(e,t)}}function Fe(e,t){return function(){this.setAttributeNS(e.space,e.local,t)}}function Be(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttribute(e):this.setAttribute(e,n)}}function ze(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttributeNS(e.space,e.local):this.setAttributeNS(e.space,e.local,n)}}var We=function(e){return e.ownerDocument&&e.ownerDocument.defaultView||e.document&&e||e.defaultView};function Ue(e){return function(){this.style.removeProperty(e)}}function Ve(e,t,n){return function(){this.style.setProperty(e,t,n)}}function qe(e,t,n){return function(){var r=t.apply(this,arguments);null==r?this.style.removeProperty(e):this.style.setProperty(e,r,n)}}function Ge(e,t){return e.style.getPropertyValue(t)||We(e).getComputedStyle(e,null).getPropertyValue(t)}function Xe(e){return function(){delete this[e]}}function Ke(e,t){return function(){this[e]=t}}function Je(e,t){return function(){var n=t.apply(this,arguments);null==n?delete this[e]:this[e]=n}}function $e(e){return e.trim().split(/^|\s+/)}function Ze(e){return e.classList||new Qe(e)}function Qe(e){this._node=e,this._names=$e(e.getAttribute("class")||"")}function et(e,t){for(var n=Ze(e),r=-1,i=t.length;++r<i;)n.add(t[r])}function tt(e,t){for(var n=Ze(e),r=-1,i=t.length;++r<i;)n.remove(t[r])}function nt(e){return function(){et(this,e)}}function rt(e){return function(){tt(this,e)}}function it(e,t){return function(){(t.apply(this,arguments)?et:tt)(this,e)}}Qe.prototype={add:function(e){this._names.indexOf(e)<0&&(this._names.push(e),this._node.setAttribute("class",this._names.join(" ")))},remove:function(e){var t=this._names.indexOf(e);t>=0&&(this._names.splice(t,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(e){return this._names.indexOf(e)>=0}};function ot(){this.textContent=""}function at(e){return function(){this.textContent=e}}function st(e){return function(){var t=e.apply(this,arguments);this.textContent=null==t?"":t}}function lt(){this.innerHTML=""}function ut(e){return function(){this.innerHTML=e}}function ct(e){return function(){var t=e.apply(this,arguments);this.innerHTML=null==t?"":t}}function dt(){this.nextSibling&&this.parentNode.appendChild(this)}function ht(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function ft(){return null}function pt(){var e=this.parentNode;e&&e.removeChild(this)}function mt(){return this.parentNode.insertBefore(this.cloneNode(!1),this.nextSibling)}function gt(){return this.parentNode.insertBefore(this.cloneNode(!0),this.nextSibling)}var yt={},vt=null;"undefined"!=typeof document&&("onmouseenter"in document.documentElement||(yt={mouseenter:"mouseover",mouseleave:"mouseout"}));function _t(e,t,n){return e=wt(e,t,n),function(t){var n=t.relatedTarget;n&&(n===this||8&n.compareDocumentPosition(this))||e.call(this,t)}}function wt(e,t,n){return function(r){var i=vt;vt=r;try{e.call(this,this.__data__,t,n)}finally{vt=i}}}function bt(e){return e.trim().split(/^|\s+/).map((function(e){var t="",n=e.indexOf(".");return n>=0&&(t=e.slice(n+1),e=e.slice(0,n)),{type:e,name:t}}))}function Mt(e){return function(){var t=this.__on;if(t){for(var n,r=0,i=-1,o=t.length;r<o;++r)n=t[r],e.type&&n.type!==e.type||n.name!==e.name?t[++i]=n:this.removeEventListener(n.type,n.listener,n.capture);++i?t.length=i:delete this.__on}}}function kt(e,t,n){var r=yt.hasOwnProperty(e.type)?_t:wt;return function(i,o,a){var s,l=this.__on,u=r(t,o,a);if(l)for(var c=0,d=l.length;c<d;++c)if((s=l[c]).type===e.type&&s.name===e.name)return this.removeEventListener(s.type,s.listener,s.capture),this.addEventListener(s.type,s.listener=u,s.capture=n),void(s.value=t);this.addEventListener(e.type,u,n),s={type:e.type,name:e.name,value:t,listener:u,capture:n},l?l.push(s):this.__on=[s]}}function St(e,t,n,r){var i=vt;e.sourceEvent=vt,vt=e;try{return t.apply(n,r)}finally{vt=i}}function Tt(e,t,n){var r=We(e),i=r.CustomEvent;"function"==typeof i?i=new i(t,n):(i=r.document.createEvent("Event"),n?(i.initEvent(t,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(t,!1,!1)),e.dispatchEvent(i)}function Ct(e,t){return function(){return Tt(this,e,t)}}function xt(e,t){return function(){return Tt(this,e,t.apply(this,arguments))}}var Et=[null];function Lt(e,t){this._groups=e,this._parents=t}function Ot(){return new Lt([[document.documentElement]],Et)}Lt.prototype=Ot.prototype={constructor:Lt,select:function(e){"function"!=typeof e&&(e=xe(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a,s=t[i],l=s.length,u=r[i]=new Array(l),c=0;c<l;++c)(o=s[c])&&(a=e.call(o,o.__data__,c,s))&&("__data__"in o&&(a.__data__=o.__data__),u[c]=a);return new Lt(r,this._parents)},selectAll:function(e){"function"!=typeof e&&(e=Le(e));for(var t=this._groups,n=t.length,r=[],i=[],o=0;o<n;++o)for(var a,s=t[o],l=s.length,u=0;u<l;++u)(a=s[u])&&(r.push(e.call(a,a.__data__,u,s)),i.push(a));return new Lt(r,i)},filter:function(e){"function"!=typeof e&&(e=Oe(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],s=a.length,l=r[i]=[],u=0;u<s;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&l.push(o);return new Lt(r,this._parents)},data:function(e,t){if(!e)return p=new Array(this.size()),c=-1,this.each((function(e){p[++c]=e})),p;var n,r=t?Ye:Ne,i=this._parents,o=this._groups;"function"!=typeof e&&(n=e,e=function(){return n});for(var a=o.length,s=new Array(a),l=new Array(a),u=new Array(a),c=0;c<a;++c){var d=i[c],h=o[c],f=h.length,p=e.call(d,d&&d.__data__,c,i),m=p.length,g=l[c]=new Array(m),y=s[c]=new Array(m);r(d,h,g,y,u[c]=new Array(f),p,t);for(var v,_,w=0,b=0;w<m;++w)if(v=g[w]){for(w>=b&&(b=w+1);!(_=y[b])&&++b<m;);v._next=_||null}}return(s=new Lt(s,i))._enter=l,s._exit=u,s},enter:function(){return new Lt(this._enter||this._groups.map(De),this._parents)},exit:function(){return new Lt(this._exit||this._groups.map(De),this._parents)},join:function(e,t,n){var r=this.enter(),i=this,o=this.exit();return r="function"==typeof e?e(r):r.append(e+""),null!=t&&(i=t(i)),null==n?o.remove():n(o),r&&i?r.merge(i).order():i},merge:function(e){for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),s=0;s<o;++s)for(var l,u=t[s],c=n[s],d=u.length,h=a[s]=new Array(d),f=0;f<d;++f)(l=u[f]||c[f])&&(h[f]=l);for(;s<r;++s)a[s]=t[s];return new Lt(a,this._parents)},order:function(){for(var e=this._groups,t=-1,n=e.length;++t<n;)for(var r,i=e[t],o=i.length-1,a=i[o];--o>=0;)(r=i[o])&&(a&&4^r.compareDocumentPosition(a)&&a.parentNode.insertBefore(r,a),a=r);return this},sort:function(e){function t(t,n){return t&&n?e(t.__data__,n.__data__):!t-!n}e||(e=je);for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var a,s=n[o],l=s.length,u=i[o]=new Array(l),c=0;c<l;++c)(a=s[c])&&(u[c]=a);u.sort(t)}return new Lt(i,this._parents).order()},call:function(){var e=arguments[0];return arguments[0]=this,e.apply(null,arguments),this},nodes:function(){var e=new Array(this.size()),t=-1;return this.each((function(){e[++t]=this})),e},node:function(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r=e[t],i=0,o=r.length;i<o;++i){var a=r[i];if(a)return a}return null},size:function(){var e=0;return this.each((function(){++e})),e},empty:function(){return!this.node()},each:function(e){for(var t=this._groups,n=0,r=t.length;n<r;++n)for(var i,o=t[n],a=0,s=o.length;a<s;++a)(i=o[a])&&e.call(i,i.__data__,a,o);return this},attr:function(e,t){var n=Me(e);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==t?n.local?Pe:He:"function"==typeof t?n.local?ze:Be:n.local?Fe:Ie)(n,t))},style:function(e,t,n){return arguments.length>1?this.each((null==t?Ue:"function"==typeof t?qe:Ve)(e,t,null==n?"":n)):Ge(this.node(),e)},property:function(e,t){return arguments.length>1?this.each((null==t?Xe:"function"==typeof t?Je:Ke)(e,t)):this.node()[e]},classed:function(e,t){var n=$e(e+"");if(arguments.length<2){for(var r=Ze(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each(("function"==typeof t?it:t?nt:rt)(n,t))},text:function(e){return arguments.length?this.each(null==e?ot:("function"==typeof e?st:at)(e)):this.node().textContent},html:function(e){return arguments.length?this.each(null==e?lt:("function"==typeof e?ct:ut)(e)):this.node().innerHTML},raise:function(){return this.each(dt)},lower:function(){return this.each(ht)},append:function(e){var t="function"==typeof e?e:Te(e);return this.select((function(){return this.appendChild(t.apply(this,arguments))}))},insert:function(e,t){var n="function"==typeof e?e:Te(e),r=null==t?ft:"function"==typeof t?t:xe(t);return this.select((function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)}))},remove:function(){return this.each(pt)},clone:function(e){return this.select(e?gt:mt)},datum:function(e){return arguments.length?this.property("__data__",e):this.node().__data__},on:function(e,t,n){var r,i,o=bt(e+""),a=o.length;if(!(arguments.length<2)){for(s=t?kt:Mt,null==n&&(n=!1),r=0;r<a;++r)this.each(s(o[r],t,n));return this}var s=this.node().__on;if(s)for(var l,u=0,c=s.length;u<c;++u)for(r=0,l=s[u];r<a;++r)if((i=o[r]).type===l.type&&i.name===l.name)return l.value},dispatch:function(e,t){return this.each(("function"==typeof t?xt:Ct)(e,t))}};var Dt=Ot,Rt=function(e){return"string"==typeof e?new Lt([[document.querySelector(e)]],[document.documentElement]):new Lt([[e]],Et)},At=function(e){return Rt(Te(e).call(document.documentElement))},Nt=0;function Yt(){return new jt}function jt(){this._="@"+(++Nt).toString(36)}jt.prototype=Yt.prototype={constructor:jt,get:function(e){for(var t=this._;!(t in e);)if(!(e=e.parentNode))return;return e[t]},set:function(e,t){return e[this._]=t},remove:function(e){return this._ in e&&delete e[this._]},toString:function(){return this._}};var Ht=function(){for(var e,t=vt;e=t.sourceEvent;)t=e;return t},Pt=function(e,t){var n=e.ownerSVGElement||e;if(n.createSVGPoint){var r=n.createSVGPoint();return r.x=t.clientX,r.y=t.clientY,[(r=r.matrixTransform(e.getScreenCTM().inverse())).x,r.y]}var i=e.getBoundingClientRect();return[t.clientX-i.left-e.clientLeft,t.clientY-i.top-e.clientTop]},It=function(e){var t=Ht();return t.changedTouches&&(t=t.changedTouches[0]),Pt(e,t)},Ft=function(e){return"string"==typeof e?new Lt([document.querySelectorAll(e)],[document.documentElement]):new Lt([null==e?[]:e],Et)},Bt=function(e,t,n){arguments.length<3&&(n=t,t=Ht().changedTouches);for(var r,i=0,o=t?t.length:0;i<o;++i)if((r=t[i]).identifier===n)return Pt(e,r);return null},zt=function(e,t){null==t&&(t=Ht().touches);for(var n=0,r=t?t.length:0,i=new Array(r);n<r;++n)i[n]=Pt(e,t[n]);return i};function Wt(){vt.stopImmediatePropagation()}var Ut=function(){vt.preventDefault(),vt.stopImmediatePropagation()},Vt=function(e){var t=e.document.documentElement,n=Rt(e).on("dragstart.drag",Ut,!0);"onselectstart"in t?n.on("selectstart.drag",Ut,!0):(t.__noselect=t.style.MozUserSelect,t.style.MozUserSelect="none")};function qt(e,t){var n=e.document.documentElement,r=Rt(e).on("dragstart.drag",null);t&&(r.on("click.drag",Ut,!0),setTimeout((function(){r.on("click.drag",null)}),0)),"onselectstart"in n?r.on("selectstart.drag",null):(n.style.MozUserSelect=n.__noselect,delete n.__noselect)}var Gt=function(e){return function(){return e}};function Xt(e,t,n,r,i,o,a,s,l,u){this.target=e,this.type=t,this.subject=n,this.identifier=r,this.active=i,this.x=o,this.y=a,this.dx=s,this.dy=l,this._=u}function Kt(){return!vt.ctrlKey&&!vt.button}function Jt(){return this.parentNode}function $t(e){return null==e?{x:vt.x,y:vt.y}:e}function Zt(){return navigator.maxTouchPoints||"ontouchstart"in this}Xt.prototype.on=function(){var e=this._.on.apply(this._,arguments);return e===this._?this:e};var Qt=function(){var e,t,n,r,i=Kt,o=Jt,a=$t,s=Zt,l={},u=_e("start","drag","end"),c=0,d=0;function h(e){e.on("mousedown.drag",f).filter(s).on("touchstart.drag",g).on("touchmove.drag",y).on("touchend.drag touchcancel.drag",v).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function f(){if(!r&&i.apply(this,arguments)){var a=_("mouse",o.apply(this,arguments),It,this,arguments);a&&(Rt(vt.view).on("mousemove.drag",p,!0).on("mouseup.drag",m,!0),Vt(vt.view),Wt(),n=!1,e=vt.clientX,t=vt.clientY,a("start"))}}function p(){if(Ut(),!n){var r=vt.clientX-e,i=vt.clientY-t;n=r*r+i*i>d}l.mouse("drag")}function m(){Rt(vt.view).on("mousemove.drag mouseup.drag",null),qt(vt.view,n),Ut(),l.mouse("end")}function g(){if(i.apply(this,arguments)){var e,t,n=vt.changedTouches,r=o.apply(this,arguments),a=n.length;for(e=0;e<a;++e)(t=_(n[e].identifier,r,Bt,this,arguments))&&(Wt(),t("start"))}}function y(){var e,t,n=vt.changedTouches,r=n.length;for(e=0;e<r;++e)(t=l[n[e].identifier])&&(Ut(),t("drag"))}function v(){var e,t,n=vt.changedTouches,i=n.length;for(r&&clearTimeout(r),r=setTimeout((function(){r=null}),500),e=0;e<i;++e)(t=l[n[e].identifier])&&(Wt(),t("end"))}function _(e,t,n,r,i){var o,s,d,f=n(t,e),p=u.copy();if(St(new Xt(h,"beforestart",o,e,c,f[0],f[1],0,0,p),(function(){return null!=(vt.subject=o=a.apply(r,i))&&(s=o.x-f[0]||0,d=o.y-f[1]||0,!0)})))return function a(u){var m,g=f;switch(u){case"start":l[e]=a,m=c++;break;case"end":delete l[e],--c;case"drag":f=n(t,e),m=c}St(new Xt(h,u,o,e,m,f[0]+s,f[1]+d,f[0]-g[0],f[1]-g[1],p),p.apply,p,[u,r,i])}}return h.filter=function(e){return arguments.length?(i="function"==typeof e?e:Gt(!!e),h):i},h.container=function(e){return arguments.length?(o="function"==typeof e?e:Gt(e),h):o},h.subject=function(e){return arguments.length?(a="function"==typeof e?e:Gt(e),h):a},h.touchable=function(e){return arguments.length?(s="function"==typeof e?e:Gt(!!e),h):s},h.on=function(){var e=u.on.apply(u,arguments);return e===u?h:e},h.clickDistance=function(e){return arguments.length?(d=(e=+e)*e,h):Math.sqrt(d)},h},en=function(e,t,n){e.prototype=t.prototype=n,n.constructor=e};function tn(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function nn(){}var rn="\\s*([+-]?\\d+)\\s*",on="\\s*([+-]?\\d*\\.?\\d+(?:[eE][+-]?\\d+)?)\\s*",an="\\s*([+-]?\\d*\\.?\\d+(?:[eE][+-]?\\d+)?)%\\s*",sn=/^#([0-9a-f]{3,8})$/,ln=new RegExp("^rgb\\("+[rn,rn,rn]+"\\)$"),un=new RegExp("^rgb\\("+[an,an,an]+"\\)$"),cn=new RegExp("^rgba\\("+[rn,rn,rn,on]+"\\)$"),dn=new RegExp("^rgba\\("+[an,an,an,on]+"\\)$"),hn=new RegExp("^hsl\\("+[on,an,an]+"\\)$"),fn=new RegExp("^hsla\\("+[on,an,an,on]+"\\)$"),pn={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function mn(){return this.rgb().formatHex()}function gn(){return this.rgb().formatRgb()}function yn(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=sn.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?vn(t):3===n?new Mn(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?new Mn(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?new Mn(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=ln.exec(e))?new Mn(t[1],t[2],t[3],1):(t=un.exec(e))?new Mn(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=cn.exec(e))?_n(t[1],t[2],t[3],t[4]):(t=dn.exec(e))?_n(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=hn.exec(e))?Cn(t[1],t[2]/100,t[3]/100,1):(t=fn.exec(e))?Cn(t[1],t[2]/100,t[3]/100,t[4]):pn.hasOwnProperty(e)?vn(pn[e]):"transparent"===e?new Mn(NaN,NaN,NaN,0):null}function vn(e){return new Mn(e>>16&255,e>>8&255,255&e,1)}function _n(e,t,n,r){return r<=0&&(e=t=n=NaN),new Mn(e,t,n,r)}function wn(e){return e instanceof nn||(e=yn(e)),e?new Mn((e=e.rgb()).r,e.g,e.b,e.opacity):new Mn}function bn(e,t,n,r){return 1===arguments.length?wn(e):new Mn(e,t,n,null==r?1:r)}function Mn(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function kn(){return"#"+Tn(this.r)+Tn(this.g)+Tn(this.b)}function Sn(){var e=this.opacity;return(1===(e=isNaN(e)?1:Math.max(0,Math.min(1,e)))?"rgb(":"rgba(")+Math.max(0,Math.min(255,Math.round(this.r)||0))+", "+Math.max(0,Math.min(255,Math.round(this.g)||0))+", "+Math.max(0,Math.min(255,Math.round(this.b)||0))+(1===e?")":", "+e+")")}function Tn(e){return((e=Math.max(0,Math.min(255,Math.round(e)||0)))<16?"0":"")+e.toString(16)}function Cn(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Ln(e,t,n,r)}function xn(e){if(e instanceof Ln)return new Ln(e.h,e.s,e.l,e.opacity);if(e instanceof nn||(e=yn(e)),!e)return new Ln;if(e instanceof Ln)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),o=Math.max(t,n,r),a=NaN,s=o-i,l=(o+i)/2;return s?(a=t===o?(n-r)/s+6*(n<r):n===o?(r-t)/s+2:(t-n)/s+4,s/=l<.5?o+i:2-o-i,a*=60):s=l>0&&l<1?0:a,new Ln(a,s,l,e.opacity)}function En(e,t,n,r){return 1===arguments.length?xn(e):new Ln(e,t,n,null==r?1:r)}function Ln(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function On(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function Dn(e,t,n,r,i){var o=e*e,a=o*e;return((1-3*e+3*o-a)*t+(4-6*o+3*a)*n+(1+3*e+3*o-3*a)*r+a*i)/6}en(nn,yn,{copy:function(e){return Object.assign(new this.constructor,this,e)},displayable:function(){return this.rgb().displayable()},hex:mn,formatHex:mn,formatHsl:function(){return xn(this).formatHsl()},formatRgb:gn,toString:gn}),en(Mn,bn,tn(nn,{brighter:function(e){return e=null==e?1/.7:Math.pow(1/.7,e),new Mn(this.r*e,this.g*e,this.b*e,this.opacity)},darker:function(e){return e=null==e?.7:Math.pow(.7,e),new Mn(this.r*e,this.g*e,this.b*e,this.opacity)},rgb:function(){return this},displayable:function(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:kn,formatHex:kn,formatRgb:Sn,toString:Sn})),en(Ln,En,tn(nn,{brighter:function(e){return e=null==e?1/.7:Math.pow(1/.7,e),new Ln(this.h,this.s,this.l*e,this.opacity)},darker:function(e){return e=null==e?.7:Math.pow(.7,e),new Ln(this.h,this.s,this.l*e,this.opacity)},rgb:function(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new Mn(On(e>=240?e-240:e+120,i,r),On(e,i,r),On(e<120?e+240:e-120,i,r),this.opacity)},displayable:function(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl:function(){var e=this.opacity;return(1===(e=isNaN(e)?1:Math.max(0,Math.min(1,e)))?"hsl(":"hsla(")+(this.h||0)+", "+100*(this.s||0)+"%, "+100*(this.l||0)+"%"+(1===e?")":", "+e+")")}}));var Rn=function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),i=e[r],o=e[r+1],a=r>0?e[r-1]:2*i-o,s=r<t-1?e[r+2]:2*o-i;return Dn((n-r/t)*t,a,i,o,s)}},An=function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),i=e[(r+t-1)%t],o=e[r%t],a=e[(r+1)%t],s=e[(r+2)%t];return Dn((n-r/t)*t,i,o,a,s)}},Nn=function(e){return function(){return e}};function Yn(e,t){return function(n){return e+n*t}}function jn(e,t){var n=t-e;return n?Yn(e,n>180||n<-180?n-360*Math.round(n/360):n):Nn(isNaN(e)?t:e)}function Hn(e){return 1==(e=+e)?Pn:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):Nn(isNaN(t)?n:t)}}function Pn(e,t){var n=t-e;return n?Yn(e,n):Nn(isNaN(e)?t:e)}var In=function e(t){var n=Hn(t);function r(e,t){var r=n((e=bn(e)).r,(t=bn(t)).r),i=n(e.g,t.g),o=n(e.b,t.b),a=Pn(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=i(t),e.b=o(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function Fn(e){return function(t){var n,r,i=t.length,o=new Array(i),a=new Array(i),s=new Array(i);for(n=0;n<i;++n)r=bn(t[n]),o[n]=r.r||0,a[n]=r.g||0,s[n]=r.b||0;return o=e(o),a=e(a),s=e(s),r.opacity=1,function(e){return r.r=o(e),r.g=a(e),r.b=s(e),r+""}}}var Bn=Fn(Rn),zn=Fn(An),Wn=function(e,t){var n,r=t?t.length:0,i=e?Math.min(r,e.length):0,o=new Array(i),a=new Array(r);for(n=0;n<i;++n)o[n]=er(e[n],t[n]);for(;n<r;++n)a[n]=t[n];return function(e){for(n=0;n<i;++n)a[n]=o[n](e);return a}},Un=function(e,t){var n=new Date;return t-=e=+e,function(r){return n.setTime(e+t*r),n}},Vn=function(e,t){return t-=e=+e,function(n){return e+t*n}},qn=function(e,t){var n,r={},i={};for(n in null!==e&&"object"==typeof e||(e={}),null!==t&&"object"==typeof t||(t={}),t)n in e?r[n]=er(e[n],t[n]):i[n]=t[n];return function(e){for(n in r)i[n]=r[n](e);return i}},Gn=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Xn=new RegExp(Gn.source,"g");var Kn,Jn,$n,Zn,Qn=function(e,t){var n,r,i,o=Gn.lastIndex=Xn.lastIndex=0,a=-1,s=[],l=[];for(e+="",t+="";(n=Gn.exec(e))&&(r=Xn.exec(t));)(i=r.index)>o&&(i=t.slice(o,i),s[a]?s[a]+=i:s[++a]=i),(n=n[0])===(r=r[0])?s[a]?s[a]+=r:s[++a]=r:(s[++a]=null,l.push({i:a,x:Vn(n,r)})),o=Xn.lastIndex;return o<t.length&&(i=t.slice(o),s[a]?s[a]+=i:s[++a]=i),s.length<2?l[0]?function(e){return function(t){return e(t)+""}}(l[0].x):function(e){return function(){return e}}(t):(t=l.length,function(e){for(var n,r=0;r<t;++r)s[(n=l[r]).i]=n.x(e);return s.join("")})},er=function(e,t){var n,r=typeof t;return null==t||"boolean"===r?Nn(t):("number"===r?Vn:"string"===r?(n=yn(t))?(t=n,In):Qn:t instanceof yn?In:t instanceof Date?Un:Array.isArray(t)?Wn:"function"!=typeof t.valueOf&&"function"!=typeof t.toString||isNaN(t)?qn:Vn)(e,t)},tr=function(e){var t=e.length;return function(n){return e[Math.max(0,Math.min(t-1,Math.floor(n*t)))]}},nr=function(e,t){var n=jn(+e,+t);return function(e){var t=n(e);return t-360*Math.floor(t/360)}},rr=function(e,t){return t-=e=+e,function(n){return Math.round(e+t*n)}},ir=180/Math.PI,or={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1},ar=function(e,t,n,r,i,o){var a,s,l;return(a=Math.sqrt(e*e+t*t))&&(e/=a,t/=a),(l=e*n+t*r)&&(n-=e*l,r-=t*l),(s=Math.sqrt(n*n+r*r))&&(n/=s,r/=s,l/=s),e*r<t*n&&(e=-e,t=-t,l=-l,a=-a),{translateX:i,translateY:o,rotate:Math.atan2(t,e)*ir,skewX:Math.atan(l)*ir,scaleX:a,scaleY:s}};function sr(e,t,n,r){function i(e){return e.length?e.pop()+" ":""}return function(o,a){var s=[],l=[];return o=e(o),a=e(a),function(e,r,i,o,a,s){if(e!==i||r!==o){var l=a.push("translate(",null,t,null,n);s.push({i:l-4,x:Vn(e,i)},{i:l-2,x:Vn(r,o)})}else(i||o)&&a.push("translate("+i+t+o+n)}(o.translateX,o.translateY,a.translateX,a.translateY,s,l),function(e,t,n,o){e!==t?(e-t>180?t+=360:t-e>180&&(e+=360),o.push({i:n.push(i(n)+"rotate(",null,r)-2,x:Vn(e,t)})):t&&n.push(i(n)+"rotate("+t+r)}(o.rotate,a.rotate,s,l),function(e,t,n,o){e!==t?o.push({i:n.push(i(n)+"skewX(",null,r)-2,x:Vn(e,t)}):t&&n.push(i(n)+"skewX("+t+r)}(o.skewX,a.skewX,s,l),function(e,t,n,r,o,a){if(e!==n||t!==r){var s=o.push(i(o)+"scale(",null,",",null,")");a.push({i:s-4,x:Vn(e,n)},{i:s-2,x:Vn(t,r)})}else 1===n&&1===r||o.push(i(o)+"scale("+n+","+r+")")}(o.scaleX,o.scaleY,a.scaleX,a.scaleY,s,l),o=a=null,function(e){for(var t,n=-1,r=l.length;++n<r;)s[(t=l[n]).i]=t.x(e);return s.join("")}}}var lr=sr((function(e){return"none"===e?or:(Kn||(Kn=document.createElement("DIV"),Jn=document.documentElement,$n=document.defaultView),Kn.style.transform=e,e=$n.getComputedStyle(Jn.appendChild(Kn),null).getPropertyValue("transform"),Jn.removeChild(Kn),e=e.slice(7,-1).split(","),ar(+e[0],+e[1],+e[2],+e[3],+e[4],+e[5]))}),"px, ","px)","deg)"),ur=sr((function(e){return null==e?or:(Zn||(Zn=document.createElementNS("http://www.w3.org/2000/svg","g")),Zn.setAttribute("transform",e),(e=Zn.transform.baseVal.consolidate())?(e=e.matrix,ar(e.a,e.b,e.c,e.d,e.e,e.f)):or)}),", ",")",")"),cr=Math.SQRT2;function dr(e){return((e=Math.exp(e))+1/e)/2}var hr=function(e,t){var n,r,i=e[0],o=e[1],a=e[2],s=t[0],l=t[1],u=t[2],c=s-i,d=l-o,h=c*c+d*d;if(h<1e-12)r=Math.log(u/a)/cr,n=function(e){return[i+e*c,o+e*d,a*Math.exp(cr*e*r)]};else{var f=Math.sqrt(h),p=(u*u-a*a+4*h)/(2*a*2*f),m=(u*u-a*a-4*h)/(2*u*2*f),g=Math.log(Math.sqrt(p*p+1)-p),y=Math.log(Math.sqrt(m*m+1)-m);r=(y-g)/cr,n=function(e){var t,n=e*r,s=dr(g),l=a/(2*f)*(s*(t=cr*n+g,((t=Math.exp(2*t))-1)/(t+1))-function(e){return((e=Math.exp(e))-1/e)/2}(g));return[i+l*c,o+l*d,a*s/dr(cr*n+g)]}}return n.duration=1e3*r,n};function fr(e){return function(t,n){var r=e((t=En(t)).h,(n=En(n)).h),i=Pn(t.s,n.s),o=Pn(t.l,n.l),a=Pn(t.opacity,n.opacity);return function(e){return t.h=r(e),t.s=i(e),t.l=o(e),t.opacity=a(e),t+""}}}var pr=fr(jn),mr=fr(Pn),gr=Math.PI/180,yr=180/Math.PI,vr=.96422,_r=1,wr=.82521,br=4/29,Mr=6/29,kr=3*Mr*Mr,Sr=Mr*Mr*Mr;function Tr(e){if(e instanceof Er)return new Er(e.l,e.a,e.b,e.opacity);if(e instanceof jr)return Hr(e);e instanceof Mn||(e=wn(e));var t,n,r=Rr(e.r),i=Rr(e.g),o=Rr(e.b),a=Lr((.2225045*r+.7168786*i+.0606169*o)/_r);return r===i&&i===o?t=n=a:(t=Lr((.4360747*r+.3850649*i+.1430804*o)/vr),n=Lr((.0139322*r+.0971045*i+.7141733*o)/wr)),new Er(116*a-16,500*(t-a),200*(a-n),e.opacity)}function Cr(e,t){return new Er(e,0,0,null==t?1:t)}function xr(e,t,n,r){return 1===arguments.length?Tr(e):new Er(e,t,n,null==r?1:r)}function Er(e,t,n,r){this.l=+e,this.a=+t,this.b=+n,this.opacity=+r}function Lr(e){return e>Sr?Math.pow(e,1/3):e/kr+br}function Or(e){return e>Mr?e*e*e:kr*(e-br)}function Dr(e){return 255*(e<=.0031308?12.92*e:1.055*Math.pow(e,1/2.4)-.055)}function Rr(e){return(e/=255)<=.04045?e/12.92:Math.pow((e+.055)/1.055,2.4)}function Ar(e){if(e instanceof jr)return new jr(e.h,e.c,e.l,e.opacity);if(e instanceof Er||(e=Tr(e)),0===e.a&&0===e.b)return new jr(NaN,0<e.l&&e.l<100?0:NaN,e.l,e.opacity);var t=Math.atan2(e.b,e.a)*yr;return new jr(t<0?t+360:t,Math.sqrt(e.a*e.a+e.b*e.b),e.l,e.opacity)}function Nr(e,t,n,r){return 1===arguments.length?Ar(e):new jr(n,t,e,null==r?1:r)}function Yr(e,t,n,r){return 1===arguments.length?Ar(e):new jr(e,t,n,null==r?1:r)}function jr(e,t,n,r){this.h=+e,this.c=+t,this.l=+n,this.opacity=+r}function Hr(e){if(isNaN(e.h))return new Er(e.l,0,0,e.opacity);var t=e.h*gr;return new Er(e.l,Math.cos(t)*e.c,Math.sin(t)*e.c,e.opacity)}function Pr(e,t){var n=Pn((e=xr(e)).l,(t=xr(t)).l),r=Pn(e.a,t.a),i=Pn(e.b,t.b),o=Pn(e.opacity,t.opacity);return function(t){return e.l=n(t),e.a=r(t),e.b=i(t),e.opacity=o(t),e+""}}function Ir(e){return function(t,n){var r=e((t=Yr(t)).h,(n=Yr(n)).h),i=Pn(t.c,n.c),o=Pn(t.l,n.l),a=Pn(t.opacity,n.opacity);return function(e){return t.h=r(e),t.c=i(e),t.l=o(e),t.opacity=a(e),t+""}}}en(Er,xr,tn(nn,{brighter:function(e){return new Er(this.l+18*(null==e?1:e),this.a,this.b,this.opacity)},darker:function(e){return new Er(this.l-18*(null==e?1:e),this.a,this.b,this.opacity)},rgb:function(){var e=(this.l+16)/116,t=isNaN(this.a)?e:e+this.a/500,n=isNaN(this.b)?e:e-this.b/200;return new Mn(Dr(3.1338561*(t=vr*Or(t))-1.6168667*(e=_r*Or(e))-.4906146*(n=wr*Or(n))),Dr(-.9787684*t+1.9161415*e+.033454*n),Dr(.0719453*t-.2289914*e+1.4052427*n),this.opacity)}})),en(jr,Yr,tn(nn,{brighter:function(e){return new jr(this.h,this.c,this.l+18*(null==e?1:e),this.opacity)},darker:function(e){return new jr(this.h,this.c,this.l-18*(null==e?1:e),this.opacity)},rgb:function(){return Hr(this).rgb()}}));var Fr=Ir(jn),Br=Ir(Pn),zr=-.29227,Wr=-.90649,Ur=1.97294,Vr=Ur*Wr,qr=1.78277*Ur,Gr=1.78277*zr- -.14861*Wr;function Xr(e,t,n,r){return 1===arguments.length?function(e){if(e instanceof Kr)return new Kr(e.h,e.s,e.l,e.opacity);e instanceof Mn||(e=wn(e));var t=e.r/255,n=e.g/255,r=e.b/255,i=(Gr*r+Vr*t-qr*n)/(Gr+Vr-qr),o=r-i,a=(Ur*(n-i)-zr*o)/Wr,s=Math.sqrt(a*a+o*o)/(Ur*i*(1-i)),l=s?Math.atan2(a,o)*yr-120:NaN;return new Kr(l<0?l+360:l,s,i,e.opacity)}(e):new Kr(e,t,n,null==r?1:r)}function Kr(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function Jr(e){return function t(n){function r(t,r){var i=e((t=Xr(t)).h,(r=Xr(r)).h),o=Pn(t.s,r.s),a=Pn(t.l,r.l),s=Pn(t.opacity,r.opacity);return function(e){return t.h=i(e),t.s=o(e),t.l=a(Math.pow(e,n)),t.opacity=s(e),t+""}}return n=+n,r.gamma=t,r}(1)}en(Kr,Xr,tn(nn,{brighter:function(e){return e=null==e?1/.7:Math.pow(1/.7,e),new Kr(this.h,this.s,this.l*e,this.opacity)},darker:function(e){return e=null==e?.7:Math.pow(.7,e),new Kr(this.h,this.s,this.l*e,this.opacity)},rgb:function(){var e=isNaN(this.h)?0:(this.h+120)*gr,t=+this.l,n=isNaN(this.s)?0:this.s*t*(1-t),r=Math.cos(e),i=Math.sin(e);return new Mn(255*(t+n*(-.14861*r+1.78277*i)),255*(t+n*(zr*r+Wr*i)),255*(t+n*(Ur*r)),this.opacity)}}));var $r=Jr(jn),Zr=Jr(Pn);function Qr(e,t){for(var n=0,r=t.length-1,i=t[0],o=new Array(r<0?0:r);n<r;)o[n]=e(i,i=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return o[t](e-t)}}var ei,ti,ni=function(e,t){for(var n=new Array(t),r=0;r<t;++r)n[r]=e(r/(t-1));return n},ri=0,ii=0,oi=0,ai=1e3,si=0,li=0,ui=0,ci="object"==typeof performance&&performance.now?performance:Date,di="object"==typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(e){setTimeout(e,17)};function hi(){return li||(di(fi),li=ci.now()+ui)}function fi(){li=0}function pi(){this._call=this._time=this._next=null}function mi(e,t,n){var r=new pi;return r.restart(e,t,n),r}function gi(){hi(),++ri;for(var e,t=ei;t;)(e=li-t._time)>=0&&t._call.call(null,e),t=t._next;--ri}function yi(){li=(si=ci.now())+ui,ri=ii=0;try{gi()}finally{ri=0,function(){var e,t,n=ei,r=1/0;for(;n;)n._call?(r>n._time&&(r=n._time),e=n,n=n._next):(t=n._next,n._next=null,n=e?e._next=t:ei=t);ti=e,_i(r)}(),li=0}}function vi(){var e=ci.now(),t=e-si;t>ai&&(ui-=t,si=e)}function _i(e){ri||(ii&&(ii=clearTimeout(ii)),e-li>24?(e<1/0&&(ii=setTimeout(yi,e-ci.now()-ui)),oi&&(oi=clearInterval(oi))):(oi||(si=ci.now(),oi=setInterval(vi,ai)),ri=1,di(yi)))}pi.prototype=mi.prototype={constructor:pi,restart:function(e,t,n){if("function"!=typeof e)throw new TypeError("callback is not a function");n=(null==n?hi():+n)+(null==t?0:+t),this._next||ti===this||(ti?ti._next=this:ei=this,ti=this),this._call=e,this._time=n,_i()},stop:function(){this._call&&(this._call=null,this._time=1/0,_i())}};var wi=function(e,t,n){var r=new pi;return t=null==t?0:+t,r.restart((function(n){r.stop(),e(n+t)}),t,n),r},bi=function(e,t,n){var r=new pi,i=t;return null==t?(r.restart(e,t,n),r):(t=+t,n=null==n?hi():+n,r.restart((function o(a){a+=i,r.restart(o,i+=t,n),e(a)}),t,n),r)},Mi=_e("start","end","cancel","interrupt"),ki=[],Si=0,Ti=1,Ci=2,xi=3,Ei=4,Li=5,Oi=6,Di=function(e,t,n,r,i,o){var a=e.__transition;if(a){if(n in a)return}else e.__transition={};!function(e,t,n){var r,i=e.__transition;function o(l){var u,c,d,h;if(n.state!==Ti)return s();for(u in i)if((h=i[u]).name===n.name){if(h.state===xi)return wi(o);h.state===Ei?(h.state=Oi,h.timer.stop(),h.on.call("interrupt",e,e.__data__,h.index,h.group),delete i[u]):+u<t&&(h.state=Oi,h.timer.stop(),h.on.call("cancel",e,e.__data__,h.index,h.group),delete i[u])}if(wi((function(){n.state===xi&&(n.state=Ei,n.timer.restart(a,n.delay,n.time),a(l))})),n.state=Ci,n.on.call("start",e,e.__data__,n.index,n.group),n.state===Ci){for(n.state=xi,r=new Array(d=n.tween.length),u=0,c=-1;u<d;++u)(h=n.tween[u].value.call(e,e.__data__,n.index,n.group))&&(r[++c]=h);r.length=c+1}}function a(t){for(var i=t<n.duration?n.ease.call(null,t/n.duration):(n.timer.restart(s),n.state=Li,1),o=-1,a=r.length;++o<a;)r[o].call(e,i);n.state===Li&&(n.on.call("end",e,e.__data__,n.index,n.group),s())}function s(){for(var r in n.state=Oi,n.timer.stop(),delete i[t],i)return;delete e.__transition}i[t]=n,n.timer=mi((function(e){n.state=Ti,n.timer.restart(o,n.delay,n.time),n.delay<=e&&o(e-n.delay)}),0,n.time)}(e,n,{name:t,index:r,group:i,on:Mi,tween:ki,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:Si})};function Ri(e,t){var n=Ni(e,t);if(n.state>Si)throw new Error("too late; already scheduled");return n}function Ai(e,t){var n=Ni(e,t);if(n.state>xi)throw new Error("too late; already running");return n}function Ni(e,t){var n=e.__transition;if(!n||!(n=n[t]))throw new Error("transition not found");return n}var Yi=function(e,t){var n,r,i,o=e.__transition,a=!0;if(o){for(i in t=null==t?null:t+"",o)(n=o[i]).name===t?(r=n.state>Ci&&n.state<Li,n.state=Oi,n.timer.stop(),n.on.call(r?"interrupt":"cancel",e,e.__data__,n.index,n.group),delete o[i]):a=!1;a&&delete e.__transition}};function ji(e,t){var n,r;return function(){var i=Ai(this,e),o=i.tween;if(o!==n)for(var a=0,s=(r=n=o).length;a<s;++a)if(r[a].name===t){(r=r.slice()).splice(a,1);break}i.tween=r}}function Hi(e,t,n){var r,i;if("function"!=typeof n)throw new Error;return function(){var o=Ai(this,e),a=o.tween;if(a!==r){i=(r=a).slice();for(var s={name:t,value:n},l=0,u=i.length;l<u;++l)if(i[l].name===t){i[l]=s;break}l===u&&i.push(s)}o.tween=i}}function Pi(e,t,n){var r=e._id;return e.each((function(){var e=Ai(this,r);(e.value||(e.value={}))[t]=n.apply(this,arguments)})),function(e){return Ni(e,r).value[t]}}var Ii=function(e,t){var n;return("number"==typeof t?Vn:t instanceof yn?In:(n=yn(t))?(t=n,In):Qn)(e,t)};function Fi(e){return function(){this.removeAttribute(e)}}function Bi(e){return function(){this.removeAttributeNS(e.space,e.local)}}function zi(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttribute(e);return a===o?null:a===r?i:i=t(r=a,n)}}function Wi(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttributeNS(e.space,e.local);return a===o?null:a===r?i:i=t(r=a,n)}}function Ui(e,t,n){var r,i,o;return function(){var a,s,l=n(this);if(null!=l)return(a=this.getAttribute(e))===(s=l+"")?null:a===r&&s===i?o:(i=s,o=t(r=a,l));this.removeAttribute(e)}}function Vi(e,t,n){var r,i,o;return function(){var a,s,l=n(this);if(null!=l)return(a=this.getAttributeNS(e.space,e.local))===(s=l+"")?null:a===r&&s===i?o:(i=s,o=t(r=a,l));this.removeAttributeNS(e.space,e.local)}}function qi(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttributeNS(e.space,e.local,t(n))}}(e,i)),n}return i._value=t,i}function Gi(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttribute(e,t(n))}}(e,i)),n}return i._value=t,i}function Xi(e,t){return function(){Ri(this,e).delay=+t.apply(this,arguments)}}function Ki(e,t){return t=+t,function(){Ri(this,e).delay=t}}function Ji(e,t){return function(){Ai(this,e).duration=+t.apply(this,arguments)}}function $i(e,t){return t=+t,function(){Ai(this,e).duration=t}}function Zi(e,t){if("function"!=typeof t)throw new Error;return function(){Ai(this,e).ease=t}}function Qi(e,t,n){var r,i,o=function(e){return(e+"").trim().split(/^|\s+/).every((function(e){var t=e.indexOf(".");return t>=0&&(e=e.slice(0,t)),!e||"start"===e}))}(t)?Ri:Ai;return function(){var a=o(this,e),s=a.on;s!==r&&(i=(r=s).copy()).on(t,n),a.on=i}}var eo=Dt.prototype.constructor;function to(e){return function(){this.style.removeProperty(e)}}function no(e,t,n){var r,i;function o(){var o=t.apply(this,arguments);return o!==i&&(r=(i=o)&&function(e,t,n){return function(r){this.style.setProperty(e,t(r),n)}}(e,o,n)),r}return o._value=t,o}var ro=0;function io(e,t,n,r){this._groups=e,this._parents=t,this._name=n,this._id=r}function oo(e){return Dt().transition(e)}function ao(){return++ro}var so=Dt.prototype;function lo(e){return+e}function uo(e){return e*e}function co(e){return e*(2-e)}function ho(e){return((e*=2)<=1?e*e:--e*(2-e)+1)/2}function fo(e){return e*e*e}function po(e){return--e*e*e+1}function mo(e){return((e*=2)<=1?e*e*e:(e-=2)*e*e+2)/2}io.prototype=oo.prototype={constructor:io,select:function(e){var t=this._name,n=this._id;"function"!=typeof e&&(e=xe(e));for(var r=this._groups,i=r.length,o=new Array(i),a=0;a<i;++a)for(var s,l,u=r[a],c=u.length,d=o[a]=new Array(c),h=0;h<c;++h)(s=u[h])&&(l=e.call(s,s.__data__,h,u))&&("__data__"in s&&(l.__data__=s.__data__),d[h]=l,Di(d[h],t,n,h,d,Ni(s,n)));return new io(o,this._parents,t,n)},selectAll:function(e){var t=this._name,n=this._id;"function"!=typeof e&&(e=Le(e));for(var r=this._groups,i=r.length,o=[],a=[],s=0;s<i;++s)for(var l,u=r[s],c=u.length,d=0;d<c;++d)if(l=u[d]){for(var h,f=e.call(l,l.__data__,d,u),p=Ni(l,n),m=0,g=f.length;m<g;++m)(h=f[m])&&Di(h,t,n,m,f,p);o.push(f),a.push(l)}return new io(o,a,t,n)},filter:function(e){"function"!=typeof e&&(e=Oe(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],s=a.length,l=r[i]=[],u=0;u<s;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&l.push(o);return new io(r,this._parents,this._name,this._id)},merge:function(e){if(e._id!==this._id)throw new Error;for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),s=0;s<o;++s)for(var l,u=t[s],c=n[s],d=u.length,h=a[s]=new Array(d),f=0;f<d;++f)(l=u[f]||c[f])&&(h[f]=l);for(;s<r;++s)a[s]=t[s];return new io(a,this._parents,this._name,this._id)},selection:function(){return new eo(this._groups,this._parents)},transition:function(){for(var e=this._name,t=this._id,n=ao(),r=this._groups,i=r.length,o=0;o<i;++o)for(var a,s=r[o],l=s.length,u=0;u<l;++u)if(a=s[u]){var c=Ni(a,t);Di(a,e,n,u,s,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new io(r,this._parents,e,n)},call:so.call,nodes:so.nodes,node:so.node,size:so.size,empty:so.empty,each:so.each,on:function(e,t){var n=this._id;return arguments.length<2?Ni(this.node(),n).on.on(e):this.each(Qi(n,e,t))},attr:function(e,t){var n=Me(e),r="transform"===n?ur:Ii;return this.attrTween(e,"function"==typeof t?(n.local?Vi:Ui)(n,r,Pi(this,"attr."+e,t)):null==t?(n.local?Bi:Fi)(n):(n.local?Wi:zi)(n,r,t))},attrTween:function(e,t){var n="attr."+e;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==t)return this.tween(n,null);if("function"!=typeof t)throw new Error;var r=Me(e);return this.tween(n,(r.local?qi:Gi)(r,t))},style:function(e,t,n){var r="transform"==(e+="")?lr:Ii;return null==t?this.styleTween(e,function(e,t){var n,r,i;return function(){var o=Ge(this,e),a=(this.style.removeProperty(e),Ge(this,e));return o===a?null:o===n&&a===r?i:i=t(n=o,r=a)}}(e,r)).on("end.style."+e,to(e)):"function"==typeof t?this.styleTween(e,function(e,t,n){var r,i,o;return function(){var a=Ge(this,e),s=n(this),l=s+"";return null==s&&(this.style.removeProperty(e),l=s=Ge(this,e)),a===l?null:a===r&&l===i?o:(i=l,o=t(r=a,s))}}(e,r,Pi(this,"style."+e,t))).each(function(e,t){var n,r,i,o,a="style."+t,s="end."+a;return function(){var l=Ai(this,e),u=l.on,c=null==l.value[a]?o||(o=to(t)):void 0;u===n&&i===c||(r=(n=u).copy()).on(s,i=c),l.on=r}}(this._id,e)):this.styleTween(e,function(e,t,n){var r,i,o=n+"";return function(){var a=Ge(this,e);return a===o?null:a===r?i:i=t(r=a,n)}}(e,r,t),n).on("end.style."+e,null)},styleTween:function(e,t,n){var r="style."+(e+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==t)return this.tween(r,null);if("function"!=typeof t)throw new Error;return this.tween(r,no(e,t,null==n?"":n))},text:function(e){return this.tween("text","function"==typeof e?function(e){return function(){var t=e(this);this.textContent=null==t?"":t}}(Pi(this,"text",e)):function(e){return function(){this.textContent=e}}(null==e?"":e+""))},remove:function(){return this.on("end.remove",(e=this._id,function(){var t=this.parentNode;for(var n in this.__transition)if(+n!==e)return;t&&t.removeChild(this)}));var e},tween:function(e,t){var n=this._id;if(e+="",arguments.length<2){for(var r,i=Ni(this.node(),n).tween,o=0,a=i.length;o<a;++o)if((r=i[o]).name===e)return r.value;return null}return this.each((null==t?ji:Hi)(n,e,t))},delay:function(e){var t=this._id;return arguments.length?this.each(("function"==typeof e?Xi:Ki)(t,e)):Ni(this.node(),t).delay},duration:function(e){var t=this._id;return arguments.length?this.each(("function"==typeof e?Ji:$i)(t,e)):Ni(this.node(),t).duration},ease:function(e){var t=this._id;return arguments.length?this.each(Zi(t,e)):Ni(this.node(),t).ease},end:function(){var e,t,n=this,r=n._id,i=n.size();return new Promise((function(o,a){var s={value:a},l={value:function(){0==--i&&o()}};n.each((function(){var n=Ai(this,r),i=n.on;i!==e&&((t=(e=i).copy())._.cancel.push(s),t._.interrupt.push(s),t._.end.push(l)),n.on=t}))}))}};var go=function e(t){function n(e){return Math.pow(e,t)}return t=+t,n.exponent=e,n}(3),yo=function e(t){function n(e){return 1-Math.pow(1-e,t)}return t=+t,n.exponent=e,n}(3),vo=function e(t){function n(e){return((e*=2)<=1?Math.pow(e,t):2-Math.pow(2-e,t))/2}return t=+t,n.exponent=e,n}(3),_o=Math.PI,wo=_o/2;function bo(e){return 1-Math.cos(e*wo)}function Mo(e){return Math.sin(e*wo)}function ko(e){return(1-Math.cos(_o*e))/2}function So(e){return Math.pow(2,10*e-10)}function To(e){return 1-Math.pow(2,-10*e)}function Co(e){return((e*=2)<=1?Math.pow(2,10*e-10):2-Math.pow(2,10-10*e))/2}function xo(e){return 1-Math.sqrt(1-e*e)}function Eo(e){return Math.sqrt(1- --e*e)}function Lo(e){return((e*=2)<=1?1-Math.sqrt(1-e*e):Math.sqrt(1-(e-=2)*e)+1)/2}var Oo=4/11,Do=6/11,Ro=8/11,Ao=.75,No=9/11,Yo=10/11,jo=.9375,Ho=21/22,Po=63/64,Io=1/Oo/Oo;function Fo(e){return 1-Bo(1-e)}function Bo(e){return(e=+e)<Oo?Io*e*e:e<Ro?Io*(e-=Do)*e+Ao:e<Yo?Io*(e-=No)*e+jo:Io*(e-=Ho)*e+Po}function zo(e){return((e*=2)<=1?1-Bo(1-e):Bo(e-1)+1)/2}var Wo=function e(t){function n(e){return e*e*((t+1)*e-t)}return t=+t,n.overshoot=e,n}(1.70158),Uo=function e(t){function n(e){return--e*e*((t+1)*e+t)+1}return t=+t,n.overshoot=e,n}(1.70158),Vo=function e(t){function n(e){return((e*=2)<1?e*e*((t+1)*e-t):(e-=2)*e*((t+1)*e+t)+2)/2}return t=+t,n.overshoot=e,n}(1.70158),qo=2*Math.PI,Go=function e(t,n){var r=Math.asin(1/(t=Math.max(1,t)))*(n/=qo);function i(e){return t*Math.pow(2,10*--e)*Math.sin((r-e)/n)}return i.amplitude=function(t){return e(t,n*qo)},i.period=function(n){return e(t,n)},i}(1,.3),Xo=function e(t,n){var r=Math.asin(1/(t=Math.max(1,t)))*(n/=qo);function i(e){return 1-t*Math.pow(2,-10*(e=+e))*Math.sin((e+r)/n)}return i.amplitude=function(t){return e(t,n*qo)},i.period=function(n){return e(t,n)},i}(1,.3),Ko=function e(t,n){var r=Math.asin(1/(t=Math.max(1,t)))*(n/=qo);function i(e){return((e=2*e-1)<0?t*Math.pow(2,10*e)*Math.sin((r-e)/n):2-t*Math.pow(2,-10*e)*Math.sin((r+e)/n))/2}return i.amplitude=function(t){return e(t,n*qo)},i.period=function(n){return e(t,n)},i}(1,.3),Jo={time:null,delay:0,duration:250,ease:mo};function $o(e,t){for(var n;!(n=e.__transition)||!(n=n[t]);)if(!(e=e.parentNode))return Jo.time=hi(),Jo;return n}Dt.prototype.interrupt=function(e){return this.each((function(){Yi(this,e)}))},Dt.prototype.transition=function(e){var t,n;e instanceof io?(t=e._id,e=e._name):(t=ao(),(n=Jo).time=hi(),e=null==e?null:e+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var a,s=r[o],l=s.length,u=0;u<l;++u)(a=s[u])&&Di(a,e,t,u,s,n||$o(a,t));return new io(r,this._parents,e,t)};var Zo=[null],Qo=function(e,t){var n,r,i=e.__transition;if(i)for(r in t=null==t?null:t+"",i)if((n=i[r]).state>Ti&&n.name===t)return new io([[e]],Zo,t,+r);return null},ea=function(e){return function(){return e}},ta=function(e,t,n){this.target=e,this.type=t,this.selection=n};function na(){vt.stopImmediatePropagation()}var ra=function(){vt.preventDefault(),vt.stopImmediatePropagation()},ia={name:"drag"},oa={name:"space"},aa={name:"handle"},sa={name:"center"};function la(e){return[+e[0],+e[1]]}function ua(e){return[la(e[0]),la(e[1])]}var ca={name:"x",handles:["w","e"].map(va),input:function(e,t){return null==e?null:[[+e[0],t[0][1]],[+e[1],t[1][1]]]},output:function(e){return e&&[e[0][0],e[1][0]]}},da={name:"y",handles:["n","s"].map(va),input:function(e,t){return null==e?null:[[t[0][0],+e[0]],[t[1][0],+e[1]]]},output:function(e){return e&&[e[0][1],e[1][1]]}},ha={name:"xy",handles:["n","w","e","s","nw","ne","sw","se"].map(va),input:function(e){return null==e?null:ua(e)},output:function(e){return e}},fa={overlay:"crosshair",selection:"move",n:"ns-resize",e:"ew-resize",s:"ns-resize",w:"ew-resize",nw:"nwse-resize",ne:"nesw-resize",se:"nwse-resize",sw:"nesw-resize"},pa={e:"w",w:"e",nw:"ne",ne:"nw",se:"sw",sw:"se"},ma={n:"s",s:"n",nw:"sw",ne:"se",se:"ne",sw:"nw"},ga={overlay:1,selection:1,n:null,e:1,s:null,w:-1,nw:-1,ne:1,se:1,sw:-1},ya={overlay:1,selection:1,n:-1,e:null,s:1,w:null,nw:-1,ne:-1,se:1,sw:1};function va(e){return{type:e}}function _a(){return!vt.ctrlKey&&!vt.button}function wa(){var e=this.ownerSVGElement||this;return e.hasAttribute("viewBox")?[[(e=e.viewBox.baseVal).x,e.y],[e.x+e.width,e.y+e.height]]:[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]}function ba(){return navigator.maxTouchPoints||"ontouchstart"in this}function Ma(e){for(;!e.__brush;)if(!(e=e.parentNode))return;return e.__brush}function ka(e){var t=e.__brush;return t?t.dim.output(t.selection):null}function Sa(){return xa(ca)}function Ta(){return xa(da)}var Ca=function(){return xa(ha)};function xa(e){var t,n=wa,r=_a,i=ba,o=!0,a=_e(l,"start","brush","end"),s=6;function l(t){var n=t.property("__brush",m).selectAll(".overlay").data([va("overlay")]);n.enter().append("rect").attr("class","overlay").attr("pointer-events","all").attr("cursor",fa.overlay).merge(n).each((function(){var e=Ma(this).extent;Rt(this).attr("x",e[0][0]).attr("y",e[0][1]).attr("width",e[1][0]-e[0][0]).attr("height",e[1][1]-e[0][1])})),t.selectAll(".selection").data([va("selection")]).enter().append("rect").attr("class","selection").attr("cursor",fa.selection).attr("fill","#777").attr("fill-opacity",.3).attr("stroke","#fff").attr("shape-rendering","crispEdges");var r=t.selectAll(".handle").data(e.handles,(function(e){return e.type}));r.exit().remove(),r.enter().append("rect").attr("class",(function(e){return"handle handle--"+e.type})).attr("cursor",(function(e){return fa[e.type]})),t.each(u).attr("fill","none").attr("pointer-events","all").on("mousedown.brush",h).filter(i).on("touchstart.brush",h).on("touchmove.brush",f).on("touchend.brush touchcancel.brush",p).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function u(){var e=Rt(this),t=Ma(this).selection;t?(e.selectAll(".selection").style("display",null).attr("x",t[0][0]).attr("y",t[0][1]).attr("width",t[1][0]-t[0][0]).attr("height",t[1][1]-t[0][1]),e.selectAll(".handle").style("display",null).attr("x",(function(e){return"e"===e.type[e.type.length-1]?t[1][0]-s/2:t[0][0]-s/2})).attr("y",(function(e){return"s"===e.type[0]?t[1][1]-s/2:t[0][1]-s/2})).attr("width",(function(e){return"n"===e.type||"s"===e.type?t[1][0]-t[0][0]+s:s})).attr("height",(function(e){return"e"===e.type||"w"===e.type?t[1][1]-t[0][1]+s:s}))):e.selectAll(".selection,.handle").style("display","none").attr("x",null).attr("y",null).attr("width",null).attr("height",null)}function c(e,t,n){return!n&&e.__brush.emitter||new d(e,t)}function d(e,t){this.that=e,this.args=t,this.state=e.__brush,this.active=0}function h(){if((!t||vt.touches)&&r.apply(this,arguments)){var n,i,a,s,l,d,h,f,p,m,g,y,v=this,_=vt.target.__data__.type,w="selection"===(o&&vt.metaKey?_="overlay":_)?ia:o&&vt.altKey?sa:aa,b=e===da?null:ga[_],M=e===ca?null:ya[_],k=Ma(v),S=k.extent,T=k.selection,C=S[0][0],x=S[0][1],E=S[1][0],L=S[1][1],O=0,D=0,R=b&&M&&o&&vt.shiftKey,A=vt.touches?(y=vt.changedTouches[0].identifier,function(e){return Bt(e,vt.touches,y)}):It,N=A(v),Y=N,j=c(v,arguments,!0).beforestart();"overlay"===_?(T&&(p=!0),k.selection=T=[[n=e===da?C:N[0],a=e===ca?x:N[1]],[l=e===da?E:n,h=e===ca?L:a]]):(n=T[0][0],a=T[0][1],l=T[1][0],h=T[1][1]),i=n,s=a,d=l,f=h;var H=Rt(v).attr("pointer-events","none"),P=H.selectAll(".overlay").attr("cursor",fa[_]);if(vt.touches)j.moved=F,j.ended=z;else{var I=Rt(vt.view).on("mousemove.brush",F,!0).on("mouseup.brush",z,!0);o&&I.on("keydown.brush",(function(){switch(vt.keyCode){case 16:R=b&&M;break;case 18:w===aa&&(b&&(l=d-O*b,n=i+O*b),M&&(h=f-D*M,a=s+D*M),w=sa,B());break;case 32:w!==aa&&w!==sa||(b<0?l=d-O:b>0&&(n=i-O),M<0?h=f-D:M>0&&(a=s-D),w=oa,P.attr("cursor",fa.selection),B());break;default:return}ra()}),!0).on("keyup.brush",(function(){switch(vt.keyCode){case 16:R&&(m=g=R=!1,B());break;case 18:w===sa&&(b<0?l=d:b>0&&(n=i),M<0?h=f:M>0&&(a=s),w=aa,B());break;case 32:w===oa&&(vt.altKey?(b&&(l=d-O*b,n=i+O*b),M&&(h=f-D*M,a=s+D*M),w=sa):(b<0?l=d:b>0&&(n=i),M<0?h=f:M>0&&(a=s),w=aa),P.attr("cursor",fa[_]),B());break;default:return}ra()}),!0),Vt(vt.view)}na(),Yi(v),u.call(v),j.start()}function F(){var e=A(v);!R||m||g||(Math.abs(e[0]-Y[0])>Math.abs(e[1]-Y[1])?g=!0:m=!0),Y=e,p=!0,ra(),B()}function B(){var e;switch(O=Y[0]-N[0],D=Y[1]-N[1],w){case oa:case ia:b&&(O=Math.max(C-n,Math.min(E-l,O)),i=n+O,d=l+O),M&&(D=Math.max(x-a,Math.min(L-h,D)),s=a+D,f=h+D);break;case aa:b<0?(O=Math.max(C-n,Math.min(E-n,O)),i=n+O,d=l):b>0&&(O=Math.max(C-l,Math.min(E-l,O)),i=n,d=l+O),M<0?(D=Math.max(x-a,Math.min(L-a,D)),s=a+D,f=h):M>0&&(D=Math.max(x-h,Math.min(L-h,D)),s=a,f=h+D);break;case sa:b&&(i=Math.max(C,Math.min(E,n-O*b)),d=Math.max(C,Math.min(E,l+O*b))),M&&(s=Math.max(x,Math.min(L,a-D*M)),f=Math.max(x,Math.min(L,h+D*M)))}d<i&&(b*=-1,e=n,n=l,l=e,e=i,i=d,d=e,_ in pa&&P.attr("cursor",fa[_=pa[_]])),f<s&&(M*=-1,e=a,a=h,h=e,e=s,s=f,f=e,_ in ma&&P.attr("cursor",fa[_=ma[_]])),k.selection&&(T=k.selection),m&&(i=T[0][0],d=T[1][0]),g&&(s=T[0][1],f=T[1][1]),T[0][0]===i&&T[0][1]===s&&T[1][0]===d&&T[1][1]===f||(k.selection=[[i,s],[d,f]],u.call(v),j.brush())}function z(){if(na(),vt.touches){if(vt.touches.length)return;t&&clearTimeout(t),t=setTimeout((function(){t=null}),500)}else qt(vt.view,p),I.on("keydown.brush keyup.brush mousemove.brush mouseup.brush",null);H.attr("pointer-events","all"),P.attr("cursor",fa.overlay),k.selection&&(T=k.selection),function(e){return e[0][0]===e[1][0]||e[0][1]===e[1][1]}(T)&&(k.selection=null,u.call(v)),j.end()}}function f(){c(this,arguments).moved()}function p(){c(this,arguments).ended()}function m(){var t=this.__brush||{selection:null};return t.extent=ua(n.apply(this,arguments)),t.dim=e,t}return l.move=function(t,n){t.selection?t.on("start.brush",(function(){c(this,arguments).beforestart().start()})).on("interrupt.brush end.brush",(function(){c(this,arguments).end()})).tween("brush",(function(){var t=this,r=t.__brush,i=c(t,arguments),o=r.selection,a=e.input("function"==typeof n?n.apply(this,arguments):n,r.extent),s=er(o,a);function l(e){r.selection=1===e&&null===a?null:s(e),u.call(t),i.brush()}return null!==o&&null!==a?l:l(1)})):t.each((function(){var t=this,r=arguments,i=t.__brush,o=e.input("function"==typeof n?n.apply(t,r):n,i.extent),a=c(t,r).beforestart();Yi(t),i.selection=null===o?null:o,u.call(t),a.start().brush().end()}))},l.clear=function(e){l.move(e,null)},d.prototype={beforestart:function(){return 1==++this.active&&(this.state.emitter=this,this.starting=!0),this},start:function(){return this.starting?(this.starting=!1,this.emit("start")):this.emit("brush"),this},brush:function(){return this.emit("brush"),this},end:function(){return 0==--this.active&&(delete this.state.emitter,this.emit("end")),this},emit:function(t){St(new ta(l,t,e.output(this.state.selection)),a.apply,a,[t,this.that,this.args])}},l.extent=function(e){return arguments.length?(n="function"==typeof e?e:ea(ua(e)),l):n},l.filter=function(e){return arguments.length?(r="function"==typeof e?e:ea(!!e),l):r},l.handleSize=function(e){return arguments.length?(s=+e,l):s},l.keyModifiers=function(e){return arguments.length?(o=!!e,l):o},l.on=function(){var e=a.on.apply(a,arguments);return e===a?l:e},l}var Ea=Math.cos,La=Math.sin,Oa=Math.PI,Da=Oa/2,Ra=2*Oa,Aa=Math.max;function Na(e){return function(t,n){return e(t.source.value+t.target.value,n.source.value+n.target.value)}}var Ya=function(){var e=0,t=null,n=null,r=null;function i(i){var o,a,s,l,u,c,d=i.length,h=[],f=C(d),p=[],m=[],g=m.groups=new Array(d),y=new Array(d*d);for(o=0,u=-1;++u<d;){for(a=0,c=-1;++c<d;)a+=i[u][c];h.push(a),p.push(C(d)),o+=a}for(t&&f.sort((function(e,n){return t(h[e],h[n])})),n&&p.forEach((function(e,t){e.sort((function(e,r){return n(i[t][e],i[t][r])}))})),l=(o=Aa(0,Ra-e*d)/o)?e:Ra/d,a=0,u=-1;++u<d;){for(s=a,c=-1;++c<d;){var v=f[u],_=p[v][c],w=i[v][_],b=a,M=a+=w*o;y[_*d+v]={index:v,subindex:_,startAngle:b,endAngle:M,value:w}}g[v]={index:v,startAngle:s,endAngle:a,value:h[v]},a+=l}for(u=-1;++u<d;)for(c=u-1;++c<d;){var k=y[c*d+u],S=y[u*d+c];(k.value||S.value)&&m.push(k.value<S.value?{source:S,target:k}:{source:k,target:S})}return r?m.sort(r):m}return i.padAngle=function(t){return arguments.length?(e=Aa(0,t),i):e},i.sortGroups=function(e){return arguments.length?(t=e,i):t},i.sortSubgroups=function(e){return arguments.length?(n=e,i):n},i.sortChords=function(e){return arguments.length?(null==e?r=null:(r=Na(e))._=e,i):r&&r._},i},ja=Array.prototype.slice,Ha=function(e){return function(){return e}},Pa=Math.PI,Ia=2*Pa,Fa=Ia-1e-6;function Ba(){this._x0=this._y0=this._x1=this._y1=null,this._=""}function za(){return new Ba}Ba.prototype=za.prototype={constructor:Ba,moveTo:function(e,t){this._+="M"+(this._x0=this._x1=+e)+","+(this._y0=this._y1=+t)},closePath:function(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._+="Z")},lineTo:function(e,t){this._+="L"+(this._x1=+e)+","+(this._y1=+t)},quadraticCurveTo:function(e,t,n,r){this._+="Q"+ +e+","+ +t+","+(this._x1=+n)+","+(this._y1=+r)},bezierCurveTo:function(e,t,n,r,i,o){this._+="C"+ +e+","+ +t+","+ +n+","+ +r+","+(this._x1=+i)+","+(this._y1=+o)},arcTo:function(e,t,n,r,i){e=+e,t=+t,n=+n,r=+r,i=+i;var o=this._x1,a=this._y1,s=n-e,l=r-t,u=o-e,c=a-t,d=u*u+c*c;if(i<0)throw new Error("negative radius: "+i);if(null===this._x1)this._+="M"+(this._x1=e)+","+(this._y1=t);else if(d>1e-6)if(Math.abs(c*s-l*u)>1e-6&&i){var h=n-o,f=r-a,p=s*s+l*l,m=h*h+f*f,g=Math.sqrt(p),y=Math.sqrt(d),v=i*Math.tan((Pa-Math.acos((p+d-m)/(2*g*y)))/2),_=v/y,w=v/g;Math.abs(_-1)>1e-6&&(this._+="L"+(e+_*u)+","+(t+_*c)),this._+="A"+i+","+i+",0,0,"+ +(c*h>u*f)+","+(this._x1=e+w*s)+","+(this._y1=t+w*l)}else this._+="L"+(this._x1=e)+","+(this._y1=t);else;},arc:function(e,t,n,r,i,o){e=+e,t=+t,o=!!o;var a=(n=+n)*Math.cos(r),s=n*Math.sin(r),l=e+a,u=t+s,c=1^o,d=o?r-i:i-r;if(n<0)throw new Error("negative radius: "+n);null===this._x1?this._+="M"+l+","+u:(Math.abs(this._x1-l)>1e-6||Math.abs(this._y1-u)>1e-6)&&(this._+="L"+l+","+u),n&&(d<0&&(d=d%Ia+Ia),d>Fa?this._+="A"+n+","+n+",0,1,"+c+","+(e-a)+","+(t-s)+"A"+n+","+n+",0,1,"+c+","+(this._x1=l)+","+(this._y1=u):d>1e-6&&(this._+="A"+n+","+n+",0,"+ +(d>=Pa)+","+c+","+(this._x1=e+n*Math.cos(i))+","+(this._y1=t+n*Math.sin(i))))},rect:function(e,t,n,r){this._+="M"+(this._x0=this._x1=+e)+","+(this._y0=this._y1=+t)+"h"+ +n+"v"+ +r+"h"+-n+"Z"},toString:function(){return this._}};var Wa=za;function Ua(e){return e.source}function Va(e){return e.target}function qa(e){return e.radius}function Ga(e){return e.startAngle}function Xa(e){return e.endAngle}var Ka=function(){var e=Ua,t=Va,n=qa,r=Ga,i=Xa,o=null;function a(){var a,s=ja.call(arguments),l=e.apply(this,s),u=t.apply(this,s),c=+n.apply(this,(s[0]=l,s)),d=r.apply(this,s)-Da,h=i.apply(this,s)-Da,f=c*Ea(d),p=c*La(d),m=+n.apply(this,(s[0]=u,s)),g=r.apply(this,s)-Da,y=i.apply(this,s)-Da;if(o||(o=a=Wa()),o.moveTo(f,p),o.arc(0,0,c,d,h),d===g&&h===y||(o.quadraticCurveTo(0,0,m*Ea(g),m*La(g)),o.arc(0,0,m,g,y)),o.quadraticCurveTo(0,0,f,p),o.closePath(),a)return o=null,a+""||null}return a.radius=function(e){return arguments.length?(n="function"==typeof e?e:Ha(+e),a):n},a.startAngle=function(e){return arguments.length?(r="function"==typeof e?e:Ha(+e),a):r},a.endAngle=function(e){return arguments.length?(i="function"==typeof e?e:Ha(+e),a):i},a.source=function(t){return arguments.length?(e=t,a):e},a.target=function(e){return arguments.length?(t=e,a):t},a.context=function(e){return arguments.length?(o=null==e?null:e,a):o},a};function Ja(){}function $a(e,t){var n=new Ja;if(e instanceof Ja)e.each((function(e,t){n.set(t,e)}));else if(Array.isArray(e)){var r,i=-1,o=e.length;if(null==t)for(;++i<o;)n.set(i,e[i]);else for(;++i<o;)n.set(t(r=e[i],i,e),r)}else if(e)for(var a in e)n.set(a,e[a]);return n}Ja.prototype=$a.prototype={constructor:Ja,has:function(e){return"$"+e in this},get:function(e){return this["$"+e]},set:function(e,t){return this["$"+e]=t,this},remove:function(e){var t="$"+e;return t in this&&delete this[t]},clear:function(){for(var e in this)"$"===e[0]&&delete this[e]},keys:function(){var e=[];for(var t in this)"$"===t[0]&&e.push(t.slice(1));return e},values:function(){var e=[];for(var t in this)"$"===t[0]&&e.push(this[t]);return e},entries:function(){var e=[];for(var t in this)"$"===t[0]&&e.push({key:t.slice(1),value:this[t]});return e},size:function(){var e=0;for(var t in this)"$"===t[0]&&++e;return e},empty:function(){for(var e in this)if("$"===e[0])return!1;return!0},each:function(e){for(var t in this)"$"===t[0]&&e(this[t],t.slice(1),this)}};var Za=$a,Qa=function(){var e,t,n,r=[],i=[];function o(n,i,a,s){if(i>=r.length)return null!=e&&n.sort(e),null!=t?t(n):n;for(var l,u,c,d=-1,h=n.length,f=r[i++],p=Za(),m=a();++d<h;)(c=p.get(l=f(u=n[d])+""))?c.push(u):p.set(l,[u]);return p.each((function(e,t){s(m,t,o(e,i,a,s))})),m}return n={object:function(e){return o(e,0,es,ts)},map:function(e){return o(e,0,ns,rs)},entries:function(e){return function e(n,o){if(++o>r.length)return n;var a,s=i[o-1];return null!=t&&o>=r.length?a=n.entries():(a=[],n.each((function(t,n){a.push({key:n,values:e(t,o)})}))),null!=s?a.sort((function(e,t){return s(e.key,t.key)})):a}(o(e,0,ns,rs),0)},key:function(e){return r.push(e),n},sortKeys:function(e){return i[r.length-1]=e,n},sortValues:function(t){return e=t,n},rollup:function(e){return t=e,n}}};function es(){return{}}function ts(e,t,n){e[t]=n}function ns(){return Za()}function rs(e,t,n){e.set(t,n)}function is(){}var os=Za.prototype;function as(e,t){var n=new is;if(e instanceof is)e.each((function(e){n.add(e)}));else if(e){var r=-1,i=e.length;if(null==t)for(;++r<i;)n.add(e[r]);else for(;++r<i;)n.add(t(e[r],r,e))}return n}is.prototype=as.prototype={constructor:is,has:os.has,add:function(e){return this["$"+(e+="")]=e,this},remove:os.remove,clear:os.clear,values:os.keys,size:os.size,empty:os.empty,each:os.each};var ss=as,ls=function(e){var t=[];for(var n in e)t.push(n);return t},us=function(e){var t=[];for(var n in e)t.push(e[n]);return t},cs=function(e){var t=[];for(var n in e)t.push({key:n,value:e[n]});return t},ds=Array.prototype.slice,hs=function(e,t){return e-t},fs=function(e){for(var t=0,n=e.length,r=e[n-1][1]*e[0][0]-e[n-1][0]*e[0][1];++t<n;)r+=e[t-1][1]*e[t][0]-e[t-1][0]*e[t][1];return r},ps=function(e){return function(){return e}},ms=function(e,t){for(var n,r=-1,i=t.length;++r<i;)if(n=gs(e,t[r]))return n;return 0};function gs(e,t){for(var n=t[0],r=t[1],i=-1,o=0,a=e.length,s=a-1;o<a;s=o++){var l=e[o],u=l[0],c=l[1],d=e[s],h=d[0],f=d[1];if(ys(l,d,t))return 0;c>r!=f>r&&n<(h-u)*(r-c)/(f-c)+u&&(i=-i)}return i}function ys(e,t,n){var r,i,o,a;return function(e,t,n){return(t[0]-e[0])*(n[1]-e[1])==(n[0]-e[0])*(t[1]-e[1])}(e,t,n)&&(i=e[r=+(e[0]===t[0])],o=n[r],a=t[r],i<=o&&o<=a||a<=o&&o<=i)}var vs=function(){},_s=[[],[[[1,1.5],[.5,1]]],[[[1.5,1],[1,1.5]]],[[[1.5,1],[.5,1]]],[[[1,.5],[1.5,1]]],[[[1,1.5],[.5,1]],[[1,.5],[1.5,1]]],[[[1,.5],[1,1.5]]],[[[1,.5],[.5,1]]],[[[.5,1],[1,.5]]],[[[1,1.5],[1,.5]]],[[[.5,1],[1,.5]],[[1.5,1],[1,1.5]]],[[[1.5,1],[1,.5]]],[[[.5,1],[1.5,1]]],[[[1,1.5],[1.5,1]]],[[[.5,1],[1,1.5]]],[]],ws=function(){var e=1,t=1,n=A,r=s;function i(e){var t=n(e);if(Array.isArray(t))t=t.slice().sort(hs);else{var r=w(e),i=r[0],a=r[1];t=R(i,a,t),t=C(Math.floor(i/t)*t,Math.floor(a/t)*t,t)}return t.map((function(t){return o(e,t)}))}function o(n,i){var o=[],s=[];return function(n,r,i){var o,s,l,u,c,d,h=new Array,f=new Array;o=s=-1,u=n[0]>=r,_s[u<<1].forEach(p);for(;++o<e-1;)l=u,u=n[o+1]>=r,_s[l|u<<1].forEach(p);_s[u<<0].forEach(p);for(;++s<t-1;){for(o=-1,u=n[s*e+e]>=r,c=n[s*e]>=r,_s[u<<1|c<<2].forEach(p);++o<e-1;)l=u,u=n[s*e+e+o+1]>=r,d=c,c=n[s*e+o+1]>=r,_s[l|u<<1|c<<2|d<<3].forEach(p);_s[u|c<<3].forEach(p)}o=-1,c=n[s*e]>=r,_s[c<<2].forEach(p);for(;++o<e-1;)d=c,c=n[s*e+o+1]>=r,_s[c<<2|d<<3].forEach(p);function p(e){var t,n,r=[e[0][0]+o,e[0][1]+s],l=[e[1][0]+o,e[1][1]+s],u=a(r),c=a(l);(t=f[u])?(n=h[c])?(delete f[t.end],delete h[n.start],t===n?(t.ring.push(l),i(t.ring)):h[t.start]=f[n.end]={start:t.start,end:n.end,ring:t.ring.concat(n.ring)}):(delete f[t.end],t.ring.push(l),f[t.end=c]=t):(t=h[c])?(n=f[u])?(delete h[t.start],delete f[n.end],t===n?(t.ring.push(l),i(t.ring)):h[n.start]=f[t.end]={start:n.start,end:t.end,ring:n.ring.concat(t.ring)}):(delete h[t.start],t.ring.unshift(r),h[t.start=u]=t):h[u]=f[c]={start:u,end:c,ring:[r,l]}}_s[c<<3].forEach(p)}(n,i,(function(e){r(e,n,i),fs(e)>0?o.push([e]):s.push(e)})),s.forEach((function(e){for(var t,n=0,r=o.length;n<r;++n)if(-1!==ms((t=o[n])[0],e))return void t.push(e)})),{type:"MultiPolygon",value:i,coordinates:o}}function a(t){return 2*t[0]+t[1]*(e+1)*4}function s(n,r,i){n.forEach((function(n){var o,a=n[0],s=n[1],l=0|a,u=0|s,c=r[u*e+l];a>0&&a<e&&l===a&&(o=r[u*e+l-1],n[0]=a+(i-o)/(c-o)-.5),s>0&&s<t&&u===s&&(o=r[(u-1)*e+l],n[1]=s+(i-o)/(c-o)-.5)}))}return i.contour=o,i.size=function(n){if(!arguments.length)return[e,t];var r=Math.ceil(n[0]),o=Math.ceil(n[1]);if(!(r>0&&o>0))throw new Error("invalid size");return e=r,t=o,i},i.thresholds=function(e){return arguments.length?(n="function"==typeof e?e:Array.isArray(e)?ps(ds.call(e)):ps(e),i):n},i.smooth=function(e){return arguments.length?(r=e?s:vs,i):r===s},i};function bs(e,t,n){for(var r=e.width,i=e.height,o=1+(n<<1),a=0;a<i;++a)for(var s=0,l=0;s<r+n;++s)s<r&&(l+=e.data[s+a*r]),s>=n&&(s>=o&&(l-=e.data[s-o+a*r]),t.data[s-n+a*r]=l/Math.min(s+1,r-1+o-s,o))}function Ms(e,t,n){for(var r=e.width,i=e.height,o=1+(n<<1),a=0;a<r;++a)for(var s=0,l=0;s<i+n;++s)s<i&&(l+=e.data[a+s*r]),s>=n&&(s>=o&&(l-=e.data[a+(s-o)*r]),t.data[a+(s-n)*r]=l/Math.min(s+1,i-1+o-s,o))}function ks(e){return e[0]}function Ss(e){return e[1]}function Ts(){return 1}var Cs=function(){var e=ks,t=Ss,n=Ts,r=960,i=500,o=20,a=2,s=3*o,l=r+2*s>>a,u=i+2*s>>a,c=ps(20);function d(r){var i=new Float32Array(l*u),d=new Float32Array(l*u);r.forEach((function(r,o,c){var d=+e(r,o,c)+s>>a,h=+t(r,o,c)+s>>a,f=+n(r,o,c);d>=0&&d<l&&h>=0&&h<u&&(i[d+h*l]+=f)})),bs({width:l,height:u,data:i},{width:l,height:u,data:d},o>>a),Ms({width:l,height:u,data:d},{width:l,height:u,data:i},o>>a),bs({width:l,height:u,data:i},{width:l,height:u,data:d},o>>a),Ms({width:l,height:u,data:d},{width:l,height:u,data:i},o>>a),bs({width:l,height:u,data:i},{width:l,height:u,data:d},o>>a),Ms({width:l,height:u,data:d},{width:l,height:u,data:i},o>>a);var f=c(i);if(!Array.isArray(f)){var p=P(i);f=R(0,p,f),(f=C(0,Math.floor(p/f)*f,f)).shift()}return ws().thresholds(f).size([l,u])(i).map(h)}function h(e){return e.value*=Math.pow(2,-2*a),e.coordinates.forEach(f),e}function f(e){e.forEach(p)}function p(e){e.forEach(m)}function m(e){e[0]=e[0]*Math.pow(2,a)-s,e[1]=e[1]*Math.pow(2,a)-s}function g(){return l=r+2*(s=3*o)>>a,u=i+2*s>>a,d}return d.x=function(t){return arguments.length?(e="function"==typeof t?t:ps(+t),d):e},d.y=function(e){return arguments.length?(t="function"==typeof e?e:ps(+e),d):t},d.weight=function(e){return arguments.length?(n="function"==typeof e?e:ps(+e),d):n},d.size=function(e){if(!arguments.length)return[r,i];var t=Math.ceil(e[0]),n=Math.ceil(e[1]);if(!(t>=0||t>=0))throw new Error("invalid size");return r=t,i=n,g()},d.cellSize=function(e){if(!arguments.length)return 1<<a;if(!((e=+e)>=1))throw new Error("invalid cell size");return a=Math.floor(Math.log(e)/Math.LN2),g()},d.thresholds=function(e){return arguments.length?(c="function"==typeof e?e:Array.isArray(e)?ps(ds.call(e)):ps(e),d):c},d.bandwidth=function(e){if(!arguments.length)return Math.sqrt(o*(o+1));if(!((e=+e)>=0))throw new Error("invalid bandwidth");return o=Math.round((Math.sqrt(4*e*e+1)-1)/2),g()},d},xs={},Es={},Ls=34,Os=10,Ds=13;function Rs(e){return new Function("d","return {"+e.map((function(e,t){return JSON.stringify(e)+": d["+t+"]"})).join(",")+"}")}function As(e){var t=Object.create(null),n=[];return e.forEach((function(e){for(var r in e)r in t||n.push(t[r]=r)})),n}function Ns(e,t){var n=e+"",r=n.length;return r<t?new Array(t-r+1).join(0)+n:n}function Ys(e){var t,n=e.getUTCHours(),r=e.getUTCMinutes(),i=e.getUTCSeconds(),o=e.getUTCMilliseconds();return isNaN(e)?"Invalid Date":((t=e.getUTCFullYear())<0?"-"+Ns(-t,6):t>9999?"+"+Ns(t,6):Ns(t,4))+"-"+Ns(e.getUTCMonth()+1,2)+"-"+Ns(e.getUTCDate(),2)+(o?"T"+Ns(n,2)+":"+Ns(r,2)+":"+Ns(i,2)+"."+Ns(o,3)+"Z":i?"T"+Ns(n,2)+":"+Ns(r,2)+":"+Ns(i,2)+"Z":r||n?"T"+Ns(n,2)+":"+Ns(r,2)+"Z":"")}var js=function(e){var t=new RegExp('["'+e+"\n\r]"),n=e.charCodeAt(0);function r(e,t){var r,i=[],o=e.length,a=0,s=0,l=o<=0,u=!1;function c(){if(l)return Es;if(u)return u=!1,xs;var t,r,i=a;if(e.charCodeAt(i)===Ls){for(;a++<o&&e.charCodeAt(a)!==Ls||e.charCodeAt(++a)===Ls;);return(t=a)>=o?l=!0:(r=e.charCodeAt(a++))===Os?u=!0:r===Ds&&(u=!0,e.charCodeAt(a)===Os&&++a),e.slice(i+1,t-1).replace(/""/g,'"')}for(;a<o;){if((r=e.charCodeAt(t=a++))===Os)u=!0;else if(r===Ds)u=!0,e.charCodeAt(a)===Os&&++a;else if(r!==n)continue;return e.slice(i,t)}return l=!0,e.slice(i,o)}for(e.charCodeAt(o-1)===Os&&--o,e.charCodeAt(o-1)===Ds&&--o;(r=c())!==Es;){for(var d=[];r!==xs&&r!==Es;)d.push(r),r=c();t&&null==(d=t(d,s++))||i.push(d)}return i}function i(t,n){return t.map((function(t){return n.map((function(e){return a(t[e])})).join(e)}))}function o(t){return t.map(a).join(e)}function a(e){return null==e?"":e instanceof Date?Ys(e):t.test(e+="")?'"'+e.replace(/"/g,'""')+'"':e}return{parse:function(e,t){var n,i,o=r(e,(function(e,r){if(n)return n(e,r-1);i=e,n=t?function(e,t){var n=Rs(e);return function(r,i){return t(n(r),i,e)}}(e,t):Rs(e)}));return o.columns=i||[],o},parseRows:r,format:function(t,n){return null==n&&(n=As(t)),[n.map(a).join(e)].concat(i(t,n)).join("\n")},formatBody:function(e,t){return null==t&&(t=As(e)),i(e,t).join("\n")},formatRows:function(e){return e.map(o).join("\n")}}},Hs=js(","),Ps=Hs.parse,Is=Hs.parseRows,Fs=Hs.format,Bs=Hs.formatBody,zs=Hs.formatRows,Ws=js("\t"),Us=Ws.parse,Vs=Ws.parseRows,qs=Ws.format,Gs=Ws.formatBody,Xs=Ws.formatRows;function Ks(e){for(var t in e){var n,r=e[t].trim();if(r)if("true"===r)r=!0;else if("false"===r)r=!1;else if("NaN"===r)r=NaN;else if(isNaN(n=+r)){if(!/^([-+]\d{2})?\d{4}(-\d{2}(-\d{2})?)?(T\d{2}:\d{2}(:\d{2}(\.\d{3})?)?(Z|[-+]\d{2}:\d{2})?)?$/.test(r))continue;r=new Date(r)}else r=n;else r=null;e[t]=r}return e}function Js(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.blob()}var $s=function(e,t){return fetch(e,t).then(Js)};function Zs(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.arrayBuffer()}var Qs=function(e,t){return fetch(e,t).then(Zs)};function el(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.text()}var tl=function(e,t){return fetch(e,t).then(el)};function nl(e){return function(t,n,r){return 2===arguments.length&&"function"==typeof n&&(r=n,n=void 0),tl(t,n).then((function(t){return e(t,r)}))}}function rl(e,t,n,r){3===arguments.length&&"function"==typeof n&&(r=n,n=void 0);var i=js(e);return tl(t,n).then((function(e){return i.parse(e,r)}))}var il=nl(Ps),ol=nl(Us),al=function(e,t){return new Promise((function(n,r){var i=new Image;for(var o in t)i[o]=t[o];i.onerror=r,i.onload=function(){n(i)},i.src=e}))};function sl(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.json()}var ll=function(e,t){return fetch(e,t).then(sl)};function ul(e){return function(t,n){return tl(t,n).then((function(t){return(new DOMParser).parseFromString(t,e)}))}}var cl=ul("application/xml"),dl=ul("text/html"),hl=ul("image/svg+xml"),fl=function(e,t){var n;function r(){var r,i,o=n.length,a=0,s=0;for(r=0;r<o;++r)a+=(i=n[r]).x,s+=i.y;for(a=a/o-e,s=s/o-t,r=0;r<o;++r)(i=n[r]).x-=a,i.y-=s}return null==e&&(e=0),null==t&&(t=0),r.initialize=function(e){n=e},r.x=function(t){return arguments.length?(e=+t,r):e},r.y=function(e){return arguments.length?(t=+e,r):t},r},pl=function(e){return function(){return e}},ml=function(){return 1e-6*(Math.random()-.5)};function gl(e,t,n,r){if(isNaN(t)||isNaN(n))return e;var i,o,a,s,l,u,c,d,h,f=e._root,p={data:r},m=e._x0,g=e._y0,y=e._x1,v=e._y1;if(!f)return e._root=p,e;for(;f.length;)if((u=t>=(o=(m+y)/2))?m=o:y=o,(c=n>=(a=(g+v)/2))?g=a:v=a,i=f,!(f=f[d=c<<1|u]))return i[d]=p,e;if(s=+e._x.call(null,f.data),l=+e._y.call(null,f.data),t===s&&n===l)return p.next=f,i?i[d]=p:e._root=p,e;do{i=i?i[d]=new Array(4):e._root=new Array(4),(u=t>=(o=(m+y)/2))?m=o:y=o,(c=n>=(a=(g+v)/2))?g=a:v=a}while((d=c<<1|u)==(h=(l>=a)<<1|s>=o));return i[h]=f,i[d]=p,e}var yl=function(e,t,n,r,i){this.node=e,this.x0=t,this.y0=n,this.x1=r,this.y1=i};function vl(e){return e[0]}function _l(e){return e[1]}function wl(e,t,n){var r=new bl(null==t?vl:t,null==n?_l:n,NaN,NaN,NaN,NaN);return null==e?r:r.addAll(e)}function bl(e,t,n,r,i,o){this._x=e,this._y=t,this._x0=n,this._y0=r,this._x1=i,this._y1=o,this._root=void 0}function Ml(e){for(var t={data:e.data},n=t;e=e.next;)n=n.next={data:e.data};return t}var kl=wl.prototype=bl.prototype;function Sl(e){return e.x+e.vx}function Tl(e){return e.y+e.vy}kl.copy=function(){var e,t,n=new bl(this._x,this._y,this._x0,this._y0,this._x1,this._y1),r=this._root;if(!r)return n;if(!r.length)return n._root=Ml(r),n;for(e=[{source:r,target:n._root=new Array(4)}];r=e.pop();)for(var i=0;i<4;++i)(t=r.source[i])&&(t.length?e.push({source:t,target:r.target[i]=new Array(4)}):r.target[i]=Ml(t));return n},kl.add=function(e){var t=+this._x.call(null,e),n=+this._y.call(null,e);return gl(this.cover(t,n),t,n,e)},kl.addAll=function(e){var t,n,r,i,o=e.length,a=new Array(o),s=new Array(o),l=1/0,u=1/0,c=-1/0,d=-1/0;for(n=0;n<o;++n)isNaN(r=+this._x.call(null,t=e[n]))||isNaN(i=+this._y.call(null,t))||(a[n]=r,s[n]=i,r<l&&(l=r),r>c&&(c=r),i<u&&(u=i),i>d&&(d=i));if(l>c||u>d)return this;for(this.cover(l,u).cover(c,d),n=0;n<o;++n)gl(this,a[n],s[n],e[n]);return this},kl.cover=function(e,t){if(isNaN(e=+e)||isNaN(t=+t))return this;var n=this._x0,r=this._y0,i=this._x1,o=this._y1;if(isNaN(n))i=(n=Math.floor(e))+1,o=(r=Math.floor(t))+1;else{for(var a,s,l=i-n,u=this._root;n>e||e>=i||r>t||t>=o;)switch(s=(t<r)<<1|e<n,(a=new Array(4))[s]=u,u=a,l*=2,s){case 0:i=n+l,o=r+l;break;case 1:n=i-l,o=r+l;break;case 2:i=n+l,r=o-l;break;case 3:n=i-l,r=o-l}this._root&&this._root.length&&(this._root=u)}return this._x0=n,this._y0=r,this._x1=i,this._y1=o,this},kl.data=function(){var e=[];return this.visit((function(t){if(!t.length)do{e.push(t.data)}while(t=t.next)})),e},kl.extent=function(e){return arguments.length?this.cover(+e[0][0],+e[0][1]).cover(+e[1][0],+e[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]},kl.find=function(e,t,n){var r,i,o,a,s,l,u,c=this._x0,d=this._y0,h=this._x1,f=this._y1,p=[],m=this._root;for(m&&p.push(new yl(m,c,d,h,f)),null==n?n=1/0:(c=e-n,d=t-n,h=e+n,f=t+n,n*=n);l=p.pop();)if(!(!(m=l.node)||(i=l.x0)>h||(o=l.y0)>f||(a=l.x1)<c||(s=l.y1)<d))if(m.length){var g=(i+a)/2,y=(o+s)/2;p.push(new yl(m[3],g,y,a,s),new yl(m[2],i,y,g,s),new yl(m[1],g,o,a,y),new yl(m[0],i,o,g,y)),(u=(t>=y)<<1|e>=g)&&(l=p[p.length-1],p[p.length-1]=p[p.length-1-u],p[p.length-1-u]=l)}else{var v=e-+this._x.call(null,m.data),_=t-+this._y.call(null,m.data),w=v*v+_*_;if(w<n){var b=Math.sqrt(n=w);c=e-b,d=t-b,h=e+b,f=t+b,r=m.data}}return r},kl.remove=function(e){if(isNaN(o=+this._x.call(null,e))||isNaN(a=+this._y.call(null,e)))return this;var t,n,r,i,o,a,s,l,u,c,d,h,f=this._root,p=this._x0,m=this._y0,g=this._x1,y=this._y1;if(!f)return this;if(f.length)for(;;){if((u=o>=(s=(p+g)/2))?p=s:g=s,(c=a>=(l=(m+y)/2))?m=l:y=l,t=f,!(f=f[d=c<<1|u]))return this;if(!f.length)break;(t[d+1&3]||t[d+2&3]||t[d+3&3])&&(n=t,h=d)}for(;f.data!==e;)if(r=f,!(f=f.next))return this;return(i=f.next)&&delete f.next,r?(i?r.next=i:delete r.next,this):t?(i?t[d]=i:delete t[d],(f=t[0]||t[1]||t[2]||t[3])&&f===(t[3]||t[2]||t[1]||t[0])&&!f.length&&(n?n[h]=f:this._root=f),this):(this._root=i,this)},kl.removeAll=function(e){for(var t=0,n=e.length;t<n;++t)this.remove(e[t]);return this},kl.root=function(){return this._root},kl.size=function(){var e=0;return this.visit((function(t){if(!t.length)do{++e}while(t=t.next)})),e},kl.visit=function(e){var t,n,r,i,o,a,s=[],l=this._root;for(l&&s.push(new yl(l,this._x0,this._y0,this._x1,this._y1));t=s.pop();)if(!e(l=t.node,r=t.x0,i=t.y0,o=t.x1,a=t.y1)&&l.length){var u=(r+o)/2,c=(i+a)/2;(n=l[3])&&s.push(new yl(n,u,c,o,a)),(n=l[2])&&s.push(new yl(n,r,c,u,a)),(n=l[1])&&s.push(new yl(n,u,i,o,c)),(n=l[0])&&s.push(new yl(n,r,i,u,c))}return this},kl.visitAfter=function(e){var t,n=[],r=[];for(this._root&&n.push(new yl(this._root,this._x0,this._y0,this._x1,this._y1));t=n.pop();){var i=t.node;if(i.length){var o,a=t.x0,s=t.y0,l=t.x1,u=t.y1,c=(a+l)/2,d=(s+u)/2;(o=i[0])&&n.push(new yl(o,a,s,c,d)),(o=i[1])&&n.push(new yl(o,c,s,l,d)),(o=i[2])&&n.push(new yl(o,a,d,c,u)),(o=i[3])&&n.push(new yl(o,c,d,l,u))}r.push(t)}for(;t=r.pop();)e(t.node,t.x0,t.y0,t.x1,t.y1);return this},kl.x=function(e){return arguments.length?(this._x=e,this):this._x},kl.y=function(e){return arguments.length?(this._y=e,this):this._y};var Cl=function(e){var t,n,r=1,i=1;function o(){for(var e,o,s,l,u,c,d,h=t.length,f=0;f<i;++f)for(o=wl(t,Sl,Tl).visitAfter(a),e=0;e<h;++e)s=t[e],c=n[s.index],d=c*c,l=s.x+s.vx,u=s.y+s.vy,o.visit(p);function p(e,t,n,i,o){var a=e.data,h=e.r,f=c+h;if(!a)return t>l+f||i<l-f||n>u+f||o<u-f;if(a.index>s.index){var p=l-a.x-a.vx,m=u-a.y-a.vy,g=p*p+m*m;g<f*f&&(0===p&&(g+=(p=ml())*p),0===m&&(g+=(m=ml())*m),g=(f-(g=Math.sqrt(g)))/g*r,s.vx+=(p*=g)*(f=(h*=h)/(d+h)),s.vy+=(m*=g)*f,a.vx-=p*(f=1-f),a.vy-=m*f)}}}function a(e){if(e.data)return e.r=n[e.data.index];for(var t=e.r=0;t<4;++t)e[t]&&e[t].r>e.r&&(e.r=e[t].r)}function s(){if(t){var r,i,o=t.length;for(n=new Array(o),r=0;r<o;++r)i=t[r],n[i.index]=+e(i,r,t)}}return"function"!=typeof e&&(e=pl(null==e?1:+e)),o.initialize=function(e){t=e,s()},o.iterations=function(e){return arguments.length?(i=+e,o):i},o.strength=function(e){return arguments.length?(r=+e,o):r},o.radius=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),s(),o):e},o};function xl(e){return e.index}function El(e,t){var n=e.get(t);if(!n)throw new Error("missing: "+t);return n}var Ll=function(e){var t,n,r,i,o,a=xl,s=function(e){return 1/Math.min(i[e.source.index],i[e.target.index])},l=pl(30),u=1;function c(r){for(var i=0,a=e.length;i<u;++i)for(var s,l,c,d,h,f,p,m=0;m<a;++m)l=(s=e[m]).source,d=(c=s.target).x+c.vx-l.x-l.vx||ml(),h=c.y+c.vy-l.y-l.vy||ml(),d*=f=((f=Math.sqrt(d*d+h*h))-n[m])/f*r*t[m],h*=f,c.vx-=d*(p=o[m]),c.vy-=h*p,l.vx+=d*(p=1-p),l.vy+=h*p}function d(){if(r){var s,l,u=r.length,c=e.length,d=Za(r,a);for(s=0,i=new Array(u);s<c;++s)(l=e[s]).index=s,"object"!=typeof l.source&&(l.source=El(d,l.source)),"object"!=typeof l.target&&(l.target=El(d,l.target)),i[l.source.index]=(i[l.source.index]||0)+1,i[l.target.index]=(i[l.target.index]||0)+1;for(s=0,o=new Array(c);s<c;++s)l=e[s],o[s]=i[l.source.index]/(i[l.source.index]+i[l.target.index]);t=new Array(c),h(),n=new Array(c),f()}}function h(){if(r)for(var n=0,i=e.length;n<i;++n)t[n]=+s(e[n],n,e)}function f(){if(r)for(var t=0,i=e.length;t<i;++t)n[t]=+l(e[t],t,e)}return null==e&&(e=[]),c.initialize=function(e){r=e,d()},c.links=function(t){return arguments.length?(e=t,d(),c):e},c.id=function(e){return arguments.length?(a=e,c):a},c.iterations=function(e){return arguments.length?(u=+e,c):u},c.strength=function(e){return arguments.length?(s="function"==typeof e?e:pl(+e),h(),c):s},c.distance=function(e){return arguments.length?(l="function"==typeof e?e:pl(+e),f(),c):l},c};function Ol(e){return e.x}function Dl(e){return e.y}var Rl=10,Al=Math.PI*(3-Math.sqrt(5)),Nl=function(e){var t,n=1,r=.001,i=1-Math.pow(r,1/300),o=0,a=.6,s=Za(),l=mi(c),u=_e("tick","end");function c(){d(),u.call("tick",t),n<r&&(l.stop(),u.call("end",t))}function d(r){var l,u,c=e.length;void 0===r&&(r=1);for(var d=0;d<r;++d)for(n+=(o-n)*i,s.each((function(e){e(n)})),l=0;l<c;++l)null==(u=e[l]).fx?u.x+=u.vx*=a:(u.x=u.fx,u.vx=0),null==u.fy?u.y+=u.vy*=a:(u.y=u.fy,u.vy=0);return t}function h(){for(var t,n=0,r=e.length;n<r;++n){if((t=e[n]).index=n,null!=t.fx&&(t.x=t.fx),null!=t.fy&&(t.y=t.fy),isNaN(t.x)||isNaN(t.y)){var i=Rl*Math.sqrt(n),o=n*Al;t.x=i*Math.cos(o),t.y=i*Math.sin(o)}(isNaN(t.vx)||isNaN(t.vy))&&(t.vx=t.vy=0)}}function f(t){return t.initialize&&t.initialize(e),t}return null==e&&(e=[]),h(),t={tick:d,restart:function(){return l.restart(c),t},stop:function(){return l.stop(),t},nodes:function(n){return arguments.length?(e=n,h(),s.each(f),t):e},alpha:function(e){return arguments.length?(n=+e,t):n},alphaMin:function(e){return arguments.length?(r=+e,t):r},alphaDecay:function(e){return arguments.length?(i=+e,t):+i},alphaTarget:function(e){return arguments.length?(o=+e,t):o},velocityDecay:function(e){return arguments.length?(a=1-e,t):1-a},force:function(e,n){return arguments.length>1?(null==n?s.remove(e):s.set(e,f(n)),t):s.get(e)},find:function(t,n,r){var i,o,a,s,l,u=0,c=e.length;for(null==r?r=1/0:r*=r,u=0;u<c;++u)(a=(i=t-(s=e[u]).x)*i+(o=n-s.y)*o)<r&&(l=s,r=a);return l},on:function(e,n){return arguments.length>1?(u.on(e,n),t):u.on(e)}}},Yl=function(){var e,t,n,r,i=pl(-30),o=1,a=1/0,s=.81;function l(r){var i,o=e.length,a=wl(e,Ol,Dl).visitAfter(c);for(n=r,i=0;i<o;++i)t=e[i],a.visit(d)}function u(){if(e){var t,n,o=e.length;for(r=new Array(o),t=0;t<o;++t)n=e[t],r[n.index]=+i(n,t,e)}}function c(e){var t,n,i,o,a,s=0,l=0;if(e.length){for(i=o=a=0;a<4;++a)(t=e[a])&&(n=Math.abs(t.value))&&(s+=t.value,l+=n,i+=n*t.x,o+=n*t.y);e.x=i/l,e.y=o/l}else{(t=e).x=t.data.x,t.y=t.data.y;do{s+=r[t.data.index]}while(t=t.next)}e.value=s}function d(e,i,l,u){if(!e.value)return!0;var c=e.x-t.x,d=e.y-t.y,h=u-i,f=c*c+d*d;if(h*h/s<f)return f<a&&(0===c&&(f+=(c=ml())*c),0===d&&(f+=(d=ml())*d),f<o&&(f=Math.sqrt(o*f)),t.vx+=c*e.value*n/f,t.vy+=d*e.value*n/f),!0;if(!(e.length||f>=a)){(e.data!==t||e.next)&&(0===c&&(f+=(c=ml())*c),0===d&&(f+=(d=ml())*d),f<o&&(f=Math.sqrt(o*f)));do{e.data!==t&&(h=r[e.data.index]*n/f,t.vx+=c*h,t.vy+=d*h)}while(e=e.next)}}return l.initialize=function(t){e=t,u()},l.strength=function(e){return arguments.length?(i="function"==typeof e?e:pl(+e),u(),l):i},l.distanceMin=function(e){return arguments.length?(o=e*e,l):Math.sqrt(o)},l.distanceMax=function(e){return arguments.length?(a=e*e,l):Math.sqrt(a)},l.theta=function(e){return arguments.length?(s=e*e,l):Math.sqrt(s)},l},jl=function(e,t,n){var r,i,o,a=pl(.1);function s(e){for(var a=0,s=r.length;a<s;++a){var l=r[a],u=l.x-t||1e-6,c=l.y-n||1e-6,d=Math.sqrt(u*u+c*c),h=(o[a]-d)*i[a]*e/d;l.vx+=u*h,l.vy+=c*h}}function l(){if(r){var t,n=r.length;for(i=new Array(n),o=new Array(n),t=0;t<n;++t)o[t]=+e(r[t],t,r),i[t]=isNaN(o[t])?0:+a(r[t],t,r)}}return"function"!=typeof e&&(e=pl(+e)),null==t&&(t=0),null==n&&(n=0),s.initialize=function(e){r=e,l()},s.strength=function(e){return arguments.length?(a="function"==typeof e?e:pl(+e),l(),s):a},s.radius=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),l(),s):e},s.x=function(e){return arguments.length?(t=+e,s):t},s.y=function(e){return arguments.length?(n=+e,s):n},s},Hl=function(e){var t,n,r,i=pl(.1);function o(e){for(var i,o=0,a=t.length;o<a;++o)(i=t[o]).vx+=(r[o]-i.x)*n[o]*e}function a(){if(t){var o,a=t.length;for(n=new Array(a),r=new Array(a),o=0;o<a;++o)n[o]=isNaN(r[o]=+e(t[o],o,t))?0:+i(t[o],o,t)}}return"function"!=typeof e&&(e=pl(null==e?0:+e)),o.initialize=function(e){t=e,a()},o.strength=function(e){return arguments.length?(i="function"==typeof e?e:pl(+e),a(),o):i},o.x=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),a(),o):e},o},Pl=function(e){var t,n,r,i=pl(.1);function o(e){for(var i,o=0,a=t.length;o<a;++o)(i=t[o]).vy+=(r[o]-i.y)*n[o]*e}function a(){if(t){var o,a=t.length;for(n=new Array(a),r=new Array(a),o=0;o<a;++o)n[o]=isNaN(r[o]=+e(t[o],o,t))?0:+i(t[o],o,t)}}return"function"!=typeof e&&(e=pl(null==e?0:+e)),o.initialize=function(e){t=e,a()},o.strength=function(e){return arguments.length?(i="function"==typeof e?e:pl(+e),a(),o):i},o.y=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),a(),o):e},o},Il=function(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]},Fl=function(e){return(e=Il(Math.abs(e)))?e[1]:NaN},Bl=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function zl(e){if(!(t=Bl.exec(e)))throw new Error("invalid format: "+e);var t;return new Wl({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}function Wl(e){this.fill=void 0===e.fill?" ":e.fill+"",this.align=void 0===e.align?">":e.align+"",this.sign=void 0===e.sign?"-":e.sign+"",this.symbol=void 0===e.symbol?"":e.symbol+"",this.zero=!!e.zero,this.width=void 0===e.width?void 0:+e.width,this.comma=!!e.comma,this.precision=void 0===e.precision?void 0:+e.precision,this.trim=!!e.trim,this.type=void 0===e.type?"":e.type+""}zl.prototype=Wl.prototype,Wl.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};var Ul,Vl,ql,Gl,Xl=function(e){e:for(var t,n=e.length,r=1,i=-1;r<n;++r)switch(e[r]){case".":i=t=r;break;case"0":0===i&&(i=r),t=r;break;default:if(i>0){if(!+e[r])break e;i=0}}return i>0?e.slice(0,i)+e.slice(t+1):e},Kl=function(e,t){var n=Il(e,t);if(!n)return e+"";var r=n[0],i=n[1];return i<0?"0."+new Array(-i).join("0")+r:r.length>i+1?r.slice(0,i+1)+"."+r.slice(i+1):r+new Array(i-r.length+2).join("0")},Jl={"%":function(e,t){return(100*e).toFixed(t)},b:function(e){return Math.round(e).toString(2)},c:function(e){return e+""},d:function(e){return Math.round(e).toString(10)},e:function(e,t){return e.toExponential(t)},f:function(e,t){return e.toFixed(t)},g:function(e,t){return e.toPrecision(t)},o:function(e){return Math.round(e).toString(8)},p:function(e,t){return Kl(100*e,t)},r:Kl,s:function(e,t){var n=Il(e,t);if(!n)return e+"";var r=n[0],i=n[1],o=i-(Ul=3*Math.max(-8,Math.min(8,Math.floor(i/3))))+1,a=r.length;return o===a?r:o>a?r+new Array(o-a+1).join("0"):o>0?r.slice(0,o)+"."+r.slice(o):"0."+new Array(1-o).join("0")+Il(e,Math.max(0,t+o-1))[0]},X:function(e){return Math.round(e).toString(16).toUpperCase()},x:function(e){return Math.round(e).toString(16)}},$l=function(e){return e},Zl=Array.prototype.map,Ql=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"],eu=function(e){var t,n,r=void 0===e.grouping||void 0===e.thousands?$l:(t=Zl.call(e.grouping,Number),n=e.thousands+"",function(e,r){for(var i=e.length,o=[],a=0,s=t[0],l=0;i>0&&s>0&&(l+s+1>r&&(s=Math.max(1,r-l)),o.push(e.substring(i-=s,i+s)),!((l+=s+1)>r));)s=t[a=(a+1)%t.length];return o.reverse().join(n)}),i=void 0===e.currency?"":e.currency[0]+"",o=void 0===e.currency?"":e.currency[1]+"",a=void 0===e.decimal?".":e.decimal+"",s=void 0===e.numerals?$l:function(e){return function(t){return t.replace(/[0-9]/g,(function(t){return e[+t]}))}}(Zl.call(e.numerals,String)),l=void 0===e.percent?"%":e.percent+"",u=void 0===e.minus?"-":e.minus+"",c=void 0===e.nan?"NaN":e.nan+"";function d(e){var t=(e=zl(e)).fill,n=e.align,d=e.sign,h=e.symbol,f=e.zero,p=e.width,m=e.comma,g=e.precision,y=e.trim,v=e.type;"n"===v?(m=!0,v="g"):Jl[v]||(void 0===g&&(g=12),y=!0,v="g"),(f||"0"===t&&"="===n)&&(f=!0,t="0",n="=");var _="$"===h?i:"#"===h&&/[boxX]/.test(v)?"0"+v.toLowerCase():"",w="$"===h?o:/[%p]/.test(v)?l:"",b=Jl[v],M=/[defgprs%]/.test(v);function k(e){var i,o,l,h=_,k=w;if("c"===v)k=b(e)+k,e="";else{var S=(e=+e)<0;if(e=isNaN(e)?c:b(Math.abs(e),g),y&&(e=Xl(e)),S&&0==+e&&(S=!1),h=(S?"("===d?d:u:"-"===d||"("===d?"":d)+h,k=("s"===v?Ql[8+Ul/3]:"")+k+(S&&"("===d?")":""),M)for(i=-1,o=e.length;++i<o;)if(48>(l=e.charCodeAt(i))||l>57){k=(46===l?a+e.slice(i+1):e.slice(i))+k,e=e.slice(0,i);break}}m&&!f&&(e=r(e,1/0));var T=h.length+e.length+k.length,C=T<p?new Array(p-T+1).join(t):"";switch(m&&f&&(e=r(C+e,C.length?p-k.length:1/0),C=""),n){case"<":e=h+e+k+C;break;case"=":e=h+C+e+k;break;case"^":e=C.slice(0,T=C.length>>1)+h+e+k+C.slice(T);break;default:e=C+h+e+k}return s(e)}return g=void 0===g?6:/[gprs]/.test(v)?Math.max(1,Math.min(21,g)):Math.max(0,Math.min(20,g)),k.toString=function(){return e+""},k}return{format:d,formatPrefix:function(e,t){var n=d(((e=zl(e)).type="f",e)),r=3*Math.max(-8,Math.min(8,Math.floor(Fl(t)/3))),i=Math.pow(10,-r),o=Ql[8+r/3];return function(e){return n(i*e)+o}}}};function tu(e){return Vl=eu(e),ql=Vl.format,Gl=Vl.formatPrefix,Vl}tu({decimal:".",thousands:",",grouping:[3],currency:["$",""],minus:"-"});var nu=function(e){return Math.max(0,-Fl(Math.abs(e)))},ru=function(e,t){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(Fl(t)/3)))-Fl(Math.abs(e)))},iu=function(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,Fl(t)-Fl(e))+1},ou=function(){return new au};function au(){this.reset()}au.prototype={constructor:au,reset:function(){this.s=this.t=0},add:function(e){lu(su,e,this.t),lu(this,su.s,this.s),this.s?this.t+=su.t:this.s=su.t},valueOf:function(){return this.s}};var su=new au;function lu(e,t,n){var r=e.s=t+n,i=r-t,o=r-i;e.t=t-o+(n-i)}var uu=1e-6,cu=1e-12,du=Math.PI,hu=du/2,fu=du/4,pu=2*du,mu=180/du,gu=du/180,yu=Math.abs,vu=Math.atan,_u=Math.atan2,wu=Math.cos,bu=Math.ceil,Mu=Math.exp,ku=(Math.floor,Math.log),Su=Math.pow,Tu=Math.sin,Cu=Math.sign||function(e){return e>0?1:e<0?-1:0},xu=Math.sqrt,Eu=Math.tan;function Lu(e){return e>1?0:e<-1?du:Math.acos(e)}function Ou(e){return e>1?hu:e<-1?-hu:Math.asin(e)}function Du(e){return(e=Tu(e/2))*e}function Ru(){}function Au(e,t){e&&Yu.hasOwnProperty(e.type)&&Yu[e.type](e,t)}var Nu={Feature:function(e,t){Au(e.geometry,t)},FeatureCollection:function(e,t){for(var n=e.features,r=-1,i=n.length;++r<i;)Au(n[r].geometry,t)}},Yu={Sphere:function(e,t){t.sphere()},Point:function(e,t){e=e.coordinates,t.point(e[0],e[1],e[2])},MultiPoint:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)e=n[r],t.point(e[0],e[1],e[2])},LineString:function(e,t){ju(e.coordinates,t,0)},MultiLineString:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)ju(n[r],t,0)},Polygon:function(e,t){Hu(e.coordinates,t)},MultiPolygon:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)Hu(n[r],t)},GeometryCollection:function(e,t){for(var n=e.geometries,r=-1,i=n.length;++r<i;)Au(n[r],t)}};function ju(e,t,n){var r,i=-1,o=e.length-n;for(t.lineStart();++i<o;)r=e[i],t.point(r[0],r[1],r[2]);t.lineEnd()}function Hu(e,t){var n=-1,r=e.length;for(t.polygonStart();++n<r;)ju(e[n],t,1);t.polygonEnd()}var Pu,Iu,Fu,Bu,zu,Wu=function(e,t){e&&Nu.hasOwnProperty(e.type)?Nu[e.type](e,t):Au(e,t)},Uu=ou(),Vu=ou(),qu={point:Ru,lineStart:Ru,lineEnd:Ru,polygonStart:function(){Uu.reset(),qu.lineStart=Gu,qu.lineEnd=Xu},polygonEnd:function(){var e=+Uu;Vu.add(e<0?pu+e:e),this.lineStart=this.lineEnd=this.point=Ru},sphere:function(){Vu.add(pu)}};function Gu(){qu.point=Ku}function Xu(){Ju(Pu,Iu)}function Ku(e,t){qu.point=Ju,Pu=e,Iu=t,Fu=e*=gu,Bu=wu(t=(t*=gu)/2+fu),zu=Tu(t)}function Ju(e,t){var n=(e*=gu)-Fu,r=n>=0?1:-1,i=r*n,o=wu(t=(t*=gu)/2+fu),a=Tu(t),s=zu*a,l=Bu*o+s*wu(i),u=s*r*Tu(i);Uu.add(_u(u,l)),Fu=e,Bu=o,zu=a}var $u=function(e){return Vu.reset(),Wu(e,qu),2*Vu};function Zu(e){return[_u(e[1],e[0]),Ou(e[2])]}function Qu(e){var t=e[0],n=e[1],r=wu(n);return[r*wu(t),r*Tu(t),Tu(n)]}function ec(e,t){return e[0]*t[0]+e[1]*t[1]+e[2]*t[2]}function tc(e,t){return[e[1]*t[2]-e[2]*t[1],e[2]*t[0]-e[0]*t[2],e[0]*t[1]-e[1]*t[0]]}function nc(e,t){e[0]+=t[0],e[1]+=t[1],e[2]+=t[2]}function rc(e,t){return[e[0]*t,e[1]*t,e[2]*t]}function ic(e){var t=xu(e[0]*e[0]+e[1]*e[1]+e[2]*e[2]);e[0]/=t,e[1]/=t,e[2]/=t}var oc,ac,sc,lc,uc,cc,dc,hc,fc,pc,mc=ou(),gc={point:yc,lineStart:_c,lineEnd:wc,polygonStart:function(){gc.point=bc,gc.lineStart=Mc,gc.lineEnd=kc,mc.reset(),qu.polygonStart()},polygonEnd:function(){qu.polygonEnd(),gc.point=yc,gc.lineStart=_c,gc.lineEnd=wc,Uu<0?(oc=-(sc=180),ac=-(lc=90)):mc>uu?lc=90:mc<-uu&&(ac=-90),pc[0]=oc,pc[1]=sc},sphere:function(){oc=-(sc=180),ac=-(lc=90)}};function yc(e,t){fc.push(pc=[oc=e,sc=e]),t<ac&&(ac=t),t>lc&&(lc=t)}function vc(e,t){var n=Qu([e*gu,t*gu]);if(hc){var r=tc(hc,n),i=tc([r[1],-r[0],0],r);ic(i),i=Zu(i);var o,a=e-uc,s=a>0?1:-1,l=i[0]*mu*s,u=yu(a)>180;u^(s*uc<l&&l<s*e)?(o=i[1]*mu)>lc&&(lc=o):u^(s*uc<(l=(l+360)%360-180)&&l<s*e)?(o=-i[1]*mu)<ac&&(ac=o):(t<ac&&(ac=t),t>lc&&(lc=t)),u?e<uc?Sc(oc,e)>Sc(oc,sc)&&(sc=e):Sc(e,sc)>Sc(oc,sc)&&(oc=e):sc>=oc?(e<oc&&(oc=e),e>sc&&(sc=e)):e>uc?Sc(oc,e)>Sc(oc,sc)&&(sc=e):Sc(e,sc)>Sc(oc,sc)&&(oc=e)}else fc.push(pc=[oc=e,sc=e]);t<ac&&(ac=t),t>lc&&(lc=t),hc=n,uc=e}function _c(){gc.point=vc}function wc(){pc[0]=oc,pc[1]=sc,gc.point=yc,hc=null}function bc(e,t){if(hc){var n=e-uc;mc.add(yu(n)>180?n+(n>0?360:-360):n)}else cc=e,dc=t;qu.point(e,t),vc(e,t)}function Mc(){qu.lineStart()}function kc(){bc(cc,dc),qu.lineEnd(),yu(mc)>uu&&(oc=-(sc=180)),pc[0]=oc,pc[1]=sc,hc=null}function Sc(e,t){return(t-=e)<0?t+360:t}function Tc(e,t){return e[0]-t[0]}function Cc(e,t){return e[0]<=e[1]?e[0]<=t&&t<=e[1]:t<e[0]||e[1]<t}var xc,Ec,Lc,Oc,Dc,Rc,Ac,Nc,Yc,jc,Hc,Pc,Ic,Fc,Bc,zc,Wc=function(e){var t,n,r,i,o,a,s;if(lc=sc=-(oc=ac=1/0),fc=[],Wu(e,gc),n=fc.length){for(fc.sort(Tc),t=1,o=[r=fc[0]];t<n;++t)Cc(r,(i=fc[t])[0])||Cc(r,i[1])?(Sc(r[0],i[1])>Sc(r[0],r[1])&&(r[1]=i[1]),Sc(i[0],r[1])>Sc(r[0],r[1])&&(r[0]=i[0])):o.push(r=i);for(a=-1/0,t=0,r=o[n=o.length-1];t<=n;r=i,++t)i=o[t],(s=Sc(r[1],i[0]))>a&&(a=s,oc=i[0],sc=r[1])}return fc=pc=null,oc===1/0||ac===1/0?[[NaN,NaN],[NaN,NaN]]:[[oc,ac],[sc,lc]]},Uc={sphere:Ru,point:Vc,lineStart:Gc,lineEnd:Jc,polygonStart:function(){Uc.lineStart=$c,Uc.lineEnd=Zc},polygonEnd:function(){Uc.lineStart=Gc,Uc.lineEnd=Jc}};function Vc(e,t){e*=gu;var n=wu(t*=gu);qc(n*wu(e),n*Tu(e),Tu(t))}function qc(e,t,n){Lc+=(e-Lc)/++xc,Oc+=(t-Oc)/xc,Dc+=(n-Dc)/xc}function Gc(){Uc.point=Xc}function Xc(e,t){e*=gu;var n=wu(t*=gu);Fc=n*wu(e),Bc=n*Tu(e),zc=Tu(t),Uc.point=Kc,qc(Fc,Bc,zc)}function Kc(e,t){e*=gu;var n=wu(t*=gu),r=n*wu(e),i=n*Tu(e),o=Tu(t),a=_u(xu((a=Bc*o-zc*i)*a+(a=zc*r-Fc*o)*a+(a=Fc*i-Bc*r)*a),Fc*r+Bc*i+zc*o);Ec+=a,Rc+=a*(Fc+(Fc=r)),Ac+=a*(Bc+(Bc=i)),Nc+=a*(zc+(zc=o)),qc(Fc,Bc,zc)}function Jc(){Uc.point=Vc}function $c(){Uc.point=Qc}function Zc(){ed(Pc,Ic),Uc.point=Vc}function Qc(e,t){Pc=e,Ic=t,e*=gu,t*=gu,Uc.point=ed;var n=wu(t);Fc=n*wu(e),Bc=n*Tu(e),zc=Tu(t),qc(Fc,Bc,zc)}function ed(e,t){e*=gu;var n=wu(t*=gu),r=n*wu(e),i=n*Tu(e),o=Tu(t),a=Bc*o-zc*i,s=zc*r-Fc*o,l=Fc*i-Bc*r,u=xu(a*a+s*s+l*l),c=Ou(u),d=u&&-c/u;Yc+=d*a,jc+=d*s,Hc+=d*l,Ec+=c,Rc+=c*(Fc+(Fc=r)),Ac+=c*(Bc+(Bc=i)),Nc+=c*(zc+(zc=o)),qc(Fc,Bc,zc)}var td=function(e){xc=Ec=Lc=Oc=Dc=Rc=Ac=Nc=Yc=jc=Hc=0,Wu(e,Uc);var t=Yc,n=jc,r=Hc,i=t*t+n*n+r*r;return i<cu&&(t=Rc,n=Ac,r=Nc,Ec<uu&&(t=Lc,n=Oc,r=Dc),(i=t*t+n*n+r*r)<cu)?[NaN,NaN]:[_u(n,t)*mu,Ou(r/xu(i))*mu]},nd=function(e){return function(){return e}},rd=function(e,t){function n(n,r){return n=e(n,r),t(n[0],n[1])}return e.invert&&t.invert&&(n.invert=function(n,r){return(n=t.invert(n,r))&&e.invert(n[0],n[1])}),n};function id(e,t){return[yu(e)>du?e+Math.round(-e/pu)*pu:e,t]}function od(e,t,n){return(e%=pu)?t||n?rd(sd(e),ld(t,n)):sd(e):t||n?ld(t,n):id}function ad(e){return function(t,n){return[(t+=e)>du?t-pu:t<-du?t+pu:t,n]}}function sd(e){var t=ad(e);return t.invert=ad(-e),t}function ld(e,t){var n=wu(e),r=Tu(e),i=wu(t),o=Tu(t);function a(e,t){var a=wu(t),s=wu(e)*a,l=Tu(e)*a,u=Tu(t),c=u*n+s*r;return[_u(l*i-c*o,s*n-u*r),Ou(c*i+l*o)]}return a.invert=function(e,t){var a=wu(t),s=wu(e)*a,l=Tu(e)*a,u=Tu(t),c=u*i-l*o;return[_u(l*i+u*o,s*n+c*r),Ou(c*n-s*r)]},a}id.invert=id;var ud=function(e){function t(t){return(t=e(t[0]*gu,t[1]*gu))[0]*=mu,t[1]*=mu,t}return e=od(e[0]*gu,e[1]*gu,e.length>2?e[2]*gu:0),t.invert=function(t){return(t=e.invert(t[0]*gu,t[1]*gu))[0]*=mu,t[1]*=mu,t},t};function cd(e,t,n,r,i,o){if(n){var a=wu(t),s=Tu(t),l=r*n;null==i?(i=t+r*pu,o=t-l/2):(i=dd(a,i),o=dd(a,o),(r>0?i<o:i>o)&&(i+=r*pu));for(var u,c=i;r>0?c>o:c<o;c-=l)u=Zu([a,-s*wu(c),-s*Tu(c)]),e.point(u[0],u[1])}}function dd(e,t){(t=Qu(t))[0]-=e,ic(t);var n=Lu(-t[1]);return((-t[2]<0?-n:n)+pu-uu)%pu}var hd=function(){var e,t,n=nd([0,0]),r=nd(90),i=nd(6),o={point:function(n,r){e.push(n=t(n,r)),n[0]*=mu,n[1]*=mu}};function a(){var a=n.apply(this,arguments),s=r.apply(this,arguments)*gu,l=i.apply(this,arguments)*gu;return e=[],t=od(-a[0]*gu,-a[1]*gu,0).invert,cd(o,s,l,1),a={type:"Polygon",coordinates:[e]},e=t=null,a}return a.center=function(e){return arguments.length?(n="function"==typeof e?e:nd([+e[0],+e[1]]),a):n},a.radius=function(e){return arguments.length?(r="function"==typeof e?e:nd(+e),a):r},a.precision=function(e){return arguments.length?(i="function"==typeof e?e:nd(+e),a):i},a},fd=function(){var e,t=[];return{point:function(t,n){e.push([t,n])},lineStart:function(){t.push(e=[])},lineEnd:Ru,rejoin:function(){t.length>1&&t.push(t.pop().concat(t.shift()))},result:function(){var n=t;return t=[],e=null,n}}},pd=function(e,t){return yu(e[0]-t[0])<uu&&yu(e[1]-t[1])<uu};function md(e,t,n,r){this.x=e,this.z=t,this.o=n,this.e=r,this.v=!1,this.n=this.p=null}var gd=function(e,t,n,r,i){var o,a,s=[],l=[];if(e.forEach((function(e){if(!((t=e.length-1)<=0)){var t,n,r=e[0],a=e[t];if(pd(r,a)){for(i.lineStart(),o=0;o<t;++o)i.point((r=e[o])[0],r[1]);i.lineEnd()}else s.push(n=new md(r,e,null,!0)),l.push(n.o=new md(r,null,n,!1)),s.push(n=new md(a,e,null,!1)),l.push(n.o=new md(a,null,n,!0))}})),s.length){for(l.sort(t),yd(s),yd(l),o=0,a=l.length;o<a;++o)l[o].e=n=!n;for(var u,c,d=s[0];;){for(var h=d,f=!0;h.v;)if((h=h.n)===d)return;u=h.z,i.lineStart();do{if(h.v=h.o.v=!0,h.e){if(f)for(o=0,a=u.length;o<a;++o)i.point((c=u[o])[0],c[1]);else r(h.x,h.n.x,1,i);h=h.n}else{if(f)for(u=h.p.z,o=u.length-1;o>=0;--o)i.point((c=u[o])[0],c[1]);else r(h.x,h.p.x,-1,i);h=h.p}u=(h=h.o).z,f=!f}while(!h.v);i.lineEnd()}}};function yd(e){if(t=e.length){for(var t,n,r=0,i=e[0];++r<t;)i.n=n=e[r],n.p=i,i=n;i.n=n=e[0],n.p=i}}var vd=ou();function _d(e){return yu(e[0])<=du?e[0]:Cu(e[0])*((yu(e[0])+du)%pu-du)}var wd=function(e,t){var n=_d(t),r=t[1],i=Tu(r),o=[Tu(n),-wu(n),0],a=0,s=0;vd.reset(),1===i?r=hu+uu:-1===i&&(r=-hu-uu);for(var l=0,u=e.length;l<u;++l)if(d=(c=e[l]).length)for(var c,d,h=c[d-1],f=_d(h),p=h[1]/2+fu,m=Tu(p),g=wu(p),y=0;y<d;++y,f=_,m=b,g=M,h=v){var v=c[y],_=_d(v),w=v[1]/2+fu,b=Tu(w),M=wu(w),k=_-f,S=k>=0?1:-1,T=S*k,C=T>du,x=m*b;if(vd.add(_u(x*S*Tu(T),g*M+x*wu(T))),a+=C?k+S*pu:k,C^f>=n^_>=n){var E=tc(Qu(h),Qu(v));ic(E);var L=tc(o,E);ic(L);var O=(C^k>=0?-1:1)*Ou(L[2]);(r>O||r===O&&(E[0]||E[1]))&&(s+=C^k>=0?1:-1)}}return(a<-uu||a<uu&&vd<-uu)^1&s},bd=function(e,t,n,r){return function(i){var o,a,s,l=t(i),u=fd(),c=t(u),d=!1,h={point:f,lineStart:m,lineEnd:g,polygonStart:function(){h.point=y,h.lineStart=v,h.lineEnd=_,a=[],o=[]},polygonEnd:function(){h.point=f,h.lineStart=m,h.lineEnd=g,a=B(a);var e=wd(o,r);a.length?(d||(i.polygonStart(),d=!0),gd(a,kd,e,n,i)):e&&(d||(i.polygonStart(),d=!0),i.lineStart(),n(null,null,1,i),i.lineEnd()),d&&(i.polygonEnd(),d=!1),a=o=null},sphere:function(){i.polygonStart(),i.lineStart(),n(null,null,1,i),i.lineEnd(),i.polygonEnd()}};function f(t,n){e(t,n)&&i.point(t,n)}function p(e,t){l.point(e,t)}function m(){h.point=p,l.lineStart()}function g(){h.point=f,l.lineEnd()}function y(e,t){s.push([e,t]),c.point(e,t)}function v(){c.lineStart(),s=[]}function _(){y(s[0][0],s[0][1]),c.lineEnd();var e,t,n,r,l=c.clean(),h=u.result(),f=h.length;if(s.pop(),o.push(s),s=null,f)if(1&l){if((t=(n=h[0]).length-1)>0){for(d||(i.polygonStart(),d=!0),i.lineStart(),e=0;e<t;++e)i.point((r=n[e])[0],r[1]);i.lineEnd()}}else f>1&&2&l&&h.push(h.pop().concat(h.shift())),a.push(h.filter(Md))}return h}};function Md(e){return e.length>1}function kd(e,t){return((e=e.x)[0]<0?e[1]-hu-uu:hu-e[1])-((t=t.x)[0]<0?t[1]-hu-uu:hu-t[1])}var Sd=bd((function(){return!0}),(function(e){var t,n=NaN,r=NaN,i=NaN;return{lineStart:function(){e.lineStart(),t=1},point:function(o,a){var s=o>0?du:-du,l=yu(o-n);yu(l-du)<uu?(e.point(n,r=(r+a)/2>0?hu:-hu),e.point(i,r),e.lineEnd(),e.lineStart(),e.point(s,r),e.point(o,r),t=0):i!==s&&l>=du&&(yu(n-i)<uu&&(n-=i*uu),yu(o-s)<uu&&(o-=s*uu),r=function(e,t,n,r){var i,o,a=Tu(e-n);return yu(a)>uu?vu((Tu(t)*(o=wu(r))*Tu(n)-Tu(r)*(i=wu(t))*Tu(e))/(i*o*a)):(t+r)/2}(n,r,o,a),e.point(i,r),e.lineEnd(),e.lineStart(),e.point(s,r),t=0),e.point(n=o,r=a),i=s},lineEnd:function(){e.lineEnd(),n=r=NaN},clean:function(){return 2-t}}}),(function(e,t,n,r){var i;if(null==e)i=n*hu,r.point(-du,i),r.point(0,i),r.point(du,i),r.point(du,0),r.point(du,-i),r.point(0,-i),r.point(-du,-i),r.point(-du,0),r.point(-du,i);else if(yu(e[0]-t[0])>uu){var o=e[0]<t[0]?du:-du;i=n*o/2,r.point(-o,i),r.point(0,i),r.point(o,i)}else r.point(t[0],t[1])}),[-du,-hu]);var Td=function(e){var t=wu(e),n=6*gu,r=t>0,i=yu(t)>uu;function o(e,n){return wu(e)*wu(n)>t}function a(e,n,r){var i=[1,0,0],o=tc(Qu(e),Qu(n)),a=ec(o,o),s=o[0],l=a-s*s;if(!l)return!r&&e;var u=t*a/l,c=-t*s/l,d=tc(i,o),h=rc(i,u);nc(h,rc(o,c));var f=d,p=ec(h,f),m=ec(f,f),g=p*p-m*(ec(h,h)-1);if(!(g<0)){var y=xu(g),v=rc(f,(-p-y)/m);if(nc(v,h),v=Zu(v),!r)return v;var _,w=e[0],b=n[0],M=e[1],k=n[1];b<w&&(_=w,w=b,b=_);var S=b-w,T=yu(S-du)<uu;if(!T&&k<M&&(_=M,M=k,k=_),T||S<uu?T?M+k>0^v[1]<(yu(v[0]-w)<uu?M:k):M<=v[1]&&v[1]<=k:S>du^(w<=v[0]&&v[0]<=b)){var C=rc(f,(-p+y)/m);return nc(C,h),[v,Zu(C)]}}}function s(t,n){var i=r?e:du-e,o=0;return t<-i?o|=1:t>i&&(o|=2),n<-i?o|=4:n>i&&(o|=8),o}return bd(o,(function(e){var t,n,l,u,c;return{lineStart:function(){u=l=!1,c=1},point:function(d,h){var f,p=[d,h],m=o(d,h),g=r?m?0:s(d,h):m?s(d+(d<0?du:-du),h):0;if(!t&&(u=l=m)&&e.lineStart(),m!==l&&(!(f=a(t,p))||pd(t,f)||pd(p,f))&&(p[0]+=uu,p[1]+=uu,m=o(p[0],p[1])),m!==l)c=0,m?(e.lineStart(),f=a(p,t),e.point(f[0],f[1])):(f=a(t,p),e.point(f[0],f[1]),e.lineEnd()),t=f;else if(i&&t&&r^m){var y;g&n||!(y=a(p,t,!0))||(c=0,r?(e.lineStart(),e.point(y[0][0],y[0][1]),e.point(y[1][0],y[1][1]),e.lineEnd()):(e.point(y[1][0],y[1][1]),e.lineEnd(),e.lineStart(),e.point(y[0][0],y[0][1])))}!m||t&&pd(t,p)||e.point(p[0],p[1]),t=p,l=m,n=g},lineEnd:function(){l&&e.lineEnd(),t=null},clean:function(){return c|(u&&l)<<1}}}),(function(t,r,i,o){cd(o,e,n,i,t,r)}),r?[0,-e]:[-du,e-du])},Cd=function(e,t,n,r,i,o){var a,s=e[0],l=e[1],u=0,c=1,d=t[0]-s,h=t[1]-l;if(a=n-s,d||!(a>0)){if(a/=d,d<0){if(a<u)return;a<c&&(c=a)}else if(d>0){if(a>c)return;a>u&&(u=a)}if(a=i-s,d||!(a<0)){if(a/=d,d<0){if(a>c)return;a>u&&(u=a)}else if(d>0){if(a<u)return;a<c&&(c=a)}if(a=r-l,h||!(a>0)){if(a/=h,h<0){if(a<u)return;a<c&&(c=a)}else if(h>0){if(a>c)return;a>u&&(u=a)}if(a=o-l,h||!(a<0)){if(a/=h,h<0){if(a>c)return;a>u&&(u=a)}else if(h>0){if(a<u)return;a<c&&(c=a)}return u>0&&(e[0]=s+u*d,e[1]=l+u*h),c<1&&(t[0]=s+c*d,t[1]=l+c*h),!0}}}}},xd=1e9,Ed=-xd;function Ld(e,t,n,r){function i(i,o){return e<=i&&i<=n&&t<=o&&o<=r}function o(i,o,s,u){var c=0,d=0;if(null==i||(c=a(i,s))!==(d=a(o,s))||l(i,o)<0^s>0)do{u.point(0===c||3===c?e:n,c>1?r:t)}while((c=(c+s+4)%4)!==d);else u.point(o[0],o[1])}function a(r,i){return yu(r[0]-e)<uu?i>0?0:3:yu(r[0]-n)<uu?i>0?2:1:yu(r[1]-t)<uu?i>0?1:0:i>0?3:2}function s(e,t){return l(e.x,t.x)}function l(e,t){var n=a(e,1),r=a(t,1);return n!==r?n-r:0===n?t[1]-e[1]:1===n?e[0]-t[0]:2===n?e[1]-t[1]:t[0]-e[0]}return function(a){var l,u,c,d,h,f,p,m,g,y,v,_=a,w=fd(),b={point:M,lineStart:function(){b.point=k,u&&u.push(c=[]);y=!0,g=!1,p=m=NaN},lineEnd:function(){l&&(k(d,h),f&&g&&w.rejoin(),l.push(w.result()));b.point=M,g&&_.lineEnd()},polygonStart:function(){_=w,l=[],u=[],v=!0},polygonEnd:function(){var t=function(){for(var t=0,n=0,i=u.length;n<i;++n)for(var o,a,s=u[n],l=1,c=s.length,d=s[0],h=d[0],f=d[1];l<c;++l)o=h,a=f,d=s[l],h=d[0],f=d[1],a<=r?f>r&&(h-o)*(r-a)>(f-a)*(e-o)&&++t:f<=r&&(h-o)*(r-a)<(f-a)*(e-o)&&--t;return t}(),n=v&&t,i=(l=B(l)).length;(n||i)&&(a.polygonStart(),n&&(a.lineStart(),o(null,null,1,a),a.lineEnd()),i&&gd(l,s,t,o,a),a.polygonEnd());_=a,l=u=c=null}};function M(e,t){i(e,t)&&_.point(e,t)}function k(o,a){var s=i(o,a);if(u&&c.push([o,a]),y)d=o,h=a,f=s,y=!1,s&&(_.lineStart(),_.point(o,a));else if(s&&g)_.point(o,a);else{var l=[p=Math.max(Ed,Math.min(xd,p)),m=Math.max(Ed,Math.min(xd,m))],w=[o=Math.max(Ed,Math.min(xd,o)),a=Math.max(Ed,Math.min(xd,a))];Cd(l,w,e,t,n,r)?(g||(_.lineStart(),_.point(l[0],l[1])),_.point(w[0],w[1]),s||_.lineEnd(),v=!1):s&&(_.lineStart(),_.point(o,a),v=!1)}p=o,m=a,g=s}return b}}var Od,Dd,Rd,Ad=function(){var e,t,n,r=0,i=0,o=960,a=500;return n={stream:function(n){return e&&t===n?e:e=Ld(r,i,o,a)(t=n)},extent:function(s){return arguments.length?(r=+s[0][0],i=+s[0][1],o=+s[1][0],a=+s[1][1],e=t=null,n):[[r,i],[o,a]]}}},Nd=ou(),Yd={sphere:Ru,point:Ru,lineStart:function(){Yd.point=Hd,Yd.lineEnd=jd},lineEnd:Ru,polygonStart:Ru,polygonEnd:Ru};function jd(){Yd.point=Yd.lineEnd=Ru}function Hd(e,t){Od=e*=gu,Dd=Tu(t*=gu),Rd=wu(t),Yd.point=Pd}function Pd(e,t){e*=gu;var n=Tu(t*=gu),r=wu(t),i=yu(e-Od),o=wu(i),a=r*Tu(i),s=Rd*n-Dd*r*o,l=Dd*n+Rd*r*o;Nd.add(_u(xu(a*a+s*s),l)),Od=e,Dd=n,Rd=r}var Id=function(e){return Nd.reset(),Wu(e,Yd),+Nd},Fd=[null,null],Bd={type:"LineString",coordinates:Fd},zd=function(e,t){return Fd[0]=e,Fd[1]=t,Id(Bd)},Wd={Feature:function(e,t){return Vd(e.geometry,t)},FeatureCollection:function(e,t){for(var n=e.features,r=-1,i=n.length;++r<i;)if(Vd(n[r].geometry,t))return!0;return!1}},Ud={Sphere:function(){return!0},Point:function(e,t){return qd(e.coordinates,t)},MultiPoint:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)if(qd(n[r],t))return!0;return!1},LineString:function(e,t){return Gd(e.coordinates,t)},MultiLineString:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)if(Gd(n[r],t))return!0;return!1},Polygon:function(e,t){return Xd(e.coordinates,t)},MultiPolygon:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)if(Xd(n[r],t))return!0;return!1},GeometryCollection:function(e,t){for(var n=e.geometries,r=-1,i=n.length;++r<i;)if(Vd(n[r],t))return!0;return!1}};function Vd(e,t){return!(!e||!Ud.hasOwnProperty(e.type))&&Ud[e.type](e,t)}function qd(e,t){return 0===zd(e,t)}function Gd(e,t){for(var n,r,i,o=0,a=e.length;o<a;o++){if(0===(r=zd(e[o],t)))return!0;if(o>0&&(i=zd(e[o],e[o-1]))>0&&n<=i&&r<=i&&(n+r-i)*(1-Math.pow((n-r)/i,2))<cu*i)return!0;n=r}return!1}function Xd(e,t){return!!wd(e.map(Kd),Jd(t))}function Kd(e){return(e=e.map(Jd)).pop(),e}function Jd(e){return[e[0]*gu,e[1]*gu]}var $d=function(e,t){return(e&&Wd.hasOwnProperty(e.type)?Wd[e.type]:Vd)(e,t)};function Zd(e,t,n){var r=C(e,t-uu,n).concat(t);return function(e){return r.map((function(t){return[e,t]}))}}function Qd(e,t,n){var r=C(e,t-uu,n).concat(t);return function(e){return r.map((function(t){return[t,e]}))}}function eh(){var e,t,n,r,i,o,a,s,l,u,c,d,h=10,f=h,p=90,m=360,g=2.5;function y(){return{type:"MultiLineString",coordinates:v()}}function v(){return C(bu(r/p)*p,n,p).map(c).concat(C(bu(s/m)*m,a,m).map(d)).concat(C(bu(t/h)*h,e,h).filter((function(e){return yu(e%p)>uu})).map(l)).concat(C(bu(o/f)*f,i,f).filter((function(e){return yu(e%m)>uu})).map(u))}return y.lines=function(){return v().map((function(e){return{type:"LineString",coordinates:e}}))},y.outline=function(){return{type:"Polygon",coordinates:[c(r).concat(d(a).slice(1),c(n).reverse().slice(1),d(s).reverse().slice(1))]}},y.extent=function(e){return arguments.length?y.extentMajor(e).extentMinor(e):y.extentMinor()},y.extentMajor=function(e){return arguments.length?(r=+e[0][0],n=+e[1][0],s=+e[0][1],a=+e[1][1],r>n&&(e=r,r=n,n=e),s>a&&(e=s,s=a,a=e),y.precision(g)):[[r,s],[n,a]]},y.extentMinor=function(n){return arguments.length?(t=+n[0][0],e=+n[1][0],o=+n[0][1],i=+n[1][1],t>e&&(n=t,t=e,e=n),o>i&&(n=o,o=i,i=n),y.precision(g)):[[t,o],[e,i]]},y.step=function(e){return arguments.length?y.stepMajor(e).stepMinor(e):y.stepMinor()},y.stepMajor=function(e){return arguments.length?(p=+e[0],m=+e[1],y):[p,m]},y.stepMinor=function(e){return arguments.length?(h=+e[0],f=+e[1],y):[h,f]},y.precision=function(h){return arguments.length?(g=+h,l=Zd(o,i,90),u=Qd(t,e,g),c=Zd(s,a,90),d=Qd(r,n,g),y):g},y.extentMajor([[-180,-90+uu],[180,90-uu]]).extentMinor([[-180,-80-uu],[180,80+uu]])}function th(){return eh()()}var nh,rh,ih,oh,ah=function(e,t){var n=e[0]*gu,r=e[1]*gu,i=t[0]*gu,o=t[1]*gu,a=wu(r),s=Tu(r),l=wu(o),u=Tu(o),c=a*wu(n),d=a*Tu(n),h=l*wu(i),f=l*Tu(i),p=2*Ou(xu(Du(o-r)+a*l*Du(i-n))),m=Tu(p),g=p?function(e){var t=Tu(e*=p)/m,n=Tu(p-e)/m,r=n*c+t*h,i=n*d+t*f,o=n*s+t*u;return[_u(i,r)*mu,_u(o,xu(r*r+i*i))*mu]}:function(){return[n*mu,r*mu]};return g.distance=p,g},sh=function(e){return e},lh=ou(),uh=ou(),ch={point:Ru,lineStart:Ru,lineEnd:Ru,polygonStart:function(){ch.lineStart=dh,ch.lineEnd=ph},polygonEnd:function(){ch.lineStart=ch.lineEnd=ch.point=Ru,lh.add(yu(uh)),uh.reset()},result:function(){var e=lh/2;return lh.reset(),e}};function dh(){ch.point=hh}function hh(e,t){ch.point=fh,nh=ih=e,rh=oh=t}function fh(e,t){uh.add(oh*e-ih*t),ih=e,oh=t}function ph(){fh(nh,rh)}var mh=ch,gh=1/0,yh=gh,vh=-gh,_h=vh;var wh,bh,Mh,kh,Sh={point:function(e,t){e<gh&&(gh=e);e>vh&&(vh=e);t<yh&&(yh=t);t>_h&&(_h=t)},lineStart:Ru,lineEnd:Ru,polygonStart:Ru,polygonEnd:Ru,result:function(){var e=[[gh,yh],[vh,_h]];return vh=_h=-(yh=gh=1/0),e}},Th=0,Ch=0,xh=0,Eh=0,Lh=0,Oh=0,Dh=0,Rh=0,Ah=0,Nh={point:Yh,lineStart:jh,lineEnd:Ih,polygonStart:function(){Nh.lineStart=Fh,Nh.lineEnd=Bh},polygonEnd:function(){Nh.point=Yh,Nh.lineStart=jh,Nh.lineEnd=Ih},result:function(){var e=Ah?[Dh/Ah,Rh/Ah]:Oh?[Eh/Oh,Lh/Oh]:xh?[Th/xh,Ch/xh]:[NaN,NaN];return Th=Ch=xh=Eh=Lh=Oh=Dh=Rh=Ah=0,e}};function Yh(e,t){Th+=e,Ch+=t,++xh}function jh(){Nh.point=Hh}function Hh(e,t){Nh.point=Ph,Yh(Mh=e,kh=t)}function Ph(e,t){var n=e-Mh,r=t-kh,i=xu(n*n+r*r);Eh+=i*(Mh+e)/2,Lh+=i*(kh+t)/2,Oh+=i,Yh(Mh=e,kh=t)}function Ih(){Nh.point=Yh}function Fh(){Nh.point=zh}function Bh(){Wh(wh,bh)}function zh(e,t){Nh.point=Wh,Yh(wh=Mh=e,bh=kh=t)}function Wh(e,t){var n=e-Mh,r=t-kh,i=xu(n*n+r*r);Eh+=i*(Mh+e)/2,Lh+=i*(kh+t)/2,Oh+=i,Dh+=(i=kh*e-Mh*t)*(Mh+e),Rh+=i*(kh+t),Ah+=3*i,Yh(Mh=e,kh=t)}var Uh=Nh;function Vh(e){this._context=e}Vh.prototype={_radius:4.5,pointRadius:function(e){return this._radius=e,this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._context.closePath(),this._point=NaN},point:function(e,t){switch(this._point){case 0:this._context.moveTo(e,t),this._point=1;break;case 1:this._context.lineTo(e,t);break;default:this._context.moveTo(e+this._radius,t),this._context.arc(e,t,this._radius,0,pu)}},result:Ru};var qh,Gh,Xh,Kh,Jh,$h=ou(),Zh={point:Ru,lineStart:function(){Zh.point=Qh},lineEnd:function(){qh&&ef(Gh,Xh),Zh.point=Ru},polygonStart:function(){qh=!0},polygonEnd:function(){qh=null},result:function(){var e=+$h;return $h.reset(),e}};function Qh(e,t){Zh.point=ef,Gh=Kh=e,Xh=Jh=t}function ef(e,t){Kh-=e,Jh-=t,$h.add(xu(Kh*Kh+Jh*Jh)),Kh=e,Jh=t}var tf=Zh;function nf(){this._string=[]}function rf(e){return"m0,"+e+"a"+e+","+e+" 0 1,1 0,"+-2*e+"a"+e+","+e+" 0 1,1 0,"+2*e+"z"}nf.prototype={_radius:4.5,_circle:rf(4.5),pointRadius:function(e){return(e=+e)!==this._radius&&(this._radius=e,this._circle=null),this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._string.push("Z"),this._point=NaN},point:function(e,t){switch(this._point){case 0:this._string.push("M",e,",",t),this._point=1;break;case 1:this._string.push("L",e,",",t);break;default:null==this._circle&&(this._circle=rf(this._radius)),this._string.push("M",e,",",t,this._circle)}},result:function(){if(this._string.length){var e=this._string.join("");return this._string=[],e}return null}};var of=function(e,t){var n,r,i=4.5;function o(e){return e&&("function"==typeof i&&r.pointRadius(+i.apply(this,arguments)),Wu(e,n(r))),r.result()}return o.area=function(e){return Wu(e,n(mh)),mh.result()},o.measure=function(e){return Wu(e,n(tf)),tf.result()},o.bounds=function(e){return Wu(e,n(Sh)),Sh.result()},o.centroid=function(e){return Wu(e,n(Uh)),Uh.result()},o.projection=function(t){return arguments.length?(n=null==t?(e=null,sh):(e=t).stream,o):e},o.context=function(e){return arguments.length?(r=null==e?(t=null,new nf):new Vh(t=e),"function"!=typeof i&&r.pointRadius(i),o):t},o.pointRadius=function(e){return arguments.length?(i="function"==typeof e?e:(r.pointRadius(+e),+e),o):i},o.projection(e).context(t)},af=function(e){return{stream:sf(e)}};function sf(e){return function(t){var n=new lf;for(var r in e)n[r]=e[r];return n.stream=t,n}}function lf(){}function uf(e,t,n){var r=e.clipExtent&&e.clipExtent();return e.scale(150).translate([0,0]),null!=r&&e.clipExtent(null),Wu(n,e.stream(Sh)),t(Sh.result()),null!=r&&e.clipExtent(r),e}function cf(e,t,n){return uf(e,(function(n){var r=t[1][0]-t[0][0],i=t[1][1]-t[0][1],o=Math.min(r/(n[1][0]-n[0][0]),i/(n[1][1]-n[0][1])),a=+t[0][0]+(r-o*(n[1][0]+n[0][0]))/2,s=+t[0][1]+(i-o*(n[1][1]+n[0][1]))/2;e.scale(150*o).translate([a,s])}),n)}function df(e,t,n){return cf(e,[[0,0],t],n)}function hf(e,t,n){return uf(e,(function(n){var r=+t,i=r/(n[1][0]-n[0][0]),o=(r-i*(n[1][0]+n[0][0]))/2,a=-i*n[0][1];e.scale(150*i).translate([o,a])}),n)}function ff(e,t,n){return uf(e,(function(n){var r=+t,i=r/(n[1][1]-n[0][1]),o=-i*n[0][0],a=(r-i*(n[1][1]+n[0][1]))/2;e.scale(150*i).translate([o,a])}),n)}lf.prototype={constructor:lf,point:function(e,t){this.stream.point(e,t)},sphere:function(){this.stream.sphere()},lineStart:function(){this.stream.lineStart()},lineEnd:function(){this.stream.lineEnd()},polygonStart:function(){this.stream.polygonStart()},polygonEnd:function(){this.stream.polygonEnd()}};var pf=16,mf=wu(30*gu),gf=function(e,t){return+t?function(e,t){function n(r,i,o,a,s,l,u,c,d,h,f,p,m,g){var y=u-r,v=c-i,_=y*y+v*v;if(_>4*t&&m--){var w=a+h,b=s+f,M=l+p,k=xu(w*w+b*b+M*M),S=Ou(M/=k),T=yu(yu(M)-1)<uu||yu(o-d)<uu?(o+d)/2:_u(b,w),C=e(T,S),x=C[0],E=C[1],L=x-r,O=E-i,D=v*L-y*O;(D*D/_>t||yu((y*L+v*O)/_-.5)>.3||a*h+s*f+l*p<mf)&&(n(r,i,o,a,s,l,x,E,T,w/=k,b/=k,M,m,g),g.point(x,E),n(x,E,T,w,b,M,u,c,d,h,f,p,m,g))}}return function(t){var r,i,o,a,s,l,u,c,d,h,f,p,m={point:g,lineStart:y,lineEnd:_,polygonStart:function(){t.polygonStart(),m.lineStart=w},polygonEnd:function(){t.polygonEnd(),m.lineStart=y}};function g(n,r){n=e(n,r),t.point(n[0],n[1])}function y(){c=NaN,m.point=v,t.lineStart()}function v(r,i){var o=Qu([r,i]),a=e(r,i);n(c,d,u,h,f,p,c=a[0],d=a[1],u=r,h=o[0],f=o[1],p=o[2],pf,t),t.point(c,d)}function _(){m.point=g,t.lineEnd()}function w(){y(),m.point=b,m.lineEnd=M}function b(e,t){v(r=e,t),i=c,o=d,a=h,s=f,l=p,m.point=v}function M(){n(c,d,u,h,f,p,i,o,r,a,s,l,pf,t),m.lineEnd=_,_()}return m}}(e,t):function(e){return sf({point:function(t,n){t=e(t,n),this.stream.point(t[0],t[1])}})}(e)};var yf=sf({point:function(e,t){this.stream.point(e*gu,t*gu)}});function vf(e,t,n){function r(r,i){return[t+e*r,n-e*i]}return r.invert=function(r,i){return[(r-t)/e,(n-i)/e]},r}function _f(e,t,n,r){var i=wu(r),o=Tu(r),a=i*e,s=o*e,l=i/e,u=o/e,c=(o*n-i*t)/e,d=(o*t+i*n)/e;function h(e,r){return[a*e-s*r+t,n-s*e-a*r]}return h.invert=function(e,t){return[l*e-u*t+c,d-u*e-l*t]},h}function wf(e){return bf((function(){return e}))()}function bf(e){var t,n,r,i,o,a,s,l,u,c,d=150,h=480,f=250,p=0,m=0,g=0,y=0,v=0,_=0,w=null,b=Sd,M=null,k=sh,S=.5;function T(e){return l(e[0]*gu,e[1]*gu)}function C(e){return(e=l.invert(e[0],e[1]))&&[e[0]*mu,e[1]*mu]}function x(){var e=_f(d,0,0,_).apply(null,t(p,m)),r=(_?_f:vf)(d,h-e[0],f-e[1],_);return n=od(g,y,v),s=rd(t,r),l=rd(n,s),a=gf(s,S),E()}function E(){return u=c=null,T}return T.stream=function(e){return u&&c===e?u:u=yf(function(e){return sf({point:function(t,n){var r=e(t,n);return this.stream.point(r[0],r[1])}})}(n)(b(a(k(c=e)))))},T.preclip=function(e){return arguments.length?(b=e,w=void 0,E()):b},T.postclip=function(e){return arguments.length?(k=e,M=r=i=o=null,E()):k},T.clipAngle=function(e){return arguments.length?(b=+e?Td(w=e*gu):(w=null,Sd),E()):w*mu},T.clipExtent=function(e){return arguments.length?(k=null==e?(M=r=i=o=null,sh):Ld(M=+e[0][0],r=+e[0][1],i=+e[1][0],o=+e[1][1]),E()):null==M?null:[[M,r],[i,o]]},T.scale=function(e){return arguments.length?(d=+e,x()):d},T.translate=function(e){return arguments.length?(h=+e[0],f=+e[1],x()):[h,f]},T.center=function(e){return arguments.length?(p=e[0]%360*gu,m=e[1]%360*gu,x()):[p*mu,m*mu]},T.rotate=function(e){return arguments.length?(g=e[0]%360*gu,y=e[1]%360*gu,v=e.length>2?e[2]%360*gu:0,x()):[g*mu,y*mu,v*mu]},T.angle=function(e){return arguments.length?(_=e%360*gu,x()):_*mu},T.precision=function(e){return arguments.length?(a=gf(s,S=e*e),E()):xu(S)},T.fitExtent=function(e,t){return cf(T,e,t)},T.fitSize=function(e,t){return df(T,e,t)},T.fitWidth=function(e,t){return hf(T,e,t)},T.fitHeight=function(e,t){return ff(T,e,t)},function(){return t=e.apply(this,arguments),T.invert=t.invert&&C,x()}}function Mf(e){var t=0,n=du/3,r=bf(e),i=r(t,n);return i.parallels=function(e){return arguments.length?r(t=e[0]*gu,n=e[1]*gu):[t*mu,n*mu]},i}function kf(e,t){var n=Tu(e),r=(n+Tu(t))/2;if(yu(r)<uu)return function(e){var t=wu(e);function n(e,n){return[e*t,Tu(n)/t]}return n.invert=function(e,n){return[e/t,Ou(n*t)]},n}(e);var i=1+n*(2*r-n),o=xu(i)/r;function a(e,t){var n=xu(i-2*r*Tu(t))/r;return[n*Tu(e*=r),o-n*wu(e)]}return a.invert=function(e,t){var n=o-t;return[_u(e,yu(n))/r*Cu(n),Ou((i-(e*e+n*n)*r*r)/(2*r))]},a}var Sf=function(){return Mf(kf).scale(155.424).center([0,33.6442])},Tf=function(){return Sf().parallels([29.5,45.5]).scale(1070).translate([480,250]).rotate([96,0]).center([-.6,38.7])};var Cf=function(){var e,t,n,r,i,o,a=Tf(),s=Sf().rotate([154,0]).center([-2,58.5]).parallels([55,65]),l=Sf().rotate([157,0]).center([-3,19.9]).parallels([8,18]),u={point:function(e,t){o=[e,t]}};function c(e){var t=e[0],a=e[1];return o=null,n.point(t,a),o||(r.point(t,a),o)||(i.point(t,a),o)}function d(){return e=t=null,c}return c.invert=function(e){var t=a.scale(),n=a.translate(),r=(e[0]-n[0])/t,i=(e[1]-n[1])/t;return(i>=.12&&i<.234&&r>=-.425&&r<-.214?s:i>=.166&&i<.234&&r>=-.214&&r<-.115?l:a).invert(e)},c.stream=function(n){return e&&t===n?e:(r=[a.stream(t=n),s.stream(n),l.stream(n)],i=r.length,e={point:function(e,t){for(var n=-1;++n<i;)r[n].point(e,t)},sphere:function(){for(var e=-1;++e<i;)r[e].sphere()},lineStart:function(){for(var e=-1;++e<i;)r[e].lineStart()},lineEnd:function(){for(var e=-1;++e<i;)r[e].lineEnd()},polygonStart:function(){for(var e=-1;++e<i;)r[e].polygonStart()},polygonEnd:function(){for(var e=-1;++e<i;)r[e].polygonEnd()}});var r,i},c.precision=function(e){return arguments.length?(a.precision(e),s.precision(e),l.precision(e),d()):a.precision()},c.scale=function(e){return arguments.length?(a.scale(e),s.scale(.35*e),l.scale(e),c.translate(a.translate())):a.scale()},c.translate=function(e){if(!arguments.length)return a.translate();var t=a.scale(),o=+e[0],c=+e[1];return n=a.translate(e).clipExtent([[o-.455*t,c-.238*t],[o+.455*t,c+.238*t]]).stream(u),r=s.translate([o-.307*t,c+.201*t]).clipExtent([[o-.425*t+uu,c+.12*t+uu],[o-.214*t-uu,c+.234*t-uu]]).stream(u),i=l.translate([o-.205*t,c+.212*t]).clipExtent([[o-.214*t+uu,c+.166*t+uu],[o-.115*t-uu,c+.234*t-uu]]).stream(u),d()},c.fitExtent=function(e,t){return cf(c,e,t)},c.fitSize=function(e,t){return df(c,e,t)},c.fitWidth=function(e,t){return hf(c,e,t)},c.fitHeight=function(e,t){return ff(c,e,t)},c.scale(1070)};function xf(e){return function(t,n){var r=wu(t),i=wu(n),o=e(r*i);return[o*i*Tu(t),o*Tu(n)]}}function Ef(e){return function(t,n){var r=xu(t*t+n*n),i=e(r),o=Tu(i),a=wu(i);return[_u(t*o,r*a),Ou(r&&n*o/r)]}}var Lf=xf((function(e){return xu(2/(1+e))}));Lf.invert=Ef((function(e){return 2*Ou(e/2)}));var Of=function(){return wf(Lf).scale(124.75).clipAngle(179.999)},Df=xf((function(e){return(e=Lu(e))&&e/Tu(e)}));Df.invert=Ef((function(e){return e}));var Rf=function(){return wf(Df).scale(79.4188).clipAngle(179.999)};function Af(e,t){return[e,ku(Eu((hu+t)/2))]}Af.invert=function(e,t){return[e,2*vu(Mu(t))-hu]};var Nf=function(){return Yf(Af).scale(961/pu)};function Yf(e){var t,n,r,i=wf(e),o=i.center,a=i.scale,s=i.translate,l=i.clipExtent,u=null;function c(){var o=du*a(),s=i(ud(i.rotate()).invert([0,0]));return l(null==u?[[s[0]-o,s[1]-o],[s[0]+o,s[1]+o]]:e===Af?[[Math.max(s[0]-o,u),t],[Math.min(s[0]+o,n),r]]:[[u,Math.max(s[1]-o,t)],[n,Math.min(s[1]+o,r)]])}return i.scale=function(e){return arguments.length?(a(e),c()):a()},i.translate=function(e){return arguments.length?(s(e),c()):s()},i.center=function(e){return arguments.length?(o(e),c()):o()},i.clipExtent=function(e){return arguments.length?(null==e?u=t=n=r=null:(u=+e[0][0],t=+e[0][1],n=+e[1][0],r=+e[1][1]),c()):null==u?null:[[u,t],[n,r]]},c()}function jf(e){return Eu((hu+e)/2)}function Hf(e,t){var n=wu(e),r=e===t?Tu(e):ku(n/wu(t))/ku(jf(t)/jf(e)),i=n*Su(jf(e),r)/r;if(!r)return Af;function o(e,t){i>0?t<-hu+uu&&(t=-hu+uu):t>hu-uu&&(t=hu-uu);var n=i/Su(jf(t),r);return[n*Tu(r*e),i-n*wu(r*e)]}return o.invert=function(e,t){var n=i-t,o=Cu(r)*xu(e*e+n*n);return[_u(e,yu(n))/r*Cu(n),2*vu(Su(i/o,1/r))-hu]},o}var Pf=function(){return Mf(Hf).scale(109.5).parallels([30,30])};function If(e,t){return[e,t]}If.invert=If;var Ff=function(){return wf(If).scale(152.63)};function Bf(e,t){var n=wu(e),r=e===t?Tu(e):(n-wu(t))/(t-e),i=n/r+e;if(yu(r)<uu)return If;function o(e,t){var n=i-t,o=r*e;return[n*Tu(o),i-n*wu(o)]}return o.invert=function(e,t){var n=i-t;return[_u(e,yu(n))/r*Cu(n),i-Cu(r)*xu(e*e+n*n)]},o}var zf=function(){return Mf(Bf).scale(131.154).center([0,13.9389])},Wf=1.340264,Uf=-.081106,Vf=893e-6,qf=.003796,Gf=xu(3)/2;function Xf(e,t){var n=Ou(Gf*Tu(t)),r=n*n,i=r*r*r;return[e*wu(n)/(Gf*(Wf+3*Uf*r+i*(7*Vf+9*qf*r))),n*(Wf+Uf*r+i*(Vf+qf*r))]}Xf.invert=function(e,t){for(var n,r=t,i=r*r,o=i*i*i,a=0;a<12&&(o=(i=(r-=n=(r*(Wf+Uf*i+o*(Vf+qf*i))-t)/(Wf+3*Uf*i+o*(7*Vf+9*qf*i)))*r)*i*i,!(yu(n)<cu));++a);return[Gf*e*(Wf+3*Uf*i+o*(7*Vf+9*qf*i))/wu(r),Ou(Tu(r)/Gf)]};var Kf=function(){return wf(Xf).scale(177.158)};function Jf(e,t){var n=wu(t),r=wu(e)*n;return[n*Tu(e)/r,Tu(t)/r]}Jf.invert=Ef(vu);var $f=function(){return wf(Jf).scale(144.049).clipAngle(60)};function Zf(e,t,n,r){return 1===e&&1===t&&0===n&&0===r?sh:sf({point:function(i,o){this.stream.point(i*e+n,o*t+r)}})}var Qf=function(){var e,t,n,r,i,o,a=1,s=0,l=0,u=1,c=1,d=sh,h=null,f=sh;function p(){return r=i=null,o}return o={stream:function(e){return r&&i===e?r:r=d(f(i=e))},postclip:function(r){return arguments.length?(f=r,h=e=t=n=null,p()):f},clipExtent:function(r){return arguments.length?(f=null==r?(h=e=t=n=null,sh):Ld(h=+r[0][0],e=+r[0][1],t=+r[1][0],n=+r[1][1]),p()):null==h?null:[[h,e],[t,n]]},scale:function(e){return arguments.length?(d=Zf((a=+e)*u,a*c,s,l),p()):a},translate:function(e){return arguments.length?(d=Zf(a*u,a*c,s=+e[0],l=+e[1]),p()):[s,l]},reflectX:function(e){return arguments.length?(d=Zf(a*(u=e?-1:1),a*c,s,l),p()):u<0},reflectY:function(e){return arguments.length?(d=Zf(a*u,a*(c=e?-1:1),s,l),p()):c<0},fitExtent:function(e,t){return cf(o,e,t)},fitSize:function(e,t){return df(o,e,t)},fitWidth:function(e,t){return hf(o,e,t)},fitHeight:function(e,t){return ff(o,e,t)}}};function ep(e,t){var n=t*t,r=n*n;return[e*(.8707-.131979*n+r*(r*(.003971*n-.001529*r)-.013791)),t*(1.007226+n*(.015085+r*(.028874*n-.044475-.005916*r)))]}ep.invert=function(e,t){var n,r=t,i=25;do{var o=r*r,a=o*o;r-=n=(r*(1.007226+o*(.015085+a*(.028874*o-.044475-.005916*a)))-t)/(1.007226+o*(.045255+a*(.259866*o-.311325-.005916*11*a)))}while(yu(n)>uu&&--i>0);return[e/(.8707+(o=r*r)*(o*(o*o*o*(.003971-.001529*o)-.013791)-.131979)),r]};var tp=function(){return wf(ep).scale(175.295)};function np(e,t){return[wu(t)*Tu(e),Tu(t)]}np.invert=Ef(Ou);var rp=function(){return wf(np).scale(249.5).clipAngle(90+uu)};function ip(e,t){var n=wu(t),r=1+wu(e)*n;return[n*Tu(e)/r,Tu(t)/r]}ip.invert=Ef((function(e){return 2*vu(e)}));var op=function(){return wf(ip).scale(250).clipAngle(142)};function ap(e,t){return[ku(Eu((hu+t)/2)),-e]}ap.invert=function(e,t){return[-t,2*vu(Mu(e))-hu]};var sp=function(){var e=Yf(ap),t=e.center,n=e.rotate;return e.center=function(e){return arguments.length?t([-e[1],e[0]]):[(e=t())[1],-e[0]]},e.rotate=function(e){return arguments.length?n([e[0],e[1],e.length>2?e[2]+90:90]):[(e=n())[0],e[1],e[2]-90]},n([0,0,90]).scale(159.155)};function lp(e,t){return e.parent===t.parent?1:2}function up(e,t){return e+t.x}function cp(e,t){return Math.max(e,t.y)}var dp=function(){var e=lp,t=1,n=1,r=!1;function i(i){var o,a=0;i.eachAfter((function(t){var n=t.children;n?(t.x=function(e){return e.reduce(up,0)/e.length}(n),t.y=function(e){return 1+e.reduce(cp,0)}(n)):(t.x=o?a+=e(t,o):0,t.y=0,o=t)}));var s=function(e){for(var t;t=e.children;)e=t[0];return e}(i),l=function(e){for(var t;t=e.children;)e=t[t.length-1];return e}(i),u=s.x-e(s,l)/2,c=l.x+e(l,s)/2;return i.eachAfter(r?function(e){e.x=(e.x-i.x)*t,e.y=(i.y-e.y)*n}:function(e){e.x=(e.x-u)/(c-u)*t,e.y=(1-(i.y?e.y/i.y:1))*n})}return i.separation=function(t){return arguments.length?(e=t,i):e},i.size=function(e){return arguments.length?(r=!1,t=+e[0],n=+e[1],i):r?null:[t,n]},i.nodeSize=function(e){return arguments.length?(r=!0,t=+e[0],n=+e[1],i):r?[t,n]:null},i};function hp(e){var t=0,n=e.children,r=n&&n.length;if(r)for(;--r>=0;)t+=n[r].value;else t=1;e.value=t}function fp(e,t){var n,r,i,o,a,s=new yp(e),l=+e.value&&(s.value=e.value),u=[s];for(null==t&&(t=pp);n=u.pop();)if(l&&(n.value=+n.data.value),(i=t(n.data))&&(a=i.length))for(n.children=new Array(a),o=a-1;o>=0;--o)u.push(r=n.children[o]=new yp(i[o])),r.parent=n,r.depth=n.depth+1;return s.eachBefore(gp)}function pp(e){return e.children}function mp(e){e.data=e.data.data}function gp(e){var t=0;do{e.height=t}while((e=e.parent)&&e.height<++t)}function yp(e){this.data=e,this.depth=this.height=0,this.parent=null}yp.prototype=fp.prototype={constructor:yp,count:function(){return this.eachAfter(hp)},each:function(e){var t,n,r,i,o=this,a=[o];do{for(t=a.reverse(),a=[];o=t.pop();)if(e(o),n=o.children)for(r=0,i=n.length;r<i;++r)a.push(n[r])}while(a.length);return this},eachAfter:function(e){for(var t,n,r,i=this,o=[i],a=[];i=o.pop();)if(a.push(i),t=i.children)for(n=0,r=t.length;n<r;++n)o.push(t[n]);for(;i=a.pop();)e(i);return this},eachBefore:function(e){for(var t,n,r=this,i=[r];r=i.pop();)if(e(r),t=r.children)for(n=t.length-1;n>=0;--n)i.push(t[n]);return this},sum:function(e){return this.eachAfter((function(t){for(var n=+e(t.data)||0,r=t.children,i=r&&r.length;--i>=0;)n+=r[i].value;t.value=n}))},sort:function(e){return this.eachBefore((function(t){t.children&&t.children.sort(e)}))},path:function(e){for(var t=this,n=function(e,t){if(e===t)return e;var n=e.ancestors(),r=t.ancestors(),i=null;e=n.pop(),t=r.pop();for(;e===t;)i=e,e=n.pop(),t=r.pop();return i}(t,e),r=[t];t!==n;)t=t.parent,r.push(t);for(var i=r.length;e!==n;)r.splice(i,0,e),e=e.parent;return r},ancestors:function(){for(var e=this,t=[e];e=e.parent;)t.push(e);return t},descendants:function(){var e=[];return this.each((function(t){e.push(t)})),e},leaves:function(){var e=[];return this.eachBefore((function(t){t.children||e.push(t)})),e},links:function(){var e=this,t=[];return e.each((function(n){n!==e&&t.push({source:n.parent,target:n})})),t},copy:function(){return fp(this).eachBefore(mp)}};var vp=Array.prototype.slice;var _p=function(e){for(var t,n,r=0,i=(e=function(e){for(var t,n,r=e.length;r;)n=Math.random()*r--|0,t=e[r],e[r]=e[n],e[n]=t;return e}(vp.call(e))).length,o=[];r<i;)t=e[r],n&&Mp(n,t)?++r:(n=Sp(o=wp(o,t)),r=0);return n};function wp(e,t){var n,r;if(kp(t,e))return[t];for(n=0;n<e.length;++n)if(bp(t,e[n])&&kp(Tp(e[n],t),e))return[e[n],t];for(n=0;n<e.length-1;++n)for(r=n+1;r<e.length;++r)if(bp(Tp(e[n],e[r]),t)&&bp(Tp(e[n],t),e[r])&&bp(Tp(e[r],t),e[n])&&kp(Cp(e[n],e[r],t),e))return[e[n],e[r],t];throw new Error}function bp(e,t){var n=e.r-t.r,r=t.x-e.x,i=t.y-e.y;return n<0||n*n<r*r+i*i}function Mp(e,t){var n=e.r-t.r+1e-6,r=t.x-e.x,i=t.y-e.y;return n>0&&n*n>r*r+i*i}function kp(e,t){for(var n=0;n<t.length;++n)if(!Mp(e,t[n]))return!1;return!0}function Sp(e){switch(e.length){case 1:return{x:(t=e[0]).x,y:t.y,r:t.r};case 2:return Tp(e[0],e[1]);case 3:return Cp(e[0],e[1],e[2])}var t}function Tp(e,t){var n=e.x,r=e.y,i=e.r,o=t.x,a=t.y,s=t.r,l=o-n,u=a-r,c=s-i,d=Math.sqrt(l*l+u*u);return{x:(n+o+l/d*c)/2,y:(r+a+u/d*c)/2,r:(d+i+s)/2}}function Cp(e,t,n){var r=e.x,i=e.y,o=e.r,a=t.x,s=t.y,l=t.r,u=n.x,c=n.y,d=n.r,h=r-a,f=r-u,p=i-s,m=i-c,g=l-o,y=d-o,v=r*r+i*i-o*o,_=v-a*a-s*s+l*l,w=v-u*u-c*c+d*d,b=f*p-h*m,M=(p*w-m*_)/(2*b)-r,k=(m*g-p*y)/b,S=(f*_-h*w)/(2*b)-i,T=(h*y-f*g)/b,C=k*k+T*T-1,x=2*(o+M*k+S*T),E=M*M+S*S-o*o,L=-(C?(x+Math.sqrt(x*x-4*C*E))/(2*C):E/x);return{x:r+M+k*L,y:i+S+T*L,r:L}}function xp(e,t,n){var r,i,o,a,s=e.x-t.x,l=e.y-t.y,u=s*s+l*l;u?(i=t.r+n.r,i*=i,a=e.r+n.r,i>(a*=a)?(r=(u+a-i)/(2*u),o=Math.sqrt(Math.max(0,a/u-r*r)),n.x=e.x-r*s-o*l,n.y=e.y-r*l+o*s):(r=(u+i-a)/(2*u),o=Math.sqrt(Math.max(0,i/u-r*r)),n.x=t.x+r*s-o*l,n.y=t.y+r*l+o*s)):(n.x=t.x+n.r,n.y=t.y)}function Ep(e,t){var n=e.r+t.r-1e-6,r=t.x-e.x,i=t.y-e.y;return n>0&&n*n>r*r+i*i}function Lp(e){var t=e._,n=e.next._,r=t.r+n.r,i=(t.x*n.r+n.x*t.r)/r,o=(t.y*n.r+n.y*t.r)/r;return i*i+o*o}function Op(e){this._=e,this.next=null,this.previous=null}function Dp(e){if(!(i=e.length))return 0;var t,n,r,i,o,a,s,l,u,c,d;if((t=e[0]).x=0,t.y=0,!(i>1))return t.r;if(n=e[1],t.x=-n.r,n.x=t.r,n.y=0,!(i>2))return t.r+n.r;xp(n,t,r=e[2]),t=new Op(t),n=new Op(n),r=new Op(r),t.next=r.previous=n,n.next=t.previous=r,r.next=n.previous=t;e:for(s=3;s<i;++s){xp(t._,n._,r=e[s]),r=new Op(r),l=n.next,u=t.previous,c=n._.r,d=t._.r;do{if(c<=d){if(Ep(l._,r._)){n=l,t.next=n,n.previous=t,--s;continue e}c+=l._.r,l=l.next}else{if(Ep(u._,r._)){(t=u).next=n,n.previous=t,--s;continue e}d+=u._.r,u=u.previous}}while(l!==u.next);for(r.previous=t,r.next=n,t.next=n.previous=n=r,o=Lp(t);(r=r.next)!==n;)(a=Lp(r))<o&&(t=r,o=a);n=t.next}for(t=[n._],r=n;(r=r.next)!==n;)t.push(r._);for(r=_p(t),s=0;s<i;++s)(t=e[s]).x-=r.x,t.y-=r.y;return r.r}var Rp=function(e){return Dp(e),e};function Ap(e){return null==e?null:Np(e)}function Np(e){if("function"!=typeof e)throw new Error;return e}function Yp(){return 0}var jp=function(e){return function(){return e}};function Hp(e){return Math.sqrt(e.value)}var Pp=function(){var e=null,t=1,n=1,r=Yp;function i(i){return i.x=t/2,i.y=n/2,e?i.eachBefore(Ip(e)).eachAfter(Fp(r,.5)).eachBefore(Bp(1)):i.eachBefore(Ip(Hp)).eachAfter(Fp(Yp,1)).eachAfter(Fp(r,i.r/Math.min(t,n))).eachBefore(Bp(Math.min(t,n)/(2*i.r))),i}return i.radius=function(t){return arguments.length?(e=Ap(t),i):e},i.size=function(e){return arguments.length?(t=+e[0],n=+e[1],i):[t,n]},i.padding=function(e){return arguments.length?(r="function"==typeof e?e:jp(+e),i):r},i};function Ip(e){return function(t){t.children||(t.r=Math.max(0,+e(t)||0))}}function Fp(e,t){return function(n){if(r=n.children){var r,i,o,a=r.length,s=e(n)*t||0;if(s)for(i=0;i<a;++i)r[i].r+=s;if(o=Dp(r),s)for(i=0;i<a;++i)r[i].r-=s;n.r=o+s}}}function Bp(e){return function(t){var n=t.parent;t.r*=e,n&&(t.x=n.x+e*t.x,t.y=n.y+e*t.y)}}var zp=function(e){e.x0=Math.round(e.x0),e.y0=Math.round(e.y0),e.x1=Math.round(e.x1),e.y1=Math.round(e.y1)},Wp=function(e,t,n,r,i){for(var o,a=e.children,s=-1,l=a.length,u=e.value&&(r-t)/e.value;++s<l;)(o=a[s]).y0=n,o.y1=i,o.x0=t,o.x1=t+=o.value*u},Up=function(){var e=1,t=1,n=0,r=!1;function i(i){var o=i.height+1;return i.x0=i.y0=n,i.x1=e,i.y1=t/o,i.eachBefore(function(e,t){return function(r){r.children&&Wp(r,r.x0,e*(r.depth+1)/t,r.x1,e*(r.depth+2)/t);var i=r.x0,o=r.y0,a=r.x1-n,s=r.y1-n;a<i&&(i=a=(i+a)/2),s<o&&(o=s=(o+s)/2),r.x0=i,r.y0=o,r.x1=a,r.y1=s}}(t,o)),r&&i.eachBefore(zp),i}return i.round=function(e){return arguments.length?(r=!!e,i):r},i.size=function(n){return arguments.length?(e=+n[0],t=+n[1],i):[e,t]},i.padding=function(e){return arguments.length?(n=+e,i):n},i},Vp="$",qp={depth:-1},Gp={};function Xp(e){return e.id}function Kp(e){return e.parentId}var Jp=function(){var e=Xp,t=Kp;function n(n){var r,i,o,a,s,l,u,c=n.length,d=new Array(c),h={};for(i=0;i<c;++i)r=n[i],s=d[i]=new yp(r),null!=(l=e(r,i,n))&&(l+="")&&(h[u=Vp+(s.id=l)]=u in h?Gp:s);for(i=0;i<c;++i)if(s=d[i],null!=(l=t(n[i],i,n))&&(l+="")){if(!(a=h[Vp+l]))throw new Error("missing: "+l);if(a===Gp)throw new Error("ambiguous: "+l);a.children?a.children.push(s):a.children=[s],s.parent=a}else{if(o)throw new Error("multiple roots");o=s}if(!o)throw new Error("no root");if(o.parent=qp,o.eachBefore((function(e){e.depth=e.parent.depth+1,--c})).eachBefore(gp),o.parent=null,c>0)throw new Error("cycle");return o}return n.id=function(t){return arguments.length?(e=Np(t),n):e},n.parentId=function(e){return arguments.length?(t=Np(e),n):t},n};function $p(e,t){return e.parent===t.parent?1:2}function Zp(e){var t=e.children;return t?t[0]:e.t}function Qp(e){var t=e.children;return t?t[t.length-1]:e.t}function em(e,t,n){var r=n/(t.i-e.i);t.c-=r,t.s+=n,e.c+=r,t.z+=n,t.m+=n}function tm(e,t,n){return e.a.parent===t.parent?e.a:n}function nm(e,t){this._=e,this.parent=null,this.children=null,this.A=null,this.a=this,this.z=0,this.m=0,this.c=0,this.s=0,this.t=null,this.i=t}nm.prototype=Object.create(yp.prototype);var rm=function(){var e=$p,t=1,n=1,r=null;function i(i){var l=function(e){for(var t,n,r,i,o,a=new nm(e,0),s=[a];t=s.pop();)if(r=t._.children)for(t.children=new Array(o=r.length),i=o-1;i>=0;--i)s.push(n=t.children[i]=new nm(r[i],i)),n.parent=t;return(a.parent=new nm(null,0)).children=[a],a}(i);if(l.eachAfter(o),l.parent.m=-l.z,l.eachBefore(a),r)i.eachBefore(s);else{var u=i,c=i,d=i;i.eachBefore((function(e){e.x<u.x&&(u=e),e.x>c.x&&(c=e),e.depth>d.depth&&(d=e)}));var h=u===c?1:e(u,c)/2,f=h-u.x,p=t/(c.x+h+f),m=n/(d.depth||1);i.eachBefore((function(e){e.x=(e.x+f)*p,e.y=e.depth*m}))}return i}function o(t){var n=t.children,r=t.parent.children,i=t.i?r[t.i-1]:null;if(n){!function(e){for(var t,n=0,r=0,i=e.children,o=i.length;--o>=0;)(t=i[o]).z+=n,t.m+=n,n+=t.s+(r+=t.c)}(t);var o=(n[0].z+n[n.length-1].z)/2;i?(t.z=i.z+e(t._,i._),t.m=t.z-o):t.z=o}else i&&(t.z=i.z+e(t._,i._));t.parent.A=function(t,n,r){if(n){for(var i,o=t,a=t,s=n,l=o.parent.children[0],u=o.m,c=a.m,d=s.m,h=l.m;s=Qp(s),o=Zp(o),s&&o;)l=Zp(l),(a=Qp(a)).a=t,(i=s.z+d-o.z-u+e(s._,o._))>0&&(em(tm(s,t,r),t,i),u+=i,c+=i),d+=s.m,u+=o.m,h+=l.m,c+=a.m;s&&!Qp(a)&&(a.t=s,a.m+=d-c),o&&!Zp(l)&&(l.t=o,l.m+=u-h,r=t)}return r}(t,i,t.parent.A||r[0])}function a(e){e._.x=e.z+e.parent.m,e.m+=e.parent.m}function s(e){e.x*=t,e.y=e.depth*n}return i.separation=function(t){return arguments.length?(e=t,i):e},i.size=function(e){return arguments.length?(r=!1,t=+e[0],n=+e[1],i):r?null:[t,n]},i.nodeSize=function(e){return arguments.length?(r=!0,t=+e[0],n=+e[1],i):r?[t,n]:null},i},im=function(e,t,n,r,i){for(var o,a=e.children,s=-1,l=a.length,u=e.value&&(i-n)/e.value;++s<l;)(o=a[s]).x0=t,o.x1=r,o.y0=n,o.y1=n+=o.value*u},om=(1+Math.sqrt(5))/2;function am(e,t,n,r,i,o){for(var a,s,l,u,c,d,h,f,p,m,g,y=[],v=t.children,_=0,w=0,b=v.length,M=t.value;_<b;){l=i-n,u=o-r;do{c=v[w++].value}while(!c&&w<b);for(d=h=c,g=c*c*(m=Math.max(u/l,l/u)/(M*e)),p=Math.max(h/g,g/d);w<b;++w){if(c+=s=v[w].value,s<d&&(d=s),s>h&&(h=s),g=c*c*m,(f=Math.max(h/g,g/d))>p){c-=s;break}p=f}y.push(a={value:c,dice:l<u,children:v.slice(_,w)}),a.dice?Wp(a,n,r,i,M?r+=u*c/M:o):im(a,n,r,M?n+=l*c/M:i,o),M-=c,_=w}return y}var sm=function e(t){function n(e,n,r,i,o){am(t,e,n,r,i,o)}return n.ratio=function(t){return e((t=+t)>1?t:1)},n}(om),lm=function(){var e=sm,t=!1,n=1,r=1,i=[0],o=Yp,a=Yp,s=Yp,l=Yp,u=Yp;function c(e){return e.x0=e.y0=0,e.x1=n,e.y1=r,e.eachBefore(d),i=[0],t&&e.eachBefore(zp),e}function d(t){var n=i[t.depth],r=t.x0+n,c=t.y0+n,d=t.x1-n,h=t.y1-n;d<r&&(r=d=(r+d)/2),h<c&&(c=h=(c+h)/2),t.x0=r,t.y0=c,t.x1=d,t.y1=h,t.children&&(n=i[t.depth+1]=o(t)/2,r+=u(t)-n,c+=a(t)-n,(d-=s(t)-n)<r&&(r=d=(r+d)/2),(h-=l(t)-n)<c&&(c=h=(c+h)/2),e(t,r,c,d,h))}return c.round=function(e){return arguments.length?(t=!!e,c):t},c.size=function(e){return arguments.length?(n=+e[0],r=+e[1],c):[n,r]},c.tile=function(t){return arguments.length?(e=Np(t),c):e},c.padding=function(e){return arguments.length?c.paddingInner(e).paddingOuter(e):c.paddingInner()},c.paddingInner=function(e){return arguments.length?(o="function"==typeof e?e:jp(+e),c):o},c.paddingOuter=function(e){return arguments.length?c.paddingTop(e).paddingRight(e).paddingBottom(e).paddingLeft(e):c.paddingTop()},c.paddingTop=function(e){return arguments.length?(a="function"==typeof e?e:jp(+e),c):a},c.paddingRight=function(e){return arguments.length?(s="function"==typeof e?e:jp(+e),c):s},c.paddingBottom=function(e){return arguments.length?(l="function"==typeof e?e:jp(+e),c):l},c.paddingLeft=function(e){return arguments.length?(u="function"==typeof e?e:jp(+e),c):u},c},um=function(e,t,n,r,i){var o,a,s=e.children,l=s.length,u=new Array(l+1);for(u[0]=a=o=0;o<l;++o)u[o+1]=a+=s[o].value;!function e(t,n,r,i,o,a,l){if(t>=n-1){var c=s[t];return c.x0=i,c.y0=o,c.x1=a,void(c.y1=l)}var d=u[t],h=r/2+d,f=t+1,p=n-1;for(;f<p;){var m=f+p>>>1;u[m]<h?f=m+1:p=m}h-u[f-1]<u[f]-h&&t+1<f&&--f;var g=u[f]-d,y=r-g;if(a-i>l-o){var v=(i*y+a*g)/r;e(t,f,g,i,o,v,l),e(f,n,y,v,o,a,l)}else{var _=(o*y+l*g)/r;e(t,f,g,i,o,a,_),e(f,n,y,i,_,a,l)}}(0,l,e.value,t,n,r,i)},cm=function(e,t,n,r,i){(1&e.depth?im:Wp)(e,t,n,r,i)},dm=function e(t){function n(e,n,r,i,o){if((a=e._squarify)&&a.ratio===t)for(var a,s,l,u,c,d=-1,h=a.length,f=e.value;++d<h;){for(l=(s=a[d]).children,u=s.value=0,c=l.length;u<c;++u)s.value+=l[u].value;s.dice?Wp(s,n,r,i,r+=(o-r)*s.value/f):im(s,n,r,n+=(i-n)*s.value/f,o),f-=s.value}else e._squarify=a=am(t,e,n,r,i,o),a.ratio=t}return n.ratio=function(t){return e((t=+t)>1?t:1)},n}(om),hm=function(e){for(var t,n=-1,r=e.length,i=e[r-1],o=0;++n<r;)t=i,i=e[n],o+=t[1]*i[0]-t[0]*i[1];return o/2},fm=function(e){for(var t,n,r=-1,i=e.length,o=0,a=0,s=e[i-1],l=0;++r<i;)t=s,s=e[r],l+=n=t[0]*s[1]-s[0]*t[1],o+=(t[0]+s[0])*n,a+=(t[1]+s[1])*n;return[o/(l*=3),a/l]},pm=function(e,t,n){return(t[0]-e[0])*(n[1]-e[1])-(t[1]-e[1])*(n[0]-e[0])};function mm(e,t){return e[0]-t[0]||e[1]-t[1]}function gm(e){for(var t=e.length,n=[0,1],r=2,i=2;i<t;++i){for(;r>1&&pm(e[n[r-2]],e[n[r-1]],e[i])<=0;)--r;n[r++]=i}return n.slice(0,r)}var ym=function(e){if((n=e.length)<3)return null;var t,n,r=new Array(n),i=new Array(n);for(t=0;t<n;++t)r[t]=[+e[t][0],+e[t][1],t];for(r.sort(mm),t=0;t<n;++t)i[t]=[r[t][0],-r[t][1]];var o=gm(r),a=gm(i),s=a[0]===o[0],l=a[a.length-1]===o[o.length-1],u=[];for(t=o.length-1;t>=0;--t)u.push(e[r[o[t]][2]]);for(t=+s;t<a.length-l;++t)u.push(e[r[a[t]][2]]);return u},vm=function(e,t){for(var n,r,i=e.length,o=e[i-1],a=t[0],s=t[1],l=o[0],u=o[1],c=!1,d=0;d<i;++d)n=(o=e[d])[0],(r=o[1])>s!=u>s&&a<(l-n)*(s-r)/(u-r)+n&&(c=!c),l=n,u=r;return c},_m=function(e){for(var t,n,r=-1,i=e.length,o=e[i-1],a=o[0],s=o[1],l=0;++r<i;)t=a,n=s,t-=a=(o=e[r])[0],n-=s=o[1],l+=Math.sqrt(t*t+n*n);return l},wm=function(){return Math.random()},bm=function e(t){function n(e,n){return e=null==e?0:+e,n=null==n?1:+n,1===arguments.length?(n=e,e=0):n-=e,function(){return t()*n+e}}return n.source=e,n}(wm),Mm=function e(t){function n(e,n){var r,i;return e=null==e?0:+e,n=null==n?1:+n,function(){var o;if(null!=r)o=r,r=null;else do{r=2*t()-1,o=2*t()-1,i=r*r+o*o}while(!i||i>1);return e+n*o*Math.sqrt(-2*Math.log(i)/i)}}return n.source=e,n}(wm),km=function e(t){function n(){var e=Mm.source(t).apply(this,arguments);return function(){return Math.exp(e())}}return n.source=e,n}(wm),Sm=function e(t){function n(e){return function(){for(var n=0,r=0;r<e;++r)n+=t();return n}}return n.source=e,n}(wm),Tm=function e(t){function n(e){var n=Sm.source(t)(e);return function(){return n()/e}}return n.source=e,n}(wm),Cm=function e(t){function n(e){return function(){return-Math.log(1-t())/e}}return n.source=e,n}(wm);function xm(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e)}return this}function Em(e,t){switch(arguments.length){case 0:break;case 1:this.interpolator(e);break;default:this.interpolator(t).domain(e)}return this}var Lm=Array.prototype,Om=Lm.map,Dm=Lm.slice,Rm={name:"implicit"};function Am(){var e=Za(),t=[],n=[],r=Rm;function i(i){var o=i+"",a=e.get(o);if(!a){if(r!==Rm)return r;e.set(o,a=t.push(i))}return n[(a-1)%n.length]}return i.domain=function(n){if(!arguments.length)return t.slice();t=[],e=Za();for(var r,o,a=-1,s=n.length;++a<s;)e.has(o=(r=n[a])+"")||e.set(o,t.push(r));return i},i.range=function(e){return arguments.length?(n=Dm.call(e),i):n.slice()},i.unknown=function(e){return arguments.length?(r=e,i):r},i.copy=function(){return Am(t,n).unknown(r)},xm.apply(i,arguments),i}function Nm(){var e,t,n=Am().unknown(void 0),r=n.domain,i=n.range,o=[0,1],a=!1,s=0,l=0,u=.5;function c(){var n=r().length,c=o[1]<o[0],d=o[c-0],h=o[1-c];e=(h-d)/Math.max(1,n-s+2*l),a&&(e=Math.floor(e)),d+=(h-d-e*(n-s))*u,t=e*(1-s),a&&(d=Math.round(d),t=Math.round(t));var f=C(n).map((function(t){return d+e*t}));return i(c?f.reverse():f)}return delete n.unknown,n.domain=function(e){return arguments.length?(r(e),c()):r()},n.range=function(e){return arguments.length?(o=[+e[0],+e[1]],c()):o.slice()},n.rangeRound=function(e){return o=[+e[0],+e[1]],a=!0,c()},n.bandwidth=function(){return t},n.step=function(){return e},n.round=function(e){return arguments.length?(a=!!e,c()):a},n.padding=function(e){return arguments.length?(s=Math.min(1,l=+e),c()):s},n.paddingInner=function(e){return arguments.length?(s=Math.min(1,e),c()):s},n.paddingOuter=function(e){return arguments.length?(l=+e,c()):l},n.align=function(e){return arguments.length?(u=Math.max(0,Math.min(1,e)),c()):u},n.copy=function(){return Nm(r(),o).round(a).paddingInner(s).paddingOuter(l).align(u)},xm.apply(c(),arguments)}function Ym(){return function e(t){var n=t.copy;return t.padding=t.paddingOuter,delete t.paddingInner,delete t.paddingOuter,t.copy=function(){return e(n())},t}(Nm.apply(null,arguments).paddingInner(1))}var jm=function(e){return function(){return e}},Hm=function(e){return+e},Pm=[0,1];function Im(e){return e}function Fm(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:jm(isNaN(t)?NaN:.5)}function Bm(e){var t,n=e[0],r=e[e.length-1];return n>r&&(t=n,n=r,r=t),function(e){return Math.max(n,Math.min(r,e))}}function zm(e,t,n){var r=e[0],i=e[1],o=t[0],a=t[1];return i<r?(r=Fm(i,r),o=n(a,o)):(r=Fm(r,i),o=n(o,a)),function(e){return o(r(e))}}function Wm(e,t,n){var r=Math.min(e.length,t.length)-1,i=new Array(r),o=new Array(r),a=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++a<r;)i[a]=Fm(e[a],e[a+1]),o[a]=n(t[a],t[a+1]);return function(t){var n=h(e,t,1,r)-1;return o[n](i[n](t))}}function Um(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function Vm(){var e,t,n,r,i,o,a=Pm,s=Pm,l=er,u=Im;function c(){return r=Math.min(a.length,s.length)>2?Wm:zm,i=o=null,d}function d(t){return isNaN(t=+t)?n:(i||(i=r(a.map(e),s,l)))(e(u(t)))}return d.invert=function(n){return u(t((o||(o=r(s,a.map(e),Vn)))(n)))},d.domain=function(e){return arguments.length?(a=Om.call(e,Hm),u===Im||(u=Bm(a)),c()):a.slice()},d.range=function(e){return arguments.length?(s=Dm.call(e),c()):s.slice()},d.rangeRound=function(e){return s=Dm.call(e),l=rr,c()},d.clamp=function(e){return arguments.length?(u=e?Bm(a):Im,d):u!==Im},d.interpolate=function(e){return arguments.length?(l=e,c()):l},d.unknown=function(e){return arguments.length?(n=e,d):n},function(n,r){return e=n,t=r,c()}}function qm(e,t){return Vm()(e,t)}var Gm=function(e,t,n,r){var i,o=R(e,t,n);switch((r=zl(null==r?",f":r)).type){case"s":var a=Math.max(Math.abs(e),Math.abs(t));return null!=r.precision||isNaN(i=ru(o,a))||(r.precision=i),Gl(r,a);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(i=iu(o,Math.max(Math.abs(e),Math.abs(t))))||(r.precision=i-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(i=nu(o))||(r.precision=i-2*("%"===r.type))}return ql(r)};function Xm(e){var t=e.domain;return e.ticks=function(e){var n=t();return O(n[0],n[n.length-1],null==e?10:e)},e.tickFormat=function(e,n){var r=t();return Gm(r[0],r[r.length-1],null==e?10:e,n)},e.nice=function(n){null==n&&(n=10);var r,i=t(),o=0,a=i.length-1,s=i[o],l=i[a];return l<s&&(r=s,s=l,l=r,r=o,o=a,a=r),(r=D(s,l,n))>0?r=D(s=Math.floor(s/r)*r,l=Math.ceil(l/r)*r,n):r<0&&(r=D(s=Math.ceil(s*r)/r,l=Math.floor(l*r)/r,n)),r>0?(i[o]=Math.floor(s/r)*r,i[a]=Math.ceil(l/r)*r,t(i)):r<0&&(i[o]=Math.ceil(s*r)/r,i[a]=Math.floor(l*r)/r,t(i)),e},e}function Km(){var e=qm(Im,Im);return e.copy=function(){return Um(e,Km())},xm.apply(e,arguments),Xm(e)}function Jm(e){var t;function n(e){return isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Om.call(t,Hm),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return Jm(e).unknown(t)},e=arguments.length?Om.call(e,Hm):[0,1],Xm(n)}var $m=function(e,t){var n,r=0,i=(e=e.slice()).length-1,o=e[r],a=e[i];return a<o&&(n=r,r=i,i=n,n=o,o=a,a=n),e[r]=t.floor(o),e[i]=t.ceil(a),e};function Zm(e){return Math.log(e)}function Qm(e){return Math.exp(e)}function eg(e){return-Math.log(-e)}function tg(e){return-Math.exp(-e)}function ng(e){return isFinite(e)?+("1e"+e):e<0?0:e}function rg(e){return function(t){return-e(-t)}}function ig(e){var t,n,r=e(Zm,Qm),i=r.domain,o=10;function a(){return t=function(e){return e===Math.E?Math.log:10===e&&Math.log10||2===e&&Math.log2||(e=Math.log(e),function(t){return Math.log(t)/e})}(o),n=function(e){return 10===e?ng:e===Math.E?Math.exp:function(t){return Math.pow(e,t)}}(o),i()[0]<0?(t=rg(t),n=rg(n),e(eg,tg)):e(Zm,Qm),r}return r.base=function(e){return arguments.length?(o=+e,a()):o},r.domain=function(e){return arguments.length?(i(e),a()):i()},r.ticks=function(e){var r,a=i(),s=a[0],l=a[a.length-1];(r=l<s)&&(h=s,s=l,l=h);var u,c,d,h=t(s),f=t(l),p=null==e?10:+e,m=[];if(!(o%1)&&f-h<p){if(h=Math.round(h)-1,f=Math.round(f)+1,s>0){for(;h<f;++h)for(c=1,u=n(h);c<o;++c)if(!((d=u*c)<s)){if(d>l)break;m.push(d)}}else for(;h<f;++h)for(c=o-1,u=n(h);c>=1;--c)if(!((d=u*c)<s)){if(d>l)break;m.push(d)}}else m=O(h,f,Math.min(f-h,p)).map(n);return r?m.reverse():m},r.tickFormat=function(e,i){if(null==i&&(i=10===o?".0e":","),"function"!=typeof i&&(i=ql(i)),e===1/0)return i;null==e&&(e=10);var a=Math.max(1,o*e/r.ticks().length);return function(e){var r=e/n(Math.round(t(e)));return r*o<o-.5&&(r*=o),r<=a?i(e):""}},r.nice=function(){return i($m(i(),{floor:function(e){return n(Math.floor(t(e)))},ceil:function(e){return n(Math.ceil(t(e)))}}))},r}function og(){var e=ig(Vm()).domain([1,10]);return e.copy=function(){return Um(e,og()).base(e.base())},xm.apply(e,arguments),e}function ag(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function sg(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function lg(e){var t=1,n=e(ag(t),sg(t));return n.constant=function(n){return arguments.length?e(ag(t=+n),sg(t)):t},Xm(n)}function ug(){var e=lg(Vm());return e.copy=function(){return Um(e,ug()).constant(e.constant())},xm.apply(e,arguments)}function cg(e){return function(t){return t<0?-Math.pow(-t,e):Math.pow(t,e)}}function dg(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function hg(e){return e<0?-e*e:e*e}function fg(e){var t=e(Im,Im),n=1;function r(){return 1===n?e(Im,Im):.5===n?e(dg,hg):e(cg(n),cg(1/n))}return t.exponent=function(e){return arguments.length?(n=+e,r()):n},Xm(t)}function pg(){var e=fg(Vm());return e.copy=function(){return Um(e,pg()).exponent(e.exponent())},xm.apply(e,arguments),e}function mg(){return pg.apply(null,arguments).exponent(.5)}function gg(){var e,t=[],n=[],r=[];function i(){var e=0,i=Math.max(1,n.length);for(r=new Array(i-1);++e<i;)r[e-1]=Y(t,e/i);return o}function o(t){return isNaN(t=+t)?e:n[h(r,t)]}return o.invertExtent=function(e){var i=n.indexOf(e);return i<0?[NaN,NaN]:[i>0?r[i-1]:t[0],i<r.length?r[i]:t[t.length-1]]},o.domain=function(e){if(!arguments.length)return t.slice();t=[];for(var n,r=0,o=e.length;r<o;++r)null==(n=e[r])||isNaN(n=+n)||t.push(n);return t.sort(s),i()},o.range=function(e){return arguments.length?(n=Dm.call(e),i()):n.slice()},o.unknown=function(t){return arguments.length?(e=t,o):e},o.quantiles=function(){return r.slice()},o.copy=function(){return gg().domain(t).range(n).unknown(e)},xm.apply(o,arguments)}function yg(){var e,t=0,n=1,r=1,i=[.5],o=[0,1];function a(t){return t<=t?o[h(i,t,0,r)]:e}function s(){var e=-1;for(i=new Array(r);++e<r;)i[e]=((e+1)*n-(e-r)*t)/(r+1);return a}return a.domain=function(e){return arguments.length?(t=+e[0],n=+e[1],s()):[t,n]},a.range=function(e){return arguments.length?(r=(o=Dm.call(e)).length-1,s()):o.slice()},a.invertExtent=function(e){var a=o.indexOf(e);return a<0?[NaN,NaN]:a<1?[t,i[0]]:a>=r?[i[r-1],n]:[i[a-1],i[a]]},a.unknown=function(t){return arguments.length?(e=t,a):a},a.thresholds=function(){return i.slice()},a.copy=function(){return yg().domain([t,n]).range(o).unknown(e)},xm.apply(Xm(a),arguments)}function vg(){var e,t=[.5],n=[0,1],r=1;function i(i){return i<=i?n[h(t,i,0,r)]:e}return i.domain=function(e){return arguments.length?(t=Dm.call(e),r=Math.min(t.length,n.length-1),i):t.slice()},i.range=function(e){return arguments.length?(n=Dm.call(e),r=Math.min(t.length,n.length-1),i):n.slice()},i.invertExtent=function(e){var r=n.indexOf(e);return[t[r-1],t[r]]},i.unknown=function(t){return arguments.length?(e=t,i):e},i.copy=function(){return vg().domain(t).range(n).unknown(e)},xm.apply(i,arguments)}var _g=new Date,wg=new Date;function bg(e,t,n,r){function i(t){return e(t=0===arguments.length?new Date:new Date(+t)),t}return i.floor=function(t){return e(t=new Date(+t)),t},i.ceil=function(n){return e(n=new Date(n-1)),t(n,1),e(n),n},i.round=function(e){var t=i(e),n=i.ceil(e);return e-t<n-e?t:n},i.offset=function(e,n){return t(e=new Date(+e),null==n?1:Math.floor(n)),e},i.range=function(n,r,o){var a,s=[];if(n=i.ceil(n),o=null==o?1:Math.floor(o),!(n<r&&o>0))return s;do{s.push(a=new Date(+n)),t(n,o),e(n)}while(a<n&&n<r);return s},i.filter=function(n){return bg((function(t){if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)}),(function(e,r){if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););}))},n&&(i.count=function(t,r){return _g.setTime(+t),wg.setTime(+r),e(_g),e(wg),Math.floor(n(_g,wg))},i.every=function(e){return e=Math.floor(e),isFinite(e)&&e>0?e>1?i.filter(r?function(t){return r(t)%e==0}:function(t){return i.count(0,t)%e==0}):i:null}),i}var Mg=bg((function(e){e.setMonth(0,1),e.setHours(0,0,0,0)}),(function(e,t){e.setFullYear(e.getFullYear()+t)}),(function(e,t){return t.getFullYear()-e.getFullYear()}),(function(e){return e.getFullYear()}));Mg.every=function(e){return isFinite(e=Math.floor(e))&&e>0?bg((function(t){t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)}),(function(t,n){t.setFullYear(t.getFullYear()+n*e)})):null};var kg=Mg,Sg=Mg.range,Tg=bg((function(e){e.setDate(1),e.setHours(0,0,0,0)}),(function(e,t){e.setMonth(e.getMonth()+t)}),(function(e,t){return t.getMonth()-e.getMonth()+12*(t.getFullYear()-e.getFullYear())}),(function(e){return e.getMonth()})),Cg=Tg,xg=Tg.range,Eg=6e4,Lg=6048e5;function Og(e){return bg((function(t){t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)}),(function(e,t){e.setDate(e.getDate()+7*t)}),(function(e,t){return(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Eg)/Lg}))}var Dg=Og(0),Rg=Og(1),Ag=Og(2),Ng=Og(3),Yg=Og(4),jg=Og(5),Hg=Og(6),Pg=Dg.range,Ig=Rg.range,Fg=Ag.range,Bg=Ng.range,zg=Yg.range,Wg=jg.range,Ug=Hg.range,Vg=bg((function(e){e.setHours(0,0,0,0)}),(function(e,t){e.setDate(e.getDate()+t)}),(function(e,t){return(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Eg)/864e5}),(function(e){return e.getDate()-1})),qg=Vg,Gg=Vg.range,Xg=bg((function(e){e.setTime(e-e.getMilliseconds()-1e3*e.getSeconds()-e.getMinutes()*Eg)}),(function(e,t){e.setTime(+e+36e5*t)}),(function(e,t){return(t-e)/36e5}),(function(e){return e.getHours()})),Kg=Xg,Jg=Xg.range,$g=bg((function(e){e.setTime(e-e.getMilliseconds()-1e3*e.getSeconds())}),(function(e,t){e.setTime(+e+t*Eg)}),(function(e,t){return(t-e)/Eg}),(function(e){return e.getMinutes()})),Zg=$g,Qg=$g.range,ey=bg((function(e){e.setTime(e-e.getMilliseconds())}),(function(e,t){e.setTime(+e+1e3*t)}),(function(e,t){return(t-e)/1e3}),(function(e){return e.getUTCSeconds()})),ty=ey,ny=ey.range,ry=bg((function(){}),(function(e,t){e.setTime(+e+t)}),(function(e,t){return t-e}));ry.every=function(e){return e=Math.floor(e),isFinite(e)&&e>0?e>1?bg((function(t){t.setTime(Math.floor(t/e)*e)}),(function(t,n){t.setTime(+t+n*e)}),(function(t,n){return(n-t)/e})):ry:null};var iy=ry,oy=ry.range;function ay(e){return bg((function(t){t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCDate(e.getUTCDate()+7*t)}),(function(e,t){return(t-e)/Lg}))}var sy=ay(0),ly=ay(1),uy=ay(2),cy=ay(3),dy=ay(4),hy=ay(5),fy=ay(6),py=sy.range,my=ly.range,gy=uy.range,yy=cy.range,vy=dy.range,_y=hy.range,wy=fy.range,by=bg((function(e){e.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCDate(e.getUTCDate()+t)}),(function(e,t){return(t-e)/864e5}),(function(e){return e.getUTCDate()-1})),My=by,ky=by.range,Sy=bg((function(e){e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCFullYear(e.getUTCFullYear()+t)}),(function(e,t){return t.getUTCFullYear()-e.getUTCFullYear()}),(function(e){return e.getUTCFullYear()}));Sy.every=function(e){return isFinite(e=Math.floor(e))&&e>0?bg((function(t){t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)}),(function(t,n){t.setUTCFullYear(t.getUTCFullYear()+n*e)})):null};var Ty=Sy,Cy=Sy.range;function xy(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Ey(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function Ly(e){return{y:e,m:0,d:1,H:0,M:0,S:0,L:0}}function Oy(e){var t=e.dateTime,n=e.date,r=e.time,i=e.periods,o=e.days,a=e.shortDays,s=e.months,l=e.shortMonths,u=zy(i),c=Wy(i),d=zy(o),h=Wy(o),f=zy(a),p=Wy(a),m=zy(s),g=Wy(s),y=zy(l),v=Wy(l),_={a:function(e){return a[e.getDay()]},A:function(e){return o[e.getDay()]},b:function(e){return l[e.getMonth()]},B:function(e){return s[e.getMonth()]},c:null,d:uv,e:uv,f:pv,H:cv,I:dv,j:hv,L:fv,m:mv,M:gv,p:function(e){return i[+(e.getHours()>=12)]},Q:Uv,s:Vv,S:yv,u:vv,U:_v,V:wv,w:bv,W:Mv,x:null,X:null,y:kv,Y:Sv,Z:Tv,"%":Wv},w={a:function(e){return a[e.getUTCDay()]},A:function(e){return o[e.getUTCDay()]},b:function(e){return l[e.getUTCMonth()]},B:function(e){return s[e.getUTCMonth()]},c:null,d:Cv,e:Cv,f:Dv,H:xv,I:Ev,j:Lv,L:Ov,m:Rv,M:Av,p:function(e){return i[+(e.getUTCHours()>=12)]},Q:Uv,s:Vv,S:Nv,u:Yv,U:jv,V:Hv,w:Pv,W:Iv,x:null,X:null,y:Fv,Y:Bv,Z:zv,"%":Wv},b={a:function(e,t,n){var r=f.exec(t.slice(n));return r?(e.w=p[r[0].toLowerCase()],n+r[0].length):-1},A:function(e,t,n){var r=d.exec(t.slice(n));return r?(e.w=h[r[0].toLowerCase()],n+r[0].length):-1},b:function(e,t,n){var r=y.exec(t.slice(n));return r?(e.m=v[r[0].toLowerCase()],n+r[0].length):-1},B:function(e,t,n){var r=m.exec(t.slice(n));return r?(e.m=g[r[0].toLowerCase()],n+r[0].length):-1},c:function(e,n,r){return S(e,t,n,r)},d:Qy,e:Qy,f:ov,H:tv,I:tv,j:ev,L:iv,m:Zy,M:nv,p:function(e,t,n){var r=u.exec(t.slice(n));return r?(e.p=c[r[0].toLowerCase()],n+r[0].length):-1},Q:sv,s:lv,S:rv,u:Vy,U:qy,V:Gy,w:Uy,W:Xy,x:function(e,t,r){return S(e,n,t,r)},X:function(e,t,n){return S(e,r,t,n)},y:Jy,Y:Ky,Z:$y,"%":av};function M(e,t){return function(n){var r,i,o,a=[],s=-1,l=0,u=e.length;for(n instanceof Date||(n=new Date(+n));++s<u;)37===e.charCodeAt(s)&&(a.push(e.slice(l,s)),null!=(i=jy[r=e.charAt(++s)])?r=e.charAt(++s):i="e"===r?" ":"0",(o=t[r])&&(r=o(n,i)),a.push(r),l=s+1);return a.push(e.slice(l,s)),a.join("")}}function k(e,t){return function(n){var r,i,o=Ly(1900);if(S(o,e,n+="",0)!=n.length)return null;if("Q"in o)return new Date(o.Q);if("p"in o&&(o.H=o.H%12+12*o.p),"V"in o){if(o.V<1||o.V>53)return null;"w"in o||(o.w=1),"Z"in o?(i=(r=Ey(Ly(o.y))).getUTCDay(),r=i>4||0===i?ly.ceil(r):ly(r),r=My.offset(r,7*(o.V-1)),o.y=r.getUTCFullYear(),o.m=r.getUTCMonth(),o.d=r.getUTCDate()+(o.w+6)%7):(i=(r=t(Ly(o.y))).getDay(),r=i>4||0===i?Rg.ceil(r):Rg(r),r=qg.offset(r,7*(o.V-1)),o.y=r.getFullYear(),o.m=r.getMonth(),o.d=r.getDate()+(o.w+6)%7)}else("W"in o||"U"in o)&&("w"in o||(o.w="u"in o?o.u%7:"W"in o?1:0),i="Z"in o?Ey(Ly(o.y)).getUTCDay():t(Ly(o.y)).getDay(),o.m=0,o.d="W"in o?(o.w+6)%7+7*o.W-(i+5)%7:o.w+7*o.U-(i+6)%7);return"Z"in o?(o.H+=o.Z/100|0,o.M+=o.Z%100,Ey(o)):t(o)}}function S(e,t,n,r){for(var i,o,a=0,s=t.length,l=n.length;a<s;){if(r>=l)return-1;if(37===(i=t.charCodeAt(a++))){if(i=t.charAt(a++),!(o=b[i in jy?t.charAt(a++):i])||(r=o(e,n,r))<0)return-1}else if(i!=n.charCodeAt(r++))return-1}return r}return(_.x=M(n,_),_.X=M(r,_),_.c=M(t,_),w.x=M(n,w),w.X=M(r,w),w.c=M(t,w),{format:function(e){var t=M(e+="",_);return t.toString=function(){return e},t},parse:function(e){var t=k(e+="",xy);return t.toString=function(){return e},t},utcFormat:function(e){var t=M(e+="",w);return t.toString=function(){return e},t},utcParse:function(e){var t=k(e,Ey);return t.toString=function(){return e},t}})}var Dy,Ry,Ay,Ny,Yy,jy={"-":"",_:" ",0:"0"},Hy=/^\s*\d+/,Py=/^%/,Iy=/[\\^$*+?|[\]().{}]/g;function Fy(e,t,n){var r=e<0?"-":"",i=(r?-e:e)+"",o=i.length;return r+(o<n?new Array(n-o+1).join(t)+i:i)}function By(e){return e.replace(Iy,"\\$&")}function zy(e){return new RegExp("^(?:"+e.map(By).join("|")+")","i")}function Wy(e){for(var t={},n=-1,r=e.length;++n<r;)t[e[n].toLowerCase()]=n;return t}function Uy(e,t,n){var r=Hy.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function Vy(e,t,n){var r=Hy.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function qy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function Gy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function Xy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function Ky(e,t,n){var r=Hy.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function Jy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function $y(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||"00")),n+r[0].length):-1}function Zy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function Qy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function ev(e,t,n){var r=Hy.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function tv(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function nv(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function rv(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function iv(e,t,n){var r=Hy.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function ov(e,t,n){var r=Hy.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function av(e,t,n){var r=Py.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function sv(e,t,n){var r=Hy.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function lv(e,t,n){var r=Hy.exec(t.slice(n));return r?(e.Q=1e3*+r[0],n+r[0].length):-1}function uv(e,t){return Fy(e.getDate(),t,2)}function cv(e,t){return Fy(e.getHours(),t,2)}function dv(e,t){return Fy(e.getHours()%12||12,t,2)}function hv(e,t){return Fy(1+qg.count(kg(e),e),t,3)}function fv(e,t){return Fy(e.getMilliseconds(),t,3)}function pv(e,t){return fv(e,t)+"000"}function mv(e,t){return Fy(e.getMonth()+1,t,2)}function gv(e,t){return Fy(e.getMinutes(),t,2)}function yv(e,t){return Fy(e.getSeconds(),t,2)}function vv(e){var t=e.getDay();return 0===t?7:t}function _v(e,t){return Fy(Dg.count(kg(e),e),t,2)}function wv(e,t){var n=e.getDay();return e=n>=4||0===n?Yg(e):Yg.ceil(e),Fy(Yg.count(kg(e),e)+(4===kg(e).getDay()),t,2)}function bv(e){return e.getDay()}function Mv(e,t){return Fy(Rg.count(kg(e),e),t,2)}function kv(e,t){return Fy(e.getFullYear()%100,t,2)}function Sv(e,t){return Fy(e.getFullYear()%1e4,t,4)}function Tv(e){var t=e.getTimezoneOffset();return(t>0?"-":(t*=-1,"+"))+Fy(t/60|0,"0",2)+Fy(t%60,"0",2)}function Cv(e,t){return Fy(e.getUTCDate(),t,2)}function xv(e,t){return Fy(e.getUTCHours(),t,2)}function Ev(e,t){return Fy(e.getUTCHours()%12||12,t,2)}function Lv(e,t){return Fy(1+My.count(Ty(e),e),t,3)}function Ov(e,t){return Fy(e.getUTCMilliseconds(),t,3)}function Dv(e,t){return Ov(e,t)+"000"}function Rv(e,t){return Fy(e.getUTCMonth()+1,t,2)}function Av(e,t){return Fy(e.getUTCMinutes(),t,2)}function Nv(e,t){return Fy(e.getUTCSeconds(),t,2)}function Yv(e){var t=e.getUTCDay();return 0===t?7:t}function jv(e,t){return Fy(sy.count(Ty(e),e),t,2)}function Hv(e,t){var n=e.getUTCDay();return e=n>=4||0===n?dy(e):dy.ceil(e),Fy(dy.count(Ty(e),e)+(4===Ty(e).getUTCDay()),t,2)}function Pv(e){return e.getUTCDay()}function Iv(e,t){return Fy(ly.count(Ty(e),e),t,2)}function Fv(e,t){return Fy(e.getUTCFullYear()%100,t,2)}function Bv(e,t){return Fy(e.getUTCFullYear()%1e4,t,4)}function zv(){return"+0000"}function Wv(){return"%"}function Uv(e){return+e}function Vv(e){return Math.floor(+e/1e3)}function qv(e){return Dy=Oy(e),Ry=Dy.format,Ay=Dy.parse,Ny=Dy.utcFormat,Yy=Dy.utcParse,Dy}qv({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});var Gv=Date.prototype.toISOString?function(e){return e.toISOString()}:Ny("%Y-%m-%dT%H:%M:%S.%LZ");var Xv=+new Date("2000-01-01T00:00:00.000Z")?function(e){var t=new Date(e);return isNaN(t)?null:t}:Yy("%Y-%m-%dT%H:%M:%S.%LZ"),Kv=1e3,Jv=60*Kv,$v=60*Jv,Zv=24*$v,Qv=7*Zv,e_=30*Zv,t_=365*Zv;function n_(e){return new Date(e)}function r_(e){return e instanceof Date?+e:+new Date(+e)}function i_(e,t,n,r,i,o,a,s,u){var c=qm(Im,Im),d=c.invert,h=c.domain,f=u(".%L"),p=u(":%S"),m=u("%I:%M"),g=u("%I %p"),y=u("%a %d"),v=u("%b %d"),_=u("%B"),w=u("%Y"),b=[[a,1,Kv],[a,5,5*Kv],[a,15,15*Kv],[a,30,30*Kv],[o,1,Jv],[o,5,5*Jv],[o,15,15*Jv],[o,30,30*Jv],[i,1,$v],[i,3,3*$v],[i,6,6*$v],[i,12,12*$v],[r,1,Zv],[r,2,2*Zv],[n,1,Qv],[t,1,e_],[t,3,3*e_],[e,1,t_]];function M(s){return(a(s)<s?f:o(s)<s?p:i(s)<s?m:r(s)<s?g:t(s)<s?n(s)<s?y:v:e(s)<s?_:w)(s)}function k(t,n,r,i){if(null==t&&(t=10),"number"==typeof t){var o=Math.abs(r-n)/t,a=l((function(e){return e[2]})).right(b,o);a===b.length?(i=R(n/t_,r/t_,t),t=e):a?(i=(a=b[o/b[a-1][2]<b[a][2]/o?a-1:a])[1],t=a[0]):(i=Math.max(R(n,r,t),1),t=s)}return null==i?t:t.every(i)}return c.invert=function(e){return new Date(d(e))},c.domain=function(e){return arguments.length?h(Om.call(e,r_)):h().map(n_)},c.ticks=function(e,t){var n,r=h(),i=r[0],o=r[r.length-1],a=o<i;return a&&(n=i,i=o,o=n),n=(n=k(e,i,o,t))?n.range(i,o+1):[],a?n.reverse():n},c.tickFormat=function(e,t){return null==t?M:u(t)},c.nice=function(e,t){var n=h();return(e=k(e,n[0],n[n.length-1],t))?h($m(n,e)):c},c.copy=function(){return Um(c,i_(e,t,n,r,i,o,a,s,u))},c}var o_=function(){return xm.apply(i_(kg,Cg,Dg,qg,Kg,Zg,ty,iy,Ry).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)},a_=bg((function(e){e.setUTCDate(1),e.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCMonth(e.getUTCMonth()+t)}),(function(e,t){return t.getUTCMonth()-e.getUTCMonth()+12*(t.getUTCFullYear()-e.getUTCFullYear())}),(function(e){return e.getUTCMonth()})),s_=a_,l_=a_.range,u_=bg((function(e){e.setUTCMinutes(0,0,0)}),(function(e,t){e.setTime(+e+36e5*t)}),(function(e,t){return(t-e)/36e5}),(function(e){return e.getUTCHours()})),c_=u_,d_=u_.range,h_=bg((function(e){e.setUTCSeconds(0,0)}),(function(e,t){e.setTime(+e+t*Eg)}),(function(e,t){return(t-e)/Eg}),(function(e){return e.getUTCMinutes()})),f_=h_,p_=h_.range,m_=function(){return xm.apply(i_(Ty,s_,sy,My,c_,f_,ty,iy,Ny).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)};function g_(){var e,t,n,r,i,o=0,a=1,s=Im,l=!1;function u(t){return isNaN(t=+t)?i:s(0===n?.5:(t=(r(t)-e)*n,l?Math.max(0,Math.min(1,t)):t))}return u.domain=function(i){return arguments.length?(e=r(o=+i[0]),t=r(a=+i[1]),n=e===t?0:1/(t-e),u):[o,a]},u.clamp=function(e){return arguments.length?(l=!!e,u):l},u.interpolator=function(e){return arguments.length?(s=e,u):s},u.unknown=function(e){return arguments.length?(i=e,u):i},function(i){return r=i,e=i(o),t=i(a),n=e===t?0:1/(t-e),u}}function y_(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function v_(){var e=Xm(g_()(Im));return e.copy=function(){return y_(e,v_())},Em.apply(e,arguments)}function __(){var e=ig(g_()).domain([1,10]);return e.copy=function(){return y_(e,__()).base(e.base())},Em.apply(e,arguments)}function w_(){var e=lg(g_());return e.copy=function(){return y_(e,w_()).constant(e.constant())},Em.apply(e,arguments)}function b_(){var e=fg(g_());return e.copy=function(){return y_(e,b_()).exponent(e.exponent())},Em.apply(e,arguments)}function M_(){return b_.apply(null,arguments).exponent(.5)}function k_(){var e=[],t=Im;function n(n){if(!isNaN(n=+n))return t((h(e,n)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(var r,i=0,o=t.length;i<o;++i)null==(r=t[i])||isNaN(r=+r)||e.push(r);return e.sort(s),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return k_(t).domain(e)},Em.apply(n,arguments)}function S_(){var e,t,n,r,i,o,a,s=0,l=.5,u=1,c=Im,d=!1;function h(e){return isNaN(e=+e)?a:(e=.5+((e=+o(e))-t)*(e<t?r:i),c(d?Math.max(0,Math.min(1,e)):e))}return h.domain=function(a){return arguments.length?(e=o(s=+a[0]),t=o(l=+a[1]),n=o(u=+a[2]),r=e===t?0:.5/(t-e),i=t===n?0:.5/(n-t),h):[s,l,u]},h.clamp=function(e){return arguments.length?(d=!!e,h):d},h.interpolator=function(e){return arguments.length?(c=e,h):c},h.unknown=function(e){return arguments.length?(a=e,h):a},function(a){return o=a,e=a(s),t=a(l),n=a(u),r=e===t?0:.5/(t-e),i=t===n?0:.5/(n-t),h}}function T_(){var e=Xm(S_()(Im));return e.copy=function(){return y_(e,T_())},Em.apply(e,arguments)}function C_(){var e=ig(S_()).domain([.1,1,10]);return e.copy=function(){return y_(e,C_()).base(e.base())},Em.apply(e,arguments)}function x_(){var e=lg(S_());return e.copy=function(){return y_(e,x_()).constant(e.constant())},Em.apply(e,arguments)}function E_(){var e=fg(S_());return e.copy=function(){return y_(e,E_()).exponent(e.exponent())},Em.apply(e,arguments)}function L_(){return E_.apply(null,arguments).exponent(.5)}var O_=function(e){for(var t=e.length/6|0,n=new Array(t),r=0;r<t;)n[r]="#"+e.slice(6*r,6*++r);return n},D_=O_("1f77b4ff7f0e2ca02cd627289467bd8c564be377c27f7f7fbcbd2217becf"),R_=O_("7fc97fbeaed4fdc086ffff99386cb0f0027fbf5b17666666"),A_=O_("1b9e77d95f027570b3e7298a66a61ee6ab02a6761d666666"),N_=O_("a6cee31f78b4b2df8a33a02cfb9a99e31a1cfdbf6fff7f00cab2d66a3d9affff99b15928"),Y_=O_("fbb4aeb3cde3ccebc5decbe4fed9a6ffffcce5d8bdfddaecf2f2f2"),j_=O_("b3e2cdfdcdaccbd5e8f4cae4e6f5c9fff2aef1e2cccccccc"),H_=O_("e41a1c377eb84daf4a984ea3ff7f00ffff33a65628f781bf999999"),P_=O_("66c2a5fc8d628da0cbe78ac3a6d854ffd92fe5c494b3b3b3"),I_=O_("8dd3c7ffffb3bebadafb807280b1d3fdb462b3de69fccde5d9d9d9bc80bdccebc5ffed6f"),F_=O_("4e79a7f28e2ce1575976b7b259a14fedc949af7aa1ff9da79c755fbab0ab"),B_=function(e){return Bn(e[e.length-1])},z_=new Array(3).concat("d8b365f5f5f55ab4ac","a6611adfc27d80cdc1018571","a6611adfc27df5f5f580cdc1018571","8c510ad8b365f6e8c3c7eae55ab4ac01665e","8c510ad8b365f6e8c3f5f5f5c7eae55ab4ac01665e","8c510abf812ddfc27df6e8c3c7eae580cdc135978f01665e","8c510abf812ddfc27df6e8c3f5f5f5c7eae580cdc135978f01665e","5430058c510abf812ddfc27df6e8c3c7eae580cdc135978f01665e003c30","5430058c510abf812ddfc27df6e8c3f5f5f5c7eae580cdc135978f01665e003c30").map(O_),W_=B_(z_),U_=new Array(3).concat("af8dc3f7f7f77fbf7b","7b3294c2a5cfa6dba0008837","7b3294c2a5cff7f7f7a6dba0008837","762a83af8dc3e7d4e8d9f0d37fbf7b1b7837","762a83af8dc3e7d4e8f7f7f7d9f0d37fbf7b1b7837","762a839970abc2a5cfe7d4e8d9f0d3a6dba05aae611b7837","762a839970abc2a5cfe7d4e8f7f7f7d9f0d3a6dba05aae611b7837","40004b762a839970abc2a5cfe7d4e8d9f0d3a6dba05aae611b783700441b","40004b762a839970abc2a5cfe7d4e8f7f7f7d9f0d3a6dba05aae611b783700441b").map(O_),V_=B_(U_),q_=new Array(3).concat("e9a3c9f7f7f7a1d76a","d01c8bf1b6dab8e1864dac26","d01c8bf1b6daf7f7f7b8e1864dac26","c51b7de9a3c9fde0efe6f5d0a1d76a4d9221","c51b7de9a3c9fde0eff7f7f7e6f5d0a1d76a4d9221","c51b7dde77aef1b6dafde0efe6f5d0b8e1867fbc414d9221","c51b7dde77aef1b6dafde0eff7f7f7e6f5d0b8e1867fbc414d9221","8e0152c51b7dde77aef1b6dafde0efe6f5d0b8e1867fbc414d9221276419","8e0152c51b7dde77aef1b6dafde0eff7f7f7e6f5d0b8e1867fbc414d9221276419").map(O_),G_=B_(q_),X_=new Array(3).concat("998ec3f7f7f7f1a340","5e3c99b2abd2fdb863e66101","5e3c99b2abd2f7f7f7fdb863e66101","542788998ec3d8daebfee0b6f1a340b35806","542788998ec3d8daebf7f7f7fee0b6f1a340b35806","5427888073acb2abd2d8daebfee0b6fdb863e08214b35806","5427888073acb2abd2d8daebf7f7f7fee0b6fdb863e08214b35806","2d004b5427888073acb2abd2d8daebfee0b6fdb863e08214b358067f3b08","2d004b5427888073acb2abd2d8daebf7f7f7fee0b6fdb863e08214b358067f3b08").map(O_),K_=B_(X_),J_=new Array(3).concat("ef8a62f7f7f767a9cf","ca0020f4a58292c5de0571b0","ca0020f4a582f7f7f792c5de0571b0","b2182bef8a62fddbc7d1e5f067a9cf2166ac","b2182bef8a62fddbc7f7f7f7d1e5f067a9cf2166ac","b2182bd6604df4a582fddbc7d1e5f092c5de4393c32166ac","b2182bd6604df4a582fddbc7f7f7f7d1e5f092c5de4393c32166ac","67001fb2182bd6604df4a582fddbc7d1e5f092c5de4393c32166ac053061","67001fb2182bd6604df4a582fddbc7f7f7f7d1e5f092c5de4393c32166ac053061").map(O_),$_=B_(J_),Z_=new Array(3).concat("ef8a62ffffff999999","ca0020f4a582bababa404040","ca0020f4a582ffffffbababa404040","b2182bef8a62fddbc7e0e0e09999994d4d4d","b2182bef8a62fddbc7ffffffe0e0e09999994d4d4d","b2182bd6604df4a582fddbc7e0e0e0bababa8787874d4d4d","b2182bd6604df4a582fddbc7ffffffe0e0e0bababa8787874d4d4d","67001fb2182bd6604df4a582fddbc7e0e0e0bababa8787874d4d4d1a1a1a","67001fb2182bd6604df4a582fddbc7ffffffe0e0e0bababa8787874d4d4d1a1a1a").map(O_),Q_=B_(Z_),ew=new Array(3).concat("fc8d59ffffbf91bfdb","d7191cfdae61abd9e92c7bb6","d7191cfdae61ffffbfabd9e92c7bb6","d73027fc8d59fee090e0f3f891bfdb4575b4","d73027fc8d59fee090ffffbfe0f3f891bfdb4575b4","d73027f46d43fdae61fee090e0f3f8abd9e974add14575b4","d73027f46d43fdae61fee090ffffbfe0f3f8abd9e974add14575b4","a50026d73027f46d43fdae61fee090e0f3f8abd9e974add14575b4313695","a50026d73027f46d43fdae61fee090ffffbfe0f3f8abd9e974add14575b4313695").map(O_),tw=B_(ew),nw=new Array(3).concat("fc8d59ffffbf91cf60","d7191cfdae61a6d96a1a9641","d7191cfdae61ffffbfa6d96a1a9641","d73027fc8d59fee08bd9ef8b91cf601a9850","d73027fc8d59fee08bffffbfd9ef8b91cf601a9850","d73027f46d43fdae61fee08bd9ef8ba6d96a66bd631a9850","d73027f46d43fdae61fee08bffffbfd9ef8ba6d96a66bd631a9850","a50026d73027f46d43fdae61fee08bd9ef8ba6d96a66bd631a9850006837","a50026d73027f46d43fdae61fee08bffffbfd9ef8ba6d96a66bd631a9850006837").map(O_),rw=B_(nw),iw=new Array(3).concat("fc8d59ffffbf99d594","d7191cfdae61abdda42b83ba","d7191cfdae61ffffbfabdda42b83ba","d53e4ffc8d59fee08be6f59899d5943288bd","d53e4ffc8d59fee08bffffbfe6f59899d5943288bd","d53e4ff46d43fdae61fee08be6f598abdda466c2a53288bd","d53e4ff46d43fdae61fee08bffffbfe6f598abdda466c2a53288bd","9e0142d53e4ff46d43fdae61fee08be6f598abdda466c2a53288bd5e4fa2","9e0142d53e4ff46d43fdae61fee08bffffbfe6f598abdda466c2a53288bd5e4fa2").map(O_),ow=B_(iw),aw=new Array(3).concat("e5f5f999d8c92ca25f","edf8fbb2e2e266c2a4238b45","edf8fbb2e2e266c2a42ca25f006d2c","edf8fbccece699d8c966c2a42ca25f006d2c","edf8fbccece699d8c966c2a441ae76238b45005824","f7fcfde5f5f9ccece699d8c966c2a441ae76238b45005824","f7fcfde5f5f9ccece699d8c966c2a441ae76238b45006d2c00441b").map(O_),sw=B_(aw),lw=new Array(3).concat("e0ecf49ebcda8856a7","edf8fbb3cde38c96c688419d","edf8fbb3cde38c96c68856a7810f7c","edf8fbbfd3e69ebcda8c96c68856a7810f7c","edf8fbbfd3e69ebcda8c96c68c6bb188419d6e016b","f7fcfde0ecf4bfd3e69ebcda8c96c68c6bb188419d6e016b","f7fcfde0ecf4bfd3e69ebcda8c96c68c6bb188419d810f7c4d004b").map(O_),uw=B_(lw),cw=new Array(3).concat("e0f3dba8ddb543a2ca","f0f9e8bae4bc7bccc42b8cbe","f0f9e8bae4bc7bccc443a2ca0868ac","f0f9e8ccebc5a8ddb57bccc443a2ca0868ac","f0f9e8ccebc5a8ddb57bccc44eb3d32b8cbe08589e","f7fcf0e0f3dbccebc5a8ddb57bccc44eb3d32b8cbe08589e","f7fcf0e0f3dbccebc5a8ddb57bccc44eb3d32b8cbe0868ac084081").map(O_),dw=B_(cw),hw=new Array(3).concat("fee8c8fdbb84e34a33","fef0d9fdcc8afc8d59d7301f","fef0d9fdcc8afc8d59e34a33b30000","fef0d9fdd49efdbb84fc8d59e34a33b30000","fef0d9fdd49efdbb84fc8d59ef6548d7301f990000","fff7ecfee8c8fdd49efdbb84fc8d59ef6548d7301f990000","fff7ecfee8c8fdd49efdbb84fc8d59ef6548d7301fb300007f0000").map(O_),fw=B_(hw),pw=new Array(3).concat("ece2f0a6bddb1c9099","f6eff7bdc9e167a9cf02818a","f6eff7bdc9e167a9cf1c9099016c59","f6eff7d0d1e6a6bddb67a9cf1c9099016c59","f6eff7d0d1e6a6bddb67a9cf3690c002818a016450","fff7fbece2f0d0d1e6a6bddb67a9cf3690c002818a016450","fff7fbece2f0d0d1e6a6bddb67a9cf3690c002818a016c59014636").map(O_),mw=B_(pw),gw=new Array(3).concat("ece7f2a6bddb2b8cbe","f1eef6bdc9e174a9cf0570b0","f1eef6bdc9e174a9cf2b8cbe045a8d","f1eef6d0d1e6a6bddb74a9cf2b8cbe045a8d","f1eef6d0d1e6a6bddb74a9cf3690c00570b0034e7b","fff7fbece7f2d0d1e6a6bddb74a9cf3690c00570b0034e7b","fff7fbece7f2d0d1e6a6bddb74a9cf3690c00570b0045a8d023858").map(O_),yw=B_(gw),vw=new Array(3).concat("e7e1efc994c7dd1c77","f1eef6d7b5d8df65b0ce1256","f1eef6d7b5d8df65b0dd1c77980043","f1eef6d4b9dac994c7df65b0dd1c77980043","f1eef6d4b9dac994c7df65b0e7298ace125691003f","f7f4f9e7e1efd4b9dac994c7df65b0e7298ace125691003f","f7f4f9e7e1efd4b9dac994c7df65b0e7298ace125698004367001f").map(O_),_w=B_(vw),ww=new Array(3).concat("fde0ddfa9fb5c51b8a","feebe2fbb4b9f768a1ae017e","feebe2fbb4b9f768a1c51b8a7a0177","feebe2fcc5c0fa9fb5f768a1c51b8a7a0177","feebe2fcc5c0fa9fb5f768a1dd3497ae017e7a0177","fff7f3fde0ddfcc5c0fa9fb5f768a1dd3497ae017e7a0177","fff7f3fde0ddfcc5c0fa9fb5f768a1dd3497ae017e7a017749006a").map(O_),bw=B_(ww),Mw=new Array(3).concat("edf8b17fcdbb2c7fb8","ffffcca1dab441b6c4225ea8","ffffcca1dab441b6c42c7fb8253494","ffffccc7e9b47fcdbb41b6c42c7fb8253494","ffffccc7e9b47fcdbb41b6c41d91c0225ea80c2c84","ffffd9edf8b1c7e9b47fcdbb41b6c41d91c0225ea80c2c84","ffffd9edf8b1c7e9b47fcdbb41b6c41d91c0225ea8253494081d58").map(O_),kw=B_(Mw),Sw=new Array(3).concat("f7fcb9addd8e31a354","ffffccc2e69978c679238443","ffffccc2e69978c67931a354006837","ffffccd9f0a3addd8e78c67931a354006837","ffffccd9f0a3addd8e78c67941ab5d238443005a32","ffffe5f7fcb9d9f0a3addd8e78c67941ab5d238443005a32","ffffe5f7fcb9d9f0a3addd8e78c67941ab5d238443006837004529").map(O_),Tw=B_(Sw),Cw=new Array(3).concat("fff7bcfec44fd95f0e","ffffd4fed98efe9929cc4c02","ffffd4fed98efe9929d95f0e993404","ffffd4fee391fec44ffe9929d95f0e993404","ffffd4fee391fec44ffe9929ec7014cc4c028c2d04","ffffe5fff7bcfee391fec44ffe9929ec7014cc4c028c2d04","ffffe5fff7bcfee391fec44ffe9929ec7014cc4c02993404662506").map(O_),xw=B_(Cw),Ew=new Array(3).concat("ffeda0feb24cf03b20","ffffb2fecc5cfd8d3ce31a1c","ffffb2fecc5cfd8d3cf03b20bd0026","ffffb2fed976feb24cfd8d3cf03b20bd0026","ffffb2fed976feb24cfd8d3cfc4e2ae31a1cb10026","ffffccffeda0fed976feb24cfd8d3cfc4e2ae31a1cb10026","ffffccffeda0fed976feb24cfd8d3cfc4e2ae31a1cbd0026800026").map(O_),Lw=B_(Ew),Ow=new Array(3).concat("deebf79ecae13182bd","eff3ffbdd7e76baed62171b5","eff3ffbdd7e76baed63182bd08519c","eff3ffc6dbef9ecae16baed63182bd08519c","eff3ffc6dbef9ecae16baed64292c62171b5084594","f7fbffdeebf7c6dbef9ecae16baed64292c62171b5084594","f7fbffdeebf7c6dbef9ecae16baed64292c62171b508519c08306b").map(O_),Dw=B_(Ow),Rw=new Array(3).concat("e5f5e0a1d99b31a354","edf8e9bae4b374c476238b45","edf8e9bae4b374c47631a354006d2c","edf8e9c7e9c0a1d99b74c47631a354006d2c","edf8e9c7e9c0a1d99b74c47641ab5d238b45005a32","f7fcf5e5f5e0c7e9c0a1d99b74c47641ab5d238b45005a32","f7fcf5e5f5e0c7e9c0a1d99b74c47641ab5d238b45006d2c00441b").map(O_),Aw=B_(Rw),Nw=new Array(3).concat("f0f0f0bdbdbd636363","f7f7f7cccccc969696525252","f7f7f7cccccc969696636363252525","f7f7f7d9d9d9bdbdbd969696636363252525","f7f7f7d9d9d9bdbdbd969696737373525252252525","fffffff0f0f0d9d9d9bdbdbd969696737373525252252525","fffffff0f0f0d9d9d9bdbdbd969696737373525252252525000000").map(O_),Yw=B_(Nw),jw=new Array(3).concat("efedf5bcbddc756bb1","f2f0f7cbc9e29e9ac86a51a3","f2f0f7cbc9e29e9ac8756bb154278f","f2f0f7dadaebbcbddc9e9ac8756bb154278f","f2f0f7dadaebbcbddc9e9ac8807dba6a51a34a1486","fcfbfdefedf5dadaebbcbddc9e9ac8807dba6a51a34a1486","fcfbfdefedf5dadaebbcbddc9e9ac8807dba6a51a354278f3f007d").map(O_),Hw=B_(jw),Pw=new Array(3).concat("fee0d2fc9272de2d26","fee5d9fcae91fb6a4acb181d","fee5d9fcae91fb6a4ade2d26a50f15","fee5d9fcbba1fc9272fb6a4ade2d26a50f15","fee5d9fcbba1fc9272fb6a4aef3b2ccb181d99000d","fff5f0fee0d2fcbba1fc9272fb6a4aef3b2ccb181d99000d","fff5f0fee0d2fcbba1fc9272fb6a4aef3b2ccb181da50f1567000d").map(O_),Iw=B_(Pw),Fw=new Array(3).concat("fee6cefdae6be6550d","feeddefdbe85fd8d3cd94701","feeddefdbe85fd8d3ce6550da63603","feeddefdd0a2fdae6bfd8d3ce6550da63603","feeddefdd0a2fdae6bfd8d3cf16913d948018c2d04","fff5ebfee6cefdd0a2fdae6bfd8d3cf16913d948018c2d04","fff5ebfee6cefdd0a2fdae6bfd8d3cf16913d94801a636037f2704").map(O_),Bw=B_(Fw),zw=function(e){return e=Math.max(0,Math.min(1,e)),"rgb("+Math.max(0,Math.min(255,Math.round(-4.54-e*(35.34-e*(2381.73-e*(6402.7-e*(7024.72-2710.57*e)))))))+", "+Math.max(0,Math.min(255,Math.round(32.49+e*(170.73+e*(52.82-e*(131.46-e*(176.58-67.37*e)))))))+", "+Math.max(0,Math.min(255,Math.round(81.24+e*(442.36-e*(2482.43-e*(6167.24-e*(6614.94-2475.67*e)))))))+")"},Ww=Zr(Xr(300,.5,0),Xr(-240,.5,1)),Uw=Zr(Xr(-100,.75,.35),Xr(80,1.5,.8)),Vw=Zr(Xr(260,.75,.35),Xr(80,1.5,.8)),qw=Xr(),Gw=function(e){(e<0||e>1)&&(e-=Math.floor(e));var t=Math.abs(e-.5);return qw.h=360*e-100,qw.s=1.5-1.5*t,qw.l=.8-.9*t,qw+""},Xw=bn(),Kw=Math.PI/3,Jw=2*Math.PI/3,$w=function(e){var t;return e=(.5-e)*Math.PI,Xw.r=255*(t=Math.sin(e))*t,Xw.g=255*(t=Math.sin(e+Kw))*t,Xw.b=255*(t=Math.sin(e+Jw))*t,Xw+""},Zw=function(e){return e=Math.max(0,Math.min(1,e)),"rgb("+Math.max(0,Math.min(255,Math.round(34.61+e*(1172.33-e*(10793.56-e*(33300.12-e*(38394.49-14825.05*e)))))))+", "+Math.max(0,Math.min(255,Math.round(23.31+e*(557.33+e*(1225.33-e*(3574.96-e*(1073.77+707.56*e)))))))+", "+Math.max(0,Math.min(255,Math.round(27.2+e*(3211.1-e*(15327.97-e*(27814-e*(22569.18-6838.66*e)))))))+")"};function Qw(e){var t=e.length;return function(n){return e[Math.max(0,Math.min(t-1,Math.floor(n*t)))]}}var eb=Qw(O_("44015444025645045745055946075a46085c460a5d460b5e470d60470e6147106347116447136548146748166848176948186a481a6c481b6d481c6e481d6f481f70482071482173482374482475482576482677482878482979472a7a472c7a472d7b472e7c472f7d46307e46327e46337f463480453581453781453882443983443a83443b84433d84433e85423f854240864241864142874144874045884046883f47883f48893e49893e4a893e4c8a3d4d8a3d4e8a3c4f8a3c508b3b518b3b528b3a538b3a548c39558c39568c38588c38598c375a8c375b8d365c8d365d8d355e8d355f8d34608d34618d33628d33638d32648e32658e31668e31678e31688e30698e306a8e2f6b8e2f6c8e2e6d8e2e6e8e2e6f8e2d708e2d718e2c718e2c728e2c738e2b748e2b758e2a768e2a778e2a788e29798e297a8e297b8e287c8e287d8e277e8e277f8e27808e26818e26828e26828e25838e25848e25858e24868e24878e23888e23898e238a8d228b8d228c8d228d8d218e8d218f8d21908d21918c20928c20928c20938c1f948c1f958b1f968b1f978b1f988b1f998a1f9a8a1e9b8a1e9c891e9d891f9e891f9f881fa0881fa1881fa1871fa28720a38620a48621a58521a68522a78522a88423a98324aa8325ab8225ac8226ad8127ad8128ae8029af7f2ab07f2cb17e2db27d2eb37c2fb47c31b57b32b67a34b67935b77937b87838b9773aba763bbb753dbc743fbc7340bd7242be7144bf7046c06f48c16e4ac16d4cc26c4ec36b50c46a52c56954c56856c66758c7655ac8645cc8635ec96260ca6063cb5f65cb5e67cc5c69cd5b6ccd5a6ece5870cf5773d05675d05477d1537ad1517cd2507fd34e81d34d84d44b86d54989d5488bd6468ed64590d74393d74195d84098d83e9bd93c9dd93ba0da39a2da37a5db36a8db34aadc32addc30b0dd2fb2dd2db5de2bb8de29bade28bddf26c0df25c2df23c5e021c8e020cae11fcde11dd0e11cd2e21bd5e21ad8e219dae319dde318dfe318e2e418e5e419e7e419eae51aece51befe51cf1e51df4e61ef6e620f8e621fbe723fde725")),tb=Qw(O_("00000401000501010601010802010902020b02020d03030f03031204041405041606051806051a07061c08071e0907200a08220b09240c09260d0a290e0b2b100b2d110c2f120d31130d34140e36150e38160f3b180f3d19103f1a10421c10441d11471e114920114b21114e22115024125325125527125829115a2a115c2c115f2d11612f116331116533106734106936106b38106c390f6e3b0f703d0f713f0f72400f74420f75440f764510774710784910784a10794c117a4e117b4f127b51127c52137c54137d56147d57157e59157e5a167e5c167f5d177f5f187f601880621980641a80651a80671b80681c816a1c816b1d816d1d816e1e81701f81721f817320817521817621817822817922827b23827c23827e24828025828125818326818426818627818827818928818b29818c29818e2a81902a81912b81932b80942c80962c80982d80992d809b2e7f9c2e7f9e2f7fa02f7fa1307ea3307ea5317ea6317da8327daa337dab337cad347cae347bb0357bb2357bb3367ab5367ab73779b83779ba3878bc3978bd3977bf3a77c03a76c23b75c43c75c53c74c73d73c83e73ca3e72cc3f71cd4071cf4070d0416fd2426fd3436ed5446dd6456cd8456cd9466bdb476adc4869de4968df4a68e04c67e24d66e34e65e44f64e55064e75263e85362e95462ea5661eb5760ec5860ed5a5fee5b5eef5d5ef05f5ef1605df2625df2645cf3655cf4675cf4695cf56b5cf66c5cf66e5cf7705cf7725cf8745cf8765cf9785df9795df97b5dfa7d5efa7f5efa815ffb835ffb8560fb8761fc8961fc8a62fc8c63fc8e64fc9065fd9266fd9467fd9668fd9869fd9a6afd9b6bfe9d6cfe9f6dfea16efea36ffea571fea772fea973feaa74feac76feae77feb078feb27afeb47bfeb67cfeb77efeb97ffebb81febd82febf84fec185fec287fec488fec68afec88cfeca8dfecc8ffecd90fecf92fed194fed395fed597fed799fed89afdda9cfddc9efddea0fde0a1fde2a3fde3a5fde5a7fde7a9fde9aafdebacfcecaefceeb0fcf0b2fcf2b4fcf4b6fcf6b8fcf7b9fcf9bbfcfbbdfcfdbf")),nb=Qw(O_("00000401000501010601010802010a02020c02020e03021004031204031405041706041907051b08051d09061f0a07220b07240c08260d08290e092b10092d110a30120a32140b34150b37160b39180c3c190c3e1b0c411c0c431e0c451f0c48210c4a230c4c240c4f260c51280b53290b552b0b572d0b592f0a5b310a5c320a5e340a5f3609613809623909633b09643d09653e0966400a67420a68440a68450a69470b6a490b6a4a0c6b4c0c6b4d0d6c4f0d6c510e6c520e6d540f6d550f6d57106e59106e5a116e5c126e5d126e5f136e61136e62146e64156e65156e67166e69166e6a176e6c186e6d186e6f196e71196e721a6e741a6e751b6e771c6d781c6d7a1d6d7c1d6d7d1e6d7f1e6c801f6c82206c84206b85216b87216b88226a8a226a8c23698d23698f24699025689225689326679526679727669827669a28659b29649d29649f2a63a02a63a22b62a32c61a52c60a62d60a82e5fa92e5eab2f5ead305dae305cb0315bb1325ab3325ab43359b63458b73557b93556ba3655bc3754bd3853bf3952c03a51c13a50c33b4fc43c4ec63d4dc73e4cc83f4bca404acb4149cc4248ce4347cf4446d04545d24644d34743d44842d54a41d74b3fd84c3ed94d3dda4e3cdb503bdd513ade5238df5337e05536e15635e25734e35933e45a31e55c30e65d2fe75e2ee8602de9612bea632aeb6429eb6628ec6726ed6925ee6a24ef6c23ef6e21f06f20f1711ff1731df2741cf3761bf37819f47918f57b17f57d15f67e14f68013f78212f78410f8850ff8870ef8890cf98b0bf98c0af98e09fa9008fa9207fa9407fb9606fb9706fb9906fb9b06fb9d07fc9f07fca108fca309fca50afca60cfca80dfcaa0ffcac11fcae12fcb014fcb216fcb418fbb61afbb81dfbba1ffbbc21fbbe23fac026fac228fac42afac62df9c72ff9c932f9cb35f8cd37f8cf3af7d13df7d340f6d543f6d746f5d949f5db4cf4dd4ff4df53f4e156f3e35af3e55df2e661f2e865f2ea69f1ec6df1ed71f1ef75f1f179f2f27df2f482f3f586f3f68af4f88ef5f992f6fa96f8fb9af9fc9dfafda1fcffa4")),rb=Qw(O_("0d088710078813078916078a19068c1b068d1d068e20068f2206902406912605912805922a05932c05942e05952f059631059733059735049837049938049a3a049a3c049b3e049c3f049c41049d43039e44039e46039f48039f4903a04b03a14c02a14e02a25002a25102a35302a35502a45601a45801a45901a55b01a55c01a65e01a66001a66100a76300a76400a76600a76700a86900a86a00a86c00a86e00a86f00a87100a87201a87401a87501a87701a87801a87a02a87b02a87d03a87e03a88004a88104a78305a78405a78606a68707a68808a68a09a58b0aa58d0ba58e0ca48f0da4910ea3920fa39410a29511a19613a19814a099159f9a169f9c179e9d189d9e199da01a9ca11b9ba21d9aa31e9aa51f99a62098a72197a82296aa2395ab2494ac2694ad2793ae2892b02991b12a90b22b8fb32c8eb42e8db52f8cb6308bb7318ab83289ba3388bb3488bc3587bd3786be3885bf3984c03a83c13b82c23c81c33d80c43e7fc5407ec6417dc7427cc8437bc9447aca457acb4679cc4778cc4977cd4a76ce4b75cf4c74d04d73d14e72d24f71d35171d45270d5536fd5546ed6556dd7566cd8576bd9586ada5a6ada5b69db5c68dc5d67dd5e66de5f65de6164df6263e06363e16462e26561e26660e3685fe4695ee56a5de56b5de66c5ce76e5be76f5ae87059e97158e97257ea7457eb7556eb7655ec7754ed7953ed7a52ee7b51ef7c51ef7e50f07f4ff0804ef1814df1834cf2844bf3854bf3874af48849f48948f58b47f58c46f68d45f68f44f79044f79143f79342f89441f89540f9973ff9983ef99a3efa9b3dfa9c3cfa9e3bfb9f3afba139fba238fca338fca537fca636fca835fca934fdab33fdac33fdae32fdaf31fdb130fdb22ffdb42ffdb52efeb72dfeb82cfeba2cfebb2bfebd2afebe2afec029fdc229fdc328fdc527fdc627fdc827fdca26fdcb26fccd25fcce25fcd025fcd225fbd324fbd524fbd724fad824fada24f9dc24f9dd25f8df25f8e125f7e225f7e425f6e626f6e826f5e926f5eb27f4ed27f3ee27f3f027f2f227f1f426f1f525f0f724f0f921")),ib=function(e){return function(){return e}},ob=Math.abs,ab=Math.atan2,sb=Math.cos,lb=Math.max,ub=Math.min,cb=Math.sin,db=Math.sqrt,hb=1e-12,fb=Math.PI,pb=fb/2,mb=2*fb;function gb(e){return e>=1?pb:e<=-1?-pb:Math.asin(e)}function yb(e){return e.innerRadius}function vb(e){return e.outerRadius}function _b(e){return e.startAngle}function wb(e){return e.endAngle}function bb(e){return e&&e.padAngle}function Mb(e,t,n,r,i,o,a){var s=e-n,l=t-r,u=(a?o:-o)/db(s*s+l*l),c=u*l,d=-u*s,h=e+c,f=t+d,p=n+c,m=r+d,g=(h+p)/2,y=(f+m)/2,v=p-h,_=m-f,w=v*v+_*_,b=i-o,M=h*m-p*f,k=(_<0?-1:1)*db(lb(0,b*b*w-M*M)),S=(M*_-v*k)/w,T=(-M*v-_*k)/w,C=(M*_+v*k)/w,x=(-M*v+_*k)/w,E=S-g,L=T-y,O=C-g,D=x-y;return E*E+L*L>O*O+D*D&&(S=C,T=x),{cx:S,cy:T,x01:-c,y01:-d,x11:S*(i/b-1),y11:T*(i/b-1)}}var kb=function(){var e=yb,t=vb,n=ib(0),r=null,i=_b,o=wb,a=bb,s=null;function l(){var l,u,c,d=+e.apply(this,arguments),h=+t.apply(this,arguments),f=i.apply(this,arguments)-pb,p=o.apply(this,arguments)-pb,m=ob(p-f),g=p>f;if(s||(s=l=Wa()),h<d&&(u=h,h=d,d=u),h>hb)if(m>mb-hb)s.moveTo(h*sb(f),h*cb(f)),s.arc(0,0,h,f,p,!g),d>hb&&(s.moveTo(d*sb(p),d*cb(p)),s.arc(0,0,d,p,f,g));else{var y,v,_=f,w=p,b=f,M=p,k=m,S=m,T=a.apply(this,arguments)/2,C=T>hb&&(r?+r.apply(this,arguments):db(d*d+h*h)),x=ub(ob(h-d)/2,+n.apply(this,arguments)),E=x,L=x;if(C>hb){var O=gb(C/d*cb(T)),D=gb(C/h*cb(T));(k-=2*O)>hb?(b+=O*=g?1:-1,M-=O):(k=0,b=M=(f+p)/2),(S-=2*D)>hb?(_+=D*=g?1:-1,w-=D):(S=0,_=w=(f+p)/2)}var R=h*sb(_),A=h*cb(_),N=d*sb(M),Y=d*cb(M);if(x>hb){var j,H=h*sb(w),P=h*cb(w),I=d*sb(b),F=d*cb(b);if(m<fb&&(j=function(e,t,n,r,i,o,a,s){var l=n-e,u=r-t,c=a-i,d=s-o,h=d*l-c*u;if(!(h*h<hb))return[e+(h=(c*(t-o)-d*(e-i))/h)*l,t+h*u]}(R,A,I,F,H,P,N,Y))){var B=R-j[0],z=A-j[1],W=H-j[0],U=P-j[1],V=1/cb(((c=(B*W+z*U)/(db(B*B+z*z)*db(W*W+U*U)))>1?0:c<-1?fb:Math.acos(c))/2),q=db(j[0]*j[0]+j[1]*j[1]);E=ub(x,(d-q)/(V-1)),L=ub(x,(h-q)/(V+1))}}S>hb?L>hb?(y=Mb(I,F,R,A,h,L,g),v=Mb(H,P,N,Y,h,L,g),s.moveTo(y.cx+y.x01,y.cy+y.y01),L<x?s.arc(y.cx,y.cy,L,ab(y.y01,y.x01),ab(v.y01,v.x01),!g):(s.arc(y.cx,y.cy,L,ab(y.y01,y.x01),ab(y.y11,y.x11),!g),s.arc(0,0,h,ab(y.cy+y.y11,y.cx+y.x11),ab(v.cy+v.y11,v.cx+v.x11),!g),s.arc(v.cx,v.cy,L,ab(v.y11,v.x11),ab(v.y01,v.x01),!g))):(s.moveTo(R,A),s.arc(0,0,h,_,w,!g)):s.moveTo(R,A),d>hb&&k>hb?E>hb?(y=Mb(N,Y,H,P,d,-E,g),v=Mb(R,A,I,F,d,-E,g),s.lineTo(y.cx+y.x01,y.cy+y.y01),E<x?s.arc(y.cx,y.cy,E,ab(y.y01,y.x01),ab(v.y01,v.x01),!g):(s.arc(y.cx,y.cy,E,ab(y.y01,y.x01),ab(y.y11,y.x11),!g),s.arc(0,0,d,ab(y.cy+y.y11,y.cx+y.x11),ab(v.cy+v.y11,v.cx+v.x11),g),s.arc(v.cx,v.cy,E,ab(v.y11,v.x11),ab(v.y01,v.x01),!g))):s.arc(0,0,d,M,b,g):s.lineTo(N,Y)}else s.moveTo(0,0);if(s.closePath(),l)return s=null,l+""||null}return l.centroid=function(){var n=(+e.apply(this,arguments)+ +t.apply(this,arguments))/2,r=(+i.apply(this,arguments)+ +o.apply(this,arguments))/2-fb/2;return[sb(r)*n,cb(r)*n]},l.innerRadius=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),l):e},l.outerRadius=function(e){return arguments.length?(t="function"==typeof e?e:ib(+e),l):t},l.cornerRadius=function(e){return arguments.length?(n="function"==typeof e?e:ib(+e),l):n},l.padRadius=function(e){return arguments.length?(r=null==e?null:"function"==typeof e?e:ib(+e),l):r},l.startAngle=function(e){return arguments.length?(i="function"==typeof e?e:ib(+e),l):i},l.endAngle=function(e){return arguments.length?(o="function"==typeof e?e:ib(+e),l):o},l.padAngle=function(e){return arguments.length?(a="function"==typeof e?e:ib(+e),l):a},l.context=function(e){return arguments.length?(s=null==e?null:e,l):s},l};function Sb(e){this._context=e}Sb.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t)}}};var Tb=function(e){return new Sb(e)};function Cb(e){return e[0]}function xb(e){return e[1]}var Eb=function(){var e=Cb,t=xb,n=ib(!0),r=null,i=Tb,o=null;function a(a){var s,l,u,c=a.length,d=!1;for(null==r&&(o=i(u=Wa())),s=0;s<=c;++s)!(s<c&&n(l=a[s],s,a))===d&&((d=!d)?o.lineStart():o.lineEnd()),d&&o.point(+e(l,s,a),+t(l,s,a));if(u)return o=null,u+""||null}return a.x=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),a):e},a.y=function(e){return arguments.length?(t="function"==typeof e?e:ib(+e),a):t},a.defined=function(e){return arguments.length?(n="function"==typeof e?e:ib(!!e),a):n},a.curve=function(e){return arguments.length?(i=e,null!=r&&(o=i(r)),a):i},a.context=function(e){return arguments.length?(null==e?r=o=null:o=i(r=e),a):r},a},Lb=function(){var e=Cb,t=null,n=ib(0),r=xb,i=ib(!0),o=null,a=Tb,s=null;function l(l){var u,c,d,h,f,p=l.length,m=!1,g=new Array(p),y=new Array(p);for(null==o&&(s=a(f=Wa())),u=0;u<=p;++u){if(!(u<p&&i(h=l[u],u,l))===m)if(m=!m)c=u,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),d=u-1;d>=c;--d)s.point(g[d],y[d]);s.lineEnd(),s.areaEnd()}m&&(g[u]=+e(h,u,l),y[u]=+n(h,u,l),s.point(t?+t(h,u,l):g[u],r?+r(h,u,l):y[u]))}if(f)return s=null,f+""||null}function u(){return Eb().defined(i).curve(a).context(o)}return l.x=function(n){return arguments.length?(e="function"==typeof n?n:ib(+n),t=null,l):e},l.x0=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),l):e},l.x1=function(e){return arguments.length?(t=null==e?null:"function"==typeof e?e:ib(+e),l):t},l.y=function(e){return arguments.length?(n="function"==typeof e?e:ib(+e),r=null,l):n},l.y0=function(e){return arguments.length?(n="function"==typeof e?e:ib(+e),l):n},l.y1=function(e){return arguments.length?(r=null==e?null:"function"==typeof e?e:ib(+e),l):r},l.lineX0=l.lineY0=function(){return u().x(e).y(n)},l.lineY1=function(){return u().x(e).y(r)},l.lineX1=function(){return u().x(t).y(n)},l.defined=function(e){return arguments.length?(i="function"==typeof e?e:ib(!!e),l):i},l.curve=function(e){return arguments.length?(a=e,null!=o&&(s=a(o)),l):a},l.context=function(e){return arguments.length?(null==e?o=s=null:s=a(o=e),l):o},l},Ob=function(e,t){return t<e?-1:t>e?1:t>=e?0:NaN},Db=function(e){return e},Rb=function(){var e=Db,t=Ob,n=null,r=ib(0),i=ib(mb),o=ib(0);function a(a){var s,l,u,c,d,h=a.length,f=0,p=new Array(h),m=new Array(h),g=+r.apply(this,arguments),y=Math.min(mb,Math.max(-mb,i.apply(this,arguments)-g)),v=Math.min(Math.abs(y)/h,o.apply(this,arguments)),_=v*(y<0?-1:1);for(s=0;s<h;++s)(d=m[p[s]=s]=+e(a[s],s,a))>0&&(f+=d);for(null!=t?p.sort((function(e,n){return t(m[e],m[n])})):null!=n&&p.sort((function(e,t){return n(a[e],a[t])})),s=0,u=f?(y-h*_)/f:0;s<h;++s,g=c)l=p[s],c=g+((d=m[l])>0?d*u:0)+_,m[l]={data:a[l],index:s,value:d,startAngle:g,endAngle:c,padAngle:v};return m}return a.value=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),a):e},a.sortValues=function(e){return arguments.length?(t=e,n=null,a):t},a.sort=function(e){return arguments.length?(n=e,t=null,a):n},a.startAngle=function(e){return arguments.length?(r="function"==typeof e?e:ib(+e),a):r},a.endAngle=function(e){return arguments.length?(i="function"==typeof e?e:ib(+e),a):i},a.padAngle=function(e){return arguments.length?(o="function"==typeof e?e:ib(+e),a):o},a},Ab=Yb(Tb);function Nb(e){this._curve=e}function Yb(e){function t(t){return new Nb(e(t))}return t._curve=e,t}function jb(e){var t=e.curve;return e.angle=e.x,delete e.x,e.radius=e.y,delete e.y,e.curve=function(e){return arguments.length?t(Yb(e)):t()._curve},e}Nb.prototype={areaStart:function(){this._curve.areaStart()},areaEnd:function(){this._curve.areaEnd()},lineStart:function(){this._curve.lineStart()},lineEnd:function(){this._curve.lineEnd()},point:function(e,t){this._curve.point(t*Math.sin(e),t*-Math.cos(e))}};var Hb=function(){return jb(Eb().curve(Ab))},Pb=function(){var e=Lb().curve(Ab),t=e.curve,n=e.lineX0,r=e.lineX1,i=e.lineY0,o=e.lineY1;return e.angle=e.x,delete e.x,e.startAngle=e.x0,delete e.x0,e.endAngle=e.x1,delete e.x1,e.radius=e.y,delete e.y,e.innerRadius=e.y0,delete e.y0,e.outerRadius=e.y1,delete e.y1,e.lineStartAngle=function(){return jb(n())},delete e.lineX0,e.lineEndAngle=function(){return jb(r())},delete e.lineX1,e.lineInnerRadius=function(){return jb(i())},delete e.lineY0,e.lineOuterRadius=function(){return jb(o())},delete e.lineY1,e.curve=function(e){return arguments.length?t(Yb(e)):t()._curve},e},Ib=function(e,t){return[(t=+t)*Math.cos(e-=Math.PI/2),t*Math.sin(e)]},Fb=Array.prototype.slice;function Bb(e){return e.source}function zb(e){return e.target}function Wb(e){var t=Bb,n=zb,r=Cb,i=xb,o=null;function a(){var a,s=Fb.call(arguments),l=t.apply(this,s),u=n.apply(this,s);if(o||(o=a=Wa()),e(o,+r.apply(this,(s[0]=l,s)),+i.apply(this,s),+r.apply(this,(s[0]=u,s)),+i.apply(this,s)),a)return o=null,a+""||null}return a.source=function(e){return arguments.length?(t=e,a):t},a.target=function(e){return arguments.length?(n=e,a):n},a.x=function(e){return arguments.length?(r="function"==typeof e?e:ib(+e),a):r},a.y=function(e){return arguments.length?(i="function"==typeof e?e:ib(+e),a):i},a.context=function(e){return arguments.length?(o=null==e?null:e,a):o},a}function Ub(e,t,n,r,i){e.moveTo(t,n),e.bezierCurveTo(t=(t+r)/2,n,t,i,r,i)}function Vb(e,t,n,r,i){e.moveTo(t,n),e.bezierCurveTo(t,n=(n+i)/2,r,n,r,i)}function qb(e,t,n,r,i){var o=Ib(t,n),a=Ib(t,n=(n+i)/2),s=Ib(r,n),l=Ib(r,i);e.moveTo(o[0],o[1]),e.bezierCurveTo(a[0],a[1],s[0],s[1],l[0],l[1])}function Gb(){return Wb(Ub)}function Xb(){return Wb(Vb)}function Kb(){var e=Wb(qb);return e.angle=e.x,delete e.x,e.radius=e.y,delete e.y,e}var Jb={draw:function(e,t){var n=Math.sqrt(t/fb);e.moveTo(n,0),e.arc(0,0,n,0,mb)}},$b={draw:function(e,t){var n=Math.sqrt(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},Zb=Math.sqrt(1/3),Qb=2*Zb,eM={draw:function(e,t){var n=Math.sqrt(t/Qb),r=n*Zb;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},tM=Math.sin(fb/10)/Math.sin(7*fb/10),nM=Math.sin(mb/10)*tM,rM=-Math.cos(mb/10)*tM,iM={draw:function(e,t){var n=Math.sqrt(.8908130915292852*t),r=nM*n,i=rM*n;e.moveTo(0,-n),e.lineTo(r,i);for(var o=1;o<5;++o){var a=mb*o/5,s=Math.cos(a),l=Math.sin(a);e.lineTo(l*n,-s*n),e.lineTo(s*r-l*i,l*r+s*i)}e.closePath()}},oM={draw:function(e,t){var n=Math.sqrt(t),r=-n/2;e.rect(r,r,n,n)}},aM=Math.sqrt(3),sM={draw:function(e,t){var n=-Math.sqrt(t/(3*aM));e.moveTo(0,2*n),e.lineTo(-aM*n,-n),e.lineTo(aM*n,-n),e.closePath()}},lM=Math.sqrt(3)/2,uM=1/Math.sqrt(12),cM=3*(uM/2+1),dM={draw:function(e,t){var n=Math.sqrt(t/cM),r=n/2,i=n*uM,o=r,a=n*uM+n,s=-o,l=a;e.moveTo(r,i),e.lineTo(o,a),e.lineTo(s,l),e.lineTo(-.5*r-lM*i,lM*r+-.5*i),e.lineTo(-.5*o-lM*a,lM*o+-.5*a),e.lineTo(-.5*s-lM*l,lM*s+-.5*l),e.lineTo(-.5*r+lM*i,-.5*i-lM*r),e.lineTo(-.5*o+lM*a,-.5*a-lM*o),e.lineTo(-.5*s+lM*l,-.5*l-lM*s),e.closePath()}},hM=[Jb,$b,eM,oM,iM,sM,dM],fM=function(){var e=ib(Jb),t=ib(64),n=null;function r(){var r;if(n||(n=r=Wa()),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),r)return n=null,r+""||null}return r.type=function(t){return arguments.length?(e="function"==typeof t?t:ib(t),r):e},r.size=function(e){return arguments.length?(t="function"==typeof e?e:ib(+e),r):t},r.context=function(e){return arguments.length?(n=null==e?null:e,r):n},r},pM=function(){};function mM(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function gM(e){this._context=e}gM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:mM(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:mM(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};var yM=function(e){return new gM(e)};function vM(e){this._context=e}vM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:mM(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};var _M=function(e){return new vM(e)};function wM(e){this._context=e}wM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:mM(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};var bM=function(e){return new wM(e)};function MM(e,t){this._basis=new gM(e),this._beta=t}MM.prototype={lineStart:function(){this._x=[],this._y=[],this._basis.lineStart()},lineEnd:function(){var e=this._x,t=this._y,n=e.length-1;if(n>0)for(var r,i=e[0],o=t[0],a=e[n]-i,s=t[n]-o,l=-1;++l<=n;)r=l/n,this._basis.point(this._beta*e[l]+(1-this._beta)*(i+r*a),this._beta*t[l]+(1-this._beta)*(o+r*s));this._x=this._y=null,this._basis.lineEnd()},point:function(e,t){this._x.push(+e),this._y.push(+t)}};var kM=function e(t){function n(e){return 1===t?new gM(e):new MM(e,t)}return n.beta=function(t){return e(+t)},n}(.85);function SM(e,t,n){e._context.bezierCurveTo(e._x1+e._k*(e._x2-e._x0),e._y1+e._k*(e._y2-e._y0),e._x2+e._k*(e._x1-t),e._y2+e._k*(e._y1-n),e._x2,e._y2)}function TM(e,t){this._context=e,this._k=(1-t)/6}TM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x2,this._y2);break;case 3:SM(this,this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2,this._x1=e,this._y1=t;break;case 2:this._point=3;default:SM(this,e,t)}this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var CM=function e(t){function n(e){return new TM(e,t)}return n.tension=function(t){return e(+t)},n}(0);function xM(e,t){this._context=e,this._k=(1-t)/6}xM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._x5=this._y0=this._y1=this._y2=this._y3=this._y4=this._y5=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x3,this._y3),this._context.closePath();break;case 2:this._context.lineTo(this._x3,this._y3),this._context.closePath();break;case 3:this.point(this._x3,this._y3),this.point(this._x4,this._y4),this.point(this._x5,this._y5)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x3=e,this._y3=t;break;case 1:this._point=2,this._context.moveTo(this._x4=e,this._y4=t);break;case 2:this._point=3,this._x5=e,this._y5=t;break;default:SM(this,e,t)}this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var EM=function e(t){function n(e){return new xM(e,t)}return n.tension=function(t){return e(+t)},n}(0);function LM(e,t){this._context=e,this._k=(1-t)/6}LM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3,this._line?this._context.lineTo(this._x2,this._y2):this._context.moveTo(this._x2,this._y2);break;case 3:this._point=4;default:SM(this,e,t)}this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var OM=function e(t){function n(e){return new LM(e,t)}return n.tension=function(t){return e(+t)},n}(0);function DM(e,t,n){var r=e._x1,i=e._y1,o=e._x2,a=e._y2;if(e._l01_a>hb){var s=2*e._l01_2a+3*e._l01_a*e._l12_a+e._l12_2a,l=3*e._l01_a*(e._l01_a+e._l12_a);r=(r*s-e._x0*e._l12_2a+e._x2*e._l01_2a)/l,i=(i*s-e._y0*e._l12_2a+e._y2*e._l01_2a)/l}if(e._l23_a>hb){var u=2*e._l23_2a+3*e._l23_a*e._l12_a+e._l12_2a,c=3*e._l23_a*(e._l23_a+e._l12_a);o=(o*u+e._x1*e._l23_2a-t*e._l12_2a)/c,a=(a*u+e._y1*e._l23_2a-n*e._l12_2a)/c}e._context.bezierCurveTo(r,i,o,a,e._x2,e._y2)}function RM(e,t){this._context=e,this._alpha=t}RM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x2,this._y2);break;case 3:this.point(this._x2,this._y2)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){if(e=+e,t=+t,this._point){var n=this._x2-e,r=this._y2-t;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(n*n+r*r,this._alpha))}switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3;default:DM(this,e,t)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var AM=function e(t){function n(e){return t?new RM(e,t):new TM(e,0)}return n.alpha=function(t){return e(+t)},n}(.5);function NM(e,t){this._context=e,this._alpha=t}NM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._x5=this._y0=this._y1=this._y2=this._y3=this._y4=this._y5=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x3,this._y3),this._context.closePath();break;case 2:this._context.lineTo(this._x3,this._y3),this._context.closePath();break;case 3:this.point(this._x3,this._y3),this.point(this._x4,this._y4),this.point(this._x5,this._y5)}},point:function(e,t){if(e=+e,t=+t,this._point){var n=this._x2-e,r=this._y2-t;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(n*n+r*r,this._alpha))}switch(this._point){case 0:this._point=1,this._x3=e,this._y3=t;break;case 1:this._point=2,this._context.moveTo(this._x4=e,this._y4=t);break;case 2:this._point=3,this._x5=e,this._y5=t;break;default:DM(this,e,t)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var YM=function e(t){function n(e){return t?new NM(e,t):new xM(e,0)}return n.alpha=function(t){return e(+t)},n}(.5);function jM(e,t){this._context=e,this._alpha=t}jM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){if(e=+e,t=+t,this._point){var n=this._x2-e,r=this._y2-t;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(n*n+r*r,this._alpha))}switch(this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3,this._line?this._context.lineTo(this._x2,this._y2):this._context.moveTo(this._x2,this._y2);break;case 3:this._point=4;default:DM(this,e,t)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var HM=function e(t){function n(e){return t?new jM(e,t):new LM(e,0)}return n.alpha=function(t){return e(+t)},n}(.5);function PM(e){this._context=e}PM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};var IM=function(e){return new PM(e)};function FM(e){return e<0?-1:1}function BM(e,t,n){var r=e._x1-e._x0,i=t-e._x1,o=(e._y1-e._y0)/(r||i<0&&-0),a=(n-e._y1)/(i||r<0&&-0),s=(o*i+a*r)/(r+i);return(FM(o)+FM(a))*Math.min(Math.abs(o),Math.abs(a),.5*Math.abs(s))||0}function zM(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function WM(e,t,n){var r=e._x0,i=e._y0,o=e._x1,a=e._y1,s=(o-r)/3;e._context.bezierCurveTo(r+s,i+s*t,o-s,a-s*n,o,a)}function UM(e){this._context=e}function VM(e){this._context=new qM(e)}function qM(e){this._context=e}function GM(e){return new UM(e)}function XM(e){return new VM(e)}function KM(e){this._context=e}function JM(e){var t,n,r=e.length-1,i=new Array(r),o=new Array(r),a=new Array(r);for(i[0]=0,o[0]=2,a[0]=e[0]+2*e[1],t=1;t<r-1;++t)i[t]=1,o[t]=4,a[t]=4*e[t]+2*e[t+1];for(i[r-1]=2,o[r-1]=7,a[r-1]=8*e[r-1]+e[r],t=1;t<r;++t)n=i[t]/o[t-1],o[t]-=n,a[t]-=n*a[t-1];for(i[r-1]=a[r-1]/o[r-1],t=r-2;t>=0;--t)i[t]=(a[t]-i[t+1])/o[t];for(o[r-1]=(e[r]+i[r-1])/2,t=0;t<r-1;++t)o[t]=2*e[t+1]-i[t+1];return[i,o]}UM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:WM(this,this._t0,zM(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(t=+t,(e=+e)!==this._x1||t!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,WM(this,zM(this,n=BM(this,e,t)),n);break;default:WM(this,this._t0,n=BM(this,e,t))}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}},(VM.prototype=Object.create(UM.prototype)).point=function(e,t){UM.prototype.point.call(this,t,e)},qM.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,o){this._context.bezierCurveTo(t,e,r,n,o,i)}},KM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),2===n)this._context.lineTo(e[1],t[1]);else for(var r=JM(e),i=JM(t),o=0,a=1;a<n;++o,++a)this._context.bezierCurveTo(r[0][o],i[0][o],r[1][o],i[1][o],e[a],t[a]);(this._line||0!==this._line&&1===n)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};var $M=function(e){return new KM(e)};function ZM(e,t){this._context=e,this._t=t}ZM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}}this._x=e,this._y=t}};var QM=function(e){return new ZM(e,.5)};function ek(e){return new ZM(e,0)}function tk(e){return new ZM(e,1)}var nk=function(e,t){if((i=e.length)>1)for(var n,r,i,o=1,a=e[t[0]],s=a.length;o<i;++o)for(r=a,a=e[t[o]],n=0;n<s;++n)a[n][1]+=a[n][0]=isNaN(r[n][1])?r[n][0]:r[n][1]},rk=function(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n};function ik(e,t){return e[t]}var ok=function(){var e=ib([]),t=rk,n=nk,r=ik;function i(i){var o,a,s=e.apply(this,arguments),l=i.length,u=s.length,c=new Array(u);for(o=0;o<u;++o){for(var d,h=s[o],f=c[o]=new Array(l),p=0;p<l;++p)f[p]=d=[0,+r(i[p],h,p,i)],d.data=i[p];f.key=h}for(o=0,a=t(c);o<u;++o)c[a[o]].index=o;return n(c,a),c}return i.keys=function(t){return arguments.length?(e="function"==typeof t?t:ib(Fb.call(t)),i):e},i.value=function(e){return arguments.length?(r="function"==typeof e?e:ib(+e),i):r},i.order=function(e){return arguments.length?(t=null==e?rk:"function"==typeof e?e:ib(Fb.call(e)),i):t},i.offset=function(e){return arguments.length?(n=null==e?nk:e,i):n},i},ak=function(e,t){if((r=e.length)>0){for(var n,r,i,o=0,a=e[0].length;o<a;++o){for(i=n=0;n<r;++n)i+=e[n][o][1]||0;if(i)for(n=0;n<r;++n)e[n][o][1]/=i}nk(e,t)}},sk=function(e,t){if((s=e.length)>0)for(var n,r,i,o,a,s,l=0,u=e[t[0]].length;l<u;++l)for(o=a=0,n=0;n<s;++n)(i=(r=e[t[n]][l])[1]-r[0])>=0?(r[0]=o,r[1]=o+=i):i<0?(r[1]=a,r[0]=a+=i):r[0]=o},lk=function(e,t){if((n=e.length)>0){for(var n,r=0,i=e[t[0]],o=i.length;r<o;++r){for(var a=0,s=0;a<n;++a)s+=e[a][r][1]||0;i[r][1]+=i[r][0]=-s/2}nk(e,t)}},uk=function(e,t){if((i=e.length)>0&&(r=(n=e[t[0]]).length)>0){for(var n,r,i,o=0,a=1;a<r;++a){for(var s=0,l=0,u=0;s<i;++s){for(var c=e[t[s]],d=c[a][1]||0,h=(d-(c[a-1][1]||0))/2,f=0;f<s;++f){var p=e[t[f]];h+=(p[a][1]||0)-(p[a-1][1]||0)}l+=d,u+=h*d}n[a-1][1]+=n[a-1][0]=o,l&&(o-=u/l)}n[a-1][1]+=n[a-1][0]=o,nk(e,t)}},ck=function(e){var t=e.map(dk);return rk(e).sort((function(e,n){return t[e]-t[n]}))};function dk(e){for(var t,n=-1,r=0,i=e.length,o=-1/0;++n<i;)(t=+e[n][1])>o&&(o=t,r=n);return r}var hk=function(e){var t=e.map(fk);return rk(e).sort((function(e,n){return t[e]-t[n]}))};function fk(e){for(var t,n=0,r=-1,i=e.length;++r<i;)(t=+e[r][1])&&(n+=t);return n}var pk=function(e){return hk(e).reverse()},mk=function(e){var t,n,r=e.length,i=e.map(fk),o=ck(e),a=0,s=0,l=[],u=[];for(t=0;t<r;++t)n=o[t],a<s?(a+=i[n],l.push(n)):(s+=i[n],u.push(n));return u.reverse().concat(l)},gk=function(e){return rk(e).reverse()},yk=function(e){return function(){return e}};function vk(e){return e[0]}function _k(e){return e[1]}function wk(){this._=null}function bk(e){e.U=e.C=e.L=e.R=e.P=e.N=null}function Mk(e,t){var n=t,r=t.R,i=n.U;i?i.L===n?i.L=r:i.R=r:e._=r,r.U=i,n.U=r,n.R=r.L,n.R&&(n.R.U=n),r.L=n}function kk(e,t){var n=t,r=t.L,i=n.U;i?i.L===n?i.L=r:i.R=r:e._=r,r.U=i,n.U=r,n.L=r.R,n.L&&(n.L.U=n),r.R=n}function Sk(e){for(;e.L;)e=e.L;return e}wk.prototype={constructor:wk,insert:function(e,t){var n,r,i;if(e){if(t.P=e,t.N=e.N,e.N&&(e.N.P=t),e.N=t,e.R){for(e=e.R;e.L;)e=e.L;e.L=t}else e.R=t;n=e}else this._?(e=Sk(this._),t.P=null,t.N=e,e.P=e.L=t,n=e):(t.P=t.N=null,this._=t,n=null);for(t.L=t.R=null,t.U=n,t.C=!0,e=t;n&&n.C;)n===(r=n.U).L?(i=r.R)&&i.C?(n.C=i.C=!1,r.C=!0,e=r):(e===n.R&&(Mk(this,n),n=(e=n).U),n.C=!1,r.C=!0,kk(this,r)):(i=r.L)&&i.C?(n.C=i.C=!1,r.C=!0,e=r):(e===n.L&&(kk(this,n),n=(e=n).U),n.C=!1,r.C=!0,Mk(this,r)),n=e.U;this._.C=!1},remove:function(e){e.N&&(e.N.P=e.P),e.P&&(e.P.N=e.N),e.N=e.P=null;var t,n,r,i=e.U,o=e.L,a=e.R;if(n=o?a?Sk(a):o:a,i?i.L===e?i.L=n:i.R=n:this._=n,o&&a?(r=n.C,n.C=e.C,n.L=o,o.U=n,n!==a?(i=n.U,n.U=e.U,e=n.R,i.L=e,n.R=a,a.U=n):(n.U=i,i=n,e=n.R)):(r=e.C,e=n),e&&(e.U=i),!r)if(e&&e.C)e.C=!1;else{do{if(e===this._)break;if(e===i.L){if((t=i.R).C&&(t.C=!1,i.C=!0,Mk(this,i),t=i.R),t.L&&t.L.C||t.R&&t.R.C){t.R&&t.R.C||(t.L.C=!1,t.C=!0,kk(this,t),t=i.R),t.C=i.C,i.C=t.R.C=!1,Mk(this,i),e=this._;break}}else if((t=i.L).C&&(t.C=!1,i.C=!0,kk(this,i),t=i.L),t.L&&t.L.C||t.R&&t.R.C){t.L&&t.L.C||(t.R.C=!1,t.C=!0,Mk(this,t),t=i.L),t.C=i.C,i.C=t.L.C=!1,kk(this,i),e=this._;break}t.C=!0,e=i,i=i.U}while(!e.C);e&&(e.C=!1)}}};var Tk=wk;function Ck(e,t,n,r){var i=[null,null],o=Jk.push(i)-1;return i.left=e,i.right=t,n&&Ek(i,e,t,n),r&&Ek(i,t,e,r),Xk[e.index].halfedges.push(o),Xk[t.index].halfedges.push(o),i}function xk(e,t,n){var r=[t,n];return r.left=e,r}function Ek(e,t,n,r){e[0]||e[1]?e.left===n?e[1]=r:e[0]=r:(e[0]=r,e.left=t,e.right=n)}function Lk(e,t,n,r,i){var o,a=e[0],s=e[1],l=a[0],u=a[1],c=0,d=1,h=s[0]-l,f=s[1]-u;if(o=t-l,h||!(o>0)){if(o/=h,h<0){if(o<c)return;o<d&&(d=o)}else if(h>0){if(o>d)return;o>c&&(c=o)}if(o=r-l,h||!(o<0)){if(o/=h,h<0){if(o>d)return;o>c&&(c=o)}else if(h>0){if(o<c)return;o<d&&(d=o)}if(o=n-u,f||!(o>0)){if(o/=f,f<0){if(o<c)return;o<d&&(d=o)}else if(f>0){if(o>d)return;o>c&&(c=o)}if(o=i-u,f||!(o<0)){if(o/=f,f<0){if(o>d)return;o>c&&(c=o)}else if(f>0){if(o<c)return;o<d&&(d=o)}return!(c>0||d<1)||(c>0&&(e[0]=[l+c*h,u+c*f]),d<1&&(e[1]=[l+d*h,u+d*f]),!0)}}}}}function Ok(e,t,n,r,i){var o=e[1];if(o)return!0;var a,s,l=e[0],u=e.left,c=e.right,d=u[0],h=u[1],f=c[0],p=c[1],m=(d+f)/2,g=(h+p)/2;if(p===h){if(m<t||m>=r)return;if(d>f){if(l){if(l[1]>=i)return}else l=[m,n];o=[m,i]}else{if(l){if(l[1]<n)return}else l=[m,i];o=[m,n]}}else if(s=g-(a=(d-f)/(p-h))*m,a<-1||a>1)if(d>f){if(l){if(l[1]>=i)return}else l=[(n-s)/a,n];o=[(i-s)/a,i]}else{if(l){if(l[1]<n)return}else l=[(i-s)/a,i];o=[(n-s)/a,n]}else if(h<p){if(l){if(l[0]>=r)return}else l=[t,a*t+s];o=[r,a*r+s]}else{if(l){if(l[0]<t)return}else l=[r,a*r+s];o=[t,a*t+s]}return e[0]=l,e[1]=o,!0}function Dk(e,t){var n=e.site,r=t.left,i=t.right;return n===i&&(i=r,r=n),i?Math.atan2(i[1]-r[1],i[0]-r[0]):(n===r?(r=t[1],i=t[0]):(r=t[0],i=t[1]),Math.atan2(r[0]-i[0],i[1]-r[1]))}function Rk(e,t){return t[+(t.left!==e.site)]}function Ak(e,t){return t[+(t.left===e.site)]}var Nk,Yk=[];function jk(){bk(this),this.x=this.y=this.arc=this.site=this.cy=null}function Hk(e){var t=e.P,n=e.N;if(t&&n){var r=t.site,i=e.site,o=n.site;if(r!==o){var a=i[0],s=i[1],l=r[0]-a,u=r[1]-s,c=o[0]-a,d=o[1]-s,h=2*(l*d-u*c);if(!(h>=-Zk)){var f=l*l+u*u,p=c*c+d*d,m=(d*f-u*p)/h,g=(l*p-c*f)/h,y=Yk.pop()||new jk;y.arc=e,y.site=i,y.x=m+a,y.y=(y.cy=g+s)+Math.sqrt(m*m+g*g),e.circle=y;for(var v=null,_=Kk._;_;)if(y.y<_.y||y.y===_.y&&y.x<=_.x){if(!_.L){v=_.P;break}_=_.L}else{if(!_.R){v=_;break}_=_.R}Kk.insert(v,y),v||(Nk=y)}}}}function Pk(e){var t=e.circle;t&&(t.P||(Nk=t.N),Kk.remove(t),Yk.push(t),bk(t),e.circle=null)}var Ik=[];function Fk(){bk(this),this.edge=this.site=this.circle=null}function Bk(e){var t=Ik.pop()||new Fk;return t.site=e,t}function zk(e){Pk(e),Gk.remove(e),Ik.push(e),bk(e)}function Wk(e){var t=e.circle,n=t.x,r=t.cy,i=[n,r],o=e.P,a=e.N,s=[e];zk(e);for(var l=o;l.circle&&Math.abs(n-l.circle.x)<$k&&Math.abs(r-l.circle.cy)<$k;)o=l.P,s.unshift(l),zk(l),l=o;s.unshift(l),Pk(l);for(var u=a;u.circle&&Math.abs(n-u.circle.x)<$k&&Math.abs(r-u.circle.cy)<$k;)a=u.N,s.push(u),zk(u),u=a;s.push(u),Pk(u);var c,d=s.length;for(c=1;c<d;++c)u=s[c],l=s[c-1],Ek(u.edge,l.site,u.site,i);l=s[0],(u=s[d-1]).edge=Ck(l.site,u.site,null,i),Hk(l),Hk(u)}function Uk(e){for(var t,n,r,i,o=e[0],a=e[1],s=Gk._;s;)if((r=Vk(s,a)-o)>$k)s=s.L;else{if(!((i=o-qk(s,a))>$k)){r>-$k?(t=s.P,n=s):i>-$k?(t=s,n=s.N):t=n=s;break}if(!s.R){t=s;break}s=s.R}!function(e){Xk[e.index]={site:e,halfedges:[]}}(e);var l=Bk(e);if(Gk.insert(t,l),t||n){if(t===n)return Pk(t),n=Bk(t.site),Gk.insert(l,n),l.edge=n.edge=Ck(t.site,l.site),Hk(t),void Hk(n);if(n){Pk(t),Pk(n);var u=t.site,c=u[0],d=u[1],h=e[0]-c,f=e[1]-d,p=n.site,m=p[0]-c,g=p[1]-d,y=2*(h*g-f*m),v=h*h+f*f,_=m*m+g*g,w=[(g*v-f*_)/y+c,(h*_-m*v)/y+d];Ek(n.edge,u,p,w),l.edge=Ck(u,e,null,w),n.edge=Ck(e,p,null,w),Hk(t),Hk(n)}else l.edge=Ck(t.site,l.site)}}function Vk(e,t){var n=e.site,r=n[0],i=n[1],o=i-t;if(!o)return r;var a=e.P;if(!a)return-1/0;var s=(n=a.site)[0],l=n[1],u=l-t;if(!u)return s;var c=s-r,d=1/o-1/u,h=c/u;return d?(-h+Math.sqrt(h*h-2*d*(c*c/(-2*u)-l+u/2+i-o/2)))/d+r:(r+s)/2}function qk(e,t){var n=e.N;if(n)return Vk(n,t);var r=e.site;return r[1]===t?r[0]:1/0}var Gk,Xk,Kk,Jk,$k=1e-6,Zk=1e-12;function Qk(e,t){return t[1]-e[1]||t[0]-e[0]}function eS(e,t){var n,r,i,o=e.sort(Qk).pop();for(Jk=[],Xk=new Array(e.length),Gk=new Tk,Kk=new Tk;;)if(i=Nk,o&&(!i||o[1]<i.y||o[1]===i.y&&o[0]<i.x))o[0]===n&&o[1]===r||(Uk(o),n=o[0],r=o[1]),o=e.pop();else{if(!i)break;Wk(i.arc)}if(function(){for(var e,t,n,r,i=0,o=Xk.length;i<o;++i)if((e=Xk[i])&&(r=(t=e.halfedges).length)){var a=new Array(r),s=new Array(r);for(n=0;n<r;++n)a[n]=n,s[n]=Dk(e,Jk[t[n]]);for(a.sort((function(e,t){return s[t]-s[e]})),n=0;n<r;++n)s[n]=t[a[n]];for(n=0;n<r;++n)t[n]=s[n]}}(),t){var a=+t[0][0],s=+t[0][1],l=+t[1][0],u=+t[1][1];!function(e,t,n,r){for(var i,o=Jk.length;o--;)Ok(i=Jk[o],e,t,n,r)&&Lk(i,e,t,n,r)&&(Math.abs(i[0][0]-i[1][0])>$k||Math.abs(i[0][1]-i[1][1])>$k)||delete Jk[o]}(a,s,l,u),function(e,t,n,r){var i,o,a,s,l,u,c,d,h,f,p,m,g=Xk.length,y=!0;for(i=0;i<g;++i)if(o=Xk[i]){for(a=o.site,s=(l=o.halfedges).length;s--;)Jk[l[s]]||l.splice(s,1);for(s=0,u=l.length;s<u;)p=(f=Ak(o,Jk[l[s]]))[0],m=f[1],d=(c=Rk(o,Jk[l[++s%u]]))[0],h=c[1],(Math.abs(p-d)>$k||Math.abs(m-h)>$k)&&(l.splice(s,0,Jk.push(xk(a,f,Math.abs(p-e)<$k&&r-m>$k?[e,Math.abs(d-e)<$k?h:r]:Math.abs(m-r)<$k&&n-p>$k?[Math.abs(h-r)<$k?d:n,r]:Math.abs(p-n)<$k&&m-t>$k?[n,Math.abs(d-n)<$k?h:t]:Math.abs(m-t)<$k&&p-e>$k?[Math.abs(h-t)<$k?d:e,t]:null))-1),++u);u&&(y=!1)}if(y){var v,_,w,b=1/0;for(i=0,y=null;i<g;++i)(o=Xk[i])&&(w=(v=(a=o.site)[0]-e)*v+(_=a[1]-t)*_)<b&&(b=w,y=o);if(y){var M=[e,t],k=[e,r],S=[n,r],T=[n,t];y.halfedges.push(Jk.push(xk(a=y.site,M,k))-1,Jk.push(xk(a,k,S))-1,Jk.push(xk(a,S,T))-1,Jk.push(xk(a,T,M))-1)}}for(i=0;i<g;++i)(o=Xk[i])&&(o.halfedges.length||delete Xk[i])}(a,s,l,u)}this.edges=Jk,this.cells=Xk,Gk=Kk=Jk=Xk=null}eS.prototype={constructor:eS,polygons:function(){var e=this.edges;return this.cells.map((function(t){var n=t.halfedges.map((function(n){return Rk(t,e[n])}));return n.data=t.site.data,n}))},triangles:function(){var e=[],t=this.edges;return this.cells.forEach((function(n,r){if(o=(i=n.halfedges).length)for(var i,o,a,s,l,u,c=n.site,d=-1,h=t[i[o-1]],f=h.left===c?h.right:h.left;++d<o;)a=f,f=(h=t[i[d]]).left===c?h.right:h.left,a&&f&&r<a.index&&r<f.index&&(l=a,u=f,((s=c)[0]-u[0])*(l[1]-s[1])-(s[0]-l[0])*(u[1]-s[1])<0)&&e.push([c.data,a.data,f.data])})),e},links:function(){return this.edges.filter((function(e){return e.right})).map((function(e){return{source:e.left.data,target:e.right.data}}))},find:function(e,t,n){for(var r,i,o=this,a=o._found||0,s=o.cells.length;!(i=o.cells[a]);)if(++a>=s)return null;var l=e-i.site[0],u=t-i.site[1],c=l*l+u*u;do{i=o.cells[r=a],a=null,i.halfedges.forEach((function(n){var r=o.edges[n],s=r.left;if(s!==i.site&&s||(s=r.right)){var l=e-s[0],u=t-s[1],d=l*l+u*u;d<c&&(c=d,a=s.index)}}))}while(null!==a);return o._found=r,null==n||c<=n*n?i.site:null}};var tS=function(){var e=vk,t=_k,n=null;function r(r){return new eS(r.map((function(n,i){var o=[Math.round(e(n,i,r)/$k)*$k,Math.round(t(n,i,r)/$k)*$k];return o.index=i,o.data=n,o})),n)}return r.polygons=function(e){return r(e).polygons()},r.links=function(e){return r(e).links()},r.triangles=function(e){return r(e).triangles()},r.x=function(t){return arguments.length?(e="function"==typeof t?t:yk(+t),r):e},r.y=function(e){return arguments.length?(t="function"==typeof e?e:yk(+e),r):t},r.extent=function(e){return arguments.length?(n=null==e?null:[[+e[0][0],+e[0][1]],[+e[1][0],+e[1][1]]],r):n&&[[n[0][0],n[0][1]],[n[1][0],n[1][1]]]},r.size=function(e){return arguments.length?(n=null==e?null:[[0,0],[+e[0],+e[1]]],r):n&&[n[1][0]-n[0][0],n[1][1]-n[0][1]]},r},nS=function(e){return function(){return e}};function rS(e,t,n){this.target=e,this.type=t,this.transform=n}function iS(e,t,n){this.k=e,this.x=t,this.y=n}iS.prototype={constructor:iS,scale:function(e){return 1===e?this:new iS(this.k*e,this.x,this.y)},translate:function(e,t){return 0===e&0===t?this:new iS(this.k,this.x+this.k*e,this.y+this.k*t)},apply:function(e){return[e[0]*this.k+this.x,e[1]*this.k+this.y]},applyX:function(e){return e*this.k+this.x},applyY:function(e){return e*this.k+this.y},invert:function(e){return[(e[0]-this.x)/this.k,(e[1]-this.y)/this.k]},invertX:function(e){return(e-this.x)/this.k},invertY:function(e){return(e-this.y)/this.k},rescaleX:function(e){return e.copy().domain(e.range().map(this.invertX,this).map(e.invert,e))},rescaleY:function(e){return e.copy().domain(e.range().map(this.invertY,this).map(e.invert,e))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var oS=new iS(1,0,0);function aS(e){for(;!e.__zoom;)if(!(e=e.parentNode))return oS;return e.__zoom}function sS(){vt.stopImmediatePropagation()}aS.prototype=iS.prototype;var lS=function(){vt.preventDefault(),vt.stopImmediatePropagation()};function uS(){return!vt.ctrlKey&&!vt.button}function cS(){var e=this;return e instanceof SVGElement?(e=e.ownerSVGElement||e).hasAttribute("viewBox")?[[(e=e.viewBox.baseVal).x,e.y],[e.x+e.width,e.y+e.height]]:[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]:[[0,0],[e.clientWidth,e.clientHeight]]}function dS(){return this.__zoom||oS}function hS(){return-vt.deltaY*(1===vt.deltaMode?.05:vt.deltaMode?1:.002)}function fS(){return navigator.maxTouchPoints||"ontouchstart"in this}function pS(e,t,n){var r=e.invertX(t[0][0])-n[0][0],i=e.invertX(t[1][0])-n[1][0],o=e.invertY(t[0][1])-n[0][1],a=e.invertY(t[1][1])-n[1][1];return e.translate(i>r?(r+i)/2:Math.min(0,r)||Math.max(0,i),a>o?(o+a)/2:Math.min(0,o)||Math.max(0,a))}var mS=function(){var e,t,n=uS,r=cS,i=pS,o=hS,a=fS,s=[0,1/0],l=[[-1/0,-1/0],[1/0,1/0]],u=250,c=hr,d=_e("start","zoom","end"),h=500,f=150,p=0;function m(e){e.property("__zoom",dS).on("wheel.zoom",M).on("mousedown.zoom",k).on("dblclick.zoom",S).filter(a).on("touchstart.zoom",T).on("touchmove.zoom",C).on("touchend.zoom touchcancel.zoom",x).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function g(e,t){return(t=Math.max(s[0],Math.min(s[1],t)))===e.k?e:new iS(t,e.x,e.y)}function y(e,t,n){var r=t[0]-n[0]*e.k,i=t[1]-n[1]*e.k;return r===e.x&&i===e.y?e:new iS(e.k,r,i)}function v(e){return[(+e[0][0]+ +e[1][0])/2,(+e[0][1]+ +e[1][1])/2]}function _(e,t,n){e.on("start.zoom",(function(){w(this,arguments).start()})).on("interrupt.zoom end.zoom",(function(){w(this,arguments).end()})).tween("zoom",(function(){var e=this,i=arguments,o=w(e,i),a=r.apply(e,i),s=null==n?v(a):"function"==typeof n?n.apply(e,i):n,l=Math.max(a[1][0]-a[0][0],a[1][1]-a[0][1]),u=e.__zoom,d="function"==typeof t?t.apply(e,i):t,h=c(u.invert(s).concat(l/u.k),d.invert(s).concat(l/d.k));return function(e){if(1===e)e=d;else{var t=h(e),n=l/t[2];e=new iS(n,s[0]-t[0]*n,s[1]-t[1]*n)}o.zoom(null,e)}}))}function w(e,t,n){return!n&&e.__zooming||new b(e,t)}function b(e,t){this.that=e,this.args=t,this.active=0,this.extent=r.apply(e,t),this.taps=0}function M(){if(n.apply(this,arguments)){var e=w(this,arguments),t=this.__zoom,r=Math.max(s[0],Math.min(s[1],t.k*Math.pow(2,o.apply(this,arguments)))),a=It(this);if(e.wheel)e.mouse[0][0]===a[0]&&e.mouse[0][1]===a[1]||(e.mouse[1]=t.invert(e.mouse[0]=a)),clearTimeout(e.wheel);else{if(t.k===r)return;e.mouse=[a,t.invert(a)],Yi(this),e.start()}lS(),e.wheel=setTimeout((function(){e.wheel=null,e.end()}),f),e.zoom("mouse",i(y(g(t,r),e.mouse[0],e.mouse[1]),e.extent,l))}}function k(){if(!t&&n.apply(this,arguments)){var e=w(this,arguments,!0),r=Rt(vt.view).on("mousemove.zoom",(function(){if(lS(),!e.moved){var t=vt.clientX-a,n=vt.clientY-s;e.moved=t*t+n*n>p}e.zoom("mouse",i(y(e.that.__zoom,e.mouse[0]=It(e.that),e.mouse[1]),e.extent,l))}),!0).on("mouseup.zoom",(function(){r.on("mousemove.zoom mouseup.zoom",null),qt(vt.view,e.moved),lS(),e.end()}),!0),o=It(this),a=vt.clientX,s=vt.clientY;Vt(vt.view),sS(),e.mouse=[o,this.__zoom.invert(o)],Yi(this),e.start()}}function S(){if(n.apply(this,arguments)){var e=this.__zoom,t=It(this),o=e.invert(t),a=e.k*(vt.shiftKey?.5:2),s=i(y(g(e,a),t,o),r.apply(this,arguments),l);lS(),u>0?Rt(this).transition().duration(u).call(_,s,t):Rt(this).call(m.transform,s)}}function T(){if(n.apply(this,arguments)){var t,r,i,o,a=vt.touches,s=a.length,l=w(this,arguments,vt.changedTouches.length===s);for(sS(),r=0;r<s;++r)i=a[r],o=[o=Bt(this,a,i.identifier),this.__zoom.invert(o),i.identifier],l.touch0?l.touch1||l.touch0[2]===o[2]||(l.touch1=o,l.taps=0):(l.touch0=o,t=!0,l.taps=1+!!e);e&&(e=clearTimeout(e)),t&&(l.taps<2&&(e=setTimeout((function(){e=null}),h)),Yi(this),l.start())}}function C(){if(this.__zooming){var t,n,r,o,a=w(this,arguments),s=vt.changedTouches,u=s.length;for(lS(),e&&(e=clearTimeout(e)),a.taps=0,t=0;t<u;++t)n=s[t],r=Bt(this,s,n.identifier),a.touch0&&a.touch0[2]===n.identifier?a.touch0[0]=r:a.touch1&&a.touch1[2]===n.identifier&&(a.touch1[0]=r);if(n=a.that.__zoom,a.touch1){var c=a.touch0[0],d=a.touch0[1],h=a.touch1[0],f=a.touch1[1],p=(p=h[0]-c[0])*p+(p=h[1]-c[1])*p,m=(m=f[0]-d[0])*m+(m=f[1]-d[1])*m;n=g(n,Math.sqrt(p/m)),r=[(c[0]+h[0])/2,(c[1]+h[1])/2],o=[(d[0]+f[0])/2,(d[1]+f[1])/2]}else{if(!a.touch0)return;r=a.touch0[0],o=a.touch0[1]}a.zoom("touch",i(y(n,r,o),a.extent,l))}}function x(){if(this.__zooming){var e,n,r=w(this,arguments),i=vt.changedTouches,o=i.length;for(sS(),t&&clearTimeout(t),t=setTimeout((function(){t=null}),h),e=0;e<o;++e)n=i[e],r.touch0&&r.touch0[2]===n.identifier?delete r.touch0:r.touch1&&r.touch1[2]===n.identifier&&delete r.touch1;if(r.touch1&&!r.touch0&&(r.touch0=r.touch1,delete r.touch1),r.touch0)r.touch0[1]=this.__zoom.invert(r.touch0[0]);else if(r.end(),2===r.taps){var a=Rt(this).on("dblclick.zoom");a&&a.apply(this,arguments)}}}return m.transform=function(e,t,n){var r=e.selection?e.selection():e;r.property("__zoom",dS),e!==r?_(e,t,n):r.interrupt().each((function(){w(this,arguments).start().zoom(null,"function"==typeof t?t.apply(this,arguments):t).end()}))},m.scaleBy=function(e,t,n){m.scaleTo(e,(function(){var e=this.__zoom.k,n="function"==typeof t?t.apply(this,arguments):t;return e*n}),n)},m.scaleTo=function(e,t,n){m.transform(e,(function(){var e=r.apply(this,arguments),o=this.__zoom,a=null==n?v(e):"function"==typeof n?n.apply(this,arguments):n,s=o.invert(a),u="function"==typeof t?t.apply(this,arguments):t;return i(y(g(o,u),a,s),e,l)}),n)},m.translateBy=function(e,t,n){m.transform(e,(function(){return i(this.__zoom.translate("function"==typeof t?t.apply(this,arguments):t,"function"==typeof n?n.apply(this,arguments):n),r.apply(this,arguments),l)}))},m.translateTo=function(e,t,n,o){m.transform(e,(function(){var e=r.apply(this,arguments),a=this.__zoom,s=null==o?v(e):"function"==typeof o?o.apply(this,arguments):o;return i(oS.translate(s[0],s[1]).scale(a.k).translate("function"==typeof t?-t.apply(this,arguments):-t,"function"==typeof n?-n.apply(this,arguments):-n),e,l)}),o)},b.prototype={start:function(){return 1==++this.active&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(e,t){return this.mouse&&"mouse"!==e&&(this.mouse[1]=t.invert(this.mouse[0])),this.touch0&&"touch"!==e&&(this.touch0[1]=t.invert(this.touch0[0])),this.touch1&&"touch"!==e&&(this.touch1[1]=t.invert(this.touch1[0])),this.that.__zoom=t,this.emit("zoom"),this},end:function(){return 0==--this.active&&(delete this.that.__zooming,this.emit("end")),this},emit:function(e){St(new rS(m,e,this.that.__zoom),d.apply,d,[e,this.that,this.args])}},m.wheelDelta=function(e){return arguments.length?(o="function"==typeof e?e:nS(+e),m):o},m.filter=function(e){return arguments.length?(n="function"==typeof e?e:nS(!!e),m):n},m.touchable=function(e){return arguments.length?(a="function"==typeof e?e:nS(!!e),m):a},m.extent=function(e){return arguments.length?(r="function"==typeof e?e:nS([[+e[0][0],+e[0][1]],[+e[1][0],+e[1][1]]]),m):r},m.scaleExtent=function(e){return arguments.length?(s[0]=+e[0],s[1]=+e[1],m):[s[0],s[1]]},m.translateExtent=function(e){return arguments.length?(l[0][0]=+e[0][0],l[1][0]=+e[1][0],l[0][1]=+e[0][1],l[1][1]=+e[1][1],m):[[l[0][0],l[0][1]],[l[1][0],l[1][1]]]},m.constrain=function(e){return arguments.length?(i=e,m):i},m.duration=function(e){return arguments.length?(u=+e,m):u},m.interpolate=function(e){return arguments.length?(c=e,m):c},m.on=function(){var e=d.on.apply(d,arguments);return e===d?m:e},m.clickDistance=function(e){return arguments.length?(p=(e=+e)*e,m):Math.sqrt(p)},m},gS=n(123),yS=n.n(gS),vS=n(124),_S=n.n(vS),wS=n(125),bS=n.n(wS);var MS={getNoCacheString:function(){const e=new Date;return[e.getUTCMilliseconds(),e.getUTCSeconds(),e.getUTCMinutes(),e.getUTCHours(),e.getUTCDay(),e.getUTCMonth(),e.getUTCFullYear()].join("-")},toDisplayNumber:function(e,t){function n(e){return(.01*Math.round(100*e)).toFixed(2)}return`${n(e)} &#177; ${n(t)}`},capitalize:function(e){return e.replace(/(?:^|\s)\S/g,e=>e.toUpperCase())},getRoot:function(){return window.CAULDRON=window.CAULDRON||{},window.CAULDRON}};const kS=['<div class="cd-body-header">','<div class="menu-icon"></div>','<div class="project-title"></div>','<div class="spacer"></div>','<div class="buttons"></div>',"</div>"];var SS={createHeader:function(){const e=MS.getRoot(),t=o()(kS.join("")).prependTo(o()(".body-wrapper"));e.RESULTS.has_error&&t.addClass("project-error")}};function TS(e){const t=MS.getRoot();let n;const r=`?nocache=${MS.getNoCacheString()}`;if(n=e.src.startsWith(":")?e.src.slice(1):t.DATA_DIRECTORY+e.src,window.document.getElementById(e.name))return Promise.resolve();function i(e,t){setTimeout(()=>e(t),250)}return/.*\.css$/.test(n)?new Promise(t=>{const o=document.createElement("link");o.rel="stylesheet",o.onload=i.bind(null,t,o),o.href=n+r,o.id=e.name,document.head.appendChild(o)}):/.*\.js$/.test(n)?new Promise(t=>{const o=document.createElement("script");o.onload=i.bind(null,t,o),o.src=n+r,o.id=e.name,document.head.appendChild(o)}):Promise.reject()}function CS(e){return e?Promise.all(e.map(TS)):Promise.resolve([])}var xS={loadSourceFile:TS,loadSourceFiles:CS,loadStepIncludes:function(e){if(!e)return Promise.resolve([]);const t=e.filter(e=>e).map(e=>CS(e.includes));return Promise.all(t)}};let ES,LS,OS;function DS(e){if(!e||e.hasClass("cd-project-step--selected"))return;e.addClass("cd-project-step--selected");const t=e.find(".cd-project-step__header");t.addClass("cd-project-step__header--selected").removeClass(t.attr("data-default-modifier"))}function RS(e){return e&&(ES=e),LS?Promise.resolve(ES):new Promise(e=>{LS=setTimeout((function(){!function(){const e=ES;LS=null,e&&o()(".body-wrapper").find(".cd-project-step").each((t,n)=>{const r=o()(n);r.attr("data-step-name")===e.name?DS(r):function(e){e.removeClass("cd-project-step--selected");const t=e.find(".cd-project-step__header");t.removeClass("cd-project-step__header--selected").addClass(t.attr("data-default-modifier"))}(r)})}(),e(ES)}),10)})}function AS(e){if(!e||!e.body)return null;const t=MS.getRoot(),n=o()(e.body);return n.find("[data-src]").each((e,n)=>{const r=o()(n),i=function(e){const t=e.attr("data-src");return t&&t.startsWith("/")?t.slice(1):t}(r);r.attr("src",`${t.DATA_DIRECTORY}/${i}?nocache=${t.getNoCacheString()}`),r.attr("data-src",null)}),n}var NS={prepareStepBody:AS,processStepUpdates:function(e,t){if(!e)return Promise.resolve();OS||(OS=window.CD.on.ready),t&&(ES=t);const n=e.map(e=>e.step);return OS=OS.then(()=>xS.loadStepIncludes(n)).then(()=>(function(e){const t=o()(".body-wrapper");let n;return e.forEach(e=>{const r=o()(`[data-step-name="${e.name}"]`);if("removed"===e.action)return void r.remove();let i=AS(e.step);ES&&e.name===ES.name&&DS(i),"updated"!==e.action?("modified"===e.action&&((i=t.find(`[data-step-name="${e.name}"]`)).find(".cd-step-title").html(e.title||e.name),i.detach()),(n=e.after?t.find(`[data-step-name="${e.after}"]`):t.find(".cd-body-header").after(i))&&n.length>0?n.after(i):e.after?t.append(i):t.prepend(i)):r.replaceWith(i)}),o()(window).trigger("resize"),RS()})(e))},updateSelectedStep:RS};function YS(){const e=MS.getRoot();!function(){const e=MS.getRoot(),{sid:t}=e.PARAMS,n=o()("body");!!t&&(o()("<div></div>").addClass("snapshot-bar").text(`Snapshot: ${t}`).prependTo(n),o()("<div></div>").addClass("snapshot-bar").addClass("snapshot-bar-overlay").text(`Snapshot: ${e.PARAMS.sid}`).prependTo(n),e.TITLE=`{${t}} ${e.TITLE}`)}(),o()("title").text(e.TITLE),e.SETTINGS.headerless||(SS.createHeader(),o()(".cd-body-header").find(".project-title").text(e.TITLE))}var jS={initialize:function(){const e=MS.getRoot();return e.DATA_DIRECTORY=function(){const e=MS.getRoot();if(window.PROJECT_DIRECTORY)return window.PROJECT_DIRECTORY;if(e.PARAMS.data_root)return e.PARAMS.data_root;const t=e.PARAMS.id||window.PROJECT_ID,{sid:n}=e.PARAMS;return["reports",t||"",n?"snapshots":"latest",n||""].filter(e=>e.length>0).join("/")}(),(MS.getRoot().PARAMS.preload_url,Promise.resolve()).then(()=>window.RESULTS?Promise.resolve():window.RESULTS_FILENAME?xS.loadSourceFile({name:"cauldron-project",src:`:${window.RESULTS_FILENAME}`}):xS.loadSourceFile({name:"cauldron-project",src:"/results.js"})).then(()=>(window.CAULDRON_VERSION=window.RESULTS.cauldron_version,e.RESULTS=window.RESULTS,e.DATA=window.RESULTS.data,e.SETTINGS=window.RESULTS.settings,e.TITLE=e.SETTINGS.title||e.SETTINGS.id,function(){const e=MS.getRoot();return window.COMBINED_INCLUDES?xS.loadSourceFiles(window.COMBINED_INCLUDES):xS.loadSourceFiles(window.RESULTS.includes).then(()=>xS.loadStepIncludes(e.RESULTS.steps))}())).then(()=>{const t=o()(".body-wrapper");return window.RESULTS.steps.forEach(e=>{const n=NS.prepareStepBody(e);n&&t.append(n)}),o()(window).trigger("resize"),e.DATA}).then(YS)}};var HS={parseUrlParameters:function(){return document.location.search.replace(/(^\?)/,"").split("&").map(e=>e.split("=")).filter(e=>2===e.length).reduce((e,[t,n])=>{const r=e;return r[t]=function(e){return!(t=e)||/[^0-9.-]+/.test(t)||(t.match(/\.+/g)||[]).length>1||-1!==t.slice(1).indexOf("-")?"true"===e.toLowerCase()||"false"!==e.toLowerCase()&&decodeURIComponent(e):-1===e.indexOf(".")?parseInt(e,10):parseFloat(e);var t}(n),r},{})}};var PS={scrollToAnchor:function(e,t,n){const r=o()(window).height(),i=o()(".body-wrapper").find(`.cd-project-step[data-step-name='${e}']`),a=i.height()<r-100,s=t&&!a?`${e}--${t}`:e,l=o()("html, body"),u=i.find(`a[name='${s}']`).offset().top-(a?0:"end"===t?r-100:0);l.stop(!0).animate({scrollTop:u},n||"slow")},changeFontSize:function(e,t){const n=o()(e),r=function(){if(!t)return parseFloat(n.attr("data-font-size-default"));const e=parseFloat(n.attr("data-font-size"));return Math.max(.1,e+.1*t)}();n.attr("data-font-size",r).css("font-size",`${r}em`)},collapse:function(e){const t=o()(`#${e}`),n=t.hasClass("closed"),r=t.attr(`data-${n?"opens":"closes"}`),i=(t.attr(`data-marks-${n?"opened":"closed"}`)||"").split("|").map(e=>o()(e));i.push(t),i.forEach(e=>{n?e.removeClass("closed").addClass("opened"):e.removeClass("opened").addClass("closed")}),r?(r.split("|").forEach(e=>{const r=o()(e);n?(r.show(),t.removeClass("closed")):(r.hide(),r.addClass("closed"))}),setTimeout(()=>o()(window).resize(),100)):o()(window).resize()},toggleVisible:function(e){o()(e).toggle()}};let IS;function FS(e){const t=o()(".body-wrapper");return Object.keys(e).forEach(n=>(function(e,t,n){const r=t[n],i=e.find(`[data-step-name="${n}"]`);i.attr("data-step-rename",r.name),i.find(".cd-step-title").html(r.title||r.name)})(t,e,n)),t.find("[data-step-rename]").each((e,t)=>(function(e){const t=o()(e),n=t.attr("data-step-rename");t.attr("data-step-rename",null).attr("data-step-name",n).find(".step-anchor").each((e,t)=>{const r=o()(t);r.attr("name",`${n}${r.attr("data-type")}`)})})(t)),Promise.resolve(e)}var BS={processStepRenames:function(e){return e?(IS||(IS=window.CD.on.ready),IS=IS.then(()=>FS(e))):Promise.resolve(e)}};let zS=-100,WS=!1;function US(e){const t=o()(e),n=t.parent(),r=t.parents(".cd-project-step-body").hasClass("closed"),i=t.parents(".cd-plotly-box-v2");r||WS||window.Plotly.relayout(t[0],{width:(i||n).width(),height:(i||n).height()})}function VS(){window.Plotly&&o()(".cd-plotly-box, .cd-plotly-box-v2").each((e,t)=>{US(o()(t).find(".plotly-graph-div"))})}function qS(){const e=MS.getRoot();if(!e.RUNNING||WS)return;const t=o()(window).width();Math.abs(t-zS)<10||(zS=t,e.resizeCallbacks.forEach(e=>e()),VS())}window.onresize=qS;var GS={pauseResizing:function(){WS=!0},resumeResizing:function(){WS=!1,setTimeout(qS,100)},resizePlotly:VS,resizePlotlyBox:US};n(132);function XS(){const e=MS.getRoot();e.RUNNING=!0,e.__on__.ready(),o()(window).resize()}window.$=o.a,window.jQuery=o.a,window.d3=r,window.Handsontable=yS.a,window.katex=_S.a,window.jstree=bS.a,window.require=function(e,t){const n=[];e.forEach(e=>{"plotly"===e&&n.push(window.Plotly)}),t.apply(this,n)},document.addEventListener("readystatechange",()=>{"complete"===document.readyState&&function(){const e=MS.getRoot();e.RUNNING=!1,e.SETTINGS={},e.notebookVersion=1,e.resizeCallbacks=[],e.PARAMS=HS.parseUrlParameters(),e.capitalize=MS.capitalize,e.getNoCacheString=MS.getNoCacheString,e.toDisplayNumber=MS.toDisplayNumber,e.scrollToAnchor=PS.scrollToAnchor,e.changeFontSize=PS.changeFontSize,e.collapse=PS.collapse,e.toggleVisible=PS.toggleVisible,e.processStepRenames=BS.processStepRenames,e.prepareStepBody=NS.prepareStepBody,e.processStepUpdates=NS.processStepUpdates,e.updateSelectedStep=NS.updateSelectedStep,e.pauseResizing=GS.pauseResizing,e.resumeResizing=GS.resumeResizing,e.resizePlotly=GS.resizePlotly,e.resizePlotlyBox=GS.resizePlotlyBox,jS.initialize().then(XS)}()})}]);
\ No newline at end of file
+!function(t,r){"use strict";var i;try{i=n(0)}catch(e){}e.exports=function(e){var t="function"==typeof e,n=!!window.addEventListener,r=window.document,i=window.setTimeout,o=function(e,t,r,i){n?e.addEventListener(t,r,!!i):e.attachEvent("on"+t,r)},a=function(e,t,r,i){n?e.removeEventListener(t,r,!!i):e.detachEvent("on"+t,r)},s=function(e,t,n){var i;r.createEvent?((i=r.createEvent("HTMLEvents")).initEvent(t,!0,!1),i=g(i,n),e.dispatchEvent(i)):r.createEventObject&&(i=r.createEventObject(),i=g(i,n),e.fireEvent("on"+t,i))},l=function(e,t){return-1!==(" "+e.className+" ").indexOf(" "+t+" ")},u=function(e){return/Array/.test(Object.prototype.toString.call(e))},c=function(e){return/Date/.test(Object.prototype.toString.call(e))&&!isNaN(e.getTime())},d=function(e){var t=e.getDay();return 0===t||6===t},h=function(e){return e%4==0&&e%100!=0||e%400==0},f=function(e,t){return[31,h(e)?29:28,31,30,31,30,31,31,30,31,30,31][t]},p=function(e){c(e)&&e.setHours(0,0,0,0)},m=function(e,t){return e.getTime()===t.getTime()},g=function(e,t,n){var r,i;for(r in t)(i=void 0!==e[r])&&"object"==typeof t[r]&&null!==t[r]&&void 0===t[r].nodeName?c(t[r])?n&&(e[r]=new Date(t[r].getTime())):u(t[r])?n&&(e[r]=t[r].slice(0)):e[r]=g({},t[r],n):!n&&i||(e[r]=t[r]);return e},y=function(e){return e.month<0&&(e.year-=Math.ceil(Math.abs(e.month)/12),e.month+=12),e.month>11&&(e.year+=Math.floor(Math.abs(e.month)/12),e.month-=12),e},v={field:null,bound:void 0,position:"bottom left",reposition:!0,format:"YYYY-MM-DD",defaultDate:null,setDefaultDate:!1,firstDay:0,formatStrict:!1,minDate:null,maxDate:null,yearRange:10,showWeekNumber:!1,minYear:0,maxYear:9999,minMonth:void 0,maxMonth:void 0,startRange:null,endRange:null,isRTL:!1,yearSuffix:"",showMonthAfterYear:!1,showDaysInNextAndPreviousMonths:!1,numberOfMonths:1,mainCalendar:"left",container:void 0,i18n:{previousMonth:"Previous Month",nextMonth:"Next Month",months:["January","February","March","April","May","June","July","August","September","October","November","December"],weekdays:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],weekdaysShort:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"]},theme:null,onSelect:null,onOpen:null,onClose:null,onDraw:null},_=function(e,t,n){for(t+=e.firstDay;t>=7;)t-=7;return n?e.i18n.weekdaysShort[t]:e.i18n.weekdays[t]},w=function(e){var t=[],n="false";if(e.isEmpty){if(!e.showDaysInNextAndPreviousMonths)return'<td class="is-empty"></td>';t.push("is-outside-current-month")}return e.isDisabled&&t.push("is-disabled"),e.isToday&&t.push("is-today"),e.isSelected&&(t.push("is-selected"),n="true"),e.isInRange&&t.push("is-inrange"),e.isStartRange&&t.push("is-startrange"),e.isEndRange&&t.push("is-endrange"),'<td data-day="'+e.day+'" class="'+t.join(" ")+'" aria-selected="'+n+'"><button class="pika-button pika-day" type="button" data-pika-year="'+e.year+'" data-pika-month="'+e.month+'" data-pika-day="'+e.day+'">'+e.day+"</button></td>"},b=function(e,t){return"<tr>"+(t?e.reverse():e).join("")+"</tr>"},M=function(e,t,n,r,i,o){var a,s,l,c,d,h=e._o,f=n===h.minYear,p=n===h.maxYear,m='<div id="'+o+'" class="pika-title" role="heading" aria-live="assertive">',g=!0,y=!0;for(l=[],a=0;a<12;a++)l.push('<option value="'+(n===i?a-t:12+a-t)+'"'+(a===r?' selected="selected"':"")+(f&&a<h.minMonth||p&&a>h.maxMonth?'disabled="disabled"':"")+">"+h.i18n.months[a]+"</option>");for(c='<div class="pika-label">'+h.i18n.months[r]+'<select class="pika-select pika-select-month" tabindex="-1">'+l.join("")+"</select></div>",u(h.yearRange)?(a=h.yearRange[0],s=h.yearRange[1]+1):(a=n-h.yearRange,s=1+n+h.yearRange),l=[];a<s&&a<=h.maxYear;a++)a>=h.minYear&&l.push('<option value="'+a+'"'+(a===n?' selected="selected"':"")+">"+a+"</option>");return d='<div class="pika-label">'+n+h.yearSuffix+'<select class="pika-select pika-select-year" tabindex="-1">'+l.join("")+"</select></div>",h.showMonthAfterYear?m+=d+c:m+=c+d,f&&(0===r||h.minMonth>=r)&&(g=!1),p&&(11===r||h.maxMonth<=r)&&(y=!1),0===t&&(m+='<button class="pika-prev'+(g?"":" is-disabled")+'" type="button">'+h.i18n.previousMonth+"</button>"),t===e._o.numberOfMonths-1&&(m+='<button class="pika-next'+(y?"":" is-disabled")+'" type="button">'+h.i18n.nextMonth+"</button>"),m+"</div>"},k=function(a){var s=this,u=s.config(a);s._onMouseDown=function(e){if(s._v){var t=(e=e||window.event).target||e.srcElement;if(t)if(l(t,"is-disabled")||(!l(t,"pika-button")||l(t,"is-empty")||l(t.parentNode,"is-disabled")?l(t,"pika-prev")?s.prevMonth():l(t,"pika-next")&&s.nextMonth():(s.setDate(new Date(t.getAttribute("data-pika-year"),t.getAttribute("data-pika-month"),t.getAttribute("data-pika-day"))),u.bound&&i((function(){s.hide(),u.field&&u.field.blur()}),100))),l(t,"pika-select"))s._c=!0;else{if(!e.preventDefault)return e.returnValue=!1,!1;e.preventDefault()}}},s._onChange=function(e){var t=(e=e||window.event).target||e.srcElement;t&&(l(t,"pika-select-month")?s.gotoMonth(t.value):l(t,"pika-select-year")&&s.gotoYear(t.value))},s._onKeyChange=function(e){if(e=e||window.event,s.isVisible())switch(e.keyCode){case 13:case 27:u.field.blur();break;case 37:e.preventDefault(),s.adjustDate("subtract",1);break;case 38:s.adjustDate("subtract",7);break;case 39:s.adjustDate("add",1);break;case 40:s.adjustDate("add",7)}},s._onInputChange=function(n){var r;n.firedBy!==s&&(r=t?(r=e(u.field.value,u.format,u.formatStrict))&&r.isValid()?r.toDate():null:new Date(Date.parse(u.field.value)),c(r)&&s.setDate(r),s._v||s.show())},s._onInputFocus=function(){s.show()},s._onInputClick=function(){s.show()},s._onInputBlur=function(){var e=r.activeElement;do{if(l(e,"pika-single"))return}while(e=e.parentNode);s._c||(s._b=i((function(){s.hide()}),50)),s._c=!1},s._onClick=function(e){var t=(e=e||window.event).target||e.srcElement,r=t;if(t){!n&&l(t,"pika-select")&&(t.onchange||(t.setAttribute("onchange","return;"),o(t,"change",s._onChange)));do{if(l(r,"pika-single")||r===u.trigger)return}while(r=r.parentNode);s._v&&t!==u.trigger&&r!==u.trigger&&s.hide()}},s.el=r.createElement("div"),s.el.className="pika-single"+(u.isRTL?" is-rtl":"")+(u.theme?" "+u.theme:""),o(s.el,"mousedown",s._onMouseDown,!0),o(s.el,"touchend",s._onMouseDown,!0),o(s.el,"change",s._onChange),o(r,"keydown",s._onKeyChange),u.field&&(u.container?u.container.appendChild(s.el):u.bound?r.body.appendChild(s.el):u.field.parentNode.insertBefore(s.el,u.field.nextSibling),o(u.field,"change",s._onInputChange),u.defaultDate||(t&&u.field.value?u.defaultDate=e(u.field.value,u.format).toDate():u.defaultDate=new Date(Date.parse(u.field.value)),u.setDefaultDate=!0));var d=u.defaultDate;c(d)?u.setDefaultDate?s.setDate(d,!0):s.gotoDate(d):s.gotoDate(new Date),u.bound?(this.hide(),s.el.className+=" is-bound",o(u.trigger,"click",s._onInputClick),o(u.trigger,"focus",s._onInputFocus),o(u.trigger,"blur",s._onInputBlur)):this.show()};return k.prototype={config:function(e){this._o||(this._o=g({},v,!0));var t=g(this._o,e,!0);t.isRTL=!!t.isRTL,t.field=t.field&&t.field.nodeName?t.field:null,t.theme="string"==typeof t.theme&&t.theme?t.theme:null,t.bound=!!(void 0!==t.bound?t.field&&t.bound:t.field),t.trigger=t.trigger&&t.trigger.nodeName?t.trigger:t.field,t.disableWeekends=!!t.disableWeekends,t.disableDayFn="function"==typeof t.disableDayFn?t.disableDayFn:null;var n=parseInt(t.numberOfMonths,10)||1;if(t.numberOfMonths=n>4?4:n,c(t.minDate)||(t.minDate=!1),c(t.maxDate)||(t.maxDate=!1),t.minDate&&t.maxDate&&t.maxDate<t.minDate&&(t.maxDate=t.minDate=!1),t.minDate&&this.setMinDate(t.minDate),t.maxDate&&this.setMaxDate(t.maxDate),u(t.yearRange)){var r=(new Date).getFullYear()-10;t.yearRange[0]=parseInt(t.yearRange[0],10)||r,t.yearRange[1]=parseInt(t.yearRange[1],10)||r}else t.yearRange=Math.abs(parseInt(t.yearRange,10))||v.yearRange,t.yearRange>100&&(t.yearRange=100);return t},toString:function(n){return c(this._d)?t?e(this._d).format(n||this._o.format):this._d.toDateString():""},getMoment:function(){return t?e(this._d):null},setMoment:function(n,r){t&&e.isMoment(n)&&this.setDate(n.toDate(),r)},getDate:function(){return c(this._d)?new Date(this._d.getTime()):new Date},setDate:function(e,t){if(!e)return this._d=null,this._o.field&&(this._o.field.value="",s(this._o.field,"change",{firedBy:this})),this.draw();if("string"==typeof e&&(e=new Date(Date.parse(e))),c(e)){var n=this._o.minDate,r=this._o.maxDate;c(n)&&e<n?e=n:c(r)&&e>r&&(e=r),this._d=new Date(e.getTime()),p(this._d),this.gotoDate(this._d),this._o.field&&(this._o.field.value=this.toString(),s(this._o.field,"change",{firedBy:this})),t||"function"!=typeof this._o.onSelect||this._o.onSelect.call(this,this.getDate())}},gotoDate:function(e){var t=!0;if(c(e)){if(this.calendars){var n=new Date(this.calendars[0].year,this.calendars[0].month,1),r=new Date(this.calendars[this.calendars.length-1].year,this.calendars[this.calendars.length-1].month,1),i=e.getTime();r.setMonth(r.getMonth()+1),r.setDate(r.getDate()-1),t=i<n.getTime()||r.getTime()<i}t&&(this.calendars=[{month:e.getMonth(),year:e.getFullYear()}],"right"===this._o.mainCalendar&&(this.calendars[0].month+=1-this._o.numberOfMonths)),this.adjustCalendars()}},adjustDate:function(n,r){var i,o=this.getDate(),a=24*parseInt(r)*60*60*1e3;"add"===n?i=new Date(o.valueOf()+a):"subtract"===n&&(i=new Date(o.valueOf()-a)),t&&("add"===n?i=e(o).add(r,"days").toDate():"subtract"===n&&(i=e(o).subtract(r,"days").toDate())),this.setDate(i)},adjustCalendars:function(){this.calendars[0]=y(this.calendars[0]);for(var e=1;e<this._o.numberOfMonths;e++)this.calendars[e]=y({month:this.calendars[0].month+e,year:this.calendars[0].year});this.draw()},gotoToday:function(){this.gotoDate(new Date)},gotoMonth:function(e){isNaN(e)||(this.calendars[0].month=parseInt(e,10),this.adjustCalendars())},nextMonth:function(){this.calendars[0].month++,this.adjustCalendars()},prevMonth:function(){this.calendars[0].month--,this.adjustCalendars()},gotoYear:function(e){isNaN(e)||(this.calendars[0].year=parseInt(e,10),this.adjustCalendars())},setMinDate:function(e){e instanceof Date?(p(e),this._o.minDate=e,this._o.minYear=e.getFullYear(),this._o.minMonth=e.getMonth()):(this._o.minDate=v.minDate,this._o.minYear=v.minYear,this._o.minMonth=v.minMonth,this._o.startRange=v.startRange),this.draw()},setMaxDate:function(e){e instanceof Date?(p(e),this._o.maxDate=e,this._o.maxYear=e.getFullYear(),this._o.maxMonth=e.getMonth()):(this._o.maxDate=v.maxDate,this._o.maxYear=v.maxYear,this._o.maxMonth=v.maxMonth,this._o.endRange=v.endRange),this.draw()},setStartRange:function(e){this._o.startRange=e},setEndRange:function(e){this._o.endRange=e},draw:function(e){if(this._v||e){var t,n=this._o,r=n.minYear,o=n.maxYear,a=n.minMonth,s=n.maxMonth,l="";this._y<=r&&(this._y=r,!isNaN(a)&&this._m<a&&(this._m=a)),this._y>=o&&(this._y=o,!isNaN(s)&&this._m>s&&(this._m=s)),t="pika-title-"+Math.random().toString(36).replace(/[^a-z]+/g,"").substr(0,2);for(var u=0;u<n.numberOfMonths;u++)l+='<div class="pika-lendar">'+M(this,u,this.calendars[u].year,this.calendars[u].month,this.calendars[0].year,t)+this.render(this.calendars[u].year,this.calendars[u].month,t)+"</div>";this.el.innerHTML=l,n.bound&&"hidden"!==n.field.type&&i((function(){n.trigger.focus()}),1),"function"==typeof this._o.onDraw&&this._o.onDraw(this),n.bound&&n.field.setAttribute("aria-label","Use the arrow keys to pick a date")}},adjustPosition:function(){var e,t,n,i,o,a,s,l,u,c;if(!this._o.container){if(this.el.style.position="absolute",t=e=this._o.trigger,n=this.el.offsetWidth,i=this.el.offsetHeight,o=window.innerWidth||r.documentElement.clientWidth,a=window.innerHeight||r.documentElement.clientHeight,s=window.pageYOffset||r.body.scrollTop||r.documentElement.scrollTop,"function"==typeof e.getBoundingClientRect)l=(c=e.getBoundingClientRect()).left+window.pageXOffset,u=c.bottom+window.pageYOffset;else for(l=t.offsetLeft,u=t.offsetTop+t.offsetHeight;t=t.offsetParent;)l+=t.offsetLeft,u+=t.offsetTop;(this._o.reposition&&l+n>o||this._o.position.indexOf("right")>-1&&l-n+e.offsetWidth>0)&&(l=l-n+e.offsetWidth),(this._o.reposition&&u+i>a+s||this._o.position.indexOf("top")>-1&&u-i-e.offsetHeight>0)&&(u=u-i-e.offsetHeight),this.el.style.left=l+"px",this.el.style.top=u+"px"}},render:function(e,t,n){var r=this._o,i=new Date,o=f(e,t),a=new Date(e,t,1).getDay(),s=[],l=[];p(i),r.firstDay>0&&(a-=r.firstDay)<0&&(a+=7);for(var u,h,g,y,v=0===t?11:t-1,M=11===t?0:t+1,k=0===t?e-1:e,S=11===t?e+1:e,T=f(k,v),C=o+a,x=C;x>7;)x-=7;C+=7-x;for(var E=0,L=0;E<C;E++){var O=new Date(e,t,E-a+1),D=!!c(this._d)&&m(O,this._d),R=m(O,i),A=E<a||E>=o+a,N=E-a+1,Y=t,j=e,H=r.startRange&&m(r.startRange,O),P=r.endRange&&m(r.endRange,O),I=r.startRange&&r.endRange&&r.startRange<O&&O<r.endRange;A&&(E<a?(N=T+N,Y=v,j=k):(N-=o,Y=M,j=S));var F={day:N,month:Y,year:j,isSelected:D,isToday:R,isDisabled:r.minDate&&O<r.minDate||r.maxDate&&O>r.maxDate||r.disableWeekends&&d(O)||r.disableDayFn&&r.disableDayFn(O),isEmpty:A,isStartRange:H,isEndRange:P,isInRange:I,showDaysInNextAndPreviousMonths:r.showDaysInNextAndPreviousMonths};l.push(w(F)),7==++L&&(r.showWeekNumber&&l.unshift((u=E-a,h=t,g=e,y=void 0,void 0,y=new Date(g,0,1),'<td class="pika-week">'+Math.ceil(((new Date(g,h,u)-y)/864e5+y.getDay()+1)/7)+"</td>")),s.push(b(l,r.isRTL)),l=[],L=0)}return function(e,t,n){return'<table cellpadding="0" cellspacing="0" class="pika-table" role="grid" aria-labelledby="'+n+'">'+function(e){var t,n=[];e.showWeekNumber&&n.push("<th></th>");for(t=0;t<7;t++)n.push('<th scope="col"><abbr title="'+_(e,t)+'">'+_(e,t,!0)+"</abbr></th>");return"<thead><tr>"+(e.isRTL?n.reverse():n).join("")+"</tr></thead>"}(e)+(r=t,"<tbody>"+r.join("")+"</tbody>")+"</table>";var r}(r,s,n)},isVisible:function(){return this._v},show:function(){var e,t,n;this.isVisible()||(e=this.el,t="is-hidden",e.className=(n=(" "+e.className+" ").replace(" "+t+" "," ")).trim?n.trim():n.replace(/^\s+|\s+$/g,""),this._v=!0,this.draw(),this._o.bound&&(o(r,"click",this._onClick),this.adjustPosition()),"function"==typeof this._o.onOpen&&this._o.onOpen.call(this))},hide:function(){var e,t,n=this._v;!1!==n&&(this._o.bound&&a(r,"click",this._onClick),this.el.style.position="static",this.el.style.left="auto",this.el.style.top="auto",e=this.el,l(e,t="is-hidden")||(e.className=""===e.className?t:e.className+" "+t),this._v=!1,void 0!==n&&"function"==typeof this._o.onClose&&this._o.onClose.call(this))},destroy:function(){this.hide(),a(this.el,"mousedown",this._onMouseDown,!0),a(this.el,"touchend",this._onMouseDown,!0),a(this.el,"change",this._onChange),this._o.field&&(a(this._o.field,"change",this._onInputChange),this._o.bound&&(a(this._o.trigger,"click",this._onInputClick),a(this._o.trigger,"focus",this._onInputFocus),a(this._o.trigger,"blur",this._onInputBlur))),this.el.parentNode&&this.el.parentNode.removeChild(this.el)}},k}(i)}()},function(e,t,n){},function(e,t,n){"use strict";n.r(t);var r={};n.r(r),n.d(r,"version",(function(){return a})),n.d(r,"bisect",(function(){return h})),n.d(r,"bisectRight",(function(){return c})),n.d(r,"bisectLeft",(function(){return d})),n.d(r,"ascending",(function(){return s})),n.d(r,"bisector",(function(){return l})),n.d(r,"cross",(function(){return m})),n.d(r,"descending",(function(){return g})),n.d(r,"deviation",(function(){return _})),n.d(r,"extent",(function(){return w})),n.d(r,"histogram",(function(){return N})),n.d(r,"thresholdFreedmanDiaconis",(function(){return j})),n.d(r,"thresholdScott",(function(){return H})),n.d(r,"thresholdSturges",(function(){return A})),n.d(r,"max",(function(){return P})),n.d(r,"mean",(function(){return I})),n.d(r,"median",(function(){return F})),n.d(r,"merge",(function(){return B})),n.d(r,"min",(function(){return z})),n.d(r,"pairs",(function(){return f})),n.d(r,"permute",(function(){return W})),n.d(r,"quantile",(function(){return Y})),n.d(r,"range",(function(){return C})),n.d(r,"scan",(function(){return U})),n.d(r,"shuffle",(function(){return V})),n.d(r,"sum",(function(){return q})),n.d(r,"ticks",(function(){return O})),n.d(r,"tickIncrement",(function(){return D})),n.d(r,"tickStep",(function(){return R})),n.d(r,"transpose",(function(){return G})),n.d(r,"variance",(function(){return v})),n.d(r,"zip",(function(){return K})),n.d(r,"axisTop",(function(){return ue})),n.d(r,"axisRight",(function(){return ce})),n.d(r,"axisBottom",(function(){return de})),n.d(r,"axisLeft",(function(){return he})),n.d(r,"brush",(function(){return Ca})),n.d(r,"brushX",(function(){return Sa})),n.d(r,"brushY",(function(){return Ta})),n.d(r,"brushSelection",(function(){return ka})),n.d(r,"chord",(function(){return Ya})),n.d(r,"ribbon",(function(){return Ka})),n.d(r,"nest",(function(){return Qa})),n.d(r,"set",(function(){return ss})),n.d(r,"map",(function(){return Za})),n.d(r,"keys",(function(){return ls})),n.d(r,"values",(function(){return us})),n.d(r,"entries",(function(){return cs})),n.d(r,"color",(function(){return yn})),n.d(r,"rgb",(function(){return bn})),n.d(r,"hsl",(function(){return En})),n.d(r,"lab",(function(){return xr})),n.d(r,"hcl",(function(){return Yr})),n.d(r,"lch",(function(){return Nr})),n.d(r,"gray",(function(){return Cr})),n.d(r,"cubehelix",(function(){return Xr})),n.d(r,"contours",(function(){return ws})),n.d(r,"contourDensity",(function(){return Cs})),n.d(r,"dispatch",(function(){return _e})),n.d(r,"drag",(function(){return Qt})),n.d(r,"dragDisable",(function(){return Vt})),n.d(r,"dragEnable",(function(){return qt})),n.d(r,"dsvFormat",(function(){return js})),n.d(r,"csvParse",(function(){return Ps})),n.d(r,"csvParseRows",(function(){return Is})),n.d(r,"csvFormat",(function(){return Fs})),n.d(r,"csvFormatBody",(function(){return Bs})),n.d(r,"csvFormatRows",(function(){return zs})),n.d(r,"tsvParse",(function(){return Us})),n.d(r,"tsvParseRows",(function(){return Vs})),n.d(r,"tsvFormat",(function(){return qs})),n.d(r,"tsvFormatBody",(function(){return Gs})),n.d(r,"tsvFormatRows",(function(){return Xs})),n.d(r,"autoType",(function(){return Ks})),n.d(r,"easeLinear",(function(){return lo})),n.d(r,"easeQuad",(function(){return ho})),n.d(r,"easeQuadIn",(function(){return uo})),n.d(r,"easeQuadOut",(function(){return co})),n.d(r,"easeQuadInOut",(function(){return ho})),n.d(r,"easeCubic",(function(){return mo})),n.d(r,"easeCubicIn",(function(){return fo})),n.d(r,"easeCubicOut",(function(){return po})),n.d(r,"easeCubicInOut",(function(){return mo})),n.d(r,"easePoly",(function(){return vo})),n.d(r,"easePolyIn",(function(){return go})),n.d(r,"easePolyOut",(function(){return yo})),n.d(r,"easePolyInOut",(function(){return vo})),n.d(r,"easeSin",(function(){return ko})),n.d(r,"easeSinIn",(function(){return bo})),n.d(r,"easeSinOut",(function(){return Mo})),n.d(r,"easeSinInOut",(function(){return ko})),n.d(r,"easeExp",(function(){return Co})),n.d(r,"easeExpIn",(function(){return So})),n.d(r,"easeExpOut",(function(){return To})),n.d(r,"easeExpInOut",(function(){return Co})),n.d(r,"easeCircle",(function(){return Lo})),n.d(r,"easeCircleIn",(function(){return xo})),n.d(r,"easeCircleOut",(function(){return Eo})),n.d(r,"easeCircleInOut",(function(){return Lo})),n.d(r,"easeBounce",(function(){return Bo})),n.d(r,"easeBounceIn",(function(){return Fo})),n.d(r,"easeBounceOut",(function(){return Bo})),n.d(r,"easeBounceInOut",(function(){return zo})),n.d(r,"easeBack",(function(){return Vo})),n.d(r,"easeBackIn",(function(){return Wo})),n.d(r,"easeBackOut",(function(){return Uo})),n.d(r,"easeBackInOut",(function(){return Vo})),n.d(r,"easeElastic",(function(){return Xo})),n.d(r,"easeElasticIn",(function(){return Go})),n.d(r,"easeElasticOut",(function(){return Xo})),n.d(r,"easeElasticInOut",(function(){return Ko})),n.d(r,"blob",(function(){return $s})),n.d(r,"buffer",(function(){return Qs})),n.d(r,"dsv",(function(){return rl})),n.d(r,"csv",(function(){return il})),n.d(r,"tsv",(function(){return ol})),n.d(r,"image",(function(){return al})),n.d(r,"json",(function(){return ll})),n.d(r,"text",(function(){return tl})),n.d(r,"xml",(function(){return cl})),n.d(r,"html",(function(){return dl})),n.d(r,"svg",(function(){return hl})),n.d(r,"forceCenter",(function(){return fl})),n.d(r,"forceCollide",(function(){return Cl})),n.d(r,"forceLink",(function(){return Ll})),n.d(r,"forceManyBody",(function(){return Yl})),n.d(r,"forceRadial",(function(){return jl})),n.d(r,"forceSimulation",(function(){return Nl})),n.d(r,"forceX",(function(){return Hl})),n.d(r,"forceY",(function(){return Pl})),n.d(r,"formatDefaultLocale",(function(){return tu})),n.d(r,"format",(function(){return ql})),n.d(r,"formatPrefix",(function(){return Gl})),n.d(r,"formatLocale",(function(){return eu})),n.d(r,"formatSpecifier",(function(){return zl})),n.d(r,"FormatSpecifier",(function(){return Wl})),n.d(r,"precisionFixed",(function(){return nu})),n.d(r,"precisionPrefix",(function(){return ru})),n.d(r,"precisionRound",(function(){return iu})),n.d(r,"geoArea",(function(){return $u})),n.d(r,"geoBounds",(function(){return Wc})),n.d(r,"geoCentroid",(function(){return td})),n.d(r,"geoCircle",(function(){return hd})),n.d(r,"geoClipAntimeridian",(function(){return Sd})),n.d(r,"geoClipCircle",(function(){return Td})),n.d(r,"geoClipExtent",(function(){return Ad})),n.d(r,"geoClipRectangle",(function(){return Ld})),n.d(r,"geoContains",(function(){return $d})),n.d(r,"geoDistance",(function(){return zd})),n.d(r,"geoGraticule",(function(){return eh})),n.d(r,"geoGraticule10",(function(){return th})),n.d(r,"geoInterpolate",(function(){return ah})),n.d(r,"geoLength",(function(){return Id})),n.d(r,"geoPath",(function(){return of})),n.d(r,"geoAlbers",(function(){return Tf})),n.d(r,"geoAlbersUsa",(function(){return Cf})),n.d(r,"geoAzimuthalEqualArea",(function(){return Of})),n.d(r,"geoAzimuthalEqualAreaRaw",(function(){return Lf})),n.d(r,"geoAzimuthalEquidistant",(function(){return Rf})),n.d(r,"geoAzimuthalEquidistantRaw",(function(){return Df})),n.d(r,"geoConicConformal",(function(){return Pf})),n.d(r,"geoConicConformalRaw",(function(){return Hf})),n.d(r,"geoConicEqualArea",(function(){return Sf})),n.d(r,"geoConicEqualAreaRaw",(function(){return kf})),n.d(r,"geoConicEquidistant",(function(){return zf})),n.d(r,"geoConicEquidistantRaw",(function(){return Bf})),n.d(r,"geoEqualEarth",(function(){return Kf})),n.d(r,"geoEqualEarthRaw",(function(){return Xf})),n.d(r,"geoEquirectangular",(function(){return Ff})),n.d(r,"geoEquirectangularRaw",(function(){return If})),n.d(r,"geoGnomonic",(function(){return $f})),n.d(r,"geoGnomonicRaw",(function(){return Jf})),n.d(r,"geoIdentity",(function(){return Qf})),n.d(r,"geoProjection",(function(){return wf})),n.d(r,"geoProjectionMutator",(function(){return bf})),n.d(r,"geoMercator",(function(){return Nf})),n.d(r,"geoMercatorRaw",(function(){return Af})),n.d(r,"geoNaturalEarth1",(function(){return tp})),n.d(r,"geoNaturalEarth1Raw",(function(){return ep})),n.d(r,"geoOrthographic",(function(){return rp})),n.d(r,"geoOrthographicRaw",(function(){return np})),n.d(r,"geoStereographic",(function(){return op})),n.d(r,"geoStereographicRaw",(function(){return ip})),n.d(r,"geoTransverseMercator",(function(){return sp})),n.d(r,"geoTransverseMercatorRaw",(function(){return ap})),n.d(r,"geoRotation",(function(){return ud})),n.d(r,"geoStream",(function(){return Wu})),n.d(r,"geoTransform",(function(){return af})),n.d(r,"cluster",(function(){return dp})),n.d(r,"hierarchy",(function(){return fp})),n.d(r,"pack",(function(){return Pp})),n.d(r,"packSiblings",(function(){return Rp})),n.d(r,"packEnclose",(function(){return _p})),n.d(r,"partition",(function(){return Up})),n.d(r,"stratify",(function(){return Jp})),n.d(r,"tree",(function(){return rm})),n.d(r,"treemap",(function(){return lm})),n.d(r,"treemapBinary",(function(){return um})),n.d(r,"treemapDice",(function(){return Wp})),n.d(r,"treemapSlice",(function(){return im})),n.d(r,"treemapSliceDice",(function(){return cm})),n.d(r,"treemapSquarify",(function(){return sm})),n.d(r,"treemapResquarify",(function(){return dm})),n.d(r,"interpolate",(function(){return er})),n.d(r,"interpolateArray",(function(){return Wn})),n.d(r,"interpolateBasis",(function(){return Rn})),n.d(r,"interpolateBasisClosed",(function(){return An})),n.d(r,"interpolateDate",(function(){return Un})),n.d(r,"interpolateDiscrete",(function(){return tr})),n.d(r,"interpolateHue",(function(){return nr})),n.d(r,"interpolateNumber",(function(){return Vn})),n.d(r,"interpolateObject",(function(){return qn})),n.d(r,"interpolateRound",(function(){return rr})),n.d(r,"interpolateString",(function(){return Qn})),n.d(r,"interpolateTransformCss",(function(){return lr})),n.d(r,"interpolateTransformSvg",(function(){return ur})),n.d(r,"interpolateZoom",(function(){return hr})),n.d(r,"interpolateRgb",(function(){return In})),n.d(r,"interpolateRgbBasis",(function(){return Bn})),n.d(r,"interpolateRgbBasisClosed",(function(){return zn})),n.d(r,"interpolateHsl",(function(){return pr})),n.d(r,"interpolateHslLong",(function(){return mr})),n.d(r,"interpolateLab",(function(){return Pr})),n.d(r,"interpolateHcl",(function(){return Fr})),n.d(r,"interpolateHclLong",(function(){return Br})),n.d(r,"interpolateCubehelix",(function(){return $r})),n.d(r,"interpolateCubehelixLong",(function(){return Zr})),n.d(r,"piecewise",(function(){return Qr})),n.d(r,"quantize",(function(){return ni})),n.d(r,"path",(function(){return Wa})),n.d(r,"polygonArea",(function(){return hm})),n.d(r,"polygonCentroid",(function(){return fm})),n.d(r,"polygonHull",(function(){return ym})),n.d(r,"polygonContains",(function(){return vm})),n.d(r,"polygonLength",(function(){return _m})),n.d(r,"quadtree",(function(){return wl})),n.d(r,"randomUniform",(function(){return bm})),n.d(r,"randomNormal",(function(){return Mm})),n.d(r,"randomLogNormal",(function(){return km})),n.d(r,"randomBates",(function(){return Tm})),n.d(r,"randomIrwinHall",(function(){return Sm})),n.d(r,"randomExponential",(function(){return Cm})),n.d(r,"scaleBand",(function(){return Nm})),n.d(r,"scalePoint",(function(){return Ym})),n.d(r,"scaleIdentity",(function(){return Jm})),n.d(r,"scaleLinear",(function(){return Km})),n.d(r,"scaleLog",(function(){return og})),n.d(r,"scaleSymlog",(function(){return ug})),n.d(r,"scaleOrdinal",(function(){return Am})),n.d(r,"scaleImplicit",(function(){return Rm})),n.d(r,"scalePow",(function(){return pg})),n.d(r,"scaleSqrt",(function(){return mg})),n.d(r,"scaleQuantile",(function(){return gg})),n.d(r,"scaleQuantize",(function(){return yg})),n.d(r,"scaleThreshold",(function(){return vg})),n.d(r,"scaleTime",(function(){return o_})),n.d(r,"scaleUtc",(function(){return m_})),n.d(r,"scaleSequential",(function(){return v_})),n.d(r,"scaleSequentialLog",(function(){return __})),n.d(r,"scaleSequentialPow",(function(){return b_})),n.d(r,"scaleSequentialSqrt",(function(){return M_})),n.d(r,"scaleSequentialSymlog",(function(){return w_})),n.d(r,"scaleSequentialQuantile",(function(){return k_})),n.d(r,"scaleDiverging",(function(){return T_})),n.d(r,"scaleDivergingLog",(function(){return C_})),n.d(r,"scaleDivergingPow",(function(){return E_})),n.d(r,"scaleDivergingSqrt",(function(){return L_})),n.d(r,"scaleDivergingSymlog",(function(){return x_})),n.d(r,"tickFormat",(function(){return Gm})),n.d(r,"schemeCategory10",(function(){return D_})),n.d(r,"schemeAccent",(function(){return R_})),n.d(r,"schemeDark2",(function(){return A_})),n.d(r,"schemePaired",(function(){return N_})),n.d(r,"schemePastel1",(function(){return Y_})),n.d(r,"schemePastel2",(function(){return j_})),n.d(r,"schemeSet1",(function(){return H_})),n.d(r,"schemeSet2",(function(){return P_})),n.d(r,"schemeSet3",(function(){return I_})),n.d(r,"schemeTableau10",(function(){return F_})),n.d(r,"interpolateBrBG",(function(){return W_})),n.d(r,"schemeBrBG",(function(){return z_})),n.d(r,"interpolatePRGn",(function(){return V_})),n.d(r,"schemePRGn",(function(){return U_})),n.d(r,"interpolatePiYG",(function(){return G_})),n.d(r,"schemePiYG",(function(){return q_})),n.d(r,"interpolatePuOr",(function(){return K_})),n.d(r,"schemePuOr",(function(){return X_})),n.d(r,"interpolateRdBu",(function(){return $_})),n.d(r,"schemeRdBu",(function(){return J_})),n.d(r,"interpolateRdGy",(function(){return Q_})),n.d(r,"schemeRdGy",(function(){return Z_})),n.d(r,"interpolateRdYlBu",(function(){return tw})),n.d(r,"schemeRdYlBu",(function(){return ew})),n.d(r,"interpolateRdYlGn",(function(){return rw})),n.d(r,"schemeRdYlGn",(function(){return nw})),n.d(r,"interpolateSpectral",(function(){return ow})),n.d(r,"schemeSpectral",(function(){return iw})),n.d(r,"interpolateBuGn",(function(){return sw})),n.d(r,"schemeBuGn",(function(){return aw})),n.d(r,"interpolateBuPu",(function(){return uw})),n.d(r,"schemeBuPu",(function(){return lw})),n.d(r,"interpolateGnBu",(function(){return dw})),n.d(r,"schemeGnBu",(function(){return cw})),n.d(r,"interpolateOrRd",(function(){return fw})),n.d(r,"schemeOrRd",(function(){return hw})),n.d(r,"interpolatePuBuGn",(function(){return mw})),n.d(r,"schemePuBuGn",(function(){return pw})),n.d(r,"interpolatePuBu",(function(){return yw})),n.d(r,"schemePuBu",(function(){return gw})),n.d(r,"interpolatePuRd",(function(){return _w})),n.d(r,"schemePuRd",(function(){return vw})),n.d(r,"interpolateRdPu",(function(){return bw})),n.d(r,"schemeRdPu",(function(){return ww})),n.d(r,"interpolateYlGnBu",(function(){return kw})),n.d(r,"schemeYlGnBu",(function(){return Mw})),n.d(r,"interpolateYlGn",(function(){return Tw})),n.d(r,"schemeYlGn",(function(){return Sw})),n.d(r,"interpolateYlOrBr",(function(){return xw})),n.d(r,"schemeYlOrBr",(function(){return Cw})),n.d(r,"interpolateYlOrRd",(function(){return Lw})),n.d(r,"schemeYlOrRd",(function(){return Ew})),n.d(r,"interpolateBlues",(function(){return Dw})),n.d(r,"schemeBlues",(function(){return Ow})),n.d(r,"interpolateGreens",(function(){return Aw})),n.d(r,"schemeGreens",(function(){return Rw})),n.d(r,"interpolateGreys",(function(){return Yw})),n.d(r,"schemeGreys",(function(){return Nw})),n.d(r,"interpolatePurples",(function(){return Hw})),n.d(r,"schemePurples",(function(){return jw})),n.d(r,"interpolateReds",(function(){return Iw})),n.d(r,"schemeReds",(function(){return Pw})),n.d(r,"interpolateOranges",(function(){return Bw})),n.d(r,"schemeOranges",(function(){return Fw})),n.d(r,"interpolateCividis",(function(){return zw})),n.d(r,"interpolateCubehelixDefault",(function(){return Ww})),n.d(r,"interpolateRainbow",(function(){return Gw})),n.d(r,"interpolateWarm",(function(){return Uw})),n.d(r,"interpolateCool",(function(){return Vw})),n.d(r,"interpolateSinebow",(function(){return $w})),n.d(r,"interpolateTurbo",(function(){return Zw})),n.d(r,"interpolateViridis",(function(){return eb})),n.d(r,"interpolateMagma",(function(){return tb})),n.d(r,"interpolateInferno",(function(){return nb})),n.d(r,"interpolatePlasma",(function(){return rb})),n.d(r,"create",(function(){return At})),n.d(r,"creator",(function(){return Te})),n.d(r,"local",(function(){return Yt})),n.d(r,"matcher",(function(){return Oe})),n.d(r,"mouse",(function(){return It})),n.d(r,"namespace",(function(){return Me})),n.d(r,"namespaces",(function(){return be})),n.d(r,"clientPoint",(function(){return Pt})),n.d(r,"select",(function(){return Rt})),n.d(r,"selectAll",(function(){return Ft})),n.d(r,"selection",(function(){return Dt})),n.d(r,"selector",(function(){return xe})),n.d(r,"selectorAll",(function(){return Le})),n.d(r,"style",(function(){return Ge})),n.d(r,"touch",(function(){return Bt})),n.d(r,"touches",(function(){return zt})),n.d(r,"window",(function(){return We})),n.d(r,"event",(function(){return vt})),n.d(r,"customEvent",(function(){return St})),n.d(r,"arc",(function(){return kb})),n.d(r,"area",(function(){return Lb})),n.d(r,"line",(function(){return Eb})),n.d(r,"pie",(function(){return Rb})),n.d(r,"areaRadial",(function(){return Pb})),n.d(r,"radialArea",(function(){return Pb})),n.d(r,"lineRadial",(function(){return Hb})),n.d(r,"radialLine",(function(){return Hb})),n.d(r,"pointRadial",(function(){return Ib})),n.d(r,"linkHorizontal",(function(){return Gb})),n.d(r,"linkVertical",(function(){return Xb})),n.d(r,"linkRadial",(function(){return Kb})),n.d(r,"symbol",(function(){return fM})),n.d(r,"symbols",(function(){return hM})),n.d(r,"symbolCircle",(function(){return Jb})),n.d(r,"symbolCross",(function(){return $b})),n.d(r,"symbolDiamond",(function(){return eM})),n.d(r,"symbolSquare",(function(){return oM})),n.d(r,"symbolStar",(function(){return iM})),n.d(r,"symbolTriangle",(function(){return sM})),n.d(r,"symbolWye",(function(){return dM})),n.d(r,"curveBasisClosed",(function(){return _M})),n.d(r,"curveBasisOpen",(function(){return bM})),n.d(r,"curveBasis",(function(){return yM})),n.d(r,"curveBundle",(function(){return kM})),n.d(r,"curveCardinalClosed",(function(){return EM})),n.d(r,"curveCardinalOpen",(function(){return OM})),n.d(r,"curveCardinal",(function(){return CM})),n.d(r,"curveCatmullRomClosed",(function(){return YM})),n.d(r,"curveCatmullRomOpen",(function(){return HM})),n.d(r,"curveCatmullRom",(function(){return AM})),n.d(r,"curveLinearClosed",(function(){return IM})),n.d(r,"curveLinear",(function(){return Tb})),n.d(r,"curveMonotoneX",(function(){return GM})),n.d(r,"curveMonotoneY",(function(){return XM})),n.d(r,"curveNatural",(function(){return $M})),n.d(r,"curveStep",(function(){return QM})),n.d(r,"curveStepAfter",(function(){return tk})),n.d(r,"curveStepBefore",(function(){return ek})),n.d(r,"stack",(function(){return ok})),n.d(r,"stackOffsetExpand",(function(){return ak})),n.d(r,"stackOffsetDiverging",(function(){return sk})),n.d(r,"stackOffsetNone",(function(){return nk})),n.d(r,"stackOffsetSilhouette",(function(){return lk})),n.d(r,"stackOffsetWiggle",(function(){return uk})),n.d(r,"stackOrderAppearance",(function(){return ck})),n.d(r,"stackOrderAscending",(function(){return hk})),n.d(r,"stackOrderDescending",(function(){return pk})),n.d(r,"stackOrderInsideOut",(function(){return mk})),n.d(r,"stackOrderNone",(function(){return rk})),n.d(r,"stackOrderReverse",(function(){return gk})),n.d(r,"timeInterval",(function(){return bg})),n.d(r,"timeMillisecond",(function(){return iy})),n.d(r,"timeMilliseconds",(function(){return oy})),n.d(r,"utcMillisecond",(function(){return iy})),n.d(r,"utcMilliseconds",(function(){return oy})),n.d(r,"timeSecond",(function(){return ty})),n.d(r,"timeSeconds",(function(){return ny})),n.d(r,"utcSecond",(function(){return ty})),n.d(r,"utcSeconds",(function(){return ny})),n.d(r,"timeMinute",(function(){return Zg})),n.d(r,"timeMinutes",(function(){return Qg})),n.d(r,"timeHour",(function(){return Kg})),n.d(r,"timeHours",(function(){return Jg})),n.d(r,"timeDay",(function(){return qg})),n.d(r,"timeDays",(function(){return Gg})),n.d(r,"timeWeek",(function(){return Dg})),n.d(r,"timeWeeks",(function(){return Pg})),n.d(r,"timeSunday",(function(){return Dg})),n.d(r,"timeSundays",(function(){return Pg})),n.d(r,"timeMonday",(function(){return Rg})),n.d(r,"timeMondays",(function(){return Ig})),n.d(r,"timeTuesday",(function(){return Ag})),n.d(r,"timeTuesdays",(function(){return Fg})),n.d(r,"timeWednesday",(function(){return Ng})),n.d(r,"timeWednesdays",(function(){return Bg})),n.d(r,"timeThursday",(function(){return Yg})),n.d(r,"timeThursdays",(function(){return zg})),n.d(r,"timeFriday",(function(){return jg})),n.d(r,"timeFridays",(function(){return Wg})),n.d(r,"timeSaturday",(function(){return Hg})),n.d(r,"timeSaturdays",(function(){return Ug})),n.d(r,"timeMonth",(function(){return Cg})),n.d(r,"timeMonths",(function(){return xg})),n.d(r,"timeYear",(function(){return kg})),n.d(r,"timeYears",(function(){return Sg})),n.d(r,"utcMinute",(function(){return f_})),n.d(r,"utcMinutes",(function(){return p_})),n.d(r,"utcHour",(function(){return c_})),n.d(r,"utcHours",(function(){return d_})),n.d(r,"utcDay",(function(){return My})),n.d(r,"utcDays",(function(){return ky})),n.d(r,"utcWeek",(function(){return sy})),n.d(r,"utcWeeks",(function(){return py})),n.d(r,"utcSunday",(function(){return sy})),n.d(r,"utcSundays",(function(){return py})),n.d(r,"utcMonday",(function(){return ly})),n.d(r,"utcMondays",(function(){return my})),n.d(r,"utcTuesday",(function(){return uy})),n.d(r,"utcTuesdays",(function(){return gy})),n.d(r,"utcWednesday",(function(){return cy})),n.d(r,"utcWednesdays",(function(){return yy})),n.d(r,"utcThursday",(function(){return dy})),n.d(r,"utcThursdays",(function(){return vy})),n.d(r,"utcFriday",(function(){return hy})),n.d(r,"utcFridays",(function(){return _y})),n.d(r,"utcSaturday",(function(){return fy})),n.d(r,"utcSaturdays",(function(){return wy})),n.d(r,"utcMonth",(function(){return s_})),n.d(r,"utcMonths",(function(){return l_})),n.d(r,"utcYear",(function(){return Ty})),n.d(r,"utcYears",(function(){return Cy})),n.d(r,"timeFormatDefaultLocale",(function(){return qv})),n.d(r,"timeFormat",(function(){return Ry})),n.d(r,"timeParse",(function(){return Ay})),n.d(r,"utcFormat",(function(){return Ny})),n.d(r,"utcParse",(function(){return Yy})),n.d(r,"timeFormatLocale",(function(){return Oy})),n.d(r,"isoFormat",(function(){return Gv})),n.d(r,"isoParse",(function(){return Xv})),n.d(r,"now",(function(){return hi})),n.d(r,"timer",(function(){return mi})),n.d(r,"timerFlush",(function(){return gi})),n.d(r,"timeout",(function(){return wi})),n.d(r,"interval",(function(){return bi})),n.d(r,"transition",(function(){return oo})),n.d(r,"active",(function(){return Qo})),n.d(r,"interrupt",(function(){return Yi})),n.d(r,"voronoi",(function(){return tS})),n.d(r,"zoom",(function(){return mS})),n.d(r,"zoomTransform",(function(){return aS})),n.d(r,"zoomIdentity",(function(){return oS}));var i=n(1),o=n.n(i),a="5.12.0",s=function(e,t){return e<t?-1:e>t?1:e>=t?0:NaN},l=function(e){var t;return 1===e.length&&(t=e,e=function(e,n){return s(t(e),n)}),{left:function(t,n,r,i){for(null==r&&(r=0),null==i&&(i=t.length);r<i;){var o=r+i>>>1;e(t[o],n)<0?r=o+1:i=o}return r},right:function(t,n,r,i){for(null==r&&(r=0),null==i&&(i=t.length);r<i;){var o=r+i>>>1;e(t[o],n)>0?i=o:r=o+1}return r}}};var u=l(s),c=u.right,d=u.left,h=c,f=function(e,t){null==t&&(t=p);for(var n=0,r=e.length-1,i=e[0],o=new Array(r<0?0:r);n<r;)o[n]=t(i,i=e[++n]);return o};function p(e,t){return[e,t]}var m=function(e,t,n){var r,i,o,a,s=e.length,l=t.length,u=new Array(s*l);for(null==n&&(n=p),r=o=0;r<s;++r)for(a=e[r],i=0;i<l;++i,++o)u[o]=n(a,t[i]);return u},g=function(e,t){return t<e?-1:t>e?1:t>=e?0:NaN},y=function(e){return null===e?NaN:+e},v=function(e,t){var n,r,i=e.length,o=0,a=-1,s=0,l=0;if(null==t)for(;++a<i;)isNaN(n=y(e[a]))||(l+=(r=n-s)*(n-(s+=r/++o)));else for(;++a<i;)isNaN(n=y(t(e[a],a,e)))||(l+=(r=n-s)*(n-(s+=r/++o)));if(o>1)return l/(o-1)},_=function(e,t){var n=v(e,t);return n?Math.sqrt(n):n},w=function(e,t){var n,r,i,o=e.length,a=-1;if(null==t){for(;++a<o;)if(null!=(n=e[a])&&n>=n)for(r=i=n;++a<o;)null!=(n=e[a])&&(r>n&&(r=n),i<n&&(i=n))}else for(;++a<o;)if(null!=(n=t(e[a],a,e))&&n>=n)for(r=i=n;++a<o;)null!=(n=t(e[a],a,e))&&(r>n&&(r=n),i<n&&(i=n));return[r,i]},b=Array.prototype,M=b.slice,k=b.map,S=function(e){return function(){return e}},T=function(e){return e},C=function(e,t,n){e=+e,t=+t,n=(i=arguments.length)<2?(t=e,e=0,1):i<3?1:+n;for(var r=-1,i=0|Math.max(0,Math.ceil((t-e)/n)),o=new Array(i);++r<i;)o[r]=e+r*n;return o},x=Math.sqrt(50),E=Math.sqrt(10),L=Math.sqrt(2),O=function(e,t,n){var r,i,o,a,s=-1;if(n=+n,(e=+e)===(t=+t)&&n>0)return[e];if((r=t<e)&&(i=e,e=t,t=i),0===(a=D(e,t,n))||!isFinite(a))return[];if(a>0)for(e=Math.ceil(e/a),t=Math.floor(t/a),o=new Array(i=Math.ceil(t-e+1));++s<i;)o[s]=(e+s)*a;else for(e=Math.floor(e*a),t=Math.ceil(t*a),o=new Array(i=Math.ceil(e-t+1));++s<i;)o[s]=(e-s)/a;return r&&o.reverse(),o};function D(e,t,n){var r=(t-e)/Math.max(0,n),i=Math.floor(Math.log(r)/Math.LN10),o=r/Math.pow(10,i);return i>=0?(o>=x?10:o>=E?5:o>=L?2:1)*Math.pow(10,i):-Math.pow(10,-i)/(o>=x?10:o>=E?5:o>=L?2:1)}function R(e,t,n){var r=Math.abs(t-e)/Math.max(0,n),i=Math.pow(10,Math.floor(Math.log(r)/Math.LN10)),o=r/i;return o>=x?i*=10:o>=E?i*=5:o>=L&&(i*=2),t<e?-i:i}var A=function(e){return Math.ceil(Math.log(e.length)/Math.LN2)+1},N=function(){var e=T,t=w,n=A;function r(r){var i,o,a=r.length,s=new Array(a);for(i=0;i<a;++i)s[i]=e(r[i],i,r);var l=t(s),u=l[0],c=l[1],d=n(s,u,c);Array.isArray(d)||(d=R(u,c,d),d=C(Math.ceil(u/d)*d,c,d));for(var f=d.length;d[0]<=u;)d.shift(),--f;for(;d[f-1]>c;)d.pop(),--f;var p,m=new Array(f+1);for(i=0;i<=f;++i)(p=m[i]=[]).x0=i>0?d[i-1]:u,p.x1=i<f?d[i]:c;for(i=0;i<a;++i)u<=(o=s[i])&&o<=c&&m[h(d,o,0,f)].push(r[i]);return m}return r.value=function(t){return arguments.length?(e="function"==typeof t?t:S(t),r):e},r.domain=function(e){return arguments.length?(t="function"==typeof e?e:S([e[0],e[1]]),r):t},r.thresholds=function(e){return arguments.length?(n="function"==typeof e?e:Array.isArray(e)?S(M.call(e)):S(e),r):n},r},Y=function(e,t,n){if(null==n&&(n=y),r=e.length){if((t=+t)<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,i=(r-1)*t,o=Math.floor(i),a=+n(e[o],o,e);return a+(+n(e[o+1],o+1,e)-a)*(i-o)}},j=function(e,t,n){return e=k.call(e,y).sort(s),Math.ceil((n-t)/(2*(Y(e,.75)-Y(e,.25))*Math.pow(e.length,-1/3)))},H=function(e,t,n){return Math.ceil((n-t)/(3.5*_(e)*Math.pow(e.length,-1/3)))},P=function(e,t){var n,r,i=e.length,o=-1;if(null==t){for(;++o<i;)if(null!=(n=e[o])&&n>=n)for(r=n;++o<i;)null!=(n=e[o])&&n>r&&(r=n)}else for(;++o<i;)if(null!=(n=t(e[o],o,e))&&n>=n)for(r=n;++o<i;)null!=(n=t(e[o],o,e))&&n>r&&(r=n);return r},I=function(e,t){var n,r=e.length,i=r,o=-1,a=0;if(null==t)for(;++o<r;)isNaN(n=y(e[o]))?--i:a+=n;else for(;++o<r;)isNaN(n=y(t(e[o],o,e)))?--i:a+=n;if(i)return a/i},F=function(e,t){var n,r=e.length,i=-1,o=[];if(null==t)for(;++i<r;)isNaN(n=y(e[i]))||o.push(n);else for(;++i<r;)isNaN(n=y(t(e[i],i,e)))||o.push(n);return Y(o.sort(s),.5)},B=function(e){for(var t,n,r,i=e.length,o=-1,a=0;++o<i;)a+=e[o].length;for(n=new Array(a);--i>=0;)for(t=(r=e[i]).length;--t>=0;)n[--a]=r[t];return n},z=function(e,t){var n,r,i=e.length,o=-1;if(null==t){for(;++o<i;)if(null!=(n=e[o])&&n>=n)for(r=n;++o<i;)null!=(n=e[o])&&r>n&&(r=n)}else for(;++o<i;)if(null!=(n=t(e[o],o,e))&&n>=n)for(r=n;++o<i;)null!=(n=t(e[o],o,e))&&r>n&&(r=n);return r},W=function(e,t){for(var n=t.length,r=new Array(n);n--;)r[n]=e[t[n]];return r},U=function(e,t){if(n=e.length){var n,r,i=0,o=0,a=e[o];for(null==t&&(t=s);++i<n;)(t(r=e[i],a)<0||0!==t(a,a))&&(a=r,o=i);return 0===t(a,a)?o:void 0}},V=function(e,t,n){for(var r,i,o=(null==n?e.length:n)-(t=null==t?0:+t);o;)i=Math.random()*o--|0,r=e[o+t],e[o+t]=e[i+t],e[i+t]=r;return e},q=function(e,t){var n,r=e.length,i=-1,o=0;if(null==t)for(;++i<r;)(n=+e[i])&&(o+=n);else for(;++i<r;)(n=+t(e[i],i,e))&&(o+=n);return o},G=function(e){if(!(i=e.length))return[];for(var t=-1,n=z(e,X),r=new Array(n);++t<n;)for(var i,o=-1,a=r[t]=new Array(i);++o<i;)a[o]=e[o][t];return r};function X(e){return e.length}var K=function(){return G(arguments)},J=Array.prototype.slice,$=function(e){return e},Z=1,Q=2,ee=3,te=4,ne=1e-6;function re(e){return"translate("+(e+.5)+",0)"}function ie(e){return"translate(0,"+(e+.5)+")"}function oe(e){return function(t){return+e(t)}}function ae(e){var t=Math.max(0,e.bandwidth()-1)/2;return e.round()&&(t=Math.round(t)),function(n){return+e(n)+t}}function se(){return!this.__axis}function le(e,t){var n=[],r=null,i=null,o=6,a=6,s=3,l=e===Z||e===te?-1:1,u=e===te||e===Q?"x":"y",c=e===Z||e===ee?re:ie;function d(d){var h=null==r?t.ticks?t.ticks.apply(t,n):t.domain():r,f=null==i?t.tickFormat?t.tickFormat.apply(t,n):$:i,p=Math.max(o,0)+s,m=t.range(),g=+m[0]+.5,y=+m[m.length-1]+.5,v=(t.bandwidth?ae:oe)(t.copy()),_=d.selection?d.selection():d,w=_.selectAll(".domain").data([null]),b=_.selectAll(".tick").data(h,t).order(),M=b.exit(),k=b.enter().append("g").attr("class","tick"),S=b.select("line"),T=b.select("text");w=w.merge(w.enter().insert("path",".tick").attr("class","domain").attr("stroke","currentColor")),b=b.merge(k),S=S.merge(k.append("line").attr("stroke","currentColor").attr(u+"2",l*o)),T=T.merge(k.append("text").attr("fill","currentColor").attr(u,l*p).attr("dy",e===Z?"0em":e===ee?"0.71em":"0.32em")),d!==_&&(w=w.transition(d),b=b.transition(d),S=S.transition(d),T=T.transition(d),M=M.transition(d).attr("opacity",ne).attr("transform",(function(e){return isFinite(e=v(e))?c(e):this.getAttribute("transform")})),k.attr("opacity",ne).attr("transform",(function(e){var t=this.parentNode.__axis;return c(t&&isFinite(t=t(e))?t:v(e))}))),M.remove(),w.attr("d",e===te||e==Q?a?"M"+l*a+","+g+"H0.5V"+y+"H"+l*a:"M0.5,"+g+"V"+y:a?"M"+g+","+l*a+"V0.5H"+y+"V"+l*a:"M"+g+",0.5H"+y),b.attr("opacity",1).attr("transform",(function(e){return c(v(e))})),S.attr(u+"2",l*o),T.attr(u,l*p).text(f),_.filter(se).attr("fill","none").attr("font-size",10).attr("font-family","sans-serif").attr("text-anchor",e===Q?"start":e===te?"end":"middle"),_.each((function(){this.__axis=v}))}return d.scale=function(e){return arguments.length?(t=e,d):t},d.ticks=function(){return n=J.call(arguments),d},d.tickArguments=function(e){return arguments.length?(n=null==e?[]:J.call(e),d):n.slice()},d.tickValues=function(e){return arguments.length?(r=null==e?null:J.call(e),d):r&&r.slice()},d.tickFormat=function(e){return arguments.length?(i=e,d):i},d.tickSize=function(e){return arguments.length?(o=a=+e,d):o},d.tickSizeInner=function(e){return arguments.length?(o=+e,d):o},d.tickSizeOuter=function(e){return arguments.length?(a=+e,d):a},d.tickPadding=function(e){return arguments.length?(s=+e,d):s},d}function ue(e){return le(Z,e)}function ce(e){return le(Q,e)}function de(e){return le(ee,e)}function he(e){return le(te,e)}var fe={value:function(){}};function pe(){for(var e,t=0,n=arguments.length,r={};t<n;++t){if(!(e=arguments[t]+"")||e in r)throw new Error("illegal type: "+e);r[e]=[]}return new me(r)}function me(e){this._=e}function ge(e,t){return e.trim().split(/^|\s+/).map((function(e){var n="",r=e.indexOf(".");if(r>=0&&(n=e.slice(r+1),e=e.slice(0,r)),e&&!t.hasOwnProperty(e))throw new Error("unknown type: "+e);return{type:e,name:n}}))}function ye(e,t){for(var n,r=0,i=e.length;r<i;++r)if((n=e[r]).name===t)return n.value}function ve(e,t,n){for(var r=0,i=e.length;r<i;++r)if(e[r].name===t){e[r]=fe,e=e.slice(0,r).concat(e.slice(r+1));break}return null!=n&&e.push({name:t,value:n}),e}me.prototype=pe.prototype={constructor:me,on:function(e,t){var n,r=this._,i=ge(e+"",r),o=-1,a=i.length;if(!(arguments.length<2)){if(null!=t&&"function"!=typeof t)throw new Error("invalid callback: "+t);for(;++o<a;)if(n=(e=i[o]).type)r[n]=ve(r[n],e.name,t);else if(null==t)for(n in r)r[n]=ve(r[n],e.name,null);return this}for(;++o<a;)if((n=(e=i[o]).type)&&(n=ye(r[n],e.name)))return n},copy:function(){var e={},t=this._;for(var n in t)e[n]=t[n].slice();return new me(e)},call:function(e,t){if((n=arguments.length-2)>0)for(var n,r,i=new Array(n),o=0;o<n;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(o=0,n=(r=this._[e]).length;o<n;++o)r[o].value.apply(t,i)},apply:function(e,t,n){if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(var r=this._[e],i=0,o=r.length;i<o;++i)r[i].value.apply(t,n)}};var _e=pe,we="http://www.w3.org/1999/xhtml",be={svg:"http://www.w3.org/2000/svg",xhtml:we,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"},Me=function(e){var t=e+="",n=t.indexOf(":");return n>=0&&"xmlns"!==(t=e.slice(0,n))&&(e=e.slice(n+1)),be.hasOwnProperty(t)?{space:be[t],local:e}:e};function ke(e){return function(){var t=this.ownerDocument,n=this.namespaceURI;return n===we&&t.documentElement.namespaceURI===we?t.createElement(e):t.createElementNS(n,e)}}function Se(e){return function(){return this.ownerDocument.createElementNS(e.space,e.local)}}var Te=function(e){var t=Me(e);return(t.local?Se:ke)(t)};function Ce(){}var xe=function(e){return null==e?Ce:function(){return this.querySelector(e)}};function Ee(){return[]}var Le=function(e){return null==e?Ee:function(){return this.querySelectorAll(e)}},Oe=function(e){return function(){return this.matches(e)}},De=function(e){return new Array(e.length)};function Re(e,t){this.ownerDocument=e.ownerDocument,this.namespaceURI=e.namespaceURI,this._next=null,this._parent=e,this.__data__=t}Re.prototype={constructor:Re,appendChild:function(e){return this._parent.insertBefore(e,this._next)},insertBefore:function(e,t){return this._parent.insertBefore(e,t)},querySelector:function(e){return this._parent.querySelector(e)},querySelectorAll:function(e){return this._parent.querySelectorAll(e)}};var Ae="$";function Ne(e,t,n,r,i,o){for(var a,s=0,l=t.length,u=o.length;s<u;++s)(a=t[s])?(a.__data__=o[s],r[s]=a):n[s]=new Re(e,o[s]);for(;s<l;++s)(a=t[s])&&(i[s]=a)}function Ye(e,t,n,r,i,o,a){var s,l,u,c={},d=t.length,h=o.length,f=new Array(d);for(s=0;s<d;++s)(l=t[s])&&(f[s]=u=Ae+a.call(l,l.__data__,s,t),u in c?i[s]=l:c[u]=l);for(s=0;s<h;++s)(l=c[u=Ae+a.call(e,o[s],s,o)])?(r[s]=l,l.__data__=o[s],c[u]=null):n[s]=new Re(e,o[s]);for(s=0;s<d;++s)(l=t[s])&&c[f[s]]===l&&(i[s]=l)}function je(e,t){return e<t?-1:e>t?1:e>=t?0:NaN}function He(e){return function(){this.removeAttribute(e)}}function Pe(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Ie(e,t){return function(){this.setAttribute(e,t)}}function Fe(e,t){return function(){this.setAttributeNS(e.space,e.local,t)}}function Be(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttribute(e):this.setAttribute(e,n)}}function ze(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttributeNS(e.space,e.local):this.setAttributeNS(e.space,e.local,n)}}var We=function(e){return e.ownerDocument&&e.ownerDocument.defaultView||e.document&&e||e.defaultView};function Ue(e){return function(){this.style.removeProperty(e)}}function Ve(e,t,n){return function(){this.style.setProperty(e,t,n)}}function qe(e,t,n){return function(){var r=t.apply(this,arguments);null==r?this.style.removeProperty(e):this.style.setProperty(e,r,n)}}function Ge(e,t){return e.style.getPropertyValue(t)||We(e).getComputedStyle(e,null).getPropertyValue(t)}function Xe(e){return function(){delete this[e]}}function Ke(e,t){return function(){this[e]=t}}function Je(e,t){return function(){var n=t.apply(this,arguments);null==n?delete this[e]:this[e]=n}}function $e(e){return e.trim().split(/^|\s+/)}function Ze(e){return e.classList||new Qe(e)}function Qe(e){this._node=e,this._names=$e(e.getAttribute("class")||"")}function et(e,t){for(var n=Ze(e),r=-1,i=t.length;++r<i;)n.add(t[r])}function tt(e,t){for(var n=Ze(e),r=-1,i=t.length;++r<i;)n.remove(t[r])}function nt(e){return function(){et(this,e)}}function rt(e){return function(){tt(this,e)}}function it(e,t){return function(){(t.apply(this,arguments)?et:tt)(this,e)}}Qe.prototype={add:function(e){this._names.indexOf(e)<0&&(this._names.push(e),this._node.setAttribute("class",this._names.join(" ")))},remove:function(e){var t=this._names.indexOf(e);t>=0&&(this._names.splice(t,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(e){return this._names.indexOf(e)>=0}};function ot(){this.textContent=""}function at(e){return function(){this.textContent=e}}function st(e){return function(){var t=e.apply(this,arguments);this.textContent=null==t?"":t}}function lt(){this.innerHTML=""}function ut(e){return function(){this.innerHTML=e}}function ct(e){return function(){var t=e.apply(this,arguments);this.innerHTML=null==t?"":t}}function dt(){this.nextSibling&&this.parentNode.appendChild(this)}function ht(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function ft(){return null}function pt(){var e=this.parentNode;e&&e.removeChild(this)}function mt(){return this.parentNode.insertBefore(this.cloneNode(!1),this.nextSibling)}function gt(){return this.parentNode.insertBefore(this.cloneNode(!0),this.nextSibling)}var yt={},vt=null;"undefined"!=typeof document&&("onmouseenter"in document.documentElement||(yt={mouseenter:"mouseover",mouseleave:"mouseout"}));function _t(e,t,n){return e=wt(e,t,n),function(t){var n=t.relatedTarget;n&&(n===this||8&n.compareDocumentPosition(this))||e.call(this,t)}}function wt(e,t,n){return function(r){var i=vt;vt=r;try{e.call(this,this.__data__,t,n)}finally{vt=i}}}function bt(e){return e.trim().split(/^|\s+/).map((function(e){var t="",n=e.indexOf(".");return n>=0&&(t=e.slice(n+1),e=e.slice(0,n)),{type:e,name:t}}))}function Mt(e){return function(){var t=this.__on;if(t){for(var n,r=0,i=-1,o=t.length;r<o;++r)n=t[r],e.type&&n.type!==e.type||n.name!==e.name?t[++i]=n:this.removeEventListener(n.type,n.listener,n.capture);++i?t.length=i:delete this.__on}}}function kt(e,t,n){var r=yt.hasOwnProperty(e.type)?_t:wt;return function(i,o,a){var s,l=this.__on,u=r(t,o,a);if(l)for(var c=0,d=l.length;c<d;++c)if((s=l[c]).type===e.type&&s.name===e.name)return this.removeEventListener(s.type,s.listener,s.capture),this.addEventListener(s.type,s.listener=u,s.capture=n),void(s.value=t);this.addEventListener(e.type,u,n),s={type:e.type,name:e.name,value:t,listener:u,capture:n},l?l.push(s):this.__on=[s]}}function St(e,t,n,r){var i=vt;e.sourceEvent=vt,vt=e;try{return t.apply(n,r)}finally{vt=i}}function Tt(e,t,n){var r=We(e),i=r.CustomEvent;"function"==typeof i?i=new i(t,n):(i=r.document.createEvent("Event"),n?(i.initEvent(t,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(t,!1,!1)),e.dispatchEvent(i)}function Ct(e,t){return function(){return Tt(this,e,t)}}function xt(e,t){return function(){return Tt(this,e,t.apply(this,arguments))}}var Et=[null];function Lt(e,t){this._groups=e,this._parents=t}function Ot(){return new Lt([[document.documentElement]],Et)}Lt.prototype=Ot.prototype={constructor:Lt,select:function(e){"function"!=typeof e&&(e=xe(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a,s=t[i],l=s.length,u=r[i]=new Array(l),c=0;c<l;++c)(o=s[c])&&(a=e.call(o,o.__data__,c,s))&&("__data__"in o&&(a.__data__=o.__data__),u[c]=a);return new Lt(r,this._parents)},selectAll:function(e){"function"!=typeof e&&(e=Le(e));for(var t=this._groups,n=t.length,r=[],i=[],o=0;o<n;++o)for(var a,s=t[o],l=s.length,u=0;u<l;++u)(a=s[u])&&(r.push(e.call(a,a.__data__,u,s)),i.push(a));return new Lt(r,i)},filter:function(e){"function"!=typeof e&&(e=Oe(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],s=a.length,l=r[i]=[],u=0;u<s;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&l.push(o);return new Lt(r,this._parents)},data:function(e,t){if(!e)return p=new Array(this.size()),c=-1,this.each((function(e){p[++c]=e})),p;var n,r=t?Ye:Ne,i=this._parents,o=this._groups;"function"!=typeof e&&(n=e,e=function(){return n});for(var a=o.length,s=new Array(a),l=new Array(a),u=new Array(a),c=0;c<a;++c){var d=i[c],h=o[c],f=h.length,p=e.call(d,d&&d.__data__,c,i),m=p.length,g=l[c]=new Array(m),y=s[c]=new Array(m);r(d,h,g,y,u[c]=new Array(f),p,t);for(var v,_,w=0,b=0;w<m;++w)if(v=g[w]){for(w>=b&&(b=w+1);!(_=y[b])&&++b<m;);v._next=_||null}}return(s=new Lt(s,i))._enter=l,s._exit=u,s},enter:function(){return new Lt(this._enter||this._groups.map(De),this._parents)},exit:function(){return new Lt(this._exit||this._groups.map(De),this._parents)},join:function(e,t,n){var r=this.enter(),i=this,o=this.exit();return r="function"==typeof e?e(r):r.append(e+""),null!=t&&(i=t(i)),null==n?o.remove():n(o),r&&i?r.merge(i).order():i},merge:function(e){for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),s=0;s<o;++s)for(var l,u=t[s],c=n[s],d=u.length,h=a[s]=new Array(d),f=0;f<d;++f)(l=u[f]||c[f])&&(h[f]=l);for(;s<r;++s)a[s]=t[s];return new Lt(a,this._parents)},order:function(){for(var e=this._groups,t=-1,n=e.length;++t<n;)for(var r,i=e[t],o=i.length-1,a=i[o];--o>=0;)(r=i[o])&&(a&&4^r.compareDocumentPosition(a)&&a.parentNode.insertBefore(r,a),a=r);return this},sort:function(e){function t(t,n){return t&&n?e(t.__data__,n.__data__):!t-!n}e||(e=je);for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var a,s=n[o],l=s.length,u=i[o]=new Array(l),c=0;c<l;++c)(a=s[c])&&(u[c]=a);u.sort(t)}return new Lt(i,this._parents).order()},call:function(){var e=arguments[0];return arguments[0]=this,e.apply(null,arguments),this},nodes:function(){var e=new Array(this.size()),t=-1;return this.each((function(){e[++t]=this})),e},node:function(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r=e[t],i=0,o=r.length;i<o;++i){var a=r[i];if(a)return a}return null},size:function(){var e=0;return this.each((function(){++e})),e},empty:function(){return!this.node()},each:function(e){for(var t=this._groups,n=0,r=t.length;n<r;++n)for(var i,o=t[n],a=0,s=o.length;a<s;++a)(i=o[a])&&e.call(i,i.__data__,a,o);return this},attr:function(e,t){var n=Me(e);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==t?n.local?Pe:He:"function"==typeof t?n.local?ze:Be:n.local?Fe:Ie)(n,t))},style:function(e,t,n){return arguments.length>1?this.each((null==t?Ue:"function"==typeof t?qe:Ve)(e,t,null==n?"":n)):Ge(this.node(),e)},property:function(e,t){return arguments.length>1?this.each((null==t?Xe:"function"==typeof t?Je:Ke)(e,t)):this.node()[e]},classed:function(e,t){var n=$e(e+"");if(arguments.length<2){for(var r=Ze(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each(("function"==typeof t?it:t?nt:rt)(n,t))},text:function(e){return arguments.length?this.each(null==e?ot:("function"==typeof e?st:at)(e)):this.node().textContent},html:function(e){return arguments.length?this.each(null==e?lt:("function"==typeof e?ct:ut)(e)):this.node().innerHTML},raise:function(){return this.each(dt)},lower:function(){return this.each(ht)},append:function(e){var t="function"==typeof e?e:Te(e);return this.select((function(){return this.appendChild(t.apply(this,arguments))}))},insert:function(e,t){var n="function"==typeof e?e:Te(e),r=null==t?ft:"function"==typeof t?t:xe(t);return this.select((function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)}))},remove:function(){return this.each(pt)},clone:function(e){return this.select(e?gt:mt)},datum:function(e){return arguments.length?this.property("__data__",e):this.node().__data__},on:function(e,t,n){var r,i,o=bt(e+""),a=o.length;if(!(arguments.length<2)){for(s=t?kt:Mt,null==n&&(n=!1),r=0;r<a;++r)this.each(s(o[r],t,n));return this}var s=this.node().__on;if(s)for(var l,u=0,c=s.length;u<c;++u)for(r=0,l=s[u];r<a;++r)if((i=o[r]).type===l.type&&i.name===l.name)return l.value},dispatch:function(e,t){return this.each(("function"==typeof t?xt:Ct)(e,t))}};var Dt=Ot,Rt=function(e){return"string"==typeof e?new Lt([[document.querySelector(e)]],[document.documentElement]):new Lt([[e]],Et)},At=function(e){return Rt(Te(e).call(document.documentElement))},Nt=0;function Yt(){return new jt}function jt(){this._="@"+(++Nt).toString(36)}jt.prototype=Yt.prototype={constructor:jt,get:function(e){for(var t=this._;!(t in e);)if(!(e=e.parentNode))return;return e[t]},set:function(e,t){return e[this._]=t},remove:function(e){return this._ in e&&delete e[this._]},toString:function(){return this._}};var Ht=function(){for(var e,t=vt;e=t.sourceEvent;)t=e;return t},Pt=function(e,t){var n=e.ownerSVGElement||e;if(n.createSVGPoint){var r=n.createSVGPoint();return r.x=t.clientX,r.y=t.clientY,[(r=r.matrixTransform(e.getScreenCTM().inverse())).x,r.y]}var i=e.getBoundingClientRect();return[t.clientX-i.left-e.clientLeft,t.clientY-i.top-e.clientTop]},It=function(e){var t=Ht();return t.changedTouches&&(t=t.changedTouches[0]),Pt(e,t)},Ft=function(e){return"string"==typeof e?new Lt([document.querySelectorAll(e)],[document.documentElement]):new Lt([null==e?[]:e],Et)},Bt=function(e,t,n){arguments.length<3&&(n=t,t=Ht().changedTouches);for(var r,i=0,o=t?t.length:0;i<o;++i)if((r=t[i]).identifier===n)return Pt(e,r);return null},zt=function(e,t){null==t&&(t=Ht().touches);for(var n=0,r=t?t.length:0,i=new Array(r);n<r;++n)i[n]=Pt(e,t[n]);return i};function Wt(){vt.stopImmediatePropagation()}var Ut=function(){vt.preventDefault(),vt.stopImmediatePropagation()},Vt=function(e){var t=e.document.documentElement,n=Rt(e).on("dragstart.drag",Ut,!0);"onselectstart"in t?n.on("selectstart.drag",Ut,!0):(t.__noselect=t.style.MozUserSelect,t.style.MozUserSelect="none")};function qt(e,t){var n=e.document.documentElement,r=Rt(e).on("dragstart.drag",null);t&&(r.on("click.drag",Ut,!0),setTimeout((function(){r.on("click.drag",null)}),0)),"onselectstart"in n?r.on("selectstart.drag",null):(n.style.MozUserSelect=n.__noselect,delete n.__noselect)}var Gt=function(e){return function(){return e}};function Xt(e,t,n,r,i,o,a,s,l,u){this.target=e,this.type=t,this.subject=n,this.identifier=r,this.active=i,this.x=o,this.y=a,this.dx=s,this.dy=l,this._=u}function Kt(){return!vt.ctrlKey&&!vt.button}function Jt(){return this.parentNode}function $t(e){return null==e?{x:vt.x,y:vt.y}:e}function Zt(){return navigator.maxTouchPoints||"ontouchstart"in this}Xt.prototype.on=function(){var e=this._.on.apply(this._,arguments);return e===this._?this:e};var Qt=function(){var e,t,n,r,i=Kt,o=Jt,a=$t,s=Zt,l={},u=_e("start","drag","end"),c=0,d=0;function h(e){e.on("mousedown.drag",f).filter(s).on("touchstart.drag",g).on("touchmove.drag",y).on("touchend.drag touchcancel.drag",v).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function f(){if(!r&&i.apply(this,arguments)){var a=_("mouse",o.apply(this,arguments),It,this,arguments);a&&(Rt(vt.view).on("mousemove.drag",p,!0).on("mouseup.drag",m,!0),Vt(vt.view),Wt(),n=!1,e=vt.clientX,t=vt.clientY,a("start"))}}function p(){if(Ut(),!n){var r=vt.clientX-e,i=vt.clientY-t;n=r*r+i*i>d}l.mouse("drag")}function m(){Rt(vt.view).on("mousemove.drag mouseup.drag",null),qt(vt.view,n),Ut(),l.mouse("end")}function g(){if(i.apply(this,arguments)){var e,t,n=vt.changedTouches,r=o.apply(this,arguments),a=n.length;for(e=0;e<a;++e)(t=_(n[e].identifier,r,Bt,this,arguments))&&(Wt(),t("start"))}}function y(){var e,t,n=vt.changedTouches,r=n.length;for(e=0;e<r;++e)(t=l[n[e].identifier])&&(Ut(),t("drag"))}function v(){var e,t,n=vt.changedTouches,i=n.length;for(r&&clearTimeout(r),r=setTimeout((function(){r=null}),500),e=0;e<i;++e)(t=l[n[e].identifier])&&(Wt(),t("end"))}function _(e,t,n,r,i){var o,s,d,f=n(t,e),p=u.copy();if(St(new Xt(h,"beforestart",o,e,c,f[0],f[1],0,0,p),(function(){return null!=(vt.subject=o=a.apply(r,i))&&(s=o.x-f[0]||0,d=o.y-f[1]||0,!0)})))return function a(u){var m,g=f;switch(u){case"start":l[e]=a,m=c++;break;case"end":delete l[e],--c;case"drag":f=n(t,e),m=c}St(new Xt(h,u,o,e,m,f[0]+s,f[1]+d,f[0]-g[0],f[1]-g[1],p),p.apply,p,[u,r,i])}}return h.filter=function(e){return arguments.length?(i="function"==typeof e?e:Gt(!!e),h):i},h.container=function(e){return arguments.length?(o="function"==typeof e?e:Gt(e),h):o},h.subject=function(e){return arguments.length?(a="function"==typeof e?e:Gt(e),h):a},h.touchable=function(e){return arguments.length?(s="function"==typeof e?e:Gt(!!e),h):s},h.on=function(){var e=u.on.apply(u,arguments);return e===u?h:e},h.clickDistance=function(e){return arguments.length?(d=(e=+e)*e,h):Math.sqrt(d)},h},en=function(e,t,n){e.prototype=t.prototype=n,n.constructor=e};function tn(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function nn(){}var rn="\\s*([+-]?\\d+)\\s*",on="\\s*([+-]?\\d*\\.?\\d+(?:[eE][+-]?\\d+)?)\\s*",an="\\s*([+-]?\\d*\\.?\\d+(?:[eE][+-]?\\d+)?)%\\s*",sn=/^#([0-9a-f]{3,8})$/,ln=new RegExp("^rgb\\("+[rn,rn,rn]+"\\)$"),un=new RegExp("^rgb\\("+[an,an,an]+"\\)$"),cn=new RegExp("^rgba\\("+[rn,rn,rn,on]+"\\)$"),dn=new RegExp("^rgba\\("+[an,an,an,on]+"\\)$"),hn=new RegExp("^hsl\\("+[on,an,an]+"\\)$"),fn=new RegExp("^hsla\\("+[on,an,an,on]+"\\)$"),pn={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function mn(){return this.rgb().formatHex()}function gn(){return this.rgb().formatRgb()}function yn(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=sn.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?vn(t):3===n?new Mn(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?new Mn(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?new Mn(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=ln.exec(e))?new Mn(t[1],t[2],t[3],1):(t=un.exec(e))?new Mn(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=cn.exec(e))?_n(t[1],t[2],t[3],t[4]):(t=dn.exec(e))?_n(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=hn.exec(e))?Cn(t[1],t[2]/100,t[3]/100,1):(t=fn.exec(e))?Cn(t[1],t[2]/100,t[3]/100,t[4]):pn.hasOwnProperty(e)?vn(pn[e]):"transparent"===e?new Mn(NaN,NaN,NaN,0):null}function vn(e){return new Mn(e>>16&255,e>>8&255,255&e,1)}function _n(e,t,n,r){return r<=0&&(e=t=n=NaN),new Mn(e,t,n,r)}function wn(e){return e instanceof nn||(e=yn(e)),e?new Mn((e=e.rgb()).r,e.g,e.b,e.opacity):new Mn}function bn(e,t,n,r){return 1===arguments.length?wn(e):new Mn(e,t,n,null==r?1:r)}function Mn(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function kn(){return"#"+Tn(this.r)+Tn(this.g)+Tn(this.b)}function Sn(){var e=this.opacity;return(1===(e=isNaN(e)?1:Math.max(0,Math.min(1,e)))?"rgb(":"rgba(")+Math.max(0,Math.min(255,Math.round(this.r)||0))+", "+Math.max(0,Math.min(255,Math.round(this.g)||0))+", "+Math.max(0,Math.min(255,Math.round(this.b)||0))+(1===e?")":", "+e+")")}function Tn(e){return((e=Math.max(0,Math.min(255,Math.round(e)||0)))<16?"0":"")+e.toString(16)}function Cn(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Ln(e,t,n,r)}function xn(e){if(e instanceof Ln)return new Ln(e.h,e.s,e.l,e.opacity);if(e instanceof nn||(e=yn(e)),!e)return new Ln;if(e instanceof Ln)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),o=Math.max(t,n,r),a=NaN,s=o-i,l=(o+i)/2;return s?(a=t===o?(n-r)/s+6*(n<r):n===o?(r-t)/s+2:(t-n)/s+4,s/=l<.5?o+i:2-o-i,a*=60):s=l>0&&l<1?0:a,new Ln(a,s,l,e.opacity)}function En(e,t,n,r){return 1===arguments.length?xn(e):new Ln(e,t,n,null==r?1:r)}function Ln(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function On(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function Dn(e,t,n,r,i){var o=e*e,a=o*e;return((1-3*e+3*o-a)*t+(4-6*o+3*a)*n+(1+3*e+3*o-3*a)*r+a*i)/6}en(nn,yn,{copy:function(e){return Object.assign(new this.constructor,this,e)},displayable:function(){return this.rgb().displayable()},hex:mn,formatHex:mn,formatHsl:function(){return xn(this).formatHsl()},formatRgb:gn,toString:gn}),en(Mn,bn,tn(nn,{brighter:function(e){return e=null==e?1/.7:Math.pow(1/.7,e),new Mn(this.r*e,this.g*e,this.b*e,this.opacity)},darker:function(e){return e=null==e?.7:Math.pow(.7,e),new Mn(this.r*e,this.g*e,this.b*e,this.opacity)},rgb:function(){return this},displayable:function(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:kn,formatHex:kn,formatRgb:Sn,toString:Sn})),en(Ln,En,tn(nn,{brighter:function(e){return e=null==e?1/.7:Math.pow(1/.7,e),new Ln(this.h,this.s,this.l*e,this.opacity)},darker:function(e){return e=null==e?.7:Math.pow(.7,e),new Ln(this.h,this.s,this.l*e,this.opacity)},rgb:function(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new Mn(On(e>=240?e-240:e+120,i,r),On(e,i,r),On(e<120?e+240:e-120,i,r),this.opacity)},displayable:function(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl:function(){var e=this.opacity;return(1===(e=isNaN(e)?1:Math.max(0,Math.min(1,e)))?"hsl(":"hsla(")+(this.h||0)+", "+100*(this.s||0)+"%, "+100*(this.l||0)+"%"+(1===e?")":", "+e+")")}}));var Rn=function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),i=e[r],o=e[r+1],a=r>0?e[r-1]:2*i-o,s=r<t-1?e[r+2]:2*o-i;return Dn((n-r/t)*t,a,i,o,s)}},An=function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),i=e[(r+t-1)%t],o=e[r%t],a=e[(r+1)%t],s=e[(r+2)%t];return Dn((n-r/t)*t,i,o,a,s)}},Nn=function(e){return function(){return e}};function Yn(e,t){return function(n){return e+n*t}}function jn(e,t){var n=t-e;return n?Yn(e,n>180||n<-180?n-360*Math.round(n/360):n):Nn(isNaN(e)?t:e)}function Hn(e){return 1==(e=+e)?Pn:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):Nn(isNaN(t)?n:t)}}function Pn(e,t){var n=t-e;return n?Yn(e,n):Nn(isNaN(e)?t:e)}var In=function e(t){var n=Hn(t);function r(e,t){var r=n((e=bn(e)).r,(t=bn(t)).r),i=n(e.g,t.g),o=n(e.b,t.b),a=Pn(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=i(t),e.b=o(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function Fn(e){return function(t){var n,r,i=t.length,o=new Array(i),a=new Array(i),s=new Array(i);for(n=0;n<i;++n)r=bn(t[n]),o[n]=r.r||0,a[n]=r.g||0,s[n]=r.b||0;return o=e(o),a=e(a),s=e(s),r.opacity=1,function(e){return r.r=o(e),r.g=a(e),r.b=s(e),r+""}}}var Bn=Fn(Rn),zn=Fn(An),Wn=function(e,t){var n,r=t?t.length:0,i=e?Math.min(r,e.length):0,o=new Array(i),a=new Array(r);for(n=0;n<i;++n)o[n]=er(e[n],t[n]);for(;n<r;++n)a[n]=t[n];return function(e){for(n=0;n<i;++n)a[n]=o[n](e);return a}},Un=function(e,t){var n=new Date;return t-=e=+e,function(r){return n.setTime(e+t*r),n}},Vn=function(e,t){return t-=e=+e,function(n){return e+t*n}},qn=function(e,t){var n,r={},i={};for(n in null!==e&&"object"==typeof e||(e={}),null!==t&&"object"==typeof t||(t={}),t)n in e?r[n]=er(e[n],t[n]):i[n]=t[n];return function(e){for(n in r)i[n]=r[n](e);return i}},Gn=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Xn=new RegExp(Gn.source,"g");var Kn,Jn,$n,Zn,Qn=function(e,t){var n,r,i,o=Gn.lastIndex=Xn.lastIndex=0,a=-1,s=[],l=[];for(e+="",t+="";(n=Gn.exec(e))&&(r=Xn.exec(t));)(i=r.index)>o&&(i=t.slice(o,i),s[a]?s[a]+=i:s[++a]=i),(n=n[0])===(r=r[0])?s[a]?s[a]+=r:s[++a]=r:(s[++a]=null,l.push({i:a,x:Vn(n,r)})),o=Xn.lastIndex;return o<t.length&&(i=t.slice(o),s[a]?s[a]+=i:s[++a]=i),s.length<2?l[0]?function(e){return function(t){return e(t)+""}}(l[0].x):function(e){return function(){return e}}(t):(t=l.length,function(e){for(var n,r=0;r<t;++r)s[(n=l[r]).i]=n.x(e);return s.join("")})},er=function(e,t){var n,r=typeof t;return null==t||"boolean"===r?Nn(t):("number"===r?Vn:"string"===r?(n=yn(t))?(t=n,In):Qn:t instanceof yn?In:t instanceof Date?Un:Array.isArray(t)?Wn:"function"!=typeof t.valueOf&&"function"!=typeof t.toString||isNaN(t)?qn:Vn)(e,t)},tr=function(e){var t=e.length;return function(n){return e[Math.max(0,Math.min(t-1,Math.floor(n*t)))]}},nr=function(e,t){var n=jn(+e,+t);return function(e){var t=n(e);return t-360*Math.floor(t/360)}},rr=function(e,t){return t-=e=+e,function(n){return Math.round(e+t*n)}},ir=180/Math.PI,or={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1},ar=function(e,t,n,r,i,o){var a,s,l;return(a=Math.sqrt(e*e+t*t))&&(e/=a,t/=a),(l=e*n+t*r)&&(n-=e*l,r-=t*l),(s=Math.sqrt(n*n+r*r))&&(n/=s,r/=s,l/=s),e*r<t*n&&(e=-e,t=-t,l=-l,a=-a),{translateX:i,translateY:o,rotate:Math.atan2(t,e)*ir,skewX:Math.atan(l)*ir,scaleX:a,scaleY:s}};function sr(e,t,n,r){function i(e){return e.length?e.pop()+" ":""}return function(o,a){var s=[],l=[];return o=e(o),a=e(a),function(e,r,i,o,a,s){if(e!==i||r!==o){var l=a.push("translate(",null,t,null,n);s.push({i:l-4,x:Vn(e,i)},{i:l-2,x:Vn(r,o)})}else(i||o)&&a.push("translate("+i+t+o+n)}(o.translateX,o.translateY,a.translateX,a.translateY,s,l),function(e,t,n,o){e!==t?(e-t>180?t+=360:t-e>180&&(e+=360),o.push({i:n.push(i(n)+"rotate(",null,r)-2,x:Vn(e,t)})):t&&n.push(i(n)+"rotate("+t+r)}(o.rotate,a.rotate,s,l),function(e,t,n,o){e!==t?o.push({i:n.push(i(n)+"skewX(",null,r)-2,x:Vn(e,t)}):t&&n.push(i(n)+"skewX("+t+r)}(o.skewX,a.skewX,s,l),function(e,t,n,r,o,a){if(e!==n||t!==r){var s=o.push(i(o)+"scale(",null,",",null,")");a.push({i:s-4,x:Vn(e,n)},{i:s-2,x:Vn(t,r)})}else 1===n&&1===r||o.push(i(o)+"scale("+n+","+r+")")}(o.scaleX,o.scaleY,a.scaleX,a.scaleY,s,l),o=a=null,function(e){for(var t,n=-1,r=l.length;++n<r;)s[(t=l[n]).i]=t.x(e);return s.join("")}}}var lr=sr((function(e){return"none"===e?or:(Kn||(Kn=document.createElement("DIV"),Jn=document.documentElement,$n=document.defaultView),Kn.style.transform=e,e=$n.getComputedStyle(Jn.appendChild(Kn),null).getPropertyValue("transform"),Jn.removeChild(Kn),e=e.slice(7,-1).split(","),ar(+e[0],+e[1],+e[2],+e[3],+e[4],+e[5]))}),"px, ","px)","deg)"),ur=sr((function(e){return null==e?or:(Zn||(Zn=document.createElementNS("http://www.w3.org/2000/svg","g")),Zn.setAttribute("transform",e),(e=Zn.transform.baseVal.consolidate())?(e=e.matrix,ar(e.a,e.b,e.c,e.d,e.e,e.f)):or)}),", ",")",")"),cr=Math.SQRT2;function dr(e){return((e=Math.exp(e))+1/e)/2}var hr=function(e,t){var n,r,i=e[0],o=e[1],a=e[2],s=t[0],l=t[1],u=t[2],c=s-i,d=l-o,h=c*c+d*d;if(h<1e-12)r=Math.log(u/a)/cr,n=function(e){return[i+e*c,o+e*d,a*Math.exp(cr*e*r)]};else{var f=Math.sqrt(h),p=(u*u-a*a+4*h)/(2*a*2*f),m=(u*u-a*a-4*h)/(2*u*2*f),g=Math.log(Math.sqrt(p*p+1)-p),y=Math.log(Math.sqrt(m*m+1)-m);r=(y-g)/cr,n=function(e){var t,n=e*r,s=dr(g),l=a/(2*f)*(s*(t=cr*n+g,((t=Math.exp(2*t))-1)/(t+1))-function(e){return((e=Math.exp(e))-1/e)/2}(g));return[i+l*c,o+l*d,a*s/dr(cr*n+g)]}}return n.duration=1e3*r,n};function fr(e){return function(t,n){var r=e((t=En(t)).h,(n=En(n)).h),i=Pn(t.s,n.s),o=Pn(t.l,n.l),a=Pn(t.opacity,n.opacity);return function(e){return t.h=r(e),t.s=i(e),t.l=o(e),t.opacity=a(e),t+""}}}var pr=fr(jn),mr=fr(Pn),gr=Math.PI/180,yr=180/Math.PI,vr=.96422,_r=1,wr=.82521,br=4/29,Mr=6/29,kr=3*Mr*Mr,Sr=Mr*Mr*Mr;function Tr(e){if(e instanceof Er)return new Er(e.l,e.a,e.b,e.opacity);if(e instanceof jr)return Hr(e);e instanceof Mn||(e=wn(e));var t,n,r=Rr(e.r),i=Rr(e.g),o=Rr(e.b),a=Lr((.2225045*r+.7168786*i+.0606169*o)/_r);return r===i&&i===o?t=n=a:(t=Lr((.4360747*r+.3850649*i+.1430804*o)/vr),n=Lr((.0139322*r+.0971045*i+.7141733*o)/wr)),new Er(116*a-16,500*(t-a),200*(a-n),e.opacity)}function Cr(e,t){return new Er(e,0,0,null==t?1:t)}function xr(e,t,n,r){return 1===arguments.length?Tr(e):new Er(e,t,n,null==r?1:r)}function Er(e,t,n,r){this.l=+e,this.a=+t,this.b=+n,this.opacity=+r}function Lr(e){return e>Sr?Math.pow(e,1/3):e/kr+br}function Or(e){return e>Mr?e*e*e:kr*(e-br)}function Dr(e){return 255*(e<=.0031308?12.92*e:1.055*Math.pow(e,1/2.4)-.055)}function Rr(e){return(e/=255)<=.04045?e/12.92:Math.pow((e+.055)/1.055,2.4)}function Ar(e){if(e instanceof jr)return new jr(e.h,e.c,e.l,e.opacity);if(e instanceof Er||(e=Tr(e)),0===e.a&&0===e.b)return new jr(NaN,0<e.l&&e.l<100?0:NaN,e.l,e.opacity);var t=Math.atan2(e.b,e.a)*yr;return new jr(t<0?t+360:t,Math.sqrt(e.a*e.a+e.b*e.b),e.l,e.opacity)}function Nr(e,t,n,r){return 1===arguments.length?Ar(e):new jr(n,t,e,null==r?1:r)}function Yr(e,t,n,r){return 1===arguments.length?Ar(e):new jr(e,t,n,null==r?1:r)}function jr(e,t,n,r){this.h=+e,this.c=+t,this.l=+n,this.opacity=+r}function Hr(e){if(isNaN(e.h))return new Er(e.l,0,0,e.opacity);var t=e.h*gr;return new Er(e.l,Math.cos(t)*e.c,Math.sin(t)*e.c,e.opacity)}function Pr(e,t){var n=Pn((e=xr(e)).l,(t=xr(t)).l),r=Pn(e.a,t.a),i=Pn(e.b,t.b),o=Pn(e.opacity,t.opacity);return function(t){return e.l=n(t),e.a=r(t),e.b=i(t),e.opacity=o(t),e+""}}function Ir(e){return function(t,n){var r=e((t=Yr(t)).h,(n=Yr(n)).h),i=Pn(t.c,n.c),o=Pn(t.l,n.l),a=Pn(t.opacity,n.opacity);return function(e){return t.h=r(e),t.c=i(e),t.l=o(e),t.opacity=a(e),t+""}}}en(Er,xr,tn(nn,{brighter:function(e){return new Er(this.l+18*(null==e?1:e),this.a,this.b,this.opacity)},darker:function(e){return new Er(this.l-18*(null==e?1:e),this.a,this.b,this.opacity)},rgb:function(){var e=(this.l+16)/116,t=isNaN(this.a)?e:e+this.a/500,n=isNaN(this.b)?e:e-this.b/200;return new Mn(Dr(3.1338561*(t=vr*Or(t))-1.6168667*(e=_r*Or(e))-.4906146*(n=wr*Or(n))),Dr(-.9787684*t+1.9161415*e+.033454*n),Dr(.0719453*t-.2289914*e+1.4052427*n),this.opacity)}})),en(jr,Yr,tn(nn,{brighter:function(e){return new jr(this.h,this.c,this.l+18*(null==e?1:e),this.opacity)},darker:function(e){return new jr(this.h,this.c,this.l-18*(null==e?1:e),this.opacity)},rgb:function(){return Hr(this).rgb()}}));var Fr=Ir(jn),Br=Ir(Pn),zr=-.29227,Wr=-.90649,Ur=1.97294,Vr=Ur*Wr,qr=1.78277*Ur,Gr=1.78277*zr- -.14861*Wr;function Xr(e,t,n,r){return 1===arguments.length?function(e){if(e instanceof Kr)return new Kr(e.h,e.s,e.l,e.opacity);e instanceof Mn||(e=wn(e));var t=e.r/255,n=e.g/255,r=e.b/255,i=(Gr*r+Vr*t-qr*n)/(Gr+Vr-qr),o=r-i,a=(Ur*(n-i)-zr*o)/Wr,s=Math.sqrt(a*a+o*o)/(Ur*i*(1-i)),l=s?Math.atan2(a,o)*yr-120:NaN;return new Kr(l<0?l+360:l,s,i,e.opacity)}(e):new Kr(e,t,n,null==r?1:r)}function Kr(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function Jr(e){return function t(n){function r(t,r){var i=e((t=Xr(t)).h,(r=Xr(r)).h),o=Pn(t.s,r.s),a=Pn(t.l,r.l),s=Pn(t.opacity,r.opacity);return function(e){return t.h=i(e),t.s=o(e),t.l=a(Math.pow(e,n)),t.opacity=s(e),t+""}}return n=+n,r.gamma=t,r}(1)}en(Kr,Xr,tn(nn,{brighter:function(e){return e=null==e?1/.7:Math.pow(1/.7,e),new Kr(this.h,this.s,this.l*e,this.opacity)},darker:function(e){return e=null==e?.7:Math.pow(.7,e),new Kr(this.h,this.s,this.l*e,this.opacity)},rgb:function(){var e=isNaN(this.h)?0:(this.h+120)*gr,t=+this.l,n=isNaN(this.s)?0:this.s*t*(1-t),r=Math.cos(e),i=Math.sin(e);return new Mn(255*(t+n*(-.14861*r+1.78277*i)),255*(t+n*(zr*r+Wr*i)),255*(t+n*(Ur*r)),this.opacity)}}));var $r=Jr(jn),Zr=Jr(Pn);function Qr(e,t){for(var n=0,r=t.length-1,i=t[0],o=new Array(r<0?0:r);n<r;)o[n]=e(i,i=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return o[t](e-t)}}var ei,ti,ni=function(e,t){for(var n=new Array(t),r=0;r<t;++r)n[r]=e(r/(t-1));return n},ri=0,ii=0,oi=0,ai=1e3,si=0,li=0,ui=0,ci="object"==typeof performance&&performance.now?performance:Date,di="object"==typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(e){setTimeout(e,17)};function hi(){return li||(di(fi),li=ci.now()+ui)}function fi(){li=0}function pi(){this._call=this._time=this._next=null}function mi(e,t,n){var r=new pi;return r.restart(e,t,n),r}function gi(){hi(),++ri;for(var e,t=ei;t;)(e=li-t._time)>=0&&t._call.call(null,e),t=t._next;--ri}function yi(){li=(si=ci.now())+ui,ri=ii=0;try{gi()}finally{ri=0,function(){var e,t,n=ei,r=1/0;for(;n;)n._call?(r>n._time&&(r=n._time),e=n,n=n._next):(t=n._next,n._next=null,n=e?e._next=t:ei=t);ti=e,_i(r)}(),li=0}}function vi(){var e=ci.now(),t=e-si;t>ai&&(ui-=t,si=e)}function _i(e){ri||(ii&&(ii=clearTimeout(ii)),e-li>24?(e<1/0&&(ii=setTimeout(yi,e-ci.now()-ui)),oi&&(oi=clearInterval(oi))):(oi||(si=ci.now(),oi=setInterval(vi,ai)),ri=1,di(yi)))}pi.prototype=mi.prototype={constructor:pi,restart:function(e,t,n){if("function"!=typeof e)throw new TypeError("callback is not a function");n=(null==n?hi():+n)+(null==t?0:+t),this._next||ti===this||(ti?ti._next=this:ei=this,ti=this),this._call=e,this._time=n,_i()},stop:function(){this._call&&(this._call=null,this._time=1/0,_i())}};var wi=function(e,t,n){var r=new pi;return t=null==t?0:+t,r.restart((function(n){r.stop(),e(n+t)}),t,n),r},bi=function(e,t,n){var r=new pi,i=t;return null==t?(r.restart(e,t,n),r):(t=+t,n=null==n?hi():+n,r.restart((function o(a){a+=i,r.restart(o,i+=t,n),e(a)}),t,n),r)},Mi=_e("start","end","cancel","interrupt"),ki=[],Si=0,Ti=1,Ci=2,xi=3,Ei=4,Li=5,Oi=6,Di=function(e,t,n,r,i,o){var a=e.__transition;if(a){if(n in a)return}else e.__transition={};!function(e,t,n){var r,i=e.__transition;function o(l){var u,c,d,h;if(n.state!==Ti)return s();for(u in i)if((h=i[u]).name===n.name){if(h.state===xi)return wi(o);h.state===Ei?(h.state=Oi,h.timer.stop(),h.on.call("interrupt",e,e.__data__,h.index,h.group),delete i[u]):+u<t&&(h.state=Oi,h.timer.stop(),h.on.call("cancel",e,e.__data__,h.index,h.group),delete i[u])}if(wi((function(){n.state===xi&&(n.state=Ei,n.timer.restart(a,n.delay,n.time),a(l))})),n.state=Ci,n.on.call("start",e,e.__data__,n.index,n.group),n.state===Ci){for(n.state=xi,r=new Array(d=n.tween.length),u=0,c=-1;u<d;++u)(h=n.tween[u].value.call(e,e.__data__,n.index,n.group))&&(r[++c]=h);r.length=c+1}}function a(t){for(var i=t<n.duration?n.ease.call(null,t/n.duration):(n.timer.restart(s),n.state=Li,1),o=-1,a=r.length;++o<a;)r[o].call(e,i);n.state===Li&&(n.on.call("end",e,e.__data__,n.index,n.group),s())}function s(){for(var r in n.state=Oi,n.timer.stop(),delete i[t],i)return;delete e.__transition}i[t]=n,n.timer=mi((function(e){n.state=Ti,n.timer.restart(o,n.delay,n.time),n.delay<=e&&o(e-n.delay)}),0,n.time)}(e,n,{name:t,index:r,group:i,on:Mi,tween:ki,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:Si})};function Ri(e,t){var n=Ni(e,t);if(n.state>Si)throw new Error("too late; already scheduled");return n}function Ai(e,t){var n=Ni(e,t);if(n.state>xi)throw new Error("too late; already running");return n}function Ni(e,t){var n=e.__transition;if(!n||!(n=n[t]))throw new Error("transition not found");return n}var Yi=function(e,t){var n,r,i,o=e.__transition,a=!0;if(o){for(i in t=null==t?null:t+"",o)(n=o[i]).name===t?(r=n.state>Ci&&n.state<Li,n.state=Oi,n.timer.stop(),n.on.call(r?"interrupt":"cancel",e,e.__data__,n.index,n.group),delete o[i]):a=!1;a&&delete e.__transition}};function ji(e,t){var n,r;return function(){var i=Ai(this,e),o=i.tween;if(o!==n)for(var a=0,s=(r=n=o).length;a<s;++a)if(r[a].name===t){(r=r.slice()).splice(a,1);break}i.tween=r}}function Hi(e,t,n){var r,i;if("function"!=typeof n)throw new Error;return function(){var o=Ai(this,e),a=o.tween;if(a!==r){i=(r=a).slice();for(var s={name:t,value:n},l=0,u=i.length;l<u;++l)if(i[l].name===t){i[l]=s;break}l===u&&i.push(s)}o.tween=i}}function Pi(e,t,n){var r=e._id;return e.each((function(){var e=Ai(this,r);(e.value||(e.value={}))[t]=n.apply(this,arguments)})),function(e){return Ni(e,r).value[t]}}var Ii=function(e,t){var n;return("number"==typeof t?Vn:t instanceof yn?In:(n=yn(t))?(t=n,In):Qn)(e,t)};function Fi(e){return function(){this.removeAttribute(e)}}function Bi(e){return function(){this.removeAttributeNS(e.space,e.local)}}function zi(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttribute(e);return a===o?null:a===r?i:i=t(r=a,n)}}function Wi(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttributeNS(e.space,e.local);return a===o?null:a===r?i:i=t(r=a,n)}}function Ui(e,t,n){var r,i,o;return function(){var a,s,l=n(this);if(null!=l)return(a=this.getAttribute(e))===(s=l+"")?null:a===r&&s===i?o:(i=s,o=t(r=a,l));this.removeAttribute(e)}}function Vi(e,t,n){var r,i,o;return function(){var a,s,l=n(this);if(null!=l)return(a=this.getAttributeNS(e.space,e.local))===(s=l+"")?null:a===r&&s===i?o:(i=s,o=t(r=a,l));this.removeAttributeNS(e.space,e.local)}}function qi(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttributeNS(e.space,e.local,t(n))}}(e,i)),n}return i._value=t,i}function Gi(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttribute(e,t(n))}}(e,i)),n}return i._value=t,i}function Xi(e,t){return function(){Ri(this,e).delay=+t.apply(this,arguments)}}function Ki(e,t){return t=+t,function(){Ri(this,e).delay=t}}function Ji(e,t){return function(){Ai(this,e).duration=+t.apply(this,arguments)}}function $i(e,t){return t=+t,function(){Ai(this,e).duration=t}}function Zi(e,t){if("function"!=typeof t)throw new Error;return function(){Ai(this,e).ease=t}}function Qi(e,t,n){var r,i,o=function(e){return(e+"").trim().split(/^|\s+/).every((function(e){var t=e.indexOf(".");return t>=0&&(e=e.slice(0,t)),!e||"start"===e}))}(t)?Ri:Ai;return function(){var a=o(this,e),s=a.on;s!==r&&(i=(r=s).copy()).on(t,n),a.on=i}}var eo=Dt.prototype.constructor;function to(e){return function(){this.style.removeProperty(e)}}function no(e,t,n){var r,i;function o(){var o=t.apply(this,arguments);return o!==i&&(r=(i=o)&&function(e,t,n){return function(r){this.style.setProperty(e,t(r),n)}}(e,o,n)),r}return o._value=t,o}var ro=0;function io(e,t,n,r){this._groups=e,this._parents=t,this._name=n,this._id=r}function oo(e){return Dt().transition(e)}function ao(){return++ro}var so=Dt.prototype;function lo(e){return+e}function uo(e){return e*e}function co(e){return e*(2-e)}function ho(e){return((e*=2)<=1?e*e:--e*(2-e)+1)/2}function fo(e){return e*e*e}function po(e){return--e*e*e+1}function mo(e){return((e*=2)<=1?e*e*e:(e-=2)*e*e+2)/2}io.prototype=oo.prototype={constructor:io,select:function(e){var t=this._name,n=this._id;"function"!=typeof e&&(e=xe(e));for(var r=this._groups,i=r.length,o=new Array(i),a=0;a<i;++a)for(var s,l,u=r[a],c=u.length,d=o[a]=new Array(c),h=0;h<c;++h)(s=u[h])&&(l=e.call(s,s.__data__,h,u))&&("__data__"in s&&(l.__data__=s.__data__),d[h]=l,Di(d[h],t,n,h,d,Ni(s,n)));return new io(o,this._parents,t,n)},selectAll:function(e){var t=this._name,n=this._id;"function"!=typeof e&&(e=Le(e));for(var r=this._groups,i=r.length,o=[],a=[],s=0;s<i;++s)for(var l,u=r[s],c=u.length,d=0;d<c;++d)if(l=u[d]){for(var h,f=e.call(l,l.__data__,d,u),p=Ni(l,n),m=0,g=f.length;m<g;++m)(h=f[m])&&Di(h,t,n,m,f,p);o.push(f),a.push(l)}return new io(o,a,t,n)},filter:function(e){"function"!=typeof e&&(e=Oe(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],s=a.length,l=r[i]=[],u=0;u<s;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&l.push(o);return new io(r,this._parents,this._name,this._id)},merge:function(e){if(e._id!==this._id)throw new Error;for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),s=0;s<o;++s)for(var l,u=t[s],c=n[s],d=u.length,h=a[s]=new Array(d),f=0;f<d;++f)(l=u[f]||c[f])&&(h[f]=l);for(;s<r;++s)a[s]=t[s];return new io(a,this._parents,this._name,this._id)},selection:function(){return new eo(this._groups,this._parents)},transition:function(){for(var e=this._name,t=this._id,n=ao(),r=this._groups,i=r.length,o=0;o<i;++o)for(var a,s=r[o],l=s.length,u=0;u<l;++u)if(a=s[u]){var c=Ni(a,t);Di(a,e,n,u,s,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new io(r,this._parents,e,n)},call:so.call,nodes:so.nodes,node:so.node,size:so.size,empty:so.empty,each:so.each,on:function(e,t){var n=this._id;return arguments.length<2?Ni(this.node(),n).on.on(e):this.each(Qi(n,e,t))},attr:function(e,t){var n=Me(e),r="transform"===n?ur:Ii;return this.attrTween(e,"function"==typeof t?(n.local?Vi:Ui)(n,r,Pi(this,"attr."+e,t)):null==t?(n.local?Bi:Fi)(n):(n.local?Wi:zi)(n,r,t))},attrTween:function(e,t){var n="attr."+e;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==t)return this.tween(n,null);if("function"!=typeof t)throw new Error;var r=Me(e);return this.tween(n,(r.local?qi:Gi)(r,t))},style:function(e,t,n){var r="transform"==(e+="")?lr:Ii;return null==t?this.styleTween(e,function(e,t){var n,r,i;return function(){var o=Ge(this,e),a=(this.style.removeProperty(e),Ge(this,e));return o===a?null:o===n&&a===r?i:i=t(n=o,r=a)}}(e,r)).on("end.style."+e,to(e)):"function"==typeof t?this.styleTween(e,function(e,t,n){var r,i,o;return function(){var a=Ge(this,e),s=n(this),l=s+"";return null==s&&(this.style.removeProperty(e),l=s=Ge(this,e)),a===l?null:a===r&&l===i?o:(i=l,o=t(r=a,s))}}(e,r,Pi(this,"style."+e,t))).each(function(e,t){var n,r,i,o,a="style."+t,s="end."+a;return function(){var l=Ai(this,e),u=l.on,c=null==l.value[a]?o||(o=to(t)):void 0;u===n&&i===c||(r=(n=u).copy()).on(s,i=c),l.on=r}}(this._id,e)):this.styleTween(e,function(e,t,n){var r,i,o=n+"";return function(){var a=Ge(this,e);return a===o?null:a===r?i:i=t(r=a,n)}}(e,r,t),n).on("end.style."+e,null)},styleTween:function(e,t,n){var r="style."+(e+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==t)return this.tween(r,null);if("function"!=typeof t)throw new Error;return this.tween(r,no(e,t,null==n?"":n))},text:function(e){return this.tween("text","function"==typeof e?function(e){return function(){var t=e(this);this.textContent=null==t?"":t}}(Pi(this,"text",e)):function(e){return function(){this.textContent=e}}(null==e?"":e+""))},remove:function(){return this.on("end.remove",(e=this._id,function(){var t=this.parentNode;for(var n in this.__transition)if(+n!==e)return;t&&t.removeChild(this)}));var e},tween:function(e,t){var n=this._id;if(e+="",arguments.length<2){for(var r,i=Ni(this.node(),n).tween,o=0,a=i.length;o<a;++o)if((r=i[o]).name===e)return r.value;return null}return this.each((null==t?ji:Hi)(n,e,t))},delay:function(e){var t=this._id;return arguments.length?this.each(("function"==typeof e?Xi:Ki)(t,e)):Ni(this.node(),t).delay},duration:function(e){var t=this._id;return arguments.length?this.each(("function"==typeof e?Ji:$i)(t,e)):Ni(this.node(),t).duration},ease:function(e){var t=this._id;return arguments.length?this.each(Zi(t,e)):Ni(this.node(),t).ease},end:function(){var e,t,n=this,r=n._id,i=n.size();return new Promise((function(o,a){var s={value:a},l={value:function(){0==--i&&o()}};n.each((function(){var n=Ai(this,r),i=n.on;i!==e&&((t=(e=i).copy())._.cancel.push(s),t._.interrupt.push(s),t._.end.push(l)),n.on=t}))}))}};var go=function e(t){function n(e){return Math.pow(e,t)}return t=+t,n.exponent=e,n}(3),yo=function e(t){function n(e){return 1-Math.pow(1-e,t)}return t=+t,n.exponent=e,n}(3),vo=function e(t){function n(e){return((e*=2)<=1?Math.pow(e,t):2-Math.pow(2-e,t))/2}return t=+t,n.exponent=e,n}(3),_o=Math.PI,wo=_o/2;function bo(e){return 1-Math.cos(e*wo)}function Mo(e){return Math.sin(e*wo)}function ko(e){return(1-Math.cos(_o*e))/2}function So(e){return Math.pow(2,10*e-10)}function To(e){return 1-Math.pow(2,-10*e)}function Co(e){return((e*=2)<=1?Math.pow(2,10*e-10):2-Math.pow(2,10-10*e))/2}function xo(e){return 1-Math.sqrt(1-e*e)}function Eo(e){return Math.sqrt(1- --e*e)}function Lo(e){return((e*=2)<=1?1-Math.sqrt(1-e*e):Math.sqrt(1-(e-=2)*e)+1)/2}var Oo=4/11,Do=6/11,Ro=8/11,Ao=.75,No=9/11,Yo=10/11,jo=.9375,Ho=21/22,Po=63/64,Io=1/Oo/Oo;function Fo(e){return 1-Bo(1-e)}function Bo(e){return(e=+e)<Oo?Io*e*e:e<Ro?Io*(e-=Do)*e+Ao:e<Yo?Io*(e-=No)*e+jo:Io*(e-=Ho)*e+Po}function zo(e){return((e*=2)<=1?1-Bo(1-e):Bo(e-1)+1)/2}var Wo=function e(t){function n(e){return e*e*((t+1)*e-t)}return t=+t,n.overshoot=e,n}(1.70158),Uo=function e(t){function n(e){return--e*e*((t+1)*e+t)+1}return t=+t,n.overshoot=e,n}(1.70158),Vo=function e(t){function n(e){return((e*=2)<1?e*e*((t+1)*e-t):(e-=2)*e*((t+1)*e+t)+2)/2}return t=+t,n.overshoot=e,n}(1.70158),qo=2*Math.PI,Go=function e(t,n){var r=Math.asin(1/(t=Math.max(1,t)))*(n/=qo);function i(e){return t*Math.pow(2,10*--e)*Math.sin((r-e)/n)}return i.amplitude=function(t){return e(t,n*qo)},i.period=function(n){return e(t,n)},i}(1,.3),Xo=function e(t,n){var r=Math.asin(1/(t=Math.max(1,t)))*(n/=qo);function i(e){return 1-t*Math.pow(2,-10*(e=+e))*Math.sin((e+r)/n)}return i.amplitude=function(t){return e(t,n*qo)},i.period=function(n){return e(t,n)},i}(1,.3),Ko=function e(t,n){var r=Math.asin(1/(t=Math.max(1,t)))*(n/=qo);function i(e){return((e=2*e-1)<0?t*Math.pow(2,10*e)*Math.sin((r-e)/n):2-t*Math.pow(2,-10*e)*Math.sin((r+e)/n))/2}return i.amplitude=function(t){return e(t,n*qo)},i.period=function(n){return e(t,n)},i}(1,.3),Jo={time:null,delay:0,duration:250,ease:mo};function $o(e,t){for(var n;!(n=e.__transition)||!(n=n[t]);)if(!(e=e.parentNode))return Jo.time=hi(),Jo;return n}Dt.prototype.interrupt=function(e){return this.each((function(){Yi(this,e)}))},Dt.prototype.transition=function(e){var t,n;e instanceof io?(t=e._id,e=e._name):(t=ao(),(n=Jo).time=hi(),e=null==e?null:e+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var a,s=r[o],l=s.length,u=0;u<l;++u)(a=s[u])&&Di(a,e,t,u,s,n||$o(a,t));return new io(r,this._parents,e,t)};var Zo=[null],Qo=function(e,t){var n,r,i=e.__transition;if(i)for(r in t=null==t?null:t+"",i)if((n=i[r]).state>Ti&&n.name===t)return new io([[e]],Zo,t,+r);return null},ea=function(e){return function(){return e}},ta=function(e,t,n){this.target=e,this.type=t,this.selection=n};function na(){vt.stopImmediatePropagation()}var ra=function(){vt.preventDefault(),vt.stopImmediatePropagation()},ia={name:"drag"},oa={name:"space"},aa={name:"handle"},sa={name:"center"};function la(e){return[+e[0],+e[1]]}function ua(e){return[la(e[0]),la(e[1])]}var ca={name:"x",handles:["w","e"].map(va),input:function(e,t){return null==e?null:[[+e[0],t[0][1]],[+e[1],t[1][1]]]},output:function(e){return e&&[e[0][0],e[1][0]]}},da={name:"y",handles:["n","s"].map(va),input:function(e,t){return null==e?null:[[t[0][0],+e[0]],[t[1][0],+e[1]]]},output:function(e){return e&&[e[0][1],e[1][1]]}},ha={name:"xy",handles:["n","w","e","s","nw","ne","sw","se"].map(va),input:function(e){return null==e?null:ua(e)},output:function(e){return e}},fa={overlay:"crosshair",selection:"move",n:"ns-resize",e:"ew-resize",s:"ns-resize",w:"ew-resize",nw:"nwse-resize",ne:"nesw-resize",se:"nwse-resize",sw:"nesw-resize"},pa={e:"w",w:"e",nw:"ne",ne:"nw",se:"sw",sw:"se"},ma={n:"s",s:"n",nw:"sw",ne:"se",se:"ne",sw:"nw"},ga={overlay:1,selection:1,n:null,e:1,s:null,w:-1,nw:-1,ne:1,se:1,sw:-1},ya={overlay:1,selection:1,n:-1,e:null,s:1,w:null,nw:-1,ne:-1,se:1,sw:1};function va(e){return{type:e}}function _a(){return!vt.ctrlKey&&!vt.button}function wa(){var e=this.ownerSVGElement||this;return e.hasAttribute("viewBox")?[[(e=e.viewBox.baseVal).x,e.y],[e.x+e.width,e.y+e.height]]:[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]}function ba(){return navigator.maxTouchPoints||"ontouchstart"in this}function Ma(e){for(;!e.__brush;)if(!(e=e.parentNode))return;return e.__brush}function ka(e){var t=e.__brush;return t?t.dim.output(t.selection):null}function Sa(){return xa(ca)}function Ta(){return xa(da)}var Ca=function(){return xa(ha)};function xa(e){var t,n=wa,r=_a,i=ba,o=!0,a=_e(l,"start","brush","end"),s=6;function l(t){var n=t.property("__brush",m).selectAll(".overlay").data([va("overlay")]);n.enter().append("rect").attr("class","overlay").attr("pointer-events","all").attr("cursor",fa.overlay).merge(n).each((function(){var e=Ma(this).extent;Rt(this).attr("x",e[0][0]).attr("y",e[0][1]).attr("width",e[1][0]-e[0][0]).attr("height",e[1][1]-e[0][1])})),t.selectAll(".selection").data([va("selection")]).enter().append("rect").attr("class","selection").attr("cursor",fa.selection).attr("fill","#777").attr("fill-opacity",.3).attr("stroke","#fff").attr("shape-rendering","crispEdges");var r=t.selectAll(".handle").data(e.handles,(function(e){return e.type}));r.exit().remove(),r.enter().append("rect").attr("class",(function(e){return"handle handle--"+e.type})).attr("cursor",(function(e){return fa[e.type]})),t.each(u).attr("fill","none").attr("pointer-events","all").on("mousedown.brush",h).filter(i).on("touchstart.brush",h).on("touchmove.brush",f).on("touchend.brush touchcancel.brush",p).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function u(){var e=Rt(this),t=Ma(this).selection;t?(e.selectAll(".selection").style("display",null).attr("x",t[0][0]).attr("y",t[0][1]).attr("width",t[1][0]-t[0][0]).attr("height",t[1][1]-t[0][1]),e.selectAll(".handle").style("display",null).attr("x",(function(e){return"e"===e.type[e.type.length-1]?t[1][0]-s/2:t[0][0]-s/2})).attr("y",(function(e){return"s"===e.type[0]?t[1][1]-s/2:t[0][1]-s/2})).attr("width",(function(e){return"n"===e.type||"s"===e.type?t[1][0]-t[0][0]+s:s})).attr("height",(function(e){return"e"===e.type||"w"===e.type?t[1][1]-t[0][1]+s:s}))):e.selectAll(".selection,.handle").style("display","none").attr("x",null).attr("y",null).attr("width",null).attr("height",null)}function c(e,t,n){return!n&&e.__brush.emitter||new d(e,t)}function d(e,t){this.that=e,this.args=t,this.state=e.__brush,this.active=0}function h(){if((!t||vt.touches)&&r.apply(this,arguments)){var n,i,a,s,l,d,h,f,p,m,g,y,v=this,_=vt.target.__data__.type,w="selection"===(o&&vt.metaKey?_="overlay":_)?ia:o&&vt.altKey?sa:aa,b=e===da?null:ga[_],M=e===ca?null:ya[_],k=Ma(v),S=k.extent,T=k.selection,C=S[0][0],x=S[0][1],E=S[1][0],L=S[1][1],O=0,D=0,R=b&&M&&o&&vt.shiftKey,A=vt.touches?(y=vt.changedTouches[0].identifier,function(e){return Bt(e,vt.touches,y)}):It,N=A(v),Y=N,j=c(v,arguments,!0).beforestart();"overlay"===_?(T&&(p=!0),k.selection=T=[[n=e===da?C:N[0],a=e===ca?x:N[1]],[l=e===da?E:n,h=e===ca?L:a]]):(n=T[0][0],a=T[0][1],l=T[1][0],h=T[1][1]),i=n,s=a,d=l,f=h;var H=Rt(v).attr("pointer-events","none"),P=H.selectAll(".overlay").attr("cursor",fa[_]);if(vt.touches)j.moved=F,j.ended=z;else{var I=Rt(vt.view).on("mousemove.brush",F,!0).on("mouseup.brush",z,!0);o&&I.on("keydown.brush",(function(){switch(vt.keyCode){case 16:R=b&&M;break;case 18:w===aa&&(b&&(l=d-O*b,n=i+O*b),M&&(h=f-D*M,a=s+D*M),w=sa,B());break;case 32:w!==aa&&w!==sa||(b<0?l=d-O:b>0&&(n=i-O),M<0?h=f-D:M>0&&(a=s-D),w=oa,P.attr("cursor",fa.selection),B());break;default:return}ra()}),!0).on("keyup.brush",(function(){switch(vt.keyCode){case 16:R&&(m=g=R=!1,B());break;case 18:w===sa&&(b<0?l=d:b>0&&(n=i),M<0?h=f:M>0&&(a=s),w=aa,B());break;case 32:w===oa&&(vt.altKey?(b&&(l=d-O*b,n=i+O*b),M&&(h=f-D*M,a=s+D*M),w=sa):(b<0?l=d:b>0&&(n=i),M<0?h=f:M>0&&(a=s),w=aa),P.attr("cursor",fa[_]),B());break;default:return}ra()}),!0),Vt(vt.view)}na(),Yi(v),u.call(v),j.start()}function F(){var e=A(v);!R||m||g||(Math.abs(e[0]-Y[0])>Math.abs(e[1]-Y[1])?g=!0:m=!0),Y=e,p=!0,ra(),B()}function B(){var e;switch(O=Y[0]-N[0],D=Y[1]-N[1],w){case oa:case ia:b&&(O=Math.max(C-n,Math.min(E-l,O)),i=n+O,d=l+O),M&&(D=Math.max(x-a,Math.min(L-h,D)),s=a+D,f=h+D);break;case aa:b<0?(O=Math.max(C-n,Math.min(E-n,O)),i=n+O,d=l):b>0&&(O=Math.max(C-l,Math.min(E-l,O)),i=n,d=l+O),M<0?(D=Math.max(x-a,Math.min(L-a,D)),s=a+D,f=h):M>0&&(D=Math.max(x-h,Math.min(L-h,D)),s=a,f=h+D);break;case sa:b&&(i=Math.max(C,Math.min(E,n-O*b)),d=Math.max(C,Math.min(E,l+O*b))),M&&(s=Math.max(x,Math.min(L,a-D*M)),f=Math.max(x,Math.min(L,h+D*M)))}d<i&&(b*=-1,e=n,n=l,l=e,e=i,i=d,d=e,_ in pa&&P.attr("cursor",fa[_=pa[_]])),f<s&&(M*=-1,e=a,a=h,h=e,e=s,s=f,f=e,_ in ma&&P.attr("cursor",fa[_=ma[_]])),k.selection&&(T=k.selection),m&&(i=T[0][0],d=T[1][0]),g&&(s=T[0][1],f=T[1][1]),T[0][0]===i&&T[0][1]===s&&T[1][0]===d&&T[1][1]===f||(k.selection=[[i,s],[d,f]],u.call(v),j.brush())}function z(){if(na(),vt.touches){if(vt.touches.length)return;t&&clearTimeout(t),t=setTimeout((function(){t=null}),500)}else qt(vt.view,p),I.on("keydown.brush keyup.brush mousemove.brush mouseup.brush",null);H.attr("pointer-events","all"),P.attr("cursor",fa.overlay),k.selection&&(T=k.selection),function(e){return e[0][0]===e[1][0]||e[0][1]===e[1][1]}(T)&&(k.selection=null,u.call(v)),j.end()}}function f(){c(this,arguments).moved()}function p(){c(this,arguments).ended()}function m(){var t=this.__brush||{selection:null};return t.extent=ua(n.apply(this,arguments)),t.dim=e,t}return l.move=function(t,n){t.selection?t.on("start.brush",(function(){c(this,arguments).beforestart().start()})).on("interrupt.brush end.brush",(function(){c(this,arguments).end()})).tween("brush",(function(){var t=this,r=t.__brush,i=c(t,arguments),o=r.selection,a=e.input("function"==typeof n?n.apply(this,arguments):n,r.extent),s=er(o,a);function l(e){r.selection=1===e&&null===a?null:s(e),u.call(t),i.brush()}return null!==o&&null!==a?l:l(1)})):t.each((function(){var t=this,r=arguments,i=t.__brush,o=e.input("function"==typeof n?n.apply(t,r):n,i.extent),a=c(t,r).beforestart();Yi(t),i.selection=null===o?null:o,u.call(t),a.start().brush().end()}))},l.clear=function(e){l.move(e,null)},d.prototype={beforestart:function(){return 1==++this.active&&(this.state.emitter=this,this.starting=!0),this},start:function(){return this.starting?(this.starting=!1,this.emit("start")):this.emit("brush"),this},brush:function(){return this.emit("brush"),this},end:function(){return 0==--this.active&&(delete this.state.emitter,this.emit("end")),this},emit:function(t){St(new ta(l,t,e.output(this.state.selection)),a.apply,a,[t,this.that,this.args])}},l.extent=function(e){return arguments.length?(n="function"==typeof e?e:ea(ua(e)),l):n},l.filter=function(e){return arguments.length?(r="function"==typeof e?e:ea(!!e),l):r},l.handleSize=function(e){return arguments.length?(s=+e,l):s},l.keyModifiers=function(e){return arguments.length?(o=!!e,l):o},l.on=function(){var e=a.on.apply(a,arguments);return e===a?l:e},l}var Ea=Math.cos,La=Math.sin,Oa=Math.PI,Da=Oa/2,Ra=2*Oa,Aa=Math.max;function Na(e){return function(t,n){return e(t.source.value+t.target.value,n.source.value+n.target.value)}}var Ya=function(){var e=0,t=null,n=null,r=null;function i(i){var o,a,s,l,u,c,d=i.length,h=[],f=C(d),p=[],m=[],g=m.groups=new Array(d),y=new Array(d*d);for(o=0,u=-1;++u<d;){for(a=0,c=-1;++c<d;)a+=i[u][c];h.push(a),p.push(C(d)),o+=a}for(t&&f.sort((function(e,n){return t(h[e],h[n])})),n&&p.forEach((function(e,t){e.sort((function(e,r){return n(i[t][e],i[t][r])}))})),l=(o=Aa(0,Ra-e*d)/o)?e:Ra/d,a=0,u=-1;++u<d;){for(s=a,c=-1;++c<d;){var v=f[u],_=p[v][c],w=i[v][_],b=a,M=a+=w*o;y[_*d+v]={index:v,subindex:_,startAngle:b,endAngle:M,value:w}}g[v]={index:v,startAngle:s,endAngle:a,value:h[v]},a+=l}for(u=-1;++u<d;)for(c=u-1;++c<d;){var k=y[c*d+u],S=y[u*d+c];(k.value||S.value)&&m.push(k.value<S.value?{source:S,target:k}:{source:k,target:S})}return r?m.sort(r):m}return i.padAngle=function(t){return arguments.length?(e=Aa(0,t),i):e},i.sortGroups=function(e){return arguments.length?(t=e,i):t},i.sortSubgroups=function(e){return arguments.length?(n=e,i):n},i.sortChords=function(e){return arguments.length?(null==e?r=null:(r=Na(e))._=e,i):r&&r._},i},ja=Array.prototype.slice,Ha=function(e){return function(){return e}},Pa=Math.PI,Ia=2*Pa,Fa=Ia-1e-6;function Ba(){this._x0=this._y0=this._x1=this._y1=null,this._=""}function za(){return new Ba}Ba.prototype=za.prototype={constructor:Ba,moveTo:function(e,t){this._+="M"+(this._x0=this._x1=+e)+","+(this._y0=this._y1=+t)},closePath:function(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._+="Z")},lineTo:function(e,t){this._+="L"+(this._x1=+e)+","+(this._y1=+t)},quadraticCurveTo:function(e,t,n,r){this._+="Q"+ +e+","+ +t+","+(this._x1=+n)+","+(this._y1=+r)},bezierCurveTo:function(e,t,n,r,i,o){this._+="C"+ +e+","+ +t+","+ +n+","+ +r+","+(this._x1=+i)+","+(this._y1=+o)},arcTo:function(e,t,n,r,i){e=+e,t=+t,n=+n,r=+r,i=+i;var o=this._x1,a=this._y1,s=n-e,l=r-t,u=o-e,c=a-t,d=u*u+c*c;if(i<0)throw new Error("negative radius: "+i);if(null===this._x1)this._+="M"+(this._x1=e)+","+(this._y1=t);else if(d>1e-6)if(Math.abs(c*s-l*u)>1e-6&&i){var h=n-o,f=r-a,p=s*s+l*l,m=h*h+f*f,g=Math.sqrt(p),y=Math.sqrt(d),v=i*Math.tan((Pa-Math.acos((p+d-m)/(2*g*y)))/2),_=v/y,w=v/g;Math.abs(_-1)>1e-6&&(this._+="L"+(e+_*u)+","+(t+_*c)),this._+="A"+i+","+i+",0,0,"+ +(c*h>u*f)+","+(this._x1=e+w*s)+","+(this._y1=t+w*l)}else this._+="L"+(this._x1=e)+","+(this._y1=t);else;},arc:function(e,t,n,r,i,o){e=+e,t=+t,o=!!o;var a=(n=+n)*Math.cos(r),s=n*Math.sin(r),l=e+a,u=t+s,c=1^o,d=o?r-i:i-r;if(n<0)throw new Error("negative radius: "+n);null===this._x1?this._+="M"+l+","+u:(Math.abs(this._x1-l)>1e-6||Math.abs(this._y1-u)>1e-6)&&(this._+="L"+l+","+u),n&&(d<0&&(d=d%Ia+Ia),d>Fa?this._+="A"+n+","+n+",0,1,"+c+","+(e-a)+","+(t-s)+"A"+n+","+n+",0,1,"+c+","+(this._x1=l)+","+(this._y1=u):d>1e-6&&(this._+="A"+n+","+n+",0,"+ +(d>=Pa)+","+c+","+(this._x1=e+n*Math.cos(i))+","+(this._y1=t+n*Math.sin(i))))},rect:function(e,t,n,r){this._+="M"+(this._x0=this._x1=+e)+","+(this._y0=this._y1=+t)+"h"+ +n+"v"+ +r+"h"+-n+"Z"},toString:function(){return this._}};var Wa=za;function Ua(e){return e.source}function Va(e){return e.target}function qa(e){return e.radius}function Ga(e){return e.startAngle}function Xa(e){return e.endAngle}var Ka=function(){var e=Ua,t=Va,n=qa,r=Ga,i=Xa,o=null;function a(){var a,s=ja.call(arguments),l=e.apply(this,s),u=t.apply(this,s),c=+n.apply(this,(s[0]=l,s)),d=r.apply(this,s)-Da,h=i.apply(this,s)-Da,f=c*Ea(d),p=c*La(d),m=+n.apply(this,(s[0]=u,s)),g=r.apply(this,s)-Da,y=i.apply(this,s)-Da;if(o||(o=a=Wa()),o.moveTo(f,p),o.arc(0,0,c,d,h),d===g&&h===y||(o.quadraticCurveTo(0,0,m*Ea(g),m*La(g)),o.arc(0,0,m,g,y)),o.quadraticCurveTo(0,0,f,p),o.closePath(),a)return o=null,a+""||null}return a.radius=function(e){return arguments.length?(n="function"==typeof e?e:Ha(+e),a):n},a.startAngle=function(e){return arguments.length?(r="function"==typeof e?e:Ha(+e),a):r},a.endAngle=function(e){return arguments.length?(i="function"==typeof e?e:Ha(+e),a):i},a.source=function(t){return arguments.length?(e=t,a):e},a.target=function(e){return arguments.length?(t=e,a):t},a.context=function(e){return arguments.length?(o=null==e?null:e,a):o},a};function Ja(){}function $a(e,t){var n=new Ja;if(e instanceof Ja)e.each((function(e,t){n.set(t,e)}));else if(Array.isArray(e)){var r,i=-1,o=e.length;if(null==t)for(;++i<o;)n.set(i,e[i]);else for(;++i<o;)n.set(t(r=e[i],i,e),r)}else if(e)for(var a in e)n.set(a,e[a]);return n}Ja.prototype=$a.prototype={constructor:Ja,has:function(e){return"$"+e in this},get:function(e){return this["$"+e]},set:function(e,t){return this["$"+e]=t,this},remove:function(e){var t="$"+e;return t in this&&delete this[t]},clear:function(){for(var e in this)"$"===e[0]&&delete this[e]},keys:function(){var e=[];for(var t in this)"$"===t[0]&&e.push(t.slice(1));return e},values:function(){var e=[];for(var t in this)"$"===t[0]&&e.push(this[t]);return e},entries:function(){var e=[];for(var t in this)"$"===t[0]&&e.push({key:t.slice(1),value:this[t]});return e},size:function(){var e=0;for(var t in this)"$"===t[0]&&++e;return e},empty:function(){for(var e in this)if("$"===e[0])return!1;return!0},each:function(e){for(var t in this)"$"===t[0]&&e(this[t],t.slice(1),this)}};var Za=$a,Qa=function(){var e,t,n,r=[],i=[];function o(n,i,a,s){if(i>=r.length)return null!=e&&n.sort(e),null!=t?t(n):n;for(var l,u,c,d=-1,h=n.length,f=r[i++],p=Za(),m=a();++d<h;)(c=p.get(l=f(u=n[d])+""))?c.push(u):p.set(l,[u]);return p.each((function(e,t){s(m,t,o(e,i,a,s))})),m}return n={object:function(e){return o(e,0,es,ts)},map:function(e){return o(e,0,ns,rs)},entries:function(e){return function e(n,o){if(++o>r.length)return n;var a,s=i[o-1];return null!=t&&o>=r.length?a=n.entries():(a=[],n.each((function(t,n){a.push({key:n,values:e(t,o)})}))),null!=s?a.sort((function(e,t){return s(e.key,t.key)})):a}(o(e,0,ns,rs),0)},key:function(e){return r.push(e),n},sortKeys:function(e){return i[r.length-1]=e,n},sortValues:function(t){return e=t,n},rollup:function(e){return t=e,n}}};function es(){return{}}function ts(e,t,n){e[t]=n}function ns(){return Za()}function rs(e,t,n){e.set(t,n)}function is(){}var os=Za.prototype;function as(e,t){var n=new is;if(e instanceof is)e.each((function(e){n.add(e)}));else if(e){var r=-1,i=e.length;if(null==t)for(;++r<i;)n.add(e[r]);else for(;++r<i;)n.add(t(e[r],r,e))}return n}is.prototype=as.prototype={constructor:is,has:os.has,add:function(e){return this["$"+(e+="")]=e,this},remove:os.remove,clear:os.clear,values:os.keys,size:os.size,empty:os.empty,each:os.each};var ss=as,ls=function(e){var t=[];for(var n in e)t.push(n);return t},us=function(e){var t=[];for(var n in e)t.push(e[n]);return t},cs=function(e){var t=[];for(var n in e)t.push({key:n,value:e[n]});return t},ds=Array.prototype.slice,hs=function(e,t){return e-t},fs=function(e){for(var t=0,n=e.length,r=e[n-1][1]*e[0][0]-e[n-1][0]*e[0][1];++t<n;)r+=e[t-1][1]*e[t][0]-e[t-1][0]*e[t][1];return r},ps=function(e){return function(){return e}},ms=function(e,t){for(var n,r=-1,i=t.length;++r<i;)if(n=gs(e,t[r]))return n;return 0};function gs(e,t){for(var n=t[0],r=t[1],i=-1,o=0,a=e.length,s=a-1;o<a;s=o++){var l=e[o],u=l[0],c=l[1],d=e[s],h=d[0],f=d[1];if(ys(l,d,t))return 0;c>r!=f>r&&n<(h-u)*(r-c)/(f-c)+u&&(i=-i)}return i}function ys(e,t,n){var r,i,o,a;return function(e,t,n){return(t[0]-e[0])*(n[1]-e[1])==(n[0]-e[0])*(t[1]-e[1])}(e,t,n)&&(i=e[r=+(e[0]===t[0])],o=n[r],a=t[r],i<=o&&o<=a||a<=o&&o<=i)}var vs=function(){},_s=[[],[[[1,1.5],[.5,1]]],[[[1.5,1],[1,1.5]]],[[[1.5,1],[.5,1]]],[[[1,.5],[1.5,1]]],[[[1,1.5],[.5,1]],[[1,.5],[1.5,1]]],[[[1,.5],[1,1.5]]],[[[1,.5],[.5,1]]],[[[.5,1],[1,.5]]],[[[1,1.5],[1,.5]]],[[[.5,1],[1,.5]],[[1.5,1],[1,1.5]]],[[[1.5,1],[1,.5]]],[[[.5,1],[1.5,1]]],[[[1,1.5],[1.5,1]]],[[[.5,1],[1,1.5]]],[]],ws=function(){var e=1,t=1,n=A,r=s;function i(e){var t=n(e);if(Array.isArray(t))t=t.slice().sort(hs);else{var r=w(e),i=r[0],a=r[1];t=R(i,a,t),t=C(Math.floor(i/t)*t,Math.floor(a/t)*t,t)}return t.map((function(t){return o(e,t)}))}function o(n,i){var o=[],s=[];return function(n,r,i){var o,s,l,u,c,d,h=new Array,f=new Array;o=s=-1,u=n[0]>=r,_s[u<<1].forEach(p);for(;++o<e-1;)l=u,u=n[o+1]>=r,_s[l|u<<1].forEach(p);_s[u<<0].forEach(p);for(;++s<t-1;){for(o=-1,u=n[s*e+e]>=r,c=n[s*e]>=r,_s[u<<1|c<<2].forEach(p);++o<e-1;)l=u,u=n[s*e+e+o+1]>=r,d=c,c=n[s*e+o+1]>=r,_s[l|u<<1|c<<2|d<<3].forEach(p);_s[u|c<<3].forEach(p)}o=-1,c=n[s*e]>=r,_s[c<<2].forEach(p);for(;++o<e-1;)d=c,c=n[s*e+o+1]>=r,_s[c<<2|d<<3].forEach(p);function p(e){var t,n,r=[e[0][0]+o,e[0][1]+s],l=[e[1][0]+o,e[1][1]+s],u=a(r),c=a(l);(t=f[u])?(n=h[c])?(delete f[t.end],delete h[n.start],t===n?(t.ring.push(l),i(t.ring)):h[t.start]=f[n.end]={start:t.start,end:n.end,ring:t.ring.concat(n.ring)}):(delete f[t.end],t.ring.push(l),f[t.end=c]=t):(t=h[c])?(n=f[u])?(delete h[t.start],delete f[n.end],t===n?(t.ring.push(l),i(t.ring)):h[n.start]=f[t.end]={start:n.start,end:t.end,ring:n.ring.concat(t.ring)}):(delete h[t.start],t.ring.unshift(r),h[t.start=u]=t):h[u]=f[c]={start:u,end:c,ring:[r,l]}}_s[c<<3].forEach(p)}(n,i,(function(e){r(e,n,i),fs(e)>0?o.push([e]):s.push(e)})),s.forEach((function(e){for(var t,n=0,r=o.length;n<r;++n)if(-1!==ms((t=o[n])[0],e))return void t.push(e)})),{type:"MultiPolygon",value:i,coordinates:o}}function a(t){return 2*t[0]+t[1]*(e+1)*4}function s(n,r,i){n.forEach((function(n){var o,a=n[0],s=n[1],l=0|a,u=0|s,c=r[u*e+l];a>0&&a<e&&l===a&&(o=r[u*e+l-1],n[0]=a+(i-o)/(c-o)-.5),s>0&&s<t&&u===s&&(o=r[(u-1)*e+l],n[1]=s+(i-o)/(c-o)-.5)}))}return i.contour=o,i.size=function(n){if(!arguments.length)return[e,t];var r=Math.ceil(n[0]),o=Math.ceil(n[1]);if(!(r>0&&o>0))throw new Error("invalid size");return e=r,t=o,i},i.thresholds=function(e){return arguments.length?(n="function"==typeof e?e:Array.isArray(e)?ps(ds.call(e)):ps(e),i):n},i.smooth=function(e){return arguments.length?(r=e?s:vs,i):r===s},i};function bs(e,t,n){for(var r=e.width,i=e.height,o=1+(n<<1),a=0;a<i;++a)for(var s=0,l=0;s<r+n;++s)s<r&&(l+=e.data[s+a*r]),s>=n&&(s>=o&&(l-=e.data[s-o+a*r]),t.data[s-n+a*r]=l/Math.min(s+1,r-1+o-s,o))}function Ms(e,t,n){for(var r=e.width,i=e.height,o=1+(n<<1),a=0;a<r;++a)for(var s=0,l=0;s<i+n;++s)s<i&&(l+=e.data[a+s*r]),s>=n&&(s>=o&&(l-=e.data[a+(s-o)*r]),t.data[a+(s-n)*r]=l/Math.min(s+1,i-1+o-s,o))}function ks(e){return e[0]}function Ss(e){return e[1]}function Ts(){return 1}var Cs=function(){var e=ks,t=Ss,n=Ts,r=960,i=500,o=20,a=2,s=3*o,l=r+2*s>>a,u=i+2*s>>a,c=ps(20);function d(r){var i=new Float32Array(l*u),d=new Float32Array(l*u);r.forEach((function(r,o,c){var d=+e(r,o,c)+s>>a,h=+t(r,o,c)+s>>a,f=+n(r,o,c);d>=0&&d<l&&h>=0&&h<u&&(i[d+h*l]+=f)})),bs({width:l,height:u,data:i},{width:l,height:u,data:d},o>>a),Ms({width:l,height:u,data:d},{width:l,height:u,data:i},o>>a),bs({width:l,height:u,data:i},{width:l,height:u,data:d},o>>a),Ms({width:l,height:u,data:d},{width:l,height:u,data:i},o>>a),bs({width:l,height:u,data:i},{width:l,height:u,data:d},o>>a),Ms({width:l,height:u,data:d},{width:l,height:u,data:i},o>>a);var f=c(i);if(!Array.isArray(f)){var p=P(i);f=R(0,p,f),(f=C(0,Math.floor(p/f)*f,f)).shift()}return ws().thresholds(f).size([l,u])(i).map(h)}function h(e){return e.value*=Math.pow(2,-2*a),e.coordinates.forEach(f),e}function f(e){e.forEach(p)}function p(e){e.forEach(m)}function m(e){e[0]=e[0]*Math.pow(2,a)-s,e[1]=e[1]*Math.pow(2,a)-s}function g(){return l=r+2*(s=3*o)>>a,u=i+2*s>>a,d}return d.x=function(t){return arguments.length?(e="function"==typeof t?t:ps(+t),d):e},d.y=function(e){return arguments.length?(t="function"==typeof e?e:ps(+e),d):t},d.weight=function(e){return arguments.length?(n="function"==typeof e?e:ps(+e),d):n},d.size=function(e){if(!arguments.length)return[r,i];var t=Math.ceil(e[0]),n=Math.ceil(e[1]);if(!(t>=0||t>=0))throw new Error("invalid size");return r=t,i=n,g()},d.cellSize=function(e){if(!arguments.length)return 1<<a;if(!((e=+e)>=1))throw new Error("invalid cell size");return a=Math.floor(Math.log(e)/Math.LN2),g()},d.thresholds=function(e){return arguments.length?(c="function"==typeof e?e:Array.isArray(e)?ps(ds.call(e)):ps(e),d):c},d.bandwidth=function(e){if(!arguments.length)return Math.sqrt(o*(o+1));if(!((e=+e)>=0))throw new Error("invalid bandwidth");return o=Math.round((Math.sqrt(4*e*e+1)-1)/2),g()},d},xs={},Es={},Ls=34,Os=10,Ds=13;function Rs(e){return new Function("d","return {"+e.map((function(e,t){return JSON.stringify(e)+": d["+t+"]"})).join(",")+"}")}function As(e){var t=Object.create(null),n=[];return e.forEach((function(e){for(var r in e)r in t||n.push(t[r]=r)})),n}function Ns(e,t){var n=e+"",r=n.length;return r<t?new Array(t-r+1).join(0)+n:n}function Ys(e){var t,n=e.getUTCHours(),r=e.getUTCMinutes(),i=e.getUTCSeconds(),o=e.getUTCMilliseconds();return isNaN(e)?"Invalid Date":((t=e.getUTCFullYear())<0?"-"+Ns(-t,6):t>9999?"+"+Ns(t,6):Ns(t,4))+"-"+Ns(e.getUTCMonth()+1,2)+"-"+Ns(e.getUTCDate(),2)+(o?"T"+Ns(n,2)+":"+Ns(r,2)+":"+Ns(i,2)+"."+Ns(o,3)+"Z":i?"T"+Ns(n,2)+":"+Ns(r,2)+":"+Ns(i,2)+"Z":r||n?"T"+Ns(n,2)+":"+Ns(r,2)+"Z":"")}var js=function(e){var t=new RegExp('["'+e+"\n\r]"),n=e.charCodeAt(0);function r(e,t){var r,i=[],o=e.length,a=0,s=0,l=o<=0,u=!1;function c(){if(l)return Es;if(u)return u=!1,xs;var t,r,i=a;if(e.charCodeAt(i)===Ls){for(;a++<o&&e.charCodeAt(a)!==Ls||e.charCodeAt(++a)===Ls;);return(t=a)>=o?l=!0:(r=e.charCodeAt(a++))===Os?u=!0:r===Ds&&(u=!0,e.charCodeAt(a)===Os&&++a),e.slice(i+1,t-1).replace(/""/g,'"')}for(;a<o;){if((r=e.charCodeAt(t=a++))===Os)u=!0;else if(r===Ds)u=!0,e.charCodeAt(a)===Os&&++a;else if(r!==n)continue;return e.slice(i,t)}return l=!0,e.slice(i,o)}for(e.charCodeAt(o-1)===Os&&--o,e.charCodeAt(o-1)===Ds&&--o;(r=c())!==Es;){for(var d=[];r!==xs&&r!==Es;)d.push(r),r=c();t&&null==(d=t(d,s++))||i.push(d)}return i}function i(t,n){return t.map((function(t){return n.map((function(e){return a(t[e])})).join(e)}))}function o(t){return t.map(a).join(e)}function a(e){return null==e?"":e instanceof Date?Ys(e):t.test(e+="")?'"'+e.replace(/"/g,'""')+'"':e}return{parse:function(e,t){var n,i,o=r(e,(function(e,r){if(n)return n(e,r-1);i=e,n=t?function(e,t){var n=Rs(e);return function(r,i){return t(n(r),i,e)}}(e,t):Rs(e)}));return o.columns=i||[],o},parseRows:r,format:function(t,n){return null==n&&(n=As(t)),[n.map(a).join(e)].concat(i(t,n)).join("\n")},formatBody:function(e,t){return null==t&&(t=As(e)),i(e,t).join("\n")},formatRows:function(e){return e.map(o).join("\n")}}},Hs=js(","),Ps=Hs.parse,Is=Hs.parseRows,Fs=Hs.format,Bs=Hs.formatBody,zs=Hs.formatRows,Ws=js("\t"),Us=Ws.parse,Vs=Ws.parseRows,qs=Ws.format,Gs=Ws.formatBody,Xs=Ws.formatRows;function Ks(e){for(var t in e){var n,r=e[t].trim();if(r)if("true"===r)r=!0;else if("false"===r)r=!1;else if("NaN"===r)r=NaN;else if(isNaN(n=+r)){if(!/^([-+]\d{2})?\d{4}(-\d{2}(-\d{2})?)?(T\d{2}:\d{2}(:\d{2}(\.\d{3})?)?(Z|[-+]\d{2}:\d{2})?)?$/.test(r))continue;r=new Date(r)}else r=n;else r=null;e[t]=r}return e}function Js(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.blob()}var $s=function(e,t){return fetch(e,t).then(Js)};function Zs(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.arrayBuffer()}var Qs=function(e,t){return fetch(e,t).then(Zs)};function el(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.text()}var tl=function(e,t){return fetch(e,t).then(el)};function nl(e){return function(t,n,r){return 2===arguments.length&&"function"==typeof n&&(r=n,n=void 0),tl(t,n).then((function(t){return e(t,r)}))}}function rl(e,t,n,r){3===arguments.length&&"function"==typeof n&&(r=n,n=void 0);var i=js(e);return tl(t,n).then((function(e){return i.parse(e,r)}))}var il=nl(Ps),ol=nl(Us),al=function(e,t){return new Promise((function(n,r){var i=new Image;for(var o in t)i[o]=t[o];i.onerror=r,i.onload=function(){n(i)},i.src=e}))};function sl(e){if(!e.ok)throw new Error(e.status+" "+e.statusText);return e.json()}var ll=function(e,t){return fetch(e,t).then(sl)};function ul(e){return function(t,n){return tl(t,n).then((function(t){return(new DOMParser).parseFromString(t,e)}))}}var cl=ul("application/xml"),dl=ul("text/html"),hl=ul("image/svg+xml"),fl=function(e,t){var n;function r(){var r,i,o=n.length,a=0,s=0;for(r=0;r<o;++r)a+=(i=n[r]).x,s+=i.y;for(a=a/o-e,s=s/o-t,r=0;r<o;++r)(i=n[r]).x-=a,i.y-=s}return null==e&&(e=0),null==t&&(t=0),r.initialize=function(e){n=e},r.x=function(t){return arguments.length?(e=+t,r):e},r.y=function(e){return arguments.length?(t=+e,r):t},r},pl=function(e){return function(){return e}},ml=function(){return 1e-6*(Math.random()-.5)};function gl(e,t,n,r){if(isNaN(t)||isNaN(n))return e;var i,o,a,s,l,u,c,d,h,f=e._root,p={data:r},m=e._x0,g=e._y0,y=e._x1,v=e._y1;if(!f)return e._root=p,e;for(;f.length;)if((u=t>=(o=(m+y)/2))?m=o:y=o,(c=n>=(a=(g+v)/2))?g=a:v=a,i=f,!(f=f[d=c<<1|u]))return i[d]=p,e;if(s=+e._x.call(null,f.data),l=+e._y.call(null,f.data),t===s&&n===l)return p.next=f,i?i[d]=p:e._root=p,e;do{i=i?i[d]=new Array(4):e._root=new Array(4),(u=t>=(o=(m+y)/2))?m=o:y=o,(c=n>=(a=(g+v)/2))?g=a:v=a}while((d=c<<1|u)==(h=(l>=a)<<1|s>=o));return i[h]=f,i[d]=p,e}var yl=function(e,t,n,r,i){this.node=e,this.x0=t,this.y0=n,this.x1=r,this.y1=i};function vl(e){return e[0]}function _l(e){return e[1]}function wl(e,t,n){var r=new bl(null==t?vl:t,null==n?_l:n,NaN,NaN,NaN,NaN);return null==e?r:r.addAll(e)}function bl(e,t,n,r,i,o){this._x=e,this._y=t,this._x0=n,this._y0=r,this._x1=i,this._y1=o,this._root=void 0}function Ml(e){for(var t={data:e.data},n=t;e=e.next;)n=n.next={data:e.data};return t}var kl=wl.prototype=bl.prototype;function Sl(e){return e.x+e.vx}function Tl(e){return e.y+e.vy}kl.copy=function(){var e,t,n=new bl(this._x,this._y,this._x0,this._y0,this._x1,this._y1),r=this._root;if(!r)return n;if(!r.length)return n._root=Ml(r),n;for(e=[{source:r,target:n._root=new Array(4)}];r=e.pop();)for(var i=0;i<4;++i)(t=r.source[i])&&(t.length?e.push({source:t,target:r.target[i]=new Array(4)}):r.target[i]=Ml(t));return n},kl.add=function(e){var t=+this._x.call(null,e),n=+this._y.call(null,e);return gl(this.cover(t,n),t,n,e)},kl.addAll=function(e){var t,n,r,i,o=e.length,a=new Array(o),s=new Array(o),l=1/0,u=1/0,c=-1/0,d=-1/0;for(n=0;n<o;++n)isNaN(r=+this._x.call(null,t=e[n]))||isNaN(i=+this._y.call(null,t))||(a[n]=r,s[n]=i,r<l&&(l=r),r>c&&(c=r),i<u&&(u=i),i>d&&(d=i));if(l>c||u>d)return this;for(this.cover(l,u).cover(c,d),n=0;n<o;++n)gl(this,a[n],s[n],e[n]);return this},kl.cover=function(e,t){if(isNaN(e=+e)||isNaN(t=+t))return this;var n=this._x0,r=this._y0,i=this._x1,o=this._y1;if(isNaN(n))i=(n=Math.floor(e))+1,o=(r=Math.floor(t))+1;else{for(var a,s,l=i-n,u=this._root;n>e||e>=i||r>t||t>=o;)switch(s=(t<r)<<1|e<n,(a=new Array(4))[s]=u,u=a,l*=2,s){case 0:i=n+l,o=r+l;break;case 1:n=i-l,o=r+l;break;case 2:i=n+l,r=o-l;break;case 3:n=i-l,r=o-l}this._root&&this._root.length&&(this._root=u)}return this._x0=n,this._y0=r,this._x1=i,this._y1=o,this},kl.data=function(){var e=[];return this.visit((function(t){if(!t.length)do{e.push(t.data)}while(t=t.next)})),e},kl.extent=function(e){return arguments.length?this.cover(+e[0][0],+e[0][1]).cover(+e[1][0],+e[1][1]):isNaN(this._x0)?void 0:[[this._x0,this._y0],[this._x1,this._y1]]},kl.find=function(e,t,n){var r,i,o,a,s,l,u,c=this._x0,d=this._y0,h=this._x1,f=this._y1,p=[],m=this._root;for(m&&p.push(new yl(m,c,d,h,f)),null==n?n=1/0:(c=e-n,d=t-n,h=e+n,f=t+n,n*=n);l=p.pop();)if(!(!(m=l.node)||(i=l.x0)>h||(o=l.y0)>f||(a=l.x1)<c||(s=l.y1)<d))if(m.length){var g=(i+a)/2,y=(o+s)/2;p.push(new yl(m[3],g,y,a,s),new yl(m[2],i,y,g,s),new yl(m[1],g,o,a,y),new yl(m[0],i,o,g,y)),(u=(t>=y)<<1|e>=g)&&(l=p[p.length-1],p[p.length-1]=p[p.length-1-u],p[p.length-1-u]=l)}else{var v=e-+this._x.call(null,m.data),_=t-+this._y.call(null,m.data),w=v*v+_*_;if(w<n){var b=Math.sqrt(n=w);c=e-b,d=t-b,h=e+b,f=t+b,r=m.data}}return r},kl.remove=function(e){if(isNaN(o=+this._x.call(null,e))||isNaN(a=+this._y.call(null,e)))return this;var t,n,r,i,o,a,s,l,u,c,d,h,f=this._root,p=this._x0,m=this._y0,g=this._x1,y=this._y1;if(!f)return this;if(f.length)for(;;){if((u=o>=(s=(p+g)/2))?p=s:g=s,(c=a>=(l=(m+y)/2))?m=l:y=l,t=f,!(f=f[d=c<<1|u]))return this;if(!f.length)break;(t[d+1&3]||t[d+2&3]||t[d+3&3])&&(n=t,h=d)}for(;f.data!==e;)if(r=f,!(f=f.next))return this;return(i=f.next)&&delete f.next,r?(i?r.next=i:delete r.next,this):t?(i?t[d]=i:delete t[d],(f=t[0]||t[1]||t[2]||t[3])&&f===(t[3]||t[2]||t[1]||t[0])&&!f.length&&(n?n[h]=f:this._root=f),this):(this._root=i,this)},kl.removeAll=function(e){for(var t=0,n=e.length;t<n;++t)this.remove(e[t]);return this},kl.root=function(){return this._root},kl.size=function(){var e=0;return this.visit((function(t){if(!t.length)do{++e}while(t=t.next)})),e},kl.visit=function(e){var t,n,r,i,o,a,s=[],l=this._root;for(l&&s.push(new yl(l,this._x0,this._y0,this._x1,this._y1));t=s.pop();)if(!e(l=t.node,r=t.x0,i=t.y0,o=t.x1,a=t.y1)&&l.length){var u=(r+o)/2,c=(i+a)/2;(n=l[3])&&s.push(new yl(n,u,c,o,a)),(n=l[2])&&s.push(new yl(n,r,c,u,a)),(n=l[1])&&s.push(new yl(n,u,i,o,c)),(n=l[0])&&s.push(new yl(n,r,i,u,c))}return this},kl.visitAfter=function(e){var t,n=[],r=[];for(this._root&&n.push(new yl(this._root,this._x0,this._y0,this._x1,this._y1));t=n.pop();){var i=t.node;if(i.length){var o,a=t.x0,s=t.y0,l=t.x1,u=t.y1,c=(a+l)/2,d=(s+u)/2;(o=i[0])&&n.push(new yl(o,a,s,c,d)),(o=i[1])&&n.push(new yl(o,c,s,l,d)),(o=i[2])&&n.push(new yl(o,a,d,c,u)),(o=i[3])&&n.push(new yl(o,c,d,l,u))}r.push(t)}for(;t=r.pop();)e(t.node,t.x0,t.y0,t.x1,t.y1);return this},kl.x=function(e){return arguments.length?(this._x=e,this):this._x},kl.y=function(e){return arguments.length?(this._y=e,this):this._y};var Cl=function(e){var t,n,r=1,i=1;function o(){for(var e,o,s,l,u,c,d,h=t.length,f=0;f<i;++f)for(o=wl(t,Sl,Tl).visitAfter(a),e=0;e<h;++e)s=t[e],c=n[s.index],d=c*c,l=s.x+s.vx,u=s.y+s.vy,o.visit(p);function p(e,t,n,i,o){var a=e.data,h=e.r,f=c+h;if(!a)return t>l+f||i<l-f||n>u+f||o<u-f;if(a.index>s.index){var p=l-a.x-a.vx,m=u-a.y-a.vy,g=p*p+m*m;g<f*f&&(0===p&&(g+=(p=ml())*p),0===m&&(g+=(m=ml())*m),g=(f-(g=Math.sqrt(g)))/g*r,s.vx+=(p*=g)*(f=(h*=h)/(d+h)),s.vy+=(m*=g)*f,a.vx-=p*(f=1-f),a.vy-=m*f)}}}function a(e){if(e.data)return e.r=n[e.data.index];for(var t=e.r=0;t<4;++t)e[t]&&e[t].r>e.r&&(e.r=e[t].r)}function s(){if(t){var r,i,o=t.length;for(n=new Array(o),r=0;r<o;++r)i=t[r],n[i.index]=+e(i,r,t)}}return"function"!=typeof e&&(e=pl(null==e?1:+e)),o.initialize=function(e){t=e,s()},o.iterations=function(e){return arguments.length?(i=+e,o):i},o.strength=function(e){return arguments.length?(r=+e,o):r},o.radius=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),s(),o):e},o};function xl(e){return e.index}function El(e,t){var n=e.get(t);if(!n)throw new Error("missing: "+t);return n}var Ll=function(e){var t,n,r,i,o,a=xl,s=function(e){return 1/Math.min(i[e.source.index],i[e.target.index])},l=pl(30),u=1;function c(r){for(var i=0,a=e.length;i<u;++i)for(var s,l,c,d,h,f,p,m=0;m<a;++m)l=(s=e[m]).source,d=(c=s.target).x+c.vx-l.x-l.vx||ml(),h=c.y+c.vy-l.y-l.vy||ml(),d*=f=((f=Math.sqrt(d*d+h*h))-n[m])/f*r*t[m],h*=f,c.vx-=d*(p=o[m]),c.vy-=h*p,l.vx+=d*(p=1-p),l.vy+=h*p}function d(){if(r){var s,l,u=r.length,c=e.length,d=Za(r,a);for(s=0,i=new Array(u);s<c;++s)(l=e[s]).index=s,"object"!=typeof l.source&&(l.source=El(d,l.source)),"object"!=typeof l.target&&(l.target=El(d,l.target)),i[l.source.index]=(i[l.source.index]||0)+1,i[l.target.index]=(i[l.target.index]||0)+1;for(s=0,o=new Array(c);s<c;++s)l=e[s],o[s]=i[l.source.index]/(i[l.source.index]+i[l.target.index]);t=new Array(c),h(),n=new Array(c),f()}}function h(){if(r)for(var n=0,i=e.length;n<i;++n)t[n]=+s(e[n],n,e)}function f(){if(r)for(var t=0,i=e.length;t<i;++t)n[t]=+l(e[t],t,e)}return null==e&&(e=[]),c.initialize=function(e){r=e,d()},c.links=function(t){return arguments.length?(e=t,d(),c):e},c.id=function(e){return arguments.length?(a=e,c):a},c.iterations=function(e){return arguments.length?(u=+e,c):u},c.strength=function(e){return arguments.length?(s="function"==typeof e?e:pl(+e),h(),c):s},c.distance=function(e){return arguments.length?(l="function"==typeof e?e:pl(+e),f(),c):l},c};function Ol(e){return e.x}function Dl(e){return e.y}var Rl=10,Al=Math.PI*(3-Math.sqrt(5)),Nl=function(e){var t,n=1,r=.001,i=1-Math.pow(r,1/300),o=0,a=.6,s=Za(),l=mi(c),u=_e("tick","end");function c(){d(),u.call("tick",t),n<r&&(l.stop(),u.call("end",t))}function d(r){var l,u,c=e.length;void 0===r&&(r=1);for(var d=0;d<r;++d)for(n+=(o-n)*i,s.each((function(e){e(n)})),l=0;l<c;++l)null==(u=e[l]).fx?u.x+=u.vx*=a:(u.x=u.fx,u.vx=0),null==u.fy?u.y+=u.vy*=a:(u.y=u.fy,u.vy=0);return t}function h(){for(var t,n=0,r=e.length;n<r;++n){if((t=e[n]).index=n,null!=t.fx&&(t.x=t.fx),null!=t.fy&&(t.y=t.fy),isNaN(t.x)||isNaN(t.y)){var i=Rl*Math.sqrt(n),o=n*Al;t.x=i*Math.cos(o),t.y=i*Math.sin(o)}(isNaN(t.vx)||isNaN(t.vy))&&(t.vx=t.vy=0)}}function f(t){return t.initialize&&t.initialize(e),t}return null==e&&(e=[]),h(),t={tick:d,restart:function(){return l.restart(c),t},stop:function(){return l.stop(),t},nodes:function(n){return arguments.length?(e=n,h(),s.each(f),t):e},alpha:function(e){return arguments.length?(n=+e,t):n},alphaMin:function(e){return arguments.length?(r=+e,t):r},alphaDecay:function(e){return arguments.length?(i=+e,t):+i},alphaTarget:function(e){return arguments.length?(o=+e,t):o},velocityDecay:function(e){return arguments.length?(a=1-e,t):1-a},force:function(e,n){return arguments.length>1?(null==n?s.remove(e):s.set(e,f(n)),t):s.get(e)},find:function(t,n,r){var i,o,a,s,l,u=0,c=e.length;for(null==r?r=1/0:r*=r,u=0;u<c;++u)(a=(i=t-(s=e[u]).x)*i+(o=n-s.y)*o)<r&&(l=s,r=a);return l},on:function(e,n){return arguments.length>1?(u.on(e,n),t):u.on(e)}}},Yl=function(){var e,t,n,r,i=pl(-30),o=1,a=1/0,s=.81;function l(r){var i,o=e.length,a=wl(e,Ol,Dl).visitAfter(c);for(n=r,i=0;i<o;++i)t=e[i],a.visit(d)}function u(){if(e){var t,n,o=e.length;for(r=new Array(o),t=0;t<o;++t)n=e[t],r[n.index]=+i(n,t,e)}}function c(e){var t,n,i,o,a,s=0,l=0;if(e.length){for(i=o=a=0;a<4;++a)(t=e[a])&&(n=Math.abs(t.value))&&(s+=t.value,l+=n,i+=n*t.x,o+=n*t.y);e.x=i/l,e.y=o/l}else{(t=e).x=t.data.x,t.y=t.data.y;do{s+=r[t.data.index]}while(t=t.next)}e.value=s}function d(e,i,l,u){if(!e.value)return!0;var c=e.x-t.x,d=e.y-t.y,h=u-i,f=c*c+d*d;if(h*h/s<f)return f<a&&(0===c&&(f+=(c=ml())*c),0===d&&(f+=(d=ml())*d),f<o&&(f=Math.sqrt(o*f)),t.vx+=c*e.value*n/f,t.vy+=d*e.value*n/f),!0;if(!(e.length||f>=a)){(e.data!==t||e.next)&&(0===c&&(f+=(c=ml())*c),0===d&&(f+=(d=ml())*d),f<o&&(f=Math.sqrt(o*f)));do{e.data!==t&&(h=r[e.data.index]*n/f,t.vx+=c*h,t.vy+=d*h)}while(e=e.next)}}return l.initialize=function(t){e=t,u()},l.strength=function(e){return arguments.length?(i="function"==typeof e?e:pl(+e),u(),l):i},l.distanceMin=function(e){return arguments.length?(o=e*e,l):Math.sqrt(o)},l.distanceMax=function(e){return arguments.length?(a=e*e,l):Math.sqrt(a)},l.theta=function(e){return arguments.length?(s=e*e,l):Math.sqrt(s)},l},jl=function(e,t,n){var r,i,o,a=pl(.1);function s(e){for(var a=0,s=r.length;a<s;++a){var l=r[a],u=l.x-t||1e-6,c=l.y-n||1e-6,d=Math.sqrt(u*u+c*c),h=(o[a]-d)*i[a]*e/d;l.vx+=u*h,l.vy+=c*h}}function l(){if(r){var t,n=r.length;for(i=new Array(n),o=new Array(n),t=0;t<n;++t)o[t]=+e(r[t],t,r),i[t]=isNaN(o[t])?0:+a(r[t],t,r)}}return"function"!=typeof e&&(e=pl(+e)),null==t&&(t=0),null==n&&(n=0),s.initialize=function(e){r=e,l()},s.strength=function(e){return arguments.length?(a="function"==typeof e?e:pl(+e),l(),s):a},s.radius=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),l(),s):e},s.x=function(e){return arguments.length?(t=+e,s):t},s.y=function(e){return arguments.length?(n=+e,s):n},s},Hl=function(e){var t,n,r,i=pl(.1);function o(e){for(var i,o=0,a=t.length;o<a;++o)(i=t[o]).vx+=(r[o]-i.x)*n[o]*e}function a(){if(t){var o,a=t.length;for(n=new Array(a),r=new Array(a),o=0;o<a;++o)n[o]=isNaN(r[o]=+e(t[o],o,t))?0:+i(t[o],o,t)}}return"function"!=typeof e&&(e=pl(null==e?0:+e)),o.initialize=function(e){t=e,a()},o.strength=function(e){return arguments.length?(i="function"==typeof e?e:pl(+e),a(),o):i},o.x=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),a(),o):e},o},Pl=function(e){var t,n,r,i=pl(.1);function o(e){for(var i,o=0,a=t.length;o<a;++o)(i=t[o]).vy+=(r[o]-i.y)*n[o]*e}function a(){if(t){var o,a=t.length;for(n=new Array(a),r=new Array(a),o=0;o<a;++o)n[o]=isNaN(r[o]=+e(t[o],o,t))?0:+i(t[o],o,t)}}return"function"!=typeof e&&(e=pl(null==e?0:+e)),o.initialize=function(e){t=e,a()},o.strength=function(e){return arguments.length?(i="function"==typeof e?e:pl(+e),a(),o):i},o.y=function(t){return arguments.length?(e="function"==typeof t?t:pl(+t),a(),o):e},o},Il=function(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]},Fl=function(e){return(e=Il(Math.abs(e)))?e[1]:NaN},Bl=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function zl(e){if(!(t=Bl.exec(e)))throw new Error("invalid format: "+e);var t;return new Wl({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}function Wl(e){this.fill=void 0===e.fill?" ":e.fill+"",this.align=void 0===e.align?">":e.align+"",this.sign=void 0===e.sign?"-":e.sign+"",this.symbol=void 0===e.symbol?"":e.symbol+"",this.zero=!!e.zero,this.width=void 0===e.width?void 0:+e.width,this.comma=!!e.comma,this.precision=void 0===e.precision?void 0:+e.precision,this.trim=!!e.trim,this.type=void 0===e.type?"":e.type+""}zl.prototype=Wl.prototype,Wl.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};var Ul,Vl,ql,Gl,Xl=function(e){e:for(var t,n=e.length,r=1,i=-1;r<n;++r)switch(e[r]){case".":i=t=r;break;case"0":0===i&&(i=r),t=r;break;default:if(i>0){if(!+e[r])break e;i=0}}return i>0?e.slice(0,i)+e.slice(t+1):e},Kl=function(e,t){var n=Il(e,t);if(!n)return e+"";var r=n[0],i=n[1];return i<0?"0."+new Array(-i).join("0")+r:r.length>i+1?r.slice(0,i+1)+"."+r.slice(i+1):r+new Array(i-r.length+2).join("0")},Jl={"%":function(e,t){return(100*e).toFixed(t)},b:function(e){return Math.round(e).toString(2)},c:function(e){return e+""},d:function(e){return Math.round(e).toString(10)},e:function(e,t){return e.toExponential(t)},f:function(e,t){return e.toFixed(t)},g:function(e,t){return e.toPrecision(t)},o:function(e){return Math.round(e).toString(8)},p:function(e,t){return Kl(100*e,t)},r:Kl,s:function(e,t){var n=Il(e,t);if(!n)return e+"";var r=n[0],i=n[1],o=i-(Ul=3*Math.max(-8,Math.min(8,Math.floor(i/3))))+1,a=r.length;return o===a?r:o>a?r+new Array(o-a+1).join("0"):o>0?r.slice(0,o)+"."+r.slice(o):"0."+new Array(1-o).join("0")+Il(e,Math.max(0,t+o-1))[0]},X:function(e){return Math.round(e).toString(16).toUpperCase()},x:function(e){return Math.round(e).toString(16)}},$l=function(e){return e},Zl=Array.prototype.map,Ql=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"],eu=function(e){var t,n,r=void 0===e.grouping||void 0===e.thousands?$l:(t=Zl.call(e.grouping,Number),n=e.thousands+"",function(e,r){for(var i=e.length,o=[],a=0,s=t[0],l=0;i>0&&s>0&&(l+s+1>r&&(s=Math.max(1,r-l)),o.push(e.substring(i-=s,i+s)),!((l+=s+1)>r));)s=t[a=(a+1)%t.length];return o.reverse().join(n)}),i=void 0===e.currency?"":e.currency[0]+"",o=void 0===e.currency?"":e.currency[1]+"",a=void 0===e.decimal?".":e.decimal+"",s=void 0===e.numerals?$l:function(e){return function(t){return t.replace(/[0-9]/g,(function(t){return e[+t]}))}}(Zl.call(e.numerals,String)),l=void 0===e.percent?"%":e.percent+"",u=void 0===e.minus?"-":e.minus+"",c=void 0===e.nan?"NaN":e.nan+"";function d(e){var t=(e=zl(e)).fill,n=e.align,d=e.sign,h=e.symbol,f=e.zero,p=e.width,m=e.comma,g=e.precision,y=e.trim,v=e.type;"n"===v?(m=!0,v="g"):Jl[v]||(void 0===g&&(g=12),y=!0,v="g"),(f||"0"===t&&"="===n)&&(f=!0,t="0",n="=");var _="$"===h?i:"#"===h&&/[boxX]/.test(v)?"0"+v.toLowerCase():"",w="$"===h?o:/[%p]/.test(v)?l:"",b=Jl[v],M=/[defgprs%]/.test(v);function k(e){var i,o,l,h=_,k=w;if("c"===v)k=b(e)+k,e="";else{var S=(e=+e)<0;if(e=isNaN(e)?c:b(Math.abs(e),g),y&&(e=Xl(e)),S&&0==+e&&(S=!1),h=(S?"("===d?d:u:"-"===d||"("===d?"":d)+h,k=("s"===v?Ql[8+Ul/3]:"")+k+(S&&"("===d?")":""),M)for(i=-1,o=e.length;++i<o;)if(48>(l=e.charCodeAt(i))||l>57){k=(46===l?a+e.slice(i+1):e.slice(i))+k,e=e.slice(0,i);break}}m&&!f&&(e=r(e,1/0));var T=h.length+e.length+k.length,C=T<p?new Array(p-T+1).join(t):"";switch(m&&f&&(e=r(C+e,C.length?p-k.length:1/0),C=""),n){case"<":e=h+e+k+C;break;case"=":e=h+C+e+k;break;case"^":e=C.slice(0,T=C.length>>1)+h+e+k+C.slice(T);break;default:e=C+h+e+k}return s(e)}return g=void 0===g?6:/[gprs]/.test(v)?Math.max(1,Math.min(21,g)):Math.max(0,Math.min(20,g)),k.toString=function(){return e+""},k}return{format:d,formatPrefix:function(e,t){var n=d(((e=zl(e)).type="f",e)),r=3*Math.max(-8,Math.min(8,Math.floor(Fl(t)/3))),i=Math.pow(10,-r),o=Ql[8+r/3];return function(e){return n(i*e)+o}}}};function tu(e){return Vl=eu(e),ql=Vl.format,Gl=Vl.formatPrefix,Vl}tu({decimal:".",thousands:",",grouping:[3],currency:["$",""],minus:"-"});var nu=function(e){return Math.max(0,-Fl(Math.abs(e)))},ru=function(e,t){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(Fl(t)/3)))-Fl(Math.abs(e)))},iu=function(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,Fl(t)-Fl(e))+1},ou=function(){return new au};function au(){this.reset()}au.prototype={constructor:au,reset:function(){this.s=this.t=0},add:function(e){lu(su,e,this.t),lu(this,su.s,this.s),this.s?this.t+=su.t:this.s=su.t},valueOf:function(){return this.s}};var su=new au;function lu(e,t,n){var r=e.s=t+n,i=r-t,o=r-i;e.t=t-o+(n-i)}var uu=1e-6,cu=1e-12,du=Math.PI,hu=du/2,fu=du/4,pu=2*du,mu=180/du,gu=du/180,yu=Math.abs,vu=Math.atan,_u=Math.atan2,wu=Math.cos,bu=Math.ceil,Mu=Math.exp,ku=(Math.floor,Math.log),Su=Math.pow,Tu=Math.sin,Cu=Math.sign||function(e){return e>0?1:e<0?-1:0},xu=Math.sqrt,Eu=Math.tan;function Lu(e){return e>1?0:e<-1?du:Math.acos(e)}function Ou(e){return e>1?hu:e<-1?-hu:Math.asin(e)}function Du(e){return(e=Tu(e/2))*e}function Ru(){}function Au(e,t){e&&Yu.hasOwnProperty(e.type)&&Yu[e.type](e,t)}var Nu={Feature:function(e,t){Au(e.geometry,t)},FeatureCollection:function(e,t){for(var n=e.features,r=-1,i=n.length;++r<i;)Au(n[r].geometry,t)}},Yu={Sphere:function(e,t){t.sphere()},Point:function(e,t){e=e.coordinates,t.point(e[0],e[1],e[2])},MultiPoint:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)e=n[r],t.point(e[0],e[1],e[2])},LineString:function(e,t){ju(e.coordinates,t,0)},MultiLineString:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)ju(n[r],t,0)},Polygon:function(e,t){Hu(e.coordinates,t)},MultiPolygon:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)Hu(n[r],t)},GeometryCollection:function(e,t){for(var n=e.geometries,r=-1,i=n.length;++r<i;)Au(n[r],t)}};function ju(e,t,n){var r,i=-1,o=e.length-n;for(t.lineStart();++i<o;)r=e[i],t.point(r[0],r[1],r[2]);t.lineEnd()}function Hu(e,t){var n=-1,r=e.length;for(t.polygonStart();++n<r;)ju(e[n],t,1);t.polygonEnd()}var Pu,Iu,Fu,Bu,zu,Wu=function(e,t){e&&Nu.hasOwnProperty(e.type)?Nu[e.type](e,t):Au(e,t)},Uu=ou(),Vu=ou(),qu={point:Ru,lineStart:Ru,lineEnd:Ru,polygonStart:function(){Uu.reset(),qu.lineStart=Gu,qu.lineEnd=Xu},polygonEnd:function(){var e=+Uu;Vu.add(e<0?pu+e:e),this.lineStart=this.lineEnd=this.point=Ru},sphere:function(){Vu.add(pu)}};function Gu(){qu.point=Ku}function Xu(){Ju(Pu,Iu)}function Ku(e,t){qu.point=Ju,Pu=e,Iu=t,Fu=e*=gu,Bu=wu(t=(t*=gu)/2+fu),zu=Tu(t)}function Ju(e,t){var n=(e*=gu)-Fu,r=n>=0?1:-1,i=r*n,o=wu(t=(t*=gu)/2+fu),a=Tu(t),s=zu*a,l=Bu*o+s*wu(i),u=s*r*Tu(i);Uu.add(_u(u,l)),Fu=e,Bu=o,zu=a}var $u=function(e){return Vu.reset(),Wu(e,qu),2*Vu};function Zu(e){return[_u(e[1],e[0]),Ou(e[2])]}function Qu(e){var t=e[0],n=e[1],r=wu(n);return[r*wu(t),r*Tu(t),Tu(n)]}function ec(e,t){return e[0]*t[0]+e[1]*t[1]+e[2]*t[2]}function tc(e,t){return[e[1]*t[2]-e[2]*t[1],e[2]*t[0]-e[0]*t[2],e[0]*t[1]-e[1]*t[0]]}function nc(e,t){e[0]+=t[0],e[1]+=t[1],e[2]+=t[2]}function rc(e,t){return[e[0]*t,e[1]*t,e[2]*t]}function ic(e){var t=xu(e[0]*e[0]+e[1]*e[1]+e[2]*e[2]);e[0]/=t,e[1]/=t,e[2]/=t}var oc,ac,sc,lc,uc,cc,dc,hc,fc,pc,mc=ou(),gc={point:yc,lineStart:_c,lineEnd:wc,polygonStart:function(){gc.point=bc,gc.lineStart=Mc,gc.lineEnd=kc,mc.reset(),qu.polygonStart()},polygonEnd:function(){qu.polygonEnd(),gc.point=yc,gc.lineStart=_c,gc.lineEnd=wc,Uu<0?(oc=-(sc=180),ac=-(lc=90)):mc>uu?lc=90:mc<-uu&&(ac=-90),pc[0]=oc,pc[1]=sc},sphere:function(){oc=-(sc=180),ac=-(lc=90)}};function yc(e,t){fc.push(pc=[oc=e,sc=e]),t<ac&&(ac=t),t>lc&&(lc=t)}function vc(e,t){var n=Qu([e*gu,t*gu]);if(hc){var r=tc(hc,n),i=tc([r[1],-r[0],0],r);ic(i),i=Zu(i);var o,a=e-uc,s=a>0?1:-1,l=i[0]*mu*s,u=yu(a)>180;u^(s*uc<l&&l<s*e)?(o=i[1]*mu)>lc&&(lc=o):u^(s*uc<(l=(l+360)%360-180)&&l<s*e)?(o=-i[1]*mu)<ac&&(ac=o):(t<ac&&(ac=t),t>lc&&(lc=t)),u?e<uc?Sc(oc,e)>Sc(oc,sc)&&(sc=e):Sc(e,sc)>Sc(oc,sc)&&(oc=e):sc>=oc?(e<oc&&(oc=e),e>sc&&(sc=e)):e>uc?Sc(oc,e)>Sc(oc,sc)&&(sc=e):Sc(e,sc)>Sc(oc,sc)&&(oc=e)}else fc.push(pc=[oc=e,sc=e]);t<ac&&(ac=t),t>lc&&(lc=t),hc=n,uc=e}function _c(){gc.point=vc}function wc(){pc[0]=oc,pc[1]=sc,gc.point=yc,hc=null}function bc(e,t){if(hc){var n=e-uc;mc.add(yu(n)>180?n+(n>0?360:-360):n)}else cc=e,dc=t;qu.point(e,t),vc(e,t)}function Mc(){qu.lineStart()}function kc(){bc(cc,dc),qu.lineEnd(),yu(mc)>uu&&(oc=-(sc=180)),pc[0]=oc,pc[1]=sc,hc=null}function Sc(e,t){return(t-=e)<0?t+360:t}function Tc(e,t){return e[0]-t[0]}function Cc(e,t){return e[0]<=e[1]?e[0]<=t&&t<=e[1]:t<e[0]||e[1]<t}var xc,Ec,Lc,Oc,Dc,Rc,Ac,Nc,Yc,jc,Hc,Pc,Ic,Fc,Bc,zc,Wc=function(e){var t,n,r,i,o,a,s;if(lc=sc=-(oc=ac=1/0),fc=[],Wu(e,gc),n=fc.length){for(fc.sort(Tc),t=1,o=[r=fc[0]];t<n;++t)Cc(r,(i=fc[t])[0])||Cc(r,i[1])?(Sc(r[0],i[1])>Sc(r[0],r[1])&&(r[1]=i[1]),Sc(i[0],r[1])>Sc(r[0],r[1])&&(r[0]=i[0])):o.push(r=i);for(a=-1/0,t=0,r=o[n=o.length-1];t<=n;r=i,++t)i=o[t],(s=Sc(r[1],i[0]))>a&&(a=s,oc=i[0],sc=r[1])}return fc=pc=null,oc===1/0||ac===1/0?[[NaN,NaN],[NaN,NaN]]:[[oc,ac],[sc,lc]]},Uc={sphere:Ru,point:Vc,lineStart:Gc,lineEnd:Jc,polygonStart:function(){Uc.lineStart=$c,Uc.lineEnd=Zc},polygonEnd:function(){Uc.lineStart=Gc,Uc.lineEnd=Jc}};function Vc(e,t){e*=gu;var n=wu(t*=gu);qc(n*wu(e),n*Tu(e),Tu(t))}function qc(e,t,n){Lc+=(e-Lc)/++xc,Oc+=(t-Oc)/xc,Dc+=(n-Dc)/xc}function Gc(){Uc.point=Xc}function Xc(e,t){e*=gu;var n=wu(t*=gu);Fc=n*wu(e),Bc=n*Tu(e),zc=Tu(t),Uc.point=Kc,qc(Fc,Bc,zc)}function Kc(e,t){e*=gu;var n=wu(t*=gu),r=n*wu(e),i=n*Tu(e),o=Tu(t),a=_u(xu((a=Bc*o-zc*i)*a+(a=zc*r-Fc*o)*a+(a=Fc*i-Bc*r)*a),Fc*r+Bc*i+zc*o);Ec+=a,Rc+=a*(Fc+(Fc=r)),Ac+=a*(Bc+(Bc=i)),Nc+=a*(zc+(zc=o)),qc(Fc,Bc,zc)}function Jc(){Uc.point=Vc}function $c(){Uc.point=Qc}function Zc(){ed(Pc,Ic),Uc.point=Vc}function Qc(e,t){Pc=e,Ic=t,e*=gu,t*=gu,Uc.point=ed;var n=wu(t);Fc=n*wu(e),Bc=n*Tu(e),zc=Tu(t),qc(Fc,Bc,zc)}function ed(e,t){e*=gu;var n=wu(t*=gu),r=n*wu(e),i=n*Tu(e),o=Tu(t),a=Bc*o-zc*i,s=zc*r-Fc*o,l=Fc*i-Bc*r,u=xu(a*a+s*s+l*l),c=Ou(u),d=u&&-c/u;Yc+=d*a,jc+=d*s,Hc+=d*l,Ec+=c,Rc+=c*(Fc+(Fc=r)),Ac+=c*(Bc+(Bc=i)),Nc+=c*(zc+(zc=o)),qc(Fc,Bc,zc)}var td=function(e){xc=Ec=Lc=Oc=Dc=Rc=Ac=Nc=Yc=jc=Hc=0,Wu(e,Uc);var t=Yc,n=jc,r=Hc,i=t*t+n*n+r*r;return i<cu&&(t=Rc,n=Ac,r=Nc,Ec<uu&&(t=Lc,n=Oc,r=Dc),(i=t*t+n*n+r*r)<cu)?[NaN,NaN]:[_u(n,t)*mu,Ou(r/xu(i))*mu]},nd=function(e){return function(){return e}},rd=function(e,t){function n(n,r){return n=e(n,r),t(n[0],n[1])}return e.invert&&t.invert&&(n.invert=function(n,r){return(n=t.invert(n,r))&&e.invert(n[0],n[1])}),n};function id(e,t){return[yu(e)>du?e+Math.round(-e/pu)*pu:e,t]}function od(e,t,n){return(e%=pu)?t||n?rd(sd(e),ld(t,n)):sd(e):t||n?ld(t,n):id}function ad(e){return function(t,n){return[(t+=e)>du?t-pu:t<-du?t+pu:t,n]}}function sd(e){var t=ad(e);return t.invert=ad(-e),t}function ld(e,t){var n=wu(e),r=Tu(e),i=wu(t),o=Tu(t);function a(e,t){var a=wu(t),s=wu(e)*a,l=Tu(e)*a,u=Tu(t),c=u*n+s*r;return[_u(l*i-c*o,s*n-u*r),Ou(c*i+l*o)]}return a.invert=function(e,t){var a=wu(t),s=wu(e)*a,l=Tu(e)*a,u=Tu(t),c=u*i-l*o;return[_u(l*i+u*o,s*n+c*r),Ou(c*n-s*r)]},a}id.invert=id;var ud=function(e){function t(t){return(t=e(t[0]*gu,t[1]*gu))[0]*=mu,t[1]*=mu,t}return e=od(e[0]*gu,e[1]*gu,e.length>2?e[2]*gu:0),t.invert=function(t){return(t=e.invert(t[0]*gu,t[1]*gu))[0]*=mu,t[1]*=mu,t},t};function cd(e,t,n,r,i,o){if(n){var a=wu(t),s=Tu(t),l=r*n;null==i?(i=t+r*pu,o=t-l/2):(i=dd(a,i),o=dd(a,o),(r>0?i<o:i>o)&&(i+=r*pu));for(var u,c=i;r>0?c>o:c<o;c-=l)u=Zu([a,-s*wu(c),-s*Tu(c)]),e.point(u[0],u[1])}}function dd(e,t){(t=Qu(t))[0]-=e,ic(t);var n=Lu(-t[1]);return((-t[2]<0?-n:n)+pu-uu)%pu}var hd=function(){var e,t,n=nd([0,0]),r=nd(90),i=nd(6),o={point:function(n,r){e.push(n=t(n,r)),n[0]*=mu,n[1]*=mu}};function a(){var a=n.apply(this,arguments),s=r.apply(this,arguments)*gu,l=i.apply(this,arguments)*gu;return e=[],t=od(-a[0]*gu,-a[1]*gu,0).invert,cd(o,s,l,1),a={type:"Polygon",coordinates:[e]},e=t=null,a}return a.center=function(e){return arguments.length?(n="function"==typeof e?e:nd([+e[0],+e[1]]),a):n},a.radius=function(e){return arguments.length?(r="function"==typeof e?e:nd(+e),a):r},a.precision=function(e){return arguments.length?(i="function"==typeof e?e:nd(+e),a):i},a},fd=function(){var e,t=[];return{point:function(t,n){e.push([t,n])},lineStart:function(){t.push(e=[])},lineEnd:Ru,rejoin:function(){t.length>1&&t.push(t.pop().concat(t.shift()))},result:function(){var n=t;return t=[],e=null,n}}},pd=function(e,t){return yu(e[0]-t[0])<uu&&yu(e[1]-t[1])<uu};function md(e,t,n,r){this.x=e,this.z=t,this.o=n,this.e=r,this.v=!1,this.n=this.p=null}var gd=function(e,t,n,r,i){var o,a,s=[],l=[];if(e.forEach((function(e){if(!((t=e.length-1)<=0)){var t,n,r=e[0],a=e[t];if(pd(r,a)){for(i.lineStart(),o=0;o<t;++o)i.point((r=e[o])[0],r[1]);i.lineEnd()}else s.push(n=new md(r,e,null,!0)),l.push(n.o=new md(r,null,n,!1)),s.push(n=new md(a,e,null,!1)),l.push(n.o=new md(a,null,n,!0))}})),s.length){for(l.sort(t),yd(s),yd(l),o=0,a=l.length;o<a;++o)l[o].e=n=!n;for(var u,c,d=s[0];;){for(var h=d,f=!0;h.v;)if((h=h.n)===d)return;u=h.z,i.lineStart();do{if(h.v=h.o.v=!0,h.e){if(f)for(o=0,a=u.length;o<a;++o)i.point((c=u[o])[0],c[1]);else r(h.x,h.n.x,1,i);h=h.n}else{if(f)for(u=h.p.z,o=u.length-1;o>=0;--o)i.point((c=u[o])[0],c[1]);else r(h.x,h.p.x,-1,i);h=h.p}u=(h=h.o).z,f=!f}while(!h.v);i.lineEnd()}}};function yd(e){if(t=e.length){for(var t,n,r=0,i=e[0];++r<t;)i.n=n=e[r],n.p=i,i=n;i.n=n=e[0],n.p=i}}var vd=ou();function _d(e){return yu(e[0])<=du?e[0]:Cu(e[0])*((yu(e[0])+du)%pu-du)}var wd=function(e,t){var n=_d(t),r=t[1],i=Tu(r),o=[Tu(n),-wu(n),0],a=0,s=0;vd.reset(),1===i?r=hu+uu:-1===i&&(r=-hu-uu);for(var l=0,u=e.length;l<u;++l)if(d=(c=e[l]).length)for(var c,d,h=c[d-1],f=_d(h),p=h[1]/2+fu,m=Tu(p),g=wu(p),y=0;y<d;++y,f=_,m=b,g=M,h=v){var v=c[y],_=_d(v),w=v[1]/2+fu,b=Tu(w),M=wu(w),k=_-f,S=k>=0?1:-1,T=S*k,C=T>du,x=m*b;if(vd.add(_u(x*S*Tu(T),g*M+x*wu(T))),a+=C?k+S*pu:k,C^f>=n^_>=n){var E=tc(Qu(h),Qu(v));ic(E);var L=tc(o,E);ic(L);var O=(C^k>=0?-1:1)*Ou(L[2]);(r>O||r===O&&(E[0]||E[1]))&&(s+=C^k>=0?1:-1)}}return(a<-uu||a<uu&&vd<-uu)^1&s},bd=function(e,t,n,r){return function(i){var o,a,s,l=t(i),u=fd(),c=t(u),d=!1,h={point:f,lineStart:m,lineEnd:g,polygonStart:function(){h.point=y,h.lineStart=v,h.lineEnd=_,a=[],o=[]},polygonEnd:function(){h.point=f,h.lineStart=m,h.lineEnd=g,a=B(a);var e=wd(o,r);a.length?(d||(i.polygonStart(),d=!0),gd(a,kd,e,n,i)):e&&(d||(i.polygonStart(),d=!0),i.lineStart(),n(null,null,1,i),i.lineEnd()),d&&(i.polygonEnd(),d=!1),a=o=null},sphere:function(){i.polygonStart(),i.lineStart(),n(null,null,1,i),i.lineEnd(),i.polygonEnd()}};function f(t,n){e(t,n)&&i.point(t,n)}function p(e,t){l.point(e,t)}function m(){h.point=p,l.lineStart()}function g(){h.point=f,l.lineEnd()}function y(e,t){s.push([e,t]),c.point(e,t)}function v(){c.lineStart(),s=[]}function _(){y(s[0][0],s[0][1]),c.lineEnd();var e,t,n,r,l=c.clean(),h=u.result(),f=h.length;if(s.pop(),o.push(s),s=null,f)if(1&l){if((t=(n=h[0]).length-1)>0){for(d||(i.polygonStart(),d=!0),i.lineStart(),e=0;e<t;++e)i.point((r=n[e])[0],r[1]);i.lineEnd()}}else f>1&&2&l&&h.push(h.pop().concat(h.shift())),a.push(h.filter(Md))}return h}};function Md(e){return e.length>1}function kd(e,t){return((e=e.x)[0]<0?e[1]-hu-uu:hu-e[1])-((t=t.x)[0]<0?t[1]-hu-uu:hu-t[1])}var Sd=bd((function(){return!0}),(function(e){var t,n=NaN,r=NaN,i=NaN;return{lineStart:function(){e.lineStart(),t=1},point:function(o,a){var s=o>0?du:-du,l=yu(o-n);yu(l-du)<uu?(e.point(n,r=(r+a)/2>0?hu:-hu),e.point(i,r),e.lineEnd(),e.lineStart(),e.point(s,r),e.point(o,r),t=0):i!==s&&l>=du&&(yu(n-i)<uu&&(n-=i*uu),yu(o-s)<uu&&(o-=s*uu),r=function(e,t,n,r){var i,o,a=Tu(e-n);return yu(a)>uu?vu((Tu(t)*(o=wu(r))*Tu(n)-Tu(r)*(i=wu(t))*Tu(e))/(i*o*a)):(t+r)/2}(n,r,o,a),e.point(i,r),e.lineEnd(),e.lineStart(),e.point(s,r),t=0),e.point(n=o,r=a),i=s},lineEnd:function(){e.lineEnd(),n=r=NaN},clean:function(){return 2-t}}}),(function(e,t,n,r){var i;if(null==e)i=n*hu,r.point(-du,i),r.point(0,i),r.point(du,i),r.point(du,0),r.point(du,-i),r.point(0,-i),r.point(-du,-i),r.point(-du,0),r.point(-du,i);else if(yu(e[0]-t[0])>uu){var o=e[0]<t[0]?du:-du;i=n*o/2,r.point(-o,i),r.point(0,i),r.point(o,i)}else r.point(t[0],t[1])}),[-du,-hu]);var Td=function(e){var t=wu(e),n=6*gu,r=t>0,i=yu(t)>uu;function o(e,n){return wu(e)*wu(n)>t}function a(e,n,r){var i=[1,0,0],o=tc(Qu(e),Qu(n)),a=ec(o,o),s=o[0],l=a-s*s;if(!l)return!r&&e;var u=t*a/l,c=-t*s/l,d=tc(i,o),h=rc(i,u);nc(h,rc(o,c));var f=d,p=ec(h,f),m=ec(f,f),g=p*p-m*(ec(h,h)-1);if(!(g<0)){var y=xu(g),v=rc(f,(-p-y)/m);if(nc(v,h),v=Zu(v),!r)return v;var _,w=e[0],b=n[0],M=e[1],k=n[1];b<w&&(_=w,w=b,b=_);var S=b-w,T=yu(S-du)<uu;if(!T&&k<M&&(_=M,M=k,k=_),T||S<uu?T?M+k>0^v[1]<(yu(v[0]-w)<uu?M:k):M<=v[1]&&v[1]<=k:S>du^(w<=v[0]&&v[0]<=b)){var C=rc(f,(-p+y)/m);return nc(C,h),[v,Zu(C)]}}}function s(t,n){var i=r?e:du-e,o=0;return t<-i?o|=1:t>i&&(o|=2),n<-i?o|=4:n>i&&(o|=8),o}return bd(o,(function(e){var t,n,l,u,c;return{lineStart:function(){u=l=!1,c=1},point:function(d,h){var f,p=[d,h],m=o(d,h),g=r?m?0:s(d,h):m?s(d+(d<0?du:-du),h):0;if(!t&&(u=l=m)&&e.lineStart(),m!==l&&(!(f=a(t,p))||pd(t,f)||pd(p,f))&&(p[0]+=uu,p[1]+=uu,m=o(p[0],p[1])),m!==l)c=0,m?(e.lineStart(),f=a(p,t),e.point(f[0],f[1])):(f=a(t,p),e.point(f[0],f[1]),e.lineEnd()),t=f;else if(i&&t&&r^m){var y;g&n||!(y=a(p,t,!0))||(c=0,r?(e.lineStart(),e.point(y[0][0],y[0][1]),e.point(y[1][0],y[1][1]),e.lineEnd()):(e.point(y[1][0],y[1][1]),e.lineEnd(),e.lineStart(),e.point(y[0][0],y[0][1])))}!m||t&&pd(t,p)||e.point(p[0],p[1]),t=p,l=m,n=g},lineEnd:function(){l&&e.lineEnd(),t=null},clean:function(){return c|(u&&l)<<1}}}),(function(t,r,i,o){cd(o,e,n,i,t,r)}),r?[0,-e]:[-du,e-du])},Cd=function(e,t,n,r,i,o){var a,s=e[0],l=e[1],u=0,c=1,d=t[0]-s,h=t[1]-l;if(a=n-s,d||!(a>0)){if(a/=d,d<0){if(a<u)return;a<c&&(c=a)}else if(d>0){if(a>c)return;a>u&&(u=a)}if(a=i-s,d||!(a<0)){if(a/=d,d<0){if(a>c)return;a>u&&(u=a)}else if(d>0){if(a<u)return;a<c&&(c=a)}if(a=r-l,h||!(a>0)){if(a/=h,h<0){if(a<u)return;a<c&&(c=a)}else if(h>0){if(a>c)return;a>u&&(u=a)}if(a=o-l,h||!(a<0)){if(a/=h,h<0){if(a>c)return;a>u&&(u=a)}else if(h>0){if(a<u)return;a<c&&(c=a)}return u>0&&(e[0]=s+u*d,e[1]=l+u*h),c<1&&(t[0]=s+c*d,t[1]=l+c*h),!0}}}}},xd=1e9,Ed=-xd;function Ld(e,t,n,r){function i(i,o){return e<=i&&i<=n&&t<=o&&o<=r}function o(i,o,s,u){var c=0,d=0;if(null==i||(c=a(i,s))!==(d=a(o,s))||l(i,o)<0^s>0)do{u.point(0===c||3===c?e:n,c>1?r:t)}while((c=(c+s+4)%4)!==d);else u.point(o[0],o[1])}function a(r,i){return yu(r[0]-e)<uu?i>0?0:3:yu(r[0]-n)<uu?i>0?2:1:yu(r[1]-t)<uu?i>0?1:0:i>0?3:2}function s(e,t){return l(e.x,t.x)}function l(e,t){var n=a(e,1),r=a(t,1);return n!==r?n-r:0===n?t[1]-e[1]:1===n?e[0]-t[0]:2===n?e[1]-t[1]:t[0]-e[0]}return function(a){var l,u,c,d,h,f,p,m,g,y,v,_=a,w=fd(),b={point:M,lineStart:function(){b.point=k,u&&u.push(c=[]);y=!0,g=!1,p=m=NaN},lineEnd:function(){l&&(k(d,h),f&&g&&w.rejoin(),l.push(w.result()));b.point=M,g&&_.lineEnd()},polygonStart:function(){_=w,l=[],u=[],v=!0},polygonEnd:function(){var t=function(){for(var t=0,n=0,i=u.length;n<i;++n)for(var o,a,s=u[n],l=1,c=s.length,d=s[0],h=d[0],f=d[1];l<c;++l)o=h,a=f,d=s[l],h=d[0],f=d[1],a<=r?f>r&&(h-o)*(r-a)>(f-a)*(e-o)&&++t:f<=r&&(h-o)*(r-a)<(f-a)*(e-o)&&--t;return t}(),n=v&&t,i=(l=B(l)).length;(n||i)&&(a.polygonStart(),n&&(a.lineStart(),o(null,null,1,a),a.lineEnd()),i&&gd(l,s,t,o,a),a.polygonEnd());_=a,l=u=c=null}};function M(e,t){i(e,t)&&_.point(e,t)}function k(o,a){var s=i(o,a);if(u&&c.push([o,a]),y)d=o,h=a,f=s,y=!1,s&&(_.lineStart(),_.point(o,a));else if(s&&g)_.point(o,a);else{var l=[p=Math.max(Ed,Math.min(xd,p)),m=Math.max(Ed,Math.min(xd,m))],w=[o=Math.max(Ed,Math.min(xd,o)),a=Math.max(Ed,Math.min(xd,a))];Cd(l,w,e,t,n,r)?(g||(_.lineStart(),_.point(l[0],l[1])),_.point(w[0],w[1]),s||_.lineEnd(),v=!1):s&&(_.lineStart(),_.point(o,a),v=!1)}p=o,m=a,g=s}return b}}var Od,Dd,Rd,Ad=function(){var e,t,n,r=0,i=0,o=960,a=500;return n={stream:function(n){return e&&t===n?e:e=Ld(r,i,o,a)(t=n)},extent:function(s){return arguments.length?(r=+s[0][0],i=+s[0][1],o=+s[1][0],a=+s[1][1],e=t=null,n):[[r,i],[o,a]]}}},Nd=ou(),Yd={sphere:Ru,point:Ru,lineStart:function(){Yd.point=Hd,Yd.lineEnd=jd},lineEnd:Ru,polygonStart:Ru,polygonEnd:Ru};function jd(){Yd.point=Yd.lineEnd=Ru}function Hd(e,t){Od=e*=gu,Dd=Tu(t*=gu),Rd=wu(t),Yd.point=Pd}function Pd(e,t){e*=gu;var n=Tu(t*=gu),r=wu(t),i=yu(e-Od),o=wu(i),a=r*Tu(i),s=Rd*n-Dd*r*o,l=Dd*n+Rd*r*o;Nd.add(_u(xu(a*a+s*s),l)),Od=e,Dd=n,Rd=r}var Id=function(e){return Nd.reset(),Wu(e,Yd),+Nd},Fd=[null,null],Bd={type:"LineString",coordinates:Fd},zd=function(e,t){return Fd[0]=e,Fd[1]=t,Id(Bd)},Wd={Feature:function(e,t){return Vd(e.geometry,t)},FeatureCollection:function(e,t){for(var n=e.features,r=-1,i=n.length;++r<i;)if(Vd(n[r].geometry,t))return!0;return!1}},Ud={Sphere:function(){return!0},Point:function(e,t){return qd(e.coordinates,t)},MultiPoint:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)if(qd(n[r],t))return!0;return!1},LineString:function(e,t){return Gd(e.coordinates,t)},MultiLineString:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)if(Gd(n[r],t))return!0;return!1},Polygon:function(e,t){return Xd(e.coordinates,t)},MultiPolygon:function(e,t){for(var n=e.coordinates,r=-1,i=n.length;++r<i;)if(Xd(n[r],t))return!0;return!1},GeometryCollection:function(e,t){for(var n=e.geometries,r=-1,i=n.length;++r<i;)if(Vd(n[r],t))return!0;return!1}};function Vd(e,t){return!(!e||!Ud.hasOwnProperty(e.type))&&Ud[e.type](e,t)}function qd(e,t){return 0===zd(e,t)}function Gd(e,t){for(var n,r,i,o=0,a=e.length;o<a;o++){if(0===(r=zd(e[o],t)))return!0;if(o>0&&(i=zd(e[o],e[o-1]))>0&&n<=i&&r<=i&&(n+r-i)*(1-Math.pow((n-r)/i,2))<cu*i)return!0;n=r}return!1}function Xd(e,t){return!!wd(e.map(Kd),Jd(t))}function Kd(e){return(e=e.map(Jd)).pop(),e}function Jd(e){return[e[0]*gu,e[1]*gu]}var $d=function(e,t){return(e&&Wd.hasOwnProperty(e.type)?Wd[e.type]:Vd)(e,t)};function Zd(e,t,n){var r=C(e,t-uu,n).concat(t);return function(e){return r.map((function(t){return[e,t]}))}}function Qd(e,t,n){var r=C(e,t-uu,n).concat(t);return function(e){return r.map((function(t){return[t,e]}))}}function eh(){var e,t,n,r,i,o,a,s,l,u,c,d,h=10,f=h,p=90,m=360,g=2.5;function y(){return{type:"MultiLineString",coordinates:v()}}function v(){return C(bu(r/p)*p,n,p).map(c).concat(C(bu(s/m)*m,a,m).map(d)).concat(C(bu(t/h)*h,e,h).filter((function(e){return yu(e%p)>uu})).map(l)).concat(C(bu(o/f)*f,i,f).filter((function(e){return yu(e%m)>uu})).map(u))}return y.lines=function(){return v().map((function(e){return{type:"LineString",coordinates:e}}))},y.outline=function(){return{type:"Polygon",coordinates:[c(r).concat(d(a).slice(1),c(n).reverse().slice(1),d(s).reverse().slice(1))]}},y.extent=function(e){return arguments.length?y.extentMajor(e).extentMinor(e):y.extentMinor()},y.extentMajor=function(e){return arguments.length?(r=+e[0][0],n=+e[1][0],s=+e[0][1],a=+e[1][1],r>n&&(e=r,r=n,n=e),s>a&&(e=s,s=a,a=e),y.precision(g)):[[r,s],[n,a]]},y.extentMinor=function(n){return arguments.length?(t=+n[0][0],e=+n[1][0],o=+n[0][1],i=+n[1][1],t>e&&(n=t,t=e,e=n),o>i&&(n=o,o=i,i=n),y.precision(g)):[[t,o],[e,i]]},y.step=function(e){return arguments.length?y.stepMajor(e).stepMinor(e):y.stepMinor()},y.stepMajor=function(e){return arguments.length?(p=+e[0],m=+e[1],y):[p,m]},y.stepMinor=function(e){return arguments.length?(h=+e[0],f=+e[1],y):[h,f]},y.precision=function(h){return arguments.length?(g=+h,l=Zd(o,i,90),u=Qd(t,e,g),c=Zd(s,a,90),d=Qd(r,n,g),y):g},y.extentMajor([[-180,-90+uu],[180,90-uu]]).extentMinor([[-180,-80-uu],[180,80+uu]])}function th(){return eh()()}var nh,rh,ih,oh,ah=function(e,t){var n=e[0]*gu,r=e[1]*gu,i=t[0]*gu,o=t[1]*gu,a=wu(r),s=Tu(r),l=wu(o),u=Tu(o),c=a*wu(n),d=a*Tu(n),h=l*wu(i),f=l*Tu(i),p=2*Ou(xu(Du(o-r)+a*l*Du(i-n))),m=Tu(p),g=p?function(e){var t=Tu(e*=p)/m,n=Tu(p-e)/m,r=n*c+t*h,i=n*d+t*f,o=n*s+t*u;return[_u(i,r)*mu,_u(o,xu(r*r+i*i))*mu]}:function(){return[n*mu,r*mu]};return g.distance=p,g},sh=function(e){return e},lh=ou(),uh=ou(),ch={point:Ru,lineStart:Ru,lineEnd:Ru,polygonStart:function(){ch.lineStart=dh,ch.lineEnd=ph},polygonEnd:function(){ch.lineStart=ch.lineEnd=ch.point=Ru,lh.add(yu(uh)),uh.reset()},result:function(){var e=lh/2;return lh.reset(),e}};function dh(){ch.point=hh}function hh(e,t){ch.point=fh,nh=ih=e,rh=oh=t}function fh(e,t){uh.add(oh*e-ih*t),ih=e,oh=t}function ph(){fh(nh,rh)}var mh=ch,gh=1/0,yh=gh,vh=-gh,_h=vh;var wh,bh,Mh,kh,Sh={point:function(e,t){e<gh&&(gh=e);e>vh&&(vh=e);t<yh&&(yh=t);t>_h&&(_h=t)},lineStart:Ru,lineEnd:Ru,polygonStart:Ru,polygonEnd:Ru,result:function(){var e=[[gh,yh],[vh,_h]];return vh=_h=-(yh=gh=1/0),e}},Th=0,Ch=0,xh=0,Eh=0,Lh=0,Oh=0,Dh=0,Rh=0,Ah=0,Nh={point:Yh,lineStart:jh,lineEnd:Ih,polygonStart:function(){Nh.lineStart=Fh,Nh.lineEnd=Bh},polygonEnd:function(){Nh.point=Yh,Nh.lineStart=jh,Nh.lineEnd=Ih},result:function(){var e=Ah?[Dh/Ah,Rh/Ah]:Oh?[Eh/Oh,Lh/Oh]:xh?[Th/xh,Ch/xh]:[NaN,NaN];return Th=Ch=xh=Eh=Lh=Oh=Dh=Rh=Ah=0,e}};function Yh(e,t){Th+=e,Ch+=t,++xh}function jh(){Nh.point=Hh}function Hh(e,t){Nh.point=Ph,Yh(Mh=e,kh=t)}function Ph(e,t){var n=e-Mh,r=t-kh,i=xu(n*n+r*r);Eh+=i*(Mh+e)/2,Lh+=i*(kh+t)/2,Oh+=i,Yh(Mh=e,kh=t)}function Ih(){Nh.point=Yh}function Fh(){Nh.point=zh}function Bh(){Wh(wh,bh)}function zh(e,t){Nh.point=Wh,Yh(wh=Mh=e,bh=kh=t)}function Wh(e,t){var n=e-Mh,r=t-kh,i=xu(n*n+r*r);Eh+=i*(Mh+e)/2,Lh+=i*(kh+t)/2,Oh+=i,Dh+=(i=kh*e-Mh*t)*(Mh+e),Rh+=i*(kh+t),Ah+=3*i,Yh(Mh=e,kh=t)}var Uh=Nh;function Vh(e){this._context=e}Vh.prototype={_radius:4.5,pointRadius:function(e){return this._radius=e,this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._context.closePath(),this._point=NaN},point:function(e,t){switch(this._point){case 0:this._context.moveTo(e,t),this._point=1;break;case 1:this._context.lineTo(e,t);break;default:this._context.moveTo(e+this._radius,t),this._context.arc(e,t,this._radius,0,pu)}},result:Ru};var qh,Gh,Xh,Kh,Jh,$h=ou(),Zh={point:Ru,lineStart:function(){Zh.point=Qh},lineEnd:function(){qh&&ef(Gh,Xh),Zh.point=Ru},polygonStart:function(){qh=!0},polygonEnd:function(){qh=null},result:function(){var e=+$h;return $h.reset(),e}};function Qh(e,t){Zh.point=ef,Gh=Kh=e,Xh=Jh=t}function ef(e,t){Kh-=e,Jh-=t,$h.add(xu(Kh*Kh+Jh*Jh)),Kh=e,Jh=t}var tf=Zh;function nf(){this._string=[]}function rf(e){return"m0,"+e+"a"+e+","+e+" 0 1,1 0,"+-2*e+"a"+e+","+e+" 0 1,1 0,"+2*e+"z"}nf.prototype={_radius:4.5,_circle:rf(4.5),pointRadius:function(e){return(e=+e)!==this._radius&&(this._radius=e,this._circle=null),this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){0===this._line&&this._string.push("Z"),this._point=NaN},point:function(e,t){switch(this._point){case 0:this._string.push("M",e,",",t),this._point=1;break;case 1:this._string.push("L",e,",",t);break;default:null==this._circle&&(this._circle=rf(this._radius)),this._string.push("M",e,",",t,this._circle)}},result:function(){if(this._string.length){var e=this._string.join("");return this._string=[],e}return null}};var of=function(e,t){var n,r,i=4.5;function o(e){return e&&("function"==typeof i&&r.pointRadius(+i.apply(this,arguments)),Wu(e,n(r))),r.result()}return o.area=function(e){return Wu(e,n(mh)),mh.result()},o.measure=function(e){return Wu(e,n(tf)),tf.result()},o.bounds=function(e){return Wu(e,n(Sh)),Sh.result()},o.centroid=function(e){return Wu(e,n(Uh)),Uh.result()},o.projection=function(t){return arguments.length?(n=null==t?(e=null,sh):(e=t).stream,o):e},o.context=function(e){return arguments.length?(r=null==e?(t=null,new nf):new Vh(t=e),"function"!=typeof i&&r.pointRadius(i),o):t},o.pointRadius=function(e){return arguments.length?(i="function"==typeof e?e:(r.pointRadius(+e),+e),o):i},o.projection(e).context(t)},af=function(e){return{stream:sf(e)}};function sf(e){return function(t){var n=new lf;for(var r in e)n[r]=e[r];return n.stream=t,n}}function lf(){}function uf(e,t,n){var r=e.clipExtent&&e.clipExtent();return e.scale(150).translate([0,0]),null!=r&&e.clipExtent(null),Wu(n,e.stream(Sh)),t(Sh.result()),null!=r&&e.clipExtent(r),e}function cf(e,t,n){return uf(e,(function(n){var r=t[1][0]-t[0][0],i=t[1][1]-t[0][1],o=Math.min(r/(n[1][0]-n[0][0]),i/(n[1][1]-n[0][1])),a=+t[0][0]+(r-o*(n[1][0]+n[0][0]))/2,s=+t[0][1]+(i-o*(n[1][1]+n[0][1]))/2;e.scale(150*o).translate([a,s])}),n)}function df(e,t,n){return cf(e,[[0,0],t],n)}function hf(e,t,n){return uf(e,(function(n){var r=+t,i=r/(n[1][0]-n[0][0]),o=(r-i*(n[1][0]+n[0][0]))/2,a=-i*n[0][1];e.scale(150*i).translate([o,a])}),n)}function ff(e,t,n){return uf(e,(function(n){var r=+t,i=r/(n[1][1]-n[0][1]),o=-i*n[0][0],a=(r-i*(n[1][1]+n[0][1]))/2;e.scale(150*i).translate([o,a])}),n)}lf.prototype={constructor:lf,point:function(e,t){this.stream.point(e,t)},sphere:function(){this.stream.sphere()},lineStart:function(){this.stream.lineStart()},lineEnd:function(){this.stream.lineEnd()},polygonStart:function(){this.stream.polygonStart()},polygonEnd:function(){this.stream.polygonEnd()}};var pf=16,mf=wu(30*gu),gf=function(e,t){return+t?function(e,t){function n(r,i,o,a,s,l,u,c,d,h,f,p,m,g){var y=u-r,v=c-i,_=y*y+v*v;if(_>4*t&&m--){var w=a+h,b=s+f,M=l+p,k=xu(w*w+b*b+M*M),S=Ou(M/=k),T=yu(yu(M)-1)<uu||yu(o-d)<uu?(o+d)/2:_u(b,w),C=e(T,S),x=C[0],E=C[1],L=x-r,O=E-i,D=v*L-y*O;(D*D/_>t||yu((y*L+v*O)/_-.5)>.3||a*h+s*f+l*p<mf)&&(n(r,i,o,a,s,l,x,E,T,w/=k,b/=k,M,m,g),g.point(x,E),n(x,E,T,w,b,M,u,c,d,h,f,p,m,g))}}return function(t){var r,i,o,a,s,l,u,c,d,h,f,p,m={point:g,lineStart:y,lineEnd:_,polygonStart:function(){t.polygonStart(),m.lineStart=w},polygonEnd:function(){t.polygonEnd(),m.lineStart=y}};function g(n,r){n=e(n,r),t.point(n[0],n[1])}function y(){c=NaN,m.point=v,t.lineStart()}function v(r,i){var o=Qu([r,i]),a=e(r,i);n(c,d,u,h,f,p,c=a[0],d=a[1],u=r,h=o[0],f=o[1],p=o[2],pf,t),t.point(c,d)}function _(){m.point=g,t.lineEnd()}function w(){y(),m.point=b,m.lineEnd=M}function b(e,t){v(r=e,t),i=c,o=d,a=h,s=f,l=p,m.point=v}function M(){n(c,d,u,h,f,p,i,o,r,a,s,l,pf,t),m.lineEnd=_,_()}return m}}(e,t):function(e){return sf({point:function(t,n){t=e(t,n),this.stream.point(t[0],t[1])}})}(e)};var yf=sf({point:function(e,t){this.stream.point(e*gu,t*gu)}});function vf(e,t,n){function r(r,i){return[t+e*r,n-e*i]}return r.invert=function(r,i){return[(r-t)/e,(n-i)/e]},r}function _f(e,t,n,r){var i=wu(r),o=Tu(r),a=i*e,s=o*e,l=i/e,u=o/e,c=(o*n-i*t)/e,d=(o*t+i*n)/e;function h(e,r){return[a*e-s*r+t,n-s*e-a*r]}return h.invert=function(e,t){return[l*e-u*t+c,d-u*e-l*t]},h}function wf(e){return bf((function(){return e}))()}function bf(e){var t,n,r,i,o,a,s,l,u,c,d=150,h=480,f=250,p=0,m=0,g=0,y=0,v=0,_=0,w=null,b=Sd,M=null,k=sh,S=.5;function T(e){return l(e[0]*gu,e[1]*gu)}function C(e){return(e=l.invert(e[0],e[1]))&&[e[0]*mu,e[1]*mu]}function x(){var e=_f(d,0,0,_).apply(null,t(p,m)),r=(_?_f:vf)(d,h-e[0],f-e[1],_);return n=od(g,y,v),s=rd(t,r),l=rd(n,s),a=gf(s,S),E()}function E(){return u=c=null,T}return T.stream=function(e){return u&&c===e?u:u=yf(function(e){return sf({point:function(t,n){var r=e(t,n);return this.stream.point(r[0],r[1])}})}(n)(b(a(k(c=e)))))},T.preclip=function(e){return arguments.length?(b=e,w=void 0,E()):b},T.postclip=function(e){return arguments.length?(k=e,M=r=i=o=null,E()):k},T.clipAngle=function(e){return arguments.length?(b=+e?Td(w=e*gu):(w=null,Sd),E()):w*mu},T.clipExtent=function(e){return arguments.length?(k=null==e?(M=r=i=o=null,sh):Ld(M=+e[0][0],r=+e[0][1],i=+e[1][0],o=+e[1][1]),E()):null==M?null:[[M,r],[i,o]]},T.scale=function(e){return arguments.length?(d=+e,x()):d},T.translate=function(e){return arguments.length?(h=+e[0],f=+e[1],x()):[h,f]},T.center=function(e){return arguments.length?(p=e[0]%360*gu,m=e[1]%360*gu,x()):[p*mu,m*mu]},T.rotate=function(e){return arguments.length?(g=e[0]%360*gu,y=e[1]%360*gu,v=e.length>2?e[2]%360*gu:0,x()):[g*mu,y*mu,v*mu]},T.angle=function(e){return arguments.length?(_=e%360*gu,x()):_*mu},T.precision=function(e){return arguments.length?(a=gf(s,S=e*e),E()):xu(S)},T.fitExtent=function(e,t){return cf(T,e,t)},T.fitSize=function(e,t){return df(T,e,t)},T.fitWidth=function(e,t){return hf(T,e,t)},T.fitHeight=function(e,t){return ff(T,e,t)},function(){return t=e.apply(this,arguments),T.invert=t.invert&&C,x()}}function Mf(e){var t=0,n=du/3,r=bf(e),i=r(t,n);return i.parallels=function(e){return arguments.length?r(t=e[0]*gu,n=e[1]*gu):[t*mu,n*mu]},i}function kf(e,t){var n=Tu(e),r=(n+Tu(t))/2;if(yu(r)<uu)return function(e){var t=wu(e);function n(e,n){return[e*t,Tu(n)/t]}return n.invert=function(e,n){return[e/t,Ou(n*t)]},n}(e);var i=1+n*(2*r-n),o=xu(i)/r;function a(e,t){var n=xu(i-2*r*Tu(t))/r;return[n*Tu(e*=r),o-n*wu(e)]}return a.invert=function(e,t){var n=o-t;return[_u(e,yu(n))/r*Cu(n),Ou((i-(e*e+n*n)*r*r)/(2*r))]},a}var Sf=function(){return Mf(kf).scale(155.424).center([0,33.6442])},Tf=function(){return Sf().parallels([29.5,45.5]).scale(1070).translate([480,250]).rotate([96,0]).center([-.6,38.7])};var Cf=function(){var e,t,n,r,i,o,a=Tf(),s=Sf().rotate([154,0]).center([-2,58.5]).parallels([55,65]),l=Sf().rotate([157,0]).center([-3,19.9]).parallels([8,18]),u={point:function(e,t){o=[e,t]}};function c(e){var t=e[0],a=e[1];return o=null,n.point(t,a),o||(r.point(t,a),o)||(i.point(t,a),o)}function d(){return e=t=null,c}return c.invert=function(e){var t=a.scale(),n=a.translate(),r=(e[0]-n[0])/t,i=(e[1]-n[1])/t;return(i>=.12&&i<.234&&r>=-.425&&r<-.214?s:i>=.166&&i<.234&&r>=-.214&&r<-.115?l:a).invert(e)},c.stream=function(n){return e&&t===n?e:(r=[a.stream(t=n),s.stream(n),l.stream(n)],i=r.length,e={point:function(e,t){for(var n=-1;++n<i;)r[n].point(e,t)},sphere:function(){for(var e=-1;++e<i;)r[e].sphere()},lineStart:function(){for(var e=-1;++e<i;)r[e].lineStart()},lineEnd:function(){for(var e=-1;++e<i;)r[e].lineEnd()},polygonStart:function(){for(var e=-1;++e<i;)r[e].polygonStart()},polygonEnd:function(){for(var e=-1;++e<i;)r[e].polygonEnd()}});var r,i},c.precision=function(e){return arguments.length?(a.precision(e),s.precision(e),l.precision(e),d()):a.precision()},c.scale=function(e){return arguments.length?(a.scale(e),s.scale(.35*e),l.scale(e),c.translate(a.translate())):a.scale()},c.translate=function(e){if(!arguments.length)return a.translate();var t=a.scale(),o=+e[0],c=+e[1];return n=a.translate(e).clipExtent([[o-.455*t,c-.238*t],[o+.455*t,c+.238*t]]).stream(u),r=s.translate([o-.307*t,c+.201*t]).clipExtent([[o-.425*t+uu,c+.12*t+uu],[o-.214*t-uu,c+.234*t-uu]]).stream(u),i=l.translate([o-.205*t,c+.212*t]).clipExtent([[o-.214*t+uu,c+.166*t+uu],[o-.115*t-uu,c+.234*t-uu]]).stream(u),d()},c.fitExtent=function(e,t){return cf(c,e,t)},c.fitSize=function(e,t){return df(c,e,t)},c.fitWidth=function(e,t){return hf(c,e,t)},c.fitHeight=function(e,t){return ff(c,e,t)},c.scale(1070)};function xf(e){return function(t,n){var r=wu(t),i=wu(n),o=e(r*i);return[o*i*Tu(t),o*Tu(n)]}}function Ef(e){return function(t,n){var r=xu(t*t+n*n),i=e(r),o=Tu(i),a=wu(i);return[_u(t*o,r*a),Ou(r&&n*o/r)]}}var Lf=xf((function(e){return xu(2/(1+e))}));Lf.invert=Ef((function(e){return 2*Ou(e/2)}));var Of=function(){return wf(Lf).scale(124.75).clipAngle(179.999)},Df=xf((function(e){return(e=Lu(e))&&e/Tu(e)}));Df.invert=Ef((function(e){return e}));var Rf=function(){return wf(Df).scale(79.4188).clipAngle(179.999)};function Af(e,t){return[e,ku(Eu((hu+t)/2))]}Af.invert=function(e,t){return[e,2*vu(Mu(t))-hu]};var Nf=function(){return Yf(Af).scale(961/pu)};function Yf(e){var t,n,r,i=wf(e),o=i.center,a=i.scale,s=i.translate,l=i.clipExtent,u=null;function c(){var o=du*a(),s=i(ud(i.rotate()).invert([0,0]));return l(null==u?[[s[0]-o,s[1]-o],[s[0]+o,s[1]+o]]:e===Af?[[Math.max(s[0]-o,u),t],[Math.min(s[0]+o,n),r]]:[[u,Math.max(s[1]-o,t)],[n,Math.min(s[1]+o,r)]])}return i.scale=function(e){return arguments.length?(a(e),c()):a()},i.translate=function(e){return arguments.length?(s(e),c()):s()},i.center=function(e){return arguments.length?(o(e),c()):o()},i.clipExtent=function(e){return arguments.length?(null==e?u=t=n=r=null:(u=+e[0][0],t=+e[0][1],n=+e[1][0],r=+e[1][1]),c()):null==u?null:[[u,t],[n,r]]},c()}function jf(e){return Eu((hu+e)/2)}function Hf(e,t){var n=wu(e),r=e===t?Tu(e):ku(n/wu(t))/ku(jf(t)/jf(e)),i=n*Su(jf(e),r)/r;if(!r)return Af;function o(e,t){i>0?t<-hu+uu&&(t=-hu+uu):t>hu-uu&&(t=hu-uu);var n=i/Su(jf(t),r);return[n*Tu(r*e),i-n*wu(r*e)]}return o.invert=function(e,t){var n=i-t,o=Cu(r)*xu(e*e+n*n);return[_u(e,yu(n))/r*Cu(n),2*vu(Su(i/o,1/r))-hu]},o}var Pf=function(){return Mf(Hf).scale(109.5).parallels([30,30])};function If(e,t){return[e,t]}If.invert=If;var Ff=function(){return wf(If).scale(152.63)};function Bf(e,t){var n=wu(e),r=e===t?Tu(e):(n-wu(t))/(t-e),i=n/r+e;if(yu(r)<uu)return If;function o(e,t){var n=i-t,o=r*e;return[n*Tu(o),i-n*wu(o)]}return o.invert=function(e,t){var n=i-t;return[_u(e,yu(n))/r*Cu(n),i-Cu(r)*xu(e*e+n*n)]},o}var zf=function(){return Mf(Bf).scale(131.154).center([0,13.9389])},Wf=1.340264,Uf=-.081106,Vf=893e-6,qf=.003796,Gf=xu(3)/2;function Xf(e,t){var n=Ou(Gf*Tu(t)),r=n*n,i=r*r*r;return[e*wu(n)/(Gf*(Wf+3*Uf*r+i*(7*Vf+9*qf*r))),n*(Wf+Uf*r+i*(Vf+qf*r))]}Xf.invert=function(e,t){for(var n,r=t,i=r*r,o=i*i*i,a=0;a<12&&(o=(i=(r-=n=(r*(Wf+Uf*i+o*(Vf+qf*i))-t)/(Wf+3*Uf*i+o*(7*Vf+9*qf*i)))*r)*i*i,!(yu(n)<cu));++a);return[Gf*e*(Wf+3*Uf*i+o*(7*Vf+9*qf*i))/wu(r),Ou(Tu(r)/Gf)]};var Kf=function(){return wf(Xf).scale(177.158)};function Jf(e,t){var n=wu(t),r=wu(e)*n;return[n*Tu(e)/r,Tu(t)/r]}Jf.invert=Ef(vu);var $f=function(){return wf(Jf).scale(144.049).clipAngle(60)};function Zf(e,t,n,r){return 1===e&&1===t&&0===n&&0===r?sh:sf({point:function(i,o){this.stream.point(i*e+n,o*t+r)}})}var Qf=function(){var e,t,n,r,i,o,a=1,s=0,l=0,u=1,c=1,d=sh,h=null,f=sh;function p(){return r=i=null,o}return o={stream:function(e){return r&&i===e?r:r=d(f(i=e))},postclip:function(r){return arguments.length?(f=r,h=e=t=n=null,p()):f},clipExtent:function(r){return arguments.length?(f=null==r?(h=e=t=n=null,sh):Ld(h=+r[0][0],e=+r[0][1],t=+r[1][0],n=+r[1][1]),p()):null==h?null:[[h,e],[t,n]]},scale:function(e){return arguments.length?(d=Zf((a=+e)*u,a*c,s,l),p()):a},translate:function(e){return arguments.length?(d=Zf(a*u,a*c,s=+e[0],l=+e[1]),p()):[s,l]},reflectX:function(e){return arguments.length?(d=Zf(a*(u=e?-1:1),a*c,s,l),p()):u<0},reflectY:function(e){return arguments.length?(d=Zf(a*u,a*(c=e?-1:1),s,l),p()):c<0},fitExtent:function(e,t){return cf(o,e,t)},fitSize:function(e,t){return df(o,e,t)},fitWidth:function(e,t){return hf(o,e,t)},fitHeight:function(e,t){return ff(o,e,t)}}};function ep(e,t){var n=t*t,r=n*n;return[e*(.8707-.131979*n+r*(r*(.003971*n-.001529*r)-.013791)),t*(1.007226+n*(.015085+r*(.028874*n-.044475-.005916*r)))]}ep.invert=function(e,t){var n,r=t,i=25;do{var o=r*r,a=o*o;r-=n=(r*(1.007226+o*(.015085+a*(.028874*o-.044475-.005916*a)))-t)/(1.007226+o*(.045255+a*(.259866*o-.311325-.005916*11*a)))}while(yu(n)>uu&&--i>0);return[e/(.8707+(o=r*r)*(o*(o*o*o*(.003971-.001529*o)-.013791)-.131979)),r]};var tp=function(){return wf(ep).scale(175.295)};function np(e,t){return[wu(t)*Tu(e),Tu(t)]}np.invert=Ef(Ou);var rp=function(){return wf(np).scale(249.5).clipAngle(90+uu)};function ip(e,t){var n=wu(t),r=1+wu(e)*n;return[n*Tu(e)/r,Tu(t)/r]}ip.invert=Ef((function(e){return 2*vu(e)}));var op=function(){return wf(ip).scale(250).clipAngle(142)};function ap(e,t){return[ku(Eu((hu+t)/2)),-e]}ap.invert=function(e,t){return[-t,2*vu(Mu(e))-hu]};var sp=function(){var e=Yf(ap),t=e.center,n=e.rotate;return e.center=function(e){return arguments.length?t([-e[1],e[0]]):[(e=t())[1],-e[0]]},e.rotate=function(e){return arguments.length?n([e[0],e[1],e.length>2?e[2]+90:90]):[(e=n())[0],e[1],e[2]-90]},n([0,0,90]).scale(159.155)};function lp(e,t){return e.parent===t.parent?1:2}function up(e,t){return e+t.x}function cp(e,t){return Math.max(e,t.y)}var dp=function(){var e=lp,t=1,n=1,r=!1;function i(i){var o,a=0;i.eachAfter((function(t){var n=t.children;n?(t.x=function(e){return e.reduce(up,0)/e.length}(n),t.y=function(e){return 1+e.reduce(cp,0)}(n)):(t.x=o?a+=e(t,o):0,t.y=0,o=t)}));var s=function(e){for(var t;t=e.children;)e=t[0];return e}(i),l=function(e){for(var t;t=e.children;)e=t[t.length-1];return e}(i),u=s.x-e(s,l)/2,c=l.x+e(l,s)/2;return i.eachAfter(r?function(e){e.x=(e.x-i.x)*t,e.y=(i.y-e.y)*n}:function(e){e.x=(e.x-u)/(c-u)*t,e.y=(1-(i.y?e.y/i.y:1))*n})}return i.separation=function(t){return arguments.length?(e=t,i):e},i.size=function(e){return arguments.length?(r=!1,t=+e[0],n=+e[1],i):r?null:[t,n]},i.nodeSize=function(e){return arguments.length?(r=!0,t=+e[0],n=+e[1],i):r?[t,n]:null},i};function hp(e){var t=0,n=e.children,r=n&&n.length;if(r)for(;--r>=0;)t+=n[r].value;else t=1;e.value=t}function fp(e,t){var n,r,i,o,a,s=new yp(e),l=+e.value&&(s.value=e.value),u=[s];for(null==t&&(t=pp);n=u.pop();)if(l&&(n.value=+n.data.value),(i=t(n.data))&&(a=i.length))for(n.children=new Array(a),o=a-1;o>=0;--o)u.push(r=n.children[o]=new yp(i[o])),r.parent=n,r.depth=n.depth+1;return s.eachBefore(gp)}function pp(e){return e.children}function mp(e){e.data=e.data.data}function gp(e){var t=0;do{e.height=t}while((e=e.parent)&&e.height<++t)}function yp(e){this.data=e,this.depth=this.height=0,this.parent=null}yp.prototype=fp.prototype={constructor:yp,count:function(){return this.eachAfter(hp)},each:function(e){var t,n,r,i,o=this,a=[o];do{for(t=a.reverse(),a=[];o=t.pop();)if(e(o),n=o.children)for(r=0,i=n.length;r<i;++r)a.push(n[r])}while(a.length);return this},eachAfter:function(e){for(var t,n,r,i=this,o=[i],a=[];i=o.pop();)if(a.push(i),t=i.children)for(n=0,r=t.length;n<r;++n)o.push(t[n]);for(;i=a.pop();)e(i);return this},eachBefore:function(e){for(var t,n,r=this,i=[r];r=i.pop();)if(e(r),t=r.children)for(n=t.length-1;n>=0;--n)i.push(t[n]);return this},sum:function(e){return this.eachAfter((function(t){for(var n=+e(t.data)||0,r=t.children,i=r&&r.length;--i>=0;)n+=r[i].value;t.value=n}))},sort:function(e){return this.eachBefore((function(t){t.children&&t.children.sort(e)}))},path:function(e){for(var t=this,n=function(e,t){if(e===t)return e;var n=e.ancestors(),r=t.ancestors(),i=null;e=n.pop(),t=r.pop();for(;e===t;)i=e,e=n.pop(),t=r.pop();return i}(t,e),r=[t];t!==n;)t=t.parent,r.push(t);for(var i=r.length;e!==n;)r.splice(i,0,e),e=e.parent;return r},ancestors:function(){for(var e=this,t=[e];e=e.parent;)t.push(e);return t},descendants:function(){var e=[];return this.each((function(t){e.push(t)})),e},leaves:function(){var e=[];return this.eachBefore((function(t){t.children||e.push(t)})),e},links:function(){var e=this,t=[];return e.each((function(n){n!==e&&t.push({source:n.parent,target:n})})),t},copy:function(){return fp(this).eachBefore(mp)}};var vp=Array.prototype.slice;var _p=function(e){for(var t,n,r=0,i=(e=function(e){for(var t,n,r=e.length;r;)n=Math.random()*r--|0,t=e[r],e[r]=e[n],e[n]=t;return e}(vp.call(e))).length,o=[];r<i;)t=e[r],n&&Mp(n,t)?++r:(n=Sp(o=wp(o,t)),r=0);return n};function wp(e,t){var n,r;if(kp(t,e))return[t];for(n=0;n<e.length;++n)if(bp(t,e[n])&&kp(Tp(e[n],t),e))return[e[n],t];for(n=0;n<e.length-1;++n)for(r=n+1;r<e.length;++r)if(bp(Tp(e[n],e[r]),t)&&bp(Tp(e[n],t),e[r])&&bp(Tp(e[r],t),e[n])&&kp(Cp(e[n],e[r],t),e))return[e[n],e[r],t];throw new Error}function bp(e,t){var n=e.r-t.r,r=t.x-e.x,i=t.y-e.y;return n<0||n*n<r*r+i*i}function Mp(e,t){var n=e.r-t.r+1e-6,r=t.x-e.x,i=t.y-e.y;return n>0&&n*n>r*r+i*i}function kp(e,t){for(var n=0;n<t.length;++n)if(!Mp(e,t[n]))return!1;return!0}function Sp(e){switch(e.length){case 1:return{x:(t=e[0]).x,y:t.y,r:t.r};case 2:return Tp(e[0],e[1]);case 3:return Cp(e[0],e[1],e[2])}var t}function Tp(e,t){var n=e.x,r=e.y,i=e.r,o=t.x,a=t.y,s=t.r,l=o-n,u=a-r,c=s-i,d=Math.sqrt(l*l+u*u);return{x:(n+o+l/d*c)/2,y:(r+a+u/d*c)/2,r:(d+i+s)/2}}function Cp(e,t,n){var r=e.x,i=e.y,o=e.r,a=t.x,s=t.y,l=t.r,u=n.x,c=n.y,d=n.r,h=r-a,f=r-u,p=i-s,m=i-c,g=l-o,y=d-o,v=r*r+i*i-o*o,_=v-a*a-s*s+l*l,w=v-u*u-c*c+d*d,b=f*p-h*m,M=(p*w-m*_)/(2*b)-r,k=(m*g-p*y)/b,S=(f*_-h*w)/(2*b)-i,T=(h*y-f*g)/b,C=k*k+T*T-1,x=2*(o+M*k+S*T),E=M*M+S*S-o*o,L=-(C?(x+Math.sqrt(x*x-4*C*E))/(2*C):E/x);return{x:r+M+k*L,y:i+S+T*L,r:L}}function xp(e,t,n){var r,i,o,a,s=e.x-t.x,l=e.y-t.y,u=s*s+l*l;u?(i=t.r+n.r,i*=i,a=e.r+n.r,i>(a*=a)?(r=(u+a-i)/(2*u),o=Math.sqrt(Math.max(0,a/u-r*r)),n.x=e.x-r*s-o*l,n.y=e.y-r*l+o*s):(r=(u+i-a)/(2*u),o=Math.sqrt(Math.max(0,i/u-r*r)),n.x=t.x+r*s-o*l,n.y=t.y+r*l+o*s)):(n.x=t.x+n.r,n.y=t.y)}function Ep(e,t){var n=e.r+t.r-1e-6,r=t.x-e.x,i=t.y-e.y;return n>0&&n*n>r*r+i*i}function Lp(e){var t=e._,n=e.next._,r=t.r+n.r,i=(t.x*n.r+n.x*t.r)/r,o=(t.y*n.r+n.y*t.r)/r;return i*i+o*o}function Op(e){this._=e,this.next=null,this.previous=null}function Dp(e){if(!(i=e.length))return 0;var t,n,r,i,o,a,s,l,u,c,d;if((t=e[0]).x=0,t.y=0,!(i>1))return t.r;if(n=e[1],t.x=-n.r,n.x=t.r,n.y=0,!(i>2))return t.r+n.r;xp(n,t,r=e[2]),t=new Op(t),n=new Op(n),r=new Op(r),t.next=r.previous=n,n.next=t.previous=r,r.next=n.previous=t;e:for(s=3;s<i;++s){xp(t._,n._,r=e[s]),r=new Op(r),l=n.next,u=t.previous,c=n._.r,d=t._.r;do{if(c<=d){if(Ep(l._,r._)){n=l,t.next=n,n.previous=t,--s;continue e}c+=l._.r,l=l.next}else{if(Ep(u._,r._)){(t=u).next=n,n.previous=t,--s;continue e}d+=u._.r,u=u.previous}}while(l!==u.next);for(r.previous=t,r.next=n,t.next=n.previous=n=r,o=Lp(t);(r=r.next)!==n;)(a=Lp(r))<o&&(t=r,o=a);n=t.next}for(t=[n._],r=n;(r=r.next)!==n;)t.push(r._);for(r=_p(t),s=0;s<i;++s)(t=e[s]).x-=r.x,t.y-=r.y;return r.r}var Rp=function(e){return Dp(e),e};function Ap(e){return null==e?null:Np(e)}function Np(e){if("function"!=typeof e)throw new Error;return e}function Yp(){return 0}var jp=function(e){return function(){return e}};function Hp(e){return Math.sqrt(e.value)}var Pp=function(){var e=null,t=1,n=1,r=Yp;function i(i){return i.x=t/2,i.y=n/2,e?i.eachBefore(Ip(e)).eachAfter(Fp(r,.5)).eachBefore(Bp(1)):i.eachBefore(Ip(Hp)).eachAfter(Fp(Yp,1)).eachAfter(Fp(r,i.r/Math.min(t,n))).eachBefore(Bp(Math.min(t,n)/(2*i.r))),i}return i.radius=function(t){return arguments.length?(e=Ap(t),i):e},i.size=function(e){return arguments.length?(t=+e[0],n=+e[1],i):[t,n]},i.padding=function(e){return arguments.length?(r="function"==typeof e?e:jp(+e),i):r},i};function Ip(e){return function(t){t.children||(t.r=Math.max(0,+e(t)||0))}}function Fp(e,t){return function(n){if(r=n.children){var r,i,o,a=r.length,s=e(n)*t||0;if(s)for(i=0;i<a;++i)r[i].r+=s;if(o=Dp(r),s)for(i=0;i<a;++i)r[i].r-=s;n.r=o+s}}}function Bp(e){return function(t){var n=t.parent;t.r*=e,n&&(t.x=n.x+e*t.x,t.y=n.y+e*t.y)}}var zp=function(e){e.x0=Math.round(e.x0),e.y0=Math.round(e.y0),e.x1=Math.round(e.x1),e.y1=Math.round(e.y1)},Wp=function(e,t,n,r,i){for(var o,a=e.children,s=-1,l=a.length,u=e.value&&(r-t)/e.value;++s<l;)(o=a[s]).y0=n,o.y1=i,o.x0=t,o.x1=t+=o.value*u},Up=function(){var e=1,t=1,n=0,r=!1;function i(i){var o=i.height+1;return i.x0=i.y0=n,i.x1=e,i.y1=t/o,i.eachBefore(function(e,t){return function(r){r.children&&Wp(r,r.x0,e*(r.depth+1)/t,r.x1,e*(r.depth+2)/t);var i=r.x0,o=r.y0,a=r.x1-n,s=r.y1-n;a<i&&(i=a=(i+a)/2),s<o&&(o=s=(o+s)/2),r.x0=i,r.y0=o,r.x1=a,r.y1=s}}(t,o)),r&&i.eachBefore(zp),i}return i.round=function(e){return arguments.length?(r=!!e,i):r},i.size=function(n){return arguments.length?(e=+n[0],t=+n[1],i):[e,t]},i.padding=function(e){return arguments.length?(n=+e,i):n},i},Vp="$",qp={depth:-1},Gp={};function Xp(e){return e.id}function Kp(e){return e.parentId}var Jp=function(){var e=Xp,t=Kp;function n(n){var r,i,o,a,s,l,u,c=n.length,d=new Array(c),h={};for(i=0;i<c;++i)r=n[i],s=d[i]=new yp(r),null!=(l=e(r,i,n))&&(l+="")&&(h[u=Vp+(s.id=l)]=u in h?Gp:s);for(i=0;i<c;++i)if(s=d[i],null!=(l=t(n[i],i,n))&&(l+="")){if(!(a=h[Vp+l]))throw new Error("missing: "+l);if(a===Gp)throw new Error("ambiguous: "+l);a.children?a.children.push(s):a.children=[s],s.parent=a}else{if(o)throw new Error("multiple roots");o=s}if(!o)throw new Error("no root");if(o.parent=qp,o.eachBefore((function(e){e.depth=e.parent.depth+1,--c})).eachBefore(gp),o.parent=null,c>0)throw new Error("cycle");return o}return n.id=function(t){return arguments.length?(e=Np(t),n):e},n.parentId=function(e){return arguments.length?(t=Np(e),n):t},n};function $p(e,t){return e.parent===t.parent?1:2}function Zp(e){var t=e.children;return t?t[0]:e.t}function Qp(e){var t=e.children;return t?t[t.length-1]:e.t}function em(e,t,n){var r=n/(t.i-e.i);t.c-=r,t.s+=n,e.c+=r,t.z+=n,t.m+=n}function tm(e,t,n){return e.a.parent===t.parent?e.a:n}function nm(e,t){this._=e,this.parent=null,this.children=null,this.A=null,this.a=this,this.z=0,this.m=0,this.c=0,this.s=0,this.t=null,this.i=t}nm.prototype=Object.create(yp.prototype);var rm=function(){var e=$p,t=1,n=1,r=null;function i(i){var l=function(e){for(var t,n,r,i,o,a=new nm(e,0),s=[a];t=s.pop();)if(r=t._.children)for(t.children=new Array(o=r.length),i=o-1;i>=0;--i)s.push(n=t.children[i]=new nm(r[i],i)),n.parent=t;return(a.parent=new nm(null,0)).children=[a],a}(i);if(l.eachAfter(o),l.parent.m=-l.z,l.eachBefore(a),r)i.eachBefore(s);else{var u=i,c=i,d=i;i.eachBefore((function(e){e.x<u.x&&(u=e),e.x>c.x&&(c=e),e.depth>d.depth&&(d=e)}));var h=u===c?1:e(u,c)/2,f=h-u.x,p=t/(c.x+h+f),m=n/(d.depth||1);i.eachBefore((function(e){e.x=(e.x+f)*p,e.y=e.depth*m}))}return i}function o(t){var n=t.children,r=t.parent.children,i=t.i?r[t.i-1]:null;if(n){!function(e){for(var t,n=0,r=0,i=e.children,o=i.length;--o>=0;)(t=i[o]).z+=n,t.m+=n,n+=t.s+(r+=t.c)}(t);var o=(n[0].z+n[n.length-1].z)/2;i?(t.z=i.z+e(t._,i._),t.m=t.z-o):t.z=o}else i&&(t.z=i.z+e(t._,i._));t.parent.A=function(t,n,r){if(n){for(var i,o=t,a=t,s=n,l=o.parent.children[0],u=o.m,c=a.m,d=s.m,h=l.m;s=Qp(s),o=Zp(o),s&&o;)l=Zp(l),(a=Qp(a)).a=t,(i=s.z+d-o.z-u+e(s._,o._))>0&&(em(tm(s,t,r),t,i),u+=i,c+=i),d+=s.m,u+=o.m,h+=l.m,c+=a.m;s&&!Qp(a)&&(a.t=s,a.m+=d-c),o&&!Zp(l)&&(l.t=o,l.m+=u-h,r=t)}return r}(t,i,t.parent.A||r[0])}function a(e){e._.x=e.z+e.parent.m,e.m+=e.parent.m}function s(e){e.x*=t,e.y=e.depth*n}return i.separation=function(t){return arguments.length?(e=t,i):e},i.size=function(e){return arguments.length?(r=!1,t=+e[0],n=+e[1],i):r?null:[t,n]},i.nodeSize=function(e){return arguments.length?(r=!0,t=+e[0],n=+e[1],i):r?[t,n]:null},i},im=function(e,t,n,r,i){for(var o,a=e.children,s=-1,l=a.length,u=e.value&&(i-n)/e.value;++s<l;)(o=a[s]).x0=t,o.x1=r,o.y0=n,o.y1=n+=o.value*u},om=(1+Math.sqrt(5))/2;function am(e,t,n,r,i,o){for(var a,s,l,u,c,d,h,f,p,m,g,y=[],v=t.children,_=0,w=0,b=v.length,M=t.value;_<b;){l=i-n,u=o-r;do{c=v[w++].value}while(!c&&w<b);for(d=h=c,g=c*c*(m=Math.max(u/l,l/u)/(M*e)),p=Math.max(h/g,g/d);w<b;++w){if(c+=s=v[w].value,s<d&&(d=s),s>h&&(h=s),g=c*c*m,(f=Math.max(h/g,g/d))>p){c-=s;break}p=f}y.push(a={value:c,dice:l<u,children:v.slice(_,w)}),a.dice?Wp(a,n,r,i,M?r+=u*c/M:o):im(a,n,r,M?n+=l*c/M:i,o),M-=c,_=w}return y}var sm=function e(t){function n(e,n,r,i,o){am(t,e,n,r,i,o)}return n.ratio=function(t){return e((t=+t)>1?t:1)},n}(om),lm=function(){var e=sm,t=!1,n=1,r=1,i=[0],o=Yp,a=Yp,s=Yp,l=Yp,u=Yp;function c(e){return e.x0=e.y0=0,e.x1=n,e.y1=r,e.eachBefore(d),i=[0],t&&e.eachBefore(zp),e}function d(t){var n=i[t.depth],r=t.x0+n,c=t.y0+n,d=t.x1-n,h=t.y1-n;d<r&&(r=d=(r+d)/2),h<c&&(c=h=(c+h)/2),t.x0=r,t.y0=c,t.x1=d,t.y1=h,t.children&&(n=i[t.depth+1]=o(t)/2,r+=u(t)-n,c+=a(t)-n,(d-=s(t)-n)<r&&(r=d=(r+d)/2),(h-=l(t)-n)<c&&(c=h=(c+h)/2),e(t,r,c,d,h))}return c.round=function(e){return arguments.length?(t=!!e,c):t},c.size=function(e){return arguments.length?(n=+e[0],r=+e[1],c):[n,r]},c.tile=function(t){return arguments.length?(e=Np(t),c):e},c.padding=function(e){return arguments.length?c.paddingInner(e).paddingOuter(e):c.paddingInner()},c.paddingInner=function(e){return arguments.length?(o="function"==typeof e?e:jp(+e),c):o},c.paddingOuter=function(e){return arguments.length?c.paddingTop(e).paddingRight(e).paddingBottom(e).paddingLeft(e):c.paddingTop()},c.paddingTop=function(e){return arguments.length?(a="function"==typeof e?e:jp(+e),c):a},c.paddingRight=function(e){return arguments.length?(s="function"==typeof e?e:jp(+e),c):s},c.paddingBottom=function(e){return arguments.length?(l="function"==typeof e?e:jp(+e),c):l},c.paddingLeft=function(e){return arguments.length?(u="function"==typeof e?e:jp(+e),c):u},c},um=function(e,t,n,r,i){var o,a,s=e.children,l=s.length,u=new Array(l+1);for(u[0]=a=o=0;o<l;++o)u[o+1]=a+=s[o].value;!function e(t,n,r,i,o,a,l){if(t>=n-1){var c=s[t];return c.x0=i,c.y0=o,c.x1=a,void(c.y1=l)}var d=u[t],h=r/2+d,f=t+1,p=n-1;for(;f<p;){var m=f+p>>>1;u[m]<h?f=m+1:p=m}h-u[f-1]<u[f]-h&&t+1<f&&--f;var g=u[f]-d,y=r-g;if(a-i>l-o){var v=(i*y+a*g)/r;e(t,f,g,i,o,v,l),e(f,n,y,v,o,a,l)}else{var _=(o*y+l*g)/r;e(t,f,g,i,o,a,_),e(f,n,y,i,_,a,l)}}(0,l,e.value,t,n,r,i)},cm=function(e,t,n,r,i){(1&e.depth?im:Wp)(e,t,n,r,i)},dm=function e(t){function n(e,n,r,i,o){if((a=e._squarify)&&a.ratio===t)for(var a,s,l,u,c,d=-1,h=a.length,f=e.value;++d<h;){for(l=(s=a[d]).children,u=s.value=0,c=l.length;u<c;++u)s.value+=l[u].value;s.dice?Wp(s,n,r,i,r+=(o-r)*s.value/f):im(s,n,r,n+=(i-n)*s.value/f,o),f-=s.value}else e._squarify=a=am(t,e,n,r,i,o),a.ratio=t}return n.ratio=function(t){return e((t=+t)>1?t:1)},n}(om),hm=function(e){for(var t,n=-1,r=e.length,i=e[r-1],o=0;++n<r;)t=i,i=e[n],o+=t[1]*i[0]-t[0]*i[1];return o/2},fm=function(e){for(var t,n,r=-1,i=e.length,o=0,a=0,s=e[i-1],l=0;++r<i;)t=s,s=e[r],l+=n=t[0]*s[1]-s[0]*t[1],o+=(t[0]+s[0])*n,a+=(t[1]+s[1])*n;return[o/(l*=3),a/l]},pm=function(e,t,n){return(t[0]-e[0])*(n[1]-e[1])-(t[1]-e[1])*(n[0]-e[0])};function mm(e,t){return e[0]-t[0]||e[1]-t[1]}function gm(e){for(var t=e.length,n=[0,1],r=2,i=2;i<t;++i){for(;r>1&&pm(e[n[r-2]],e[n[r-1]],e[i])<=0;)--r;n[r++]=i}return n.slice(0,r)}var ym=function(e){if((n=e.length)<3)return null;var t,n,r=new Array(n),i=new Array(n);for(t=0;t<n;++t)r[t]=[+e[t][0],+e[t][1],t];for(r.sort(mm),t=0;t<n;++t)i[t]=[r[t][0],-r[t][1]];var o=gm(r),a=gm(i),s=a[0]===o[0],l=a[a.length-1]===o[o.length-1],u=[];for(t=o.length-1;t>=0;--t)u.push(e[r[o[t]][2]]);for(t=+s;t<a.length-l;++t)u.push(e[r[a[t]][2]]);return u},vm=function(e,t){for(var n,r,i=e.length,o=e[i-1],a=t[0],s=t[1],l=o[0],u=o[1],c=!1,d=0;d<i;++d)n=(o=e[d])[0],(r=o[1])>s!=u>s&&a<(l-n)*(s-r)/(u-r)+n&&(c=!c),l=n,u=r;return c},_m=function(e){for(var t,n,r=-1,i=e.length,o=e[i-1],a=o[0],s=o[1],l=0;++r<i;)t=a,n=s,t-=a=(o=e[r])[0],n-=s=o[1],l+=Math.sqrt(t*t+n*n);return l},wm=function(){return Math.random()},bm=function e(t){function n(e,n){return e=null==e?0:+e,n=null==n?1:+n,1===arguments.length?(n=e,e=0):n-=e,function(){return t()*n+e}}return n.source=e,n}(wm),Mm=function e(t){function n(e,n){var r,i;return e=null==e?0:+e,n=null==n?1:+n,function(){var o;if(null!=r)o=r,r=null;else do{r=2*t()-1,o=2*t()-1,i=r*r+o*o}while(!i||i>1);return e+n*o*Math.sqrt(-2*Math.log(i)/i)}}return n.source=e,n}(wm),km=function e(t){function n(){var e=Mm.source(t).apply(this,arguments);return function(){return Math.exp(e())}}return n.source=e,n}(wm),Sm=function e(t){function n(e){return function(){for(var n=0,r=0;r<e;++r)n+=t();return n}}return n.source=e,n}(wm),Tm=function e(t){function n(e){var n=Sm.source(t)(e);return function(){return n()/e}}return n.source=e,n}(wm),Cm=function e(t){function n(e){return function(){return-Math.log(1-t())/e}}return n.source=e,n}(wm);function xm(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e)}return this}function Em(e,t){switch(arguments.length){case 0:break;case 1:this.interpolator(e);break;default:this.interpolator(t).domain(e)}return this}var Lm=Array.prototype,Om=Lm.map,Dm=Lm.slice,Rm={name:"implicit"};function Am(){var e=Za(),t=[],n=[],r=Rm;function i(i){var o=i+"",a=e.get(o);if(!a){if(r!==Rm)return r;e.set(o,a=t.push(i))}return n[(a-1)%n.length]}return i.domain=function(n){if(!arguments.length)return t.slice();t=[],e=Za();for(var r,o,a=-1,s=n.length;++a<s;)e.has(o=(r=n[a])+"")||e.set(o,t.push(r));return i},i.range=function(e){return arguments.length?(n=Dm.call(e),i):n.slice()},i.unknown=function(e){return arguments.length?(r=e,i):r},i.copy=function(){return Am(t,n).unknown(r)},xm.apply(i,arguments),i}function Nm(){var e,t,n=Am().unknown(void 0),r=n.domain,i=n.range,o=[0,1],a=!1,s=0,l=0,u=.5;function c(){var n=r().length,c=o[1]<o[0],d=o[c-0],h=o[1-c];e=(h-d)/Math.max(1,n-s+2*l),a&&(e=Math.floor(e)),d+=(h-d-e*(n-s))*u,t=e*(1-s),a&&(d=Math.round(d),t=Math.round(t));var f=C(n).map((function(t){return d+e*t}));return i(c?f.reverse():f)}return delete n.unknown,n.domain=function(e){return arguments.length?(r(e),c()):r()},n.range=function(e){return arguments.length?(o=[+e[0],+e[1]],c()):o.slice()},n.rangeRound=function(e){return o=[+e[0],+e[1]],a=!0,c()},n.bandwidth=function(){return t},n.step=function(){return e},n.round=function(e){return arguments.length?(a=!!e,c()):a},n.padding=function(e){return arguments.length?(s=Math.min(1,l=+e),c()):s},n.paddingInner=function(e){return arguments.length?(s=Math.min(1,e),c()):s},n.paddingOuter=function(e){return arguments.length?(l=+e,c()):l},n.align=function(e){return arguments.length?(u=Math.max(0,Math.min(1,e)),c()):u},n.copy=function(){return Nm(r(),o).round(a).paddingInner(s).paddingOuter(l).align(u)},xm.apply(c(),arguments)}function Ym(){return function e(t){var n=t.copy;return t.padding=t.paddingOuter,delete t.paddingInner,delete t.paddingOuter,t.copy=function(){return e(n())},t}(Nm.apply(null,arguments).paddingInner(1))}var jm=function(e){return function(){return e}},Hm=function(e){return+e},Pm=[0,1];function Im(e){return e}function Fm(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:jm(isNaN(t)?NaN:.5)}function Bm(e){var t,n=e[0],r=e[e.length-1];return n>r&&(t=n,n=r,r=t),function(e){return Math.max(n,Math.min(r,e))}}function zm(e,t,n){var r=e[0],i=e[1],o=t[0],a=t[1];return i<r?(r=Fm(i,r),o=n(a,o)):(r=Fm(r,i),o=n(o,a)),function(e){return o(r(e))}}function Wm(e,t,n){var r=Math.min(e.length,t.length)-1,i=new Array(r),o=new Array(r),a=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++a<r;)i[a]=Fm(e[a],e[a+1]),o[a]=n(t[a],t[a+1]);return function(t){var n=h(e,t,1,r)-1;return o[n](i[n](t))}}function Um(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function Vm(){var e,t,n,r,i,o,a=Pm,s=Pm,l=er,u=Im;function c(){return r=Math.min(a.length,s.length)>2?Wm:zm,i=o=null,d}function d(t){return isNaN(t=+t)?n:(i||(i=r(a.map(e),s,l)))(e(u(t)))}return d.invert=function(n){return u(t((o||(o=r(s,a.map(e),Vn)))(n)))},d.domain=function(e){return arguments.length?(a=Om.call(e,Hm),u===Im||(u=Bm(a)),c()):a.slice()},d.range=function(e){return arguments.length?(s=Dm.call(e),c()):s.slice()},d.rangeRound=function(e){return s=Dm.call(e),l=rr,c()},d.clamp=function(e){return arguments.length?(u=e?Bm(a):Im,d):u!==Im},d.interpolate=function(e){return arguments.length?(l=e,c()):l},d.unknown=function(e){return arguments.length?(n=e,d):n},function(n,r){return e=n,t=r,c()}}function qm(e,t){return Vm()(e,t)}var Gm=function(e,t,n,r){var i,o=R(e,t,n);switch((r=zl(null==r?",f":r)).type){case"s":var a=Math.max(Math.abs(e),Math.abs(t));return null!=r.precision||isNaN(i=ru(o,a))||(r.precision=i),Gl(r,a);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(i=iu(o,Math.max(Math.abs(e),Math.abs(t))))||(r.precision=i-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(i=nu(o))||(r.precision=i-2*("%"===r.type))}return ql(r)};function Xm(e){var t=e.domain;return e.ticks=function(e){var n=t();return O(n[0],n[n.length-1],null==e?10:e)},e.tickFormat=function(e,n){var r=t();return Gm(r[0],r[r.length-1],null==e?10:e,n)},e.nice=function(n){null==n&&(n=10);var r,i=t(),o=0,a=i.length-1,s=i[o],l=i[a];return l<s&&(r=s,s=l,l=r,r=o,o=a,a=r),(r=D(s,l,n))>0?r=D(s=Math.floor(s/r)*r,l=Math.ceil(l/r)*r,n):r<0&&(r=D(s=Math.ceil(s*r)/r,l=Math.floor(l*r)/r,n)),r>0?(i[o]=Math.floor(s/r)*r,i[a]=Math.ceil(l/r)*r,t(i)):r<0&&(i[o]=Math.ceil(s*r)/r,i[a]=Math.floor(l*r)/r,t(i)),e},e}function Km(){var e=qm(Im,Im);return e.copy=function(){return Um(e,Km())},xm.apply(e,arguments),Xm(e)}function Jm(e){var t;function n(e){return isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Om.call(t,Hm),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return Jm(e).unknown(t)},e=arguments.length?Om.call(e,Hm):[0,1],Xm(n)}var $m=function(e,t){var n,r=0,i=(e=e.slice()).length-1,o=e[r],a=e[i];return a<o&&(n=r,r=i,i=n,n=o,o=a,a=n),e[r]=t.floor(o),e[i]=t.ceil(a),e};function Zm(e){return Math.log(e)}function Qm(e){return Math.exp(e)}function eg(e){return-Math.log(-e)}function tg(e){return-Math.exp(-e)}function ng(e){return isFinite(e)?+("1e"+e):e<0?0:e}function rg(e){return function(t){return-e(-t)}}function ig(e){var t,n,r=e(Zm,Qm),i=r.domain,o=10;function a(){return t=function(e){return e===Math.E?Math.log:10===e&&Math.log10||2===e&&Math.log2||(e=Math.log(e),function(t){return Math.log(t)/e})}(o),n=function(e){return 10===e?ng:e===Math.E?Math.exp:function(t){return Math.pow(e,t)}}(o),i()[0]<0?(t=rg(t),n=rg(n),e(eg,tg)):e(Zm,Qm),r}return r.base=function(e){return arguments.length?(o=+e,a()):o},r.domain=function(e){return arguments.length?(i(e),a()):i()},r.ticks=function(e){var r,a=i(),s=a[0],l=a[a.length-1];(r=l<s)&&(h=s,s=l,l=h);var u,c,d,h=t(s),f=t(l),p=null==e?10:+e,m=[];if(!(o%1)&&f-h<p){if(h=Math.round(h)-1,f=Math.round(f)+1,s>0){for(;h<f;++h)for(c=1,u=n(h);c<o;++c)if(!((d=u*c)<s)){if(d>l)break;m.push(d)}}else for(;h<f;++h)for(c=o-1,u=n(h);c>=1;--c)if(!((d=u*c)<s)){if(d>l)break;m.push(d)}}else m=O(h,f,Math.min(f-h,p)).map(n);return r?m.reverse():m},r.tickFormat=function(e,i){if(null==i&&(i=10===o?".0e":","),"function"!=typeof i&&(i=ql(i)),e===1/0)return i;null==e&&(e=10);var a=Math.max(1,o*e/r.ticks().length);return function(e){var r=e/n(Math.round(t(e)));return r*o<o-.5&&(r*=o),r<=a?i(e):""}},r.nice=function(){return i($m(i(),{floor:function(e){return n(Math.floor(t(e)))},ceil:function(e){return n(Math.ceil(t(e)))}}))},r}function og(){var e=ig(Vm()).domain([1,10]);return e.copy=function(){return Um(e,og()).base(e.base())},xm.apply(e,arguments),e}function ag(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function sg(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function lg(e){var t=1,n=e(ag(t),sg(t));return n.constant=function(n){return arguments.length?e(ag(t=+n),sg(t)):t},Xm(n)}function ug(){var e=lg(Vm());return e.copy=function(){return Um(e,ug()).constant(e.constant())},xm.apply(e,arguments)}function cg(e){return function(t){return t<0?-Math.pow(-t,e):Math.pow(t,e)}}function dg(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function hg(e){return e<0?-e*e:e*e}function fg(e){var t=e(Im,Im),n=1;function r(){return 1===n?e(Im,Im):.5===n?e(dg,hg):e(cg(n),cg(1/n))}return t.exponent=function(e){return arguments.length?(n=+e,r()):n},Xm(t)}function pg(){var e=fg(Vm());return e.copy=function(){return Um(e,pg()).exponent(e.exponent())},xm.apply(e,arguments),e}function mg(){return pg.apply(null,arguments).exponent(.5)}function gg(){var e,t=[],n=[],r=[];function i(){var e=0,i=Math.max(1,n.length);for(r=new Array(i-1);++e<i;)r[e-1]=Y(t,e/i);return o}function o(t){return isNaN(t=+t)?e:n[h(r,t)]}return o.invertExtent=function(e){var i=n.indexOf(e);return i<0?[NaN,NaN]:[i>0?r[i-1]:t[0],i<r.length?r[i]:t[t.length-1]]},o.domain=function(e){if(!arguments.length)return t.slice();t=[];for(var n,r=0,o=e.length;r<o;++r)null==(n=e[r])||isNaN(n=+n)||t.push(n);return t.sort(s),i()},o.range=function(e){return arguments.length?(n=Dm.call(e),i()):n.slice()},o.unknown=function(t){return arguments.length?(e=t,o):e},o.quantiles=function(){return r.slice()},o.copy=function(){return gg().domain(t).range(n).unknown(e)},xm.apply(o,arguments)}function yg(){var e,t=0,n=1,r=1,i=[.5],o=[0,1];function a(t){return t<=t?o[h(i,t,0,r)]:e}function s(){var e=-1;for(i=new Array(r);++e<r;)i[e]=((e+1)*n-(e-r)*t)/(r+1);return a}return a.domain=function(e){return arguments.length?(t=+e[0],n=+e[1],s()):[t,n]},a.range=function(e){return arguments.length?(r=(o=Dm.call(e)).length-1,s()):o.slice()},a.invertExtent=function(e){var a=o.indexOf(e);return a<0?[NaN,NaN]:a<1?[t,i[0]]:a>=r?[i[r-1],n]:[i[a-1],i[a]]},a.unknown=function(t){return arguments.length?(e=t,a):a},a.thresholds=function(){return i.slice()},a.copy=function(){return yg().domain([t,n]).range(o).unknown(e)},xm.apply(Xm(a),arguments)}function vg(){var e,t=[.5],n=[0,1],r=1;function i(i){return i<=i?n[h(t,i,0,r)]:e}return i.domain=function(e){return arguments.length?(t=Dm.call(e),r=Math.min(t.length,n.length-1),i):t.slice()},i.range=function(e){return arguments.length?(n=Dm.call(e),r=Math.min(t.length,n.length-1),i):n.slice()},i.invertExtent=function(e){var r=n.indexOf(e);return[t[r-1],t[r]]},i.unknown=function(t){return arguments.length?(e=t,i):e},i.copy=function(){return vg().domain(t).range(n).unknown(e)},xm.apply(i,arguments)}var _g=new Date,wg=new Date;function bg(e,t,n,r){function i(t){return e(t=0===arguments.length?new Date:new Date(+t)),t}return i.floor=function(t){return e(t=new Date(+t)),t},i.ceil=function(n){return e(n=new Date(n-1)),t(n,1),e(n),n},i.round=function(e){var t=i(e),n=i.ceil(e);return e-t<n-e?t:n},i.offset=function(e,n){return t(e=new Date(+e),null==n?1:Math.floor(n)),e},i.range=function(n,r,o){var a,s=[];if(n=i.ceil(n),o=null==o?1:Math.floor(o),!(n<r&&o>0))return s;do{s.push(a=new Date(+n)),t(n,o),e(n)}while(a<n&&n<r);return s},i.filter=function(n){return bg((function(t){if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)}),(function(e,r){if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););}))},n&&(i.count=function(t,r){return _g.setTime(+t),wg.setTime(+r),e(_g),e(wg),Math.floor(n(_g,wg))},i.every=function(e){return e=Math.floor(e),isFinite(e)&&e>0?e>1?i.filter(r?function(t){return r(t)%e==0}:function(t){return i.count(0,t)%e==0}):i:null}),i}var Mg=bg((function(e){e.setMonth(0,1),e.setHours(0,0,0,0)}),(function(e,t){e.setFullYear(e.getFullYear()+t)}),(function(e,t){return t.getFullYear()-e.getFullYear()}),(function(e){return e.getFullYear()}));Mg.every=function(e){return isFinite(e=Math.floor(e))&&e>0?bg((function(t){t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)}),(function(t,n){t.setFullYear(t.getFullYear()+n*e)})):null};var kg=Mg,Sg=Mg.range,Tg=bg((function(e){e.setDate(1),e.setHours(0,0,0,0)}),(function(e,t){e.setMonth(e.getMonth()+t)}),(function(e,t){return t.getMonth()-e.getMonth()+12*(t.getFullYear()-e.getFullYear())}),(function(e){return e.getMonth()})),Cg=Tg,xg=Tg.range,Eg=6e4,Lg=6048e5;function Og(e){return bg((function(t){t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)}),(function(e,t){e.setDate(e.getDate()+7*t)}),(function(e,t){return(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Eg)/Lg}))}var Dg=Og(0),Rg=Og(1),Ag=Og(2),Ng=Og(3),Yg=Og(4),jg=Og(5),Hg=Og(6),Pg=Dg.range,Ig=Rg.range,Fg=Ag.range,Bg=Ng.range,zg=Yg.range,Wg=jg.range,Ug=Hg.range,Vg=bg((function(e){e.setHours(0,0,0,0)}),(function(e,t){e.setDate(e.getDate()+t)}),(function(e,t){return(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Eg)/864e5}),(function(e){return e.getDate()-1})),qg=Vg,Gg=Vg.range,Xg=bg((function(e){e.setTime(e-e.getMilliseconds()-1e3*e.getSeconds()-e.getMinutes()*Eg)}),(function(e,t){e.setTime(+e+36e5*t)}),(function(e,t){return(t-e)/36e5}),(function(e){return e.getHours()})),Kg=Xg,Jg=Xg.range,$g=bg((function(e){e.setTime(e-e.getMilliseconds()-1e3*e.getSeconds())}),(function(e,t){e.setTime(+e+t*Eg)}),(function(e,t){return(t-e)/Eg}),(function(e){return e.getMinutes()})),Zg=$g,Qg=$g.range,ey=bg((function(e){e.setTime(e-e.getMilliseconds())}),(function(e,t){e.setTime(+e+1e3*t)}),(function(e,t){return(t-e)/1e3}),(function(e){return e.getUTCSeconds()})),ty=ey,ny=ey.range,ry=bg((function(){}),(function(e,t){e.setTime(+e+t)}),(function(e,t){return t-e}));ry.every=function(e){return e=Math.floor(e),isFinite(e)&&e>0?e>1?bg((function(t){t.setTime(Math.floor(t/e)*e)}),(function(t,n){t.setTime(+t+n*e)}),(function(t,n){return(n-t)/e})):ry:null};var iy=ry,oy=ry.range;function ay(e){return bg((function(t){t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCDate(e.getUTCDate()+7*t)}),(function(e,t){return(t-e)/Lg}))}var sy=ay(0),ly=ay(1),uy=ay(2),cy=ay(3),dy=ay(4),hy=ay(5),fy=ay(6),py=sy.range,my=ly.range,gy=uy.range,yy=cy.range,vy=dy.range,_y=hy.range,wy=fy.range,by=bg((function(e){e.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCDate(e.getUTCDate()+t)}),(function(e,t){return(t-e)/864e5}),(function(e){return e.getUTCDate()-1})),My=by,ky=by.range,Sy=bg((function(e){e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCFullYear(e.getUTCFullYear()+t)}),(function(e,t){return t.getUTCFullYear()-e.getUTCFullYear()}),(function(e){return e.getUTCFullYear()}));Sy.every=function(e){return isFinite(e=Math.floor(e))&&e>0?bg((function(t){t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)}),(function(t,n){t.setUTCFullYear(t.getUTCFullYear()+n*e)})):null};var Ty=Sy,Cy=Sy.range;function xy(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Ey(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function Ly(e){return{y:e,m:0,d:1,H:0,M:0,S:0,L:0}}function Oy(e){var t=e.dateTime,n=e.date,r=e.time,i=e.periods,o=e.days,a=e.shortDays,s=e.months,l=e.shortMonths,u=zy(i),c=Wy(i),d=zy(o),h=Wy(o),f=zy(a),p=Wy(a),m=zy(s),g=Wy(s),y=zy(l),v=Wy(l),_={a:function(e){return a[e.getDay()]},A:function(e){return o[e.getDay()]},b:function(e){return l[e.getMonth()]},B:function(e){return s[e.getMonth()]},c:null,d:uv,e:uv,f:pv,H:cv,I:dv,j:hv,L:fv,m:mv,M:gv,p:function(e){return i[+(e.getHours()>=12)]},Q:Uv,s:Vv,S:yv,u:vv,U:_v,V:wv,w:bv,W:Mv,x:null,X:null,y:kv,Y:Sv,Z:Tv,"%":Wv},w={a:function(e){return a[e.getUTCDay()]},A:function(e){return o[e.getUTCDay()]},b:function(e){return l[e.getUTCMonth()]},B:function(e){return s[e.getUTCMonth()]},c:null,d:Cv,e:Cv,f:Dv,H:xv,I:Ev,j:Lv,L:Ov,m:Rv,M:Av,p:function(e){return i[+(e.getUTCHours()>=12)]},Q:Uv,s:Vv,S:Nv,u:Yv,U:jv,V:Hv,w:Pv,W:Iv,x:null,X:null,y:Fv,Y:Bv,Z:zv,"%":Wv},b={a:function(e,t,n){var r=f.exec(t.slice(n));return r?(e.w=p[r[0].toLowerCase()],n+r[0].length):-1},A:function(e,t,n){var r=d.exec(t.slice(n));return r?(e.w=h[r[0].toLowerCase()],n+r[0].length):-1},b:function(e,t,n){var r=y.exec(t.slice(n));return r?(e.m=v[r[0].toLowerCase()],n+r[0].length):-1},B:function(e,t,n){var r=m.exec(t.slice(n));return r?(e.m=g[r[0].toLowerCase()],n+r[0].length):-1},c:function(e,n,r){return S(e,t,n,r)},d:Qy,e:Qy,f:ov,H:tv,I:tv,j:ev,L:iv,m:Zy,M:nv,p:function(e,t,n){var r=u.exec(t.slice(n));return r?(e.p=c[r[0].toLowerCase()],n+r[0].length):-1},Q:sv,s:lv,S:rv,u:Vy,U:qy,V:Gy,w:Uy,W:Xy,x:function(e,t,r){return S(e,n,t,r)},X:function(e,t,n){return S(e,r,t,n)},y:Jy,Y:Ky,Z:$y,"%":av};function M(e,t){return function(n){var r,i,o,a=[],s=-1,l=0,u=e.length;for(n instanceof Date||(n=new Date(+n));++s<u;)37===e.charCodeAt(s)&&(a.push(e.slice(l,s)),null!=(i=jy[r=e.charAt(++s)])?r=e.charAt(++s):i="e"===r?" ":"0",(o=t[r])&&(r=o(n,i)),a.push(r),l=s+1);return a.push(e.slice(l,s)),a.join("")}}function k(e,t){return function(n){var r,i,o=Ly(1900);if(S(o,e,n+="",0)!=n.length)return null;if("Q"in o)return new Date(o.Q);if("p"in o&&(o.H=o.H%12+12*o.p),"V"in o){if(o.V<1||o.V>53)return null;"w"in o||(o.w=1),"Z"in o?(i=(r=Ey(Ly(o.y))).getUTCDay(),r=i>4||0===i?ly.ceil(r):ly(r),r=My.offset(r,7*(o.V-1)),o.y=r.getUTCFullYear(),o.m=r.getUTCMonth(),o.d=r.getUTCDate()+(o.w+6)%7):(i=(r=t(Ly(o.y))).getDay(),r=i>4||0===i?Rg.ceil(r):Rg(r),r=qg.offset(r,7*(o.V-1)),o.y=r.getFullYear(),o.m=r.getMonth(),o.d=r.getDate()+(o.w+6)%7)}else("W"in o||"U"in o)&&("w"in o||(o.w="u"in o?o.u%7:"W"in o?1:0),i="Z"in o?Ey(Ly(o.y)).getUTCDay():t(Ly(o.y)).getDay(),o.m=0,o.d="W"in o?(o.w+6)%7+7*o.W-(i+5)%7:o.w+7*o.U-(i+6)%7);return"Z"in o?(o.H+=o.Z/100|0,o.M+=o.Z%100,Ey(o)):t(o)}}function S(e,t,n,r){for(var i,o,a=0,s=t.length,l=n.length;a<s;){if(r>=l)return-1;if(37===(i=t.charCodeAt(a++))){if(i=t.charAt(a++),!(o=b[i in jy?t.charAt(a++):i])||(r=o(e,n,r))<0)return-1}else if(i!=n.charCodeAt(r++))return-1}return r}return(_.x=M(n,_),_.X=M(r,_),_.c=M(t,_),w.x=M(n,w),w.X=M(r,w),w.c=M(t,w),{format:function(e){var t=M(e+="",_);return t.toString=function(){return e},t},parse:function(e){var t=k(e+="",xy);return t.toString=function(){return e},t},utcFormat:function(e){var t=M(e+="",w);return t.toString=function(){return e},t},utcParse:function(e){var t=k(e,Ey);return t.toString=function(){return e},t}})}var Dy,Ry,Ay,Ny,Yy,jy={"-":"",_:" ",0:"0"},Hy=/^\s*\d+/,Py=/^%/,Iy=/[\\^$*+?|[\]().{}]/g;function Fy(e,t,n){var r=e<0?"-":"",i=(r?-e:e)+"",o=i.length;return r+(o<n?new Array(n-o+1).join(t)+i:i)}function By(e){return e.replace(Iy,"\\$&")}function zy(e){return new RegExp("^(?:"+e.map(By).join("|")+")","i")}function Wy(e){for(var t={},n=-1,r=e.length;++n<r;)t[e[n].toLowerCase()]=n;return t}function Uy(e,t,n){var r=Hy.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function Vy(e,t,n){var r=Hy.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function qy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function Gy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function Xy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function Ky(e,t,n){var r=Hy.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function Jy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function $y(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||"00")),n+r[0].length):-1}function Zy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function Qy(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function ev(e,t,n){var r=Hy.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function tv(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function nv(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function rv(e,t,n){var r=Hy.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function iv(e,t,n){var r=Hy.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function ov(e,t,n){var r=Hy.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function av(e,t,n){var r=Py.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function sv(e,t,n){var r=Hy.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function lv(e,t,n){var r=Hy.exec(t.slice(n));return r?(e.Q=1e3*+r[0],n+r[0].length):-1}function uv(e,t){return Fy(e.getDate(),t,2)}function cv(e,t){return Fy(e.getHours(),t,2)}function dv(e,t){return Fy(e.getHours()%12||12,t,2)}function hv(e,t){return Fy(1+qg.count(kg(e),e),t,3)}function fv(e,t){return Fy(e.getMilliseconds(),t,3)}function pv(e,t){return fv(e,t)+"000"}function mv(e,t){return Fy(e.getMonth()+1,t,2)}function gv(e,t){return Fy(e.getMinutes(),t,2)}function yv(e,t){return Fy(e.getSeconds(),t,2)}function vv(e){var t=e.getDay();return 0===t?7:t}function _v(e,t){return Fy(Dg.count(kg(e),e),t,2)}function wv(e,t){var n=e.getDay();return e=n>=4||0===n?Yg(e):Yg.ceil(e),Fy(Yg.count(kg(e),e)+(4===kg(e).getDay()),t,2)}function bv(e){return e.getDay()}function Mv(e,t){return Fy(Rg.count(kg(e),e),t,2)}function kv(e,t){return Fy(e.getFullYear()%100,t,2)}function Sv(e,t){return Fy(e.getFullYear()%1e4,t,4)}function Tv(e){var t=e.getTimezoneOffset();return(t>0?"-":(t*=-1,"+"))+Fy(t/60|0,"0",2)+Fy(t%60,"0",2)}function Cv(e,t){return Fy(e.getUTCDate(),t,2)}function xv(e,t){return Fy(e.getUTCHours(),t,2)}function Ev(e,t){return Fy(e.getUTCHours()%12||12,t,2)}function Lv(e,t){return Fy(1+My.count(Ty(e),e),t,3)}function Ov(e,t){return Fy(e.getUTCMilliseconds(),t,3)}function Dv(e,t){return Ov(e,t)+"000"}function Rv(e,t){return Fy(e.getUTCMonth()+1,t,2)}function Av(e,t){return Fy(e.getUTCMinutes(),t,2)}function Nv(e,t){return Fy(e.getUTCSeconds(),t,2)}function Yv(e){var t=e.getUTCDay();return 0===t?7:t}function jv(e,t){return Fy(sy.count(Ty(e),e),t,2)}function Hv(e,t){var n=e.getUTCDay();return e=n>=4||0===n?dy(e):dy.ceil(e),Fy(dy.count(Ty(e),e)+(4===Ty(e).getUTCDay()),t,2)}function Pv(e){return e.getUTCDay()}function Iv(e,t){return Fy(ly.count(Ty(e),e),t,2)}function Fv(e,t){return Fy(e.getUTCFullYear()%100,t,2)}function Bv(e,t){return Fy(e.getUTCFullYear()%1e4,t,4)}function zv(){return"+0000"}function Wv(){return"%"}function Uv(e){return+e}function Vv(e){return Math.floor(+e/1e3)}function qv(e){return Dy=Oy(e),Ry=Dy.format,Ay=Dy.parse,Ny=Dy.utcFormat,Yy=Dy.utcParse,Dy}qv({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});var Gv=Date.prototype.toISOString?function(e){return e.toISOString()}:Ny("%Y-%m-%dT%H:%M:%S.%LZ");var Xv=+new Date("2000-01-01T00:00:00.000Z")?function(e){var t=new Date(e);return isNaN(t)?null:t}:Yy("%Y-%m-%dT%H:%M:%S.%LZ"),Kv=1e3,Jv=60*Kv,$v=60*Jv,Zv=24*$v,Qv=7*Zv,e_=30*Zv,t_=365*Zv;function n_(e){return new Date(e)}function r_(e){return e instanceof Date?+e:+new Date(+e)}function i_(e,t,n,r,i,o,a,s,u){var c=qm(Im,Im),d=c.invert,h=c.domain,f=u(".%L"),p=u(":%S"),m=u("%I:%M"),g=u("%I %p"),y=u("%a %d"),v=u("%b %d"),_=u("%B"),w=u("%Y"),b=[[a,1,Kv],[a,5,5*Kv],[a,15,15*Kv],[a,30,30*Kv],[o,1,Jv],[o,5,5*Jv],[o,15,15*Jv],[o,30,30*Jv],[i,1,$v],[i,3,3*$v],[i,6,6*$v],[i,12,12*$v],[r,1,Zv],[r,2,2*Zv],[n,1,Qv],[t,1,e_],[t,3,3*e_],[e,1,t_]];function M(s){return(a(s)<s?f:o(s)<s?p:i(s)<s?m:r(s)<s?g:t(s)<s?n(s)<s?y:v:e(s)<s?_:w)(s)}function k(t,n,r,i){if(null==t&&(t=10),"number"==typeof t){var o=Math.abs(r-n)/t,a=l((function(e){return e[2]})).right(b,o);a===b.length?(i=R(n/t_,r/t_,t),t=e):a?(i=(a=b[o/b[a-1][2]<b[a][2]/o?a-1:a])[1],t=a[0]):(i=Math.max(R(n,r,t),1),t=s)}return null==i?t:t.every(i)}return c.invert=function(e){return new Date(d(e))},c.domain=function(e){return arguments.length?h(Om.call(e,r_)):h().map(n_)},c.ticks=function(e,t){var n,r=h(),i=r[0],o=r[r.length-1],a=o<i;return a&&(n=i,i=o,o=n),n=(n=k(e,i,o,t))?n.range(i,o+1):[],a?n.reverse():n},c.tickFormat=function(e,t){return null==t?M:u(t)},c.nice=function(e,t){var n=h();return(e=k(e,n[0],n[n.length-1],t))?h($m(n,e)):c},c.copy=function(){return Um(c,i_(e,t,n,r,i,o,a,s,u))},c}var o_=function(){return xm.apply(i_(kg,Cg,Dg,qg,Kg,Zg,ty,iy,Ry).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)},a_=bg((function(e){e.setUTCDate(1),e.setUTCHours(0,0,0,0)}),(function(e,t){e.setUTCMonth(e.getUTCMonth()+t)}),(function(e,t){return t.getUTCMonth()-e.getUTCMonth()+12*(t.getUTCFullYear()-e.getUTCFullYear())}),(function(e){return e.getUTCMonth()})),s_=a_,l_=a_.range,u_=bg((function(e){e.setUTCMinutes(0,0,0)}),(function(e,t){e.setTime(+e+36e5*t)}),(function(e,t){return(t-e)/36e5}),(function(e){return e.getUTCHours()})),c_=u_,d_=u_.range,h_=bg((function(e){e.setUTCSeconds(0,0)}),(function(e,t){e.setTime(+e+t*Eg)}),(function(e,t){return(t-e)/Eg}),(function(e){return e.getUTCMinutes()})),f_=h_,p_=h_.range,m_=function(){return xm.apply(i_(Ty,s_,sy,My,c_,f_,ty,iy,Ny).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)};function g_(){var e,t,n,r,i,o=0,a=1,s=Im,l=!1;function u(t){return isNaN(t=+t)?i:s(0===n?.5:(t=(r(t)-e)*n,l?Math.max(0,Math.min(1,t)):t))}return u.domain=function(i){return arguments.length?(e=r(o=+i[0]),t=r(a=+i[1]),n=e===t?0:1/(t-e),u):[o,a]},u.clamp=function(e){return arguments.length?(l=!!e,u):l},u.interpolator=function(e){return arguments.length?(s=e,u):s},u.unknown=function(e){return arguments.length?(i=e,u):i},function(i){return r=i,e=i(o),t=i(a),n=e===t?0:1/(t-e),u}}function y_(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function v_(){var e=Xm(g_()(Im));return e.copy=function(){return y_(e,v_())},Em.apply(e,arguments)}function __(){var e=ig(g_()).domain([1,10]);return e.copy=function(){return y_(e,__()).base(e.base())},Em.apply(e,arguments)}function w_(){var e=lg(g_());return e.copy=function(){return y_(e,w_()).constant(e.constant())},Em.apply(e,arguments)}function b_(){var e=fg(g_());return e.copy=function(){return y_(e,b_()).exponent(e.exponent())},Em.apply(e,arguments)}function M_(){return b_.apply(null,arguments).exponent(.5)}function k_(){var e=[],t=Im;function n(n){if(!isNaN(n=+n))return t((h(e,n)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(var r,i=0,o=t.length;i<o;++i)null==(r=t[i])||isNaN(r=+r)||e.push(r);return e.sort(s),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return k_(t).domain(e)},Em.apply(n,arguments)}function S_(){var e,t,n,r,i,o,a,s=0,l=.5,u=1,c=Im,d=!1;function h(e){return isNaN(e=+e)?a:(e=.5+((e=+o(e))-t)*(e<t?r:i),c(d?Math.max(0,Math.min(1,e)):e))}return h.domain=function(a){return arguments.length?(e=o(s=+a[0]),t=o(l=+a[1]),n=o(u=+a[2]),r=e===t?0:.5/(t-e),i=t===n?0:.5/(n-t),h):[s,l,u]},h.clamp=function(e){return arguments.length?(d=!!e,h):d},h.interpolator=function(e){return arguments.length?(c=e,h):c},h.unknown=function(e){return arguments.length?(a=e,h):a},function(a){return o=a,e=a(s),t=a(l),n=a(u),r=e===t?0:.5/(t-e),i=t===n?0:.5/(n-t),h}}function T_(){var e=Xm(S_()(Im));return e.copy=function(){return y_(e,T_())},Em.apply(e,arguments)}function C_(){var e=ig(S_()).domain([.1,1,10]);return e.copy=function(){return y_(e,C_()).base(e.base())},Em.apply(e,arguments)}function x_(){var e=lg(S_());return e.copy=function(){return y_(e,x_()).constant(e.constant())},Em.apply(e,arguments)}function E_(){var e=fg(S_());return e.copy=function(){return y_(e,E_()).exponent(e.exponent())},Em.apply(e,arguments)}function L_(){return E_.apply(null,arguments).exponent(.5)}var O_=function(e){for(var t=e.length/6|0,n=new Array(t),r=0;r<t;)n[r]="#"+e.slice(6*r,6*++r);return n},D_=O_("1f77b4ff7f0e2ca02cd627289467bd8c564be377c27f7f7fbcbd2217becf"),R_=O_("7fc97fbeaed4fdc086ffff99386cb0f0027fbf5b17666666"),A_=O_("1b9e77d95f027570b3e7298a66a61ee6ab02a6761d666666"),N_=O_("a6cee31f78b4b2df8a33a02cfb9a99e31a1cfdbf6fff7f00cab2d66a3d9affff99b15928"),Y_=O_("fbb4aeb3cde3ccebc5decbe4fed9a6ffffcce5d8bdfddaecf2f2f2"),j_=O_("b3e2cdfdcdaccbd5e8f4cae4e6f5c9fff2aef1e2cccccccc"),H_=O_("e41a1c377eb84daf4a984ea3ff7f00ffff33a65628f781bf999999"),P_=O_("66c2a5fc8d628da0cbe78ac3a6d854ffd92fe5c494b3b3b3"),I_=O_("8dd3c7ffffb3bebadafb807280b1d3fdb462b3de69fccde5d9d9d9bc80bdccebc5ffed6f"),F_=O_("4e79a7f28e2ce1575976b7b259a14fedc949af7aa1ff9da79c755fbab0ab"),B_=function(e){return Bn(e[e.length-1])},z_=new Array(3).concat("d8b365f5f5f55ab4ac","a6611adfc27d80cdc1018571","a6611adfc27df5f5f580cdc1018571","8c510ad8b365f6e8c3c7eae55ab4ac01665e","8c510ad8b365f6e8c3f5f5f5c7eae55ab4ac01665e","8c510abf812ddfc27df6e8c3c7eae580cdc135978f01665e","8c510abf812ddfc27df6e8c3f5f5f5c7eae580cdc135978f01665e","5430058c510abf812ddfc27df6e8c3c7eae580cdc135978f01665e003c30","5430058c510abf812ddfc27df6e8c3f5f5f5c7eae580cdc135978f01665e003c30").map(O_),W_=B_(z_),U_=new Array(3).concat("af8dc3f7f7f77fbf7b","7b3294c2a5cfa6dba0008837","7b3294c2a5cff7f7f7a6dba0008837","762a83af8dc3e7d4e8d9f0d37fbf7b1b7837","762a83af8dc3e7d4e8f7f7f7d9f0d37fbf7b1b7837","762a839970abc2a5cfe7d4e8d9f0d3a6dba05aae611b7837","762a839970abc2a5cfe7d4e8f7f7f7d9f0d3a6dba05aae611b7837","40004b762a839970abc2a5cfe7d4e8d9f0d3a6dba05aae611b783700441b","40004b762a839970abc2a5cfe7d4e8f7f7f7d9f0d3a6dba05aae611b783700441b").map(O_),V_=B_(U_),q_=new Array(3).concat("e9a3c9f7f7f7a1d76a","d01c8bf1b6dab8e1864dac26","d01c8bf1b6daf7f7f7b8e1864dac26","c51b7de9a3c9fde0efe6f5d0a1d76a4d9221","c51b7de9a3c9fde0eff7f7f7e6f5d0a1d76a4d9221","c51b7dde77aef1b6dafde0efe6f5d0b8e1867fbc414d9221","c51b7dde77aef1b6dafde0eff7f7f7e6f5d0b8e1867fbc414d9221","8e0152c51b7dde77aef1b6dafde0efe6f5d0b8e1867fbc414d9221276419","8e0152c51b7dde77aef1b6dafde0eff7f7f7e6f5d0b8e1867fbc414d9221276419").map(O_),G_=B_(q_),X_=new Array(3).concat("998ec3f7f7f7f1a340","5e3c99b2abd2fdb863e66101","5e3c99b2abd2f7f7f7fdb863e66101","542788998ec3d8daebfee0b6f1a340b35806","542788998ec3d8daebf7f7f7fee0b6f1a340b35806","5427888073acb2abd2d8daebfee0b6fdb863e08214b35806","5427888073acb2abd2d8daebf7f7f7fee0b6fdb863e08214b35806","2d004b5427888073acb2abd2d8daebfee0b6fdb863e08214b358067f3b08","2d004b5427888073acb2abd2d8daebf7f7f7fee0b6fdb863e08214b358067f3b08").map(O_),K_=B_(X_),J_=new Array(3).concat("ef8a62f7f7f767a9cf","ca0020f4a58292c5de0571b0","ca0020f4a582f7f7f792c5de0571b0","b2182bef8a62fddbc7d1e5f067a9cf2166ac","b2182bef8a62fddbc7f7f7f7d1e5f067a9cf2166ac","b2182bd6604df4a582fddbc7d1e5f092c5de4393c32166ac","b2182bd6604df4a582fddbc7f7f7f7d1e5f092c5de4393c32166ac","67001fb2182bd6604df4a582fddbc7d1e5f092c5de4393c32166ac053061","67001fb2182bd6604df4a582fddbc7f7f7f7d1e5f092c5de4393c32166ac053061").map(O_),$_=B_(J_),Z_=new Array(3).concat("ef8a62ffffff999999","ca0020f4a582bababa404040","ca0020f4a582ffffffbababa404040","b2182bef8a62fddbc7e0e0e09999994d4d4d","b2182bef8a62fddbc7ffffffe0e0e09999994d4d4d","b2182bd6604df4a582fddbc7e0e0e0bababa8787874d4d4d","b2182bd6604df4a582fddbc7ffffffe0e0e0bababa8787874d4d4d","67001fb2182bd6604df4a582fddbc7e0e0e0bababa8787874d4d4d1a1a1a","67001fb2182bd6604df4a582fddbc7ffffffe0e0e0bababa8787874d4d4d1a1a1a").map(O_),Q_=B_(Z_),ew=new Array(3).concat("fc8d59ffffbf91bfdb","d7191cfdae61abd9e92c7bb6","d7191cfdae61ffffbfabd9e92c7bb6","d73027fc8d59fee090e0f3f891bfdb4575b4","d73027fc8d59fee090ffffbfe0f3f891bfdb4575b4","d73027f46d43fdae61fee090e0f3f8abd9e974add14575b4","d73027f46d43fdae61fee090ffffbfe0f3f8abd9e974add14575b4","a50026d73027f46d43fdae61fee090e0f3f8abd9e974add14575b4313695","a50026d73027f46d43fdae61fee090ffffbfe0f3f8abd9e974add14575b4313695").map(O_),tw=B_(ew),nw=new Array(3).concat("fc8d59ffffbf91cf60","d7191cfdae61a6d96a1a9641","d7191cfdae61ffffbfa6d96a1a9641","d73027fc8d59fee08bd9ef8b91cf601a9850","d73027fc8d59fee08bffffbfd9ef8b91cf601a9850","d73027f46d43fdae61fee08bd9ef8ba6d96a66bd631a9850","d73027f46d43fdae61fee08bffffbfd9ef8ba6d96a66bd631a9850","a50026d73027f46d43fdae61fee08bd9ef8ba6d96a66bd631a9850006837","a50026d73027f46d43fdae61fee08bffffbfd9ef8ba6d96a66bd631a9850006837").map(O_),rw=B_(nw),iw=new Array(3).concat("fc8d59ffffbf99d594","d7191cfdae61abdda42b83ba","d7191cfdae61ffffbfabdda42b83ba","d53e4ffc8d59fee08be6f59899d5943288bd","d53e4ffc8d59fee08bffffbfe6f59899d5943288bd","d53e4ff46d43fdae61fee08be6f598abdda466c2a53288bd","d53e4ff46d43fdae61fee08bffffbfe6f598abdda466c2a53288bd","9e0142d53e4ff46d43fdae61fee08be6f598abdda466c2a53288bd5e4fa2","9e0142d53e4ff46d43fdae61fee08bffffbfe6f598abdda466c2a53288bd5e4fa2").map(O_),ow=B_(iw),aw=new Array(3).concat("e5f5f999d8c92ca25f","edf8fbb2e2e266c2a4238b45","edf8fbb2e2e266c2a42ca25f006d2c","edf8fbccece699d8c966c2a42ca25f006d2c","edf8fbccece699d8c966c2a441ae76238b45005824","f7fcfde5f5f9ccece699d8c966c2a441ae76238b45005824","f7fcfde5f5f9ccece699d8c966c2a441ae76238b45006d2c00441b").map(O_),sw=B_(aw),lw=new Array(3).concat("e0ecf49ebcda8856a7","edf8fbb3cde38c96c688419d","edf8fbb3cde38c96c68856a7810f7c","edf8fbbfd3e69ebcda8c96c68856a7810f7c","edf8fbbfd3e69ebcda8c96c68c6bb188419d6e016b","f7fcfde0ecf4bfd3e69ebcda8c96c68c6bb188419d6e016b","f7fcfde0ecf4bfd3e69ebcda8c96c68c6bb188419d810f7c4d004b").map(O_),uw=B_(lw),cw=new Array(3).concat("e0f3dba8ddb543a2ca","f0f9e8bae4bc7bccc42b8cbe","f0f9e8bae4bc7bccc443a2ca0868ac","f0f9e8ccebc5a8ddb57bccc443a2ca0868ac","f0f9e8ccebc5a8ddb57bccc44eb3d32b8cbe08589e","f7fcf0e0f3dbccebc5a8ddb57bccc44eb3d32b8cbe08589e","f7fcf0e0f3dbccebc5a8ddb57bccc44eb3d32b8cbe0868ac084081").map(O_),dw=B_(cw),hw=new Array(3).concat("fee8c8fdbb84e34a33","fef0d9fdcc8afc8d59d7301f","fef0d9fdcc8afc8d59e34a33b30000","fef0d9fdd49efdbb84fc8d59e34a33b30000","fef0d9fdd49efdbb84fc8d59ef6548d7301f990000","fff7ecfee8c8fdd49efdbb84fc8d59ef6548d7301f990000","fff7ecfee8c8fdd49efdbb84fc8d59ef6548d7301fb300007f0000").map(O_),fw=B_(hw),pw=new Array(3).concat("ece2f0a6bddb1c9099","f6eff7bdc9e167a9cf02818a","f6eff7bdc9e167a9cf1c9099016c59","f6eff7d0d1e6a6bddb67a9cf1c9099016c59","f6eff7d0d1e6a6bddb67a9cf3690c002818a016450","fff7fbece2f0d0d1e6a6bddb67a9cf3690c002818a016450","fff7fbece2f0d0d1e6a6bddb67a9cf3690c002818a016c59014636").map(O_),mw=B_(pw),gw=new Array(3).concat("ece7f2a6bddb2b8cbe","f1eef6bdc9e174a9cf0570b0","f1eef6bdc9e174a9cf2b8cbe045a8d","f1eef6d0d1e6a6bddb74a9cf2b8cbe045a8d","f1eef6d0d1e6a6bddb74a9cf3690c00570b0034e7b","fff7fbece7f2d0d1e6a6bddb74a9cf3690c00570b0034e7b","fff7fbece7f2d0d1e6a6bddb74a9cf3690c00570b0045a8d023858").map(O_),yw=B_(gw),vw=new Array(3).concat("e7e1efc994c7dd1c77","f1eef6d7b5d8df65b0ce1256","f1eef6d7b5d8df65b0dd1c77980043","f1eef6d4b9dac994c7df65b0dd1c77980043","f1eef6d4b9dac994c7df65b0e7298ace125691003f","f7f4f9e7e1efd4b9dac994c7df65b0e7298ace125691003f","f7f4f9e7e1efd4b9dac994c7df65b0e7298ace125698004367001f").map(O_),_w=B_(vw),ww=new Array(3).concat("fde0ddfa9fb5c51b8a","feebe2fbb4b9f768a1ae017e","feebe2fbb4b9f768a1c51b8a7a0177","feebe2fcc5c0fa9fb5f768a1c51b8a7a0177","feebe2fcc5c0fa9fb5f768a1dd3497ae017e7a0177","fff7f3fde0ddfcc5c0fa9fb5f768a1dd3497ae017e7a0177","fff7f3fde0ddfcc5c0fa9fb5f768a1dd3497ae017e7a017749006a").map(O_),bw=B_(ww),Mw=new Array(3).concat("edf8b17fcdbb2c7fb8","ffffcca1dab441b6c4225ea8","ffffcca1dab441b6c42c7fb8253494","ffffccc7e9b47fcdbb41b6c42c7fb8253494","ffffccc7e9b47fcdbb41b6c41d91c0225ea80c2c84","ffffd9edf8b1c7e9b47fcdbb41b6c41d91c0225ea80c2c84","ffffd9edf8b1c7e9b47fcdbb41b6c41d91c0225ea8253494081d58").map(O_),kw=B_(Mw),Sw=new Array(3).concat("f7fcb9addd8e31a354","ffffccc2e69978c679238443","ffffccc2e69978c67931a354006837","ffffccd9f0a3addd8e78c67931a354006837","ffffccd9f0a3addd8e78c67941ab5d238443005a32","ffffe5f7fcb9d9f0a3addd8e78c67941ab5d238443005a32","ffffe5f7fcb9d9f0a3addd8e78c67941ab5d238443006837004529").map(O_),Tw=B_(Sw),Cw=new Array(3).concat("fff7bcfec44fd95f0e","ffffd4fed98efe9929cc4c02","ffffd4fed98efe9929d95f0e993404","ffffd4fee391fec44ffe9929d95f0e993404","ffffd4fee391fec44ffe9929ec7014cc4c028c2d04","ffffe5fff7bcfee391fec44ffe9929ec7014cc4c028c2d04","ffffe5fff7bcfee391fec44ffe9929ec7014cc4c02993404662506").map(O_),xw=B_(Cw),Ew=new Array(3).concat("ffeda0feb24cf03b20","ffffb2fecc5cfd8d3ce31a1c","ffffb2fecc5cfd8d3cf03b20bd0026","ffffb2fed976feb24cfd8d3cf03b20bd0026","ffffb2fed976feb24cfd8d3cfc4e2ae31a1cb10026","ffffccffeda0fed976feb24cfd8d3cfc4e2ae31a1cb10026","ffffccffeda0fed976feb24cfd8d3cfc4e2ae31a1cbd0026800026").map(O_),Lw=B_(Ew),Ow=new Array(3).concat("deebf79ecae13182bd","eff3ffbdd7e76baed62171b5","eff3ffbdd7e76baed63182bd08519c","eff3ffc6dbef9ecae16baed63182bd08519c","eff3ffc6dbef9ecae16baed64292c62171b5084594","f7fbffdeebf7c6dbef9ecae16baed64292c62171b5084594","f7fbffdeebf7c6dbef9ecae16baed64292c62171b508519c08306b").map(O_),Dw=B_(Ow),Rw=new Array(3).concat("e5f5e0a1d99b31a354","edf8e9bae4b374c476238b45","edf8e9bae4b374c47631a354006d2c","edf8e9c7e9c0a1d99b74c47631a354006d2c","edf8e9c7e9c0a1d99b74c47641ab5d238b45005a32","f7fcf5e5f5e0c7e9c0a1d99b74c47641ab5d238b45005a32","f7fcf5e5f5e0c7e9c0a1d99b74c47641ab5d238b45006d2c00441b").map(O_),Aw=B_(Rw),Nw=new Array(3).concat("f0f0f0bdbdbd636363","f7f7f7cccccc969696525252","f7f7f7cccccc969696636363252525","f7f7f7d9d9d9bdbdbd969696636363252525","f7f7f7d9d9d9bdbdbd969696737373525252252525","fffffff0f0f0d9d9d9bdbdbd969696737373525252252525","fffffff0f0f0d9d9d9bdbdbd969696737373525252252525000000").map(O_),Yw=B_(Nw),jw=new Array(3).concat("efedf5bcbddc756bb1","f2f0f7cbc9e29e9ac86a51a3","f2f0f7cbc9e29e9ac8756bb154278f","f2f0f7dadaebbcbddc9e9ac8756bb154278f","f2f0f7dadaebbcbddc9e9ac8807dba6a51a34a1486","fcfbfdefedf5dadaebbcbddc9e9ac8807dba6a51a34a1486","fcfbfdefedf5dadaebbcbddc9e9ac8807dba6a51a354278f3f007d").map(O_),Hw=B_(jw),Pw=new Array(3).concat("fee0d2fc9272de2d26","fee5d9fcae91fb6a4acb181d","fee5d9fcae91fb6a4ade2d26a50f15","fee5d9fcbba1fc9272fb6a4ade2d26a50f15","fee5d9fcbba1fc9272fb6a4aef3b2ccb181d99000d","fff5f0fee0d2fcbba1fc9272fb6a4aef3b2ccb181d99000d","fff5f0fee0d2fcbba1fc9272fb6a4aef3b2ccb181da50f1567000d").map(O_),Iw=B_(Pw),Fw=new Array(3).concat("fee6cefdae6be6550d","feeddefdbe85fd8d3cd94701","feeddefdbe85fd8d3ce6550da63603","feeddefdd0a2fdae6bfd8d3ce6550da63603","feeddefdd0a2fdae6bfd8d3cf16913d948018c2d04","fff5ebfee6cefdd0a2fdae6bfd8d3cf16913d948018c2d04","fff5ebfee6cefdd0a2fdae6bfd8d3cf16913d94801a636037f2704").map(O_),Bw=B_(Fw),zw=function(e){return e=Math.max(0,Math.min(1,e)),"rgb("+Math.max(0,Math.min(255,Math.round(-4.54-e*(35.34-e*(2381.73-e*(6402.7-e*(7024.72-2710.57*e)))))))+", "+Math.max(0,Math.min(255,Math.round(32.49+e*(170.73+e*(52.82-e*(131.46-e*(176.58-67.37*e)))))))+", "+Math.max(0,Math.min(255,Math.round(81.24+e*(442.36-e*(2482.43-e*(6167.24-e*(6614.94-2475.67*e)))))))+")"},Ww=Zr(Xr(300,.5,0),Xr(-240,.5,1)),Uw=Zr(Xr(-100,.75,.35),Xr(80,1.5,.8)),Vw=Zr(Xr(260,.75,.35),Xr(80,1.5,.8)),qw=Xr(),Gw=function(e){(e<0||e>1)&&(e-=Math.floor(e));var t=Math.abs(e-.5);return qw.h=360*e-100,qw.s=1.5-1.5*t,qw.l=.8-.9*t,qw+""},Xw=bn(),Kw=Math.PI/3,Jw=2*Math.PI/3,$w=function(e){var t;return e=(.5-e)*Math.PI,Xw.r=255*(t=Math.sin(e))*t,Xw.g=255*(t=Math.sin(e+Kw))*t,Xw.b=255*(t=Math.sin(e+Jw))*t,Xw+""},Zw=function(e){return e=Math.max(0,Math.min(1,e)),"rgb("+Math.max(0,Math.min(255,Math.round(34.61+e*(1172.33-e*(10793.56-e*(33300.12-e*(38394.49-14825.05*e)))))))+", "+Math.max(0,Math.min(255,Math.round(23.31+e*(557.33+e*(1225.33-e*(3574.96-e*(1073.77+707.56*e)))))))+", "+Math.max(0,Math.min(255,Math.round(27.2+e*(3211.1-e*(15327.97-e*(27814-e*(22569.18-6838.66*e)))))))+")"};function Qw(e){var t=e.length;return function(n){return e[Math.max(0,Math.min(t-1,Math.floor(n*t)))]}}var eb=Qw(O_("44015444025645045745055946075a46085c460a5d460b5e470d60470e6147106347116447136548146748166848176948186a481a6c481b6d481c6e481d6f481f70482071482173482374482475482576482677482878482979472a7a472c7a472d7b472e7c472f7d46307e46327e46337f463480453581453781453882443983443a83443b84433d84433e85423f854240864241864142874144874045884046883f47883f48893e49893e4a893e4c8a3d4d8a3d4e8a3c4f8a3c508b3b518b3b528b3a538b3a548c39558c39568c38588c38598c375a8c375b8d365c8d365d8d355e8d355f8d34608d34618d33628d33638d32648e32658e31668e31678e31688e30698e306a8e2f6b8e2f6c8e2e6d8e2e6e8e2e6f8e2d708e2d718e2c718e2c728e2c738e2b748e2b758e2a768e2a778e2a788e29798e297a8e297b8e287c8e287d8e277e8e277f8e27808e26818e26828e26828e25838e25848e25858e24868e24878e23888e23898e238a8d228b8d228c8d228d8d218e8d218f8d21908d21918c20928c20928c20938c1f948c1f958b1f968b1f978b1f988b1f998a1f9a8a1e9b8a1e9c891e9d891f9e891f9f881fa0881fa1881fa1871fa28720a38620a48621a58521a68522a78522a88423a98324aa8325ab8225ac8226ad8127ad8128ae8029af7f2ab07f2cb17e2db27d2eb37c2fb47c31b57b32b67a34b67935b77937b87838b9773aba763bbb753dbc743fbc7340bd7242be7144bf7046c06f48c16e4ac16d4cc26c4ec36b50c46a52c56954c56856c66758c7655ac8645cc8635ec96260ca6063cb5f65cb5e67cc5c69cd5b6ccd5a6ece5870cf5773d05675d05477d1537ad1517cd2507fd34e81d34d84d44b86d54989d5488bd6468ed64590d74393d74195d84098d83e9bd93c9dd93ba0da39a2da37a5db36a8db34aadc32addc30b0dd2fb2dd2db5de2bb8de29bade28bddf26c0df25c2df23c5e021c8e020cae11fcde11dd0e11cd2e21bd5e21ad8e219dae319dde318dfe318e2e418e5e419e7e419eae51aece51befe51cf1e51df4e61ef6e620f8e621fbe723fde725")),tb=Qw(O_("00000401000501010601010802010902020b02020d03030f03031204041405041606051806051a07061c08071e0907200a08220b09240c09260d0a290e0b2b100b2d110c2f120d31130d34140e36150e38160f3b180f3d19103f1a10421c10441d11471e114920114b21114e22115024125325125527125829115a2a115c2c115f2d11612f116331116533106734106936106b38106c390f6e3b0f703d0f713f0f72400f74420f75440f764510774710784910784a10794c117a4e117b4f127b51127c52137c54137d56147d57157e59157e5a167e5c167f5d177f5f187f601880621980641a80651a80671b80681c816a1c816b1d816d1d816e1e81701f81721f817320817521817621817822817922827b23827c23827e24828025828125818326818426818627818827818928818b29818c29818e2a81902a81912b81932b80942c80962c80982d80992d809b2e7f9c2e7f9e2f7fa02f7fa1307ea3307ea5317ea6317da8327daa337dab337cad347cae347bb0357bb2357bb3367ab5367ab73779b83779ba3878bc3978bd3977bf3a77c03a76c23b75c43c75c53c74c73d73c83e73ca3e72cc3f71cd4071cf4070d0416fd2426fd3436ed5446dd6456cd8456cd9466bdb476adc4869de4968df4a68e04c67e24d66e34e65e44f64e55064e75263e85362e95462ea5661eb5760ec5860ed5a5fee5b5eef5d5ef05f5ef1605df2625df2645cf3655cf4675cf4695cf56b5cf66c5cf66e5cf7705cf7725cf8745cf8765cf9785df9795df97b5dfa7d5efa7f5efa815ffb835ffb8560fb8761fc8961fc8a62fc8c63fc8e64fc9065fd9266fd9467fd9668fd9869fd9a6afd9b6bfe9d6cfe9f6dfea16efea36ffea571fea772fea973feaa74feac76feae77feb078feb27afeb47bfeb67cfeb77efeb97ffebb81febd82febf84fec185fec287fec488fec68afec88cfeca8dfecc8ffecd90fecf92fed194fed395fed597fed799fed89afdda9cfddc9efddea0fde0a1fde2a3fde3a5fde5a7fde7a9fde9aafdebacfcecaefceeb0fcf0b2fcf2b4fcf4b6fcf6b8fcf7b9fcf9bbfcfbbdfcfdbf")),nb=Qw(O_("00000401000501010601010802010a02020c02020e03021004031204031405041706041907051b08051d09061f0a07220b07240c08260d08290e092b10092d110a30120a32140b34150b37160b39180c3c190c3e1b0c411c0c431e0c451f0c48210c4a230c4c240c4f260c51280b53290b552b0b572d0b592f0a5b310a5c320a5e340a5f3609613809623909633b09643d09653e0966400a67420a68440a68450a69470b6a490b6a4a0c6b4c0c6b4d0d6c4f0d6c510e6c520e6d540f6d550f6d57106e59106e5a116e5c126e5d126e5f136e61136e62146e64156e65156e67166e69166e6a176e6c186e6d186e6f196e71196e721a6e741a6e751b6e771c6d781c6d7a1d6d7c1d6d7d1e6d7f1e6c801f6c82206c84206b85216b87216b88226a8a226a8c23698d23698f24699025689225689326679526679727669827669a28659b29649d29649f2a63a02a63a22b62a32c61a52c60a62d60a82e5fa92e5eab2f5ead305dae305cb0315bb1325ab3325ab43359b63458b73557b93556ba3655bc3754bd3853bf3952c03a51c13a50c33b4fc43c4ec63d4dc73e4cc83f4bca404acb4149cc4248ce4347cf4446d04545d24644d34743d44842d54a41d74b3fd84c3ed94d3dda4e3cdb503bdd513ade5238df5337e05536e15635e25734e35933e45a31e55c30e65d2fe75e2ee8602de9612bea632aeb6429eb6628ec6726ed6925ee6a24ef6c23ef6e21f06f20f1711ff1731df2741cf3761bf37819f47918f57b17f57d15f67e14f68013f78212f78410f8850ff8870ef8890cf98b0bf98c0af98e09fa9008fa9207fa9407fb9606fb9706fb9906fb9b06fb9d07fc9f07fca108fca309fca50afca60cfca80dfcaa0ffcac11fcae12fcb014fcb216fcb418fbb61afbb81dfbba1ffbbc21fbbe23fac026fac228fac42afac62df9c72ff9c932f9cb35f8cd37f8cf3af7d13df7d340f6d543f6d746f5d949f5db4cf4dd4ff4df53f4e156f3e35af3e55df2e661f2e865f2ea69f1ec6df1ed71f1ef75f1f179f2f27df2f482f3f586f3f68af4f88ef5f992f6fa96f8fb9af9fc9dfafda1fcffa4")),rb=Qw(O_("0d088710078813078916078a19068c1b068d1d068e20068f2206902406912605912805922a05932c05942e05952f059631059733059735049837049938049a3a049a3c049b3e049c3f049c41049d43039e44039e46039f48039f4903a04b03a14c02a14e02a25002a25102a35302a35502a45601a45801a45901a55b01a55c01a65e01a66001a66100a76300a76400a76600a76700a86900a86a00a86c00a86e00a86f00a87100a87201a87401a87501a87701a87801a87a02a87b02a87d03a87e03a88004a88104a78305a78405a78606a68707a68808a68a09a58b0aa58d0ba58e0ca48f0da4910ea3920fa39410a29511a19613a19814a099159f9a169f9c179e9d189d9e199da01a9ca11b9ba21d9aa31e9aa51f99a62098a72197a82296aa2395ab2494ac2694ad2793ae2892b02991b12a90b22b8fb32c8eb42e8db52f8cb6308bb7318ab83289ba3388bb3488bc3587bd3786be3885bf3984c03a83c13b82c23c81c33d80c43e7fc5407ec6417dc7427cc8437bc9447aca457acb4679cc4778cc4977cd4a76ce4b75cf4c74d04d73d14e72d24f71d35171d45270d5536fd5546ed6556dd7566cd8576bd9586ada5a6ada5b69db5c68dc5d67dd5e66de5f65de6164df6263e06363e16462e26561e26660e3685fe4695ee56a5de56b5de66c5ce76e5be76f5ae87059e97158e97257ea7457eb7556eb7655ec7754ed7953ed7a52ee7b51ef7c51ef7e50f07f4ff0804ef1814df1834cf2844bf3854bf3874af48849f48948f58b47f58c46f68d45f68f44f79044f79143f79342f89441f89540f9973ff9983ef99a3efa9b3dfa9c3cfa9e3bfb9f3afba139fba238fca338fca537fca636fca835fca934fdab33fdac33fdae32fdaf31fdb130fdb22ffdb42ffdb52efeb72dfeb82cfeba2cfebb2bfebd2afebe2afec029fdc229fdc328fdc527fdc627fdc827fdca26fdcb26fccd25fcce25fcd025fcd225fbd324fbd524fbd724fad824fada24f9dc24f9dd25f8df25f8e125f7e225f7e425f6e626f6e826f5e926f5eb27f4ed27f3ee27f3f027f2f227f1f426f1f525f0f724f0f921")),ib=function(e){return function(){return e}},ob=Math.abs,ab=Math.atan2,sb=Math.cos,lb=Math.max,ub=Math.min,cb=Math.sin,db=Math.sqrt,hb=1e-12,fb=Math.PI,pb=fb/2,mb=2*fb;function gb(e){return e>=1?pb:e<=-1?-pb:Math.asin(e)}function yb(e){return e.innerRadius}function vb(e){return e.outerRadius}function _b(e){return e.startAngle}function wb(e){return e.endAngle}function bb(e){return e&&e.padAngle}function Mb(e,t,n,r,i,o,a){var s=e-n,l=t-r,u=(a?o:-o)/db(s*s+l*l),c=u*l,d=-u*s,h=e+c,f=t+d,p=n+c,m=r+d,g=(h+p)/2,y=(f+m)/2,v=p-h,_=m-f,w=v*v+_*_,b=i-o,M=h*m-p*f,k=(_<0?-1:1)*db(lb(0,b*b*w-M*M)),S=(M*_-v*k)/w,T=(-M*v-_*k)/w,C=(M*_+v*k)/w,x=(-M*v+_*k)/w,E=S-g,L=T-y,O=C-g,D=x-y;return E*E+L*L>O*O+D*D&&(S=C,T=x),{cx:S,cy:T,x01:-c,y01:-d,x11:S*(i/b-1),y11:T*(i/b-1)}}var kb=function(){var e=yb,t=vb,n=ib(0),r=null,i=_b,o=wb,a=bb,s=null;function l(){var l,u,c,d=+e.apply(this,arguments),h=+t.apply(this,arguments),f=i.apply(this,arguments)-pb,p=o.apply(this,arguments)-pb,m=ob(p-f),g=p>f;if(s||(s=l=Wa()),h<d&&(u=h,h=d,d=u),h>hb)if(m>mb-hb)s.moveTo(h*sb(f),h*cb(f)),s.arc(0,0,h,f,p,!g),d>hb&&(s.moveTo(d*sb(p),d*cb(p)),s.arc(0,0,d,p,f,g));else{var y,v,_=f,w=p,b=f,M=p,k=m,S=m,T=a.apply(this,arguments)/2,C=T>hb&&(r?+r.apply(this,arguments):db(d*d+h*h)),x=ub(ob(h-d)/2,+n.apply(this,arguments)),E=x,L=x;if(C>hb){var O=gb(C/d*cb(T)),D=gb(C/h*cb(T));(k-=2*O)>hb?(b+=O*=g?1:-1,M-=O):(k=0,b=M=(f+p)/2),(S-=2*D)>hb?(_+=D*=g?1:-1,w-=D):(S=0,_=w=(f+p)/2)}var R=h*sb(_),A=h*cb(_),N=d*sb(M),Y=d*cb(M);if(x>hb){var j,H=h*sb(w),P=h*cb(w),I=d*sb(b),F=d*cb(b);if(m<fb&&(j=function(e,t,n,r,i,o,a,s){var l=n-e,u=r-t,c=a-i,d=s-o,h=d*l-c*u;if(!(h*h<hb))return[e+(h=(c*(t-o)-d*(e-i))/h)*l,t+h*u]}(R,A,I,F,H,P,N,Y))){var B=R-j[0],z=A-j[1],W=H-j[0],U=P-j[1],V=1/cb(((c=(B*W+z*U)/(db(B*B+z*z)*db(W*W+U*U)))>1?0:c<-1?fb:Math.acos(c))/2),q=db(j[0]*j[0]+j[1]*j[1]);E=ub(x,(d-q)/(V-1)),L=ub(x,(h-q)/(V+1))}}S>hb?L>hb?(y=Mb(I,F,R,A,h,L,g),v=Mb(H,P,N,Y,h,L,g),s.moveTo(y.cx+y.x01,y.cy+y.y01),L<x?s.arc(y.cx,y.cy,L,ab(y.y01,y.x01),ab(v.y01,v.x01),!g):(s.arc(y.cx,y.cy,L,ab(y.y01,y.x01),ab(y.y11,y.x11),!g),s.arc(0,0,h,ab(y.cy+y.y11,y.cx+y.x11),ab(v.cy+v.y11,v.cx+v.x11),!g),s.arc(v.cx,v.cy,L,ab(v.y11,v.x11),ab(v.y01,v.x01),!g))):(s.moveTo(R,A),s.arc(0,0,h,_,w,!g)):s.moveTo(R,A),d>hb&&k>hb?E>hb?(y=Mb(N,Y,H,P,d,-E,g),v=Mb(R,A,I,F,d,-E,g),s.lineTo(y.cx+y.x01,y.cy+y.y01),E<x?s.arc(y.cx,y.cy,E,ab(y.y01,y.x01),ab(v.y01,v.x01),!g):(s.arc(y.cx,y.cy,E,ab(y.y01,y.x01),ab(y.y11,y.x11),!g),s.arc(0,0,d,ab(y.cy+y.y11,y.cx+y.x11),ab(v.cy+v.y11,v.cx+v.x11),g),s.arc(v.cx,v.cy,E,ab(v.y11,v.x11),ab(v.y01,v.x01),!g))):s.arc(0,0,d,M,b,g):s.lineTo(N,Y)}else s.moveTo(0,0);if(s.closePath(),l)return s=null,l+""||null}return l.centroid=function(){var n=(+e.apply(this,arguments)+ +t.apply(this,arguments))/2,r=(+i.apply(this,arguments)+ +o.apply(this,arguments))/2-fb/2;return[sb(r)*n,cb(r)*n]},l.innerRadius=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),l):e},l.outerRadius=function(e){return arguments.length?(t="function"==typeof e?e:ib(+e),l):t},l.cornerRadius=function(e){return arguments.length?(n="function"==typeof e?e:ib(+e),l):n},l.padRadius=function(e){return arguments.length?(r=null==e?null:"function"==typeof e?e:ib(+e),l):r},l.startAngle=function(e){return arguments.length?(i="function"==typeof e?e:ib(+e),l):i},l.endAngle=function(e){return arguments.length?(o="function"==typeof e?e:ib(+e),l):o},l.padAngle=function(e){return arguments.length?(a="function"==typeof e?e:ib(+e),l):a},l.context=function(e){return arguments.length?(s=null==e?null:e,l):s},l};function Sb(e){this._context=e}Sb.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t)}}};var Tb=function(e){return new Sb(e)};function Cb(e){return e[0]}function xb(e){return e[1]}var Eb=function(){var e=Cb,t=xb,n=ib(!0),r=null,i=Tb,o=null;function a(a){var s,l,u,c=a.length,d=!1;for(null==r&&(o=i(u=Wa())),s=0;s<=c;++s)!(s<c&&n(l=a[s],s,a))===d&&((d=!d)?o.lineStart():o.lineEnd()),d&&o.point(+e(l,s,a),+t(l,s,a));if(u)return o=null,u+""||null}return a.x=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),a):e},a.y=function(e){return arguments.length?(t="function"==typeof e?e:ib(+e),a):t},a.defined=function(e){return arguments.length?(n="function"==typeof e?e:ib(!!e),a):n},a.curve=function(e){return arguments.length?(i=e,null!=r&&(o=i(r)),a):i},a.context=function(e){return arguments.length?(null==e?r=o=null:o=i(r=e),a):r},a},Lb=function(){var e=Cb,t=null,n=ib(0),r=xb,i=ib(!0),o=null,a=Tb,s=null;function l(l){var u,c,d,h,f,p=l.length,m=!1,g=new Array(p),y=new Array(p);for(null==o&&(s=a(f=Wa())),u=0;u<=p;++u){if(!(u<p&&i(h=l[u],u,l))===m)if(m=!m)c=u,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),d=u-1;d>=c;--d)s.point(g[d],y[d]);s.lineEnd(),s.areaEnd()}m&&(g[u]=+e(h,u,l),y[u]=+n(h,u,l),s.point(t?+t(h,u,l):g[u],r?+r(h,u,l):y[u]))}if(f)return s=null,f+""||null}function u(){return Eb().defined(i).curve(a).context(o)}return l.x=function(n){return arguments.length?(e="function"==typeof n?n:ib(+n),t=null,l):e},l.x0=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),l):e},l.x1=function(e){return arguments.length?(t=null==e?null:"function"==typeof e?e:ib(+e),l):t},l.y=function(e){return arguments.length?(n="function"==typeof e?e:ib(+e),r=null,l):n},l.y0=function(e){return arguments.length?(n="function"==typeof e?e:ib(+e),l):n},l.y1=function(e){return arguments.length?(r=null==e?null:"function"==typeof e?e:ib(+e),l):r},l.lineX0=l.lineY0=function(){return u().x(e).y(n)},l.lineY1=function(){return u().x(e).y(r)},l.lineX1=function(){return u().x(t).y(n)},l.defined=function(e){return arguments.length?(i="function"==typeof e?e:ib(!!e),l):i},l.curve=function(e){return arguments.length?(a=e,null!=o&&(s=a(o)),l):a},l.context=function(e){return arguments.length?(null==e?o=s=null:s=a(o=e),l):o},l},Ob=function(e,t){return t<e?-1:t>e?1:t>=e?0:NaN},Db=function(e){return e},Rb=function(){var e=Db,t=Ob,n=null,r=ib(0),i=ib(mb),o=ib(0);function a(a){var s,l,u,c,d,h=a.length,f=0,p=new Array(h),m=new Array(h),g=+r.apply(this,arguments),y=Math.min(mb,Math.max(-mb,i.apply(this,arguments)-g)),v=Math.min(Math.abs(y)/h,o.apply(this,arguments)),_=v*(y<0?-1:1);for(s=0;s<h;++s)(d=m[p[s]=s]=+e(a[s],s,a))>0&&(f+=d);for(null!=t?p.sort((function(e,n){return t(m[e],m[n])})):null!=n&&p.sort((function(e,t){return n(a[e],a[t])})),s=0,u=f?(y-h*_)/f:0;s<h;++s,g=c)l=p[s],c=g+((d=m[l])>0?d*u:0)+_,m[l]={data:a[l],index:s,value:d,startAngle:g,endAngle:c,padAngle:v};return m}return a.value=function(t){return arguments.length?(e="function"==typeof t?t:ib(+t),a):e},a.sortValues=function(e){return arguments.length?(t=e,n=null,a):t},a.sort=function(e){return arguments.length?(n=e,t=null,a):n},a.startAngle=function(e){return arguments.length?(r="function"==typeof e?e:ib(+e),a):r},a.endAngle=function(e){return arguments.length?(i="function"==typeof e?e:ib(+e),a):i},a.padAngle=function(e){return arguments.length?(o="function"==typeof e?e:ib(+e),a):o},a},Ab=Yb(Tb);function Nb(e){this._curve=e}function Yb(e){function t(t){return new Nb(e(t))}return t._curve=e,t}function jb(e){var t=e.curve;return e.angle=e.x,delete e.x,e.radius=e.y,delete e.y,e.curve=function(e){return arguments.length?t(Yb(e)):t()._curve},e}Nb.prototype={areaStart:function(){this._curve.areaStart()},areaEnd:function(){this._curve.areaEnd()},lineStart:function(){this._curve.lineStart()},lineEnd:function(){this._curve.lineEnd()},point:function(e,t){this._curve.point(t*Math.sin(e),t*-Math.cos(e))}};var Hb=function(){return jb(Eb().curve(Ab))},Pb=function(){var e=Lb().curve(Ab),t=e.curve,n=e.lineX0,r=e.lineX1,i=e.lineY0,o=e.lineY1;return e.angle=e.x,delete e.x,e.startAngle=e.x0,delete e.x0,e.endAngle=e.x1,delete e.x1,e.radius=e.y,delete e.y,e.innerRadius=e.y0,delete e.y0,e.outerRadius=e.y1,delete e.y1,e.lineStartAngle=function(){return jb(n())},delete e.lineX0,e.lineEndAngle=function(){return jb(r())},delete e.lineX1,e.lineInnerRadius=function(){return jb(i())},delete e.lineY0,e.lineOuterRadius=function(){return jb(o())},delete e.lineY1,e.curve=function(e){return arguments.length?t(Yb(e)):t()._curve},e},Ib=function(e,t){return[(t=+t)*Math.cos(e-=Math.PI/2),t*Math.sin(e)]},Fb=Array.prototype.slice;function Bb(e){return e.source}function zb(e){return e.target}function Wb(e){var t=Bb,n=zb,r=Cb,i=xb,o=null;function a(){var a,s=Fb.call(arguments),l=t.apply(this,s),u=n.apply(this,s);if(o||(o=a=Wa()),e(o,+r.apply(this,(s[0]=l,s)),+i.apply(this,s),+r.apply(this,(s[0]=u,s)),+i.apply(this,s)),a)return o=null,a+""||null}return a.source=function(e){return arguments.length?(t=e,a):t},a.target=function(e){return arguments.length?(n=e,a):n},a.x=function(e){return arguments.length?(r="function"==typeof e?e:ib(+e),a):r},a.y=function(e){return arguments.length?(i="function"==typeof e?e:ib(+e),a):i},a.context=function(e){return arguments.length?(o=null==e?null:e,a):o},a}function Ub(e,t,n,r,i){e.moveTo(t,n),e.bezierCurveTo(t=(t+r)/2,n,t,i,r,i)}function Vb(e,t,n,r,i){e.moveTo(t,n),e.bezierCurveTo(t,n=(n+i)/2,r,n,r,i)}function qb(e,t,n,r,i){var o=Ib(t,n),a=Ib(t,n=(n+i)/2),s=Ib(r,n),l=Ib(r,i);e.moveTo(o[0],o[1]),e.bezierCurveTo(a[0],a[1],s[0],s[1],l[0],l[1])}function Gb(){return Wb(Ub)}function Xb(){return Wb(Vb)}function Kb(){var e=Wb(qb);return e.angle=e.x,delete e.x,e.radius=e.y,delete e.y,e}var Jb={draw:function(e,t){var n=Math.sqrt(t/fb);e.moveTo(n,0),e.arc(0,0,n,0,mb)}},$b={draw:function(e,t){var n=Math.sqrt(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},Zb=Math.sqrt(1/3),Qb=2*Zb,eM={draw:function(e,t){var n=Math.sqrt(t/Qb),r=n*Zb;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},tM=Math.sin(fb/10)/Math.sin(7*fb/10),nM=Math.sin(mb/10)*tM,rM=-Math.cos(mb/10)*tM,iM={draw:function(e,t){var n=Math.sqrt(.8908130915292852*t),r=nM*n,i=rM*n;e.moveTo(0,-n),e.lineTo(r,i);for(var o=1;o<5;++o){var a=mb*o/5,s=Math.cos(a),l=Math.sin(a);e.lineTo(l*n,-s*n),e.lineTo(s*r-l*i,l*r+s*i)}e.closePath()}},oM={draw:function(e,t){var n=Math.sqrt(t),r=-n/2;e.rect(r,r,n,n)}},aM=Math.sqrt(3),sM={draw:function(e,t){var n=-Math.sqrt(t/(3*aM));e.moveTo(0,2*n),e.lineTo(-aM*n,-n),e.lineTo(aM*n,-n),e.closePath()}},lM=Math.sqrt(3)/2,uM=1/Math.sqrt(12),cM=3*(uM/2+1),dM={draw:function(e,t){var n=Math.sqrt(t/cM),r=n/2,i=n*uM,o=r,a=n*uM+n,s=-o,l=a;e.moveTo(r,i),e.lineTo(o,a),e.lineTo(s,l),e.lineTo(-.5*r-lM*i,lM*r+-.5*i),e.lineTo(-.5*o-lM*a,lM*o+-.5*a),e.lineTo(-.5*s-lM*l,lM*s+-.5*l),e.lineTo(-.5*r+lM*i,-.5*i-lM*r),e.lineTo(-.5*o+lM*a,-.5*a-lM*o),e.lineTo(-.5*s+lM*l,-.5*l-lM*s),e.closePath()}},hM=[Jb,$b,eM,oM,iM,sM,dM],fM=function(){var e=ib(Jb),t=ib(64),n=null;function r(){var r;if(n||(n=r=Wa()),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),r)return n=null,r+""||null}return r.type=function(t){return arguments.length?(e="function"==typeof t?t:ib(t),r):e},r.size=function(e){return arguments.length?(t="function"==typeof e?e:ib(+e),r):t},r.context=function(e){return arguments.length?(n=null==e?null:e,r):n},r},pM=function(){};function mM(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function gM(e){this._context=e}gM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:mM(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:mM(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};var yM=function(e){return new gM(e)};function vM(e){this._context=e}vM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:mM(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};var _M=function(e){return new vM(e)};function wM(e){this._context=e}wM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:mM(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};var bM=function(e){return new wM(e)};function MM(e,t){this._basis=new gM(e),this._beta=t}MM.prototype={lineStart:function(){this._x=[],this._y=[],this._basis.lineStart()},lineEnd:function(){var e=this._x,t=this._y,n=e.length-1;if(n>0)for(var r,i=e[0],o=t[0],a=e[n]-i,s=t[n]-o,l=-1;++l<=n;)r=l/n,this._basis.point(this._beta*e[l]+(1-this._beta)*(i+r*a),this._beta*t[l]+(1-this._beta)*(o+r*s));this._x=this._y=null,this._basis.lineEnd()},point:function(e,t){this._x.push(+e),this._y.push(+t)}};var kM=function e(t){function n(e){return 1===t?new gM(e):new MM(e,t)}return n.beta=function(t){return e(+t)},n}(.85);function SM(e,t,n){e._context.bezierCurveTo(e._x1+e._k*(e._x2-e._x0),e._y1+e._k*(e._y2-e._y0),e._x2+e._k*(e._x1-t),e._y2+e._k*(e._y1-n),e._x2,e._y2)}function TM(e,t){this._context=e,this._k=(1-t)/6}TM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x2,this._y2);break;case 3:SM(this,this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2,this._x1=e,this._y1=t;break;case 2:this._point=3;default:SM(this,e,t)}this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var CM=function e(t){function n(e){return new TM(e,t)}return n.tension=function(t){return e(+t)},n}(0);function xM(e,t){this._context=e,this._k=(1-t)/6}xM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._x5=this._y0=this._y1=this._y2=this._y3=this._y4=this._y5=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x3,this._y3),this._context.closePath();break;case 2:this._context.lineTo(this._x3,this._y3),this._context.closePath();break;case 3:this.point(this._x3,this._y3),this.point(this._x4,this._y4),this.point(this._x5,this._y5)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x3=e,this._y3=t;break;case 1:this._point=2,this._context.moveTo(this._x4=e,this._y4=t);break;case 2:this._point=3,this._x5=e,this._y5=t;break;default:SM(this,e,t)}this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var EM=function e(t){function n(e){return new xM(e,t)}return n.tension=function(t){return e(+t)},n}(0);function LM(e,t){this._context=e,this._k=(1-t)/6}LM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3,this._line?this._context.lineTo(this._x2,this._y2):this._context.moveTo(this._x2,this._y2);break;case 3:this._point=4;default:SM(this,e,t)}this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var OM=function e(t){function n(e){return new LM(e,t)}return n.tension=function(t){return e(+t)},n}(0);function DM(e,t,n){var r=e._x1,i=e._y1,o=e._x2,a=e._y2;if(e._l01_a>hb){var s=2*e._l01_2a+3*e._l01_a*e._l12_a+e._l12_2a,l=3*e._l01_a*(e._l01_a+e._l12_a);r=(r*s-e._x0*e._l12_2a+e._x2*e._l01_2a)/l,i=(i*s-e._y0*e._l12_2a+e._y2*e._l01_2a)/l}if(e._l23_a>hb){var u=2*e._l23_2a+3*e._l23_a*e._l12_a+e._l12_2a,c=3*e._l23_a*(e._l23_a+e._l12_a);o=(o*u+e._x1*e._l23_2a-t*e._l12_2a)/c,a=(a*u+e._y1*e._l23_2a-n*e._l12_2a)/c}e._context.bezierCurveTo(r,i,o,a,e._x2,e._y2)}function RM(e,t){this._context=e,this._alpha=t}RM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x2,this._y2);break;case 3:this.point(this._x2,this._y2)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){if(e=+e,t=+t,this._point){var n=this._x2-e,r=this._y2-t;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(n*n+r*r,this._alpha))}switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3;default:DM(this,e,t)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var AM=function e(t){function n(e){return t?new RM(e,t):new TM(e,0)}return n.alpha=function(t){return e(+t)},n}(.5);function NM(e,t){this._context=e,this._alpha=t}NM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._x5=this._y0=this._y1=this._y2=this._y3=this._y4=this._y5=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x3,this._y3),this._context.closePath();break;case 2:this._context.lineTo(this._x3,this._y3),this._context.closePath();break;case 3:this.point(this._x3,this._y3),this.point(this._x4,this._y4),this.point(this._x5,this._y5)}},point:function(e,t){if(e=+e,t=+t,this._point){var n=this._x2-e,r=this._y2-t;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(n*n+r*r,this._alpha))}switch(this._point){case 0:this._point=1,this._x3=e,this._y3=t;break;case 1:this._point=2,this._context.moveTo(this._x4=e,this._y4=t);break;case 2:this._point=3,this._x5=e,this._y5=t;break;default:DM(this,e,t)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var YM=function e(t){function n(e){return t?new NM(e,t):new xM(e,0)}return n.alpha=function(t){return e(+t)},n}(.5);function jM(e,t){this._context=e,this._alpha=t}jM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._x2=this._y0=this._y1=this._y2=NaN,this._l01_a=this._l12_a=this._l23_a=this._l01_2a=this._l12_2a=this._l23_2a=this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){if(e=+e,t=+t,this._point){var n=this._x2-e,r=this._y2-t;this._l23_a=Math.sqrt(this._l23_2a=Math.pow(n*n+r*r,this._alpha))}switch(this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3,this._line?this._context.lineTo(this._x2,this._y2):this._context.moveTo(this._x2,this._y2);break;case 3:this._point=4;default:DM(this,e,t)}this._l01_a=this._l12_a,this._l12_a=this._l23_a,this._l01_2a=this._l12_2a,this._l12_2a=this._l23_2a,this._x0=this._x1,this._x1=this._x2,this._x2=e,this._y0=this._y1,this._y1=this._y2,this._y2=t}};var HM=function e(t){function n(e){return t?new jM(e,t):new LM(e,0)}return n.alpha=function(t){return e(+t)},n}(.5);function PM(e){this._context=e}PM.prototype={areaStart:pM,areaEnd:pM,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};var IM=function(e){return new PM(e)};function FM(e){return e<0?-1:1}function BM(e,t,n){var r=e._x1-e._x0,i=t-e._x1,o=(e._y1-e._y0)/(r||i<0&&-0),a=(n-e._y1)/(i||r<0&&-0),s=(o*i+a*r)/(r+i);return(FM(o)+FM(a))*Math.min(Math.abs(o),Math.abs(a),.5*Math.abs(s))||0}function zM(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function WM(e,t,n){var r=e._x0,i=e._y0,o=e._x1,a=e._y1,s=(o-r)/3;e._context.bezierCurveTo(r+s,i+s*t,o-s,a-s*n,o,a)}function UM(e){this._context=e}function VM(e){this._context=new qM(e)}function qM(e){this._context=e}function GM(e){return new UM(e)}function XM(e){return new VM(e)}function KM(e){this._context=e}function JM(e){var t,n,r=e.length-1,i=new Array(r),o=new Array(r),a=new Array(r);for(i[0]=0,o[0]=2,a[0]=e[0]+2*e[1],t=1;t<r-1;++t)i[t]=1,o[t]=4,a[t]=4*e[t]+2*e[t+1];for(i[r-1]=2,o[r-1]=7,a[r-1]=8*e[r-1]+e[r],t=1;t<r;++t)n=i[t]/o[t-1],o[t]-=n,a[t]-=n*a[t-1];for(i[r-1]=a[r-1]/o[r-1],t=r-2;t>=0;--t)i[t]=(a[t]-i[t+1])/o[t];for(o[r-1]=(e[r]+i[r-1])/2,t=0;t<r-1;++t)o[t]=2*e[t+1]-i[t+1];return[i,o]}UM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:WM(this,this._t0,zM(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(t=+t,(e=+e)!==this._x1||t!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,WM(this,zM(this,n=BM(this,e,t)),n);break;default:WM(this,this._t0,n=BM(this,e,t))}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}},(VM.prototype=Object.create(UM.prototype)).point=function(e,t){UM.prototype.point.call(this,t,e)},qM.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,o){this._context.bezierCurveTo(t,e,r,n,o,i)}},KM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),2===n)this._context.lineTo(e[1],t[1]);else for(var r=JM(e),i=JM(t),o=0,a=1;a<n;++o,++a)this._context.bezierCurveTo(r[0][o],i[0][o],r[1][o],i[1][o],e[a],t[a]);(this._line||0!==this._line&&1===n)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};var $M=function(e){return new KM(e)};function ZM(e,t){this._context=e,this._t=t}ZM.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}}this._x=e,this._y=t}};var QM=function(e){return new ZM(e,.5)};function ek(e){return new ZM(e,0)}function tk(e){return new ZM(e,1)}var nk=function(e,t){if((i=e.length)>1)for(var n,r,i,o=1,a=e[t[0]],s=a.length;o<i;++o)for(r=a,a=e[t[o]],n=0;n<s;++n)a[n][1]+=a[n][0]=isNaN(r[n][1])?r[n][0]:r[n][1]},rk=function(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n};function ik(e,t){return e[t]}var ok=function(){var e=ib([]),t=rk,n=nk,r=ik;function i(i){var o,a,s=e.apply(this,arguments),l=i.length,u=s.length,c=new Array(u);for(o=0;o<u;++o){for(var d,h=s[o],f=c[o]=new Array(l),p=0;p<l;++p)f[p]=d=[0,+r(i[p],h,p,i)],d.data=i[p];f.key=h}for(o=0,a=t(c);o<u;++o)c[a[o]].index=o;return n(c,a),c}return i.keys=function(t){return arguments.length?(e="function"==typeof t?t:ib(Fb.call(t)),i):e},i.value=function(e){return arguments.length?(r="function"==typeof e?e:ib(+e),i):r},i.order=function(e){return arguments.length?(t=null==e?rk:"function"==typeof e?e:ib(Fb.call(e)),i):t},i.offset=function(e){return arguments.length?(n=null==e?nk:e,i):n},i},ak=function(e,t){if((r=e.length)>0){for(var n,r,i,o=0,a=e[0].length;o<a;++o){for(i=n=0;n<r;++n)i+=e[n][o][1]||0;if(i)for(n=0;n<r;++n)e[n][o][1]/=i}nk(e,t)}},sk=function(e,t){if((s=e.length)>0)for(var n,r,i,o,a,s,l=0,u=e[t[0]].length;l<u;++l)for(o=a=0,n=0;n<s;++n)(i=(r=e[t[n]][l])[1]-r[0])>=0?(r[0]=o,r[1]=o+=i):i<0?(r[1]=a,r[0]=a+=i):r[0]=o},lk=function(e,t){if((n=e.length)>0){for(var n,r=0,i=e[t[0]],o=i.length;r<o;++r){for(var a=0,s=0;a<n;++a)s+=e[a][r][1]||0;i[r][1]+=i[r][0]=-s/2}nk(e,t)}},uk=function(e,t){if((i=e.length)>0&&(r=(n=e[t[0]]).length)>0){for(var n,r,i,o=0,a=1;a<r;++a){for(var s=0,l=0,u=0;s<i;++s){for(var c=e[t[s]],d=c[a][1]||0,h=(d-(c[a-1][1]||0))/2,f=0;f<s;++f){var p=e[t[f]];h+=(p[a][1]||0)-(p[a-1][1]||0)}l+=d,u+=h*d}n[a-1][1]+=n[a-1][0]=o,l&&(o-=u/l)}n[a-1][1]+=n[a-1][0]=o,nk(e,t)}},ck=function(e){var t=e.map(dk);return rk(e).sort((function(e,n){return t[e]-t[n]}))};function dk(e){for(var t,n=-1,r=0,i=e.length,o=-1/0;++n<i;)(t=+e[n][1])>o&&(o=t,r=n);return r}var hk=function(e){var t=e.map(fk);return rk(e).sort((function(e,n){return t[e]-t[n]}))};function fk(e){for(var t,n=0,r=-1,i=e.length;++r<i;)(t=+e[r][1])&&(n+=t);return n}var pk=function(e){return hk(e).reverse()},mk=function(e){var t,n,r=e.length,i=e.map(fk),o=ck(e),a=0,s=0,l=[],u=[];for(t=0;t<r;++t)n=o[t],a<s?(a+=i[n],l.push(n)):(s+=i[n],u.push(n));return u.reverse().concat(l)},gk=function(e){return rk(e).reverse()},yk=function(e){return function(){return e}};function vk(e){return e[0]}function _k(e){return e[1]}function wk(){this._=null}function bk(e){e.U=e.C=e.L=e.R=e.P=e.N=null}function Mk(e,t){var n=t,r=t.R,i=n.U;i?i.L===n?i.L=r:i.R=r:e._=r,r.U=i,n.U=r,n.R=r.L,n.R&&(n.R.U=n),r.L=n}function kk(e,t){var n=t,r=t.L,i=n.U;i?i.L===n?i.L=r:i.R=r:e._=r,r.U=i,n.U=r,n.L=r.R,n.L&&(n.L.U=n),r.R=n}function Sk(e){for(;e.L;)e=e.L;return e}wk.prototype={constructor:wk,insert:function(e,t){var n,r,i;if(e){if(t.P=e,t.N=e.N,e.N&&(e.N.P=t),e.N=t,e.R){for(e=e.R;e.L;)e=e.L;e.L=t}else e.R=t;n=e}else this._?(e=Sk(this._),t.P=null,t.N=e,e.P=e.L=t,n=e):(t.P=t.N=null,this._=t,n=null);for(t.L=t.R=null,t.U=n,t.C=!0,e=t;n&&n.C;)n===(r=n.U).L?(i=r.R)&&i.C?(n.C=i.C=!1,r.C=!0,e=r):(e===n.R&&(Mk(this,n),n=(e=n).U),n.C=!1,r.C=!0,kk(this,r)):(i=r.L)&&i.C?(n.C=i.C=!1,r.C=!0,e=r):(e===n.L&&(kk(this,n),n=(e=n).U),n.C=!1,r.C=!0,Mk(this,r)),n=e.U;this._.C=!1},remove:function(e){e.N&&(e.N.P=e.P),e.P&&(e.P.N=e.N),e.N=e.P=null;var t,n,r,i=e.U,o=e.L,a=e.R;if(n=o?a?Sk(a):o:a,i?i.L===e?i.L=n:i.R=n:this._=n,o&&a?(r=n.C,n.C=e.C,n.L=o,o.U=n,n!==a?(i=n.U,n.U=e.U,e=n.R,i.L=e,n.R=a,a.U=n):(n.U=i,i=n,e=n.R)):(r=e.C,e=n),e&&(e.U=i),!r)if(e&&e.C)e.C=!1;else{do{if(e===this._)break;if(e===i.L){if((t=i.R).C&&(t.C=!1,i.C=!0,Mk(this,i),t=i.R),t.L&&t.L.C||t.R&&t.R.C){t.R&&t.R.C||(t.L.C=!1,t.C=!0,kk(this,t),t=i.R),t.C=i.C,i.C=t.R.C=!1,Mk(this,i),e=this._;break}}else if((t=i.L).C&&(t.C=!1,i.C=!0,kk(this,i),t=i.L),t.L&&t.L.C||t.R&&t.R.C){t.L&&t.L.C||(t.R.C=!1,t.C=!0,Mk(this,t),t=i.L),t.C=i.C,i.C=t.L.C=!1,kk(this,i),e=this._;break}t.C=!0,e=i,i=i.U}while(!e.C);e&&(e.C=!1)}}};var Tk=wk;function Ck(e,t,n,r){var i=[null,null],o=Jk.push(i)-1;return i.left=e,i.right=t,n&&Ek(i,e,t,n),r&&Ek(i,t,e,r),Xk[e.index].halfedges.push(o),Xk[t.index].halfedges.push(o),i}function xk(e,t,n){var r=[t,n];return r.left=e,r}function Ek(e,t,n,r){e[0]||e[1]?e.left===n?e[1]=r:e[0]=r:(e[0]=r,e.left=t,e.right=n)}function Lk(e,t,n,r,i){var o,a=e[0],s=e[1],l=a[0],u=a[1],c=0,d=1,h=s[0]-l,f=s[1]-u;if(o=t-l,h||!(o>0)){if(o/=h,h<0){if(o<c)return;o<d&&(d=o)}else if(h>0){if(o>d)return;o>c&&(c=o)}if(o=r-l,h||!(o<0)){if(o/=h,h<0){if(o>d)return;o>c&&(c=o)}else if(h>0){if(o<c)return;o<d&&(d=o)}if(o=n-u,f||!(o>0)){if(o/=f,f<0){if(o<c)return;o<d&&(d=o)}else if(f>0){if(o>d)return;o>c&&(c=o)}if(o=i-u,f||!(o<0)){if(o/=f,f<0){if(o>d)return;o>c&&(c=o)}else if(f>0){if(o<c)return;o<d&&(d=o)}return!(c>0||d<1)||(c>0&&(e[0]=[l+c*h,u+c*f]),d<1&&(e[1]=[l+d*h,u+d*f]),!0)}}}}}function Ok(e,t,n,r,i){var o=e[1];if(o)return!0;var a,s,l=e[0],u=e.left,c=e.right,d=u[0],h=u[1],f=c[0],p=c[1],m=(d+f)/2,g=(h+p)/2;if(p===h){if(m<t||m>=r)return;if(d>f){if(l){if(l[1]>=i)return}else l=[m,n];o=[m,i]}else{if(l){if(l[1]<n)return}else l=[m,i];o=[m,n]}}else if(s=g-(a=(d-f)/(p-h))*m,a<-1||a>1)if(d>f){if(l){if(l[1]>=i)return}else l=[(n-s)/a,n];o=[(i-s)/a,i]}else{if(l){if(l[1]<n)return}else l=[(i-s)/a,i];o=[(n-s)/a,n]}else if(h<p){if(l){if(l[0]>=r)return}else l=[t,a*t+s];o=[r,a*r+s]}else{if(l){if(l[0]<t)return}else l=[r,a*r+s];o=[t,a*t+s]}return e[0]=l,e[1]=o,!0}function Dk(e,t){var n=e.site,r=t.left,i=t.right;return n===i&&(i=r,r=n),i?Math.atan2(i[1]-r[1],i[0]-r[0]):(n===r?(r=t[1],i=t[0]):(r=t[0],i=t[1]),Math.atan2(r[0]-i[0],i[1]-r[1]))}function Rk(e,t){return t[+(t.left!==e.site)]}function Ak(e,t){return t[+(t.left===e.site)]}var Nk,Yk=[];function jk(){bk(this),this.x=this.y=this.arc=this.site=this.cy=null}function Hk(e){var t=e.P,n=e.N;if(t&&n){var r=t.site,i=e.site,o=n.site;if(r!==o){var a=i[0],s=i[1],l=r[0]-a,u=r[1]-s,c=o[0]-a,d=o[1]-s,h=2*(l*d-u*c);if(!(h>=-Zk)){var f=l*l+u*u,p=c*c+d*d,m=(d*f-u*p)/h,g=(l*p-c*f)/h,y=Yk.pop()||new jk;y.arc=e,y.site=i,y.x=m+a,y.y=(y.cy=g+s)+Math.sqrt(m*m+g*g),e.circle=y;for(var v=null,_=Kk._;_;)if(y.y<_.y||y.y===_.y&&y.x<=_.x){if(!_.L){v=_.P;break}_=_.L}else{if(!_.R){v=_;break}_=_.R}Kk.insert(v,y),v||(Nk=y)}}}}function Pk(e){var t=e.circle;t&&(t.P||(Nk=t.N),Kk.remove(t),Yk.push(t),bk(t),e.circle=null)}var Ik=[];function Fk(){bk(this),this.edge=this.site=this.circle=null}function Bk(e){var t=Ik.pop()||new Fk;return t.site=e,t}function zk(e){Pk(e),Gk.remove(e),Ik.push(e),bk(e)}function Wk(e){var t=e.circle,n=t.x,r=t.cy,i=[n,r],o=e.P,a=e.N,s=[e];zk(e);for(var l=o;l.circle&&Math.abs(n-l.circle.x)<$k&&Math.abs(r-l.circle.cy)<$k;)o=l.P,s.unshift(l),zk(l),l=o;s.unshift(l),Pk(l);for(var u=a;u.circle&&Math.abs(n-u.circle.x)<$k&&Math.abs(r-u.circle.cy)<$k;)a=u.N,s.push(u),zk(u),u=a;s.push(u),Pk(u);var c,d=s.length;for(c=1;c<d;++c)u=s[c],l=s[c-1],Ek(u.edge,l.site,u.site,i);l=s[0],(u=s[d-1]).edge=Ck(l.site,u.site,null,i),Hk(l),Hk(u)}function Uk(e){for(var t,n,r,i,o=e[0],a=e[1],s=Gk._;s;)if((r=Vk(s,a)-o)>$k)s=s.L;else{if(!((i=o-qk(s,a))>$k)){r>-$k?(t=s.P,n=s):i>-$k?(t=s,n=s.N):t=n=s;break}if(!s.R){t=s;break}s=s.R}!function(e){Xk[e.index]={site:e,halfedges:[]}}(e);var l=Bk(e);if(Gk.insert(t,l),t||n){if(t===n)return Pk(t),n=Bk(t.site),Gk.insert(l,n),l.edge=n.edge=Ck(t.site,l.site),Hk(t),void Hk(n);if(n){Pk(t),Pk(n);var u=t.site,c=u[0],d=u[1],h=e[0]-c,f=e[1]-d,p=n.site,m=p[0]-c,g=p[1]-d,y=2*(h*g-f*m),v=h*h+f*f,_=m*m+g*g,w=[(g*v-f*_)/y+c,(h*_-m*v)/y+d];Ek(n.edge,u,p,w),l.edge=Ck(u,e,null,w),n.edge=Ck(e,p,null,w),Hk(t),Hk(n)}else l.edge=Ck(t.site,l.site)}}function Vk(e,t){var n=e.site,r=n[0],i=n[1],o=i-t;if(!o)return r;var a=e.P;if(!a)return-1/0;var s=(n=a.site)[0],l=n[1],u=l-t;if(!u)return s;var c=s-r,d=1/o-1/u,h=c/u;return d?(-h+Math.sqrt(h*h-2*d*(c*c/(-2*u)-l+u/2+i-o/2)))/d+r:(r+s)/2}function qk(e,t){var n=e.N;if(n)return Vk(n,t);var r=e.site;return r[1]===t?r[0]:1/0}var Gk,Xk,Kk,Jk,$k=1e-6,Zk=1e-12;function Qk(e,t){return t[1]-e[1]||t[0]-e[0]}function eS(e,t){var n,r,i,o=e.sort(Qk).pop();for(Jk=[],Xk=new Array(e.length),Gk=new Tk,Kk=new Tk;;)if(i=Nk,o&&(!i||o[1]<i.y||o[1]===i.y&&o[0]<i.x))o[0]===n&&o[1]===r||(Uk(o),n=o[0],r=o[1]),o=e.pop();else{if(!i)break;Wk(i.arc)}if(function(){for(var e,t,n,r,i=0,o=Xk.length;i<o;++i)if((e=Xk[i])&&(r=(t=e.halfedges).length)){var a=new Array(r),s=new Array(r);for(n=0;n<r;++n)a[n]=n,s[n]=Dk(e,Jk[t[n]]);for(a.sort((function(e,t){return s[t]-s[e]})),n=0;n<r;++n)s[n]=t[a[n]];for(n=0;n<r;++n)t[n]=s[n]}}(),t){var a=+t[0][0],s=+t[0][1],l=+t[1][0],u=+t[1][1];!function(e,t,n,r){for(var i,o=Jk.length;o--;)Ok(i=Jk[o],e,t,n,r)&&Lk(i,e,t,n,r)&&(Math.abs(i[0][0]-i[1][0])>$k||Math.abs(i[0][1]-i[1][1])>$k)||delete Jk[o]}(a,s,l,u),function(e,t,n,r){var i,o,a,s,l,u,c,d,h,f,p,m,g=Xk.length,y=!0;for(i=0;i<g;++i)if(o=Xk[i]){for(a=o.site,s=(l=o.halfedges).length;s--;)Jk[l[s]]||l.splice(s,1);for(s=0,u=l.length;s<u;)p=(f=Ak(o,Jk[l[s]]))[0],m=f[1],d=(c=Rk(o,Jk[l[++s%u]]))[0],h=c[1],(Math.abs(p-d)>$k||Math.abs(m-h)>$k)&&(l.splice(s,0,Jk.push(xk(a,f,Math.abs(p-e)<$k&&r-m>$k?[e,Math.abs(d-e)<$k?h:r]:Math.abs(m-r)<$k&&n-p>$k?[Math.abs(h-r)<$k?d:n,r]:Math.abs(p-n)<$k&&m-t>$k?[n,Math.abs(d-n)<$k?h:t]:Math.abs(m-t)<$k&&p-e>$k?[Math.abs(h-t)<$k?d:e,t]:null))-1),++u);u&&(y=!1)}if(y){var v,_,w,b=1/0;for(i=0,y=null;i<g;++i)(o=Xk[i])&&(w=(v=(a=o.site)[0]-e)*v+(_=a[1]-t)*_)<b&&(b=w,y=o);if(y){var M=[e,t],k=[e,r],S=[n,r],T=[n,t];y.halfedges.push(Jk.push(xk(a=y.site,M,k))-1,Jk.push(xk(a,k,S))-1,Jk.push(xk(a,S,T))-1,Jk.push(xk(a,T,M))-1)}}for(i=0;i<g;++i)(o=Xk[i])&&(o.halfedges.length||delete Xk[i])}(a,s,l,u)}this.edges=Jk,this.cells=Xk,Gk=Kk=Jk=Xk=null}eS.prototype={constructor:eS,polygons:function(){var e=this.edges;return this.cells.map((function(t){var n=t.halfedges.map((function(n){return Rk(t,e[n])}));return n.data=t.site.data,n}))},triangles:function(){var e=[],t=this.edges;return this.cells.forEach((function(n,r){if(o=(i=n.halfedges).length)for(var i,o,a,s,l,u,c=n.site,d=-1,h=t[i[o-1]],f=h.left===c?h.right:h.left;++d<o;)a=f,f=(h=t[i[d]]).left===c?h.right:h.left,a&&f&&r<a.index&&r<f.index&&(l=a,u=f,((s=c)[0]-u[0])*(l[1]-s[1])-(s[0]-l[0])*(u[1]-s[1])<0)&&e.push([c.data,a.data,f.data])})),e},links:function(){return this.edges.filter((function(e){return e.right})).map((function(e){return{source:e.left.data,target:e.right.data}}))},find:function(e,t,n){for(var r,i,o=this,a=o._found||0,s=o.cells.length;!(i=o.cells[a]);)if(++a>=s)return null;var l=e-i.site[0],u=t-i.site[1],c=l*l+u*u;do{i=o.cells[r=a],a=null,i.halfedges.forEach((function(n){var r=o.edges[n],s=r.left;if(s!==i.site&&s||(s=r.right)){var l=e-s[0],u=t-s[1],d=l*l+u*u;d<c&&(c=d,a=s.index)}}))}while(null!==a);return o._found=r,null==n||c<=n*n?i.site:null}};var tS=function(){var e=vk,t=_k,n=null;function r(r){return new eS(r.map((function(n,i){var o=[Math.round(e(n,i,r)/$k)*$k,Math.round(t(n,i,r)/$k)*$k];return o.index=i,o.data=n,o})),n)}return r.polygons=function(e){return r(e).polygons()},r.links=function(e){return r(e).links()},r.triangles=function(e){return r(e).triangles()},r.x=function(t){return arguments.length?(e="function"==typeof t?t:yk(+t),r):e},r.y=function(e){return arguments.length?(t="function"==typeof e?e:yk(+e),r):t},r.extent=function(e){return arguments.length?(n=null==e?null:[[+e[0][0],+e[0][1]],[+e[1][0],+e[1][1]]],r):n&&[[n[0][0],n[0][1]],[n[1][0],n[1][1]]]},r.size=function(e){return arguments.length?(n=null==e?null:[[0,0],[+e[0],+e[1]]],r):n&&[n[1][0]-n[0][0],n[1][1]-n[0][1]]},r},nS=function(e){return function(){return e}};function rS(e,t,n){this.target=e,this.type=t,this.transform=n}function iS(e,t,n){this.k=e,this.x=t,this.y=n}iS.prototype={constructor:iS,scale:function(e){return 1===e?this:new iS(this.k*e,this.x,this.y)},translate:function(e,t){return 0===e&0===t?this:new iS(this.k,this.x+this.k*e,this.y+this.k*t)},apply:function(e){return[e[0]*this.k+this.x,e[1]*this.k+this.y]},applyX:function(e){return e*this.k+this.x},applyY:function(e){return e*this.k+this.y},invert:function(e){return[(e[0]-this.x)/this.k,(e[1]-this.y)/this.k]},invertX:function(e){return(e-this.x)/this.k},invertY:function(e){return(e-this.y)/this.k},rescaleX:function(e){return e.copy().domain(e.range().map(this.invertX,this).map(e.invert,e))},rescaleY:function(e){return e.copy().domain(e.range().map(this.invertY,this).map(e.invert,e))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var oS=new iS(1,0,0);function aS(e){for(;!e.__zoom;)if(!(e=e.parentNode))return oS;return e.__zoom}function sS(){vt.stopImmediatePropagation()}aS.prototype=iS.prototype;var lS=function(){vt.preventDefault(),vt.stopImmediatePropagation()};function uS(){return!vt.ctrlKey&&!vt.button}function cS(){var e=this;return e instanceof SVGElement?(e=e.ownerSVGElement||e).hasAttribute("viewBox")?[[(e=e.viewBox.baseVal).x,e.y],[e.x+e.width,e.y+e.height]]:[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]:[[0,0],[e.clientWidth,e.clientHeight]]}function dS(){return this.__zoom||oS}function hS(){return-vt.deltaY*(1===vt.deltaMode?.05:vt.deltaMode?1:.002)}function fS(){return navigator.maxTouchPoints||"ontouchstart"in this}function pS(e,t,n){var r=e.invertX(t[0][0])-n[0][0],i=e.invertX(t[1][0])-n[1][0],o=e.invertY(t[0][1])-n[0][1],a=e.invertY(t[1][1])-n[1][1];return e.translate(i>r?(r+i)/2:Math.min(0,r)||Math.max(0,i),a>o?(o+a)/2:Math.min(0,o)||Math.max(0,a))}var mS=function(){var e,t,n=uS,r=cS,i=pS,o=hS,a=fS,s=[0,1/0],l=[[-1/0,-1/0],[1/0,1/0]],u=250,c=hr,d=_e("start","zoom","end"),h=500,f=150,p=0;function m(e){e.property("__zoom",dS).on("wheel.zoom",M).on("mousedown.zoom",k).on("dblclick.zoom",S).filter(a).on("touchstart.zoom",T).on("touchmove.zoom",C).on("touchend.zoom touchcancel.zoom",x).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function g(e,t){return(t=Math.max(s[0],Math.min(s[1],t)))===e.k?e:new iS(t,e.x,e.y)}function y(e,t,n){var r=t[0]-n[0]*e.k,i=t[1]-n[1]*e.k;return r===e.x&&i===e.y?e:new iS(e.k,r,i)}function v(e){return[(+e[0][0]+ +e[1][0])/2,(+e[0][1]+ +e[1][1])/2]}function _(e,t,n){e.on("start.zoom",(function(){w(this,arguments).start()})).on("interrupt.zoom end.zoom",(function(){w(this,arguments).end()})).tween("zoom",(function(){var e=this,i=arguments,o=w(e,i),a=r.apply(e,i),s=null==n?v(a):"function"==typeof n?n.apply(e,i):n,l=Math.max(a[1][0]-a[0][0],a[1][1]-a[0][1]),u=e.__zoom,d="function"==typeof t?t.apply(e,i):t,h=c(u.invert(s).concat(l/u.k),d.invert(s).concat(l/d.k));return function(e){if(1===e)e=d;else{var t=h(e),n=l/t[2];e=new iS(n,s[0]-t[0]*n,s[1]-t[1]*n)}o.zoom(null,e)}}))}function w(e,t,n){return!n&&e.__zooming||new b(e,t)}function b(e,t){this.that=e,this.args=t,this.active=0,this.extent=r.apply(e,t),this.taps=0}function M(){if(n.apply(this,arguments)){var e=w(this,arguments),t=this.__zoom,r=Math.max(s[0],Math.min(s[1],t.k*Math.pow(2,o.apply(this,arguments)))),a=It(this);if(e.wheel)e.mouse[0][0]===a[0]&&e.mouse[0][1]===a[1]||(e.mouse[1]=t.invert(e.mouse[0]=a)),clearTimeout(e.wheel);else{if(t.k===r)return;e.mouse=[a,t.invert(a)],Yi(this),e.start()}lS(),e.wheel=setTimeout((function(){e.wheel=null,e.end()}),f),e.zoom("mouse",i(y(g(t,r),e.mouse[0],e.mouse[1]),e.extent,l))}}function k(){if(!t&&n.apply(this,arguments)){var e=w(this,arguments,!0),r=Rt(vt.view).on("mousemove.zoom",(function(){if(lS(),!e.moved){var t=vt.clientX-a,n=vt.clientY-s;e.moved=t*t+n*n>p}e.zoom("mouse",i(y(e.that.__zoom,e.mouse[0]=It(e.that),e.mouse[1]),e.extent,l))}),!0).on("mouseup.zoom",(function(){r.on("mousemove.zoom mouseup.zoom",null),qt(vt.view,e.moved),lS(),e.end()}),!0),o=It(this),a=vt.clientX,s=vt.clientY;Vt(vt.view),sS(),e.mouse=[o,this.__zoom.invert(o)],Yi(this),e.start()}}function S(){if(n.apply(this,arguments)){var e=this.__zoom,t=It(this),o=e.invert(t),a=e.k*(vt.shiftKey?.5:2),s=i(y(g(e,a),t,o),r.apply(this,arguments),l);lS(),u>0?Rt(this).transition().duration(u).call(_,s,t):Rt(this).call(m.transform,s)}}function T(){if(n.apply(this,arguments)){var t,r,i,o,a=vt.touches,s=a.length,l=w(this,arguments,vt.changedTouches.length===s);for(sS(),r=0;r<s;++r)i=a[r],o=[o=Bt(this,a,i.identifier),this.__zoom.invert(o),i.identifier],l.touch0?l.touch1||l.touch0[2]===o[2]||(l.touch1=o,l.taps=0):(l.touch0=o,t=!0,l.taps=1+!!e);e&&(e=clearTimeout(e)),t&&(l.taps<2&&(e=setTimeout((function(){e=null}),h)),Yi(this),l.start())}}function C(){if(this.__zooming){var t,n,r,o,a=w(this,arguments),s=vt.changedTouches,u=s.length;for(lS(),e&&(e=clearTimeout(e)),a.taps=0,t=0;t<u;++t)n=s[t],r=Bt(this,s,n.identifier),a.touch0&&a.touch0[2]===n.identifier?a.touch0[0]=r:a.touch1&&a.touch1[2]===n.identifier&&(a.touch1[0]=r);if(n=a.that.__zoom,a.touch1){var c=a.touch0[0],d=a.touch0[1],h=a.touch1[0],f=a.touch1[1],p=(p=h[0]-c[0])*p+(p=h[1]-c[1])*p,m=(m=f[0]-d[0])*m+(m=f[1]-d[1])*m;n=g(n,Math.sqrt(p/m)),r=[(c[0]+h[0])/2,(c[1]+h[1])/2],o=[(d[0]+f[0])/2,(d[1]+f[1])/2]}else{if(!a.touch0)return;r=a.touch0[0],o=a.touch0[1]}a.zoom("touch",i(y(n,r,o),a.extent,l))}}function x(){if(this.__zooming){var e,n,r=w(this,arguments),i=vt.changedTouches,o=i.length;for(sS(),t&&clearTimeout(t),t=setTimeout((function(){t=null}),h),e=0;e<o;++e)n=i[e],r.touch0&&r.touch0[2]===n.identifier?delete r.touch0:r.touch1&&r.touch1[2]===n.identifier&&delete r.touch1;if(r.touch1&&!r.touch0&&(r.touch0=r.touch1,delete r.touch1),r.touch0)r.touch0[1]=this.__zoom.invert(r.touch0[0]);else if(r.end(),2===r.taps){var a=Rt(this).on("dblclick.zoom");a&&a.apply(this,arguments)}}}return m.transform=function(e,t,n){var r=e.selection?e.selection():e;r.property("__zoom",dS),e!==r?_(e,t,n):r.interrupt().each((function(){w(this,arguments).start().zoom(null,"function"==typeof t?t.apply(this,arguments):t).end()}))},m.scaleBy=function(e,t,n){m.scaleTo(e,(function(){var e=this.__zoom.k,n="function"==typeof t?t.apply(this,arguments):t;return e*n}),n)},m.scaleTo=function(e,t,n){m.transform(e,(function(){var e=r.apply(this,arguments),o=this.__zoom,a=null==n?v(e):"function"==typeof n?n.apply(this,arguments):n,s=o.invert(a),u="function"==typeof t?t.apply(this,arguments):t;return i(y(g(o,u),a,s),e,l)}),n)},m.translateBy=function(e,t,n){m.transform(e,(function(){return i(this.__zoom.translate("function"==typeof t?t.apply(this,arguments):t,"function"==typeof n?n.apply(this,arguments):n),r.apply(this,arguments),l)}))},m.translateTo=function(e,t,n,o){m.transform(e,(function(){var e=r.apply(this,arguments),a=this.__zoom,s=null==o?v(e):"function"==typeof o?o.apply(this,arguments):o;return i(oS.translate(s[0],s[1]).scale(a.k).translate("function"==typeof t?-t.apply(this,arguments):-t,"function"==typeof n?-n.apply(this,arguments):-n),e,l)}),o)},b.prototype={start:function(){return 1==++this.active&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(e,t){return this.mouse&&"mouse"!==e&&(this.mouse[1]=t.invert(this.mouse[0])),this.touch0&&"touch"!==e&&(this.touch0[1]=t.invert(this.touch0[0])),this.touch1&&"touch"!==e&&(this.touch1[1]=t.invert(this.touch1[0])),this.that.__zoom=t,this.emit("zoom"),this},end:function(){return 0==--this.active&&(delete this.that.__zooming,this.emit("end")),this},emit:function(e){St(new rS(m,e,this.that.__zoom),d.apply,d,[e,this.that,this.args])}},m.wheelDelta=function(e){return arguments.length?(o="function"==typeof e?e:nS(+e),m):o},m.filter=function(e){return arguments.length?(n="function"==typeof e?e:nS(!!e),m):n},m.touchable=function(e){return arguments.length?(a="function"==typeof e?e:nS(!!e),m):a},m.extent=function(e){return arguments.length?(r="function"==typeof e?e:nS([[+e[0][0],+e[0][1]],[+e[1][0],+e[1][1]]]),m):r},m.scaleExtent=function(e){return arguments.length?(s[0]=+e[0],s[1]=+e[1],m):[s[0],s[1]]},m.translateExtent=function(e){return arguments.length?(l[0][0]=+e[0][0],l[1][0]=+e[1][0],l[0][1]=+e[0][1],l[1][1]=+e[1][1],m):[[l[0][0],l[0][1]],[l[1][0],l[1][1]]]},m.constrain=function(e){return arguments.length?(i=e,m):i},m.duration=function(e){return arguments.length?(u=+e,m):u},m.interpolate=function(e){return arguments.length?(c=e,m):c},m.on=function(){var e=d.on.apply(d,arguments);return e===d?m:e},m.clickDistance=function(e){return arguments.length?(p=(e=+e)*e,m):Math.sqrt(p)},m},gS=n(123),yS=n.n(gS),vS=n(124),_S=n.n(vS),wS=n(125),bS=n.n(wS);var MS={getNoCacheString:function(){const e=new Date;return[e.getUTCMilliseconds(),e.getUTCSeconds(),e.getUTCMinutes(),e.getUTCHours(),e.getUTCDay(),e.getUTCMonth(),e.getUTCFullYear()].join("-")},toDisplayNumber:function(e,t){function n(e){return(.01*Math.round(100*e)).toFixed(2)}return`${n(e)} &#177; ${n(t)}`},capitalize:function(e){return e.replace(/(?:^|\s)\S/g,e=>e.toUpperCase())},getRoot:function(){return window.CAULDRON=window.CAULDRON||{},window.CAULDRON}};const kS=['<div class="cd-body-header">','<div class="menu-icon"></div>','<div class="project-title"></div>','<div class="spacer"></div>','<div class="buttons"></div>',"</div>"];var SS={createHeader:function(){const e=MS.getRoot(),t=o()(kS.join("")).prependTo(o()(".body-wrapper"));e.RESULTS.has_error&&t.addClass("project-error")}};function TS(e){const t=MS.getRoot();let n;const r=`?nocache=${MS.getNoCacheString()}`;if(n=e.src.startsWith(":")?e.src.slice(1):t.DATA_DIRECTORY+e.src,window.document.getElementById(e.name))return Promise.resolve();function i(e,t){setTimeout(()=>e(t),250)}function s(e,t){t.remove(),e(new Error(`Unable to load "${n}"`))}return/.*\.css$/.test(n)?new Promise((t,a)=>{const o=document.createElement("link");o.rel="stylesheet",o.onload=i.bind(null,t,o),o.onerror=s.bind(null,a,o),o.href=n+r,o.id=e.name,document.head.appendChild(o)}):/.*\.js$/.test(n)?new Promise((t,a)=>{const o=document.createElement("script");o.onload=i.bind(null,t,o),o.onerror=s.bind(null,a,o),o.src=n+r,o.id=e.name,document.head.appendChild(o)}):Promise.reject()}function CS(e){return e?Promise.all(e.map(TS)):Promise.resolve([])}var xS={loadSourceFile:TS,loadSourceFiles:CS,loadStepBody:function(e){return e&&e.body_file&&!e.body?TS({name:`cauldron-step-body:${e.body_file}`,src:`/${e.body_file}`}).catch(()=>null).then(()=>{const t=window.STEP_BODIES||{};return e.body=t[e.body_file]||"",e}):Promise.resolve(e)},loadStepIncludes:function(e){if(!e)return Promise.resolve([]);const t=e.filter(e=>e).map(e=>CS(e.includes));return Promise.all(t)}};let ES,LS,OS;function DS(e){if(!e||e.hasClass("cd-project-step--selected"))return;e.addClass("cd-project-step--selected");const t=e.find(".cd-project-step__header");t.addClass("cd-project-step__header--selected").removeClass(t.attr("data-default-modifier"))}function RS(e){return e&&(ES=e),LS?Promise.resolve(ES):new Promise(e=>{LS=setTimeout((function(){!function(){const e=ES;LS=null,e&&o()(".body-wrapper").find(".cd-project-step").each((t,n)=>{const r=o()(n);r.attr("data-step-name")===e.name?DS(r):function(e){e.removeClass("cd-project-step--selected");const t=e.find(".cd-project-step__header");t.removeClass("cd-project-step__header--selected").addClass(t.attr("data-default-modifier"))}(r)})}(),e(ES)}),10)})}function AS(e){if(!e||!e.body)return null;const t=MS.getRoot(),n=o()(e.body);return n.find("[data-src]").each((e,n)=>{const r=o()(n),i=function(e){const t=e.attr("data-src");return t&&t.startsWith("/")?t.slice(1):t}(r);r.attr("src",`${t.DATA_DIRECTORY}/${i}?nocache=${t.getNoCacheString()}`),r.attr("data-src",null)}),n}function CdBodySequences(){const e={};return o()(".body-wrapper").find(".cd-ProjectStep__bodyInner[data-body-id]").each((t,n)=>{const r=o()(n),i=r.closest(".cd-project-step").attr("data-step-name"),a=parseInt(r.attr("data-body-sequence"),10);i&&!Number.isNaN(a)&&(e[i]={body_id:r.attr("data-body-id"),sequence:a})}),e}function CdAppendStepBody(e,t){const n=e.find(".cd-ProjectStep__bodyInner"),r=0===t.start,i=n.attr("data-body-id")===t.body_id&&parseInt(n.attr("data-body-sequence"),10)===t.start;if(0===n.length||!r&&!i)return void n.removeAttr("data-body-id");n.find(".cd-ProjectStep__pending").remove(),r&&n.empty();const a=AS({body:`<div>${t.chunks.join("")}</div>`});n.append(a.contents()),t.pending&&n.append(`<div class="cd-ProjectStep__pending">${t.pending}</div>`),n.attr("data-body-id",t.body_id).attr("data-body-sequence",t.sequence),(t.chunks.length>0||t.pending)&&n.parent().show(),e.find(".cd-step-status").remove(),e.find('.step-anchor[data-type="--end"]').before(t.progress||"")}var NS={getBodySequences:CdBodySequences,prepareStepBody:AS,processStepUpdates:function(e,t){if(!e)return Promise.resolve();OS||(OS=window.CD.on.ready),t&&(ES=t);const n=e.map(e=>e.step);return OS=OS.then(()=>xS.loadStepIncludes(n)).then(()=>(function(e){const t=o()(".body-wrapper");let n;return e.forEach(e=>{const r=o()(`[data-step-name="${e.name}"]`);if("removed"===e.action)return void r.remove();if("appended"===e.action)return void CdAppendStepBody(r,e.step);let i=AS(e.step);ES&&e.name===ES.name&&DS(i),"updated"!==e.action?("modified"===e.action&&((i=t.find(`[data-step-name="${e.name}"]`)).find(".cd-step-title").html(e.title||e.name),i.detach()),(n=e.after?t.find(`[data-step-name="${e.after}"]`):t.find(".cd-body-header").after(i))&&n.length>0?n.after(i):e.after?t.append(i):t.prepend(i)):r.replaceWith(i)}),o()(window).trigger("resize"),RS()})(e))},updateSelectedStep:RS};function YS(){const e=MS.getRoot();!function(){const e=MS.getRoot(),{sid:t}=e.PARAMS,n=o()("body");!!t&&(o()("<div></div>").addClass("snapshot-bar").text(`Snapshot: ${t}`).prependTo(n),o()("<div></div>").addClass("snapshot-bar").addClass("snapshot-bar-overlay").text(`Snapshot: ${e.PARAMS.sid}`).prependTo(n),e.TITLE=`{${t}} ${e.TITLE}`)}(),o()("title").text(e.TITLE),e.SETTINGS.headerless||(SS.createHeader(),o()(".cd-body-header").find(".project-title").text(e.TITLE))}function CdDisplaySteps(e){const t=o()(".body-wrapper"),n=new Map;function r(e){const t=n.get(e);return n.delete(e),xS.loadStepBody(t).then(()=>{const n=o()(e);if(0===n.closest("body").length)return;const r=NS.prepareStepBody(t);r?n.replaceWith(r):n.remove(),o()(window).trigger("resize")})}const i=window.IntersectionObserver?new window.IntersectionObserver(e=>{e.filter(e=>e.isIntersecting).forEach(e=>{i.unobserve(e.target),r(e.target)})},{rootMargin:"100% 0px"}):null;e.forEach(e=>{if(!e.body_file||e.body){const n=NS.prepareStepBody(e);return void(n&&t.append(n))}const a=o()('<div class="cd-project-step"></div>').attr("data-step-name",e.name).css("min-height","200px").append(o()('<a class="step-anchor" data-type=""></a>').attr("name",e.name));t.append(a),n.set(a[0],e),i?i.observe(a[0]):r(a[0])})}var jS={initialize:function(){const e=MS.getRoot();return e.DATA_DIRECTORY=function(){const e=MS.getRoot();if(window.PROJECT_DIRECTORY)return window.PROJECT_DIRECTORY;if(e.PARAMS.data_root)return e.PARAMS.data_root;const t=e.PARAMS.id||window.PROJECT_ID,{sid:n}=e.PARAMS;return["reports",t||"",n?"snapshots":"latest",n||""].filter(e=>e.length>0).join("/")}(),(MS.getRoot().PARAMS.preload_url,Promise.resolve()).then(()=>window.RESULTS?Promise.resolve():window.RESULTS_FILENAME?xS.loadSourceFile({name:"cauldron-project",src:`:${window.RESULTS_FILENAME}`}):xS.loadSourceFile({name:"cauldron-project",src:"/results.js"})).then(()=>(window.CAULDRON_VERSION=window.RESULTS.cauldron_version,e.RESULTS=window.RESULTS,e.DATA=window.RESULTS.data,e.SETTINGS=window.RESULTS.settings,e.TITLE=e.SETTINGS.title||e.SETTINGS.id,function(){const e=MS.getRoot();return window.COMBINED_INCLUDES?xS.loadSourceFiles(window.COMBINED_INCLUDES):xS.loadSourceFiles(window.RESULTS.includes).then(()=>xS.loadStepIncludes(e.RESULTS.steps))}())).then(()=>(CdDisplaySteps(window.RESULTS.steps),o()(window).trigger("resize"),e.DATA)).then(YS)}};var HS={parseUrlParameters:function(){return document.location.search.replace(/(^\?)/,"").split("&").map(e=>e.split("=")).filter(e=>2===e.length).reduce((e,[t,n])=>{const r=e;return r[t]=function(e){return!(t=e)||/[^0-9.-]+/.test(t)||(t.match(/\.+/g)||[]).length>1||-1!==t.slice(1).indexOf("-")?"true"===e.toLowerCase()||"false"!==e.toLowerCase()&&decodeURIComponent(e):-1===e.indexOf(".")?parseInt(e,10):parseFloat(e);var t}(n),r},{})}};var PS={scrollToAnchor:function(e,t,n){const r=o()(window).height(),i=o()(".body-wrapper").find(`.cd-project-step[data-step-name='${e}']`),a=i.height()<r-100,s=t&&!a?`${e}--${t}`:e,l=o()("html, body"),u=i.find(`a[name='${s}']`).offset().top-(a?0:"end"===t?r-100:0);l.stop(!0).animate({scrollTop:u},n||"slow")},changeFontSize:function(e,t){const n=o()(e),r=function(){if(!t)return parseFloat(n.attr("data-font-size-default"));const e=parseFloat(n.attr("data-font-size"));return Math.max(.1,e+.1*t)}();n.attr("data-font-size",r).css("font-size",`${r}em`)},collapse:function(e){const t=o()(`#${e}`),n=t.hasClass("closed"),r=t.attr(`data-${n?"opens":"closes"}`),i=(t.attr(`data-marks-${n?"opened":"closed"}`)||"").split("|").map(e=>o()(e));i.push(t),i.forEach(e=>{n?e.removeClass("closed").addClass("opened"):e.removeClass("opened").addClass("closed")}),r?(r.split("|").forEach(e=>{const r=o()(e);n?(r.show(),t.removeClass("closed")):(r.hide(),r.addClass("closed"))}),setTimeout(()=>o()(window).resize(),100)):o()(window).resize()},toggleVisible:function(e){o()(e).toggle()}};let IS;function FS(e){const t=o()(".body-wrapper");return Object.keys(e).forEach(n=>(function(e,t,n){const r=t[n],i=e.find(`[data-step-name="${n}"]`);i.attr("data-step-rename",r.name),i.find(".cd-step-title").html(r.title||r.name)})(t,e,n)),t.find("[data-step-rename]").each((e,t)=>(function(e){const t=o()(e),n=t.attr("data-step-rename");t.attr("data-step-rename",null).attr("data-step-name",n).find(".step-anchor").each((e,t)=>{const r=o()(t);r.attr("name",`${n}${r.attr("data-type")}`)})})(t)),Promise.resolve(e)}var BS={processStepRenames:function(e){return e?(IS||(IS=window.CD.on.ready),IS=IS.then(()=>FS(e))):Promise.resolve(e)}};let zS=-100,WS=!1;function US(e){const t=o()(e),n=t.parent(),r=t.parents(".cd-project-step-body").hasClass("closed"),i=t.parents(".cd-plotly-box-v2");r||WS||window.Plotly.relayout(t[0],{width:(i||n).width(),height:(i||n).height()})}function VS(){window.Plotly&&o()(".cd-plotly-box, .cd-plotly-box-v2").each((e,t)=>{US(o()(t).find(".plotly-graph-div"))})}function qS(){const e=MS.getRoot();if(!e.RUNNING||WS)return;const t=o()(window).width();Math.abs(t-zS)<10||(zS=t,e.resizeCallbacks.forEach(e=>e()),VS())}window.onresize=qS;var GS={pauseResizing:function(){WS=!0},resumeResizing:function(){WS=!1,setTimeout(qS,100)},resizePlotly:VS,resizePlotlyBox:US};n(132);function XS(){const e=MS.getRoot();e.RUNNING=!0,e.__on__.ready(),o()(window).resize()}window.$=o.a,window.jQuery=o.a,window.d3=r,window.Handsontable=yS.a,window.katex=_S.a,window.jstree=bS.a,window.require=function(e,t){const n=[];e.forEach(e=>{"plotly"===e&&n.push(window.Plotly)}),t.apply(this,n)},document.addEventListener("readystatechange",()=>{"complete"===document.readyState&&function(){const e=MS.getRoot();e.RUNNING=!1,e.SETTINGS={},e.notebookVersion=1,e.resizeCallbacks=[],e.PARAMS=HS.parseUrlParameters(),e.capitalize=MS.capitalize,e.getNoCacheString=MS.getNoCacheString,e.toDisplayNumber=MS.toDisplayNumber,e.scrollToAnchor=PS.scrollToAnchor,e.changeFontSize=PS.changeFontSize,e.collapse=PS.collapse,e.toggleVisible=PS.toggleVisible,e.processStepRenames=BS.processStepRenames,e.getBodySequences=NS.getBodySequences,e.prepareStepBody=NS.prepareStepBody,e.processStepUpdates=NS.processStepUpdates,e.updateSelectedStep=NS.updateSelectedStep,e.pauseResizing=GS.pauseResizing,e.resumeResizing=GS.resumeResizing,e.resizePlotly=GS.resizePlotly,e.resizePlotlyBox=GS.resizePlotlyBox,jS.initialize().then(XS)}()})}]);
\ No newline at end of file
@@ -7,6 +7,8 @@ import typing
 import cauldron
 from cauldron import environ
 from cauldron.environ import Response
+from cauldron.runner import checkpoints
+from cauldron.runner import scheduling
 from cauldron.runner import source
 from cauldron.session.projects import Project
 from cauldron.session.projects import ProjectStep
@@ -171,13 +173,23 @@ def reload_libraries(library_directories: list = None) -> list:
     ]
 
 
+def _is_executed(step: ProjectStep, force: bool) -> bool:
+    """
+    Whether or not running the step will execute it instead of skipping it
+    because it is muted or has nothing to update. Only the steps that are
+    executed have their shared values checkpointed afterward.
+    """
+    return not step.is_muted and (force or step.is_dirty())
+
+
 def section(
         response: Response,
         project: typing.Union[Project, None],
         starting: ProjectStep = None,
         limit: int = 1,
         force: bool = False,
-        skips: typing.List[ProjectStep] = None
+        skips: typing.List[ProjectStep] = None,
+        checkpoint: bool = False
 ) -> list:
     """
 
@@ -188,6 +200,9 @@ def section(
     :param force:
     :param skips:
         Steps that should be skipped while running this section
+    :param checkpoint:
+        Whether or not to save a checkpoint of the shared values after each
+        step that runs successfully.
     :return:
     """
 
@@ -217,9 +232,13 @@ def section(
             continue
 
         steps_run.append(ps)
+        is_executed = _is_executed(ps, force)
         if not source.run_step(response, project, ps, force=force):
             return steps_run
 
+        if checkpoint and is_executed:
+            checkpoints.save(project, ps)
+
         count += 1
 
     return steps_run
@@ -230,7 +249,9 @@ def complete(
         project: typing.Union[Project, None],
         starting: ProjectStep = None,
         force: bool = False,
-        limit: int = -1
+        limit: int = -1,
+        max_workers: int = 1,
+        checkpoint: bool = False
 ) -> list:
     """
     Runs the entire project, writes the results files, and returns the URL to
@@ -241,6 +262,13 @@ def complete(
     :param starting:
     :param force:
     :param limit:
+    :param max_workers:
+        The maximum number of steps that can be run simultaneously. When
+        greater than one, steps that do not share any `cauldron.shared`
+        variables are run concurrently in separate processes.
+    :param checkpoint:
+        Whether or not to save a checkpoint of the shared values after each
+        step that runs successfully.
     :return:
         Local URL to the report path
     """
@@ -253,6 +281,21 @@ def complete(
         starting_index = project.steps.index(starting)
     count = 0
 
+    if max_workers > 1 and scheduling.is_available():
+        steps_to_run = _list_parallel_steps(
+            project,
+            starting_index,
+            force,
+            limit
+        )
+        return scheduling.run(
+            response,
+            project,
+            steps_to_run,
+            max_workers,
+            checkpoint
+        )
+
     steps_run = []
 
     for ps in project.steps:
@@ -272,8 +315,68 @@ def complete(
         count += 1
 
         steps_run.append(ps)
+        is_executed = _is_executed(ps, force=True)
         success = source.run_step(response, project, ps, force=True)
+        if success and checkpoint and is_executed:
+            checkpoints.save(project, ps)
+
         if not success or project.stop_condition.halt:
             return steps_run
 
     return steps_run
+
+
+def _list_parallel_steps(
+        project: Project,
+        starting_index: int,
+        force: bool,
+        limit: int
+) -> typing.List[ProjectStep]:
+    """
+    Lists the steps that a complete run would execute sequentially. Running
+    a python step makes the later steps that consume its shared variables
+    dirty, which is accounted for up front here given that the steps will
+    not be run one at a time. The variables a step will change are predicted
+    from both its source code and its most recent execution, and include the
+    variables it reads given that those can be modified in place.
+    """
+    out = []
+    changed = set()
+    everything_changed = False
+
+    for ps in project.steps[starting_index:]:
+        if 0 < limit <= len(out):
+            break
+
+        if ps.is_muted:
+            environ.log('[{}]: Muted (skipped)'.format(ps.definition.name))
+            continue
+
+        access = ps.shared_access
+        is_affected = everything_changed or (
+            access is not None
+            and bool(
+                (access.reads_all and changed)
+                or changed & (access.reads | access.writes)
+            )
+        )
+
+        if not force and not is_affected and not ps.is_dirty():
+            if limit < 1:
+                environ.log(
+                    '[{}]: Nothing to update'.format(ps.definition.name)
+                )
+            continue
+
+        out.append(ps)
+
+        if not source.has_extension(ps.source_path, 'py'):
+            continue
+
+        predicted = scheduling.get_step_access(ps)
+        everything_changed = everything_changed or predicted.opaque
+        changed.update(predicted.reads | predicted.writes)
+        if access is not None:
+            changed.update(access.reads | access.writes)
+
+    return out
@@ -0,0 +1,345 @@
+import json
+import os
+import pickle
+import time
+import typing
+import uuid
+import weakref
+from collections import namedtuple
+
+from cauldron import environ
+from cauldron import writer
+from cauldron.environ import Response
+from cauldron.runner import step_cache
+from cauldron.session import caching
+from cauldron.session import projects
+
+CHECKPOINT_STATE = namedtuple('CHECKPOINT_STATE', ['files', 'identities'])
+
+#: The files and identities of the shared values in the most recently saved
+#: or restored checkpoint of each shared cache. Values that have the same
+#: identity when the next checkpoint is saved and were not accessed by the
+#: step in between reuse their existing files instead of being written again.
+#: Identities are stored as tokens so that replaced values are not kept alive.
+_states = weakref.WeakKeyDictionary()
+
+
+def is_enabled(project: 'projects.Project') -> bool:
+    """
+    Whether or not the project has been configured to save a checkpoint of
+    its shared values after each successful step, which is turned on by
+    setting the `checkpoints` value to true in the project's cauldron.json
+    file. Checkpoints can also be enabled for a single run with the run
+    command's `--checkpoint` flag.
+    """
+    return bool(project.settings.fetch('checkpoints', False))
+
+
+def get_directory(project: 'projects.Project') -> str:
+    """Directory where the checkpoints for the project are stored."""
+    return os.path.join(project.results_path, '.cache', 'checkpoints')
+
+
+def get_manifest_path(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep'
+) -> str:
+    """Path to the file that describes the checkpoint of the given step."""
+    return os.path.join(
+        get_directory(project),
+        '{}.json'.format(step.filename)
+    )
+
+
+def get_report_path(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep'
+) -> str:
+    """Path to the file where the report of the checkpointed step is stored."""
+    return os.path.join(
+        get_directory(project),
+        'reports',
+        '{}.pickle'.format(step.filename)
+    )
+
+
+def _load_manifest(path: str) -> typing.Optional[dict]:
+    """Loads the checkpoint manifest at the path if it can be read."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _remove_file(path: str):
+    """Removes the file at the path if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _prune(project: 'projects.Project'):
+    """
+    Removes the value files that are no longer referenced by any of the
+    checkpoint manifests of the project.
+    """
+    directory = get_directory(project)
+    referenced = set()
+    for filename in os.listdir(directory):
+        if not filename.endswith('.json'):
+            continue
+        manifest = _load_manifest(os.path.join(directory, filename)) or {}
+        referenced.update(manifest.get('values', {}).values())
+
+    values_directory = os.path.join(directory, 'values')
+    for filename in os.listdir(values_directory):
+        if filename not in referenced:
+            _remove_file(os.path.join(values_directory, filename))
+
+
+def remove_later(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep'
+):
+    """
+    Removes the checkpoints of all steps after the given step, which are no
+    longer consistent with the shared values once the step has run again.
+    """
+    for s in project.steps[step.index + 1:]:
+        _remove_file(get_manifest_path(project, s))
+        _remove_file(get_report_path(project, s))
+
+
+def save(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep'
+) -> bool:
+    """
+    Saves a checkpoint of the project's shared values and of the step's
+    report after the successful execution of the step. Each shared value is
+    stored in its own file, with numeric NumPy arrays written in the npy
+    format and all other values pickled. Values that were neither replaced
+    nor accessed by the step since the previous checkpoint are not written
+    again and share the files of the previous checkpoint instead. Values
+    that cannot be pickled are left out of the checkpoint.
+
+    :param project:
+        Project in which the step was executed.
+    :param step:
+        The step that was executed.
+    :return:
+        Whether or not the checkpoint was saved.
+    """
+    directory = get_directory(project)
+    values_directory = os.path.join(directory, 'values')
+    os.makedirs(values_directory, exist_ok=True)
+
+    shared = project.shared
+    previous = _states.get(shared) or CHECKPOINT_STATE({}, {})
+    identities = shared.get_identities(tokens=True)
+
+    # In-place modifications cannot be detected, which means that every value
+    # read by the step is written again. Steps run without tracking access to
+    # the shared values, e.g. in parallel, write all of their values.
+    access = step.shared_access
+    accessed = (
+        set(access.reads) | set(access.writes)
+        if access is not None else
+        None
+    )
+
+    files = {}
+    skipped = []
+    for name, identity in identities.items():
+        filename = previous.files.get(name)
+        is_unchanged = (
+            filename is not None
+            and accessed is not None
+            and name not in accessed
+            and previous.identities.get(name) is identity
+            and os.path.exists(os.path.join(values_directory, filename))
+        )
+        if is_unchanged:
+            files[name] = filename
+            continue
+
+        path = os.path.join(values_directory, uuid.uuid4().hex)
+        try:
+            files[name] = os.path.basename(caching.spill(
+                shared.fetch(name),
+                path
+            ))
+        except Exception:
+            skipped.append(name)
+
+    if skipped:
+        environ.log(
+            '[{}]: Unable to checkpoint shared values: {}'.format(
+                step.definition.name,
+                ', '.join(sorted(skipped))
+            )
+        )
+
+    report = step.report
+    report_path = get_report_path(project, step)
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    try:
+        report_contents = pickle.dumps(
+            dict(
+                body=list(report.body),
+                css=list(report.css),
+                library_includes=list(report.library_includes),
+                data=dict(report.data.fetch(None)),
+                files=dict(report.files.fetch(None)),
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+    except Exception:
+        report_contents = None
+
+    if report_contents is not None:
+        writer.write_file_atomically(report_path, report_contents, mode='wb')
+    else:
+        _remove_file(report_path)
+
+    manifest = dict(
+        version=environ.version,
+        key=step_cache.get_key(project, step),
+        step=step.filename,
+        timestamp=time.time(),
+        values=files,
+        skipped=skipped
+    )
+    success, error = writer.write_file_atomically(
+        get_manifest_path(project, step),
+        json.dumps(manifest, indent=2)
+    )
+    if not success:
+        return False
+
+    _states[shared] = CHECKPOINT_STATE(files, identities)
+    remove_later(project, step)
+    _prune(project)
+    return True
+
+
+def _restore_report(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep'
+):
+    """
+    Restores the report of the step from its checkpoint if one exists and
+    marks the step as no longer needing to be run.
+    """
+    try:
+        with open(get_report_path(project, step), 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        entry = None
+
+    if entry is not None:
+        report = step.report
+        report.clear()
+        report.body = list(entry['body'])
+        report.css = list(entry['css'])
+        report.library_includes = list(entry['library_includes'])
+        report.data.put(**entry['data'])
+        report.files.put(**entry['files'])
+        report.update_last_modified()
+
+    step.mark_dirty(False)
+
+
+def restore(
+        response: Response,
+        project: 'projects.Project',
+        step: 'projects.ProjectStep',
+        force: bool = False
+) -> bool:
+    """
+    Restores the shared values of the project to their state in the
+    checkpoint saved after the last step that precedes the given step, along
+    with the reports of all of the preceding steps, so that the project can
+    be resumed from the given step without running the steps before it.
+
+    :param response:
+        Response in which to report failures to restore the checkpoint.
+    :param project:
+        Project that will be resumed.
+    :param step:
+        The step from which the project will be resumed.
+    :param force:
+        Whether or not to restore the checkpoint even when the source code
+        of the project has been modified since the checkpoint was saved.
+    :return:
+        Whether or not the checkpoint was restored.
+    """
+    previous_steps = [s for s in project.steps[:step.index] if not s.is_muted]
+    if not previous_steps:
+        project.shared.clear()
+        _states.pop(project.shared, None)
+        return True
+
+    checkpoint_step = previous_steps[-1]
+    manifest = _load_manifest(get_manifest_path(project, checkpoint_step))
+    if manifest is None:
+        response.fail(
+            code='NO_CHECKPOINT',
+            message='No checkpoint exists for step "{}"'.format(
+                checkpoint_step.definition.name
+            )
+        ).console(whitespace=1)
+        return False
+
+    if not force and manifest['key'] != step_cache.get_key(
+            project,
+            checkpoint_step
+    ):
+        response.fail(
+            code='STALE_CHECKPOINT',
+            message=(
+                'The checkpoint for step "{}" was saved before the project '
+                'was modified. Use the --force flag to restore it anyway.'
+            ).format(checkpoint_step.definition.name)
+        ).console(whitespace=1)
+        return False
+
+    values_directory = os.path.join(get_directory(project), 'values')
+    try:
+        values = {
+            name: caching.unspill(os.path.join(values_directory, filename))
+            for name, filename in manifest['values'].items()
+        }
+    except Exception as error:
+        response.fail(
+            code='CHECKPOINT_ERROR',
+            message='Unable to load checkpoint for step "{}"'.format(
+                checkpoint_step.definition.name
+            ),
+            error=error
+        ).console(whitespace=1)
+        return False
+
+    project.shared.clear()
+    project.shared.put(**values)
+    _states[project.shared] = CHECKPOINT_STATE(
+        dict(manifest['values']),
+        project.shared.get_identities(tokens=True)
+    )
+
+    for s in previous_steps:
+        _restore_report(project, s)
+
+    environ.log('[{}]: Restored checkpoint{}'.format(
+        checkpoint_step.definition.name,
+        (
+            ' without shared values: {}'.format(
+                ', '.join(manifest['skipped'])
+            )
+            if manifest['skipped'] else
+            ''
+        )
+    ))
+    return True
@@ -3,6 +3,25 @@ from cauldron import templating
 from cauldron.session import projects
 
 
+def get_template_variables(
+        project: 'projects.Project',
+        template: str
+) -> dict:
+    """
+    Returns the shared variables used by the template string, which are
+    fetched individually so that only those values need to be loaded when
+    the shared cache has spilled values to disk.
+
+    :param project:
+        The project whose shared variables are used in the template.
+    :param template:
+        The template string of the step.
+    """
+    shared = project.shared
+    names = set(shared.get_keys()) & templating.get_variable_names(template)
+    return {name: shared.fetch(name) for name in names}
+
+
 def run(
         project: 'projects.Project',
         step: 'projects.ProjectStep'
@@ -19,7 +38,7 @@ def run(
 
     step.report.append_body(render.html(templating.render(
         template=code,
-        **project.shared.fetch(None)
+        **get_template_variables(project, code)
     )))
 
     return {'success': True}
@@ -1,5 +1,6 @@
 import cauldron
 from cauldron import templating
+from cauldron.runner import html_file
 from cauldron.session import projects
 
 
@@ -20,7 +21,8 @@ def run(
         code = f.read()
 
     try:
-        cauldron.display.markdown(code, **project.shared.fetch(None))
+        variables = html_file.get_template_variables(project, code)
+        cauldron.display.markdown(code, **variables)
         return {'success': True}
     except Exception as err:
         return dict(
@@ -0,0 +1,223 @@
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+import typing
+
+from cauldron import environ
+from cauldron import writer
+from cauldron.session import projects
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # The resource module is only available on Unix platforms, where it is
+    # used to measure the peak resident memory and block I/O of the process.
+    resource = None
+
+#: Number of source lines with the largest memory allocations that remain
+#: after a step has run that are included in its profile.
+TOP_ALLOCATORS_COUNT = 10
+
+
+def is_enabled(project: 'projects.Project') -> bool:
+    """
+    Whether or not steps in the project are profiled when they run, which
+    is turned on by setting the `profiling` value to true in the project's
+    cauldron.json file or in the Cauldron configs. Profiling adds overhead
+    to the execution of the steps and is therefore disabled by default.
+    """
+    return bool(project.get_setting('profiling'))
+
+
+def is_cprofile_enabled(project: 'projects.Project') -> bool:
+    """
+    Whether or not a cProfile statistics file is written for each profiled
+    step, which is turned on with the `profiling_cprofile` setting.
+    """
+    return bool(project.get_setting('profiling_cprofile'))
+
+
+def get_profile_path(step: 'projects.ProjectStep') -> str:
+    """
+    Path where the profile of the step's most recent execution is stored,
+    which is alongside the cached results of the step.
+    """
+    cache_path = step.report.results_cache_path
+    if not cache_path:
+        return ''
+    return '{}.profile.json'.format(os.path.splitext(cache_path)[0])
+
+
+def get_stats_path(step: 'projects.ProjectStep') -> str:
+    """
+    Path where the cProfile statistics of the step's most recent execution
+    are stored, which can be loaded with the pstats module.
+    """
+    cache_path = step.report.results_cache_path
+    if not cache_path:
+        return ''
+    return '{}.prof'.format(os.path.splitext(cache_path)[0])
+
+
+def _get_usage() -> typing.Optional[typing.Any]:
+    """Resource usage of the process or None where it is unavailable."""
+    return resource.getrusage(resource.RUSAGE_SELF) if resource else None
+
+
+def _get_max_rss(usage) -> typing.Optional[int]:
+    """
+    Converts the peak resident memory of the resource usage into bytes,
+    which is reported in bytes on macOS and in kilobytes elsewhere.
+    """
+    if usage is None:
+        return None
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return usage.ru_maxrss * scale
+
+
+class StepProfiler(object):
+    """
+    Measures the wall and CPU time, the growth in peak resident memory, the
+    block I/O and the memory allocations of a single step execution. The
+    CPU time and resource usage are those of the whole process, which means
+    that they include work done in other threads while the step runs, e.g.
+    by numerical libraries. The cProfile statistics only cover the thread
+    that executes the step.
+    """
+
+    def __init__(self, step: 'projects.ProjectStep', cprofile: bool = False):
+        self.step = step
+        self.cprofile = cprofile
+        self._profiler = None  # type: typing.Optional[cProfile.Profile]
+        self._started_tracing = False
+        self._start_time = 0
+        self._start_cpu_time = 0
+        self._start_usage = None
+
+    def start(self) -> 'StepProfiler':
+        """Starts measuring the execution of the step."""
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        if self.cprofile:
+            try:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            except ValueError as error:
+                # Only one profiler can be active at a time, which may
+                # already be the case when cauldron itself is profiled.
+                self._profiler = None
+                environ.log('[{}]: Unable to start cProfile: {}'.format(
+                    self.step.definition.name,
+                    error
+                ))
+
+        self._start_usage = _get_usage()
+        self._start_cpu_time = time.process_time()
+        self._start_time = time.perf_counter()
+        return self
+
+    def _get_top_allocators(self) -> typing.List[dict]:
+        """
+        Returns the source lines responsible for the largest allocations
+        made during the step that have not been released.
+        """
+        if not tracemalloc.is_tracing():
+            return []
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ])
+        return [
+            dict(
+                filename=stat.traceback[0].filename,
+                lineno=stat.traceback[0].lineno,
+                size=stat.size,
+                count=stat.count
+            )
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATORS_COUNT]
+        ]
+
+    def stop(self) -> dict:
+        """
+        Stops measuring the step and returns its profile, which is also
+        written to the profile path of the step along with the cProfile
+        statistics if they were collected.
+        """
+        wall_time = time.perf_counter() - self._start_time
+        cpu_time = time.process_time() - self._start_cpu_time
+        usage = _get_usage()
+
+        stats_path = None
+        if self._profiler is not None:
+            self._profiler.disable()
+            stats_path = get_stats_path(self.step) or None
+            if stats_path:
+                os.makedirs(os.path.dirname(stats_path), exist_ok=True)
+                self._profiler.dump_stats(stats_path)
+            self._profiler = None
+
+        traced_peak = (
+            tracemalloc.get_traced_memory()[1]
+            if tracemalloc.is_tracing() else
+            None
+        )
+        top_allocators = self._get_top_allocators()
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        start_rss = _get_max_rss(self._start_usage)
+        end_rss = _get_max_rss(usage)
+
+        profile = dict(
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            cpu_ratio=cpu_time / wall_time if wall_time > 0 else 0,
+            peak_rss=end_rss,
+            peak_rss_delta=(
+                end_rss - start_rss
+                if end_rss is not None else
+                None
+            ),
+            blocks_read=(
+                usage.ru_inblock - self._start_usage.ru_inblock
+                if usage is not None else
+                None
+            ),
+            blocks_written=(
+                usage.ru_oublock - self._start_usage.ru_oublock
+                if usage is not None else
+                None
+            ),
+            traced_peak=traced_peak,
+            top_allocators=top_allocators,
+            stats_path=stats_path
+        )
+
+        profile_path = get_profile_path(self.step)
+        if profile_path:
+            os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+            writer.write_file_atomically(
+                profile_path,
+                json.dumps(profile, indent=2)
+            )
+
+        return profile
+
+
+def start(project: 'projects.Project', step: 'projects.ProjectStep'):
+    """
+    Starts profiling the execution of the step if profiling is enabled for
+    the project and returns the profiler, or None if it is not enabled.
+    """
+    if not is_enabled(project):
+        return None
+    return StepProfiler(step, cprofile=is_cprofile_enabled(project)).start()
@@ -1,17 +1,30 @@
 import codecs
 import functools
+import hashlib
+import importlib.util
+import marshal
 import os
+import sys
 import threading
 import types
 import typing
+from collections import OrderedDict
 from importlib.abc import InspectLoader
 
 from cauldron import environ
 from cauldron import templating
+from cauldron import writer
 from cauldron.cli import threads
 from cauldron.render import stack as render_stack
 from cauldron.session import projects
 
+#: Maximum number of compiled step code objects kept in memory.
+MAX_CACHED_CODES = 256
+
+#: Compiled code objects of recently run step files, keyed by a hash of
+#: the step file path and contents along with the Cauldron version.
+_code_cache = OrderedDict()  # type: typing.Dict[str, types.CodeType]
+
 
 class UserAbortError(Exception):
     """
@@ -71,7 +84,7 @@ def get_file_contents(source_path: str) -> str:
     )
 
 
-def load_step_file(source_path: str) -> str:
+def load_step_file(source_path: str, source_contents: str = None) -> str:
     """
     Loads the source for a step file at the given path location and then
     renders it in a template to add additional footer data.
@@ -81,14 +94,164 @@ def load_step_file(source_path: str) -> str:
     necessary, but it seems there's an async race condition with print
     buffers that is hard to reproduce and so this is in place to fix the
     problem.
+
+    :param source_path:
+        Path of the step file to load.
+    :param source_contents:
+        The already loaded contents of the step file, in which case the
+        file is not loaded again.
     """
 
     return templating.render_template(
         template_name='embedded-step.py.txt',
-        source_contents=get_file_contents(source_path)
+        source_contents=(
+            source_contents
+            if source_contents is not None else
+            get_file_contents(source_path)
+        )
     )
 
 
+def get_code_key(source_path: str, contents: bytes) -> str:
+    """
+    Creates the key under which the compiled code of the step file is
+    cached, which changes whenever the path or contents of the step file,
+    the Cauldron version or the Python bytecode version change.
+    """
+    return hashlib.sha1(b'\0'.join([
+        environ.version.encode(),
+        importlib.util.MAGIC_NUMBER,
+        source_path.encode('utf-8', 'surrogateescape'),
+        contents
+    ])).hexdigest()
+
+
+def get_code_cache_path(
+        project: 'projects.Project',
+        source_path: str
+) -> str:
+    """
+    Path of the file where the compiled code of the step file is stored on
+    disk, which is within the cache folder of the project results so that
+    nothing is written into the project source directories. The path of
+    the step file is hashed into the file name to keep step files with the
+    same name in different source folders apart.
+    """
+    filename = os.path.basename(source_path)
+    return os.path.join(
+        project.results_path,
+        '.cache',
+        'code',
+        '{}.{}.{}.pyc'.format(
+            filename.rsplit('.', 1)[0],
+            hashlib.sha1(
+                source_path.encode('utf-8', 'surrogateescape')
+            ).hexdigest()[:8],
+            sys.implementation.cache_tag
+        )
+    )
+
+
+def _read_cached_code(
+        cache_path: str,
+        key: str
+) -> typing.Optional[types.CodeType]:
+    """
+    Loads the compiled code of the step file from the disk cache if it was
+    stored there under the given key.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            header = f.read(len(key))
+            if header != key.encode():
+                return None
+            return marshal.loads(f.read())
+    except Exception:
+        return None
+
+
+def _write_cached_code(cache_path: str, key: str, code: types.CodeType):
+    """
+    Stores the compiled code of the step file in the disk cache under the
+    given key unless Python has been configured not to write bytecode.
+    Failures are ignored given that the cache is only an optimization and
+    the compiled code is still kept in memory.
+    """
+    if sys.dont_write_bytecode:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        writer.write_file_atomically(
+            cache_path,
+            key.encode() + marshal.dumps(code),
+            mode='wb',
+            retry_count=1
+        )
+    except Exception:
+        pass
+
+
+def compile_step_file(
+        source_path: str,
+        project: 'projects.Project' = None
+) -> types.CodeType:
+    """
+    Returns the compiled code of the step file rendered within the embedded
+    step template. Compiled code is cached in memory and, when a project is
+    specified, on disk within the project results cache folder by the
+    contents of the step file so that unchanged steps are neither rendered
+    nor compiled again when they are re-run.
+
+    :param source_path:
+        Path of the step file to compile.
+    :param project:
+        The project the step file belongs to. If omitted, the compiled
+        code is only cached in memory.
+    :raises SyntaxError:
+        If the step file contains invalid Python code.
+    """
+    try:
+        with open(source_path, 'rb') as f:
+            contents = f.read()
+    except Exception:
+        # The rendered step will display the error instead.
+        return InspectLoader.source_to_code(
+            load_step_file(source_path),
+            source_path
+        )
+
+    key = get_code_key(source_path, contents)
+    code = _code_cache.get(key)
+    if code is not None:
+        _code_cache.move_to_end(key)
+        return code
+
+    cache_path = (
+        get_code_cache_path(project, source_path)
+        if project is not None else
+        None
+    )
+    code = _read_cached_code(cache_path, key) if cache_path else None
+    if code is None:
+        try:
+            source_contents = contents.decode('utf-8')
+        except UnicodeDecodeError:
+            source_contents = get_file_contents(source_path)
+
+        code = InspectLoader.source_to_code(
+            load_step_file(source_path, source_contents),
+            source_path
+        )
+        if cache_path:
+            _write_cached_code(cache_path, key, code)
+
+    _code_cache[key] = code
+    while len(_code_cache) > MAX_CACHED_CODES:
+        _code_cache.popitem(last=False)
+    return code
+
+
 def create_module(
         project: 'projects.Project',
         step: 'projects.ProjectStep'
@@ -144,10 +307,9 @@ def run(
     """
 
     target_module = create_module(project, step)
-    source_code = load_step_file(step.source_path)
 
     try:
-        code = InspectLoader.source_to_code(source_code, step.source_path)
+        code = compile_step_file(step.source_path, project)
     except SyntaxError as error:
         return render_syntax_error(project, error)
 
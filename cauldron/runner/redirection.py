@@ -1,16 +1,59 @@
+import os
 import sys
+
+from cauldron.session import caching
 from cauldron.session import projects
 from cauldron.session.buffering import RedirectBuffer
 
 
+def create_interceptor(
+        step: 'projects.ProjectStep',
+        source,
+        name: str
+) -> RedirectBuffer:
+    """
+    Creates a redirect buffer that intercepts the output written to the
+    source stream while the step runs. The output kept in memory is bounded
+    when the `output_head_size` or `output_tail_size` settings are specified
+    in the project's cauldron.json file or in the Cauldron configs, in which
+    case only that much of the beginning and end of each section of output
+    is displayed, and the full output is written to a file in the logs
+    directory of the project results instead.
+
+    :param step:
+        The step whose output will be intercepted.
+    :param source:
+        The stream whose output will be intercepted.
+    :param name:
+        Name of the stream used in the name of the full output file.
+    """
+    project = step.project
+    head_size = caching.parse_size(project.get_setting('output_head_size'))
+    tail_size = caching.parse_size(project.get_setting('output_tail_size'))
+
+    if head_size is None and tail_size is None:
+        return RedirectBuffer(source)
+
+    spill_path = os.path.join(
+        project.results_path,
+        'logs',
+        '{}.{}.log'.format(step.filename, name)
+    )
+    return RedirectBuffer(
+        source,
+        head_size=head_size,
+        tail_size=tail_size,
+        spill_path=spill_path
+    )
+
+
 def enable(step: 'projects.ProjectStep'):
     """
     Create a print equivalent function that also writes the output to the
-    project page. The write_through is enabled so that the TextIOWrapper
-    immediately writes all of its input data directly to the underlying
-    BytesIO buffer. This is needed so that we can safely access the buffer
-    data in a multi-threaded environment to display updates while the buffer
-    is being written to.
+    project page. The redirect buffers store each write immediately, which
+    is needed so that we can safely access the buffer data in a
+    multi-threaded environment to display updates while the buffer is being
+    written to.
 
     :param step:
     """
@@ -18,11 +61,11 @@ def enable(step: 'projects.ProjectStep'):
     # Prevent anything unusual from causing buffer issues
     restore_default_configuration()
 
-    stdout_interceptor = RedirectBuffer(sys.stdout)
+    stdout_interceptor = create_interceptor(step, sys.stdout, 'stdout')
     sys.stdout = stdout_interceptor
     step.report.stdout_interceptor = stdout_interceptor
 
-    stderr_interceptor = RedirectBuffer(sys.stderr)
+    stderr_interceptor = create_interceptor(step, sys.stderr, 'stderr')
     sys.stderr = stderr_interceptor
     step.report.stderr_interceptor = stderr_interceptor
 
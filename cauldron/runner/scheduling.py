@@ -0,0 +1,483 @@
+import ast
+import multiprocessing
+import time
+import typing
+from collections import namedtuple
+from datetime import datetime
+from multiprocessing import connection as mp_connection
+
+from cauldron import environ
+from cauldron.cli import threads
+from cauldron.environ import Response
+from cauldron.runner import checkpoints
+from cauldron.runner import python_file
+from cauldron.runner import source
+from cauldron.session import caching
+from cauldron.session import projects
+
+STEP_ACCESS = namedtuple(
+    'STEP_ACCESS',
+    ['reads', 'writes', 'opaque', 'reads_all'],
+    defaults=(False,)
+)
+
+#: SharedCache methods whose arguments name the variables being read.
+READ_METHODS = ('fetch', 'grab')
+
+#: SharedCache methods whose arguments name the variables being written.
+WRITE_METHODS = ('put',)
+
+
+def _get_string_constant(node: ast.AST) -> typing.Optional[str]:
+    """Returns the value of the node if it is a string constant."""
+    if isinstance(node, getattr(ast, 'Index', ())):
+        # Subscript slices are wrapped in an Index node prior to Python 3.9.
+        node = node.value
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, getattr(ast, 'Str', ())):
+        # String literals are parsed as Str nodes prior to Python 3.8.
+        return node.s
+    return None
+
+
+class _SharedAccessVisitor(ast.NodeVisitor):
+    """
+    Walks the abstract syntax tree of a step file and records the names of
+    the `cauldron.shared` variables that the step reads and writes. Any use
+    of the shared cache that cannot be resolved to specific variable names
+    marks the access as opaque.
+    """
+
+    def __init__(self):
+        self.module_aliases = {'cauldron'}
+        self.shared_aliases = set()
+        self.reads = set()
+        self.writes = set()
+        self.opaque = False
+        self.handled = set()
+
+    def is_shared(self, node: ast.AST) -> bool:
+        """Whether or not the node is an expression for the shared cache."""
+        if isinstance(node, ast.Name):
+            return node.id in self.shared_aliases
+
+        if not isinstance(node, ast.Attribute) or node.attr != 'shared':
+            return False
+
+        value = node.value
+        if isinstance(value, ast.Attribute) and value.attr == 'project':
+            value = value.value
+
+        return isinstance(value, ast.Name) and value.id in self.module_aliases
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.name == 'cauldron':
+                self.module_aliases.add(alias.asname or alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        for alias in node.names:
+            if node.module == 'cauldron' and alias.name == 'shared':
+                self.shared_aliases.add(alias.asname or alias.name)
+
+    def visit_Assign(self, node: ast.Assign):
+        if self.is_shared(node.value):
+            self.handled.add(id(node.value))
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.shared_aliases.add(target.id)
+                    self.handled.add(id(target))
+                else:
+                    self.opaque = True
+        self.generic_visit(node)
+
+    def _get_variable_name(self, node: ast.AST) -> typing.Optional[str]:
+        """
+        Returns the name of the shared variable if the node is a direct
+        access of a shared variable, e.g. `cd.shared.df` or `cd.shared['df']`.
+        """
+        if isinstance(node, ast.Attribute) and self.is_shared(node.value):
+            return node.attr
+        if isinstance(node, ast.Subscript) and self.is_shared(node.value):
+            return _get_string_constant(node.slice)
+        return None
+
+    def _mark_mutation(self, target: ast.AST):
+        """
+        Records a write for assignments into an object stored in the shared
+        cache, e.g. `cd.shared.df['column'] = values`.
+        """
+        while isinstance(target, (ast.Attribute, ast.Subscript)):
+            target = target.value
+            name = self._get_variable_name(target)
+            if name is not None:
+                self.writes.add(name)
+                return
+
+    def visit_Subscript(self, node: ast.Subscript):
+        if isinstance(node.ctx, (ast.Store, ast.Del)):
+            self._mark_mutation(node)
+
+        if not self.is_shared(node.value):
+            return self.generic_visit(node)
+
+        self.handled.add(id(node.value))
+        name = _get_string_constant(node.slice)
+        if name is None:
+            self.opaque = True
+        elif isinstance(node.ctx, ast.Load):
+            self.reads.add(name)
+        else:
+            self.writes.add(name)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        if isinstance(node.ctx, (ast.Store, ast.Del)):
+            self._mark_mutation(node)
+
+        if not self.is_shared(node.value):
+            return self.generic_visit(node)
+
+        self.handled.add(id(node.value))
+        if node.attr in READ_METHODS + WRITE_METHODS:
+            # Method calls are resolved by the visit_Call handler.
+            return
+        elif hasattr(caching.SharedCache, node.attr):
+            self.opaque = True
+        elif isinstance(node.ctx, ast.Load):
+            self.reads.add(node.attr)
+        else:
+            self.writes.add(node.attr)
+
+    def visit_AugAssign(self, node: ast.AugAssign):
+        # Augmented assignments both read and write their targets.
+        name = self._get_variable_name(node.target)
+        if name is not None:
+            self.reads.add(name)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        func = node.func
+        is_method = (
+            isinstance(func, ast.Attribute)
+            and func.attr in READ_METHODS + WRITE_METHODS
+            and self.is_shared(func.value)
+        )
+        if not is_method:
+            return self.generic_visit(node)
+
+        names = [_get_string_constant(arg) for arg in node.args]
+        if func.attr in READ_METHODS:
+            names = names[:1] if func.attr == 'fetch' else names
+            self.opaque = self.opaque or None in names or not names
+            self.reads.update(n for n in names if n is not None)
+        else:
+            keys = names[::2]
+            self.opaque = (
+                self.opaque
+                or None in keys
+                or any(k.arg is None for k in node.keywords)
+            )
+            self.writes.update(n for n in keys if n is not None)
+            self.writes.update(k.arg for k in node.keywords if k.arg)
+
+        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        for child in ast.iter_child_nodes(node):
+            if self.is_shared(child) and id(child) not in self.handled:
+                # The shared cache object is used directly in a way that
+                # cannot be resolved, e.g. passed as a function argument.
+                self.opaque = True
+            self.visit(child)
+
+
+def analyze_source(source_code: str) -> STEP_ACCESS:
+    """
+    Statically determines which shared variables are read and written by
+    the given step source code. If the access cannot be fully determined,
+    or the source cannot be parsed, the result will be marked as opaque.
+    """
+    try:
+        tree = ast.parse(source_code)
+    except SyntaxError:
+        return STEP_ACCESS(set(), set(), True)
+
+    visitor = _SharedAccessVisitor()
+    visitor.visit(tree)
+    return STEP_ACCESS(visitor.reads, visitor.writes, visitor.opaque)
+
+
+def get_step_access(step: 'projects.ProjectStep') -> STEP_ACCESS:
+    """
+    Returns the shared variable access for the given step. Markdown and
+    html steps can template any shared variable into their output and so
+    are treated as reading every shared variable.
+    """
+    if not source.has_extension(step.source_path, 'py'):
+        return STEP_ACCESS(set(), set(), False, reads_all=True)
+
+    return analyze_source(python_file.get_file_contents(step.source_path))
+
+
+def create_dependencies(
+        steps: typing.List['projects.ProjectStep']
+) -> typing.Dict['projects.ProjectStep', typing.Set['projects.ProjectStep']]:
+    """
+    Creates a dependency graph for the specified steps, which must be in
+    project order. Values read by a step can be modified in place, which
+    static analysis cannot detect when it happens through a local alias, so
+    every shared variable a python step reads is treated as one it may also
+    write. A step therefore depends on every earlier step that accesses any
+    of the shared variables it accesses. Steps with opaque access depend on,
+    and are depended upon by, every other step in the list. Steps that read
+    every shared variable, i.e. markdown and html steps, depend on every
+    earlier step that accesses the shared cache.
+
+    :return:
+        A dictionary mapping each step to the set of earlier steps that must
+        finish before the step can start.
+    """
+    access = {step: get_step_access(step) for step in steps}
+    out = {}
+
+    for index, step in enumerate(steps):
+        mine = access[step]
+        mine_changes = mine.reads | mine.writes
+
+        def conflicts(other: STEP_ACCESS) -> bool:
+            other_changes = other.reads | other.writes
+            return bool(
+                mine.opaque
+                or other.opaque
+                or other_changes & mine_changes
+                or (mine.reads_all and other_changes)
+                or (other.reads_all and mine_changes)
+            )
+
+        out[step] = {
+            previous
+            for previous in steps[:index]
+            if conflicts(access[previous])
+        }
+
+    return out
+
+
+def is_available() -> bool:
+    """
+    Whether or not steps can be executed in parallel processes, which
+    requires the fork process start method so that each process inherits
+    the current state of the project.
+
+    A pool of long-lived worker processes, or the spawn and forkserver start
+    methods, cannot be used instead because each step has to start from the
+    shared values as they are once the steps it depends on have finished,
+    which would otherwise require pickling the entire shared cache and
+    reloading the project libraries for every step.
+    """
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _execute_in_process(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep',
+        pipe: mp_connection.Connection
+):
+    """
+    Runs the step within a forked child process and sends the results of the
+    execution back to the parent process through the pipe. Only the thread
+    that forked the process exists within the child, which runs the step
+    and communicates through the pipe without using any of the kernel
+    server state that the other threads of the parent process work with.
+
+    Shared values read by the step may have been modified in place, so they
+    are sent back along with the values the step wrote.
+    """
+    response = Response()
+    success = source.run_step(response, project, step, force=True)
+
+    shared = project.shared
+    existing = set(shared.get_keys())
+    access = step.shared_access or caching.SHARED_ACCESS(set(), set())
+    changed = set(access.writes) | set(access.reads)
+
+    report = step.report
+    result = dict(
+        success=success,
+        error=step.error,
+        response=response.serialize(),
+        stop_condition=tuple(project.stop_condition),
+        start_time=step.start_time,
+        end_time=step.end_time,
+        body=report.body,
+        css=report.css,
+        library_includes=report.library_includes,
+        data=report.data.fetch(None),
+        files=report.files.fetch(None),
+        reads=access.reads,
+        reads_all=access.reads_all,
+        writes={k: shared.fetch(k) for k in changed if k in existing},
+        deletes=[k for k in changed if k not in existing],
+    )
+
+    try:
+        pipe.send(result)
+    except Exception:
+        # Values that cannot be pickled cannot be returned to the parent,
+        # which will execute the step itself instead.
+        pipe.send(None)
+    pipe.close()
+
+
+def _apply_result(
+        response: Response,
+        project: 'projects.Project',
+        step: 'projects.ProjectStep',
+        result: dict
+) -> bool:
+    """
+    Merges the results of a step executed in a child process into the step
+    and the shared cache of the project within this process.
+    """
+    report = step.report
+    report.body = result['body']
+    report.css = result['css']
+    report.library_includes = result['library_includes']
+    report.data.put(**result['data'])
+    report.files.put(**result['files'])
+
+    caching.apply_changes(project.shared, result['writes'], result['deletes'])
+
+    step.shared_access = caching.SHARED_ACCESS(
+        set(result['reads']),
+        set(result['writes'].keys()) | set(result['deletes']),
+        result['reads_all']
+    )
+    project.mark_dependents_dirty(step, step.shared_access.writes)
+
+    step.start_time = result['start_time']
+    step.end_time = result['end_time']
+    step.error = result['error']
+    step.mark_dirty(not result['success'])
+    step.dumps(running_override=False)
+
+    project.stop_condition = projects.StopCondition(*result['stop_condition'])
+    response.consume(Response.deserialize(result['response']))
+
+    step.report.update_last_modified()
+    step.last_modified = time.time()
+    step.is_running = False
+    return result['success']
+
+
+def run(
+        response: Response,
+        project: 'projects.Project',
+        steps: typing.List['projects.ProjectStep'],
+        max_workers: int = 2,
+        checkpoint: bool = False
+) -> typing.List['projects.ProjectStep']:
+    """
+    Runs the specified steps concurrently in forked processes, starting
+    each step as soon as all of the earlier steps it depends on have
+    finished. The shared variables written by each step are merged back
+    into the project's shared cache when it finishes. Scheduling of new
+    steps stops when any step fails or halts the project.
+
+    Dependencies are inferred by static analysis of `cauldron.shared`
+    access within step files. Shared variables accessed indirectly, e.g.
+    within project library functions, are not visible to this analysis and
+    steps that rely on such access should not be run in parallel.
+
+    :param response:
+        The response object for the run command.
+    :param project:
+        The project in which the steps will be run.
+    :param steps:
+        The steps to run, in project order.
+    :param max_workers:
+        The maximum number of steps to execute simultaneously.
+    :param checkpoint:
+        Whether or not to save a checkpoint of the shared values after each
+        step that runs successfully. A checkpoint is saved once the step and
+        all of the steps before it have finished.
+    :return:
+        The list of steps that were run.
+    """
+    context = multiprocessing.get_context('fork')
+    dependencies = create_dependencies(steps)
+    pending = list(steps)
+    running = {}  # type: typing.Dict[mp_connection.Connection, tuple]
+    steps_run = []
+    succeeded = set()
+    unsaved = list(steps) if checkpoint else []
+
+    def start(step: 'projects.ProjectStep'):
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_execute_in_process,
+            args=(project, step, sender),
+            daemon=True
+        )
+        step.is_running = True
+        step.start_time = datetime.utcnow()
+        step.end_time = None
+        process.start()
+        sender.close()
+        running[receiver] = (step, process)
+        steps_run.append(step)
+
+    def finish(receiver: mp_connection.Connection) -> bool:
+        step, process = running.pop(receiver)
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = None
+        process.join()
+
+        if result is not None:
+            return _apply_result(response, project, step, result)
+
+        environ.log('[{}]: Unable to run in parallel'.format(
+            step.definition.name
+        ))
+        step.is_running = False
+        return source.run_step(response, project, step, force=True)
+
+    def save_checkpoints():
+        # Checkpoints are saved in project order so that the checkpoint of
+        # each step includes the changes made by all of the steps before it.
+        while unsaved and unsaved[0] in succeeded:
+            checkpoints.save(project, unsaved.pop(0))
+
+    try:
+        while pending or running:
+            threads.abort_thread()
+
+            ready = [
+                s for s in pending
+                if not (dependencies[s] & set(pending + [
+                    r[0] for r in running.values()
+                ]))
+            ]
+            for step in ready[:max(0, max_workers - len(running))]:
+                pending.remove(step)
+                start(step)
+
+            for receiver in mp_connection.wait(list(running.keys()), 0.5):
+                step = running[receiver][0]
+                success = finish(receiver)
+                if success:
+                    succeeded.add(step)
+                    save_checkpoints()
+                if not success or project.stop_condition.halt:
+                    pending = []
+    except threads.ThreadAbortError:
+        for step, process in running.values():
+            process.terminate()
+            step.is_running = False
+        project.stop_condition = projects.StopCondition(True, True)
+
+    return steps_run
@@ -1,3 +1,4 @@
+import functools
 import os
 import time
 import typing
@@ -8,8 +9,11 @@ from cauldron import environ
 from cauldron.environ import Response
 from cauldron.runner import html_file
 from cauldron.runner import markdown_file
+from cauldron.runner import profiling
 from cauldron.runner import python_file
 from cauldron.runner import redirection
+from cauldron.runner import step_cache
+from cauldron.session import caching
 from cauldron.session.projects import Project
 from cauldron.session.projects import ProjectStep
 from cauldron.session.projects import StopCondition
@@ -71,16 +75,91 @@ def _execute_step(project: Project, step: ProjectStep) -> dict:
     if has_extension(step.source_path, 'html'):
         return html_file.run(project, step)
 
-    # Mark the downstream steps as dirty because this one has run
-    for s in project.steps[(step.index + 1):]:
-        s.mark_dirty(True)
-
     if has_extension(step.source_path, 'py'):
         return python_file.run(project, step)
 
     return {'success': False}
 
 
+def _execute_tracked_step(project: Project, step: ProjectStep) -> dict:
+    """
+    Executes the step while recording the shared variables that it reads and
+    writes. Only the downstream steps that consumed a shared variable changed
+    by this step are marked dirty afterward. When the project step cache is
+    enabled and contains a valid entry for the step, the cached results are
+    restored instead of running the step, and successful executions of
+    python steps are stored in the step cache for reuse in later sessions.
+
+    Values modified in place keep their identities and can be modified
+    through local aliases, e.g. `items = cd.shared.items; items.append(1)`,
+    which cannot be detected. Every shared variable that the step reads is
+    therefore considered to have been changed by the step as well.
+    """
+    if not has_extension(step.source_path, 'py'):
+        # Markdown and html steps can template any shared variable.
+        result = _execute_step(project, step)
+        step.shared_access = caching.SHARED_ACCESS(set(), set(), True)
+        return result
+
+    key = (
+        step_cache.get_key(project, step)
+        if step_cache.is_enabled(project) else
+        None
+    )
+    entry = step_cache.load(project, key) if key else None
+    if entry is not None:
+        result = step_cache.restore(project, step, entry)
+        step.shared_access = caching.SHARED_ACCESS(
+            set(entry['reads'].keys()),
+            set(entry['writes'].keys()) | set(entry['deletes'])
+        )
+        project.mark_dependents_dirty(step, step.shared_access.writes)
+        return result
+
+    # The step cache digests the shared variables when they are first read,
+    # which is before the step can modify them in place. Changes are
+    # otherwise detected from the identities of the values, which does not
+    # load values that were spilled to disk by a memory limited cache.
+    read_digests = {}
+    initial_identities = project.shared.get_identities()
+    project.shared.start_tracking(
+        functools.partial(step_cache.digest_read, read_digests)
+        if key else
+        None
+    )
+    try:
+        result = _execute_step(project, step)
+    finally:
+        access = project.shared.stop_tracking()
+
+    # Values replaced within the shared dictionary without going through the
+    # SharedCache interface are detected by identity comparison.
+    writes = caching.get_changed_keys(
+        initial_identities,
+        project.shared.get_identities()
+    )
+    writes.update(access.writes)
+    writes.update(access.reads)
+    step.shared_access = caching.SHARED_ACCESS(access.reads, writes)
+    project.mark_dependents_dirty(step, writes)
+
+    stop_condition = result.get('stop_condition')
+    aborted = stop_condition and stop_condition.aborted
+    if key and result['success'] and not aborted:
+        # Any remaining printed output must be part of the report body
+        # before the cache entry is created from it.
+        step.report.flush_stdout()
+        step_cache.store(
+            project=project,
+            step=step,
+            key=key,
+            read_digests=read_digests,
+            writes=writes
+        )
+
+    return result
+
+
 def run_step(
         response: Response,
         project: Project,
@@ -120,15 +199,17 @@ def run_step(
     step.sub_progress = 0
     step.start_time = datetime.utcnow()
     step.end_time = None
+    step.profile = None
 
     # Set the top-level display and cache values to the current project values
     # before running the step for availability within the step scripts
     cauldron.shared = cauldron.project.shared
 
     redirection.enable(step)
+    profiler = profiling.start(project, step)
 
     try:
-        result = _execute_step(project, step)
+        result = _execute_tracked_step(project, step)
     except Exception as error:
         result = dict(
             success=False,
@@ -137,6 +218,8 @@ def run_step(
         )
 
     step.end_time = datetime.utcnow()
+    if profiler is not None:
+        step.profile = profiler.stop()
     os.chdir(environ.configs.fetch('directory', os.path.expanduser('~')))
 
     step.mark_dirty(not result['success'])
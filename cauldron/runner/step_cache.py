@@ -0,0 +1,232 @@
+import glob
+import hashlib
+import os
+import pickle
+import typing
+
+from cauldron import environ
+from cauldron import writer
+from cauldron.session import caching
+from cauldron.session import projects
+
+#: Sentinel digest value used for shared variables that were deleted
+#: or did not exist when they were accessed.
+MISSING_DIGEST = 'missing'
+
+
+def is_enabled(project: 'projects.Project') -> bool:
+    """
+    Whether or not the persistent step result cache has been enabled for
+    the given project. The cache is opt-in and is turned on by setting the
+    `step_cache` value to true in the project's cauldron.json file.
+    """
+    return bool(project.settings.fetch('step_cache', False))
+
+
+def get_cache_directory(project: 'projects.Project') -> str:
+    """Directory where the step cache entries for the project are stored."""
+    return os.path.join(project.results_path, '.cache', 'results')
+
+
+def _hash_file(path: str) -> str:
+    """Returns a hex digest of the contents of the file at the given path."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except Exception:
+        return MISSING_DIGEST
+
+
+def _get_libraries_fingerprint(project: 'projects.Project') -> str:
+    """
+    Creates a digest of the python files within the project library
+    directories so that modifications to library code invalidate all
+    cached step results.
+    """
+    entries = []
+    for directory in project.library_directories:
+        if directory == project.source_directory:
+            # Step files are hashed individually by content instead.
+            continue
+
+        glob_path = os.path.join(directory, '**', '*.py')
+        for path in sorted(glob.iglob(glob_path, recursive=True)):
+            stats = os.stat(path)
+            entries.append('{}:{}:{}'.format(
+                path,
+                stats.st_size,
+                stats.st_mtime
+            ))
+
+    return hashlib.sha1('\n'.join(entries).encode()).hexdigest()
+
+
+def get_key(project: 'projects.Project', step: 'projects.ProjectStep') -> str:
+    """
+    Computes the cache key for the step, which is a hash of the step source
+    chained onto the keys of all upstream steps in the project. Any change to
+    the source of this step or an upstream step, the project libraries or the
+    Cauldron version will produce a different key.
+    """
+    key = hashlib.sha1('{}:{}'.format(
+        environ.version,
+        _get_libraries_fingerprint(project)
+    ).encode()).hexdigest()
+
+    for s in project.steps[:step.index + 1]:
+        if s.is_muted and s != step:
+            continue
+        key = hashlib.sha1('{}:{}:{}'.format(
+            key,
+            s.filename,
+            _hash_file(s.source_path)
+        ).encode()).hexdigest()
+
+    return key
+
+
+def get_entry_path(project: 'projects.Project', key: str) -> str:
+    """Path to the file where the cache entry with the given key is stored."""
+    return os.path.join(get_cache_directory(project), '{}.pickle'.format(key))
+
+
+def digest(value: typing.Any) -> typing.Optional[str]:
+    """
+    Creates a content digest of the specified value by hashing its pickled
+    representation. If the value cannot be pickled, None is returned.
+    """
+    try:
+        serialized = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return hashlib.sha1(serialized).hexdigest()
+
+
+def digest_read(
+        digests: typing.Dict[str, typing.Optional[str]],
+        name: str,
+        exists: bool,
+        value: typing.Any
+):
+    """
+    Stores the digest of a shared variable in the digests dictionary when it
+    is first read by a step, which is before the step has a chance to modify
+    the value in place. It is used as the first read callback of the shared
+    cache tracking.
+    """
+    digests[name] = digest(value) if exists else MISSING_DIGEST
+
+
+def load(project: 'projects.Project', key: str) -> typing.Optional[dict]:
+    """
+    Loads the cache entry for the given step key if one exists and if all of
+    the shared variables that the step read during its cached execution still
+    have the same values. Otherwise None is returned.
+    """
+    path = get_entry_path(project, key)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        return None
+
+    shared = project.shared
+    existing = set(shared.get_keys())
+    for name, expected in entry.get('reads', {}).items():
+        exists = name in existing
+        current = digest(shared.fetch(name)) if exists else MISSING_DIGEST
+        if current != expected:
+            return None
+
+    return entry
+
+
+def restore(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep',
+        entry: dict
+) -> dict:
+    """
+    Restores the report display and the shared variable outputs stored in the
+    given cache entry to the step and its project and returns a successful
+    run result.
+    """
+    report = step.report
+    report.body = list(entry['body'])
+    report.css = list(entry['css'])
+    report.library_includes = list(entry['library_includes'])
+    report.data.put(**entry['data'])
+    report.files.put(**entry['files'])
+    report.update_last_modified()
+
+    caching.apply_changes(project.shared, entry['writes'], entry['deletes'])
+
+    environ.log('[{}]: Restored from step cache'.format(step.definition.name))
+    return {
+        'success': True,
+        'stop_condition': projects.StopCondition(False, False)
+    }
+
+
+def store(
+        project: 'projects.Project',
+        step: 'projects.ProjectStep',
+        key: str,
+        read_digests: typing.Dict[str, typing.Optional[str]],
+        writes: typing.Iterable[str]
+) -> bool:
+    """
+    Writes a cache entry for the step after a successful execution. The
+    entry stores the digests of the shared variables read by the step,
+    which are compared against in later sessions, along with the values of
+    the shared variables the step wrote and the step's report display.
+
+    :param project:
+        Project in which the step was executed.
+    :param step:
+        The step that was executed.
+    :param key:
+        The cache key for the step computed prior to its execution.
+    :param read_digests:
+        Digests of the shared variables read by the step, which were created
+        by digest_read when each variable was first read. Variables that the
+        step wrote before reading them are not included.
+    :param writes:
+        Names of the shared variables written or otherwise changed during
+        step execution.
+    :return:
+        Whether or not the entry was stored. Steps that read or write
+        shared values that cannot be pickled are never cached.
+    """
+    shared = project.shared
+    existing = set(shared.get_keys())
+    changed = set(writes)
+
+    if None in read_digests.values():
+        return False
+
+    report = step.report
+    entry = dict(
+        version=environ.version,
+        reads=dict(read_digests),
+        writes={k: shared.fetch(k) for k in changed if k in existing},
+        deletes=[k for k in changed if k not in existing],
+        body=list(report.body),
+        css=list(report.css),
+        library_includes=list(report.library_includes),
+        data=dict(report.data.fetch(None)),
+        files=dict(report.files.fetch(None)),
+    )
+
+    try:
+        contents = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+
+    path = get_entry_path(project, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    success, error = writer.write_file(path, contents, mode='wb')
+    return success
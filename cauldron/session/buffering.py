@@ -1,26 +1,145 @@
 import io
+import os
+import threading
 import time
+import typing
 
 from cauldron.cli.threads import abort_thread
 
+#: Number of characters written to a bounded redirect buffer after which
+#: they are moved into its bounded output instead of waiting for the next
+#: read of the buffer.
+CONSUME_SIZE = 64 * 1024
 
-class RedirectBuffer(io.TextIOWrapper):
+
+class BoundedOutput(object):
+    """
+    Stores the beginning and end of the text written to a redirect buffer,
+    keeping only the first head size and the last tail size characters in
+    memory and replacing the rest with a message indicating how many
+    characters were omitted. The complete text can also be written to a
+    spill file as it is added so that none of the output is lost.
+    """
+
+    def __init__(
+            self,
+            head_size: int = None,
+            tail_size: int = None,
+            spill_path: str = None
+    ):
+        self.head_size = head_size or 0
+        self.tail_size = tail_size or 0
+        self.spill_path = spill_path
+        self._spill_file = None  # type: typing.Optional[typing.TextIO]
+        self._head = ''
+        self._tail = ''
+        self._omitted = 0
+
+    def append(self, text: str):
+        """Adds the text to the end of the stored text."""
+        if not text:
+            return
+
+        if self.spill_path:
+            self._spill(text)
+
+        head_remaining = self.head_size - len(self._head)
+        if head_remaining > 0:
+            self._head += text[:head_remaining]
+            text = text[head_remaining:]
+
+        # The tail is allowed to grow to twice its size before it is
+        # truncated so that it is not copied on every append.
+        self._tail += text
+        if len(self._tail) > 2 * self.tail_size:
+            excess = len(self._tail) - self.tail_size
+            self._omitted += excess
+            self._tail = self._tail[excess:]
+
+    def _spill(self, text: str):
+        """Appends the text to the spill file, opening it if needed."""
+        if self._spill_file is None:
+            os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+            self._spill_file = open(self.spill_path, 'w', encoding='utf-8')
+        self._spill_file.write(text)
+        self._spill_file.flush()
+
+    def read(self) -> str:
+        """Returns the stored text including any omitted text message."""
+        tail = self._tail
+        omitted = self._omitted
+
+        if len(tail) > self.tail_size:
+            omitted += len(tail) - self.tail_size
+            tail = tail[len(tail) - self.tail_size:]
+
+        if not omitted:
+            return self._head + tail
+
+        location = (
+            ', see "{}" for the full output'.format(self.spill_path)
+            if self.spill_path else
+            ''
+        )
+        return '{}\n[... {} characters omitted{} ...]\n{}'.format(
+            self._head,
+            omitted,
+            location,
+            tail
+        )
+
+    def flush(self) -> str:
+        """Returns the stored text and removes it from memory."""
+        contents = self.read()
+        self._head = ''
+        self._tail = ''
+        self._omitted = 0
+        return contents
+
+    def close(self):
+        """Closes the spill file if it was opened."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+class RedirectBuffer(io.TextIOBase):
     """
     A class for intercepting and independently storing buffer writes for use
     within Cauldron step display.
+
+    Only the writing methods are implemented by the buffer itself and all
+    other attributes are delegated directly to the redirection source. The
+    written strings are stored as they are and only joined when the buffer
+    is read. When a head or tail size is specified, the buffer is bounded
+    and the written text is regularly moved into a BoundedOutput, which
+    keeps only that much of the beginning and end of the output in memory
+    and writes the complete output to the spill path.
     """
 
-    def __init__(self, redirection_source):
+    def __init__(
+            self,
+            redirection_source,
+            head_size: int = None,
+            tail_size: int = None,
+            spill_path: str = None
+    ):
+        super(RedirectBuffer, self).__init__()
         self.active = False
-        self.bytes_buffer = io.BytesIO()
         self.redirection_source = redirection_source
         self.last_write_time = 0
-
-        super(RedirectBuffer, self).__init__(
-            buffer=self.bytes_buffer,
-            encoding=redirection_source.encoding,
-            write_through=True
-        )
+        self.bounded_output = (
+            BoundedOutput(
+                head_size=head_size,
+                tail_size=tail_size,
+                spill_path=spill_path
+            )
+            if head_size is not None or tail_size is not None else
+            None
+        )  # type: typing.Optional[BoundedOutput]
+        self._chunks = []  # type: typing.List[str]
+        self._pending_size = 0
+        self._read_lock = threading.Lock()
 
     @property
     def source_encoding(self):
@@ -28,6 +147,49 @@ class RedirectBuffer(io.TextIOWrapper):
             return self.redirection_source.encoding
         return 'utf-8'
 
+    @property
+    def encoding(self):
+        return self.redirection_source.encoding
+
+    @property
+    def errors(self):
+        return self.redirection_source.errors
+
+    @property
+    def newlines(self):
+        return self.redirection_source.newlines
+
+    @property
+    def closed(self) -> bool:
+        return self.redirection_source.closed
+
+    def fileno(self) -> int:
+        return self.redirection_source.fileno()
+
+    def isatty(self) -> bool:
+        return self.redirection_source.isatty()
+
+    def readable(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return self.redirection_source.writable()
+
+    def seekable(self) -> bool:
+        return False
+
+    def _take_chunks(self) -> str:
+        """
+        Removes the currently stored chunks and returns them joined into a
+        single string, which must be done while holding the read lock.
+        Chunks written while the existing ones are being joined are kept.
+        """
+        count = len(self._chunks)
+        contents = ''.join(self._chunks[:count])
+        del self._chunks[:count]
+        self._pending_size = 0
+        return contents
+
     def read_all(self) -> str:
         """
         Reads the current state of the buffer and returns a string those
@@ -37,49 +199,70 @@ class RedirectBuffer(io.TextIOWrapper):
             A string for the current state of the print buffer contents
         """
         try:
-            buffered_bytes = self.bytes_buffer.getvalue()
-            if buffered_bytes is None:
-                return ''
+            with self._read_lock:
+                if self.bounded_output is not None:
+                    self.bounded_output.append(self._take_chunks())
+                    return self.bounded_output.read()
 
-            return buffered_bytes.decode(self.source_encoding)
+                # The chunks are replaced by their joined value so that
+                # later reads only need to join the newly written chunks.
+                count = len(self._chunks)
+                if count > 1:
+                    self._chunks[:count] = [''.join(self._chunks[:count])]
+                return self._chunks[0] if self._chunks else ''
         except Exception as err:
             return 'Redirect Buffer Error: {}'.format(err)
 
     def flush_all(self) -> str:
         """
+        Empties the buffer and returns a string of its contents.
 
         :return:
+            A string of the print buffer contents prior to being emptied
         """
+        with self._read_lock:
+            contents = self._take_chunks()
+            if self.bounded_output is None:
+                return contents
 
-        # self.bytes_buffer.seek(0)
-        # contents = self.bytes_buffer.read()
-        # self.bytes_buffer.truncate(0)
-        # self.bytes_buffer.seek(0)
-
-        # if contents is None:
-        #     return ''
-
-        contents = self.bytes_buffer.getvalue()
-        self.bytes_buffer.truncate(0)
-        self.bytes_buffer.seek(0)
-
-        return (
-            ''
-            if not contents else
-            contents.decode(self.source_encoding)
-        )
+            self.bounded_output.append(contents)
+            return self.bounded_output.flush()
 
-    def write_both(self, *args, **kwargs):
+    def write(self, text: str) -> int:
+        """
+        Writes the text to the redirection source and, while redirection is
+        active, stores it in this buffer as well.
+        """
         abort_thread()
 
+        if not isinstance(text, str):
+            raise TypeError(
+                'write() argument must be str, not {}'
+                .format(type(text).__name__)
+            )
+
         if self.active:
             # Only write to this buffer if redirection is active. This prevents
             # race conditions from mixing buffers when attaching or removing
             # the write buffer from its sys output.
             self.last_write_time = time.time()
-            super(RedirectBuffer, self).write(*args, **kwargs)
+            self._chunks.append(text)
+
+            if self.bounded_output is not None:
+                self._pending_size += len(text)
+                if self._pending_size > CONSUME_SIZE:
+                    with self._read_lock:
+                        self.bounded_output.append(self._take_chunks())
 
-        return self.write_source(*args, **kwargs)
+        return self.redirection_source.write(text)
+
+    #: Retained for backwards compatibility with code that wrote to both
+    #: the buffer and the redirection source explicitly.
+    write_both = write
+
+    def writelines(self, lines: typing.Iterable[str]):
+        """Writes each of the strings in the iterable in order."""
+        self.write(''.join(lines))
 
     def write_source(self, *args, **kwargs):
         """
@@ -90,36 +273,26 @@ class RedirectBuffer(io.TextIOWrapper):
         """
         return self.redirection_source.write(*args, **kwargs)
 
-    def __getattribute__(self, item):
-        """
+    def flush(self):
+        """Flushes the redirection source."""
+        return self.redirection_source.flush()
 
-        :param item:
-        :return:
+    def close(self):
         """
+        Closes the buffer, which moves any remaining output of a bounded
+        buffer into its spill file. The redirection source is not closed.
+        """
+        self.active = False
+        if self.bounded_output is not None:
+            with self._read_lock:
+                self.bounded_output.append(self._take_chunks())
+                self.bounded_output.close()
 
-        abort_thread()
-
-        if item == 'write':
-            # Writing should be done to both the source buffer and the redirect
-            # buffer so that they have identical copies of the same information
-            # for their separate uses
-            return self.write_both
-        elif item == 'close':
-            # The source buffer should not be closed. The redirect buffer is
-            # what should be closed by calls to instances of this class
-            return super(RedirectBuffer, self).__getattribute__(item)
-
-        # Access the source buffer using a super call to prevent recursion
-        source = super(RedirectBuffer, self) \
-            .__getattribute__('redirection_source')
-
-        if hasattr(source, item):
-            # Preference should be given to the source buffer for all other
-            # operations given that this class is a wrapper around the source
-            # buffer with the only added functionality being the intercepting
-            # and duplication of write operations
-            return getattr(source, item)
-
-        # If the source buffer doesn't have a particular attribute it should
-        # an attribute specific to this class
-        return super(RedirectBuffer, self).__getattribute__(item)
+    def __getattr__(self, item):
+        """
+        Delegates all attributes that are not defined by the buffer itself
+        to the redirection source, e.g. the `buffer` of standard streams.
+        """
+        if item == 'redirection_source':
+            raise AttributeError(item)
+        return getattr(self.redirection_source, item)
@@ -1,16 +1,458 @@
+import itertools
+import os
+import pickle
+import re
+import shutil
+import sys
+import tempfile
 import typing
+import uuid
+import weakref
+from collections import OrderedDict
+from collections import namedtuple
+
+import numpy as np
+
 from cauldron import environ
 
+SHARED_ACCESS = namedtuple(
+    'SHARED_ACCESS',
+    ['reads', 'writes', 'reads_all'],
+    defaults=(False,)
+)
+SPILLED_ENTRY = namedtuple('SPILLED_ENTRY', ['path', 'size'])
+
+#: Values smaller than this number of bytes are never spilled to disk
+#: because the savings would not be worth the cost of reloading them.
+MIN_SPILL_SIZE = 1024 * 1024
+
+#: Number of items sampled from large containers and data frames when
+#: estimating the memory size of their contents.
+SIZE_SAMPLE_COUNT = 1000
+
+SIZE_PATTERN = re.compile(
+    r'^\s*(?P<value>[0-9.]+)\s*(?P<unit>[KMGT]?)i?B?\s*$',
+    re.IGNORECASE
+)
+SIZE_UNITS = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+
+def parse_size(
+        value: typing.Union[str, int, float, None]
+) -> typing.Optional[int]:
+    """
+    Converts a memory size specified as a number of bytes or as a string
+    with a unit suffix, e.g. "512MB" or "16GB", into a number of bytes.
+    Empty values are returned as None.
+
+    :param value:
+        The memory size to convert.
+    """
+    if value is None or value == '':
+        return None
+
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    match = SIZE_PATTERN.match(value)
+    if not match:
+        raise ValueError('Invalid memory size "{}"'.format(value))
+
+    unit = SIZE_UNITS[match.group('unit').upper()]
+    return int(float(match.group('value')) * unit)
+
+
+def _get_sampled_size(items: typing.Sized, sample: typing.Iterable) -> int:
+    """
+    Estimates the total size of the items in a container from the sizes of
+    a sample of those items.
+    """
+    sizes = [get_size(item) for item in sample]
+    if not sizes:
+        return 0
+    return int(sum(sizes) * len(items) / len(sizes))
+
+
+def get_size(value: typing.Any) -> int:
+    """
+    Returns an approximation of the number of bytes of memory used by the
+    value. The sizes of NumPy arrays and pandas objects are determined from
+    their data buffers, with the contents of object columns estimated from
+    a sample of rows. The contents of large containers are estimated from a
+    sample of their items in the same way.
+
+    :param value:
+        The value whose size should be estimated.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype != object or value.size == 0:
+            return int(value.nbytes)
+        flat = value.ravel()
+        return int(value.nbytes) + _get_sampled_size(
+            flat,
+            flat[:SIZE_SAMPLE_COUNT].tolist()
+        )
+
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage) and hasattr(value, 'head'):
+        # Pandas objects only calculate the memory used by the contents of
+        # object columns when deep is True, which is slow for large frames.
+        count = len(value)
+        sample = value.head(SIZE_SAMPLE_COUNT) if count else value
+        usage = sample.memory_usage(index=True, deep=True)
+        usage = int(getattr(usage, 'sum', lambda: usage)())
+        return int(usage * count / len(sample)) if len(sample) else usage
+
+    size = sys.getsizeof(value, 0)
+    if isinstance(value, dict):
+        keys = list(itertools.islice(value.keys(), SIZE_SAMPLE_COUNT))
+        return (
+            size
+            + _get_sampled_size(value, keys)
+            + _get_sampled_size(value, [value[k] for k in keys])
+        )
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        sample = itertools.islice(value, SIZE_SAMPLE_COUNT)
+        return size + _get_sampled_size(value, sample)
+
+    return size
+
+
+def spill(value: typing.Any, path: str) -> str:
+    """
+    Writes the value to a file at the specified path, excluding the file
+    extension. Numeric NumPy arrays are written as npy files and all other
+    values are pickled, which is also how pandas objects are stored because
+    it preserves their indexes and column types exactly.
+
+    :param value:
+        The value to write.
+    :param path:
+        The path of the file without an extension.
+    :return:
+        The path of the written file including its extension.
+    """
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        path = '{}.npy'.format(path)
+        np.save(path, value, allow_pickle=False)
+        return path
+
+    path = '{}.pickle'.format(path)
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return path
+
+
+def unspill(path: str) -> typing.Any:
+    """Loads the value stored in a file written by the spill function."""
+    if path.endswith('.npy'):
+        return np.load(path, allow_pickle=False)
+
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def get_changed_keys(previous: dict, current: dict) -> typing.Set[str]:
+    """
+    Returns the keys whose values differ by identity between the previous
+    and current states of a shared cache data dictionary, including keys
+    that were added or removed. Values that were mutated in place are not
+    detected.
+    """
+    return {
+        key
+        for key in set(previous.keys()) | set(current.keys())
+        if previous.get(key) is not current.get(key)
+        or (key in previous) != (key in current)
+    }
+
 
 class SharedCache(object):
     """
     A class that serves as a container for storing data by key but is
     accessible using dot notation instead of dictionary notation. Also contains
     additional functions for handling multiple variables at once.
+
+    An optional memory limit can be set for the cache, in which case the
+    least recently used values are spilled to disk once the estimated size
+    of all values in memory exceeds the limit. Spilled values are loaded
+    back into memory when they are next accessed. The size of each value
+    is estimated once when it is stored, which means that values modified
+    in place keep the size they had when they were stored.
     """
 
     def __init__(self):
         self._shared_cache_data = dict()
+        self._reads = None  # type: typing.Optional[typing.Set[str]]
+        self._writes = None  # type: typing.Optional[typing.Set[str]]
+        self._on_first_read = None  # type: typing.Optional[typing.Callable]
+        self._memory_limit = None  # type: typing.Optional[int]
+        self._spill_directory = None  # type: typing.Optional[str]
+        self._spilled = dict()  # type: typing.Dict[str, SPILLED_ENTRY]
+        self._recent = OrderedDict()  # type: typing.Dict[str, None]
+        self._sizes = dict()  # type: typing.Dict[str, int]
+        self._memory_total = 0
+        self._tokens = dict()  # type: typing.Dict[str, object]
+        self._known = dict()  # type: typing.Dict[str, typing.Any]
+
+    def get_memory_limit(self) -> typing.Optional[int]:
+        """
+        Returns the maximum number of bytes of values kept in memory before
+        the least recently used values are spilled to disk, or None if the
+        cache is unbounded.
+        """
+        return self._memory_limit
+
+    def get_spilled_keys(self) -> typing.List[str]:
+        """Returns the keys of the values that are spilled to disk."""
+        return list(self._spilled.keys())
+
+    def get_keys(self) -> typing.List[str]:
+        """
+        Returns the keys of all of the variables stored in the cache,
+        including those that are spilled to disk, without loading or
+        tracking access to their values.
+        """
+        return list(self._shared_cache_data.keys()) + self.get_spilled_keys()
+
+    def set_memory_limit(
+            self,
+            limit: typing.Union[str, int, None],
+            spill_directory: str = None
+    ) -> 'SharedCache':
+        """
+        Sets the memory limit of the cache, which spills the least recently
+        used values to disk when exceeded. Removing the limit loads all of
+        the spilled values back into memory.
+
+        :param limit:
+            The maximum number of bytes of values to keep in memory, either
+            as a number or a string with a unit suffix such as "16GB". A
+            value of None removes the limit.
+        :param spill_directory:
+            The directory in which spilled values are stored. If omitted, a
+            temporary directory is created when values are first spilled,
+            which is removed along with the cache.
+        """
+        self._memory_limit = parse_size(limit)
+        if spill_directory:
+            self._spill_directory = spill_directory
+
+        if self._memory_limit is None:
+            for key in list(self._spilled.keys()):
+                self._unspill(key)
+            self._recent = OrderedDict()
+            self._sizes = dict()
+            self._memory_total = 0
+            return self
+
+        for key, value in self._shared_cache_data.items():
+            self._recent.setdefault(key, None)
+            if key not in self._sizes:
+                self._store_size(key, get_size(value))
+        self._enforce_memory_limit()
+        return self
+
+    def get_identities(self, tokens: bool = False) -> dict:
+        """
+        Returns a dictionary of the values in the cache by key for detecting
+        values that are replaced by comparing their identities. When the
+        cache has a memory limit, values are represented by tokens that
+        remain the same while they are spilled to disk and loaded back
+        until they are replaced, which means that spilled values do not
+        have to be loaded to compare their identities.
+
+        :param tokens:
+            Whether or not to represent all values by tokens, even if the
+            cache has no memory limit. Tokens do not reference the values,
+            which makes them safe to keep after the values are replaced.
+        """
+        self._prune_known()
+
+        if tokens or self._memory_limit is not None:
+            for key, value in self._shared_cache_data.items():
+                if key not in self._known:
+                    self._tokens[key] = object()
+                    self._known[key] = value
+
+        out = {key: self._tokens[key] for key in self._spilled.keys()}
+        for key, value in self._shared_cache_data.items():
+            out[key] = self._tokens[key] if key in self._known else value
+        return out
+
+    def _prune_known(self):
+        """
+        Removes the tokens of values that have since been replaced directly
+        within the underlying dictionary, which also releases the references
+        to the replaced values.
+        """
+        stale = [
+            key for key, value in self._known.items()
+            if self._shared_cache_data.get(key) is not value
+        ]
+        for key in stale:
+            del self._known[key]
+            self._tokens.pop(key, None)
+
+    def _get_spill_directory(self) -> str:
+        if not self._spill_directory:
+            self._spill_directory = tempfile.mkdtemp(prefix='cd-shared-')
+            weakref.finalize(
+                self,
+                shutil.rmtree,
+                self._spill_directory,
+                True
+            )
+        elif not os.path.exists(self._spill_directory):
+            os.makedirs(self._spill_directory)
+        return self._spill_directory
+
+    def _store_size(self, key, size: int):
+        """Records the size of the in-memory value of the key."""
+        self._memory_total += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def _discard_size(self, key):
+        """Removes the size of the in-memory value of the key."""
+        self._memory_total -= self._sizes.pop(key, 0)
+
+    def _forget(self, key):
+        """Removes all spill information for the key."""
+        self._tokens.pop(key, None)
+        self._known.pop(key, None)
+        entry = self._spilled.pop(key, None)
+        if entry and os.path.exists(entry.path):
+            os.remove(entry.path)
+
+    def _spill(self, key, size: int) -> bool:
+        """Spills the value of the key to disk if it can be pickled."""
+        value = self._shared_cache_data[key]
+        path = os.path.join(self._get_spill_directory(), uuid.uuid4().hex)
+
+        try:
+            path = spill(value, path)
+        except Exception:
+            return False
+
+        if self._known.get(key) is not value:
+            self._tokens[key] = object()
+
+        self._known.pop(key, None)
+        self._spilled[key] = SPILLED_ENTRY(path, size)
+        del self._shared_cache_data[key]
+        self._recent.pop(key, None)
+        self._discard_size(key)
+        return True
+
+    def _unspill(self, key):
+        """Loads the spilled value of the key back into memory."""
+        entry = self._spilled.pop(key)
+        value = unspill(entry.path)
+        os.remove(entry.path)
+
+        self._shared_cache_data[key] = value
+        self._known[key] = value
+        if self._memory_limit is not None:
+            self._recent[key] = None
+            self._store_size(key, entry.size)
+
+    def _enforce_memory_limit(self, keep: str = None):
+        """
+        Spills the least recently used values to disk until the estimated
+        size of the values in memory is within the memory limit. The value
+        of the keep key is never spilled.
+        """
+        if self._memory_limit is None:
+            return
+
+        self._prune_known()
+        for key in list(self._recent.keys()):
+            if self._memory_total <= self._memory_limit:
+                break
+
+            size = self._sizes.get(key, 0)
+            if key != keep and size >= MIN_SPILL_SIZE:
+                self._spill(key, size)
+
+    def _get(self, key, default_value=None):
+        if key in self._spilled:
+            self._unspill(key)
+            self._enforce_memory_limit(keep=key)
+        elif self._memory_limit is not None and key in self._recent:
+            self._recent.move_to_end(key)
+
+        return self._shared_cache_data.get(key, default_value)
+
+    def _set(self, key, value):
+        if self._spilled or self._tokens:
+            self._forget(key)
+
+        self._shared_cache_data[key] = value
+
+        if self._memory_limit is not None:
+            self._recent[key] = None
+            self._recent.move_to_end(key)
+            self._store_size(key, get_size(value))
+            self._enforce_memory_limit(keep=key)
+
+    def _delete(self, key):
+        self._forget(key)
+        self._recent.pop(key, None)
+        self._discard_size(key)
+        self._shared_cache_data.pop(key, None)
+
+    def start_tracking(
+            self,
+            on_first_read: typing.Callable = None
+    ) -> 'SharedCache':
+        """
+        Begins recording the names of the variables that are read from and
+        written to this cache until `stop_tracking` is called. Any previously
+        recorded access information is discarded.
+
+        :param on_first_read:
+            An optional function called the first time each variable is read
+            while tracking, unless the variable was written before it was
+            read. It is called with the name of the variable, whether or not
+            it exists and its value before it is returned to the reader,
+            which allows the value to be inspected before it can be modified
+            in place.
+        """
+        self._reads = set()
+        self._writes = set()
+        self._on_first_read = on_first_read
+        return self
+
+    def stop_tracking(self) -> SHARED_ACCESS:
+        """
+        Stops recording variable access and returns the names of the
+        variables that were read and written while tracking was active.
+        """
+        out = SHARED_ACCESS(self._reads or set(), self._writes or set())
+        self._reads = None
+        self._writes = None
+        self._on_first_read = None
+        return out
+
+    def _track_read(self, key):
+        if self._reads is None or key in self._reads:
+            return
+
+        self._reads.add(key)
+        if self._on_first_read is not None and key not in self._writes:
+            exists = self._has(key)
+            value = self._get(key) if exists else None
+            self._on_first_read(key, exists, value)
+
+    def _track_write(self, key):
+        if self._writes is not None:
+            self._writes.add(key)
 
     def clear(self) -> 'SharedCache':
         """
@@ -19,7 +461,19 @@ class SharedCache(object):
 
         environ.abort_thread()
 
+        for key in self._shared_cache_data.keys():
+            self._track_write(key)
+
+        for key in list(self._spilled.keys()):
+            self._track_write(key)
+            self._forget(key)
+
         self._shared_cache_data = dict()
+        self._recent = OrderedDict()
+        self._sizes = dict()
+        self._memory_total = 0
+        self._tokens = dict()
+        self._known = dict()
         return self
 
     def put(self, *args, **kwargs) -> 'SharedCache':
@@ -55,17 +509,22 @@ class SharedCache(object):
         while index < (len(args) - 1):
             key = args[index]
             value = args[index + 1]
-            self._shared_cache_data[key] = value
+            self._set(key, value)
+            self._track_write(key)
             index += 2
 
         for key, value in kwargs.items():
-            if value is None and key in self._shared_cache_data:
-                del self._shared_cache_data[key]
+            self._track_write(key)
+            if value is None and self._has(key):
+                self._delete(key)
             else:
-                self._shared_cache_data[key] = value
+                self._set(key, value)
 
         return self
 
+    def _has(self, key: str) -> bool:
+        return key in self._shared_cache_data or key in self._spilled
+
     def grab(
             self,
             *keys: typing.List[str],
@@ -94,7 +553,12 @@ class SharedCache(object):
         Retrieves the value of the specified variable from the cache
 
         :param key:
-            The name of the variable for which the value should be returned
+            The name of the variable for which the value should be returned.
+            If None, the underlying dictionary of all variables is returned
+            instead. When the cache has a memory limit, a copy of the
+            dictionary that also contains the values spilled to disk is
+            returned, which leaves the spilled values on disk so that the
+            cache remains within its limit.
         :param default_value:
             The value to return if the variable does not exist in the cache
         :return:
@@ -105,14 +569,28 @@ class SharedCache(object):
         environ.abort_thread()
 
         if key is None:
-            return self._shared_cache_data
+            # Access to the underlying dictionary allows for arbitrary
+            # reads and writes that cannot be individually tracked.
+            for k in self.get_keys():
+                self._track_read(k)
+                self._track_write(k)
 
-        return self._shared_cache_data.get(key, default_value)
+            if self._memory_limit is None:
+                return self._shared_cache_data
+
+            out = dict(self._shared_cache_data)
+            for k, entry in self._spilled.items():
+                out[k] = unspill(entry.path)
+            return out
+
+        self._track_read(key)
+        return self._get(key, default_value)
 
     def __getitem__(self, item):
         environ.abort_thread()
 
-        return self._shared_cache_data.get(item)
+        self._track_read(item)
+        return self._get(item)
 
     def __getattr__(self, item):
         environ.abort_thread()
@@ -120,12 +598,14 @@ class SharedCache(object):
         if item.startswith('_'):
             return None
 
-        return self._shared_cache_data.get(item)
+        self._track_read(item)
+        return self._get(item)
 
     def __setitem__(self, key, value):
         environ.abort_thread()
 
-        self._shared_cache_data[key] = value
+        self._track_write(key)
+        self._set(key, value)
 
     def __setattr__(self, key, value):
         environ.abort_thread()
@@ -133,4 +613,31 @@ class SharedCache(object):
         if key.startswith('_'):
             super(SharedCache, self).__setattr__(key, value)
         else:
-            self._shared_cache_data[key] = value
+            self._track_write(key)
+            self._set(key, value)
+
+
+def apply_changes(
+        cache: SharedCache,
+        writes: typing.Dict[str, typing.Any],
+        deletes: typing.Iterable[str]
+) -> SharedCache:
+    """
+    Applies shared variable changes that were recorded elsewhere, e.g. by a
+    step executed in a child process or restored from the step cache, to
+    the cache. The changes are made through the cache interface so that
+    the values are accounted for by any memory limit of the cache.
+
+    :param cache:
+        The cache to which the changes will be applied.
+    :param writes:
+        Values of the variables that were written.
+    :param deletes:
+        Names of the variables that were removed.
+    """
+    existing = set(cache.get_keys())
+    cache.put(**{key: None for key in deletes if key in existing})
+    for key, value in writes.items():
+        # Positional arguments store None values instead of deleting them.
+        cache.put(key, value)
+    return cache
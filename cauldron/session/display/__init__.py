@@ -140,7 +140,8 @@ def plotly(
         layout: typing.Union[dict, typing.Any] = None,
         scale: float = 0.5,
         figure: typing.Union[dict, typing.Any] = None,
-        static: bool = False
+        static: bool = False,
+        shared_data: bool = False
 ):
     """
     Creates a Plotly plot in the display with the specified data and
@@ -162,6 +163,13 @@ def plotly(
     :param static:
         If true, the plot will be created without interactivity.
         This is useful if you have a lot of plots in your notebook.
+    :param shared_data:
+        When True, the trace data of the plot is written to data files in
+        the project results folder that are named by the content of each
+        trace and loaded when the plot scrolls into view. Traces that are
+        identical to those of other plots in the project are written and
+        loaded only once, which keeps notebooks that draw many plots of the
+        same large data much smaller.
     """
     r = _get_report()
 
@@ -171,6 +179,19 @@ def plotly(
     if 'plotly' not in r.library_includes:
         r.library_includes.append('plotly')
 
+    if shared_data:
+        result = render.shared_data_plotly(
+            data=data,
+            layout=layout,
+            scale=scale,
+            figure=figure,
+            static=static
+        )
+        r.files.put(**result['files'])
+        r.append_body(result['body'])
+        r.stdout_interceptor.write_source('[ADDED] Plotly plot\n')
+        return
+
     r.append_body(render.plotly(
         data=data,
         layout=layout,
@@ -194,7 +215,8 @@ def table(
                 str,
                 typing.Union[str, typing.Callable[[typing.Any], str]]
             ]
-        ] = None
+        ] = None,
+        stream: bool = False
 ):
     """
     Adds the specified data frame to the display in a nicely formatted
@@ -233,8 +255,28 @@ def table(
         positional argument in the format arguments. A string value can also
         be specified for uniform formatting of all columns (or if displaying
         a series with only a single value).
+    :param stream:
+        When True, the rows of the table are written to separate files in
+        the step's results folder and loaded by the display only as they are
+        scrolled into view. This allows displaying data frames with millions
+        of rows, and the max_rows argument is ignored in this case.
     """
     r = _get_report()
+
+    if stream:
+        result = render.streaming_table(
+            data_frame=data_frame,
+            directory='tables/{}'.format(r.id.rsplit('.', 1)[0]),
+            scale=scale,
+            include_index=include_index,
+            sample_rows=sample_rows,
+            formats=formats
+        )
+        r.files.put(**result['files'])
+        r.append_body(result['body'])
+        r.stdout_interceptor.write_source('[ADDED] Table\n')
+        return
+
     r.append_body(render.table(
         data_frame=data_frame,
         scale=scale,
@@ -351,11 +393,12 @@ def workspace(show_values: bool = True, show_types: bool = True):
     """
     r = _get_report()
 
+    shared = r.project.shared
     data = {}
-    for key, value in r.project.shared.fetch(None).items():
+    for key in shared.get_keys():
         if key.startswith('__cauldron_'):
             continue
-        data[key] = value
+        data[key] = shared.fetch(key)
 
     r.append_body(render.status(data, values=show_values, types=show_types))
 
@@ -364,7 +407,8 @@ def pyplot(
         figure=None,
         scale: float = 0.8,
         clear: bool = True,
-        aspect_ratio: typing.Union[list, tuple] = None
+        aspect_ratio: typing.Union[list, tuple] = None,
+        format: str = 'svg'
 ):
     """
     Creates a matplotlib plot in the display for the specified figure. The size
@@ -390,14 +434,36 @@ def pyplot(
         for the display of text within the figure. If no aspect ratio is
         specified, the currently assigned values to the plot will be used
         instead.
+    :param format:
+        The format in which the plot is rendered, which is one of "svg",
+        "png" or "webp". SVG plots are embedded within the display. Other
+        formats are rendered into image files that are written to the
+        step's results folder and referenced by the display, which is much
+        smaller and faster to render for plots with many elements, such as
+        scatter plots with many points.
     """
     r = _get_report()
-    r.append_body(render_plots.pyplot(
-        figure,
-        scale=scale,
-        clear=clear,
-        aspect_ratio=aspect_ratio
-    ))
+    image_format = format
+
+    if image_format != 'svg':
+        result = render_plots.pyplot_image(
+            figure,
+            directory='plots/{}'.format(r.id.rsplit('.', 1)[0]),
+            image_format=image_format,
+            scale=scale,
+            clear=clear,
+            aspect_ratio=aspect_ratio
+        )
+        r.files.put(**result['files'])
+        r.append_body(result['body'])
+    else:
+        r.append_body(render_plots.pyplot(
+            figure,
+            scale=scale,
+            clear=clear,
+            aspect_ratio=aspect_ratio
+        ))
+
     r.stdout_interceptor.write_source('[ADDED] PyPlot plot\n')
 
 
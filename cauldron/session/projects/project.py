@@ -274,6 +274,17 @@ class Project:
             naming_scheme=self.naming_scheme
         )
 
+    def get_setting(self, key: str):
+        """
+        Returns the value of the setting from the project settings if it is
+        specified there and from the environment configs otherwise.
+
+        :param key:
+            Name of the setting to return.
+        """
+        value = self.settings.fetch(key)
+        return value if value is not None else environ.configs.fetch(key)
+
     def refresh(self, force: bool = False) -> bool:
         """
         Loads the cauldron.json definition file for the project and populates
@@ -305,6 +316,7 @@ class Project:
             return False
 
         self.settings.clear().put(**new_definition)
+        self.shared.set_memory_limit(self.get_setting('shared_memory_limit'))
 
         old_step_definitions = old_definition.get('steps', [])
         new_step_definitions = new_definition.get('steps', [])
@@ -418,13 +430,59 @@ class Project:
         if step is None:
             return None
 
-        if step.definition.name.endswith('.py'):
-            for i in range(self.steps.index(step) + 1, len(self.steps)):
-                self.steps[i].mark_dirty(True)
+        if step.shared_access is not None:
+            self.mark_dependents_dirty(step, step.shared_access.writes)
 
         self.steps.remove(step)
         return step
 
+    def mark_dependents_dirty(
+            self,
+            step: 'steps.ProjectStep',
+            changed_keys: typing.Iterable[str]
+    ) -> typing.List['steps.ProjectStep']:
+        """
+        Marks dirty the steps after the specified one that read or wrote any
+        of the changed shared variables during their most recent execution.
+        Invalidation is transitive, such that the variables written by an
+        invalidated step are considered changed for the steps after it.
+        Markdown and html steps read every shared variable and so are marked
+        dirty by any change.
+
+        :param step:
+            The step whose execution, or removal, changed the shared variables.
+        :param changed_keys:
+            Names of the shared variables that were changed by the step.
+        :return:
+            A list of the steps that were marked dirty.
+        """
+        changed = set(changed_keys)
+        index = self.steps.index(step)
+        out = []
+
+        for ps in self.steps[(index + 1):]:
+            if not changed:
+                break
+
+            # Steps that have never been executed are already dirty and
+            # have not consumed any of the changed variables.
+            access = ps.shared_access
+            if access is None:
+                continue
+
+            consumed = (
+                access.reads_all
+                or changed & (access.reads | access.writes)
+            )
+            if not consumed:
+                continue
+
+            ps.mark_dirty(True)
+            changed.update(access.writes)
+            out.append(ps)
+
+        return out
+
     def save(self, path: str = None):
         """
 
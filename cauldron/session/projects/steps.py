@@ -9,6 +9,7 @@ from cauldron import templating
 from cauldron.session import definitions
 from cauldron.session import naming
 from cauldron.session import projects  # noqa
+from cauldron.session.caching import SHARED_ACCESS
 from cauldron.session.report import Report
 
 
@@ -62,6 +63,17 @@ class ProjectStep(object):
         self.start_time = None  # type: typing.Optional[datetime]
         self.end_time = None  # type: typing.Optional[datetime]
 
+        # Names of the shared variables read and written by the step during
+        # its most recent execution, which determine which downstream steps
+        # are invalidated when the step is run again. None until the step
+        # has been executed.
+        self.shared_access = None  # type: typing.Optional[SHARED_ACCESS]
+
+        # Resource usage measured during the most recent execution of the
+        # step when profiling is enabled for the project, which is None
+        # otherwise.
+        self.profile = None  # type: typing.Optional[dict]
+
     @property
     def is_running(self) -> bool:
         """Whether or not the step code is currently being executed."""
@@ -201,7 +213,8 @@ class ProjectStep(object):
             is_dirty=is_dirty,
             running=self.is_running,
             run=self._has_run,
-            error=self.error is not None
+            error=self.error is not None,
+            profile=self.profile
         )
 
     def is_dirty(self):
@@ -248,6 +261,24 @@ class ProjectStep(object):
         self.mark_dirty(True)
         return self.dom
 
+    def dumps_status(self) -> str:
+        """
+        Writes the run status of the step, i.e. its progress messages and
+        progress bars, to an HTML-formatted string, which is empty if the
+        step has no progress to display.
+        """
+        if not self.progress and not self.progress_message:
+            return ''
+
+        return templating.render_template(
+            'step-status.html',
+            id=self.definition.name,
+            progress_message=self.progress_message,
+            progress=int(round(max(0, min(100, 100 * self.progress)))),
+            sub_progress_message=self.sub_progress_message,
+            sub_progress=int(round(max(0, min(100, 100 * self.sub_progress))))
+        )
+
     def dumps(self, running_override: bool = None) -> str:
         """Writes the step information to an HTML-formatted string"""
         is_running = (
@@ -273,14 +304,21 @@ class ProjectStep(object):
             self.report.flush_stdout()
 
         # Create a copy of the body for dumping
+        body_id = self.report.body_id
         body = self.report.body[:]
+        body_sequence = len(body)
 
-        if is_running:
+        pending = self.report.read_stdout() if is_running else ''
+        if pending:
             # If still running add a temporary copy of anything not flushed
             # from the stdout buffer to the copy of the body for display. Do
             # not flush the buffer though until the step is done running or
-            # it gets flushed by another display call.
-            body.append(self.report.read_stdout())
+            # it gets flushed by another display call. The copy is wrapped
+            # so that clients appending body chunks can replace it.
+            body.append(
+                '<div class="cd-ProjectStep__pending">{}</div>'
+                .format(pending)
+            )
 
         body = ''.join(body)
 
@@ -311,6 +349,8 @@ class ProjectStep(object):
             elapsed_time=self.get_elapsed_timestamp(),
             code=code,
             body=body,
+            body_id=body_id,
+            body_sequence=body_sequence,
             has_body=has_body,
             id=self.definition.name,
             title=self.report.title,
@@ -320,10 +360,7 @@ class ProjectStep(object):
             index=self.index,
             is_running=is_running,
             is_visible=is_visible,
-            progress_message=self.progress_message,
-            progress=int(round(max(0, min(100, 100 * self.progress)))),
-            sub_progress_message=self.sub_progress_message,
-            sub_progress=int(round(max(0, min(100, 100 * self.sub_progress)))),
+            status=self.dumps_status() if is_running else '',
             std_err=std_err
         )
 
@@ -1,6 +1,8 @@
 import os
 import time
 import typing
+import uuid
+from collections import namedtuple
 
 from cauldron.render import texts as render_texts
 from cauldron.session import projects
@@ -8,6 +10,8 @@ from cauldron.session.buffering import RedirectBuffer
 from cauldron.session.caching import SharedCache
 from cauldron.session import definitions
 
+BODY_CHUNKS = namedtuple('BODY_CHUNKS', ['body_id', 'start', 'chunks'])
+
 
 class Report(object):
     """
@@ -18,7 +22,9 @@ class Report(object):
 
     def __init__(self, step=None):
         self.step = step  # type: projects.ProjectStep
-        self.body = []  # type: typing.List[str]
+        # The body list is stored together with its identifier so that both
+        # are always read and replaced together.
+        self._body_state = (uuid.uuid4().hex, [])
         self.css = []  # type: typing.List[str]
         self.data = SharedCache()
         self.files = SharedCache()
@@ -46,6 +52,26 @@ class Report(object):
             stderr.last_write_time if stderr else 0,
         ])
 
+    @property
+    def body(self) -> typing.List[str]:
+        """
+        The list of HTML-formatted DOM chunks that make up the report body.
+        The body is append-only, which makes the index of each chunk its
+        sequence number within the body. Replacing the body list assigns a
+        new body_id so that clients holding previously received chunks know
+        to discard them.
+        """
+        return self._body_state[1]
+
+    @body.setter
+    def body(self, value: typing.List[str]):
+        self._body_state = (uuid.uuid4().hex, value)
+
+    @property
+    def body_id(self) -> str:
+        """Unique identifier for the current report body list."""
+        return self._body_state[0]
+
     @property
     def project(self) -> typing.Union['projects.Project', None]:
         """
@@ -93,6 +119,37 @@ class Report(object):
         self._last_update_time = time.time()
         return self
 
+    def get_body_chunks(
+            self,
+            body_id: str = None,
+            sequence: int = 0
+    ) -> BODY_CHUNKS:
+        """
+        Returns the body chunks that were appended to the report after the
+        client-side state identified by the given body_id and sequence. If
+        the body has been replaced since then, or the state is unknown, all
+        of the body chunks are returned starting from a sequence of zero.
+
+        :param body_id:
+            The identifier of the body from which the client last received
+            chunks.
+        :param sequence:
+            The number of chunks that the client has already received from
+            the body identified by the body_id.
+        :return:
+            The body identifier, the sequence number of the first returned
+            chunk and the chunks themselves.
+        """
+        current_id, body = self._body_state
+        count = len(body)
+        is_current = (
+            body_id == current_id
+            and sequence is not None
+            and 0 <= sequence <= count
+        )
+        start = sequence if is_current else 0
+        return BODY_CHUNKS(current_id, start, body[start:count])
+
     def update_last_modified(self, value: float = None):
         """
         Manually update the last modified time, which is useful for
@@ -10,6 +10,12 @@ from cauldron.session.writing import file_io
 from cauldron.session.writing import html
 from cauldron.session.writing import step as step_writer
 
+#: The most recent step body file write entry for each step, keyed by the
+#: output directory and the name of the step, along with the body from which
+#: it was created. Serialized steps reuse the same body until they change,
+#: which allows the entry to be reused instead of rendering it again.
+_step_body_writes = dict()  # type: typing.Dict[tuple, tuple]
+
 
 def save(
         project: 'projects.Project',
@@ -18,7 +24,10 @@ def save(
     """
     Computes the file write list for the current state of the project if no
     write_list was specified in the arguments, and then writes each entry in
-    that list to disk.
+    that list to disk. Only entries whose contents have changed since they
+    were last written are written again. When the complete file write list
+    for the project is saved, any files from earlier saves that are no longer
+    part of the project results are removed from the output directory.
 
     :param project:
         The project to be saved
@@ -38,21 +47,74 @@ def save(
     except Exception as err:
         raise
 
-    environ.systems.remove(project.output_directory)
     try:
         os.makedirs(project.output_directory)
     except FileExistsError:
         pass
 
     file_io.deploy(writes)
+
+    if write_list is None:
+        file_io.prune(project.output_directory, writes)
+
     return writes
 
 
+def get_step_body_path(step_data: step_writer.STEP_DATA) -> str:
+    """
+    Returns the path, relative to the output directory of the project, of
+    the file in which the body of the serialized step is written. The path
+    is addressed by the checksum of the body so that the file only changes
+    when the body of the step changes.
+    """
+    return '/'.join([
+        'steps',
+        '{}.{}.js'.format(step_data.name, step_data.body_checksum)
+    ])
+
+
+def to_step_body_write(
+        project: 'projects.Project',
+        step_data: step_writer.STEP_DATA
+) -> file_io.FILE_WRITE_ENTRY:
+    """
+    Creates the file write entry for the file that stores the body of the
+    serialized step, which the notebook viewer loads separately from the
+    results file when the step is displayed.
+    """
+    body_path = get_step_body_path(step_data)
+    path = os.path.join(project.output_directory, *body_path.split('/'))
+
+    key = (project.output_directory, step_data.name)
+    body, entry = _step_body_writes.get(key) or (None, None)
+    if entry is not None and body is step_data.body and entry.path == path:
+        return entry
+
+    entry = file_io.FILE_WRITE_ENTRY(
+        path=path,
+        contents=templating.render_template(
+            'step-body.js.template',
+            KEY=json.dumps(body_path),
+            BODY=json.dumps(step_data.body)
+        )
+    )
+    _step_body_writes[key] = (step_data.body, entry)
+    return entry
+
+
 def to_write_list(project: 'projects.Project') -> typing.List[tuple]:
     """
+    Creates the file write list for the current state of the project. The
+    results file contains everything but the step bodies, which are each
+    written to a separate file addressed by the checksum of the body. As a
+    result, only the files of the steps whose bodies have changed and the
+    comparatively small results file are written again when the project is
+    saved.
 
     :param project:
+        The project for which to create the file write list
     :return:
+        A list of the file write and copy entries for the project results
     """
 
     project_component = components.project_component.create_many(
@@ -67,6 +129,10 @@ def to_write_list(project: 'projects.Project') -> typing.List[tuple]:
     def to_step_dict(step: step_writer.STEP_DATA) -> dict:
         out = step._asdict()
         del out['file_writes']
+        if step.body:
+            del out['body']
+            out['body_file'] = get_step_body_path(step)
+            file_writes.append(to_step_body_write(project, step))
         return out
 
     project_includes = [inc._asdict() for inc in project_component.includes]
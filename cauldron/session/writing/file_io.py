@@ -1,3 +1,5 @@
+import base64
+import hashlib
 import os
 import shutil
 import subprocess
@@ -11,6 +13,13 @@ from cauldron import writer
 FILE_WRITE_ENTRY = namedtuple('FILE_WRITE_ENTRY', ['path', 'contents'])
 FILE_COPY_ENTRY = namedtuple('FILE_COY_ENTRY', ['source', 'destination'])
 
+#: The contents of the files written by this process keyed by their paths
+#: along with the signature of each file, which holds the digest of the
+#: written contents and the size and modified time of the file after it was
+#: written. Entries that write the same contents object again are compared
+#: by signature without hashing their contents again.
+_WRITTEN_FILES = dict()  # type: typing.Dict[str, tuple]
+
 
 def entry_from_dict(
         data: dict
@@ -19,11 +28,76 @@ def entry_from_dict(
     Converts the given data dictionary into either a file write or file copy
     entry depending on the keys in the dictionary. The dictionary should
     contain either ('path', 'contents') keys for file write entries or
-    ('source', 'destination') keys for file copy entries.
+    ('source', 'destination') keys for file copy entries. File write entries
+    with an "encoding" of "base64" have their contents decoded into bytes.
+    """
+    if 'contents' not in data:
+        return FILE_COPY_ENTRY(**data)
+
+    if data.get('encoding') == 'base64':
+        return FILE_WRITE_ENTRY(
+            path=data['path'],
+            contents=base64.b64decode(data['contents'])
+        )
+
+    return FILE_WRITE_ENTRY(path=data['path'], contents=data['contents'])
+
+
+def entry_to_dict(
+        entry: typing.Union[FILE_WRITE_ENTRY, FILE_COPY_ENTRY]
+) -> dict:
+    """
+    Converts the given file write or file copy entry into a JSON
+    serializable dictionary that can be converted back into the entry with
+    the entry_from_dict function. Binary file contents are base64 encoded.
+    """
+    data = entry._asdict()
+    if isinstance(data.get('contents'), bytes):
+        data['contents'] = base64.b64encode(data['contents']).decode()
+        data['encoding'] = 'base64'
+    return data
+
+
+def entry_to_reference(entry: FILE_WRITE_ENTRY) -> dict:
     """
-    if 'contents' in data:
-        return FILE_WRITE_ENTRY(**data)
-    return FILE_COPY_ENTRY(**data)
+    Converts the given file write entry into a JSON serializable reference
+    to the written file, which holds the digest of the contents instead of
+    the contents themselves. The entry can be recreated from the written
+    file with the entry_from_reference function.
+    """
+    return dict(
+        path=entry.path,
+        digest=get_digest(entry.path, entry.contents),
+        binary=isinstance(entry.contents, bytes)
+    )
+
+
+def entry_from_reference(data: dict) -> FILE_WRITE_ENTRY:
+    """
+    Recreates the file write entry for a reference created by the
+    entry_to_reference function by reading the contents of the written
+    file. The file is then known to have been written with those contents
+    and will not be written again unless it changes.
+
+    :raises IOError:
+        If the file is missing or its contents do not match the digest
+        of the reference.
+    """
+    output_path = environ.paths.clean(data['path'])
+    with open(output_path, 'rb') as f:
+        contents = f.read()
+
+    digest = _get_digest(contents)
+    if digest != data['digest']:
+        raise IOError('Unexpected contents in "{}"'.format(output_path))
+
+    if not data.get('binary'):
+        contents = contents.decode()
+
+    signature = _get_written_signature(output_path, digest)
+    if signature:
+        _WRITTEN_FILES[output_path] = (contents, signature)
+    return FILE_WRITE_ENTRY(path=data['path'], contents=contents)
 
 
 def deploy(files_list: typing.List[tuple]):
@@ -69,36 +143,207 @@ def make_output_directory(output_path: str) -> str:
     return output_directory
 
 
-def copy(copy_entry: FILE_COPY_ENTRY):
+def _list_copy_pairs(
+        copy_entry: FILE_COPY_ENTRY
+) -> typing.List[typing.Tuple[str, str]]:
     """
-    Copies the specified file from its source location to its destination
-    location.
+    Lists the source and destination path pairs for each of the files that
+    will be copied by the given copy entry, which is a single pair for a
+    file copy and the pairs of all the files within a directory copy.
     """
     source_path = environ.paths.clean(copy_entry.source)
     output_path = environ.paths.clean(copy_entry.destination)
-    copier = shutil.copy2 if os.path.isfile(source_path) else shutil.copytree
+
+    if os.path.isfile(source_path):
+        return [(source_path, output_path)]
+
+    pairs = []
+    for directory, _, filenames in os.walk(source_path):
+        relative = os.path.relpath(directory, source_path)
+        for filename in filenames:
+            pairs.append((
+                os.path.join(directory, filename),
+                os.path.normpath(os.path.join(output_path, relative, filename))
+            ))
+    return pairs
+
+
+def _is_same_file(source_path: str, output_path: str) -> bool:
+    """
+    Whether or not the output file is an unchanged copy of the source file,
+    which is determined by the size and modified time of the two files
+    given that copies preserve the modified time of their source.
+    """
+    try:
+        source = os.stat(source_path)
+        output = os.stat(output_path)
+    except OSError:
+        return False
+
+    return (
+        source.st_size == output.st_size
+        and int(source.st_mtime) == int(output.st_mtime)
+    )
+
+
+def _copy_file(source_path: str, output_path: str) -> bool:
+    """
+    Copies the source file to the output path unless an unchanged copy
+    already exists there. The copy is made to a temporary file that then
+    replaces the output file atomically.
+
+    :return:
+        Whether or not the file was copied.
+    """
+    if _is_same_file(source_path, output_path):
+        return False
+
     make_output_directory(output_path)
+    temp_path = '{}.tmp'.format(output_path)
+    shutil.copy2(source_path, temp_path)
+    os.replace(temp_path, output_path)
+    return True
 
-    for i in range(3):
-        try:
-            copier(source_path, output_path)
-            return
-        except Exception:
-            time.sleep(0.5)
 
-    raise IOError('Unable to copy "{source}" to "{destination}"'.format(
-        source=source_path,
-        destination=output_path
-    ))
+def copy(copy_entry: FILE_COPY_ENTRY):
+    """
+    Copies the specified file or directory from its source location to its
+    destination location. Files that already have an unchanged copy at the
+    destination location are skipped.
+    """
+    source_path = environ.paths.clean(copy_entry.source)
+    output_path = environ.paths.clean(copy_entry.destination)
+
+    if not os.path.exists(source_path):
+        raise IOError('Unable to copy "{source}" to "{destination}"'.format(
+            source=source_path,
+            destination=output_path
+        ))
+
+    if os.path.isdir(source_path) and not os.path.exists(output_path):
+        os.makedirs(output_path)
+
+    for source_file, output_file in _list_copy_pairs(copy_entry):
+        for i in range(3):
+            try:
+                _copy_file(source_file, output_file)
+                break
+            except Exception:
+                time.sleep(0.5)
+        else:
+            raise IOError(
+                'Unable to copy "{source}" to "{destination}"'.format(
+                    source=source_file,
+                    destination=output_file
+                )
+            )
+
+
+def _get_digest(contents: typing.Union[str, bytes]) -> str:
+    """Returns a hex digest of the file contents."""
+    try:
+        data = contents.encode()
+    except AttributeError:
+        data = contents
+    return hashlib.sha1(data).hexdigest()
+
+
+def get_digest(path: str, contents: typing.Union[str, bytes]) -> str:
+    """
+    Returns a hex digest of the file contents, which is reused without
+    hashing the contents again if the same contents object was the last
+    one written to the path.
+    """
+    written = _WRITTEN_FILES.get(environ.paths.clean(path))
+    if written and written[0] is contents:
+        return written[1][0]
+    return _get_digest(contents)
 
 
-def write(write_entry: FILE_WRITE_ENTRY):
+def _get_written_signature(
+        path: str,
+        digest: str
+) -> typing.Optional[tuple]:
     """
-    Writes the contents of the specified file entry to its destination path.
+    Returns the signature of the file at the given path for the specified
+    contents digest, or None if the file does not exist.
+    """
+    try:
+        stats = os.stat(path)
+    except OSError:
+        return None
+    return digest, stats.st_size, stats.st_mtime_ns
+
+
+def write(write_entry: FILE_WRITE_ENTRY) -> bool:
+    """
+    Writes the contents of the specified file entry to its destination path
+    unless the same contents were already written there and the file has not
+    been modified since. Files are written atomically so that the existing
+    file is never removed or left partially written during the update.
+
+    :return:
+        Whether or not the file was written.
     """
     output_path = environ.paths.clean(write_entry.path)
+    digest = get_digest(output_path, write_entry.contents)
+
+    written = _WRITTEN_FILES.get(output_path)
+    signature = _get_written_signature(output_path, digest)
+    if written and written[1] == signature:
+        return False
+
     make_output_directory(output_path)
-    writer.write_file(output_path, write_entry.contents)
+    success, error = writer.write_file_atomically(
+        output_path,
+        write_entry.contents
+    )
+
+    signature = _get_written_signature(output_path, digest)
+    if success and signature:
+        _WRITTEN_FILES[output_path] = (write_entry.contents, signature)
+    else:
+        _WRITTEN_FILES.pop(output_path, None)
+
+    return success
+
+
+def prune(directory: str, files_list: typing.List[tuple]) -> typing.List[str]:
+    """
+    Removes the files within the specified directory that are not written or
+    copied by any of the entries in the files_list, which cleans up files
+    left behind by earlier deployments without removing the directory.
+
+    :param directory:
+        The directory in which to remove files.
+    :param files_list:
+        A list of file write entries and file copy entries that were
+        deployed.
+    :return:
+        A list of the paths of the files that were removed.
+    """
+    directory = environ.paths.clean(directory)
+    expected = set()
+    for entry in files_list:
+        if isinstance(entry, FILE_WRITE_ENTRY):
+            expected.add(environ.paths.clean(entry.path))
+        elif isinstance(entry, FILE_COPY_ENTRY):
+            expected.update(o for _, o in _list_copy_pairs(entry))
+
+    removed = []
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.normpath(os.path.join(root, filename))
+            if path in expected:
+                continue
+            try:
+                os.remove(path)
+                _WRITTEN_FILES.pop(path, None)
+                removed.append(path)
+            except OSError:
+                pass
+
+    return removed
 
 
 def move(copy_entry: FILE_COPY_ENTRY):
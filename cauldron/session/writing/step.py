@@ -1,6 +1,7 @@
 import json
 import os
 import typing
+import weakref
 import zlib
 from collections import namedtuple
 
@@ -21,6 +22,30 @@ STEP_DATA = namedtuple('STEP_DATA', [
     'body_checksum'
 ])
 
+STEP_CHUNKS = namedtuple('STEP_CHUNKS', [
+    'name',
+    'status',
+    'has_error',
+    'body_id',
+    'start',
+    'sequence',
+    'chunks',
+    'pending',
+    'progress',
+    'includes',
+    'cauldron_version',
+    'file_writes'
+])
+
+#: The serialized data of a step that is reused for as long as the step's
+#: DOM and its version have not changed.
+SERIALIZED_STEP = namedtuple('SERIALIZED_STEP', ['dom', 'version', 'data'])
+
+#: Serialized data of the steps that are not running, which prevents
+#: finished steps from being serialized again by every save and status
+#: poll until their reports change.
+_serialized_steps = weakref.WeakKeyDictionary()
+
 
 def create_data(step: 'projects.ProjectStep') -> STEP_DATA:
     """
@@ -56,7 +81,8 @@ def get_cached_data(
     """
     Attempts to load and return the cached step data for the specified step. If
     not cached data exists, or the cached data is corrupt, a None value is
-    returned instead.
+    returned instead. The contents of the files written by the step are read
+    back from the files themselves, which must not have changed since.
 
     :param step:
         The step for which the cached data should be loaded
@@ -74,13 +100,18 @@ def get_cached_data(
     try:
         with open(cache_path, 'r') as f:
             cached_data = json.load(f)
+        file_writes = [
+            file_io.entry_from_reference(fw)
+            if 'digest' in fw else
+            file_io.entry_from_dict(fw)
+            for fw in cached_data['file_writes']
+        ]
     except Exception:
         return None
 
-    file_writes = [
-        file_io.entry_from_dict(fw)
-        for fw in cached_data['file_writes']
-    ]
+    # The status stored in the cache is that of the session in which the
+    # step was run and is replaced by the current status of the step.
+    cached_data.pop('status', None)
 
     return out \
         ._replace(**cached_data) \
@@ -91,13 +122,24 @@ def _make_cache_write_entry(
         step: 'projects.ProjectStep',
         step_data: STEP_DATA
 ) -> typing.Optional[file_io.FILE_WRITE_ENTRY]:
-    """..."""
+    """
+    Creates the file write entry for the step cache file, which stores the
+    serialized step data for use by later sessions. Files written by the
+    step are stored as references to the written files instead of their
+    contents, which keeps large report files, such as table pages and
+    images, out of the step cache file.
+    """
     cache_path = step.report.results_cache_path
     if not cache_path:
         return None
 
     storable_step_data = step_data \
-        ._replace(file_writes=[fw._asdict() for fw in step_data.file_writes]) \
+        ._replace(file_writes=[
+            file_io.entry_to_reference(fw)
+            if isinstance(fw, file_io.FILE_WRITE_ENTRY) else
+            file_io.entry_to_dict(fw)
+            for fw in step_data.file_writes
+        ]) \
         ._asdict()
 
     return file_io.FILE_WRITE_ENTRY(
@@ -106,6 +148,24 @@ def _make_cache_write_entry(
     )
 
 
+def _get_report_file_writes(
+        step: 'projects.ProjectStep'
+) -> typing.List[file_io.FILE_WRITE_ENTRY]:
+    """
+    Returns the file write entries for the files added to the report of the
+    step, which are keyed by their paths relative to the project output
+    directory.
+    """
+    output_directory = step.project.output_directory
+    return [
+        file_io.FILE_WRITE_ENTRY(
+            path=os.path.join(output_directory, *name.split('/')),
+            contents=contents
+        )
+        for name, contents in step.report.files.fetch(None).items()
+    ]
+
+
 def _populate_data(step: 'projects.ProjectStep') -> STEP_DATA:
     """..."""
     step_data = create_data(step)
@@ -118,6 +178,7 @@ def _populate_data(step: 'projects.ProjectStep') -> STEP_DATA:
 
     file_writes = step_data.file_writes.copy()
     file_writes.extend(component.files)
+    file_writes.extend(_get_report_file_writes(step))
 
     body = step.get_dom()
     checksum = zlib.adler32(body.encode())
@@ -136,18 +197,69 @@ def _populate_data(step: 'projects.ProjectStep') -> STEP_DATA:
     )
 
 
+def get_version(step: 'projects.ProjectStep') -> tuple:
+    """
+    Returns the version of the step's report and includes, which together
+    with the step's DOM determines whether or not previously serialized data
+    for the step is still current.
+    """
+    report = step.report
+    return (
+        report.body_id,
+        report.last_update_time,
+        tuple(report.library_includes),
+        tuple(step.web_includes),
+        bool(step.error)
+    )
+
+
 def serialize(step: 'projects.ProjectStep') -> STEP_DATA:
-    """..."""
-    def disable_caching():
-        return step.is_running or step.last_modified or step.error
+    """
+    Serializes the step for display and for writing to the results files.
+    The serialized data of steps that are not running is kept in memory and
+    reused until the DOM, report or includes of the step change, with only
+    the status of the step updated on reuse. Steps that have not run in the
+    current session are loaded from the step cache file written by a
+    previous session when one exists.
 
-    cached = None if disable_caching() else get_cached_data(step)
-    if cached:
-        return cached
+    :param step:
+        The step to serialize.
+    :return:
+        The serialized data for the step.
+    """
+    if step.is_running:
+        return create_data(step) if step.is_muted else _serialize(step)
 
-    if step.is_muted:
+    from_file = not step.last_modified and not step.error
+    if step.is_muted and not from_file:
         return create_data(step)
 
+    dom = step.dom if from_file else step.get_dom()
+    entry = _serialized_steps.get(step)
+    if entry and entry.dom is dom and entry.version == get_version(step):
+        return entry.data._replace(status=step.status())
+
+    step_data = get_cached_data(step) if from_file else None
+    if step_data is None:
+        if step.is_muted:
+            return create_data(step)
+        step_data = _serialize(step)
+
+    # The DOM and version are read again because serializing the step can
+    # create its DOM and flush its output into the report.
+    _serialized_steps[step] = SERIALIZED_STEP(
+        step.dom,
+        get_version(step),
+        step_data
+    )
+    return step_data
+
+
+def _serialize(step: 'projects.ProjectStep') -> STEP_DATA:
+    """
+    Serializes the step along with the file write entry that stores the
+    serialized data in the step cache file.
+    """
     step_data = _populate_data(step)
 
     # Add cache of step data to the file writes list
@@ -155,3 +267,54 @@ def serialize(step: 'projects.ProjectStep') -> STEP_DATA:
     file_writes.append(_make_cache_write_entry(step, step_data))
 
     return step_data._replace(file_writes=file_writes)
+
+
+def serialize_chunks(
+        step: 'projects.ProjectStep',
+        body_id: str = None,
+        sequence: int = 0
+) -> STEP_CHUNKS:
+    """
+    Serializes only the report body chunks that were appended to the step
+    after the client-side state specified by the body_id and sequence, which
+    is used while a step is running so that status polls do not re-serialize
+    the entire step body each time.
+
+    :param step:
+        Project step for which to serialize the body changes.
+    :param body_id:
+        Identifier of the report body from which the client last received
+        chunks. If this does not match the current report body, all of the
+        chunks will be returned and the client should replace its body.
+    :param sequence:
+        The number of chunks the client has already received.
+    :return:
+        Step chunks tuple where start is the sequence number of the first
+        returned chunk and sequence is the number of chunks the client will
+        have after appending the returned ones. The pending value contains
+        the printed output that has not yet been flushed to the body and the
+        progress value contains the rendered run status of the step, both of
+        which replace any previously received values.
+    """
+    report = step.report
+    component = components.get(step)
+
+    # Read the pending output before the chunks so that any output flushed
+    # to the body between the two reads is briefly duplicated, not lost.
+    pending = report.read_stdout() if step.is_running else ''
+    body_chunks = report.get_body_chunks(body_id, sequence)
+
+    return STEP_CHUNKS(
+        name=step.definition.name,
+        status=step.status(),
+        has_error=bool(step.error),
+        body_id=body_chunks.body_id,
+        start=body_chunks.start,
+        sequence=body_chunks.start + len(body_chunks.chunks),
+        chunks=body_chunks.chunks,
+        pending=pending,
+        progress=step.dumps_status() if step.is_running else '',
+        includes=[include._asdict() for include in component.includes],
+        cauldron_version=list(environ.version_info),
+        file_writes=component.files + _get_report_file_writes(step)
+    )
@@ -8,6 +8,7 @@ import typing
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
 from jinja2 import Template
+from jinja2 import meta
 from jinja2 import pass_context
 from jinja2.runtime import Context
 
@@ -108,6 +109,18 @@ def render(template: typing.Union[str, Template], **kwargs):
     )
 
 
+def get_variable_names(template: str) -> typing.Set[str]:
+    """
+    Returns the names of the variables that the template string expects to
+    be supplied when it is rendered.
+
+    :param template:
+        The string containing the template to be rendered
+    """
+    tree = get_environment().parse(textwrap.dedent(template))
+    return meta.find_undeclared_variables(tree)
+
+
 def render_file(path: str, **kwargs):
     """
     Renders a file at the specified absolute path. The file can reside
@@ -192,10 +192,16 @@ class TestRun(scaffolds.ResultsTest):
     def test_repeat_additions(self):
         """Should not repeat run multiple named steps in a single run."""
         support.create_project(self, 'plymouth')
-        support.add_step(self)
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'print(cd.shared.fetch("value"))'
+        ]))
         support.add_step(self)
 
         project = cauldron.project.get_internal_project()
+        with open(project.steps[0].source_path, 'w') as f:
+            f.write('import cauldron as cd\ncd.shared.value = 1')
+
         step_names = [
             project.steps[1].filename,
             project.steps[0].filename,
@@ -208,14 +214,127 @@ class TestRun(scaffolds.ResultsTest):
         )
 
         self.assertFalse(r.failed)
-        for s in project.steps[:1]:
-            self.assertFalse(s.is_dirty(), """
-                Expect "{}" step not to be dirty
-                """.format(s.filename))
-        for s in project.steps[1:]:
-            self.assertTrue(s.is_dirty(), """
-                Expect "{}" step to be dirty
-                """.format(s.filename))
+        self.assertFalse(project.steps[0].is_dirty(), """
+            Expect "{}" step not to be dirty
+            """.format(project.steps[0].filename))
+        self.assertTrue(project.steps[1].is_dirty(), """
+            Expect "{}" step to be dirty because it read a shared value
+            changed by a step run after it
+            """.format(project.steps[1].filename))
+        self.assertFalse(project.steps[2].is_dirty(), """
+            Expect "{}" step not to be dirty because it does not read any
+            of the changed shared values
+            """.format(project.steps[2].filename))
+
+    def test_independent_steps(self):
+        """Should not invalidate later steps that do not consume changes."""
+        support.create_project(self, 'golden-valley')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.shared.second = cd.shared.first + 1'
+        ]))
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.shared.third = 3'
+        ]))
+
+        project = cauldron.project.get_internal_project()
+        with open(project.steps[0].source_path, 'w') as f:
+            f.write('import cauldron as cd\ncd.shared.first = 1')
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed)
+
+        r = run.execute(
+            context=cli.make_command_context(name=run.NAME),
+            step=[project.steps[0].filename]
+        )
+
+        self.assertFalse(r.failed)
+        self.assertFalse(project.steps[0].is_dirty())
+        self.assertTrue(project.steps[1].is_dirty())
+        self.assertFalse(project.steps[2].is_dirty())
+
+    def test_markdown_dependents(self):
+        """Should invalidate markdown steps when shared values change."""
+        support.create_project(self, 'silver-lake')
+        support.add_step(self, 'S02-notes.md', 'Value is {{ first }}')
+
+        project = cauldron.project.get_internal_project()
+        with open(project.steps[0].source_path, 'w') as f:
+            f.write('import cauldron as cd\ncd.shared.first = 1')
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed)
+
+        r = run.execute(
+            context=cli.make_command_context(name=run.NAME),
+            step=[project.steps[0].filename]
+        )
+
+        self.assertFalse(r.failed)
+        self.assertTrue(project.steps[1].is_dirty(), """
+            Expect the markdown step to be dirty because it can template
+            any of the shared values
+            """)
+
+    def test_modified_in_place(self):
+        """Should invalidate readers of values assigned into in place."""
+        support.create_project(self, 'stone-arch')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.shared.values["b"] = 2'
+        ]))
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.shared.total = sum(cd.shared.values.values())'
+        ]))
+
+        project = cauldron.project.get_internal_project()
+        with open(project.steps[0].source_path, 'w') as f:
+            f.write('import cauldron as cd\ncd.shared.values = {"a": 1}')
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed)
+
+        r = run.execute(
+            context=cli.make_command_context(name=run.NAME),
+            step=[project.steps[1].filename]
+        )
+
+        self.assertFalse(r.failed)
+        self.assertTrue(project.steps[2].is_dirty())
+
+    def test_modified_through_alias(self):
+        """Should invalidate readers of values modified through aliases."""
+        support.create_project(self, 'lake-harriet')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'items = cd.shared.items',
+            'items["a"] = 2'
+        ]))
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("VALUE={}".format(cd.shared.items["a"]))'
+        ]))
+
+        project = cauldron.project.get_internal_project()
+        with open(project.steps[0].source_path, 'w') as f:
+            f.write('import cauldron as cd\ncd.shared.items = {"a": 1}')
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed)
+        self.assertIn('VALUE=2', project.steps[2].dom)
+
+        with open(project.steps[1].source_path, 'a') as f:
+            f.write('\nitems["a"] = 999\n')
+        r = support.run_command('run')
+
+        self.assertFalse(r.failed)
+        self.assertEqual({'a': 999}, project.shared.items)
+        self.assertIn('VALUE=999', project.steps[2].dom, """
+            Expect the step reading the modified value to run again.
+            """)
 
     def test_no_such_step(self):
         """Should fail if unable to find a step."""
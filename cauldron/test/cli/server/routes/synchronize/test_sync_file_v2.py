@@ -0,0 +1,120 @@
+import os
+import zlib
+
+import cauldron
+from cauldron.cli import sync
+from cauldron.test import support
+from cauldron.test.support import server
+from cauldron.test.support.flask_scaffolds import FlaskResultsTest
+
+SOURCE = b'abcdefghij' * 25
+
+
+class TestSyncFileV2(FlaskResultsTest):
+    """..."""
+
+    def post_chunk(self, index: int, chunk_size: int = 100, **kwargs):
+        """Posts the chunk of the source data at the given index."""
+        chunk = SOURCE[index * chunk_size:(index + 1) * chunk_size]
+        body, encoding = sync.io.pack_binary_chunk(chunk)
+        args = dict(
+            relative_path='data/test.bin',
+            index=index,
+            size=len(SOURCE),
+            chunk_size=chunk_size,
+            modified=1000.5,
+            checksum=zlib.crc32(chunk),
+            encoding=encoding
+        )
+        args.update(kwargs)
+
+        flask_response = self.app.post(
+            '/sync-file-v2',
+            query_string=args,
+            data=body,
+            content_type='application/octet-stream'
+        )
+        return server.deserialize_flask_response(flask_response)
+
+    def open_project(self, name: str) -> 'cauldron.project.Project':
+        """Opens a new project in the kernel."""
+        support.create_project(self, name)
+        project = cauldron.project.get_internal_project()
+
+        response = support.run_remote_command(
+            'open "{}" --forget'.format(project.source_directory)
+        )
+        self.assert_no_errors(response)
+        return cauldron.project.get_internal_project()
+
+    def test_no_args(self):
+        """Should error without arguments."""
+        response = self.post('/sync-file-v2').response
+        self.assert_has_error_code(response, 'INVALID_ARGS')
+
+    def test_no_project(self):
+        """Should error without an open project."""
+        response = self.post_chunk(0)
+        self.assert_has_error_code(response, 'NO_OPEN_PROJECT')
+
+    def test_out_of_order(self):
+        """Should write chunks received in any order into the file."""
+        project = self.open_project('ooo')
+        path = os.path.join(project.source_directory, 'data', 'test.bin')
+
+        for index in [2, 0]:
+            response = self.post_chunk(index)
+            self.assert_has_success_code(response, 'SAVED_CHUNK')
+            self.assertFalse(os.path.exists(path))
+
+        response = self.post_chunk(1)
+        self.assert_has_success_code(response, 'SAVED_FILE')
+
+        with open(path, 'rb') as f:
+            self.assertEqual(SOURCE, f.read())
+        self.assertFalse(os.path.exists('{}.cauldron-partial'.format(path)))
+
+        support.run_remote_command('close')
+
+    def test_resume(self):
+        """Should return the chunks already received for the file."""
+        self.open_project('resumed')
+        self.post_chunk(1)
+        self.post_chunk(2)
+
+        args = dict(
+            relative_path='data/test.bin',
+            size=len(SOURCE),
+            chunk_size=100,
+            modified=1000.5
+        )
+        response = server.deserialize_flask_response(
+            self.app.get('/sync-file-v2', query_string=args)
+        )
+        self.assertEqual([1, 2], response.data['received'])
+
+        args['modified'] = 2000
+        response = server.deserialize_flask_response(
+            self.app.get('/sync-file-v2', query_string=args)
+        )
+        self.assertEqual([], response.data['received'], """
+            Expect no chunks to have been received for a different version
+            of the source file.
+            """)
+
+        support.run_remote_command('close')
+
+    def test_invalid_checksum(self):
+        """Should reject chunks with contents that do not match."""
+        project = self.open_project('checksum')
+
+        response = self.post_chunk(0, checksum=12)
+        self.assert_has_error_code(response, 'INVALID_CHUNK')
+
+        response = self.post_chunk(3)
+        self.assert_has_error_code(response, 'INVALID_CHUNK')
+
+        path = os.path.join(project.source_directory, 'data', 'test.bin')
+        self.assertFalse(os.path.exists(path))
+
+        support.run_remote_command('close')
@@ -0,0 +1,50 @@
+import os
+
+import cauldron
+from cauldron.cli import sync
+from cauldron.test import support
+from cauldron.test.support.flask_scaffolds import FlaskResultsTest
+
+
+class TestSyncManifest(FlaskResultsTest):
+    """..."""
+
+    def test_no_args(self):
+        """Should error without arguments."""
+        response = self.post('/sync-manifest').response
+        self.assert_has_error_code(response, 'INVALID_ARGS')
+
+    def test_no_project(self):
+        """Should error without an open project."""
+        response = self.post('/sync-manifest', {'files': {}}).response
+        self.assert_has_error_code(response, 'NO_OPEN_PROJECT')
+
+    def test_changed(self):
+        """Should return the files that are missing or have changed."""
+        support.create_project(self, 'manifested')
+        project = cauldron.project.get_internal_project()
+
+        response = support.run_remote_command(
+            'open "{}" --forget'.format(project.source_directory)
+        )
+        self.assert_no_errors(response)
+        project = cauldron.project.get_internal_project()
+
+        path = os.path.join(project.source_directory, 'cauldron.json')
+        file_hash = sync.manifest.hash_file(path)
+
+        response = self.post('/sync-manifest', {
+            'files': {
+                'cauldron.json': file_hash,
+                'missing.py': file_hash,
+                'S01.py': 'fake-hash'
+            }
+        }).response
+
+        self.assert_no_errors(response)
+        self.assertEqual(
+            ['S01.py', 'missing.py'],
+            sorted(response.data['changed'])
+        )
+
+        support.run_remote_command('close')
@@ -71,6 +71,13 @@ class TestServer(FlaskResultsTest):
         self.assert_no_errors(response)
         self.assertEqual(response.data['run_status'], 'unknown')
 
+    def test_server_data_without_packages(self):
+        """Should omit the packages list from lightweight server data."""
+        result = server_run.get_server_data(include_packages=False)
+        self.assertNotIn('packages', result)
+        self.assertIn('python', result)
+        self.assertIn('packages', server_run.get_server_data())
+
     def test_abort_invalid(self):
         """Should cancel abort if nothing to abort."""
 
@@ -161,4 +168,5 @@ class TestServer(FlaskResultsTest):
             host='TEST',
         )
         server_run.execute(**kwargs)
-        assert waitress_serve.call_args[1] == kwargs
+        expected = dict(kwargs, threads=server_run.SERVER_THREADS)
+        assert waitress_serve.call_args[1] == expected
@@ -1,3 +1,4 @@
+import time
 import typing
 from collections import namedtuple
 from unittest.mock import MagicMock
@@ -107,6 +108,65 @@ class TestServerRunStatus(flask_scaffolds.FlaskResultsTest):
 
         self.deactivate_execution(active_response.identifier)
 
+    @patch('cauldron.cli.server.run.get_running_step_changes')
+    def test_body_sequences(self, get_running_step_changes):
+        """Should request appended step changes for the body sequences."""
+
+        get_running_step_changes.return_value = []
+        active_response = self.activate_execution('body-sequences')
+        body_sequences = {'S01.py': {'body_id': 'abc', 'sequence': 3}}
+
+        run_status = self.post(
+            '/run-status/{}'.format(active_response.identifier),
+            {'body_sequences': body_sequences}
+        )
+        self.assertEqual(run_status.flask.status_code, 200)
+
+        response = run_status.response
+        self.assertFalse(response.failed)
+        get_running_step_changes.assert_called_once_with(
+            write=True,
+            body_sequences=body_sequences
+        )
+
+        self.deactivate_execution(active_response.identifier)
+
+    def test_wait_for_log(self):
+        """Should stop waiting once new messages are logged."""
+
+        active_response = self.activate_execution('wait-for-log')
+        active_response.thread.logs = ['a', 'b']
+
+        start = time.time()
+        run_status = self.post(
+            '/run-status/{}'.format(active_response.identifier),
+            {'wait': 3, 'log_index': 1}
+        )
+        elapsed = time.time() - start
+
+        response = run_status.response
+        self.assertFalse(response.failed)
+        self.assertEqual(['a', 'b'], response.data['run_log'])
+        self.assertEqual(3, response.data['run_wait'])
+        self.assertLess(elapsed, 2)
+
+        self.deactivate_execution(active_response.identifier)
+
+    def test_wait_timeout(self):
+        """Should wait until timeout without any run changes."""
+
+        active_response = self.activate_execution('wait-timeout')
+        active_response.thread.logs = ['a']
+
+        changed = server_runner.wait_for_run_changes(
+            active_response,
+            wait=0.2,
+            log_index=1
+        )
+        self.assertFalse(changed)
+
+        self.deactivate_execution(active_response.identifier)
+
     def test_not_running(self):
         """Should succeed even if the step is no longer running """
 
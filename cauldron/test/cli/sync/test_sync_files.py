@@ -33,11 +33,17 @@ class TestSyncFiles(scaffolds.ResultsTest):
 
         self.assert_has_success_code(response, 'NOT_MODIFIED')
 
-    @patch('cauldron.cli.sync.files.send_chunk')
-    def test_send_progress(self, send_chunk: MagicMock):
+    @patch('cauldron.cli.sync.files.get_received_chunks')
+    @patch('cauldron.cli.sync.files.send_binary_chunk')
+    def test_send_progress(
+            self,
+            send_binary_chunk: MagicMock,
+            get_received_chunks: MagicMock
+    ):
         """Should send file in multiple chunks."""
 
-        send_chunk.return_value = Response()
+        send_binary_chunk.return_value = Response()
+        get_received_chunks.return_value = Response()
 
         file_path = os.path.realpath(__file__)
         size = os.path.getsize(file_path)
@@ -52,12 +58,69 @@ class TestSyncFiles(scaffolds.ResultsTest):
 
         self.assertTrue(response.success)
         self.assertGreaterEqual(chunk_count, len(response.messages))
+        self.assertEqual(chunk_count, send_binary_chunk.call_count)
+
+    @patch('cauldron.cli.sync.files.get_received_chunks')
+    @patch('cauldron.cli.sync.files.send_binary_chunk')
+    def test_send_resume(
+            self,
+            send_binary_chunk: MagicMock,
+            get_received_chunks: MagicMock
+    ):
+        """Should only send chunks not already received by the kernel."""
+
+        send_binary_chunk.return_value = Response()
+        get_received_chunks.return_value = Response().update(
+            received=[0, 2]
+        ).response
+
+        file_path = os.path.realpath(__file__)
+        chunk_size = int(os.path.getsize(file_path) / 3) + 1
+
+        response = sync.files.send(
+            file_path=file_path,
+            relative_path=__file__,
+            chunk_size=chunk_size
+        )
+
+        self.assertTrue(response.success)
+        indexes = [c[1]['index'] for c in send_binary_chunk.call_args_list]
+        self.assertEqual([1], indexes)
 
     @patch('cauldron.cli.sync.files.send_chunk')
-    def test_failed_chunk(self, send_chunk: MagicMock):
+    @patch('cauldron.cli.sync.files.get_received_chunks')
+    @patch('cauldron.cli.sync.files.send_binary_chunk')
+    def test_send_legacy(
+            self,
+            send_binary_chunk: MagicMock,
+            get_received_chunks: MagicMock,
+            send_chunk: MagicMock
+    ):
+        """Should send encoded chunks to kernels without binary support."""
+
+        unsupported = Response().fail(code='INVALID_REMOTE_RESPONSE').response
+        unsupported.http_response = MagicMock(status_code=404)
+        get_received_chunks.return_value = unsupported
+        send_chunk.return_value = Response()
+
+        file_path = os.path.realpath(__file__)
+        chunk_size = int(os.path.getsize(file_path) / 3) + 1
+
+        response = sync.files.send(
+            file_path=file_path,
+            relative_path=__file__,
+            chunk_size=chunk_size
+        )
+
+        self.assertTrue(response.success)
+        send_binary_chunk.assert_not_called()
+        self.assertEqual(3, send_chunk.call_count)
+
+    @patch('cauldron.cli.sync.files.send_binary_chunk')
+    def test_failed_chunk(self, send_binary_chunk: MagicMock):
         """Should abort sending when chunk write fails."""
 
-        send_chunk.return_value = Response().fail().response
+        send_binary_chunk.return_value = Response().fail().response
         file_path = os.path.realpath(__file__)
 
         response = sync.files.send(
@@ -67,13 +130,66 @@ class TestSyncFiles(scaffolds.ResultsTest):
 
         self.assertTrue(response.failed)
 
+    @patch('cauldron.cli.sync.files.get_changed_files')
     @patch('cauldron.cli.sync.files.send')
-    def test_all_failed_file(self, send: MagicMock):
+    def test_all_failed_file(
+            self,
+            send: MagicMock,
+            get_changed_files: MagicMock
+    ):
         """Should abort sending when file send fails."""
 
         send.return_value = Response().fail().response
+        get_changed_files.return_value = Response().update(
+            changed=[os.path.basename(__file__)]
+        ).response
         directory = os.path.dirname(os.path.realpath(__file__))
 
         response = sync.files.send_all_in(directory)
 
         self.assertTrue(response.failed)
+
+    @patch('cauldron.cli.sync.manifest.get_manifest_path')
+    @patch('cauldron.cli.sync.files.get_changed_files')
+    @patch('cauldron.cli.sync.files.send')
+    def test_all_changed_only(
+            self,
+            send: MagicMock,
+            get_changed_files: MagicMock,
+            get_manifest_path: MagicMock
+    ):
+        """Should only send files with contents that differ remotely."""
+
+        directory = self.get_temp_path('test_all_changed_only')
+        os.makedirs(os.path.join(directory, 'data', '__pycache__'))
+        contents = {
+            'a.txt': 'a',
+            'data/b.txt': 'b',
+            'empty.txt': '',
+            '.hidden': 'hidden',
+            'data/__pycache__/c.pyc': 'c'
+        }
+        for name, value in contents.items():
+            with open(os.path.join(directory, name), 'w') as f:
+                f.write(value)
+
+        manifest_path = self.get_temp_path('test_all_changed_only_manifest')
+        get_manifest_path.return_value = manifest_path + '/manifest.json'
+        send.return_value = Response()
+        get_changed_files.return_value = Response().update(
+            changed=['data/b.txt']
+        ).response
+
+        response = sync.files.send_all_in(directory)
+
+        self.assertTrue(response.success)
+        file_hashes = get_changed_files.call_args[0][0]
+        self.assertEqual({'a.txt', 'data/b.txt'}, set(file_hashes.keys()))
+        send.assert_called_once()
+        self.assertEqual(
+            os.path.join('data', 'b.txt'),
+            send.call_args[1]['relative_path']
+        )
+
+        manifest = sync.manifest.load(get_manifest_path.return_value)
+        self.assertEqual(file_hashes['a.txt'], manifest['a.txt'][2])
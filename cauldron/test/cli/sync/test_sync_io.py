@@ -35,3 +35,41 @@ class TestSyncIo(scaffolds.ResultsTest):
         fake_path = '{}.fake-file'.format(__file__)
         chunks = [c for c, length in sync.io.read_file_chunks(fake_path)]
         self.assertEqual(0, len(chunks))
+
+    def test_binary_packing(self):
+        """Should pack and unpack binary chunks with compression."""
+
+        source = b'abcdefg' * 100
+        packed, encoding = sync.io.pack_binary_chunk(source)
+        unpacked = sync.io.unpack_binary_chunk(packed, encoding)
+        self.assertEqual('zlib', encoding)
+        self.assertEqual(source, unpacked)
+
+    def test_binary_packing_incompressible(self):
+        """Should not compress binary chunks that do not get smaller."""
+
+        source = os.urandom(1000)
+        packed, encoding = sync.io.pack_binary_chunk(source)
+        self.assertEqual('', encoding)
+        self.assertEqual(source, packed)
+
+    def test_writing_chunks_at(self):
+        """Should write chunks read out of order into an identical file."""
+
+        path = os.path.realpath(__file__)
+        out = self.get_temp_path('test_writing_chunks_at', 'test.py')
+        size = os.path.getsize(path)
+        with open(out, 'wb') as f:
+            f.truncate(size)
+
+        chunk_count = sync.io.get_file_chunk_count(path, 100)
+        for index in reversed(range(chunk_count)):
+            chunk = sync.io.read_file_chunk(path, index, 100)
+            sync.io.write_file_chunk_at(out, chunk, index * 100)
+
+        with open(path, 'rb') as f:
+            me = f.read()
+        with open(out, 'rb') as f:
+            compare = f.read()
+
+        self.assertEqual(me, compare)
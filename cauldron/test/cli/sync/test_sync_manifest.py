@@ -0,0 +1,88 @@
+import os
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from cauldron.cli.sync import manifest
+from cauldron.test.support import scaffolds
+
+
+class TestSyncManifest(scaffolds.ResultsTest):
+    """Tests for the cauldron.cli.sync.manifest module."""
+
+    def test_load_missing(self):
+        """Should load an empty manifest if the file does not exist."""
+        path = self.get_temp_path('test_load_missing', 'fake.json')
+        self.assertEqual({}, manifest.load(path))
+
+    def test_save_and_load(self):
+        """Should load the saved manifest entries."""
+        path = self.get_temp_path('test_save_and_load', 'sync', 'm.json')
+        entries = {'a.txt': [1, 2, 'abc']}
+        manifest.save(path, entries)
+        self.assertEqual(entries, manifest.load(path))
+
+    def test_missing_file_hash(self):
+        """Should return None for a file that does not exist."""
+        path = self.get_temp_path('test_missing_file_hash', 'fake.txt')
+        self.assertIsNone(manifest.get_file_hash(path))
+
+    @patch('cauldron.cli.sync.manifest.hash_file')
+    def test_cached_file_hash(self, hash_file: MagicMock):
+        """Should only hash files again when their size or time changes."""
+        hash_file.return_value = 'abc'
+        path = self.get_temp_path('test_cached_file_hash', 'file.txt')
+        with open(path, 'w') as f:
+            f.write('abc')
+
+        entries = dict()
+        first = manifest.get_file_hash(path, entries=entries, key='file')
+        second = manifest.get_file_hash(path, entries=entries, key='file')
+        self.assertEqual('abc', first)
+        self.assertEqual('abc', second)
+        self.assertEqual(1, hash_file.call_count)
+
+        stats = os.stat(path)
+        os.utime(path, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1000))
+        manifest.get_file_hash(path, entries=entries, key='file')
+        self.assertEqual(2, hash_file.call_count)
+
+    def test_file_hash_contents(self):
+        """Should produce hashes that only depend on file contents."""
+        paths = [
+            self.get_temp_path('test_file_hash_contents', name)
+            for name in ['a.txt', 'b.txt', 'c.txt']
+        ]
+        for path, contents in zip(paths, ['abc', 'abc', 'abd']):
+            with open(path, 'w') as f:
+                f.write(contents)
+
+        hashes = [manifest.get_file_hash(p, entries={}) for p in paths]
+        self.assertEqual(hashes[0], hashes[1])
+        self.assertNotEqual(hashes[0], hashes[2])
+
+    def test_list_files(self):
+        """Should list only files that should be synchronized."""
+        directory = self.get_temp_path('test_list_files')
+        os.makedirs(os.path.join(directory, 'sub', '.hidden'))
+        names = [
+            'a.py',
+            'b.whl',
+            'empty.txt',
+            os.path.join('sub', 'c.txt'),
+            os.path.join('sub', '.hidden', 'd.txt')
+        ]
+        for name in names:
+            with open(os.path.join(directory, name), 'w') as f:
+                f.write('' if name == 'empty.txt' else 'x')
+
+        listed = [
+            path[len(directory):].strip(os.path.sep)
+            for path, stats in manifest.list_files(directory)
+        ]
+        self.assertEqual(
+            ['a.py', os.path.join('sub', 'c.txt')],
+            sorted(listed)
+        )
+
+        listed = list(manifest.list_files(directory, recursive=False))
+        self.assertEqual(1, len(listed))
@@ -53,3 +53,45 @@ class TestSyncThreading(scaffolds.ResultsTest):
         self.assertEqual(last_response.data['run_status'], 'complete')
         first_response = thread.responses[0]
         self.assertEqual(first_response.data['run_status'], 'running')
+
+    @patch('cauldron.cli.sync.comm.send_request')
+    def test_check_status_wait(self, send_request: MagicMock):
+        """Should request a long-polled run status with the log index."""
+
+        thread = threads.AsyncCommandThread('fake_command_name')
+        thread.responses.append(environ.Response().update(
+            run_uid='abc',
+            run_log=['a', 'b']
+        ))
+
+        thread.check_status()
+
+        kwargs = send_request.call_args[1]
+        self.assertEqual('/run-status/abc', kwargs['endpoint'])
+        self.assertEqual('POST', kwargs['method'])
+        self.assertEqual(
+            dict(wait=threads.RUN_STATUS_WAIT, log_index=2),
+            kwargs['data']
+        )
+        self.assertGreater(kwargs['timeout'], threads.RUN_STATUS_WAIT)
+
+    @patch('cauldron.cli.sync.threads.time.sleep')
+    @patch('cauldron.cli.sync.comm.send_request')
+    def test_long_poll_no_sleep(
+            self,
+            send_request: MagicMock,
+            sleep: MagicMock
+    ):
+        """Should not sleep between long-polled run status requests."""
+
+        send_request.side_effect = [
+            environ.Response().update(run_status='running', run_uid='a'),
+            environ.Response().update(run_status='running', run_wait=4),
+            environ.Response().update(run_status='complete', run_wait=4),
+        ]
+
+        thread = threads.send_remote_command('fake_command_name')
+        thread.join()
+
+        self.assertEqual(3, len(thread.responses))
+        self.assertEqual(0, sleep.call_count)
@@ -0,0 +1,74 @@
+import threading
+import unittest
+
+from cauldron.cli import threads
+from cauldron.cli.threads import CauldronThread
+
+
+def _create_thread(command, is_executing: bool = False) -> CauldronThread:
+    """Creates a thread that runs the given command without arguments."""
+    thread = CauldronThread()
+    thread.kwargs = {}
+    thread.command = command
+    thread.is_executing = is_executing
+    return thread
+
+
+class TestThreads(unittest.TestCase):
+    """Test suite for the cauldron.cli.threads module"""
+
+    def test_abort_thread_not_aborted(self):
+        """Should not raise an error when no threads have been aborted."""
+        self.assertEqual(set(), threads._aborted_threads)
+        self.assertIsNone(threads.abort_thread())
+
+    def test_abort_executing_thread(self):
+        """Should raise an error only within the aborted thread."""
+        errors = []
+        ready = threading.Event()
+        resume = threading.Event()
+
+        def command(context):
+            ready.set()
+            resume.wait(5)
+            try:
+                threads.abort_thread()
+            except threads.ThreadAbortError as error:
+                errors.append(error)
+
+        thread = _create_thread(command=command, is_executing=True)
+        thread.start()
+        ready.wait(5)
+        thread.abort = True
+
+        self.assertTrue(thread.abort)
+        self.assertIsNone(threads.abort_thread(), """
+            Expect no error in the main thread when another thread has
+            been aborted.
+            """)
+
+        resume.set()
+        thread.join(5)
+
+        self.assertEqual(1, len(errors))
+        self.assertEqual(set(), threads._aborted_threads, """
+            Expect aborted threads to be removed once they finish.
+            """)
+
+    def test_abort_not_executing(self):
+        """Should not abort threads that are not executing step code."""
+        errors = []
+
+        def command(context):
+            try:
+                threads.abort_thread()
+            except threads.ThreadAbortError as error:
+                errors.append(error)
+
+        thread = _create_thread(command=command)
+        thread.abort = True
+        thread.start()
+        thread.join(5)
+
+        self.assertEqual([], errors)
+        self.assertEqual(set(), threads._aborted_threads)
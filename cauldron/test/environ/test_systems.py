@@ -157,3 +157,33 @@ class TestSystems(scaffolds.ResultsTest):
 
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 0)
+
+    def test_get_system_data_cached(self):
+        """Should reuse system data until the loaded modules change."""
+        systems.get_system_data(refresh=True)
+
+        with patch('cauldron.environ.systems._create_system_data') as create:
+            first = systems.get_system_data()
+            first['packages'].append({'name': 'fake'})
+            second = systems.get_system_data()
+
+        self.assertEqual(0, create.call_count)
+        self.assertNotIn({'name': 'fake'}, second['packages'])
+
+    def test_get_system_data_modules_changed(self):
+        """Should recompute system data when the loaded modules change."""
+        systems.get_system_data(refresh=True)
+
+        with ExitStack() as stack:
+            create = stack.enter_context(
+                patch('cauldron.environ.systems._create_system_data')
+            )
+            create.return_value = {'python': {}, 'packages': []}
+            stack.enter_context(
+                patch.dict('sys.modules', {'fake_module_for_test': None})
+            )
+            result = systems.get_system_data()
+
+        self.assertEqual(1, create.call_count)
+        self.assertEqual([], result['packages'])
+        systems.get_system_data(refresh=True)
@@ -1,4 +1,6 @@
+import json
 import os
+from unittest.mock import patch
 
 import cauldron as cd
 from cauldron import environ
@@ -35,6 +37,32 @@ class TestProject(scaffolds.ResultsTest):
         for key, value in shared_data.items():
             self.assertEqual(p.shared.fetch(key), value)
 
+    def test_shared_memory_limit(self):
+        """Should apply the shared memory limit of the project settings."""
+
+        support.create_project(self, 'hagrid')
+        project = cd.project.get_internal_project()
+        self.assertIsNone(project.shared.get_memory_limit())
+
+        settings = project.settings.fetch(None).copy()
+        settings['shared_memory_limit'] = '2GB'
+        with open(project.source_path, 'w') as f:
+            json.dump(settings, f)
+
+        project.refresh(force=True)
+        self.assertEqual(2 * 1024 ** 3, project.shared.get_memory_limit())
+
+    def test_get_setting(self):
+        """Should fall back to the environment configs for settings."""
+
+        support.create_project(self, 'dobby')
+        project = cd.project.get_internal_project()
+        project.settings.put(profiling=True)
+
+        with patch.object(environ.configs, 'fetch', return_value='1MB'):
+            self.assertTrue(project.get_setting('profiling'))
+            self.assertEqual('1MB', project.get_setting('output_head_size'))
+
     def test_title(self):
         """Project title should be readable and writable"""
 
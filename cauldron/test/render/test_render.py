@@ -76,6 +76,36 @@ class TestRender(scaffolds.ResultsTest):
         result = render.table(df, formats='{:,.1f}%')
         self.assertEqual(result.count('1.1%'), 2)
 
+    def test_streaming_table(self):
+        """Should render a table that loads its rows from page files."""
+        df = pd.DataFrame({
+            'foo': list(range(2500)),
+            'bar': [1.123123] * 2500
+        })
+
+        result = render.streaming_table(
+            df,
+            directory='tables/S01',
+            formats={'bar': '{:,.1f}%'},
+            page_size=1000
+        )
+
+        self.assertNotIn('1.1%', result['body'])
+        self.assertEqual(3, len(result['files']))
+
+        name = [n for n in result['files'] if n.endswith('/2.js')][0]
+        self.assertTrue(name.startswith('tables/S01/table-'))
+
+        page = result['files'][name]
+        self.assertIn('[2000, 2001', page)
+        self.assertEqual(500, page.count('1.1%'))
+
+    def test_streaming_table_empty(self):
+        """Should render a streaming table without any rows."""
+        df = pd.DataFrame({'foo': []})
+        result = render.streaming_table(df)
+        self.assertEqual(1, len(result['files']))
+
     def test_listing(self):
         """Should render a list of the results"""
 
@@ -156,6 +186,27 @@ class TestRender(scaffolds.ResultsTest):
 
         self.assertEqual(len(result), 0)
 
+    def test_code_file_cached(self):
+        """Should reuse the rendered code file until the file changes."""
+        path = self.get_temp_path('code-file', 'step.py')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('a = 1')
+
+        result = render.code_file(path)
+        with patch('builtins.open') as open_func:
+            open_func.side_effect = IOError('Fake Error')
+            cached = render.code_file(path)
+
+        self.assertEqual(result, cached)
+
+        with open(path, 'w') as f:
+            f.write('a = 12345')
+
+        updated = render.code_file(path)
+        self.assertNotEqual(result, updated)
+        self.assertTrue(updated.find('12345') != -1)
+
     def test_plotly_import_error(self):
         """Should fail if unable to import with plotly"""
 
@@ -184,6 +235,41 @@ class TestRender(scaffolds.ResultsTest):
         result = render.plotly([trace], {}, static=True)
         self.assertLess(0, result.index('"staticPlot": true'))
 
+    def test_shared_data_plotly(self):
+        """Should write each unique plotly trace to a single data file."""
+
+        trace = dict(type='scatter', x=[1, 2, 3], y=[3, 1, 2])
+        other = dict(type='bar', x=[1, 2], y=[4, 5])
+
+        first = render.shared_data_plotly([trace, other], {'height': 400})
+        second = render.shared_data_plotly([trace], {}, directory='/data/')
+
+        self.assertEqual(3, len(first['files']), """
+            Expect one data file for each trace and one for the template.
+            """)
+        self.assertEqual(2, len(second['files']))
+        self.assertEqual(
+            {name.split('/')[-1] for name in second['files']},
+            {name.split('/')[-1] for name in first['files']} &
+            {name.split('/')[-1] for name in second['files']},
+            'Expect identical traces to share the same data files.'
+        )
+        self.assertTrue(all(
+            name.startswith('data/') for name in second['files']
+        ))
+        self.assertIn('"height": 400', first['body'])
+        self.assertNotIn('"y": [3, 1, 2]', first['body'])
+
+    def test_shared_data_plotly_figure(self):
+        """Should split plotly figures into data files."""
+        from plotly import graph_objs as go
+
+        figure = go.Figure(data=[go.Scatter(x=[1, 2], y=[3, 4])])
+        result = render.shared_data_plotly(figure=figure, static=True)
+
+        self.assertEqual(2, len(result['files']))
+        self.assertIn('"staticPlot": true', result['body'])
+
     def test_status(self):
         """Should display status of specified data"""
 
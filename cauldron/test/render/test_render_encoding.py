@@ -1,10 +1,16 @@
 import unittest
 import json
 import datetime
+import decimal
+from collections import namedtuple
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 
+from cauldron.render import encoding
 from cauldron.render.encoding import ComplexJsonEncoder
+from cauldron.render.encoding import ComplexFlaskJsonEncoder
 
 
 class TestRenderEncoding(unittest.TestCase):
@@ -108,3 +114,127 @@ class TestRenderEncoding(unittest.TestCase):
         output = json.dumps(source, cls=ComplexJsonEncoder)
         self.assertIsInstance(output, str)
         self.assertEqual(2, output.count('2002-06-28T01:00:00'))
+
+    def test_datetime_values(self):
+        """Should convert datetimes to the ISO format of each timestamp."""
+        series = pd.Series([
+            pd.Timestamp(2016, 9, 9),
+            pd.Timestamp(2016, 9, 9, 1, 2, 3, 500000),
+            pd.NaT
+        ])
+
+        result = encoding.series_to_list(series)
+
+        self.assertEqual(
+            ['2016-09-09T00:00:00', '2016-09-09T01:02:03.500000', 'NaT'],
+            result
+        )
+
+    def test_categorical_values(self):
+        """Should convert categorical values through their categories."""
+        series = pd.Series(pd.Categorical(['x', 'y', None, 'x']))
+        result = encoding.series_to_list(series)
+        self.assertEqual(['x', 'y', 'x'], [result[i] for i in [0, 1, 3]])
+        self.assertTrue(np.isnan(result[2]))
+
+    def test_timedelta_values(self):
+        """Should convert timedeltas into seconds."""
+        series = pd.Series(pd.to_timedelta([1.5, 60], unit='s'))
+        self.assertEqual([1.5, 60.0], encoding.series_to_list(series))
+
+    def test_numpy_bool(self):
+        """Should serialize numpy booleans."""
+        output = json.dumps([np.bool_(True)], cls=ComplexJsonEncoder)
+        self.assertEqual('[true]', output)
+
+    def test_datetime_array(self):
+        """Should serialize datetime arrays as ISO strings."""
+        source = np.array(
+            [['2016-09-09', '2016-09-10T01:02:03']],
+            dtype='datetime64[ns]'
+        )
+        self.assertEqual(
+            [['2016-09-09T00:00:00', '2016-09-10T01:02:03']],
+            encoding.default_override(source)
+        )
+
+    def test_timedelta_array(self):
+        """Should serialize timedelta arrays as seconds."""
+        source = np.array([1500, 60000], dtype='timedelta64[ms]')
+        self.assertEqual([1.5, 60.0], encoding.default_override(source))
+
+    def test_register(self):
+        """Should dispatch registered types and their subclasses."""
+
+        class Distance:
+            def __init__(self, meters):
+                self.meters = meters
+
+        class Kilometers(Distance):
+            pass
+
+        self.assertIsInstance(
+            encoding.default_override(Distance(1)),
+            encoding.NOT_OVERRIDEN
+        )
+        encoding.default_override.register(Distance, lambda d: d.meters)
+
+        source = [Distance(2), Kilometers(3)]
+        output = json.dumps(source, cls=ComplexJsonEncoder)
+        self.assertEqual('[2, 3]', output)
+
+    def test_dumps(self):
+        """Should serialize the same values with either backend."""
+        Point = namedtuple('Point', ['x', 'y'])
+        source = {
+            'a': np.arange(3),
+            'b': pd.Series([1.5, 2.5]),
+            'c': decimal.Decimal('3.5'),
+            'd': datetime.datetime(2016, 1, 1, 1, 2, 3),
+            'e': pd.Timestamp('2016-01-01 01:02:03'),
+            'f': Point(1, 2),
+            'g': np.float32(0.5),
+            'h': b'bytes'
+        }
+
+        results = []
+        for backend in ['json', 'orjson']:
+            if backend == 'orjson' and encoding.orjson is None:
+                continue
+            with patch.dict(encoding._backend, name=backend):
+                results.append(json.loads(encoding.dumps(source)))
+
+        self.assertEqual(results[0], results[-1])
+        self.assertEqual([1, 2], results[0]['f'])
+        self.assertEqual('2016-01-01T01:02:03', results[0]['e'])
+
+    def test_dumps_unsupported(self):
+        """Should fail to serialize unsupported types with either backend."""
+        for backend in ['json', 'orjson']:
+            if backend == 'orjson' and encoding.orjson is None:
+                continue
+            with patch.dict(encoding._backend, name=backend):
+                with self.assertRaises(TypeError):
+                    encoding.dumps({'a': object()})
+
+    def test_set_backend(self):
+        """Should only allow setting known backends."""
+        with patch.dict(encoding._backend):
+            encoding.set_backend('json')
+            self.assertEqual('json', encoding.get_backend())
+
+            with self.assertRaises(ValueError):
+                encoding.set_backend('fake')
+
+    def test_flask_encoder(self):
+        """Should encode with the flask encoder settings."""
+        source = {'b': 1, 'a': np.arange(2)}
+        output = json.dumps(
+            source,
+            cls=ComplexFlaskJsonEncoder,
+            sort_keys=True,
+            indent=2
+        )
+        self.assertEqual(source['b'], json.loads(output)['b'])
+        self.assertLess(output.index('"a"'), output.index('"b"'))
+        self.assertIn('\n  "a"', output)
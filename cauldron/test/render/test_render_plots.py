@@ -1,16 +1,19 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 from cauldron.test import support
 from cauldron.render import plots
 
-
-def test_pyplot_bs4_error():
-    """Should render import error if bs4 is not installed."""
-    with support.ImportPatcher() as mocked_importer:
-        mocked_importer.error_on = ['bs4']
-        result = plots.pyplot()
-
-    assert 'The beatifulsoup4 library is needed' in result
+SVG_DATA = '''<?xml version="1.0" encoding="utf-8" standalone="no"?>
+<svg xmlns:xlink="http://www.w3.org/1999/xlink" width="864pt" height="576pt"
+  viewBox="0 0 864 576" xmlns="http://www.w3.org/2000/svg" version="1.1">
+ <defs>
+  <style type="text/css">*{stroke-linejoin: round}</style>
+ </defs>
+ <g id="figure_1"><path d="M 0 0 L 1 1" style="fill: #ffffff"/></g>
+</svg>
+'''
 
 
 def test_pyplot_pyplot_error():
@@ -28,6 +31,61 @@ def test_pyplot_no_figure():
     assert result is not None
 
 
+def test_pyplot_deterministic():
+    """Should render identical figures into identical display bodies."""
+    from matplotlib import pyplot
+
+    results = []
+    for _ in range(2):
+        pyplot.plot([1, 2, 3], [2, 4, 1])
+        results.append(plots.pyplot(scale=0.345))
+
+    assert results[0] == results[1]
+
+
+def test_process_svg():
+    """Should scope the styles and size the root svg tag."""
+    result = plots._process_svg(SVG_DATA, 'abc', 0.5)
+
+    assert result.startswith('<svg ')
+    assert 'width="100%" height="100%"' in result
+    assert 'viewBox="0 0 864 576"' in result
+    assert 'class="cd-pylab-svg-abc"' in result
+    assert 'style="max-height:50vh;"' in result
+    assert '.cd-pylab-svg-abc *{stroke-linejoin: round}' in result
+    assert 'style="fill: #ffffff"' in result
+    assert '<?xml' not in result
+
+
+@pytest.mark.parametrize('image_format', ['png', 'svg'])
+def test_pyplot_image(image_format: str):
+    """Should render figures into image files referenced by the display."""
+    from matplotlib import pyplot
+
+    results = []
+    for _ in range(2):
+        pyplot.plot([1, 2, 3], [2, 4, 1])
+        results.append(plots.pyplot_image(
+            directory='plots/S01',
+            image_format=image_format
+        ))
+
+    path, data = list(results[0]['files'].items())[0]
+    assert path.startswith('plots/S01/')
+    assert path.endswith('.{}'.format(image_format))
+    assert 'data-src="{}"'.format(path) in results[0]['body']
+    assert 0 < len(data)
+    assert results[0] == results[1], """
+        Expect identical figures to render to identically named files.
+        """
+
+
+def test_pyplot_image_invalid_format():
+    """Should raise an error for unsupported image formats."""
+    with pytest.raises(ValueError):
+        plots.pyplot_image(image_format='tiff')
+
+
 def test_bokeh_plot_import_error():
     """Should render bokeh import error if library not installed."""
     with support.ImportPatcher() as mocked_importer:
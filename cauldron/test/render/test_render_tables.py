@@ -0,0 +1,52 @@
+import datetime
+import decimal
+import json
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from cauldron.render import tables
+from cauldron.render.encoding import ComplexJsonEncoder
+
+
+class TestRenderTables(unittest.TestCase):
+
+    def test_format_column(self):
+        """Should format each unique value only once."""
+        series = pd.Series([1.5, 2.5, 1.5, np.nan, 2.5])
+        format_function = MagicMock(side_effect='{:.2f}%'.format)
+
+        result = tables.format_column(series, format_function)
+
+        self.assertEqual(
+            ['1.50%', '2.50%', '1.50%', 'nan%', '2.50%'],
+            result.tolist()
+        )
+        self.assertEqual(3, format_function.call_count)
+
+    def test_format_column_unhashable(self):
+        """Should format columns of unhashable values."""
+        series = pd.Series([[1], [2]])
+        result = tables.format_column(series, '{}!'.format)
+        self.assertEqual(['[1]!', '[2]!'], result.tolist())
+
+    def test_dumps_columns(self):
+        """Should serialize the same values as serializing the rows."""
+        df = pd.DataFrame({
+            'a': [1, 2],
+            'b': [1.5, np.nan],
+            'c': [True, False],
+            'd': pd.to_datetime(['2016-09-09', '2016-09-10']),
+            'e': [decimal.Decimal('3.14'), datetime.date(2016, 9, 9)]
+        })
+
+        columns = json.loads(tables.dumps_columns(df))
+        rows = json.loads(
+            json.dumps(df.values.tolist(), cls=ComplexJsonEncoder)
+        )
+
+        self.assertEqual(rows[0], [c[0] for c in columns])
+        self.assertEqual(rows[1][2:], [c[1] for c in columns][2:])
+        self.assertTrue(np.isnan(columns[1][1]))
@@ -0,0 +1,181 @@
+import gc
+import json
+import os
+import weakref
+
+import numpy as np
+
+import cauldron as cd
+from cauldron.runner import checkpoints
+from cauldron.test import support
+from cauldron.test.support import scaffolds
+
+
+class TestCheckpoints(scaffolds.ResultsTest):
+    """Tests for the cauldron.runner.checkpoints module."""
+
+    def _create_project(self, name: str) -> 'cd.session.projects.Project':
+        """Creates a project with three steps that share values."""
+        support.create_project(self, name)
+        self.counters = [
+            support.add_counting_step(self, 'S01-first.py', '\n'.join([
+                'import numpy as np',
+                'cd.shared.values = np.arange(1000)',
+                'cd.display.text("First Step")'
+            ])),
+            support.add_counting_step(self, 'S02-second.py', '\n'.join([
+                'cd.shared.total = int(cd.shared.values.sum())',
+            ])),
+            support.add_counting_step(self, 'S03-third.py', '\n'.join([
+                'cd.shared.result = cd.shared.total + 1',
+            ])),
+        ]
+        return cd.project.get_internal_project()
+
+    def _count(self, index: int) -> int:
+        return support.count_runs(self.counters[index])
+
+    @staticmethod
+    def _get_name(index: int) -> str:
+        """Name of the added step at the index, after the initial step."""
+        project = cd.project.get_internal_project()
+        return project.steps[index + 1].definition.name
+
+    @staticmethod
+    def _load_manifest(project, step) -> dict:
+        with open(checkpoints.get_manifest_path(project, step)) as f:
+            return json.load(f)
+
+    def test_disabled_by_default(self):
+        """Should not be enabled unless the project opts in."""
+        project = self._create_project('jamaica')
+        self.assertFalse(checkpoints.is_enabled(project))
+
+        support.run_command('run')
+        self.assertFalse(os.path.exists(checkpoints.get_directory(project)))
+
+    def test_resume_from(self):
+        """Should restore the checkpoint instead of running prior steps."""
+        project = self._create_project('dominica')
+        response = support.run_command('run --checkpoint')
+        self.assertFalse(response.failed)
+
+        # Simulate a fresh session with an empty shared cache.
+        project.shared.clear()
+        for step in project.steps:
+            step.report.clear()
+            step.mark_dirty(True)
+
+        command = 'run --resume-from {}'.format(self._get_name(2))
+        response = support.run_command(command)
+        self.assertFalse(response.failed)
+        self.assertEqual([1, 1, 2], [self._count(i) for i in range(3)])
+        self.assertEqual(499500, project.shared.total)
+        self.assertEqual(499501, project.shared.result)
+        np.testing.assert_array_equal(np.arange(1000), project.shared.values)
+        self.assertIn('First Step', project.steps[1].dom)
+
+    def test_reuses_unchanged_values(self):
+        """Should only write values accessed by the step to the checkpoint."""
+        project = self._create_project('martinique')
+        project.settings.put(checkpoints=True)
+        support.run_command('run')
+
+        first = self._load_manifest(project, project.steps[1])
+        second = self._load_manifest(project, project.steps[2])
+        third = self._load_manifest(project, project.steps[3])
+
+        self.assertTrue(first['values']['values'].endswith('.npy'))
+        self.assertNotEqual(
+            first['values']['values'],
+            second['values']['values'],
+            'Expect the values read by the second step to be written again.'
+        )
+        self.assertEqual(
+            second['values']['values'],
+            third['values']['values']
+        )
+
+        values_directory = os.path.join(
+            checkpoints.get_directory(project),
+            'values'
+        )
+        self.assertEqual(5, len(os.listdir(values_directory)), """
+            Expect one file for the first checkpoint, two for the values
+            accessed by the second step and two for those of the third.
+            """)
+
+    def test_rerun_removes_later(self):
+        """Should remove later checkpoints when an earlier step is re-run."""
+        project = self._create_project('montserrat')
+        support.run_command('run --checkpoint')
+        support.run_command('run {} --checkpoint'.format(self._get_name(0)))
+
+        paths = [
+            checkpoints.get_manifest_path(project, step)
+            for step in project.steps[1:]
+        ]
+        self.assertEqual(
+            [True, False, False],
+            [os.path.exists(path) for path in paths]
+        )
+
+    def test_missing_checkpoint(self):
+        """Should fail to resume when no checkpoint exists."""
+        self._create_project('anguilla')
+        command = 'run --resume-from {}'.format(self._get_name(2))
+        response = support.run_command(command)
+        self.assertTrue(response.failed)
+        self.assertEqual('NO_CHECKPOINT', response.errors[0].code)
+        self.assertEqual(0, self._count(2))
+
+    def test_stale_checkpoint(self):
+        """Should not restore checkpoints of modified projects by default."""
+        project = self._create_project('nevis')
+        support.run_command('run --checkpoint')
+
+        with open(project.steps[1].source_path, 'a') as f:
+            f.write('\ncd.shared.changed = True\n')
+
+        command = 'run --resume-from {}'.format(self._get_name(1))
+        response = support.run_command(command)
+        self.assertTrue(response.failed)
+        self.assertEqual('STALE_CHECKPOINT', response.errors[0].code)
+
+        response = support.run_command('{} -f'.format(command))
+        self.assertFalse(response.failed)
+        self.assertEqual([1, 2, 2], [self._count(i) for i in range(3)])
+
+    def test_skipped_steps(self):
+        """Should not save checkpoints for steps that were not executed."""
+        project = self._create_project('barbuda')
+        project.steps[3].is_muted = True
+
+        support.run_command('run --checkpoint')
+        paths = [
+            checkpoints.get_manifest_path(project, step)
+            for step in project.steps[1:]
+        ]
+        self.assertEqual(
+            [True, True, False],
+            [os.path.exists(path) for path in paths]
+        )
+
+        command = 'run {} --limit 2 --checkpoint'.format(self._get_name(1))
+        support.run_command(command)
+        self.assertEqual(
+            [True, True, False],
+            [os.path.exists(path) for path in paths]
+        )
+
+    def test_replaced_values_released(self):
+        """Should not keep replaced shared values alive."""
+        project = self._create_project('saba')
+        support.run_command('run --checkpoint')
+
+        reference = weakref.ref(project.shared.values)
+        project.shared.values = None
+        gc.collect()
+        self.assertIsNone(reference(), """
+            Expect the checkpoint state not to reference the values.
+            """)
@@ -41,6 +41,27 @@ class TestPrinting(scaffolds.ResultsTest):
         self.assertEqual(dom.count('BAT'), 1, 'third check failed')
         self.assertLess(dom.count('SAT'), 2, 'fourth check failed')
 
+    def test_pending_output(self):
+        """Should wrap unflushed output of running steps in the dom."""
+        support.create_project(self, 'edina')
+        support.add_step(self, contents='\n'.join([
+            'import time',
+            'print("PENDING")',
+            'time.sleep(1)'
+        ]))
+        response = commander.execute('run', '-f')
+        response.thread.join(0.5)
+
+        step = cauldron.project.get_internal_project().steps[1]
+        dom = step.dumps()
+        self.assertIn('cd-ProjectStep__pending', dom)
+        self.assertIn('data-body-id="{}"'.format(step.report.body_id), dom)
+
+        response.thread.join()
+        dom = step.dumps()
+        self.assertIn('PENDING', dom)
+        self.assertNotIn('cd-ProjectStep__pending', dom)
+
     def test_print_solo(self):
         """Should properly print in a step that does nothing but print."""
         response = support.create_project(self, 'minneapolis')
@@ -0,0 +1,65 @@
+import json
+import os
+import pstats
+import tracemalloc
+
+import cauldron as cd
+from cauldron.runner import profiling
+from cauldron.test import support
+from cauldron.test.support import scaffolds
+
+
+class TestProfiling(scaffolds.ResultsTest):
+    """Tests for the cauldron.runner.profiling module."""
+
+    def _create_project(self, name: str) -> 'cd.session.projects.Project':
+        """Creates a project with a step that allocates memory."""
+        support.create_project(self, name)
+        support.add_step(self, 'S01-allocate.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.values = [list(range(100)) for _ in range(1000)]',
+        ]))
+        return cd.project.get_internal_project()
+
+    def test_disabled_by_default(self):
+        """Should not profile steps unless the project opts in."""
+        project = self._create_project('aruba')
+        self.assertFalse(profiling.is_enabled(project))
+
+        response = support.run_command('run')
+        self.assertFalse(response.failed)
+
+        step = project.steps[1]
+        self.assertIsNone(step.status()['profile'])
+        self.assertFalse(os.path.exists(profiling.get_profile_path(step)))
+
+    def test_profile_step(self):
+        """Should record the resource usage of each step execution."""
+        project = self._create_project('bonaire')
+        project.settings.put(profiling=True, profiling_cprofile=True)
+
+        response = support.run_command('run')
+        self.assertFalse(response.failed)
+
+        step = project.steps[1]
+        profile = step.status()['profile']
+        self.assertIsNotNone(profile)
+        self.assertGreater(profile['wall_time'], 0)
+        self.assertGreaterEqual(profile['cpu_time'], 0)
+        self.assertGreater(profile['traced_peak'], 0)
+        self.assertFalse(
+            tracemalloc.is_tracing(),
+            'Expect memory tracing to stop after the step has run.'
+        )
+
+        allocators = profile['top_allocators']
+        self.assertEqual(step.source_path, allocators[0]['filename'], """
+            Expect the list allocated by the step to be the largest
+            allocation remaining after the step has run.
+            """)
+
+        with open(profiling.get_profile_path(step)) as f:
+            self.assertEqual(profile, json.load(f))
+
+        stats = pstats.Stats(profile['stats_path'])
+        self.assertGreater(stats.total_calls, 0)
@@ -1,7 +1,11 @@
+import numpy as np
+
 import cauldron as cd
 from cauldron.test import support
 from cauldron.test.support import scaffolds
 
+MEGABYTE = 1024 * 1024
+
 
 class TestRunnerMarkdownFile(scaffolds.ResultsTest):
     """Test suite for the runner.markdown_file module"""
@@ -28,3 +32,22 @@ class TestRunnerMarkdownFile(scaffolds.ResultsTest):
         )
         response = support.run_command('run -f')
         self.assertTrue(response.failed)
+
+    def test_shared_variables(self):
+        """Should template shared variables without loading unused ones."""
+
+        support.create_project(self, 'ames')
+        support.add_step(self, 'test.md', contents='Value is {{ value }}')
+        project = cd.project.get_internal_project()
+        project.shared.set_memory_limit(3 * MEGABYTE)
+        project.shared.put(unused=np.ones(MEGABYTE // 4), value=42)
+        project.shared.put(filler=np.ones(MEGABYTE // 4))
+
+        response = support.run_command('run -f')
+
+        self.assertFalse(response.failed)
+        self.assertIn('Value is 42', project.steps[-1].dom)
+        self.assertEqual(['unused'], project.shared.get_spilled_keys(), """
+            Expect the shared value that is not used by the template to
+            remain spilled to disk.
+            """)
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -13,3 +14,73 @@ def test_get_file_contents_failed(functools: MagicMock):
     functools.partial.return_value = func
     result = python_file.get_file_contents('FAKE')
     assert result.startswith('raise IOError(')
+
+
+def _write_step(directory: str, contents: str) -> str:
+    path = os.path.join(directory, 'S01-step.py')
+    with open(path, 'w') as f:
+        f.write(contents)
+    return path
+
+
+@patch('cauldron.runner.python_file.sys.dont_write_bytecode', False)
+def test_compile_step_file_cached(tmpdir):
+    """Should only compile unchanged step files once."""
+    source_directory = tmpdir.mkdir('source')
+    project = MagicMock(results_path=str(tmpdir.mkdir('results')))
+    path = _write_step(str(source_directory), 'value = 42\n')
+    python_file._code_cache.clear()
+
+    code = python_file.compile_step_file(path, project)
+    assert code is python_file.compile_step_file(path, project)
+    cache_path = python_file.get_code_cache_path(project, path)
+    assert os.path.exists(cache_path)
+    assert cache_path.startswith(project.results_path)
+    assert ['S01-step.py'] == os.listdir(str(source_directory)), """
+        Expect nothing to be written into the source directory.
+        """
+
+    assert 42 in code.co_consts
+
+    _write_step(str(source_directory), 'value = 43\n')
+    changed = python_file.compile_step_file(path, project)
+    assert 43 in changed.co_consts, 'Expect changed steps to be recompiled.'
+
+
+@patch('cauldron.runner.python_file.sys.dont_write_bytecode', False)
+@patch('cauldron.runner.python_file.InspectLoader.source_to_code')
+def test_compile_step_file_disk(source_to_code: MagicMock, tmpdir):
+    """Should load compiled code from disk when not cached in memory."""
+    source_to_code.side_effect = lambda source, path: compile(
+        source,
+        path,
+        'exec'
+    )
+    project = MagicMock(results_path=str(tmpdir.mkdir('results')))
+    path = _write_step(str(tmpdir), 'value = 42\n')
+
+    python_file._code_cache.clear()
+    python_file.compile_step_file(path, project)
+    python_file._code_cache.clear()
+    code = python_file.compile_step_file(path, project)
+
+    assert 1 == source_to_code.call_count
+    assert 42 in code.co_consts
+
+
+@patch('cauldron.runner.python_file.sys.dont_write_bytecode', False)
+@patch('cauldron.runner.python_file.writer.write_file_atomically')
+def test_compile_step_file_write_failed(
+        write_file_atomically: MagicMock,
+        tmpdir
+):
+    """Should compile in memory when the disk cache cannot be written."""
+    write_file_atomically.side_effect = IOError
+    project = MagicMock(results_path=str(tmpdir.mkdir('results')))
+    path = _write_step(str(tmpdir), 'value = 42\n')
+    python_file._code_cache.clear()
+
+    code = python_file.compile_step_file(path, project)
+
+    assert 42 in code.co_consts
+    assert code is python_file.compile_step_file(path, project)
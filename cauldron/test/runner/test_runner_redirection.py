@@ -1,3 +1,4 @@
+import os
 import sys
 
 import cauldron as cd
@@ -51,3 +52,28 @@ class TestRunnerRedirection(scaffolds.ResultsTest):
         self.assertNotIsInstance(sys.stderr, redirection.RedirectBuffer)
         self.assertEqual(sys.stdout, sys.__stdout__)
         self.assertEqual(sys.stderr, sys.__stderr__)
+
+    def test_bounded_output(self):
+        """Should bound displayed output and keep the full output in a file."""
+        support.create_project(self, 'lupin')
+        project = cd.project.get_internal_project()
+        project.settings.put(output_head_size='1KB', output_tail_size='1KB')
+        support.add_step(self, contents='\n'.join([
+            'for index in range(10000):',
+            '    print("Line {:05d}".format(index))'
+        ]))
+        step = project.steps[-1]
+
+        response = support.run_command('run')
+        self.assertFalse(response.failed)
+        self.assertIn('Line 00000', step.dom)
+        self.assertIn('Line 09999', step.dom)
+        self.assertNotIn('Line 05000', step.dom)
+
+        path = os.path.join(
+            project.results_path,
+            'logs',
+            '{}.stdout.log'.format(step.filename)
+        )
+        with open(path) as f:
+            self.assertEqual(10000, len(f.read().splitlines()))
@@ -0,0 +1,237 @@
+import os
+import textwrap
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import cauldron as cd
+from cauldron.runner import checkpoints
+from cauldron.runner import scheduling
+from cauldron.test import support
+from cauldron.test.support import scaffolds
+
+
+def test_analyze_attributes():
+    """Should find attribute reads and writes on the shared cache."""
+    result = scheduling.analyze_source(textwrap.dedent(
+        """
+        import cauldron as cd
+        df = cd.shared.df
+        cd.shared.total = df.sum()
+        cd.shared.count += 1
+        """
+    ))
+    assert {'df', 'count'} == result.reads
+    assert {'total', 'count'} == result.writes
+    assert not result.opaque
+
+
+def test_analyze_methods():
+    """Should find reads and writes within shared cache method calls."""
+    result = scheduling.analyze_source(textwrap.dedent(
+        """
+        from cauldron import shared
+        a, b = shared.grab('a', 'b')
+        c = shared.fetch('c', 12)
+        shared.put('d', 1, e=2)
+        shared['f'] = shared['g']
+        """
+    ))
+    assert {'a', 'b', 'c', 'g'} == result.reads
+    assert {'d', 'e', 'f'} == result.writes
+    assert not result.opaque
+
+
+def test_analyze_mutations():
+    """Should treat assignments into shared objects as writes."""
+    result = scheduling.analyze_source(textwrap.dedent(
+        """
+        import cauldron
+        cauldron.shared.df['column'] = 1
+        cauldron.shared['frame'].loc[0, 'a'] = 2
+        """
+    ))
+    assert {'df', 'frame'} == result.writes
+    assert not result.opaque
+
+
+def test_analyze_opaque():
+    """Should mark unresolvable shared cache usage as opaque."""
+    sources = [
+        'import cauldron as cd\ncd.shared.fetch(name)',
+        'import cauldron as cd\ncd.shared.put(**values)',
+        'import cauldron as cd\nprint(cd.shared)',
+        'import cauldron as cd\ncd.shared.clear()',
+        'import cauldron as cd\ncd.shared[key] = 1',
+        'not valid python ~~',
+    ]
+    for source in sources:
+        assert scheduling.analyze_source(source).opaque, source
+
+
+def _mock_step(name: str, contents: str) -> MagicMock:
+    step = MagicMock()
+    step.source_path = '{}.py'.format(name)
+    step.contents = textwrap.dedent(contents)
+    return step
+
+
+@patch('cauldron.runner.python_file.get_file_contents')
+def test_create_dependencies(get_file_contents: MagicMock):
+    """Should only depend on earlier steps with conflicting access."""
+    load = _mock_step('load', 'import cauldron as cd\ncd.shared.df = 1')
+    plot = _mock_step('plot', 'import cauldron as cd\nprint(cd.shared.df)')
+    table = _mock_step('table', 'import cauldron as cd\nx = cd.shared.df')
+    update = _mock_step('update', 'import cauldron as cd\ncd.shared.df = 2')
+    steps = [load, plot, table, update]
+
+    by_path = {s.source_path: s.contents for s in steps}
+    get_file_contents.side_effect = lambda path: by_path[path]
+
+    result = scheduling.create_dependencies(steps)
+    assert set() == result[load]
+    assert {load} == result[plot]
+    assert {load, plot} == result[table], """
+        Expect steps reading the same variable to depend on each other
+        given that either of them can modify the value in place.
+        """
+    assert {load, plot, table} == result[update]
+
+
+@patch('cauldron.runner.python_file.get_file_contents')
+def test_create_dependencies_opaque(get_file_contents: MagicMock):
+    """Should make opaque steps depend upon every earlier step."""
+    first = _mock_step('first', 'import cauldron as cd\ncd.shared.a = 1')
+    second = _mock_step('second', 'import cauldron as cd\ncd.shared.b = 1')
+    third = _mock_step('third', 'import cauldron as cd\nprint(cd.shared)')
+    steps = [first, second, third]
+
+    by_path = {s.source_path: s.contents for s in steps}
+    get_file_contents.side_effect = lambda path: by_path[path]
+
+    result = scheduling.create_dependencies(steps)
+    assert set() == result[second]
+    assert {first, second} == result[third]
+
+
+@patch('cauldron.runner.python_file.get_file_contents')
+def test_create_dependencies_markdown(get_file_contents: MagicMock):
+    """Should make markdown steps read every shared variable."""
+    first = _mock_step('first', 'import cauldron as cd\ncd.shared.a = 1')
+    notes = _mock_step('notes', '')
+    notes.source_path = 'notes.md'
+    reader = _mock_step('reader', 'import cauldron as cd\nx = cd.shared.a')
+    writer = _mock_step('writer', 'import cauldron as cd\ncd.shared.b = 1')
+    steps = [first, notes, reader, writer]
+
+    by_path = {s.source_path: s.contents for s in steps}
+    get_file_contents.side_effect = lambda path: by_path[path]
+
+    result = scheduling.create_dependencies(steps)
+    assert {first} == result[notes]
+    assert {first, notes} == result[reader]
+    assert {notes} == result[writer]
+
+
+class TestParallelRun(scaffolds.ResultsTest):
+    """Tests running project steps in parallel processes."""
+
+    def test_run_parallel(self):
+        """Should run independent steps and merge their shared values."""
+        if not scheduling.is_available():  # pragma: no cover
+            return
+
+        support.create_project(self, 'pollux')
+        support.add_step(self, 'S02-a.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.a = 1',
+            'cd.display.text("Step A")'
+        ]))
+        support.add_step(self, 'S03-b.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.b = 2',
+        ]))
+        support.add_step(self, 'S04-c.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.c = cd.shared.a + cd.shared.b',
+        ]))
+
+        response = support.run_command('run -j 3')
+        self.assertFalse(response.failed)
+
+        project = cd.project.get_internal_project()
+        self.assertEqual(3, project.shared.c)
+        self.assertIn('Step A', project.get_step('S02-a.py').dom)
+        self.assertFalse(any(s.is_dirty() for s in project.steps))
+
+    def test_run_parallel_in_place(self):
+        """Should return values modified in place through aliases."""
+        if not scheduling.is_available():  # pragma: no cover
+            return
+
+        support.create_project(self, 'vega')
+        support.add_step(self, 'S02-a.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.items = {"a": 1}',
+        ]))
+        support.add_step(self, 'S03-b.py', '\n'.join([
+            'import cauldron as cd',
+            'items = cd.shared.items',
+            'items["a"] = 999',
+        ]))
+        support.add_step(self, 'S04-c.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.value = cd.shared.items["a"]',
+        ]))
+
+        response = support.run_command('run -j 3')
+        self.assertFalse(response.failed)
+
+        project = cd.project.get_internal_project()
+        self.assertEqual({'a': 999}, project.shared.items)
+        self.assertEqual(999, project.shared.value)
+
+    def test_run_parallel_checkpoint(self):
+        """Should save checkpoints of steps run in parallel."""
+        if not scheduling.is_available():  # pragma: no cover
+            return
+
+        support.create_project(self, 'deneb')
+        support.add_step(self, 'S02-a.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.a = 1',
+        ]))
+        support.add_step(self, 'S03-b.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.b = 2',
+        ]))
+
+        response = support.run_command('run -j 2 --checkpoint')
+        self.assertFalse(response.failed)
+
+        project = cd.project.get_internal_project()
+        self.assertTrue(all(
+            os.path.exists(checkpoints.get_manifest_path(project, step))
+            for step in project.steps
+        ))
+
+    def test_run_parallel_failure(self):
+        """Should stop scheduling steps after a failure."""
+        if not scheduling.is_available():  # pragma: no cover
+            return
+
+        support.create_project(self, 'castor')
+        support.add_step(self, 'S02-a.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.a = 1 / 0',
+        ]))
+        support.add_step(self, 'S03-b.py', '\n'.join([
+            'import cauldron as cd',
+            'cd.shared.b = cd.shared.a',
+        ]))
+
+        response = support.run_command('run -j 2')
+        self.assertTrue(response.failed)
+
+        project = cd.project.get_internal_project()
+        self.assertTrue(project.get_step('S02-a.py').error)
+        self.assertIsNone(project.shared.b)
@@ -144,7 +144,7 @@ def test_execute_step():
 
     result = source._execute_step(project, step)
     assert not result['success']
-    project.steps[-1].mark_dirty.assert_called_once_with(True)
+    assert not project.steps[-1].mark_dirty.called
 
 
 @patch('cauldron.runner.source.time.sleep')
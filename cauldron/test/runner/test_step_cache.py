@@ -0,0 +1,138 @@
+import cauldron as cd
+from cauldron.runner import step_cache
+from cauldron.session.caching import SharedCache
+from cauldron.test import support
+from cauldron.test.support import scaffolds
+
+
+class TestStepCache(scaffolds.ResultsTest):
+    """Tests for the cauldron.runner.step_cache module."""
+
+    def _create_project(self, name: str) -> 'cd.session.projects.Project':
+        support.create_project(self, name)
+        project = cd.project.get_internal_project()
+        project.settings.put(step_cache=True)
+        return project
+
+    def test_disabled_by_default(self):
+        """Should not be enabled unless the project opts in."""
+        support.create_project(self, 'grenada')
+        project = cd.project.get_internal_project()
+        self.assertFalse(step_cache.is_enabled(project))
+
+    def test_restores_unchanged_step(self):
+        """Should restore shared outputs and body instead of re-running."""
+        project = self._create_project('barbados')
+        counter_path = support.add_counting_step(
+            self,
+            'S01-cached.py',
+            '\n'.join([
+                'cd.shared.value = (cd.shared.seed or 0) + 41',
+                'cd.display.text("Hello Cache")'
+            ])
+        )
+        step = project.steps[-1]
+
+        response = support.run_command('run -f')
+        self.assertFalse(response.failed)
+        self.assertEqual(1, support.count_runs(counter_path))
+
+        # Simulate a fresh session with an empty shared cache.
+        project.shared.clear()
+        step.mark_dirty(True)
+
+        response = support.run_command('run -f')
+        self.assertFalse(response.failed)
+        self.assertEqual(1, support.count_runs(counter_path), """
+            Expect the step not to have executed again.
+            """)
+        self.assertEqual(41, project.shared.value)
+        self.assertIn('Hello Cache', step.dom)
+
+    def test_changed_read_invalidates(self):
+        """Should re-run the step when a shared value it reads changes."""
+        project = self._create_project('trinidad')
+        counter_path = support.add_counting_step(
+            self,
+            'S01-reader.py',
+            'cd.shared.value = (cd.shared.seed or 0) + 1'
+        )
+
+        support.run_command('run -f')
+        self.assertEqual(1, support.count_runs(counter_path))
+
+        project.shared.put(seed=10)
+        support.run_command('run -f')
+        self.assertEqual(2, support.count_runs(counter_path))
+        self.assertEqual(11, project.shared.value)
+
+    def test_read_modified_in_place(self):
+        """Should digest read values before the step modifies them."""
+        project = self._create_project('bequia')
+        counter_path = support.add_counting_step(
+            self,
+            'S01-modifier.py',
+            'cd.shared.items.append(3)'
+        )
+        step = project.steps[-1]
+
+        project.shared.put(items=[1, 2])
+        support.run_command('run -f')
+        self.assertEqual([1, 2, 3], project.shared.items)
+
+        # Simulate a fresh session with the same initial shared values.
+        project.shared.clear()
+        project.shared.put(items=[1, 2])
+        step.mark_dirty(True)
+
+        support.run_command('run -f')
+        self.assertEqual(1, support.count_runs(counter_path), """
+            Expect the cache entry to match the value the step read
+            instead of its value after it was modified.
+            """)
+
+    def test_changed_source_invalidates(self):
+        """Should re-run the step when its source changes."""
+        project = self._create_project('tobago')
+        counter_path = support.add_counting_step(self, 'S01-source.py', '')
+
+        support.run_command('run -f')
+        step = project.steps[-1]
+        with open(step.source_path, 'a') as f:
+            f.write('\ncd.shared.changed = True\n')
+
+        support.run_command('run -f')
+        self.assertEqual(2, support.count_runs(counter_path))
+        self.assertTrue(project.shared.changed)
+
+    def test_failed_step_not_cached(self):
+        """Should not store cache entries for failed steps."""
+        project = self._create_project('antigua')
+        support.add_step(self, 'S01-broken.py', 'raise ValueError("Nope")')
+        step = project.steps[-1]
+
+        support.run_command('run -f')
+        key = step_cache.get_key(project, step)
+        self.assertIsNone(step_cache.load(project, key))
+
+
+def test_shared_cache_tracking():
+    """Should record reads and writes while tracking is active."""
+    cache = SharedCache().put(a=1, b=2)
+    cache.fetch('a')
+
+    cache.start_tracking()
+    cache.fetch('a')
+    assert cache['b'] == 2
+    assert cache.missing is None
+    cache.c = 3
+    cache.put(d=4)
+    access = cache.stop_tracking()
+
+    assert {'a', 'b', 'missing'} == access.reads
+    assert {'c', 'd'} == access.writes
+
+    cache.fetch('a')
+    assert {'a', 'b', 'missing'} == access.reads, """
+        Expect no more tracking after tracking has stopped.
+        """
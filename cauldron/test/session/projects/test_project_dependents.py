@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+from cauldron.session.caching import SHARED_ACCESS
+from cauldron.session.projects import Project
+
+
+def _create_step(reads, writes) -> MagicMock:
+    """Creates a mock step that previously accessed the shared variables."""
+    step = MagicMock()
+    step.shared_access = (
+        SHARED_ACCESS(set(reads), set(writes))
+        if reads is not None else
+        None
+    )
+    step.definition.name = 'S{}.py'.format(id(step))
+    return step
+
+
+def _create_project(steps: list) -> Project:
+    """Creates a project containing the specified steps."""
+    project = Project.__new__(Project)
+    project.steps = steps
+    return project
+
+
+def test_mark_dependents_dirty():
+    """Should only mark steps that consumed changed variables dirty."""
+    steps = [
+        _create_step([], ['a', 'b']),
+        _create_step(['a'], ['c']),
+        _create_step(['b'], []),
+        _create_step(['d'], ['e']),
+    ]
+    project = _create_project(steps)
+
+    result = project.mark_dependents_dirty(steps[0], ['a'])
+
+    assert [steps[1]] == result
+    steps[1].mark_dirty.assert_called_once_with(True)
+    assert not steps[2].mark_dirty.called
+    assert not steps[3].mark_dirty.called
+
+
+def test_mark_dependents_dirty_transitive():
+    """Should mark steps consuming the outputs of invalidated steps dirty."""
+    steps = [
+        _create_step([], ['a']),
+        _create_step(['a'], ['b']),
+        _create_step(['b'], []),
+        _create_step(None, None),
+        _create_step([], ['a']),
+    ]
+    project = _create_project(steps)
+
+    result = project.mark_dependents_dirty(steps[0], ['a'])
+
+    assert [steps[1], steps[2], steps[4]] == result, """
+        Expect the step reading the output of the invalidated step and the
+        step overwriting the changed value to be marked dirty, but not the
+        step that has never been run.
+        """
+    assert not steps[3].mark_dirty.called
+
+
+def test_mark_dependents_dirty_reads_all():
+    """Should mark steps that read every variable dirty on any change."""
+    steps = [
+        _create_step([], ['a']),
+        _create_step([], []),
+        _create_step(['b'], []),
+    ]
+    steps[1].shared_access = SHARED_ACCESS(set(), set(), True)
+    project = _create_project(steps)
+
+    result = project.mark_dependents_dirty(steps[0], ['a'])
+
+    assert [steps[1]] == result
+    assert not steps[2].mark_dirty.called
+
+
+def test_remove_step():
+    """Should mark steps that consumed the removed step outputs dirty."""
+    steps = [
+        _create_step([], ['a']),
+        _create_step(['a'], []),
+        _create_step(['b'], []),
+    ]
+    project = _create_project(list(steps))
+
+    removed = project.remove_step(steps[0].definition.name)
+
+    assert removed == steps[0]
+    assert 2 == len(project.steps)
+    steps[1].mark_dirty.assert_called_once_with(True)
+    assert not steps[2].mark_dirty.called
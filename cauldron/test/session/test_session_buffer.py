@@ -1,3 +1,4 @@
+import io
 import sys
 
 from cauldron.session import buffering
@@ -19,3 +20,72 @@ class TestSessionBuffer(scaffolds.ResultsTest):
 
         contents = b.flush_all().strip()
         self.assertEqual(contents, value)
+
+    def test_read_all(self):
+        """Should only join newly written chunks when read again."""
+        b = buffering.RedirectBuffer(io.StringIO())
+        b.active = True
+        b.write('first')
+        b.writelines(['\n', 'café ☃\n'])
+        self.assertEqual('first\ncafé ☃\n', b.read_all())
+        self.assertEqual(1, len(b._chunks))
+
+        print('second', file=b)
+        self.assertEqual('first\ncafé ☃\nsecond\n', b.read_all())
+        self.assertEqual('first\ncafé ☃\nsecond\n', b.flush_all())
+        self.assertEqual('', b.read_all())
+        self.assertEqual(
+            'first\ncafé ☃\nsecond\n',
+            b.redirection_source.getvalue()
+        )
+
+    def test_delegation(self):
+        """Should delegate other attributes to the redirection source."""
+        source = io.TextIOWrapper(io.BytesIO(), encoding='latin-1')
+        b = buffering.RedirectBuffer(source)
+        self.assertEqual('latin-1', b.encoding)
+        self.assertIs(source.buffer, b.buffer)
+        self.assertFalse(b.isatty())
+        self.assertFalse(b.closed)
+
+        b.close()
+        self.assertFalse(source.closed, 'Expect the source to stay open.')
+
+    def test_write_invalid(self):
+        """Should not accept writing values that are not strings."""
+        b = buffering.RedirectBuffer(io.StringIO())
+        b.active = True
+        with self.assertRaises(TypeError):
+            b.write(b'bytes')
+
+    def test_bounded_output(self):
+        """Should only keep the head and tail of bounded output."""
+        spill_path = self.get_temp_path('buffer', 'output.log')
+        output = buffering.BoundedOutput(
+            head_size=10,
+            tail_size=10,
+            spill_path=spill_path
+        )
+        for index in range(1000):
+            output.append('{:04d}\n'.format(index))
+
+        contents = output.read()
+        self.assertTrue(contents.startswith('0000\n0001\n\n[... 4980'))
+        self.assertTrue(contents.endswith('...]\n0998\n0999\n'))
+        self.assertIn(spill_path, contents)
+        self.assertLess(len(output._tail), 21)
+
+        output.close()
+        with open(spill_path) as f:
+            self.assertEqual(5000, len(f.read()))
+
+    def test_bounded_buffer(self):
+        """Should bound the output captured by the buffer between reads."""
+        b = buffering.RedirectBuffer(io.StringIO(), head_size=0, tail_size=5)
+        b.active = True
+        for index in range(buffering.CONSUME_SIZE + 4):
+            b.write('{}\n'.format(index % 10))
+
+        self.assertLess(len(b._chunks), buffering.CONSUME_SIZE // 2)
+        self.assertTrue(b.flush_all().endswith('omitted ...]\n\n8\n9\n'))
+        b.close()
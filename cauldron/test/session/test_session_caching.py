@@ -0,0 +1,188 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from cauldron.session import caching
+from cauldron.session.caching import SharedCache
+
+MEGABYTE = 1024 * 1024
+
+
+class TestSessionCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='cd-test-shared-')
+
+    def create_cache(self, limit: int = 3 * MEGABYTE) -> SharedCache:
+        """Creates a memory limited cache that spills to the test directory."""
+        return SharedCache().set_memory_limit(limit, self.directory)
+
+    def test_parse_size(self):
+        """Should convert memory sizes into bytes."""
+        self.assertIsNone(caching.parse_size(None))
+        self.assertEqual(12, caching.parse_size(12))
+        self.assertEqual(512 * MEGABYTE, caching.parse_size('512MB'))
+        self.assertEqual(16 * 1024 * MEGABYTE, caching.parse_size('16gb'))
+        self.assertEqual(1536, caching.parse_size('1.5 KiB'))
+
+        with self.assertRaises(ValueError):
+            caching.parse_size('lots')
+
+    def test_get_size(self):
+        """Should estimate sizes of arrays, frames and containers."""
+        array = np.zeros(1000000)
+        self.assertEqual(8000000, caching.get_size(array))
+
+        df = pd.DataFrame({'a': np.zeros(5000), 'b': ['x' * 100] * 5000})
+        self.assertGreater(caching.get_size(df), 5000 * (8 + 100))
+
+        self.assertGreater(caching.get_size(['x' * 1000] * 2000), 2000000)
+        self.assertGreater(caching.get_size({'a': 'x' * 1000}), 1000)
+
+    def test_spill_least_recent(self):
+        """Should spill least recently used values past the memory limit."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 8), b=np.ones(MEGABYTE // 8))
+        cache.fetch('a')
+        cache.put(c=np.ones(MEGABYTE // 4))
+
+        self.assertEqual(['b'], cache.get_spilled_keys())
+        self.assertEqual(1, len(os.listdir(self.directory)))
+
+    def test_reload_spilled(self):
+        """Should reload spilled values when they are accessed."""
+        cache = self.create_cache()
+        df = pd.DataFrame({'a': np.arange(MEGABYTE // 4)})
+        cache.put(df=df, other=np.zeros(MEGABYTE // 4))
+
+        self.assertEqual(['df'], cache.get_spilled_keys())
+        pd.testing.assert_frame_equal(df, cache.df)
+        self.assertEqual(['other'], cache.get_spilled_keys(), """
+            Expect the other value to be spilled when the data frame is
+            reloaded into memory.
+            """)
+        np.testing.assert_array_equal(np.zeros(MEGABYTE // 4), cache['other'])
+
+    def test_sizes_estimated_once(self):
+        """Should only estimate the size of each value when it is stored."""
+        cache = self.create_cache()
+        with patch('cauldron.session.caching.get_size') as get_size:
+            get_size.return_value = MEGABYTE
+            cache.put(a=1, b=2, c=3, d=4)
+            cache.fetch('a')
+            cache.fetch('b')
+
+        self.assertEqual(4, get_size.call_count, """
+            Expect the sizes of spilled values to be remembered when they
+            are loaded back into memory.
+            """)
+        self.assertEqual(3 * MEGABYTE, cache._memory_total)
+        self.assertEqual(['c'], cache.get_spilled_keys())
+
+    def test_small_values(self):
+        """Should not spill small values."""
+        cache = self.create_cache(limit=10)
+        cache.put(a=1, b='hello', c=[1, 2, 3])
+        self.assertEqual([], cache.get_spilled_keys())
+
+    def test_unpicklable_values(self):
+        """Should keep values that cannot be spilled in memory."""
+        cache = self.create_cache(limit=MEGABYTE)
+        value = [lambda: 1] + list(range(MEGABYTE // 8))
+        cache.put(f=value, other=np.zeros(MEGABYTE // 4))
+        self.assertEqual([], cache.get_spilled_keys())
+        self.assertIs(value, cache.f)
+
+    def test_replace_spilled(self):
+        """Should remove spilled values when they are replaced or deleted."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 4), b=np.ones(MEGABYTE // 4))
+        self.assertEqual(['a'], cache.get_spilled_keys())
+
+        cache.put(a=12)
+        self.assertEqual(12, cache.a)
+        self.assertEqual([], cache.get_spilled_keys())
+        self.assertEqual([], os.listdir(self.directory))
+
+        cache.put(c=np.ones(MEGABYTE // 4))
+        cache.put(b=None)
+        self.assertIsNone(cache.b)
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_fetch_all(self):
+        """Should include spilled values when fetching the dictionary."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 4), b=np.ones(MEGABYTE // 4))
+
+        data = cache.fetch(None)
+        self.assertEqual({'a', 'b'}, set(data.keys()))
+        self.assertEqual(['a'], cache.get_spilled_keys(), """
+            Expect the spilled value to remain on disk so that the cache
+            stays within its memory limit.
+            """)
+        self.assertEqual({'a', 'b'}, set(cache.get_keys()))
+
+    def test_apply_changes(self):
+        """Should apply writes and deletes within the memory limit."""
+        cache = self.create_cache()
+        cache.put(a=1, b=2)
+
+        caching.apply_changes(
+            cache,
+            writes={'c': np.ones(MEGABYTE // 4), 'd': np.ones(MEGABYTE // 4)},
+            deletes=['a', 'missing']
+        )
+
+        self.assertEqual({'b', 'c', 'd'}, set(cache.get_keys()))
+        self.assertEqual(['c'], cache.get_spilled_keys())
+
+    def test_remove_limit(self):
+        """Should reload all spilled values when the limit is removed."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 4), b=np.ones(MEGABYTE // 4))
+        cache.set_memory_limit(None)
+
+        self.assertIsNone(cache.get_memory_limit())
+        self.assertEqual([], cache.get_spilled_keys())
+        self.assertEqual(MEGABYTE // 4, len(cache.a))
+
+    def test_identities(self):
+        """Should keep identities of spilled values until replaced."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 4), b=np.ones(MEGABYTE // 4))
+        initial = cache.get_identities()
+
+        cache.fetch('a')
+        cache.fetch('b')
+        self.assertEqual(
+            set(),
+            caching.get_changed_keys(initial, cache.get_identities()),
+            'Expect reloaded values to keep their identities.'
+        )
+
+        cache.put(b=np.zeros(MEGABYTE // 4))
+        self.assertEqual(
+            {'b'},
+            caching.get_changed_keys(initial, cache.get_identities())
+        )
+
+    def test_tracking(self):
+        """Should track reads of spilled values."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 4), b=np.ones(MEGABYTE // 4))
+        cache.start_tracking()
+        cache.grab('a', 'b')
+        self.assertEqual({'a', 'b'}, cache.stop_tracking().reads)
+
+    def test_clear(self):
+        """Should remove spilled values when cleared."""
+        cache = self.create_cache()
+        cache.put(a=np.ones(MEGABYTE // 4), b=np.ones(MEGABYTE // 4))
+        cache.clear()
+        self.assertEqual([], cache.get_spilled_keys())
+        self.assertEqual([], os.listdir(self.directory))
+        self.assertIsNone(cache.a)
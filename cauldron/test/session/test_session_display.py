@@ -37,6 +37,89 @@ class TestSessionDisplay(scaffolds.ResultsTest):
         r = support.run_command('run')
         self.assertFalse(r.failed, 'should not have failed')
 
+    def test_streaming_table(self):
+        """Should write the pages of a streaming table to the results."""
+
+        support.create_project(self, 'paged')
+
+        step_contents = '\n'.join([
+            'import cauldron as cd',
+            'import pandas as pd',
+            'df = pd.DataFrame({"a": range(2500)})',
+            'cd.display.table(df, stream=True)'
+        ])
+
+        support.add_step(self, contents=step_contents)
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed, 'should not have failed')
+
+        project = cauldron.project.get_internal_project()
+        step = project.steps[1]
+        names = list(step.report.files.fetch(None).keys())
+        self.assertEqual(3, len(names))
+
+        directory = os.path.join(project.output_directory, 'tables')
+        written = [
+            os.path.join(root, name)
+            for root, directories, files in os.walk(directory)
+            for name in files
+        ]
+        self.assertEqual(3, len(written), """
+            Expect each page of the table to be written to the results.
+            """)
+
+    def test_pyplot_png(self):
+        """Should write pyplot images to the results."""
+
+        support.create_project(self, 'rastered')
+
+        step_contents = '\n'.join([
+            'import cauldron as cd',
+            'from matplotlib import pyplot as plt',
+            'plt.plot([1, 2, 3], [3, 1, 2])',
+            'cd.display.pyplot(format="png")'
+        ])
+
+        support.add_step(self, contents=step_contents)
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed, 'should not have failed')
+
+        project = cauldron.project.get_internal_project()
+        step = project.steps[1]
+        name = list(step.report.files.fetch(None).keys())[0]
+        self.assertIn('data-src="{}"'.format(name), step.get_dom())
+
+        path = os.path.join(project.output_directory, *name.split('/'))
+        with open(path, 'rb') as f:
+            self.assertTrue(f.read().startswith(b'\x89PNG'))
+
+    def test_plotly_shared_data(self):
+        """Should write plotly traces shared by steps only once."""
+
+        support.create_project(self, 'shared-plotly')
+
+        step_contents = '\n'.join([
+            'import cauldron as cd',
+            'trace = dict(type="scatter", x=[1, 2, 3], y=[3, 1, 2])',
+            'cd.display.plotly(trace, shared_data=True)',
+            'cd.display.plotly([trace], {"height": 300}, shared_data=True)'
+        ])
+
+        support.add_step(self, contents=step_contents)
+        support.add_step(self, contents=step_contents)
+
+        r = support.run_command('run')
+        self.assertFalse(r.failed, 'should not have failed')
+
+        project = cauldron.project.get_internal_project()
+        directory = os.path.join(project.output_directory, 'plotly')
+        self.assertEqual(2, len(os.listdir(directory)), """
+            Expect one data file for the trace and one for the layout
+            template shared by all of the plots.
+            """)
+
     def test_status(self):
         """Should update status display."""
 
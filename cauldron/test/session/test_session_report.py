@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from cauldron.session.report import Report
+
+
+def test_get_body_chunks():
+    """Should return only the chunks appended after the sequence."""
+    report = Report(MagicMock())
+    report.append_body('a')
+    report.append_body('b')
+
+    first = report.get_body_chunks()
+    assert 0 == first.start
+    assert ['a', 'b'] == first.chunks
+
+    report.append_body('c')
+    second = report.get_body_chunks(first.body_id, 2)
+    assert first.body_id == second.body_id
+    assert 2 == second.start
+    assert ['c'] == second.chunks
+
+    third = report.get_body_chunks(second.body_id, 3)
+    assert 3 == third.start
+    assert [] == third.chunks
+
+
+def test_get_body_chunks_replaced():
+    """Should return all chunks after the body has been replaced."""
+    report = Report(MagicMock())
+    report.append_body('a')
+    previous = report.get_body_chunks()
+
+    report.clear()
+    report.append_body('b')
+    result = report.get_body_chunks(previous.body_id, 1)
+
+    assert previous.body_id != result.body_id, """
+        Expect clearing the body to assign a new body identifier.
+        """
+    assert 0 == result.start
+    assert ['b'] == result.chunks
+
+
+def test_get_body_chunks_invalid_sequence():
+    """Should return all chunks if the sequence is out of range."""
+    report = Report(MagicMock())
+    report.append_body('a')
+
+    result = report.get_body_chunks(report.body_id, 5)
+
+    assert 0 == result.start
+    assert ['a'] == result.chunks
+
+
+def test_body_assignment():
+    """Should assign a new body identifier when the body is replaced."""
+    report = Report(MagicMock())
+    body_id = report.body_id
+
+    report.body = ['a']
+
+    assert body_id != report.body_id
+    assert ['a'] == report.body
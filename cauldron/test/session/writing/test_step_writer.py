@@ -0,0 +1,93 @@
+import json
+from unittest.mock import patch
+
+import cauldron
+from cauldron.session.writing import step_writer
+from cauldron.test import support
+from cauldron.test.support import scaffolds
+
+
+class TestStepWriter(scaffolds.ResultsTest):
+    """Test suite for the step writer module"""
+
+    def test_serialize_chunks(self):
+        """Should serialize only the body chunks after the sequence."""
+        support.create_project(self, 'maple-grove')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("first")',
+            'cd.display.text("second")'
+        ]))
+        support.run_command('run')
+
+        project = cauldron.project.get_internal_project()
+        step = project.steps[-1]
+        report = step.report
+
+        first = step_writer.serialize_chunks(step)
+        self.assertEqual(0, first.start)
+        self.assertEqual(len(report.body), first.sequence)
+        self.assertEqual(report.body, first.chunks)
+        self.assertEqual(report.body_id, first.body_id)
+
+        report.append_body('<div>third</div>')
+        second = step_writer.serialize_chunks(
+            step,
+            body_id=first.body_id,
+            sequence=first.sequence
+        )
+        self.assertEqual(first.sequence, second.start)
+        self.assertEqual(['<div>third</div>'], second.chunks)
+        self.assertEqual(first.sequence + 1, second.sequence)
+
+    def test_serialize_finished(self):
+        """Should reuse the serialized data until the step changes."""
+        support.create_project(self, 'plymouth')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("hello")'
+        ]))
+        support.run_command('run')
+
+        project = cauldron.project.get_internal_project()
+        step = project.steps[-1]
+        first = step_writer.serialize(step)
+
+        step.is_selected = not step.is_selected
+        with patch.object(step_writer, '_populate_data') as populate:
+            second = step_writer.serialize(step)
+        populate.assert_not_called()
+        self.assertIs(first.body, second.body)
+        self.assertEqual(step.is_selected, second.status['selected'], """
+            Expect the status of reused data to be current.
+            """)
+
+        support.run_command('run "{}" --force'.format(step.definition.name))
+        third = step_writer.serialize(step)
+        self.assertIsNot(first.body, third.body)
+        self.assertIn('hello', third.body)
+
+    def test_cached_report_files(self):
+        """Should reference report files in the step cache by digest."""
+        support.create_project(self, 'bloomington')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.svg("<svg>LARGE-IMAGE</svg>", filename="a.svg")'
+        ]))
+        support.run_command('run')
+
+        project = cauldron.project.get_internal_project()
+        step = project.steps[-1]
+        with open(step.report.results_cache_path) as f:
+            file_writes = json.load(f)['file_writes']
+        self.assertNotIn('LARGE-IMAGE', json.dumps(file_writes), """
+            Expect the svg file to be referenced by its digest instead of
+            being stored in the step cache.
+            """)
+
+        cached = step_writer.get_cached_data(step)
+        self.assertTrue(any(
+            'LARGE-IMAGE' in fw.contents
+            for fw in cached.file_writes
+            if hasattr(fw, 'contents')
+        ))
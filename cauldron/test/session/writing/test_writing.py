@@ -0,0 +1,91 @@
+import json
+import os
+
+import cauldron
+from cauldron.session import writing
+from cauldron.test import support
+from cauldron.test.support import scaffolds
+
+
+class TestWriting(scaffolds.ResultsTest):
+    """Test suite for the cauldron.session.writing module"""
+
+    def _load_results(self, project) -> dict:
+        """Loads the data of the project's results file."""
+        with open(project.output_path) as f:
+            contents = f.read()
+        start = contents.index('=') + 1
+        end = contents.rindex(';', 0, contents.rindex('}'))
+        return json.loads(contents[start:end])
+
+    def _list_body_files(self, project) -> list:
+        """Lists the step body files in the project output directory."""
+        directory = os.path.join(project.output_directory, 'steps')
+        return sorted(os.listdir(directory))
+
+    def test_step_body_files(self):
+        """Should write step bodies to files addressed by their checksums."""
+        support.create_project(self, 'trinidad')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("first")'
+        ]))
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("second")'
+        ]))
+        support.run_command('run')
+
+        project = cauldron.project.get_internal_project()
+        writing.save(project)
+        results = self._load_results(project)
+
+        steps = [s for s in results['steps'] if 'body_file' in s]
+        self.assertEqual(3, len(steps))
+        self.assertTrue(all('body' not in s for s in steps), """
+            Expect the step bodies to be left out of the results file.
+            """)
+
+        bodies = []
+        for step in steps:
+            self.assertEqual(
+                'steps/{}.{}.js'.format(step['name'], step['body_checksum']),
+                step['body_file']
+            )
+            path = os.path.join(
+                project.output_directory,
+                *step['body_file'].split('/')
+            )
+            with open(path) as f:
+                bodies.append(f.read())
+
+        self.assertEqual(1, len([b for b in bodies if 'second' in b]))
+
+    def test_write_changed_steps(self):
+        """Should only replace the body files of changed steps."""
+        support.create_project(self, 'tobago')
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("unchanged")'
+        ]))
+        support.add_step(self, contents='\n'.join([
+            'import cauldron as cd',
+            'cd.display.text("before")'
+        ]))
+        support.run_command('run')
+
+        project = cauldron.project.get_internal_project()
+        writing.save(project)
+        initial = self._list_body_files(project)
+
+        with open(project.steps[2].source_path, 'w') as f:
+            f.write('import cauldron as cd\ncd.display.text("after")\n')
+        support.run_command('run')
+        writing.save(project)
+        current = self._list_body_files(project)
+
+        self.assertEqual(3, len(current))
+        self.assertEqual(2, len(set(initial) & set(current)), """
+            Expect the body files of the unchanged steps to be kept and
+            the body file of the changed step to be replaced.
+            """)
@@ -1,3 +1,4 @@
+import os
 import re
 import sys
 import typing
@@ -51,9 +52,20 @@ def run_remote_command(
             endpoint: str,
             data: dict = None,
             method: str = None,
+            body: bytes = None,
+            params: dict = None,
             **kwargs
     ):
         http_method = method.lower() if method else None
+        if body is not None or params is not None:
+            return server.deserialize_flask_response(app.open(
+                endpoint,
+                method=(http_method or 'post').upper(),
+                query_string=params,
+                data=body,
+                content_type='application/octet-stream'
+            ))
+
         func = server.post if data or http_method == 'post' else server.get
         result = func(
             app=app,
@@ -207,6 +219,43 @@ def add_step(
     return step_path
 
 
+def add_counting_step(
+        tester: 'scaffolds.ResultsTest',
+        name: str,
+        contents: str
+) -> str:
+    """
+    Adds a step that appends a character to a counter file each time it is
+    executed before running the given contents, which allows tests to
+    check how many times the step actually ran.
+
+    :param tester:
+    :param name:
+    :param contents:
+    :return:
+        The path to the counter file of the step
+    """
+    counter_path = tester.get_temp_path(name, 'counter.txt')
+    add_step(tester, name, '\n'.join([
+        'import cauldron as cd',
+        'with open({}, "a") as f:'.format(repr(counter_path)),
+        '    f.write("x")',
+        contents
+    ]))
+    return counter_path
+
+
+def count_runs(counter_path: str) -> int:
+    """
+    Returns the number of times the step that writes to the counter file
+    created by add_counting_step has been executed.
+    """
+    if not os.path.exists(counter_path):
+        return 0
+    with open(counter_path) as f:
+        return len(f.read())
+
+
 def has_error_code(response: environ.Response, code: str) -> bool:
     """..."""
     assert response.failed, Message(
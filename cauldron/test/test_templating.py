@@ -51,3 +51,10 @@ class TestTemplating(unittest.TestCase):
 
 
 
+
+    def test_get_variable_names(self):
+        """Should find the variables expected by the template."""
+        result = templating.get_variable_names(
+            '{{ a }} {% for x in b %}{{ x + c.d }}{% endfor %}'
+        )
+        self.assertEqual({'a', 'b', 'c'}, result)
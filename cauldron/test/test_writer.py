@@ -1,3 +1,4 @@
+import os
 import tempfile
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -128,3 +129,47 @@ def test_write_offset_ascii():
         Expected the offset argument to adjust how data is written
         to the file to produce an overlapped result.
         """
+
+
+def test_write_file_atomically():
+    """Should replace the file contents without leaving temporary files."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'file.txt')
+    try:
+        writer.write_file(path, 'abc')
+        success, error = writer.write_file_atomically(path, 'def')
+
+        with open(path, 'r') as f:
+            contents = f.read()
+        names = os.listdir(directory)
+    except Exception:  # pragma: no cover
+        raise
+    finally:
+        environ.systems.remove(directory, 10)
+
+    assert success
+    assert error is None
+    assert 'def' == contents
+    assert ['file.txt'] == names, """
+        Expected the temporary file to be renamed to the path.
+        """
+
+
+@patch('time.sleep')
+@patch('os.replace')
+def test_write_file_atomically_fail(replace: MagicMock, sleep: MagicMock):
+    """Should fail to replace the file and remove the temporary file."""
+    replace.side_effect = IOError('FAKE')
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'file.txt')
+    try:
+        success, error = writer.write_file_atomically(path, 'abc')
+        names = os.listdir(directory)
+    except Exception:  # pragma: no cover
+        raise
+    finally:
+        environ.systems.remove(directory, 10)
+
+    assert not success
+    assert error is not None
+    assert [] == names
@@ -84,3 +84,58 @@ def test_get_status_no_project(
     assert response['hash'].startswith('forced-'), """
         Expect a forced call to have a forced hash.
         """
+
+
+@patch('time.time')
+@patch('cauldron.session.writing.step_writer.serialize_chunks')
+@patch('cauldron.session.writing.step_writer.serialize')
+@patch('cauldron.session.writing.save')
+@patch('cauldron.project.get_internal_project')
+def test_get_status_body_sequences(
+        get_internal_project: MagicMock,
+        writing_save: MagicMock,
+        step_writer_serialize: MagicMock,
+        step_writer_serialize_chunks: MagicMock,
+        time_time: MagicMock,
+):
+    """Should return appended body chunks for running steps."""
+    time_time.return_value = 123123
+    step = MagicMock()
+    step.last_modified = time.time() + 1000
+    step.report.last_update_time = time.time() + 1000
+    step.definition.name = 'bar'
+    step.is_running = True
+
+    step_data = MagicMock()
+    step_data._asdict.return_value = {'name': 'bar', 'chunks': []}
+    step_writer_serialize_chunks.return_value = step_data
+
+    project = MagicMock()
+    project.steps = [step]
+    project.kernel_serialize.return_value = {'name': 'foo'}
+    get_internal_project.return_value = project
+
+    body_sequences = {'bar': {'body_id': 'abc', 'sequence': 12}}
+    response = statuses.get_status(0, body_sequences=body_sequences)
+
+    assert response['success'], """
+        Expect the status process to be successful.
+        """
+    assert 0 == step_writer_serialize.call_count, """
+        Expect the running step body not to be fully serialized.
+        """
+    step_writer_serialize_chunks.assert_called_once_with(
+        step,
+        body_id='abc',
+        sequence=12
+    )
+
+    step_changes = response['data']['step_changes']
+    expected = [{
+        'name': 'bar',
+        'action': 'appended',
+        'step': {'name': 'bar', 'chunks': []},
+        'timestamp': 123123,
+        'written': True
+    }]
+    assert expected == step_changes
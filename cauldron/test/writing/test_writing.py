@@ -1,3 +1,4 @@
+import os
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -22,6 +23,29 @@ class TestWriting(scaffolds.ResultsTest):
         self.assertEqual('abc', result.contents)
         self.assertEqual('/foo', result.path)
 
+    def test_entry_binary_contents(self):
+        """Should convert binary file write entries to and from dicts."""
+        entry = file_io.FILE_WRITE_ENTRY(path='/foo', contents=b'\x89PNG')
+        data = file_io.entry_to_dict(entry)
+        self.assertEqual('base64', data['encoding'])
+        self.assertIsInstance(data['contents'], str)
+        self.assertEqual(entry, file_io.entry_from_dict(data))
+
+    def test_entry_reference(self):
+        """Should recreate file write entries from the written files."""
+        path = self.get_temp_path('writing', 'reference', 'image.png')
+        entry = file_io.FILE_WRITE_ENTRY(path=path, contents=b'\x89PNG')
+        file_io.write(entry)
+
+        data = file_io.entry_to_reference(entry)
+        self.assertNotIn('contents', data)
+        self.assertEqual(entry, file_io.entry_from_reference(data))
+
+        with open(path, 'wb') as f:
+            f.write(b'modified')
+        with self.assertRaises(IOError):
+            file_io.entry_from_reference(data)
+
     def test_entry_from_dict_copy_entry(self):
         """Should create a file copy entry from the source dict."""
         result = file_io.entry_from_dict({
@@ -62,3 +86,69 @@ class TestWriting(scaffolds.ResultsTest):
         with self.assertRaises(IOError):
             file_io.copy(file_io.FILE_COPY_ENTRY(__file__, '/fake'))
         self.assertEqual(3, sleep.call_count)
+
+    def test_write_unchanged(self):
+        """Should only write files when their contents have changed."""
+        path = self.get_temp_path('writing', 'out', 'file.txt')
+
+        self.assertTrue(file_io.write(file_io.FILE_WRITE_ENTRY(path, 'a')))
+        self.assertFalse(file_io.write(file_io.FILE_WRITE_ENTRY(path, 'a')))
+        self.assertTrue(file_io.write(file_io.FILE_WRITE_ENTRY(path, 'b')))
+
+        with open(path, 'w') as f:
+            f.write('modified-elsewhere')
+
+        self.assertTrue(file_io.write(file_io.FILE_WRITE_ENTRY(path, 'b')))
+        with open(path) as f:
+            self.assertEqual('b', f.read())
+
+    @patch('cauldron.session.writing.file_io._get_digest')
+    def test_write_same_contents(self, get_digest: MagicMock):
+        """Should not hash contents that were already written again."""
+        get_digest.return_value = 'abc'
+        path = self.get_temp_path('writing', 'out', 'same.txt')
+        contents = 'x' * 100
+
+        entry = file_io.FILE_WRITE_ENTRY(path, contents)
+        self.assertTrue(file_io.write(entry))
+        self.assertFalse(file_io.write(entry._replace()))
+        self.assertEqual(1, get_digest.call_count)
+
+    def test_copy_directory_incrementally(self):
+        """Should only copy the files that have changed in a directory."""
+        source = self.get_temp_path('writing', 'source')
+        destination = self.get_temp_path('writing', 'destination')
+        os.makedirs(os.path.join(source, 'sub'))
+        for name in ['a.txt', os.path.join('sub', 'b.txt')]:
+            with open(os.path.join(source, name), 'w') as f:
+                f.write(name)
+
+        entry = file_io.FILE_COPY_ENTRY(source, destination)
+        file_io.copy(entry)
+        self.assertTrue(os.path.exists(os.path.join(destination, 'a.txt')))
+        self.assertTrue(
+            os.path.exists(os.path.join(destination, 'sub', 'b.txt'))
+        )
+
+        with patch('shutil.copy2') as copy2:
+            file_io.copy(entry)
+        self.assertEqual(0, copy2.call_count)
+
+    def test_prune(self):
+        """Should remove files that are not part of the deployed entries."""
+        directory = self.get_temp_path('writing', 'output')
+        kept = os.path.join(directory, 'kept.txt')
+        stale = os.path.join(directory, 'stale', 'stale.txt')
+
+        file_io.deploy([
+            file_io.FILE_WRITE_ENTRY(kept, 'a'),
+            file_io.FILE_WRITE_ENTRY(stale, 'b'),
+        ])
+        removed = file_io.prune(
+            directory,
+            [file_io.FILE_WRITE_ENTRY(kept, 'a')]
+        )
+
+        self.assertEqual([os.path.realpath(stale)], removed)
+        self.assertTrue(os.path.exists(kept))
+        self.assertFalse(os.path.exists(stale))
@@ -25,9 +25,14 @@ def status():
     args = arguments.from_request()
     last_timestamp = args.get('last_timestamp', 0)
     force = args.get('force', False)
+    body_sequences = args.get('body_sequences')
 
     if not environ.remote_connection.active:
-        results = ui_statuses.get_status(last_timestamp, force)
+        results = ui_statuses.get_status(
+            last_timestamp,
+            force,
+            body_sequences
+        )
         return flask.jsonify(results)
 
     # When connected remotely, get the status from the remote kernel and
@@ -1,3 +1,5 @@
+import typing
+
 import cauldron
 from cauldron import environ
 from cauldron.ui.statuses import _utils
@@ -5,7 +7,11 @@ from cauldron.ui.statuses._reconciler import merge_local_state  # noqa
 from cauldron.ui import configs as ui_configs
 
 
-def get_status(last_timestamp: float, force: bool = False) -> dict:
+def get_status(
+        last_timestamp: float,
+        force: bool = False,
+        body_sequences: typing.Dict[str, dict] = None
+) -> dict:
     """
     Returns the current status of the cauldron process for updated
     display in the UI. This contains project information along with
@@ -21,6 +27,12 @@ def get_status(last_timestamp: float, force: bool = False) -> dict:
         If forced, the hash will be certain to be different than
         the previous one, which is useful when trying to reconcile
         settings changes.
+    :param body_sequences:
+        If specified, a dictionary of step names mapped to dictionaries
+        containing the `body_id` and `sequence` of the report body last
+        received by the UI for each step. Running steps in the dictionary
+        will then only include the body chunks appended since that state
+        instead of their entire serialized body.
     :return:
         A dictionary containing the serialized request for the
         given status request.
@@ -32,7 +44,8 @@ def get_status(last_timestamp: float, force: bool = False) -> dict:
         step_changes = _utils.get_step_changes_after(
             project=project,
             timestamp=last_timestamp - 1,
-            write_running=True
+            write_running=True,
+            body_sequences=body_sequences
         )
     else:
         project_data = None
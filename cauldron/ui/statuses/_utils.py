@@ -1,9 +1,8 @@
 import hashlib
-import json
 import time
 import typing
 
-from cauldron.render.encoding import ComplexJsonEncoder
+from cauldron.render import encoding
 from cauldron.session import projects
 from cauldron.session import writing
 
@@ -28,7 +27,7 @@ def get_digest_hash(response_data: dict, force: bool = False) -> str:
 
     r = response_data.copy()
     r['timestamp'] = None
-    serialized = json.dumps(r, cls=ComplexJsonEncoder)
+    serialized = encoding.dumps(r)
     func = getattr(hashlib, 'blake2b', hashlib.sha256)
     return func(serialized.encode()).hexdigest()
 
@@ -36,7 +35,8 @@ def get_digest_hash(response_data: dict, force: bool = False) -> str:
 def _get_step_changes(
         project: 'projects.Project',
         step: 'projects.ProjectStep',
-        write_running: bool
+        write_running: bool,
+        body_sequences: typing.Dict[str, dict] = None
 ) -> typing.Dict[str, typing.Any]:
     """
     Returns a dictionary containing the step changes for the given
@@ -51,17 +51,33 @@ def _get_step_changes(
     :param write_running:
         Whether or not to write running step changes to disk as part
         of the serialization process.
+    :param body_sequences:
+        Client-side report body states by step name. When the step is
+        running and has a client-side state, only the body chunks appended
+        since that state are serialized.
     :return:
         A dictionary containing the serialized step change.
     """
-    step_data = writing.step_writer.serialize(step)
+    is_appending = (
+        step.is_running
+        and step.definition.name in (body_sequences or {})
+    )
+    if is_appending:
+        state = body_sequences.get(step.definition.name) or {}
+        step_data = writing.step_writer.serialize_chunks(
+            step,
+            body_id=state.get('body_id'),
+            sequence=state.get('sequence', 0)
+        )
+    else:
+        step_data = writing.step_writer.serialize(step)
 
     if write_running and step.is_running:
         writing.save(project, step_data.file_writes)
 
     return dict(
         name=step.definition.name,
-        action='updated',
+        action='appended' if is_appending else 'updated',
         step=step_data._asdict(),
         timestamp=time.time(),
         written=write_running and step.is_running
@@ -71,7 +87,8 @@ def _get_step_changes(
 def get_step_changes_after(
         project: 'projects.Project',
         timestamp: float,
-        write_running: bool = False
+        write_running: bool = False,
+        body_sequences: typing.Dict[str, dict] = None
 ) -> typing.List[dict]:
     """
     Creates a list of step changes for each step in the project that has
@@ -87,11 +104,16 @@ def get_step_changes_after(
     :param write_running:
         Whether or not to write running step changes to disk as part
         of the serialization process.
+    :param body_sequences:
+        Client-side report body states by step name, which are dictionaries
+        containing the `body_id` and `sequence` last received for each step.
+        Running steps with a client-side state only serialize the body
+        chunks that were appended since that state.
     :return:
         A list of dictionaries containing the serialized step changes.
     """
     return [
-        _get_step_changes(project, step, write_running)
+        _get_step_changes(project, step, write_running, body_sequences)
         for step in project.steps
         if step.report.last_update_time >= timestamp
         or (step.last_modified or 0) >= timestamp
@@ -1,6 +1,8 @@
 import json
+import os
 import time
 import typing
+import uuid
 
 
 def attempt_file_write(
@@ -34,18 +36,20 @@ def attempt_file_write(
     except Exception:
         data = contents
 
-    if offset > 0:
-        with open(path, 'rb') as f:
-            existing = f.read(offset)
-    else:
-        existing = None
-
     append = 'a' in mode
     write_mode = 'wb' if offset > 0 or not append else 'ab'
     try:
+        if offset > 0:
+            # Write over the existing file in place from the offset instead
+            # of rewriting everything that comes before the offset, which
+            # would make writing a file in many chunks quadratic.
+            with open(path, 'r+b') as f:
+                f.seek(offset)
+                f.write(data)
+                f.truncate()
+            return None
+
         with open(path, write_mode) as f:
-            if existing is not None:
-                f.write(existing)
             f.write(data)
         return None
     except Exception as error:
@@ -95,6 +99,53 @@ def write_file(
     return False, error
 
 
+def write_file_atomically(
+        path: str,
+        contents,
+        mode: str = 'w',
+        retry_count: int = 3
+) -> typing.Tuple[bool, typing.Union[None, Exception]]:
+    """
+    Writes the specified contents to a temporary file in the same directory
+    as the path and then renames the temporary file to the path, which
+    replaces any existing file at that path atomically. Readers of the file
+    will therefore never encounter a partially written or missing file.
+
+    :param path:
+        The path to the file that will be written
+    :param contents:
+        The contents of the file to write
+    :param mode:
+        The mode in which the temporary file will be opened when written.
+        Append modes are not supported.
+    :param retry_count:
+        The number of attempts to make before giving up and returning a
+        failed write.
+    :return:
+        Returns two arguments. The first is a boolean specifying whether or
+        not the write operation succeeded. The second is the error result,
+        which is None if the write operation succeeded. Otherwise, it will be
+        the exception that was raised by the last failed write attempt.
+    """
+    temp_path = '{}.{}.tmp'.format(path, uuid.uuid4().hex[:8])
+    success, error = write_file(temp_path, contents, mode, retry_count)
+
+    for i in range(retry_count if success else 0):
+        try:
+            os.replace(temp_path, path)
+            return True, None
+        except Exception as replace_error:
+            error = replace_error
+            time.sleep(0.2)
+
+    try:
+        os.remove(temp_path)
+    except Exception:
+        pass
+
+    return False, error
+
+
 def attempt_json_write(
         path: str,
         contents: dict,